@@ -0,0 +1,300 @@
+"""Benchmark the throughput of pyuegc across scripts and workloads.
+
+Each workload is a text of about `--size` code points, representative of a
+kind of input:
+    - ascii: English prose;
+    - latin-combining: French prose in NFD (letters followed by combining
+      marks);
+    - hangul-jamo: Korean prose in NFD (conjoining jamo L, V and T);
+    - indic-conjuncts: the words of the CLDR TestSegmenter files in
+      pyuegc/tests/unit/data (conjunct linker clusters, rule GB9c);
+    - emoji-zwj: emoji ZWJ sequences with modifiers (rule GB11);
+    - flags: regional indicator pairs (rules GB12 and GB13);
+    - zalgo: letters followed by random runs of combining marks;
+    - long-extend: a single letter followed by combining marks only;
+    - cjk-large-repertoire: CJK ideographs drawn at random from 20,000 of
+      them (a large working set of code points).
+
+For each workload and function, the script reports the number of code
+points and of clusters processed per second, and the peak amount of memory
+allocated during a call, per code point. It also reports the import time of
+the package (see bench_import.py).
+
+By default, the package is imported from this source tree; with
+`--installed`, the installed package is benchmarked instead. To compare two
+versions, save the results of one with `--save FILE`, and pass the file to
+the other with `--compare FILE`, e.g. from two virtual environments:
+    venv-old/bin/python benchmarks/bench_egc.py --installed --save old.json
+    venv-new/bin/python benchmarks/bench_egc.py --installed --compare old.json
+
+Usage:
+    python benchmarks/bench_egc.py [--size N] [--repeat N]
+        [--workloads NAME ...] [--functions NAME ...] [--installed]
+        [--no-import-time] [--save FILE] [--compare FILE]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+import unicodedata
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+DATA_DIR = os.path.join(ROOT_DIR, "pyuegc", "tests", "unit", "data")
+
+ENGLISH = (
+    "The quick brown fox jumps over the lazy dog, while the early bird "
+    "catches the worm and a stitch in time saves nine. "
+)
+
+FRENCH = (
+    "L'élève arrivé à l'école près de la forêt a déjà reçu où était "
+    "caché le trésor de sa grand-mère, âgée et très bien élevée. "
+)
+
+KOREAN = "다람쥐 헌 쳇바퀴에 타고파. 키스의 고유조건은 입술끼리 만나야 하고 특별한 기술은 필요치 않다. "
+
+EMOJI = (
+    "\U0001F468\u200D\U0001F469\u200D\U0001F467\u200D\U0001F466",
+    "\U0001F469\U0001F3FD\u200D\U0001F4BB",
+    "\U0001F3F3\uFE0F\u200D\U0001F308",
+    "\U0001F9D1\U0001F3FF\u200D\U0001F91D\u200D\U0001F9D1\U0001F3FB",
+    "\u2764\uFE0F\u200D\U0001F525",
+    "\U0001F44D\U0001F3FC",
+)
+
+FLAGS = "FRDEUSJPBRINCAGBITESKR"
+
+COMBINING_MARKS = [chr(code) for code in range(0x0300, 0x0370)]
+
+INDIC_FILES = (
+    "TestSegmenter-Bengali.txt",
+    "TestSegmenter-Devanagari.txt",
+    "TestSegmenter-Gujarati.txt",
+    "TestSegmenter-Malayalam.txt",
+    "TestSegmenter-Odia.txt",
+    "TestSegmenter-Telugu.txt",
+)
+
+
+def repeat_to_size(text, size):
+    return (text * (size // len(text) + 1))[:size]
+
+
+def indic_words():
+    words = []
+    for filename in INDIC_FILES:
+        with open(os.path.join(DATA_DIR, filename), encoding="utf-8-sig") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    words.append(line.partition(";")[0].strip())
+    return " ".join(words) + " "
+
+
+def flags():
+    # Regional indicator symbols are offset from ASCII capital letters
+    pairs = [FLAGS[i:i + 2] for i in range(0, len(FLAGS), 2)]
+    return " ".join(
+        "".join(chr(0x1F1E6 + ord(letter) - ord("A")) for letter in pair)
+        for pair in pairs
+    ) + " "
+
+
+def zalgo(size):
+    rng = random.Random(0)
+    chars = []
+    while len(chars) < size:
+        chars.append(rng.choice("abcdefghijklmnopqrstuvwxyz"))
+        chars += rng.choices(COMBINING_MARKS, k=rng.randint(1, 8))
+    return "".join(chars[:size])
+
+
+def large_repertoire(size):
+    rng = random.Random(0)
+    codes = rng.sample(range(0x4E00, 0xA000), 20_000)
+    repertoire = [chr(code) for code in codes]
+    return "".join(rng.choices(repertoire, k=size))
+
+
+WORKLOADS = {
+    "ascii": lambda size: repeat_to_size(ENGLISH, size),
+    "latin-combining": lambda size: repeat_to_size(
+        unicodedata.normalize("NFD", FRENCH), size
+    ),
+    "hangul-jamo": lambda size: repeat_to_size(
+        unicodedata.normalize("NFD", KOREAN), size
+    ),
+    "indic-conjuncts": lambda size: repeat_to_size(indic_words(), size),
+    "emoji-zwj": lambda size: repeat_to_size(" ".join(EMOJI) + " ", size),
+    "flags": lambda size: repeat_to_size(flags(), size),
+    "zalgo": zalgo,
+    "long-extend": lambda size: "a" + "\u0301" * (size - 1),
+    "cjk-large-repertoire": large_repertoire,
+}
+
+FUNCTIONS = ("EGC", "egc_count", "egc_boundaries", "iter_egc")
+
+
+def call(pyuegc, name):
+    """Returns a function of a string that runs the pyuegc function `name`
+    on it (consuming the iterator returned by `iter_egc`)."""
+    func = getattr(pyuegc, name, None)
+    if func is None:  # not available in this version
+        return None
+    if name == "iter_egc":
+        return lambda unistr: sum(1 for _ in func(unistr))
+    return func
+
+
+def peak_memory(func, text):
+    tracemalloc.start()
+    try:
+        func(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(pyuegc, workloads, functions, size, repeat):
+    results = {}
+
+    for workload in workloads:
+        text = WORKLOADS[workload](size)
+        clusters = len(pyuegc.EGC(text))
+
+        for name in functions:
+            func = call(pyuegc, name)
+            if func is None:
+                continue
+
+            timer = timeit.Timer(lambda: func(text))
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+            results[f"{workload}/{name}"] = {
+                "code_points_per_s": len(text) / best,
+                "clusters_per_s": clusters / best,
+                "peak_bytes_per_code_point": peak_memory(func, text) / len(text),
+            }
+
+    return results
+
+
+def import_times(runs, path):
+    sys.path.insert(0, BENCH_DIR)
+    from bench_import import measure
+
+    return {
+        label: sorted(measure(sys.executable, runs, cached, path))[runs // 2]
+        / 1000
+        for label, cached in (("no bytecode cache", False),
+                              ("bytecode cache", True))
+    }
+
+
+def print_results(results, baseline):
+    print(
+        f"{'workload/function':<32}{'Mcp/s':>9}{'Mclusters/s':>13}"
+        f"{'peak B/cp':>11}" + (f"{'vs baseline':>13}" if baseline else "")
+    )
+
+    for key, result in results.items():
+        line = (
+            f"{key:<32}"
+            f"{result['code_points_per_s'] / 1e6:9.3f}"
+            f"{result['clusters_per_s'] / 1e6:13.3f}"
+            f"{result['peak_bytes_per_code_point']:11.1f}"
+        )
+        if baseline:
+            old = baseline["results"].get(key)
+            if old:
+                ratio = (result["code_points_per_s"]
+                         / old["code_points_per_s"])
+                line += f"{ratio:12.2f}x"
+            else:
+                line += f"{'-':>13}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--workloads", nargs="+", choices=list(WORKLOADS),
+        default=list(WORKLOADS),
+    )
+    parser.add_argument(
+        "--functions", nargs="+", choices=FUNCTIONS, default=FUNCTIONS[:3],
+    )
+    parser.add_argument(
+        "--installed", action="store_true",
+        help="benchmark the installed package instead of this source tree",
+    )
+    parser.add_argument("--no-import-time", action="store_true")
+    parser.add_argument("--import-runs", type=int, default=10)
+    parser.add_argument("--save", metavar="FILE")
+    parser.add_argument("--compare", metavar="FILE")
+    args = parser.parse_args()
+
+    if not args.installed:
+        sys.path.insert(0, ROOT_DIR)
+
+    import pyuegc
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print(
+        f"pyuegc {pyuegc.__version__} ({os.path.dirname(pyuegc.__file__)}), "
+        f"{platform.python_implementation()} {platform.python_version()}"
+    )
+    if baseline:
+        print(
+            f"baseline: pyuegc {baseline['version']}, "
+            f"Python {baseline['python']}"
+        )
+    print()
+
+    results = run(
+        pyuegc, args.workloads, args.functions, args.size, args.repeat
+    )
+    print_results(results, baseline)
+
+    times = {}
+    if not args.no_import_time:
+        print()
+        times = import_times(
+            args.import_runs, None if args.installed else ROOT_DIR
+        )
+        for label, ms in times.items():
+            old = baseline and baseline.get("import_ms", {}).get(label)
+            print(
+                f"import pyuegc ({label}): {ms:.2f} ms"
+                + (f" (baseline {old:.2f} ms)" if old else "")
+            )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": pyuegc.__version__,
+                    "python": platform.python_version(),
+                    "results": results,
+                    "import_ms": times,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the time it takes to import pyuegc.
+
+Each measurement runs `import pyuegc` in a fresh interpreter with
+`-X importtime` and reports the cumulative time spent importing the package,
+both without any cached bytecode (as on a first run or on a read-only file
+system) and with cached bytecode.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(python, env):
+    """Returns the cumulative import time of pyuegc in microseconds."""
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", "import pyuegc"],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    # Lines read "import time: <self> | <cumulative> | <module name>"
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == "pyuegc":
+            return int(cumulative)
+
+    raise RuntimeError("pyuegc import time not found in output")
+
+
+def measure(python, runs, cached, path=ROOT_DIR):
+    """Returns the import times of pyuegc in `runs` fresh interpreters, with
+    `path` (by default, this source tree) prepended to the module search
+    path, or with the installed package if `path` is None."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [path, env.get("PYTHONPATH")])
+        )
+        env["PYTHONPYCACHEPREFIX"] = cache_dir
+
+        if cached:
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+            import_time(python, env)  # populate the bytecode cache
+        else:
+            env["PYTHONDONTWRITEBYTECODE"] = "1"
+
+        return [import_time(python, env) for _ in range(runs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for cached in (False, True):
+        label = "bytecode cache" if cached else "no bytecode cache"
+        times = measure(sys.executable, args.runs, cached)
+        print(
+            f"import pyuegc ({label}): "
+            f"median {statistics.median(times) / 1000:.2f} ms, "
+            f"min {min(times) / 1000:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
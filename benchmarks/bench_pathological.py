@@ -0,0 +1,72 @@
+"""Check that segmentation time stays linear on pathological inputs.
+
+Each input is built at several sizes and segmented with `EGC`; the time per
+code point must not grow with the size of the input. The inputs stress the
+rules that depend on unbounded context:
+    - GB11: a pictograph followed by a long run of Extend characters and
+      many ZWJ + pictograph pairs;
+    - GB12/GB13: a long run of regional indicators;
+    - GB9c: a long chain of conjunct linker clusters;
+    - GB9: a single base followed by a long run of combining marks.
+
+The script exits with a nonzero status if the time per code point at the
+largest size exceeds that at the smallest size by more than `--max-ratio`.
+
+Usage:
+    python benchmarks/bench_pathological.py [--max-ratio R]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyuegc import EGC
+
+SIZES = (1_000, 10_000, 100_000)
+
+INPUTS = {
+    "emoji zwj after extend": lambda n: (
+        "\U0001F468" + "\u0301" * (n // 2) + "\u200D\U0001F469" * (n // 4)
+    ),
+    "regional indicators": lambda n: "\U0001F1EB" * n,
+    "conjunct linkers": lambda n: "\u0915" + "\u094D\u0937" * (n // 2),
+    "combining marks": lambda n: "a" + "\u0301" * n,
+}
+
+
+def time_per_code_point(string):
+    number = max(1, 100_000 // len(string))
+    best = min(timeit.repeat(lambda: EGC(string), number=number, repeat=5))
+    return best / number / len(string)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-ratio", type=float, default=3.0)
+    args = parser.parse_args()
+
+    failed = False
+
+    for name, make_input in INPUTS.items():
+        times = [time_per_code_point(make_input(size)) for size in SIZES]
+        ratio = times[-1] / times[0]
+        failed |= ratio > args.max_ratio
+
+        print(
+            f"{name:<24}"
+            + "".join(
+                f"  n={size:<7,} {t * 1e9:6.1f} ns/cp"
+                for size, t in zip(SIZES, times)
+            )
+            + f"  ratio {ratio:4.2f}"
+        )
+
+    if failed:
+        sys.exit(f"time per code point grew by more than {args.max_ratio}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,9 +13,26 @@ This software is distributed under the MIT license.
 
 __all__ = [
     "EGC",
+    "EditableGraphemeIndex",
+    "GraphemeSegmenter",
+    "GraphemeString",
     "UCD_VERSION",
     "UNICODE_VERSION",
     "__version__",
+    "aiter_egc",
+    "egc_boundaries",
+    "egc_boundaries_utf8",
+    "egc_count",
+    "egc_count_utf8",
+    "egc_many",
+    "egc_truncate",
+    "egc_utf8",
+    "find_safe_boundary",
+    "iter_egc",
+    "iter_egc_reversed",
+    "next_boundary",
+    "prev_boundary",
+    "segment_file",
 ]
 
 # Unicode standard used to process the data
@@ -34,4 +51,29 @@ if _UNICODE_VERSION != UNICODE_VERSION:
     )
 del _UNICODE_VERSION
 
-from pyuegc.egc import EGC
+from pyuegc.egc import (
+    EGC,
+    EditableGraphemeIndex,
+    GraphemeSegmenter,
+    GraphemeString,
+    aiter_egc,
+    egc_boundaries,
+    egc_boundaries_utf8,
+    egc_count,
+    egc_count_utf8,
+    egc_many,
+    egc_truncate,
+    egc_utf8,
+    find_safe_boundary,
+    iter_egc,
+    iter_egc_reversed,
+    next_boundary,
+    prev_boundary,
+    segment_file,
+)
+
+import os
+if os.environ.get("PYUEGC_INSTRUMENT"):
+    from pyuegc import instrumentation
+    del instrumentation
+del os
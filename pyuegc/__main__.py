@@ -0,0 +1,190 @@
+"""Command-line interface of pyuegc.
+
+Segments each line of the given files (or of the standard input) into
+extended grapheme clusters, and writes, for each line, its number of
+clusters, the offsets of its cluster boundaries, or its clusters joined by a
+delimiter, either as plain text or as JSON lines.
+
+Usage:
+    python -m pyuegc [-o {count,boundaries,clusters}] [-d DELIMITER]
+                     [--json] [-j N] [--stats] [FILE ...]
+
+Examples:
+    $ printf 'e\\xcc\\x81le\\xcc\\x80ve\\n' | python -m pyuegc
+    5
+    $ printf 'e\\xcc\\x81le\\xcc\\x80ve\\n' | python -m pyuegc -o boundaries --json
+    {"line": 1, "boundaries": [0, 2, 3, 5, 6, 7]}
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+from pyuegc import EGC, __version__, egc_boundaries, egc_count
+
+PROG = "python -m pyuegc"
+
+_FUNCTIONS = {
+    "count": egc_count,
+    "boundaries": egc_boundaries,
+    "clusters": EGC,
+}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog=PROG,
+        description=(
+            "Segment each line of text into Unicode extended grapheme "
+            "clusters."
+        ),
+    )
+    parser.add_argument(
+        "files", metavar="FILE", nargs="*", default=["-"],
+        help="files to read, or - for the standard input (the default)",
+    )
+    parser.add_argument(
+        "-o", "--output", choices=list(_FUNCTIONS), default="count",
+        help=(
+            "what to write for each line: its number of clusters (the "
+            "default), the offsets of its cluster boundaries, or its clusters"
+        ),
+    )
+    parser.add_argument(
+        "-d", "--delimiter", default="|",
+        help="string written between clusters (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--json", action="store_true",
+        help="write one JSON object per line",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, metavar="N",
+        help="number of worker processes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--encoding", default="utf-8",
+        help="encoding of the input (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--errors", default="strict",
+        help="error handling scheme for decoding (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="write throughput statistics to the standard error",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.jobs < 1:
+        parser.error("the number of jobs must be at least 1")
+
+    return args
+
+
+def iter_lines(paths, encoding, errors):
+    """Generates the lines of the given files, without line terminators."""
+    for path in paths:
+        if path == "-":
+            file = io.TextIOWrapper(
+                sys.stdin.buffer, encoding, errors, newline=""
+            )
+        else:
+            file = open(path, encoding=encoding, errors=errors, newline="")
+
+        try:
+            for line in file:
+                if line.endswith("\n"):
+                    line = line[:-1]
+                if line.endswith("\r"):
+                    line = line[:-1]
+                yield line
+        finally:
+            if path == "-":
+                file.detach()  # do not close the standard input
+            else:
+                file.close()
+
+
+def segment_lines(lines, output, jobs):
+    if jobs == 1:
+        return map(_FUNCTIONS[output], lines)
+
+    # Imported here, since this is the only use of multiple processes
+    from pyuegc.parallel import egc_many_parallel
+
+    return egc_many_parallel(lines, output, max_workers=jobs)
+
+
+def format_result(num, result, args):
+    if args.json:
+        return json.dumps({"line": num, args.output: result},
+                          ensure_ascii=False)
+    if args.output == "count":
+        return str(result)
+    if args.output == "boundaries":
+        return " ".join(map(str, result))
+    return args.delimiter.join(result)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    stats = {"lines": 0, "code points": 0, "clusters": 0}
+
+    def counted(lines):
+        for line in lines:
+            stats["lines"] += 1
+            stats["code points"] += len(line)
+            yield line
+
+    start = time.perf_counter()
+
+    try:
+        results = segment_lines(
+            counted(iter_lines(args.files, args.encoding, args.errors)),
+            args.output,
+            args.jobs,
+        )
+        for num, result in enumerate(results, 1):
+            if args.output == "count":
+                stats["clusters"] += result
+            elif args.output == "boundaries":
+                stats["clusters"] += len(result) - 1
+            else:
+                stats["clusters"] += len(result)
+            sys.stdout.write(format_result(num, result, args) + "\n")
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader of the output went away (as with `| head`); avoid
+        # another error when the output is flushed at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, UnicodeDecodeError) as exc:
+        sys.stdout.flush()
+        print(f"{PROG}: error: {exc}", file=sys.stderr)
+        return 1
+
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        rate = (lambda n: n / elapsed) if elapsed else (lambda n: 0)
+        print(
+            f"{stats['lines']:,} lines, {stats['code points']:,} code points, "
+            f"{stats['clusters']:,} clusters in {elapsed:.3f} s "
+            f"({rate(stats['code points']):,.0f} code points/s, "
+            f"{rate(stats['clusters']):,.0f} clusters/s)",
+            file=sys.stderr,
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
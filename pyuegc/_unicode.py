@@ -5,19044 +5,1022 @@ This file was generated from pyuegc/tools/generate_unicode.py
 
 _UNICODE_VERSION = "16.0.0"
 
-# Mapping of Unicode code points to their corresponding grapheme cluster
-# break property values (any code point not listed here defaults to "Other")
-# Source: GraphemeBreakProperty.txt
-_PROP_DICT = {
-    0x00600: "Prepend",
-    0x00601: "Prepend",
-    0x00602: "Prepend",
-    0x00603: "Prepend",
-    0x00604: "Prepend",
-    0x00605: "Prepend",
-    0x006DD: "Prepend",
-    0x0070F: "Prepend",
-    0x00890: "Prepend",
-    0x00891: "Prepend",
-    0x008E2: "Prepend",
-    0x00D4E: "Prepend",
-    0x110BD: "Prepend",
-    0x110CD: "Prepend",
-    0x111C2: "Prepend",
-    0x111C3: "Prepend",
-    0x113D1: "Prepend",
-    0x1193F: "Prepend",
-    0x11941: "Prepend",
-    0x11A3A: "Prepend",
-    0x11A84: "Prepend",
-    0x11A85: "Prepend",
-    0x11A86: "Prepend",
-    0x11A87: "Prepend",
-    0x11A88: "Prepend",
-    0x11A89: "Prepend",
-    0x11D46: "Prepend",
-    0x11F02: "Prepend",
-    0x0000D: "CR",
-    0x0000A: "LF",
-    0x00000: "Control",
-    0x00001: "Control",
-    0x00002: "Control",
-    0x00003: "Control",
-    0x00004: "Control",
-    0x00005: "Control",
-    0x00006: "Control",
-    0x00007: "Control",
-    0x00008: "Control",
-    0x00009: "Control",
-    0x0000B: "Control",
-    0x0000C: "Control",
-    0x0000E: "Control",
-    0x0000F: "Control",
-    0x00010: "Control",
-    0x00011: "Control",
-    0x00012: "Control",
-    0x00013: "Control",
-    0x00014: "Control",
-    0x00015: "Control",
-    0x00016: "Control",
-    0x00017: "Control",
-    0x00018: "Control",
-    0x00019: "Control",
-    0x0001A: "Control",
-    0x0001B: "Control",
-    0x0001C: "Control",
-    0x0001D: "Control",
-    0x0001E: "Control",
-    0x0001F: "Control",
-    0x0007F: "Control",
-    0x00080: "Control",
-    0x00081: "Control",
-    0x00082: "Control",
-    0x00083: "Control",
-    0x00084: "Control",
-    0x00085: "Control",
-    0x00086: "Control",
-    0x00087: "Control",
-    0x00088: "Control",
-    0x00089: "Control",
-    0x0008A: "Control",
-    0x0008B: "Control",
-    0x0008C: "Control",
-    0x0008D: "Control",
-    0x0008E: "Control",
-    0x0008F: "Control",
-    0x00090: "Control",
-    0x00091: "Control",
-    0x00092: "Control",
-    0x00093: "Control",
-    0x00094: "Control",
-    0x00095: "Control",
-    0x00096: "Control",
-    0x00097: "Control",
-    0x00098: "Control",
-    0x00099: "Control",
-    0x0009A: "Control",
-    0x0009B: "Control",
-    0x0009C: "Control",
-    0x0009D: "Control",
-    0x0009E: "Control",
-    0x0009F: "Control",
-    0x000AD: "Control",
-    0x0061C: "Control",
-    0x0180E: "Control",
-    0x0200B: "Control",
-    0x0200E: "Control",
-    0x0200F: "Control",
-    0x02028: "Control",
-    0x02029: "Control",
-    0x0202A: "Control",
-    0x0202B: "Control",
-    0x0202C: "Control",
-    0x0202D: "Control",
-    0x0202E: "Control",
-    0x02060: "Control",
-    0x02061: "Control",
-    0x02062: "Control",
-    0x02063: "Control",
-    0x02064: "Control",
-    0x02065: "Control",
-    0x02066: "Control",
-    0x02067: "Control",
-    0x02068: "Control",
-    0x02069: "Control",
-    0x0206A: "Control",
-    0x0206B: "Control",
-    0x0206C: "Control",
-    0x0206D: "Control",
-    0x0206E: "Control",
-    0x0206F: "Control",
-    0x0FEFF: "Control",
-    0x0FFF0: "Control",
-    0x0FFF1: "Control",
-    0x0FFF2: "Control",
-    0x0FFF3: "Control",
-    0x0FFF4: "Control",
-    0x0FFF5: "Control",
-    0x0FFF6: "Control",
-    0x0FFF7: "Control",
-    0x0FFF8: "Control",
-    0x0FFF9: "Control",
-    0x0FFFA: "Control",
-    0x0FFFB: "Control",
-    0x13430: "Control",
-    0x13431: "Control",
-    0x13432: "Control",
-    0x13433: "Control",
-    0x13434: "Control",
-    0x13435: "Control",
-    0x13436: "Control",
-    0x13437: "Control",
-    0x13438: "Control",
-    0x13439: "Control",
-    0x1343A: "Control",
-    0x1343B: "Control",
-    0x1343C: "Control",
-    0x1343D: "Control",
-    0x1343E: "Control",
-    0x1343F: "Control",
-    0x1BCA0: "Control",
-    0x1BCA1: "Control",
-    0x1BCA2: "Control",
-    0x1BCA3: "Control",
-    0x1D173: "Control",
-    0x1D174: "Control",
-    0x1D175: "Control",
-    0x1D176: "Control",
-    0x1D177: "Control",
-    0x1D178: "Control",
-    0x1D179: "Control",
-    0x1D17A: "Control",
-    0xE0000: "Control",
-    0xE0001: "Control",
-    0xE0002: "Control",
-    0xE0003: "Control",
-    0xE0004: "Control",
-    0xE0005: "Control",
-    0xE0006: "Control",
-    0xE0007: "Control",
-    0xE0008: "Control",
-    0xE0009: "Control",
-    0xE000A: "Control",
-    0xE000B: "Control",
-    0xE000C: "Control",
-    0xE000D: "Control",
-    0xE000E: "Control",
-    0xE000F: "Control",
-    0xE0010: "Control",
-    0xE0011: "Control",
-    0xE0012: "Control",
-    0xE0013: "Control",
-    0xE0014: "Control",
-    0xE0015: "Control",
-    0xE0016: "Control",
-    0xE0017: "Control",
-    0xE0018: "Control",
-    0xE0019: "Control",
-    0xE001A: "Control",
-    0xE001B: "Control",
-    0xE001C: "Control",
-    0xE001D: "Control",
-    0xE001E: "Control",
-    0xE001F: "Control",
-    0xE0080: "Control",
-    0xE0081: "Control",
-    0xE0082: "Control",
-    0xE0083: "Control",
-    0xE0084: "Control",
-    0xE0085: "Control",
-    0xE0086: "Control",
-    0xE0087: "Control",
-    0xE0088: "Control",
-    0xE0089: "Control",
-    0xE008A: "Control",
-    0xE008B: "Control",
-    0xE008C: "Control",
-    0xE008D: "Control",
-    0xE008E: "Control",
-    0xE008F: "Control",
-    0xE0090: "Control",
-    0xE0091: "Control",
-    0xE0092: "Control",
-    0xE0093: "Control",
-    0xE0094: "Control",
-    0xE0095: "Control",
-    0xE0096: "Control",
-    0xE0097: "Control",
-    0xE0098: "Control",
-    0xE0099: "Control",
-    0xE009A: "Control",
-    0xE009B: "Control",
-    0xE009C: "Control",
-    0xE009D: "Control",
-    0xE009E: "Control",
-    0xE009F: "Control",
-    0xE00A0: "Control",
-    0xE00A1: "Control",
-    0xE00A2: "Control",
-    0xE00A3: "Control",
-    0xE00A4: "Control",
-    0xE00A5: "Control",
-    0xE00A6: "Control",
-    0xE00A7: "Control",
-    0xE00A8: "Control",
-    0xE00A9: "Control",
-    0xE00AA: "Control",
-    0xE00AB: "Control",
-    0xE00AC: "Control",
-    0xE00AD: "Control",
-    0xE00AE: "Control",
-    0xE00AF: "Control",
-    0xE00B0: "Control",
-    0xE00B1: "Control",
-    0xE00B2: "Control",
-    0xE00B3: "Control",
-    0xE00B4: "Control",
-    0xE00B5: "Control",
-    0xE00B6: "Control",
-    0xE00B7: "Control",
-    0xE00B8: "Control",
-    0xE00B9: "Control",
-    0xE00BA: "Control",
-    0xE00BB: "Control",
-    0xE00BC: "Control",
-    0xE00BD: "Control",
-    0xE00BE: "Control",
-    0xE00BF: "Control",
-    0xE00C0: "Control",
-    0xE00C1: "Control",
-    0xE00C2: "Control",
-    0xE00C3: "Control",
-    0xE00C4: "Control",
-    0xE00C5: "Control",
-    0xE00C6: "Control",
-    0xE00C7: "Control",
-    0xE00C8: "Control",
-    0xE00C9: "Control",
-    0xE00CA: "Control",
-    0xE00CB: "Control",
-    0xE00CC: "Control",
-    0xE00CD: "Control",
-    0xE00CE: "Control",
-    0xE00CF: "Control",
-    0xE00D0: "Control",
-    0xE00D1: "Control",
-    0xE00D2: "Control",
-    0xE00D3: "Control",
-    0xE00D4: "Control",
-    0xE00D5: "Control",
-    0xE00D6: "Control",
-    0xE00D7: "Control",
-    0xE00D8: "Control",
-    0xE00D9: "Control",
-    0xE00DA: "Control",
-    0xE00DB: "Control",
-    0xE00DC: "Control",
-    0xE00DD: "Control",
-    0xE00DE: "Control",
-    0xE00DF: "Control",
-    0xE00E0: "Control",
-    0xE00E1: "Control",
-    0xE00E2: "Control",
-    0xE00E3: "Control",
-    0xE00E4: "Control",
-    0xE00E5: "Control",
-    0xE00E6: "Control",
-    0xE00E7: "Control",
-    0xE00E8: "Control",
-    0xE00E9: "Control",
-    0xE00EA: "Control",
-    0xE00EB: "Control",
-    0xE00EC: "Control",
-    0xE00ED: "Control",
-    0xE00EE: "Control",
-    0xE00EF: "Control",
-    0xE00F0: "Control",
-    0xE00F1: "Control",
-    0xE00F2: "Control",
-    0xE00F3: "Control",
-    0xE00F4: "Control",
-    0xE00F5: "Control",
-    0xE00F6: "Control",
-    0xE00F7: "Control",
-    0xE00F8: "Control",
-    0xE00F9: "Control",
-    0xE00FA: "Control",
-    0xE00FB: "Control",
-    0xE00FC: "Control",
-    0xE00FD: "Control",
-    0xE00FE: "Control",
-    0xE00FF: "Control",
-    0xE01F0: "Control",
-    0xE01F1: "Control",
-    0xE01F2: "Control",
-    0xE01F3: "Control",
-    0xE01F4: "Control",
-    0xE01F5: "Control",
-    0xE01F6: "Control",
-    0xE01F7: "Control",
-    0xE01F8: "Control",
-    0xE01F9: "Control",
-    0xE01FA: "Control",
-    0xE01FB: "Control",
-    0xE01FC: "Control",
-    0xE01FD: "Control",
-    0xE01FE: "Control",
-    0xE01FF: "Control",
-    0xE0200: "Control",
-    0xE0201: "Control",
-    0xE0202: "Control",
-    0xE0203: "Control",
-    0xE0204: "Control",
-    0xE0205: "Control",
-    0xE0206: "Control",
-    0xE0207: "Control",
-    0xE0208: "Control",
-    0xE0209: "Control",
-    0xE020A: "Control",
-    0xE020B: "Control",
-    0xE020C: "Control",
-    0xE020D: "Control",
-    0xE020E: "Control",
-    0xE020F: "Control",
-    0xE0210: "Control",
-    0xE0211: "Control",
-    0xE0212: "Control",
-    0xE0213: "Control",
-    0xE0214: "Control",
-    0xE0215: "Control",
-    0xE0216: "Control",
-    0xE0217: "Control",
-    0xE0218: "Control",
-    0xE0219: "Control",
-    0xE021A: "Control",
-    0xE021B: "Control",
-    0xE021C: "Control",
-    0xE021D: "Control",
-    0xE021E: "Control",
-    0xE021F: "Control",
-    0xE0220: "Control",
-    0xE0221: "Control",
-    0xE0222: "Control",
-    0xE0223: "Control",
-    0xE0224: "Control",
-    0xE0225: "Control",
-    0xE0226: "Control",
-    0xE0227: "Control",
-    0xE0228: "Control",
-    0xE0229: "Control",
-    0xE022A: "Control",
-    0xE022B: "Control",
-    0xE022C: "Control",
-    0xE022D: "Control",
-    0xE022E: "Control",
-    0xE022F: "Control",
-    0xE0230: "Control",
-    0xE0231: "Control",
-    0xE0232: "Control",
-    0xE0233: "Control",
-    0xE0234: "Control",
-    0xE0235: "Control",
-    0xE0236: "Control",
-    0xE0237: "Control",
-    0xE0238: "Control",
-    0xE0239: "Control",
-    0xE023A: "Control",
-    0xE023B: "Control",
-    0xE023C: "Control",
-    0xE023D: "Control",
-    0xE023E: "Control",
-    0xE023F: "Control",
-    0xE0240: "Control",
-    0xE0241: "Control",
-    0xE0242: "Control",
-    0xE0243: "Control",
-    0xE0244: "Control",
-    0xE0245: "Control",
-    0xE0246: "Control",
-    0xE0247: "Control",
-    0xE0248: "Control",
-    0xE0249: "Control",
-    0xE024A: "Control",
-    0xE024B: "Control",
-    0xE024C: "Control",
-    0xE024D: "Control",
-    0xE024E: "Control",
-    0xE024F: "Control",
-    0xE0250: "Control",
-    0xE0251: "Control",
-    0xE0252: "Control",
-    0xE0253: "Control",
-    0xE0254: "Control",
-    0xE0255: "Control",
-    0xE0256: "Control",
-    0xE0257: "Control",
-    0xE0258: "Control",
-    0xE0259: "Control",
-    0xE025A: "Control",
-    0xE025B: "Control",
-    0xE025C: "Control",
-    0xE025D: "Control",
-    0xE025E: "Control",
-    0xE025F: "Control",
-    0xE0260: "Control",
-    0xE0261: "Control",
-    0xE0262: "Control",
-    0xE0263: "Control",
-    0xE0264: "Control",
-    0xE0265: "Control",
-    0xE0266: "Control",
-    0xE0267: "Control",
-    0xE0268: "Control",
-    0xE0269: "Control",
-    0xE026A: "Control",
-    0xE026B: "Control",
-    0xE026C: "Control",
-    0xE026D: "Control",
-    0xE026E: "Control",
-    0xE026F: "Control",
-    0xE0270: "Control",
-    0xE0271: "Control",
-    0xE0272: "Control",
-    0xE0273: "Control",
-    0xE0274: "Control",
-    0xE0275: "Control",
-    0xE0276: "Control",
-    0xE0277: "Control",
-    0xE0278: "Control",
-    0xE0279: "Control",
-    0xE027A: "Control",
-    0xE027B: "Control",
-    0xE027C: "Control",
-    0xE027D: "Control",
-    0xE027E: "Control",
-    0xE027F: "Control",
-    0xE0280: "Control",
-    0xE0281: "Control",
-    0xE0282: "Control",
-    0xE0283: "Control",
-    0xE0284: "Control",
-    0xE0285: "Control",
-    0xE0286: "Control",
-    0xE0287: "Control",
-    0xE0288: "Control",
-    0xE0289: "Control",
-    0xE028A: "Control",
-    0xE028B: "Control",
-    0xE028C: "Control",
-    0xE028D: "Control",
-    0xE028E: "Control",
-    0xE028F: "Control",
-    0xE0290: "Control",
-    0xE0291: "Control",
-    0xE0292: "Control",
-    0xE0293: "Control",
-    0xE0294: "Control",
-    0xE0295: "Control",
-    0xE0296: "Control",
-    0xE0297: "Control",
-    0xE0298: "Control",
-    0xE0299: "Control",
-    0xE029A: "Control",
-    0xE029B: "Control",
-    0xE029C: "Control",
-    0xE029D: "Control",
-    0xE029E: "Control",
-    0xE029F: "Control",
-    0xE02A0: "Control",
-    0xE02A1: "Control",
-    0xE02A2: "Control",
-    0xE02A3: "Control",
-    0xE02A4: "Control",
-    0xE02A5: "Control",
-    0xE02A6: "Control",
-    0xE02A7: "Control",
-    0xE02A8: "Control",
-    0xE02A9: "Control",
-    0xE02AA: "Control",
-    0xE02AB: "Control",
-    0xE02AC: "Control",
-    0xE02AD: "Control",
-    0xE02AE: "Control",
-    0xE02AF: "Control",
-    0xE02B0: "Control",
-    0xE02B1: "Control",
-    0xE02B2: "Control",
-    0xE02B3: "Control",
-    0xE02B4: "Control",
-    0xE02B5: "Control",
-    0xE02B6: "Control",
-    0xE02B7: "Control",
-    0xE02B8: "Control",
-    0xE02B9: "Control",
-    0xE02BA: "Control",
-    0xE02BB: "Control",
-    0xE02BC: "Control",
-    0xE02BD: "Control",
-    0xE02BE: "Control",
-    0xE02BF: "Control",
-    0xE02C0: "Control",
-    0xE02C1: "Control",
-    0xE02C2: "Control",
-    0xE02C3: "Control",
-    0xE02C4: "Control",
-    0xE02C5: "Control",
-    0xE02C6: "Control",
-    0xE02C7: "Control",
-    0xE02C8: "Control",
-    0xE02C9: "Control",
-    0xE02CA: "Control",
-    0xE02CB: "Control",
-    0xE02CC: "Control",
-    0xE02CD: "Control",
-    0xE02CE: "Control",
-    0xE02CF: "Control",
-    0xE02D0: "Control",
-    0xE02D1: "Control",
-    0xE02D2: "Control",
-    0xE02D3: "Control",
-    0xE02D4: "Control",
-    0xE02D5: "Control",
-    0xE02D6: "Control",
-    0xE02D7: "Control",
-    0xE02D8: "Control",
-    0xE02D9: "Control",
-    0xE02DA: "Control",
-    0xE02DB: "Control",
-    0xE02DC: "Control",
-    0xE02DD: "Control",
-    0xE02DE: "Control",
-    0xE02DF: "Control",
-    0xE02E0: "Control",
-    0xE02E1: "Control",
-    0xE02E2: "Control",
-    0xE02E3: "Control",
-    0xE02E4: "Control",
-    0xE02E5: "Control",
-    0xE02E6: "Control",
-    0xE02E7: "Control",
-    0xE02E8: "Control",
-    0xE02E9: "Control",
-    0xE02EA: "Control",
-    0xE02EB: "Control",
-    0xE02EC: "Control",
-    0xE02ED: "Control",
-    0xE02EE: "Control",
-    0xE02EF: "Control",
-    0xE02F0: "Control",
-    0xE02F1: "Control",
-    0xE02F2: "Control",
-    0xE02F3: "Control",
-    0xE02F4: "Control",
-    0xE02F5: "Control",
-    0xE02F6: "Control",
-    0xE02F7: "Control",
-    0xE02F8: "Control",
-    0xE02F9: "Control",
-    0xE02FA: "Control",
-    0xE02FB: "Control",
-    0xE02FC: "Control",
-    0xE02FD: "Control",
-    0xE02FE: "Control",
-    0xE02FF: "Control",
-    0xE0300: "Control",
-    0xE0301: "Control",
-    0xE0302: "Control",
-    0xE0303: "Control",
-    0xE0304: "Control",
-    0xE0305: "Control",
-    0xE0306: "Control",
-    0xE0307: "Control",
-    0xE0308: "Control",
-    0xE0309: "Control",
-    0xE030A: "Control",
-    0xE030B: "Control",
-    0xE030C: "Control",
-    0xE030D: "Control",
-    0xE030E: "Control",
-    0xE030F: "Control",
-    0xE0310: "Control",
-    0xE0311: "Control",
-    0xE0312: "Control",
-    0xE0313: "Control",
-    0xE0314: "Control",
-    0xE0315: "Control",
-    0xE0316: "Control",
-    0xE0317: "Control",
-    0xE0318: "Control",
-    0xE0319: "Control",
-    0xE031A: "Control",
-    0xE031B: "Control",
-    0xE031C: "Control",
-    0xE031D: "Control",
-    0xE031E: "Control",
-    0xE031F: "Control",
-    0xE0320: "Control",
-    0xE0321: "Control",
-    0xE0322: "Control",
-    0xE0323: "Control",
-    0xE0324: "Control",
-    0xE0325: "Control",
-    0xE0326: "Control",
-    0xE0327: "Control",
-    0xE0328: "Control",
-    0xE0329: "Control",
-    0xE032A: "Control",
-    0xE032B: "Control",
-    0xE032C: "Control",
-    0xE032D: "Control",
-    0xE032E: "Control",
-    0xE032F: "Control",
-    0xE0330: "Control",
-    0xE0331: "Control",
-    0xE0332: "Control",
-    0xE0333: "Control",
-    0xE0334: "Control",
-    0xE0335: "Control",
-    0xE0336: "Control",
-    0xE0337: "Control",
-    0xE0338: "Control",
-    0xE0339: "Control",
-    0xE033A: "Control",
-    0xE033B: "Control",
-    0xE033C: "Control",
-    0xE033D: "Control",
-    0xE033E: "Control",
-    0xE033F: "Control",
-    0xE0340: "Control",
-    0xE0341: "Control",
-    0xE0342: "Control",
-    0xE0343: "Control",
-    0xE0344: "Control",
-    0xE0345: "Control",
-    0xE0346: "Control",
-    0xE0347: "Control",
-    0xE0348: "Control",
-    0xE0349: "Control",
-    0xE034A: "Control",
-    0xE034B: "Control",
-    0xE034C: "Control",
-    0xE034D: "Control",
-    0xE034E: "Control",
-    0xE034F: "Control",
-    0xE0350: "Control",
-    0xE0351: "Control",
-    0xE0352: "Control",
-    0xE0353: "Control",
-    0xE0354: "Control",
-    0xE0355: "Control",
-    0xE0356: "Control",
-    0xE0357: "Control",
-    0xE0358: "Control",
-    0xE0359: "Control",
-    0xE035A: "Control",
-    0xE035B: "Control",
-    0xE035C: "Control",
-    0xE035D: "Control",
-    0xE035E: "Control",
-    0xE035F: "Control",
-    0xE0360: "Control",
-    0xE0361: "Control",
-    0xE0362: "Control",
-    0xE0363: "Control",
-    0xE0364: "Control",
-    0xE0365: "Control",
-    0xE0366: "Control",
-    0xE0367: "Control",
-    0xE0368: "Control",
-    0xE0369: "Control",
-    0xE036A: "Control",
-    0xE036B: "Control",
-    0xE036C: "Control",
-    0xE036D: "Control",
-    0xE036E: "Control",
-    0xE036F: "Control",
-    0xE0370: "Control",
-    0xE0371: "Control",
-    0xE0372: "Control",
-    0xE0373: "Control",
-    0xE0374: "Control",
-    0xE0375: "Control",
-    0xE0376: "Control",
-    0xE0377: "Control",
-    0xE0378: "Control",
-    0xE0379: "Control",
-    0xE037A: "Control",
-    0xE037B: "Control",
-    0xE037C: "Control",
-    0xE037D: "Control",
-    0xE037E: "Control",
-    0xE037F: "Control",
-    0xE0380: "Control",
-    0xE0381: "Control",
-    0xE0382: "Control",
-    0xE0383: "Control",
-    0xE0384: "Control",
-    0xE0385: "Control",
-    0xE0386: "Control",
-    0xE0387: "Control",
-    0xE0388: "Control",
-    0xE0389: "Control",
-    0xE038A: "Control",
-    0xE038B: "Control",
-    0xE038C: "Control",
-    0xE038D: "Control",
-    0xE038E: "Control",
-    0xE038F: "Control",
-    0xE0390: "Control",
-    0xE0391: "Control",
-    0xE0392: "Control",
-    0xE0393: "Control",
-    0xE0394: "Control",
-    0xE0395: "Control",
-    0xE0396: "Control",
-    0xE0397: "Control",
-    0xE0398: "Control",
-    0xE0399: "Control",
-    0xE039A: "Control",
-    0xE039B: "Control",
-    0xE039C: "Control",
-    0xE039D: "Control",
-    0xE039E: "Control",
-    0xE039F: "Control",
-    0xE03A0: "Control",
-    0xE03A1: "Control",
-    0xE03A2: "Control",
-    0xE03A3: "Control",
-    0xE03A4: "Control",
-    0xE03A5: "Control",
-    0xE03A6: "Control",
-    0xE03A7: "Control",
-    0xE03A8: "Control",
-    0xE03A9: "Control",
-    0xE03AA: "Control",
-    0xE03AB: "Control",
-    0xE03AC: "Control",
-    0xE03AD: "Control",
-    0xE03AE: "Control",
-    0xE03AF: "Control",
-    0xE03B0: "Control",
-    0xE03B1: "Control",
-    0xE03B2: "Control",
-    0xE03B3: "Control",
-    0xE03B4: "Control",
-    0xE03B5: "Control",
-    0xE03B6: "Control",
-    0xE03B7: "Control",
-    0xE03B8: "Control",
-    0xE03B9: "Control",
-    0xE03BA: "Control",
-    0xE03BB: "Control",
-    0xE03BC: "Control",
-    0xE03BD: "Control",
-    0xE03BE: "Control",
-    0xE03BF: "Control",
-    0xE03C0: "Control",
-    0xE03C1: "Control",
-    0xE03C2: "Control",
-    0xE03C3: "Control",
-    0xE03C4: "Control",
-    0xE03C5: "Control",
-    0xE03C6: "Control",
-    0xE03C7: "Control",
-    0xE03C8: "Control",
-    0xE03C9: "Control",
-    0xE03CA: "Control",
-    0xE03CB: "Control",
-    0xE03CC: "Control",
-    0xE03CD: "Control",
-    0xE03CE: "Control",
-    0xE03CF: "Control",
-    0xE03D0: "Control",
-    0xE03D1: "Control",
-    0xE03D2: "Control",
-    0xE03D3: "Control",
-    0xE03D4: "Control",
-    0xE03D5: "Control",
-    0xE03D6: "Control",
-    0xE03D7: "Control",
-    0xE03D8: "Control",
-    0xE03D9: "Control",
-    0xE03DA: "Control",
-    0xE03DB: "Control",
-    0xE03DC: "Control",
-    0xE03DD: "Control",
-    0xE03DE: "Control",
-    0xE03DF: "Control",
-    0xE03E0: "Control",
-    0xE03E1: "Control",
-    0xE03E2: "Control",
-    0xE03E3: "Control",
-    0xE03E4: "Control",
-    0xE03E5: "Control",
-    0xE03E6: "Control",
-    0xE03E7: "Control",
-    0xE03E8: "Control",
-    0xE03E9: "Control",
-    0xE03EA: "Control",
-    0xE03EB: "Control",
-    0xE03EC: "Control",
-    0xE03ED: "Control",
-    0xE03EE: "Control",
-    0xE03EF: "Control",
-    0xE03F0: "Control",
-    0xE03F1: "Control",
-    0xE03F2: "Control",
-    0xE03F3: "Control",
-    0xE03F4: "Control",
-    0xE03F5: "Control",
-    0xE03F6: "Control",
-    0xE03F7: "Control",
-    0xE03F8: "Control",
-    0xE03F9: "Control",
-    0xE03FA: "Control",
-    0xE03FB: "Control",
-    0xE03FC: "Control",
-    0xE03FD: "Control",
-    0xE03FE: "Control",
-    0xE03FF: "Control",
-    0xE0400: "Control",
-    0xE0401: "Control",
-    0xE0402: "Control",
-    0xE0403: "Control",
-    0xE0404: "Control",
-    0xE0405: "Control",
-    0xE0406: "Control",
-    0xE0407: "Control",
-    0xE0408: "Control",
-    0xE0409: "Control",
-    0xE040A: "Control",
-    0xE040B: "Control",
-    0xE040C: "Control",
-    0xE040D: "Control",
-    0xE040E: "Control",
-    0xE040F: "Control",
-    0xE0410: "Control",
-    0xE0411: "Control",
-    0xE0412: "Control",
-    0xE0413: "Control",
-    0xE0414: "Control",
-    0xE0415: "Control",
-    0xE0416: "Control",
-    0xE0417: "Control",
-    0xE0418: "Control",
-    0xE0419: "Control",
-    0xE041A: "Control",
-    0xE041B: "Control",
-    0xE041C: "Control",
-    0xE041D: "Control",
-    0xE041E: "Control",
-    0xE041F: "Control",
-    0xE0420: "Control",
-    0xE0421: "Control",
-    0xE0422: "Control",
-    0xE0423: "Control",
-    0xE0424: "Control",
-    0xE0425: "Control",
-    0xE0426: "Control",
-    0xE0427: "Control",
-    0xE0428: "Control",
-    0xE0429: "Control",
-    0xE042A: "Control",
-    0xE042B: "Control",
-    0xE042C: "Control",
-    0xE042D: "Control",
-    0xE042E: "Control",
-    0xE042F: "Control",
-    0xE0430: "Control",
-    0xE0431: "Control",
-    0xE0432: "Control",
-    0xE0433: "Control",
-    0xE0434: "Control",
-    0xE0435: "Control",
-    0xE0436: "Control",
-    0xE0437: "Control",
-    0xE0438: "Control",
-    0xE0439: "Control",
-    0xE043A: "Control",
-    0xE043B: "Control",
-    0xE043C: "Control",
-    0xE043D: "Control",
-    0xE043E: "Control",
-    0xE043F: "Control",
-    0xE0440: "Control",
-    0xE0441: "Control",
-    0xE0442: "Control",
-    0xE0443: "Control",
-    0xE0444: "Control",
-    0xE0445: "Control",
-    0xE0446: "Control",
-    0xE0447: "Control",
-    0xE0448: "Control",
-    0xE0449: "Control",
-    0xE044A: "Control",
-    0xE044B: "Control",
-    0xE044C: "Control",
-    0xE044D: "Control",
-    0xE044E: "Control",
-    0xE044F: "Control",
-    0xE0450: "Control",
-    0xE0451: "Control",
-    0xE0452: "Control",
-    0xE0453: "Control",
-    0xE0454: "Control",
-    0xE0455: "Control",
-    0xE0456: "Control",
-    0xE0457: "Control",
-    0xE0458: "Control",
-    0xE0459: "Control",
-    0xE045A: "Control",
-    0xE045B: "Control",
-    0xE045C: "Control",
-    0xE045D: "Control",
-    0xE045E: "Control",
-    0xE045F: "Control",
-    0xE0460: "Control",
-    0xE0461: "Control",
-    0xE0462: "Control",
-    0xE0463: "Control",
-    0xE0464: "Control",
-    0xE0465: "Control",
-    0xE0466: "Control",
-    0xE0467: "Control",
-    0xE0468: "Control",
-    0xE0469: "Control",
-    0xE046A: "Control",
-    0xE046B: "Control",
-    0xE046C: "Control",
-    0xE046D: "Control",
-    0xE046E: "Control",
-    0xE046F: "Control",
-    0xE0470: "Control",
-    0xE0471: "Control",
-    0xE0472: "Control",
-    0xE0473: "Control",
-    0xE0474: "Control",
-    0xE0475: "Control",
-    0xE0476: "Control",
-    0xE0477: "Control",
-    0xE0478: "Control",
-    0xE0479: "Control",
-    0xE047A: "Control",
-    0xE047B: "Control",
-    0xE047C: "Control",
-    0xE047D: "Control",
-    0xE047E: "Control",
-    0xE047F: "Control",
-    0xE0480: "Control",
-    0xE0481: "Control",
-    0xE0482: "Control",
-    0xE0483: "Control",
-    0xE0484: "Control",
-    0xE0485: "Control",
-    0xE0486: "Control",
-    0xE0487: "Control",
-    0xE0488: "Control",
-    0xE0489: "Control",
-    0xE048A: "Control",
-    0xE048B: "Control",
-    0xE048C: "Control",
-    0xE048D: "Control",
-    0xE048E: "Control",
-    0xE048F: "Control",
-    0xE0490: "Control",
-    0xE0491: "Control",
-    0xE0492: "Control",
-    0xE0493: "Control",
-    0xE0494: "Control",
-    0xE0495: "Control",
-    0xE0496: "Control",
-    0xE0497: "Control",
-    0xE0498: "Control",
-    0xE0499: "Control",
-    0xE049A: "Control",
-    0xE049B: "Control",
-    0xE049C: "Control",
-    0xE049D: "Control",
-    0xE049E: "Control",
-    0xE049F: "Control",
-    0xE04A0: "Control",
-    0xE04A1: "Control",
-    0xE04A2: "Control",
-    0xE04A3: "Control",
-    0xE04A4: "Control",
-    0xE04A5: "Control",
-    0xE04A6: "Control",
-    0xE04A7: "Control",
-    0xE04A8: "Control",
-    0xE04A9: "Control",
-    0xE04AA: "Control",
-    0xE04AB: "Control",
-    0xE04AC: "Control",
-    0xE04AD: "Control",
-    0xE04AE: "Control",
-    0xE04AF: "Control",
-    0xE04B0: "Control",
-    0xE04B1: "Control",
-    0xE04B2: "Control",
-    0xE04B3: "Control",
-    0xE04B4: "Control",
-    0xE04B5: "Control",
-    0xE04B6: "Control",
-    0xE04B7: "Control",
-    0xE04B8: "Control",
-    0xE04B9: "Control",
-    0xE04BA: "Control",
-    0xE04BB: "Control",
-    0xE04BC: "Control",
-    0xE04BD: "Control",
-    0xE04BE: "Control",
-    0xE04BF: "Control",
-    0xE04C0: "Control",
-    0xE04C1: "Control",
-    0xE04C2: "Control",
-    0xE04C3: "Control",
-    0xE04C4: "Control",
-    0xE04C5: "Control",
-    0xE04C6: "Control",
-    0xE04C7: "Control",
-    0xE04C8: "Control",
-    0xE04C9: "Control",
-    0xE04CA: "Control",
-    0xE04CB: "Control",
-    0xE04CC: "Control",
-    0xE04CD: "Control",
-    0xE04CE: "Control",
-    0xE04CF: "Control",
-    0xE04D0: "Control",
-    0xE04D1: "Control",
-    0xE04D2: "Control",
-    0xE04D3: "Control",
-    0xE04D4: "Control",
-    0xE04D5: "Control",
-    0xE04D6: "Control",
-    0xE04D7: "Control",
-    0xE04D8: "Control",
-    0xE04D9: "Control",
-    0xE04DA: "Control",
-    0xE04DB: "Control",
-    0xE04DC: "Control",
-    0xE04DD: "Control",
-    0xE04DE: "Control",
-    0xE04DF: "Control",
-    0xE04E0: "Control",
-    0xE04E1: "Control",
-    0xE04E2: "Control",
-    0xE04E3: "Control",
-    0xE04E4: "Control",
-    0xE04E5: "Control",
-    0xE04E6: "Control",
-    0xE04E7: "Control",
-    0xE04E8: "Control",
-    0xE04E9: "Control",
-    0xE04EA: "Control",
-    0xE04EB: "Control",
-    0xE04EC: "Control",
-    0xE04ED: "Control",
-    0xE04EE: "Control",
-    0xE04EF: "Control",
-    0xE04F0: "Control",
-    0xE04F1: "Control",
-    0xE04F2: "Control",
-    0xE04F3: "Control",
-    0xE04F4: "Control",
-    0xE04F5: "Control",
-    0xE04F6: "Control",
-    0xE04F7: "Control",
-    0xE04F8: "Control",
-    0xE04F9: "Control",
-    0xE04FA: "Control",
-    0xE04FB: "Control",
-    0xE04FC: "Control",
-    0xE04FD: "Control",
-    0xE04FE: "Control",
-    0xE04FF: "Control",
-    0xE0500: "Control",
-    0xE0501: "Control",
-    0xE0502: "Control",
-    0xE0503: "Control",
-    0xE0504: "Control",
-    0xE0505: "Control",
-    0xE0506: "Control",
-    0xE0507: "Control",
-    0xE0508: "Control",
-    0xE0509: "Control",
-    0xE050A: "Control",
-    0xE050B: "Control",
-    0xE050C: "Control",
-    0xE050D: "Control",
-    0xE050E: "Control",
-    0xE050F: "Control",
-    0xE0510: "Control",
-    0xE0511: "Control",
-    0xE0512: "Control",
-    0xE0513: "Control",
-    0xE0514: "Control",
-    0xE0515: "Control",
-    0xE0516: "Control",
-    0xE0517: "Control",
-    0xE0518: "Control",
-    0xE0519: "Control",
-    0xE051A: "Control",
-    0xE051B: "Control",
-    0xE051C: "Control",
-    0xE051D: "Control",
-    0xE051E: "Control",
-    0xE051F: "Control",
-    0xE0520: "Control",
-    0xE0521: "Control",
-    0xE0522: "Control",
-    0xE0523: "Control",
-    0xE0524: "Control",
-    0xE0525: "Control",
-    0xE0526: "Control",
-    0xE0527: "Control",
-    0xE0528: "Control",
-    0xE0529: "Control",
-    0xE052A: "Control",
-    0xE052B: "Control",
-    0xE052C: "Control",
-    0xE052D: "Control",
-    0xE052E: "Control",
-    0xE052F: "Control",
-    0xE0530: "Control",
-    0xE0531: "Control",
-    0xE0532: "Control",
-    0xE0533: "Control",
-    0xE0534: "Control",
-    0xE0535: "Control",
-    0xE0536: "Control",
-    0xE0537: "Control",
-    0xE0538: "Control",
-    0xE0539: "Control",
-    0xE053A: "Control",
-    0xE053B: "Control",
-    0xE053C: "Control",
-    0xE053D: "Control",
-    0xE053E: "Control",
-    0xE053F: "Control",
-    0xE0540: "Control",
-    0xE0541: "Control",
-    0xE0542: "Control",
-    0xE0543: "Control",
-    0xE0544: "Control",
-    0xE0545: "Control",
-    0xE0546: "Control",
-    0xE0547: "Control",
-    0xE0548: "Control",
-    0xE0549: "Control",
-    0xE054A: "Control",
-    0xE054B: "Control",
-    0xE054C: "Control",
-    0xE054D: "Control",
-    0xE054E: "Control",
-    0xE054F: "Control",
-    0xE0550: "Control",
-    0xE0551: "Control",
-    0xE0552: "Control",
-    0xE0553: "Control",
-    0xE0554: "Control",
-    0xE0555: "Control",
-    0xE0556: "Control",
-    0xE0557: "Control",
-    0xE0558: "Control",
-    0xE0559: "Control",
-    0xE055A: "Control",
-    0xE055B: "Control",
-    0xE055C: "Control",
-    0xE055D: "Control",
-    0xE055E: "Control",
-    0xE055F: "Control",
-    0xE0560: "Control",
-    0xE0561: "Control",
-    0xE0562: "Control",
-    0xE0563: "Control",
-    0xE0564: "Control",
-    0xE0565: "Control",
-    0xE0566: "Control",
-    0xE0567: "Control",
-    0xE0568: "Control",
-    0xE0569: "Control",
-    0xE056A: "Control",
-    0xE056B: "Control",
-    0xE056C: "Control",
-    0xE056D: "Control",
-    0xE056E: "Control",
-    0xE056F: "Control",
-    0xE0570: "Control",
-    0xE0571: "Control",
-    0xE0572: "Control",
-    0xE0573: "Control",
-    0xE0574: "Control",
-    0xE0575: "Control",
-    0xE0576: "Control",
-    0xE0577: "Control",
-    0xE0578: "Control",
-    0xE0579: "Control",
-    0xE057A: "Control",
-    0xE057B: "Control",
-    0xE057C: "Control",
-    0xE057D: "Control",
-    0xE057E: "Control",
-    0xE057F: "Control",
-    0xE0580: "Control",
-    0xE0581: "Control",
-    0xE0582: "Control",
-    0xE0583: "Control",
-    0xE0584: "Control",
-    0xE0585: "Control",
-    0xE0586: "Control",
-    0xE0587: "Control",
-    0xE0588: "Control",
-    0xE0589: "Control",
-    0xE058A: "Control",
-    0xE058B: "Control",
-    0xE058C: "Control",
-    0xE058D: "Control",
-    0xE058E: "Control",
-    0xE058F: "Control",
-    0xE0590: "Control",
-    0xE0591: "Control",
-    0xE0592: "Control",
-    0xE0593: "Control",
-    0xE0594: "Control",
-    0xE0595: "Control",
-    0xE0596: "Control",
-    0xE0597: "Control",
-    0xE0598: "Control",
-    0xE0599: "Control",
-    0xE059A: "Control",
-    0xE059B: "Control",
-    0xE059C: "Control",
-    0xE059D: "Control",
-    0xE059E: "Control",
-    0xE059F: "Control",
-    0xE05A0: "Control",
-    0xE05A1: "Control",
-    0xE05A2: "Control",
-    0xE05A3: "Control",
-    0xE05A4: "Control",
-    0xE05A5: "Control",
-    0xE05A6: "Control",
-    0xE05A7: "Control",
-    0xE05A8: "Control",
-    0xE05A9: "Control",
-    0xE05AA: "Control",
-    0xE05AB: "Control",
-    0xE05AC: "Control",
-    0xE05AD: "Control",
-    0xE05AE: "Control",
-    0xE05AF: "Control",
-    0xE05B0: "Control",
-    0xE05B1: "Control",
-    0xE05B2: "Control",
-    0xE05B3: "Control",
-    0xE05B4: "Control",
-    0xE05B5: "Control",
-    0xE05B6: "Control",
-    0xE05B7: "Control",
-    0xE05B8: "Control",
-    0xE05B9: "Control",
-    0xE05BA: "Control",
-    0xE05BB: "Control",
-    0xE05BC: "Control",
-    0xE05BD: "Control",
-    0xE05BE: "Control",
-    0xE05BF: "Control",
-    0xE05C0: "Control",
-    0xE05C1: "Control",
-    0xE05C2: "Control",
-    0xE05C3: "Control",
-    0xE05C4: "Control",
-    0xE05C5: "Control",
-    0xE05C6: "Control",
-    0xE05C7: "Control",
-    0xE05C8: "Control",
-    0xE05C9: "Control",
-    0xE05CA: "Control",
-    0xE05CB: "Control",
-    0xE05CC: "Control",
-    0xE05CD: "Control",
-    0xE05CE: "Control",
-    0xE05CF: "Control",
-    0xE05D0: "Control",
-    0xE05D1: "Control",
-    0xE05D2: "Control",
-    0xE05D3: "Control",
-    0xE05D4: "Control",
-    0xE05D5: "Control",
-    0xE05D6: "Control",
-    0xE05D7: "Control",
-    0xE05D8: "Control",
-    0xE05D9: "Control",
-    0xE05DA: "Control",
-    0xE05DB: "Control",
-    0xE05DC: "Control",
-    0xE05DD: "Control",
-    0xE05DE: "Control",
-    0xE05DF: "Control",
-    0xE05E0: "Control",
-    0xE05E1: "Control",
-    0xE05E2: "Control",
-    0xE05E3: "Control",
-    0xE05E4: "Control",
-    0xE05E5: "Control",
-    0xE05E6: "Control",
-    0xE05E7: "Control",
-    0xE05E8: "Control",
-    0xE05E9: "Control",
-    0xE05EA: "Control",
-    0xE05EB: "Control",
-    0xE05EC: "Control",
-    0xE05ED: "Control",
-    0xE05EE: "Control",
-    0xE05EF: "Control",
-    0xE05F0: "Control",
-    0xE05F1: "Control",
-    0xE05F2: "Control",
-    0xE05F3: "Control",
-    0xE05F4: "Control",
-    0xE05F5: "Control",
-    0xE05F6: "Control",
-    0xE05F7: "Control",
-    0xE05F8: "Control",
-    0xE05F9: "Control",
-    0xE05FA: "Control",
-    0xE05FB: "Control",
-    0xE05FC: "Control",
-    0xE05FD: "Control",
-    0xE05FE: "Control",
-    0xE05FF: "Control",
-    0xE0600: "Control",
-    0xE0601: "Control",
-    0xE0602: "Control",
-    0xE0603: "Control",
-    0xE0604: "Control",
-    0xE0605: "Control",
-    0xE0606: "Control",
-    0xE0607: "Control",
-    0xE0608: "Control",
-    0xE0609: "Control",
-    0xE060A: "Control",
-    0xE060B: "Control",
-    0xE060C: "Control",
-    0xE060D: "Control",
-    0xE060E: "Control",
-    0xE060F: "Control",
-    0xE0610: "Control",
-    0xE0611: "Control",
-    0xE0612: "Control",
-    0xE0613: "Control",
-    0xE0614: "Control",
-    0xE0615: "Control",
-    0xE0616: "Control",
-    0xE0617: "Control",
-    0xE0618: "Control",
-    0xE0619: "Control",
-    0xE061A: "Control",
-    0xE061B: "Control",
-    0xE061C: "Control",
-    0xE061D: "Control",
-    0xE061E: "Control",
-    0xE061F: "Control",
-    0xE0620: "Control",
-    0xE0621: "Control",
-    0xE0622: "Control",
-    0xE0623: "Control",
-    0xE0624: "Control",
-    0xE0625: "Control",
-    0xE0626: "Control",
-    0xE0627: "Control",
-    0xE0628: "Control",
-    0xE0629: "Control",
-    0xE062A: "Control",
-    0xE062B: "Control",
-    0xE062C: "Control",
-    0xE062D: "Control",
-    0xE062E: "Control",
-    0xE062F: "Control",
-    0xE0630: "Control",
-    0xE0631: "Control",
-    0xE0632: "Control",
-    0xE0633: "Control",
-    0xE0634: "Control",
-    0xE0635: "Control",
-    0xE0636: "Control",
-    0xE0637: "Control",
-    0xE0638: "Control",
-    0xE0639: "Control",
-    0xE063A: "Control",
-    0xE063B: "Control",
-    0xE063C: "Control",
-    0xE063D: "Control",
-    0xE063E: "Control",
-    0xE063F: "Control",
-    0xE0640: "Control",
-    0xE0641: "Control",
-    0xE0642: "Control",
-    0xE0643: "Control",
-    0xE0644: "Control",
-    0xE0645: "Control",
-    0xE0646: "Control",
-    0xE0647: "Control",
-    0xE0648: "Control",
-    0xE0649: "Control",
-    0xE064A: "Control",
-    0xE064B: "Control",
-    0xE064C: "Control",
-    0xE064D: "Control",
-    0xE064E: "Control",
-    0xE064F: "Control",
-    0xE0650: "Control",
-    0xE0651: "Control",
-    0xE0652: "Control",
-    0xE0653: "Control",
-    0xE0654: "Control",
-    0xE0655: "Control",
-    0xE0656: "Control",
-    0xE0657: "Control",
-    0xE0658: "Control",
-    0xE0659: "Control",
-    0xE065A: "Control",
-    0xE065B: "Control",
-    0xE065C: "Control",
-    0xE065D: "Control",
-    0xE065E: "Control",
-    0xE065F: "Control",
-    0xE0660: "Control",
-    0xE0661: "Control",
-    0xE0662: "Control",
-    0xE0663: "Control",
-    0xE0664: "Control",
-    0xE0665: "Control",
-    0xE0666: "Control",
-    0xE0667: "Control",
-    0xE0668: "Control",
-    0xE0669: "Control",
-    0xE066A: "Control",
-    0xE066B: "Control",
-    0xE066C: "Control",
-    0xE066D: "Control",
-    0xE066E: "Control",
-    0xE066F: "Control",
-    0xE0670: "Control",
-    0xE0671: "Control",
-    0xE0672: "Control",
-    0xE0673: "Control",
-    0xE0674: "Control",
-    0xE0675: "Control",
-    0xE0676: "Control",
-    0xE0677: "Control",
-    0xE0678: "Control",
-    0xE0679: "Control",
-    0xE067A: "Control",
-    0xE067B: "Control",
-    0xE067C: "Control",
-    0xE067D: "Control",
-    0xE067E: "Control",
-    0xE067F: "Control",
-    0xE0680: "Control",
-    0xE0681: "Control",
-    0xE0682: "Control",
-    0xE0683: "Control",
-    0xE0684: "Control",
-    0xE0685: "Control",
-    0xE0686: "Control",
-    0xE0687: "Control",
-    0xE0688: "Control",
-    0xE0689: "Control",
-    0xE068A: "Control",
-    0xE068B: "Control",
-    0xE068C: "Control",
-    0xE068D: "Control",
-    0xE068E: "Control",
-    0xE068F: "Control",
-    0xE0690: "Control",
-    0xE0691: "Control",
-    0xE0692: "Control",
-    0xE0693: "Control",
-    0xE0694: "Control",
-    0xE0695: "Control",
-    0xE0696: "Control",
-    0xE0697: "Control",
-    0xE0698: "Control",
-    0xE0699: "Control",
-    0xE069A: "Control",
-    0xE069B: "Control",
-    0xE069C: "Control",
-    0xE069D: "Control",
-    0xE069E: "Control",
-    0xE069F: "Control",
-    0xE06A0: "Control",
-    0xE06A1: "Control",
-    0xE06A2: "Control",
-    0xE06A3: "Control",
-    0xE06A4: "Control",
-    0xE06A5: "Control",
-    0xE06A6: "Control",
-    0xE06A7: "Control",
-    0xE06A8: "Control",
-    0xE06A9: "Control",
-    0xE06AA: "Control",
-    0xE06AB: "Control",
-    0xE06AC: "Control",
-    0xE06AD: "Control",
-    0xE06AE: "Control",
-    0xE06AF: "Control",
-    0xE06B0: "Control",
-    0xE06B1: "Control",
-    0xE06B2: "Control",
-    0xE06B3: "Control",
-    0xE06B4: "Control",
-    0xE06B5: "Control",
-    0xE06B6: "Control",
-    0xE06B7: "Control",
-    0xE06B8: "Control",
-    0xE06B9: "Control",
-    0xE06BA: "Control",
-    0xE06BB: "Control",
-    0xE06BC: "Control",
-    0xE06BD: "Control",
-    0xE06BE: "Control",
-    0xE06BF: "Control",
-    0xE06C0: "Control",
-    0xE06C1: "Control",
-    0xE06C2: "Control",
-    0xE06C3: "Control",
-    0xE06C4: "Control",
-    0xE06C5: "Control",
-    0xE06C6: "Control",
-    0xE06C7: "Control",
-    0xE06C8: "Control",
-    0xE06C9: "Control",
-    0xE06CA: "Control",
-    0xE06CB: "Control",
-    0xE06CC: "Control",
-    0xE06CD: "Control",
-    0xE06CE: "Control",
-    0xE06CF: "Control",
-    0xE06D0: "Control",
-    0xE06D1: "Control",
-    0xE06D2: "Control",
-    0xE06D3: "Control",
-    0xE06D4: "Control",
-    0xE06D5: "Control",
-    0xE06D6: "Control",
-    0xE06D7: "Control",
-    0xE06D8: "Control",
-    0xE06D9: "Control",
-    0xE06DA: "Control",
-    0xE06DB: "Control",
-    0xE06DC: "Control",
-    0xE06DD: "Control",
-    0xE06DE: "Control",
-    0xE06DF: "Control",
-    0xE06E0: "Control",
-    0xE06E1: "Control",
-    0xE06E2: "Control",
-    0xE06E3: "Control",
-    0xE06E4: "Control",
-    0xE06E5: "Control",
-    0xE06E6: "Control",
-    0xE06E7: "Control",
-    0xE06E8: "Control",
-    0xE06E9: "Control",
-    0xE06EA: "Control",
-    0xE06EB: "Control",
-    0xE06EC: "Control",
-    0xE06ED: "Control",
-    0xE06EE: "Control",
-    0xE06EF: "Control",
-    0xE06F0: "Control",
-    0xE06F1: "Control",
-    0xE06F2: "Control",
-    0xE06F3: "Control",
-    0xE06F4: "Control",
-    0xE06F5: "Control",
-    0xE06F6: "Control",
-    0xE06F7: "Control",
-    0xE06F8: "Control",
-    0xE06F9: "Control",
-    0xE06FA: "Control",
-    0xE06FB: "Control",
-    0xE06FC: "Control",
-    0xE06FD: "Control",
-    0xE06FE: "Control",
-    0xE06FF: "Control",
-    0xE0700: "Control",
-    0xE0701: "Control",
-    0xE0702: "Control",
-    0xE0703: "Control",
-    0xE0704: "Control",
-    0xE0705: "Control",
-    0xE0706: "Control",
-    0xE0707: "Control",
-    0xE0708: "Control",
-    0xE0709: "Control",
-    0xE070A: "Control",
-    0xE070B: "Control",
-    0xE070C: "Control",
-    0xE070D: "Control",
-    0xE070E: "Control",
-    0xE070F: "Control",
-    0xE0710: "Control",
-    0xE0711: "Control",
-    0xE0712: "Control",
-    0xE0713: "Control",
-    0xE0714: "Control",
-    0xE0715: "Control",
-    0xE0716: "Control",
-    0xE0717: "Control",
-    0xE0718: "Control",
-    0xE0719: "Control",
-    0xE071A: "Control",
-    0xE071B: "Control",
-    0xE071C: "Control",
-    0xE071D: "Control",
-    0xE071E: "Control",
-    0xE071F: "Control",
-    0xE0720: "Control",
-    0xE0721: "Control",
-    0xE0722: "Control",
-    0xE0723: "Control",
-    0xE0724: "Control",
-    0xE0725: "Control",
-    0xE0726: "Control",
-    0xE0727: "Control",
-    0xE0728: "Control",
-    0xE0729: "Control",
-    0xE072A: "Control",
-    0xE072B: "Control",
-    0xE072C: "Control",
-    0xE072D: "Control",
-    0xE072E: "Control",
-    0xE072F: "Control",
-    0xE0730: "Control",
-    0xE0731: "Control",
-    0xE0732: "Control",
-    0xE0733: "Control",
-    0xE0734: "Control",
-    0xE0735: "Control",
-    0xE0736: "Control",
-    0xE0737: "Control",
-    0xE0738: "Control",
-    0xE0739: "Control",
-    0xE073A: "Control",
-    0xE073B: "Control",
-    0xE073C: "Control",
-    0xE073D: "Control",
-    0xE073E: "Control",
-    0xE073F: "Control",
-    0xE0740: "Control",
-    0xE0741: "Control",
-    0xE0742: "Control",
-    0xE0743: "Control",
-    0xE0744: "Control",
-    0xE0745: "Control",
-    0xE0746: "Control",
-    0xE0747: "Control",
-    0xE0748: "Control",
-    0xE0749: "Control",
-    0xE074A: "Control",
-    0xE074B: "Control",
-    0xE074C: "Control",
-    0xE074D: "Control",
-    0xE074E: "Control",
-    0xE074F: "Control",
-    0xE0750: "Control",
-    0xE0751: "Control",
-    0xE0752: "Control",
-    0xE0753: "Control",
-    0xE0754: "Control",
-    0xE0755: "Control",
-    0xE0756: "Control",
-    0xE0757: "Control",
-    0xE0758: "Control",
-    0xE0759: "Control",
-    0xE075A: "Control",
-    0xE075B: "Control",
-    0xE075C: "Control",
-    0xE075D: "Control",
-    0xE075E: "Control",
-    0xE075F: "Control",
-    0xE0760: "Control",
-    0xE0761: "Control",
-    0xE0762: "Control",
-    0xE0763: "Control",
-    0xE0764: "Control",
-    0xE0765: "Control",
-    0xE0766: "Control",
-    0xE0767: "Control",
-    0xE0768: "Control",
-    0xE0769: "Control",
-    0xE076A: "Control",
-    0xE076B: "Control",
-    0xE076C: "Control",
-    0xE076D: "Control",
-    0xE076E: "Control",
-    0xE076F: "Control",
-    0xE0770: "Control",
-    0xE0771: "Control",
-    0xE0772: "Control",
-    0xE0773: "Control",
-    0xE0774: "Control",
-    0xE0775: "Control",
-    0xE0776: "Control",
-    0xE0777: "Control",
-    0xE0778: "Control",
-    0xE0779: "Control",
-    0xE077A: "Control",
-    0xE077B: "Control",
-    0xE077C: "Control",
-    0xE077D: "Control",
-    0xE077E: "Control",
-    0xE077F: "Control",
-    0xE0780: "Control",
-    0xE0781: "Control",
-    0xE0782: "Control",
-    0xE0783: "Control",
-    0xE0784: "Control",
-    0xE0785: "Control",
-    0xE0786: "Control",
-    0xE0787: "Control",
-    0xE0788: "Control",
-    0xE0789: "Control",
-    0xE078A: "Control",
-    0xE078B: "Control",
-    0xE078C: "Control",
-    0xE078D: "Control",
-    0xE078E: "Control",
-    0xE078F: "Control",
-    0xE0790: "Control",
-    0xE0791: "Control",
-    0xE0792: "Control",
-    0xE0793: "Control",
-    0xE0794: "Control",
-    0xE0795: "Control",
-    0xE0796: "Control",
-    0xE0797: "Control",
-    0xE0798: "Control",
-    0xE0799: "Control",
-    0xE079A: "Control",
-    0xE079B: "Control",
-    0xE079C: "Control",
-    0xE079D: "Control",
-    0xE079E: "Control",
-    0xE079F: "Control",
-    0xE07A0: "Control",
-    0xE07A1: "Control",
-    0xE07A2: "Control",
-    0xE07A3: "Control",
-    0xE07A4: "Control",
-    0xE07A5: "Control",
-    0xE07A6: "Control",
-    0xE07A7: "Control",
-    0xE07A8: "Control",
-    0xE07A9: "Control",
-    0xE07AA: "Control",
-    0xE07AB: "Control",
-    0xE07AC: "Control",
-    0xE07AD: "Control",
-    0xE07AE: "Control",
-    0xE07AF: "Control",
-    0xE07B0: "Control",
-    0xE07B1: "Control",
-    0xE07B2: "Control",
-    0xE07B3: "Control",
-    0xE07B4: "Control",
-    0xE07B5: "Control",
-    0xE07B6: "Control",
-    0xE07B7: "Control",
-    0xE07B8: "Control",
-    0xE07B9: "Control",
-    0xE07BA: "Control",
-    0xE07BB: "Control",
-    0xE07BC: "Control",
-    0xE07BD: "Control",
-    0xE07BE: "Control",
-    0xE07BF: "Control",
-    0xE07C0: "Control",
-    0xE07C1: "Control",
-    0xE07C2: "Control",
-    0xE07C3: "Control",
-    0xE07C4: "Control",
-    0xE07C5: "Control",
-    0xE07C6: "Control",
-    0xE07C7: "Control",
-    0xE07C8: "Control",
-    0xE07C9: "Control",
-    0xE07CA: "Control",
-    0xE07CB: "Control",
-    0xE07CC: "Control",
-    0xE07CD: "Control",
-    0xE07CE: "Control",
-    0xE07CF: "Control",
-    0xE07D0: "Control",
-    0xE07D1: "Control",
-    0xE07D2: "Control",
-    0xE07D3: "Control",
-    0xE07D4: "Control",
-    0xE07D5: "Control",
-    0xE07D6: "Control",
-    0xE07D7: "Control",
-    0xE07D8: "Control",
-    0xE07D9: "Control",
-    0xE07DA: "Control",
-    0xE07DB: "Control",
-    0xE07DC: "Control",
-    0xE07DD: "Control",
-    0xE07DE: "Control",
-    0xE07DF: "Control",
-    0xE07E0: "Control",
-    0xE07E1: "Control",
-    0xE07E2: "Control",
-    0xE07E3: "Control",
-    0xE07E4: "Control",
-    0xE07E5: "Control",
-    0xE07E6: "Control",
-    0xE07E7: "Control",
-    0xE07E8: "Control",
-    0xE07E9: "Control",
-    0xE07EA: "Control",
-    0xE07EB: "Control",
-    0xE07EC: "Control",
-    0xE07ED: "Control",
-    0xE07EE: "Control",
-    0xE07EF: "Control",
-    0xE07F0: "Control",
-    0xE07F1: "Control",
-    0xE07F2: "Control",
-    0xE07F3: "Control",
-    0xE07F4: "Control",
-    0xE07F5: "Control",
-    0xE07F6: "Control",
-    0xE07F7: "Control",
-    0xE07F8: "Control",
-    0xE07F9: "Control",
-    0xE07FA: "Control",
-    0xE07FB: "Control",
-    0xE07FC: "Control",
-    0xE07FD: "Control",
-    0xE07FE: "Control",
-    0xE07FF: "Control",
-    0xE0800: "Control",
-    0xE0801: "Control",
-    0xE0802: "Control",
-    0xE0803: "Control",
-    0xE0804: "Control",
-    0xE0805: "Control",
-    0xE0806: "Control",
-    0xE0807: "Control",
-    0xE0808: "Control",
-    0xE0809: "Control",
-    0xE080A: "Control",
-    0xE080B: "Control",
-    0xE080C: "Control",
-    0xE080D: "Control",
-    0xE080E: "Control",
-    0xE080F: "Control",
-    0xE0810: "Control",
-    0xE0811: "Control",
-    0xE0812: "Control",
-    0xE0813: "Control",
-    0xE0814: "Control",
-    0xE0815: "Control",
-    0xE0816: "Control",
-    0xE0817: "Control",
-    0xE0818: "Control",
-    0xE0819: "Control",
-    0xE081A: "Control",
-    0xE081B: "Control",
-    0xE081C: "Control",
-    0xE081D: "Control",
-    0xE081E: "Control",
-    0xE081F: "Control",
-    0xE0820: "Control",
-    0xE0821: "Control",
-    0xE0822: "Control",
-    0xE0823: "Control",
-    0xE0824: "Control",
-    0xE0825: "Control",
-    0xE0826: "Control",
-    0xE0827: "Control",
-    0xE0828: "Control",
-    0xE0829: "Control",
-    0xE082A: "Control",
-    0xE082B: "Control",
-    0xE082C: "Control",
-    0xE082D: "Control",
-    0xE082E: "Control",
-    0xE082F: "Control",
-    0xE0830: "Control",
-    0xE0831: "Control",
-    0xE0832: "Control",
-    0xE0833: "Control",
-    0xE0834: "Control",
-    0xE0835: "Control",
-    0xE0836: "Control",
-    0xE0837: "Control",
-    0xE0838: "Control",
-    0xE0839: "Control",
-    0xE083A: "Control",
-    0xE083B: "Control",
-    0xE083C: "Control",
-    0xE083D: "Control",
-    0xE083E: "Control",
-    0xE083F: "Control",
-    0xE0840: "Control",
-    0xE0841: "Control",
-    0xE0842: "Control",
-    0xE0843: "Control",
-    0xE0844: "Control",
-    0xE0845: "Control",
-    0xE0846: "Control",
-    0xE0847: "Control",
-    0xE0848: "Control",
-    0xE0849: "Control",
-    0xE084A: "Control",
-    0xE084B: "Control",
-    0xE084C: "Control",
-    0xE084D: "Control",
-    0xE084E: "Control",
-    0xE084F: "Control",
-    0xE0850: "Control",
-    0xE0851: "Control",
-    0xE0852: "Control",
-    0xE0853: "Control",
-    0xE0854: "Control",
-    0xE0855: "Control",
-    0xE0856: "Control",
-    0xE0857: "Control",
-    0xE0858: "Control",
-    0xE0859: "Control",
-    0xE085A: "Control",
-    0xE085B: "Control",
-    0xE085C: "Control",
-    0xE085D: "Control",
-    0xE085E: "Control",
-    0xE085F: "Control",
-    0xE0860: "Control",
-    0xE0861: "Control",
-    0xE0862: "Control",
-    0xE0863: "Control",
-    0xE0864: "Control",
-    0xE0865: "Control",
-    0xE0866: "Control",
-    0xE0867: "Control",
-    0xE0868: "Control",
-    0xE0869: "Control",
-    0xE086A: "Control",
-    0xE086B: "Control",
-    0xE086C: "Control",
-    0xE086D: "Control",
-    0xE086E: "Control",
-    0xE086F: "Control",
-    0xE0870: "Control",
-    0xE0871: "Control",
-    0xE0872: "Control",
-    0xE0873: "Control",
-    0xE0874: "Control",
-    0xE0875: "Control",
-    0xE0876: "Control",
-    0xE0877: "Control",
-    0xE0878: "Control",
-    0xE0879: "Control",
-    0xE087A: "Control",
-    0xE087B: "Control",
-    0xE087C: "Control",
-    0xE087D: "Control",
-    0xE087E: "Control",
-    0xE087F: "Control",
-    0xE0880: "Control",
-    0xE0881: "Control",
-    0xE0882: "Control",
-    0xE0883: "Control",
-    0xE0884: "Control",
-    0xE0885: "Control",
-    0xE0886: "Control",
-    0xE0887: "Control",
-    0xE0888: "Control",
-    0xE0889: "Control",
-    0xE088A: "Control",
-    0xE088B: "Control",
-    0xE088C: "Control",
-    0xE088D: "Control",
-    0xE088E: "Control",
-    0xE088F: "Control",
-    0xE0890: "Control",
-    0xE0891: "Control",
-    0xE0892: "Control",
-    0xE0893: "Control",
-    0xE0894: "Control",
-    0xE0895: "Control",
-    0xE0896: "Control",
-    0xE0897: "Control",
-    0xE0898: "Control",
-    0xE0899: "Control",
-    0xE089A: "Control",
-    0xE089B: "Control",
-    0xE089C: "Control",
-    0xE089D: "Control",
-    0xE089E: "Control",
-    0xE089F: "Control",
-    0xE08A0: "Control",
-    0xE08A1: "Control",
-    0xE08A2: "Control",
-    0xE08A3: "Control",
-    0xE08A4: "Control",
-    0xE08A5: "Control",
-    0xE08A6: "Control",
-    0xE08A7: "Control",
-    0xE08A8: "Control",
-    0xE08A9: "Control",
-    0xE08AA: "Control",
-    0xE08AB: "Control",
-    0xE08AC: "Control",
-    0xE08AD: "Control",
-    0xE08AE: "Control",
-    0xE08AF: "Control",
-    0xE08B0: "Control",
-    0xE08B1: "Control",
-    0xE08B2: "Control",
-    0xE08B3: "Control",
-    0xE08B4: "Control",
-    0xE08B5: "Control",
-    0xE08B6: "Control",
-    0xE08B7: "Control",
-    0xE08B8: "Control",
-    0xE08B9: "Control",
-    0xE08BA: "Control",
-    0xE08BB: "Control",
-    0xE08BC: "Control",
-    0xE08BD: "Control",
-    0xE08BE: "Control",
-    0xE08BF: "Control",
-    0xE08C0: "Control",
-    0xE08C1: "Control",
-    0xE08C2: "Control",
-    0xE08C3: "Control",
-    0xE08C4: "Control",
-    0xE08C5: "Control",
-    0xE08C6: "Control",
-    0xE08C7: "Control",
-    0xE08C8: "Control",
-    0xE08C9: "Control",
-    0xE08CA: "Control",
-    0xE08CB: "Control",
-    0xE08CC: "Control",
-    0xE08CD: "Control",
-    0xE08CE: "Control",
-    0xE08CF: "Control",
-    0xE08D0: "Control",
-    0xE08D1: "Control",
-    0xE08D2: "Control",
-    0xE08D3: "Control",
-    0xE08D4: "Control",
-    0xE08D5: "Control",
-    0xE08D6: "Control",
-    0xE08D7: "Control",
-    0xE08D8: "Control",
-    0xE08D9: "Control",
-    0xE08DA: "Control",
-    0xE08DB: "Control",
-    0xE08DC: "Control",
-    0xE08DD: "Control",
-    0xE08DE: "Control",
-    0xE08DF: "Control",
-    0xE08E0: "Control",
-    0xE08E1: "Control",
-    0xE08E2: "Control",
-    0xE08E3: "Control",
-    0xE08E4: "Control",
-    0xE08E5: "Control",
-    0xE08E6: "Control",
-    0xE08E7: "Control",
-    0xE08E8: "Control",
-    0xE08E9: "Control",
-    0xE08EA: "Control",
-    0xE08EB: "Control",
-    0xE08EC: "Control",
-    0xE08ED: "Control",
-    0xE08EE: "Control",
-    0xE08EF: "Control",
-    0xE08F0: "Control",
-    0xE08F1: "Control",
-    0xE08F2: "Control",
-    0xE08F3: "Control",
-    0xE08F4: "Control",
-    0xE08F5: "Control",
-    0xE08F6: "Control",
-    0xE08F7: "Control",
-    0xE08F8: "Control",
-    0xE08F9: "Control",
-    0xE08FA: "Control",
-    0xE08FB: "Control",
-    0xE08FC: "Control",
-    0xE08FD: "Control",
-    0xE08FE: "Control",
-    0xE08FF: "Control",
-    0xE0900: "Control",
-    0xE0901: "Control",
-    0xE0902: "Control",
-    0xE0903: "Control",
-    0xE0904: "Control",
-    0xE0905: "Control",
-    0xE0906: "Control",
-    0xE0907: "Control",
-    0xE0908: "Control",
-    0xE0909: "Control",
-    0xE090A: "Control",
-    0xE090B: "Control",
-    0xE090C: "Control",
-    0xE090D: "Control",
-    0xE090E: "Control",
-    0xE090F: "Control",
-    0xE0910: "Control",
-    0xE0911: "Control",
-    0xE0912: "Control",
-    0xE0913: "Control",
-    0xE0914: "Control",
-    0xE0915: "Control",
-    0xE0916: "Control",
-    0xE0917: "Control",
-    0xE0918: "Control",
-    0xE0919: "Control",
-    0xE091A: "Control",
-    0xE091B: "Control",
-    0xE091C: "Control",
-    0xE091D: "Control",
-    0xE091E: "Control",
-    0xE091F: "Control",
-    0xE0920: "Control",
-    0xE0921: "Control",
-    0xE0922: "Control",
-    0xE0923: "Control",
-    0xE0924: "Control",
-    0xE0925: "Control",
-    0xE0926: "Control",
-    0xE0927: "Control",
-    0xE0928: "Control",
-    0xE0929: "Control",
-    0xE092A: "Control",
-    0xE092B: "Control",
-    0xE092C: "Control",
-    0xE092D: "Control",
-    0xE092E: "Control",
-    0xE092F: "Control",
-    0xE0930: "Control",
-    0xE0931: "Control",
-    0xE0932: "Control",
-    0xE0933: "Control",
-    0xE0934: "Control",
-    0xE0935: "Control",
-    0xE0936: "Control",
-    0xE0937: "Control",
-    0xE0938: "Control",
-    0xE0939: "Control",
-    0xE093A: "Control",
-    0xE093B: "Control",
-    0xE093C: "Control",
-    0xE093D: "Control",
-    0xE093E: "Control",
-    0xE093F: "Control",
-    0xE0940: "Control",
-    0xE0941: "Control",
-    0xE0942: "Control",
-    0xE0943: "Control",
-    0xE0944: "Control",
-    0xE0945: "Control",
-    0xE0946: "Control",
-    0xE0947: "Control",
-    0xE0948: "Control",
-    0xE0949: "Control",
-    0xE094A: "Control",
-    0xE094B: "Control",
-    0xE094C: "Control",
-    0xE094D: "Control",
-    0xE094E: "Control",
-    0xE094F: "Control",
-    0xE0950: "Control",
-    0xE0951: "Control",
-    0xE0952: "Control",
-    0xE0953: "Control",
-    0xE0954: "Control",
-    0xE0955: "Control",
-    0xE0956: "Control",
-    0xE0957: "Control",
-    0xE0958: "Control",
-    0xE0959: "Control",
-    0xE095A: "Control",
-    0xE095B: "Control",
-    0xE095C: "Control",
-    0xE095D: "Control",
-    0xE095E: "Control",
-    0xE095F: "Control",
-    0xE0960: "Control",
-    0xE0961: "Control",
-    0xE0962: "Control",
-    0xE0963: "Control",
-    0xE0964: "Control",
-    0xE0965: "Control",
-    0xE0966: "Control",
-    0xE0967: "Control",
-    0xE0968: "Control",
-    0xE0969: "Control",
-    0xE096A: "Control",
-    0xE096B: "Control",
-    0xE096C: "Control",
-    0xE096D: "Control",
-    0xE096E: "Control",
-    0xE096F: "Control",
-    0xE0970: "Control",
-    0xE0971: "Control",
-    0xE0972: "Control",
-    0xE0973: "Control",
-    0xE0974: "Control",
-    0xE0975: "Control",
-    0xE0976: "Control",
-    0xE0977: "Control",
-    0xE0978: "Control",
-    0xE0979: "Control",
-    0xE097A: "Control",
-    0xE097B: "Control",
-    0xE097C: "Control",
-    0xE097D: "Control",
-    0xE097E: "Control",
-    0xE097F: "Control",
-    0xE0980: "Control",
-    0xE0981: "Control",
-    0xE0982: "Control",
-    0xE0983: "Control",
-    0xE0984: "Control",
-    0xE0985: "Control",
-    0xE0986: "Control",
-    0xE0987: "Control",
-    0xE0988: "Control",
-    0xE0989: "Control",
-    0xE098A: "Control",
-    0xE098B: "Control",
-    0xE098C: "Control",
-    0xE098D: "Control",
-    0xE098E: "Control",
-    0xE098F: "Control",
-    0xE0990: "Control",
-    0xE0991: "Control",
-    0xE0992: "Control",
-    0xE0993: "Control",
-    0xE0994: "Control",
-    0xE0995: "Control",
-    0xE0996: "Control",
-    0xE0997: "Control",
-    0xE0998: "Control",
-    0xE0999: "Control",
-    0xE099A: "Control",
-    0xE099B: "Control",
-    0xE099C: "Control",
-    0xE099D: "Control",
-    0xE099E: "Control",
-    0xE099F: "Control",
-    0xE09A0: "Control",
-    0xE09A1: "Control",
-    0xE09A2: "Control",
-    0xE09A3: "Control",
-    0xE09A4: "Control",
-    0xE09A5: "Control",
-    0xE09A6: "Control",
-    0xE09A7: "Control",
-    0xE09A8: "Control",
-    0xE09A9: "Control",
-    0xE09AA: "Control",
-    0xE09AB: "Control",
-    0xE09AC: "Control",
-    0xE09AD: "Control",
-    0xE09AE: "Control",
-    0xE09AF: "Control",
-    0xE09B0: "Control",
-    0xE09B1: "Control",
-    0xE09B2: "Control",
-    0xE09B3: "Control",
-    0xE09B4: "Control",
-    0xE09B5: "Control",
-    0xE09B6: "Control",
-    0xE09B7: "Control",
-    0xE09B8: "Control",
-    0xE09B9: "Control",
-    0xE09BA: "Control",
-    0xE09BB: "Control",
-    0xE09BC: "Control",
-    0xE09BD: "Control",
-    0xE09BE: "Control",
-    0xE09BF: "Control",
-    0xE09C0: "Control",
-    0xE09C1: "Control",
-    0xE09C2: "Control",
-    0xE09C3: "Control",
-    0xE09C4: "Control",
-    0xE09C5: "Control",
-    0xE09C6: "Control",
-    0xE09C7: "Control",
-    0xE09C8: "Control",
-    0xE09C9: "Control",
-    0xE09CA: "Control",
-    0xE09CB: "Control",
-    0xE09CC: "Control",
-    0xE09CD: "Control",
-    0xE09CE: "Control",
-    0xE09CF: "Control",
-    0xE09D0: "Control",
-    0xE09D1: "Control",
-    0xE09D2: "Control",
-    0xE09D3: "Control",
-    0xE09D4: "Control",
-    0xE09D5: "Control",
-    0xE09D6: "Control",
-    0xE09D7: "Control",
-    0xE09D8: "Control",
-    0xE09D9: "Control",
-    0xE09DA: "Control",
-    0xE09DB: "Control",
-    0xE09DC: "Control",
-    0xE09DD: "Control",
-    0xE09DE: "Control",
-    0xE09DF: "Control",
-    0xE09E0: "Control",
-    0xE09E1: "Control",
-    0xE09E2: "Control",
-    0xE09E3: "Control",
-    0xE09E4: "Control",
-    0xE09E5: "Control",
-    0xE09E6: "Control",
-    0xE09E7: "Control",
-    0xE09E8: "Control",
-    0xE09E9: "Control",
-    0xE09EA: "Control",
-    0xE09EB: "Control",
-    0xE09EC: "Control",
-    0xE09ED: "Control",
-    0xE09EE: "Control",
-    0xE09EF: "Control",
-    0xE09F0: "Control",
-    0xE09F1: "Control",
-    0xE09F2: "Control",
-    0xE09F3: "Control",
-    0xE09F4: "Control",
-    0xE09F5: "Control",
-    0xE09F6: "Control",
-    0xE09F7: "Control",
-    0xE09F8: "Control",
-    0xE09F9: "Control",
-    0xE09FA: "Control",
-    0xE09FB: "Control",
-    0xE09FC: "Control",
-    0xE09FD: "Control",
-    0xE09FE: "Control",
-    0xE09FF: "Control",
-    0xE0A00: "Control",
-    0xE0A01: "Control",
-    0xE0A02: "Control",
-    0xE0A03: "Control",
-    0xE0A04: "Control",
-    0xE0A05: "Control",
-    0xE0A06: "Control",
-    0xE0A07: "Control",
-    0xE0A08: "Control",
-    0xE0A09: "Control",
-    0xE0A0A: "Control",
-    0xE0A0B: "Control",
-    0xE0A0C: "Control",
-    0xE0A0D: "Control",
-    0xE0A0E: "Control",
-    0xE0A0F: "Control",
-    0xE0A10: "Control",
-    0xE0A11: "Control",
-    0xE0A12: "Control",
-    0xE0A13: "Control",
-    0xE0A14: "Control",
-    0xE0A15: "Control",
-    0xE0A16: "Control",
-    0xE0A17: "Control",
-    0xE0A18: "Control",
-    0xE0A19: "Control",
-    0xE0A1A: "Control",
-    0xE0A1B: "Control",
-    0xE0A1C: "Control",
-    0xE0A1D: "Control",
-    0xE0A1E: "Control",
-    0xE0A1F: "Control",
-    0xE0A20: "Control",
-    0xE0A21: "Control",
-    0xE0A22: "Control",
-    0xE0A23: "Control",
-    0xE0A24: "Control",
-    0xE0A25: "Control",
-    0xE0A26: "Control",
-    0xE0A27: "Control",
-    0xE0A28: "Control",
-    0xE0A29: "Control",
-    0xE0A2A: "Control",
-    0xE0A2B: "Control",
-    0xE0A2C: "Control",
-    0xE0A2D: "Control",
-    0xE0A2E: "Control",
-    0xE0A2F: "Control",
-    0xE0A30: "Control",
-    0xE0A31: "Control",
-    0xE0A32: "Control",
-    0xE0A33: "Control",
-    0xE0A34: "Control",
-    0xE0A35: "Control",
-    0xE0A36: "Control",
-    0xE0A37: "Control",
-    0xE0A38: "Control",
-    0xE0A39: "Control",
-    0xE0A3A: "Control",
-    0xE0A3B: "Control",
-    0xE0A3C: "Control",
-    0xE0A3D: "Control",
-    0xE0A3E: "Control",
-    0xE0A3F: "Control",
-    0xE0A40: "Control",
-    0xE0A41: "Control",
-    0xE0A42: "Control",
-    0xE0A43: "Control",
-    0xE0A44: "Control",
-    0xE0A45: "Control",
-    0xE0A46: "Control",
-    0xE0A47: "Control",
-    0xE0A48: "Control",
-    0xE0A49: "Control",
-    0xE0A4A: "Control",
-    0xE0A4B: "Control",
-    0xE0A4C: "Control",
-    0xE0A4D: "Control",
-    0xE0A4E: "Control",
-    0xE0A4F: "Control",
-    0xE0A50: "Control",
-    0xE0A51: "Control",
-    0xE0A52: "Control",
-    0xE0A53: "Control",
-    0xE0A54: "Control",
-    0xE0A55: "Control",
-    0xE0A56: "Control",
-    0xE0A57: "Control",
-    0xE0A58: "Control",
-    0xE0A59: "Control",
-    0xE0A5A: "Control",
-    0xE0A5B: "Control",
-    0xE0A5C: "Control",
-    0xE0A5D: "Control",
-    0xE0A5E: "Control",
-    0xE0A5F: "Control",
-    0xE0A60: "Control",
-    0xE0A61: "Control",
-    0xE0A62: "Control",
-    0xE0A63: "Control",
-    0xE0A64: "Control",
-    0xE0A65: "Control",
-    0xE0A66: "Control",
-    0xE0A67: "Control",
-    0xE0A68: "Control",
-    0xE0A69: "Control",
-    0xE0A6A: "Control",
-    0xE0A6B: "Control",
-    0xE0A6C: "Control",
-    0xE0A6D: "Control",
-    0xE0A6E: "Control",
-    0xE0A6F: "Control",
-    0xE0A70: "Control",
-    0xE0A71: "Control",
-    0xE0A72: "Control",
-    0xE0A73: "Control",
-    0xE0A74: "Control",
-    0xE0A75: "Control",
-    0xE0A76: "Control",
-    0xE0A77: "Control",
-    0xE0A78: "Control",
-    0xE0A79: "Control",
-    0xE0A7A: "Control",
-    0xE0A7B: "Control",
-    0xE0A7C: "Control",
-    0xE0A7D: "Control",
-    0xE0A7E: "Control",
-    0xE0A7F: "Control",
-    0xE0A80: "Control",
-    0xE0A81: "Control",
-    0xE0A82: "Control",
-    0xE0A83: "Control",
-    0xE0A84: "Control",
-    0xE0A85: "Control",
-    0xE0A86: "Control",
-    0xE0A87: "Control",
-    0xE0A88: "Control",
-    0xE0A89: "Control",
-    0xE0A8A: "Control",
-    0xE0A8B: "Control",
-    0xE0A8C: "Control",
-    0xE0A8D: "Control",
-    0xE0A8E: "Control",
-    0xE0A8F: "Control",
-    0xE0A90: "Control",
-    0xE0A91: "Control",
-    0xE0A92: "Control",
-    0xE0A93: "Control",
-    0xE0A94: "Control",
-    0xE0A95: "Control",
-    0xE0A96: "Control",
-    0xE0A97: "Control",
-    0xE0A98: "Control",
-    0xE0A99: "Control",
-    0xE0A9A: "Control",
-    0xE0A9B: "Control",
-    0xE0A9C: "Control",
-    0xE0A9D: "Control",
-    0xE0A9E: "Control",
-    0xE0A9F: "Control",
-    0xE0AA0: "Control",
-    0xE0AA1: "Control",
-    0xE0AA2: "Control",
-    0xE0AA3: "Control",
-    0xE0AA4: "Control",
-    0xE0AA5: "Control",
-    0xE0AA6: "Control",
-    0xE0AA7: "Control",
-    0xE0AA8: "Control",
-    0xE0AA9: "Control",
-    0xE0AAA: "Control",
-    0xE0AAB: "Control",
-    0xE0AAC: "Control",
-    0xE0AAD: "Control",
-    0xE0AAE: "Control",
-    0xE0AAF: "Control",
-    0xE0AB0: "Control",
-    0xE0AB1: "Control",
-    0xE0AB2: "Control",
-    0xE0AB3: "Control",
-    0xE0AB4: "Control",
-    0xE0AB5: "Control",
-    0xE0AB6: "Control",
-    0xE0AB7: "Control",
-    0xE0AB8: "Control",
-    0xE0AB9: "Control",
-    0xE0ABA: "Control",
-    0xE0ABB: "Control",
-    0xE0ABC: "Control",
-    0xE0ABD: "Control",
-    0xE0ABE: "Control",
-    0xE0ABF: "Control",
-    0xE0AC0: "Control",
-    0xE0AC1: "Control",
-    0xE0AC2: "Control",
-    0xE0AC3: "Control",
-    0xE0AC4: "Control",
-    0xE0AC5: "Control",
-    0xE0AC6: "Control",
-    0xE0AC7: "Control",
-    0xE0AC8: "Control",
-    0xE0AC9: "Control",
-    0xE0ACA: "Control",
-    0xE0ACB: "Control",
-    0xE0ACC: "Control",
-    0xE0ACD: "Control",
-    0xE0ACE: "Control",
-    0xE0ACF: "Control",
-    0xE0AD0: "Control",
-    0xE0AD1: "Control",
-    0xE0AD2: "Control",
-    0xE0AD3: "Control",
-    0xE0AD4: "Control",
-    0xE0AD5: "Control",
-    0xE0AD6: "Control",
-    0xE0AD7: "Control",
-    0xE0AD8: "Control",
-    0xE0AD9: "Control",
-    0xE0ADA: "Control",
-    0xE0ADB: "Control",
-    0xE0ADC: "Control",
-    0xE0ADD: "Control",
-    0xE0ADE: "Control",
-    0xE0ADF: "Control",
-    0xE0AE0: "Control",
-    0xE0AE1: "Control",
-    0xE0AE2: "Control",
-    0xE0AE3: "Control",
-    0xE0AE4: "Control",
-    0xE0AE5: "Control",
-    0xE0AE6: "Control",
-    0xE0AE7: "Control",
-    0xE0AE8: "Control",
-    0xE0AE9: "Control",
-    0xE0AEA: "Control",
-    0xE0AEB: "Control",
-    0xE0AEC: "Control",
-    0xE0AED: "Control",
-    0xE0AEE: "Control",
-    0xE0AEF: "Control",
-    0xE0AF0: "Control",
-    0xE0AF1: "Control",
-    0xE0AF2: "Control",
-    0xE0AF3: "Control",
-    0xE0AF4: "Control",
-    0xE0AF5: "Control",
-    0xE0AF6: "Control",
-    0xE0AF7: "Control",
-    0xE0AF8: "Control",
-    0xE0AF9: "Control",
-    0xE0AFA: "Control",
-    0xE0AFB: "Control",
-    0xE0AFC: "Control",
-    0xE0AFD: "Control",
-    0xE0AFE: "Control",
-    0xE0AFF: "Control",
-    0xE0B00: "Control",
-    0xE0B01: "Control",
-    0xE0B02: "Control",
-    0xE0B03: "Control",
-    0xE0B04: "Control",
-    0xE0B05: "Control",
-    0xE0B06: "Control",
-    0xE0B07: "Control",
-    0xE0B08: "Control",
-    0xE0B09: "Control",
-    0xE0B0A: "Control",
-    0xE0B0B: "Control",
-    0xE0B0C: "Control",
-    0xE0B0D: "Control",
-    0xE0B0E: "Control",
-    0xE0B0F: "Control",
-    0xE0B10: "Control",
-    0xE0B11: "Control",
-    0xE0B12: "Control",
-    0xE0B13: "Control",
-    0xE0B14: "Control",
-    0xE0B15: "Control",
-    0xE0B16: "Control",
-    0xE0B17: "Control",
-    0xE0B18: "Control",
-    0xE0B19: "Control",
-    0xE0B1A: "Control",
-    0xE0B1B: "Control",
-    0xE0B1C: "Control",
-    0xE0B1D: "Control",
-    0xE0B1E: "Control",
-    0xE0B1F: "Control",
-    0xE0B20: "Control",
-    0xE0B21: "Control",
-    0xE0B22: "Control",
-    0xE0B23: "Control",
-    0xE0B24: "Control",
-    0xE0B25: "Control",
-    0xE0B26: "Control",
-    0xE0B27: "Control",
-    0xE0B28: "Control",
-    0xE0B29: "Control",
-    0xE0B2A: "Control",
-    0xE0B2B: "Control",
-    0xE0B2C: "Control",
-    0xE0B2D: "Control",
-    0xE0B2E: "Control",
-    0xE0B2F: "Control",
-    0xE0B30: "Control",
-    0xE0B31: "Control",
-    0xE0B32: "Control",
-    0xE0B33: "Control",
-    0xE0B34: "Control",
-    0xE0B35: "Control",
-    0xE0B36: "Control",
-    0xE0B37: "Control",
-    0xE0B38: "Control",
-    0xE0B39: "Control",
-    0xE0B3A: "Control",
-    0xE0B3B: "Control",
-    0xE0B3C: "Control",
-    0xE0B3D: "Control",
-    0xE0B3E: "Control",
-    0xE0B3F: "Control",
-    0xE0B40: "Control",
-    0xE0B41: "Control",
-    0xE0B42: "Control",
-    0xE0B43: "Control",
-    0xE0B44: "Control",
-    0xE0B45: "Control",
-    0xE0B46: "Control",
-    0xE0B47: "Control",
-    0xE0B48: "Control",
-    0xE0B49: "Control",
-    0xE0B4A: "Control",
-    0xE0B4B: "Control",
-    0xE0B4C: "Control",
-    0xE0B4D: "Control",
-    0xE0B4E: "Control",
-    0xE0B4F: "Control",
-    0xE0B50: "Control",
-    0xE0B51: "Control",
-    0xE0B52: "Control",
-    0xE0B53: "Control",
-    0xE0B54: "Control",
-    0xE0B55: "Control",
-    0xE0B56: "Control",
-    0xE0B57: "Control",
-    0xE0B58: "Control",
-    0xE0B59: "Control",
-    0xE0B5A: "Control",
-    0xE0B5B: "Control",
-    0xE0B5C: "Control",
-    0xE0B5D: "Control",
-    0xE0B5E: "Control",
-    0xE0B5F: "Control",
-    0xE0B60: "Control",
-    0xE0B61: "Control",
-    0xE0B62: "Control",
-    0xE0B63: "Control",
-    0xE0B64: "Control",
-    0xE0B65: "Control",
-    0xE0B66: "Control",
-    0xE0B67: "Control",
-    0xE0B68: "Control",
-    0xE0B69: "Control",
-    0xE0B6A: "Control",
-    0xE0B6B: "Control",
-    0xE0B6C: "Control",
-    0xE0B6D: "Control",
-    0xE0B6E: "Control",
-    0xE0B6F: "Control",
-    0xE0B70: "Control",
-    0xE0B71: "Control",
-    0xE0B72: "Control",
-    0xE0B73: "Control",
-    0xE0B74: "Control",
-    0xE0B75: "Control",
-    0xE0B76: "Control",
-    0xE0B77: "Control",
-    0xE0B78: "Control",
-    0xE0B79: "Control",
-    0xE0B7A: "Control",
-    0xE0B7B: "Control",
-    0xE0B7C: "Control",
-    0xE0B7D: "Control",
-    0xE0B7E: "Control",
-    0xE0B7F: "Control",
-    0xE0B80: "Control",
-    0xE0B81: "Control",
-    0xE0B82: "Control",
-    0xE0B83: "Control",
-    0xE0B84: "Control",
-    0xE0B85: "Control",
-    0xE0B86: "Control",
-    0xE0B87: "Control",
-    0xE0B88: "Control",
-    0xE0B89: "Control",
-    0xE0B8A: "Control",
-    0xE0B8B: "Control",
-    0xE0B8C: "Control",
-    0xE0B8D: "Control",
-    0xE0B8E: "Control",
-    0xE0B8F: "Control",
-    0xE0B90: "Control",
-    0xE0B91: "Control",
-    0xE0B92: "Control",
-    0xE0B93: "Control",
-    0xE0B94: "Control",
-    0xE0B95: "Control",
-    0xE0B96: "Control",
-    0xE0B97: "Control",
-    0xE0B98: "Control",
-    0xE0B99: "Control",
-    0xE0B9A: "Control",
-    0xE0B9B: "Control",
-    0xE0B9C: "Control",
-    0xE0B9D: "Control",
-    0xE0B9E: "Control",
-    0xE0B9F: "Control",
-    0xE0BA0: "Control",
-    0xE0BA1: "Control",
-    0xE0BA2: "Control",
-    0xE0BA3: "Control",
-    0xE0BA4: "Control",
-    0xE0BA5: "Control",
-    0xE0BA6: "Control",
-    0xE0BA7: "Control",
-    0xE0BA8: "Control",
-    0xE0BA9: "Control",
-    0xE0BAA: "Control",
-    0xE0BAB: "Control",
-    0xE0BAC: "Control",
-    0xE0BAD: "Control",
-    0xE0BAE: "Control",
-    0xE0BAF: "Control",
-    0xE0BB0: "Control",
-    0xE0BB1: "Control",
-    0xE0BB2: "Control",
-    0xE0BB3: "Control",
-    0xE0BB4: "Control",
-    0xE0BB5: "Control",
-    0xE0BB6: "Control",
-    0xE0BB7: "Control",
-    0xE0BB8: "Control",
-    0xE0BB9: "Control",
-    0xE0BBA: "Control",
-    0xE0BBB: "Control",
-    0xE0BBC: "Control",
-    0xE0BBD: "Control",
-    0xE0BBE: "Control",
-    0xE0BBF: "Control",
-    0xE0BC0: "Control",
-    0xE0BC1: "Control",
-    0xE0BC2: "Control",
-    0xE0BC3: "Control",
-    0xE0BC4: "Control",
-    0xE0BC5: "Control",
-    0xE0BC6: "Control",
-    0xE0BC7: "Control",
-    0xE0BC8: "Control",
-    0xE0BC9: "Control",
-    0xE0BCA: "Control",
-    0xE0BCB: "Control",
-    0xE0BCC: "Control",
-    0xE0BCD: "Control",
-    0xE0BCE: "Control",
-    0xE0BCF: "Control",
-    0xE0BD0: "Control",
-    0xE0BD1: "Control",
-    0xE0BD2: "Control",
-    0xE0BD3: "Control",
-    0xE0BD4: "Control",
-    0xE0BD5: "Control",
-    0xE0BD6: "Control",
-    0xE0BD7: "Control",
-    0xE0BD8: "Control",
-    0xE0BD9: "Control",
-    0xE0BDA: "Control",
-    0xE0BDB: "Control",
-    0xE0BDC: "Control",
-    0xE0BDD: "Control",
-    0xE0BDE: "Control",
-    0xE0BDF: "Control",
-    0xE0BE0: "Control",
-    0xE0BE1: "Control",
-    0xE0BE2: "Control",
-    0xE0BE3: "Control",
-    0xE0BE4: "Control",
-    0xE0BE5: "Control",
-    0xE0BE6: "Control",
-    0xE0BE7: "Control",
-    0xE0BE8: "Control",
-    0xE0BE9: "Control",
-    0xE0BEA: "Control",
-    0xE0BEB: "Control",
-    0xE0BEC: "Control",
-    0xE0BED: "Control",
-    0xE0BEE: "Control",
-    0xE0BEF: "Control",
-    0xE0BF0: "Control",
-    0xE0BF1: "Control",
-    0xE0BF2: "Control",
-    0xE0BF3: "Control",
-    0xE0BF4: "Control",
-    0xE0BF5: "Control",
-    0xE0BF6: "Control",
-    0xE0BF7: "Control",
-    0xE0BF8: "Control",
-    0xE0BF9: "Control",
-    0xE0BFA: "Control",
-    0xE0BFB: "Control",
-    0xE0BFC: "Control",
-    0xE0BFD: "Control",
-    0xE0BFE: "Control",
-    0xE0BFF: "Control",
-    0xE0C00: "Control",
-    0xE0C01: "Control",
-    0xE0C02: "Control",
-    0xE0C03: "Control",
-    0xE0C04: "Control",
-    0xE0C05: "Control",
-    0xE0C06: "Control",
-    0xE0C07: "Control",
-    0xE0C08: "Control",
-    0xE0C09: "Control",
-    0xE0C0A: "Control",
-    0xE0C0B: "Control",
-    0xE0C0C: "Control",
-    0xE0C0D: "Control",
-    0xE0C0E: "Control",
-    0xE0C0F: "Control",
-    0xE0C10: "Control",
-    0xE0C11: "Control",
-    0xE0C12: "Control",
-    0xE0C13: "Control",
-    0xE0C14: "Control",
-    0xE0C15: "Control",
-    0xE0C16: "Control",
-    0xE0C17: "Control",
-    0xE0C18: "Control",
-    0xE0C19: "Control",
-    0xE0C1A: "Control",
-    0xE0C1B: "Control",
-    0xE0C1C: "Control",
-    0xE0C1D: "Control",
-    0xE0C1E: "Control",
-    0xE0C1F: "Control",
-    0xE0C20: "Control",
-    0xE0C21: "Control",
-    0xE0C22: "Control",
-    0xE0C23: "Control",
-    0xE0C24: "Control",
-    0xE0C25: "Control",
-    0xE0C26: "Control",
-    0xE0C27: "Control",
-    0xE0C28: "Control",
-    0xE0C29: "Control",
-    0xE0C2A: "Control",
-    0xE0C2B: "Control",
-    0xE0C2C: "Control",
-    0xE0C2D: "Control",
-    0xE0C2E: "Control",
-    0xE0C2F: "Control",
-    0xE0C30: "Control",
-    0xE0C31: "Control",
-    0xE0C32: "Control",
-    0xE0C33: "Control",
-    0xE0C34: "Control",
-    0xE0C35: "Control",
-    0xE0C36: "Control",
-    0xE0C37: "Control",
-    0xE0C38: "Control",
-    0xE0C39: "Control",
-    0xE0C3A: "Control",
-    0xE0C3B: "Control",
-    0xE0C3C: "Control",
-    0xE0C3D: "Control",
-    0xE0C3E: "Control",
-    0xE0C3F: "Control",
-    0xE0C40: "Control",
-    0xE0C41: "Control",
-    0xE0C42: "Control",
-    0xE0C43: "Control",
-    0xE0C44: "Control",
-    0xE0C45: "Control",
-    0xE0C46: "Control",
-    0xE0C47: "Control",
-    0xE0C48: "Control",
-    0xE0C49: "Control",
-    0xE0C4A: "Control",
-    0xE0C4B: "Control",
-    0xE0C4C: "Control",
-    0xE0C4D: "Control",
-    0xE0C4E: "Control",
-    0xE0C4F: "Control",
-    0xE0C50: "Control",
-    0xE0C51: "Control",
-    0xE0C52: "Control",
-    0xE0C53: "Control",
-    0xE0C54: "Control",
-    0xE0C55: "Control",
-    0xE0C56: "Control",
-    0xE0C57: "Control",
-    0xE0C58: "Control",
-    0xE0C59: "Control",
-    0xE0C5A: "Control",
-    0xE0C5B: "Control",
-    0xE0C5C: "Control",
-    0xE0C5D: "Control",
-    0xE0C5E: "Control",
-    0xE0C5F: "Control",
-    0xE0C60: "Control",
-    0xE0C61: "Control",
-    0xE0C62: "Control",
-    0xE0C63: "Control",
-    0xE0C64: "Control",
-    0xE0C65: "Control",
-    0xE0C66: "Control",
-    0xE0C67: "Control",
-    0xE0C68: "Control",
-    0xE0C69: "Control",
-    0xE0C6A: "Control",
-    0xE0C6B: "Control",
-    0xE0C6C: "Control",
-    0xE0C6D: "Control",
-    0xE0C6E: "Control",
-    0xE0C6F: "Control",
-    0xE0C70: "Control",
-    0xE0C71: "Control",
-    0xE0C72: "Control",
-    0xE0C73: "Control",
-    0xE0C74: "Control",
-    0xE0C75: "Control",
-    0xE0C76: "Control",
-    0xE0C77: "Control",
-    0xE0C78: "Control",
-    0xE0C79: "Control",
-    0xE0C7A: "Control",
-    0xE0C7B: "Control",
-    0xE0C7C: "Control",
-    0xE0C7D: "Control",
-    0xE0C7E: "Control",
-    0xE0C7F: "Control",
-    0xE0C80: "Control",
-    0xE0C81: "Control",
-    0xE0C82: "Control",
-    0xE0C83: "Control",
-    0xE0C84: "Control",
-    0xE0C85: "Control",
-    0xE0C86: "Control",
-    0xE0C87: "Control",
-    0xE0C88: "Control",
-    0xE0C89: "Control",
-    0xE0C8A: "Control",
-    0xE0C8B: "Control",
-    0xE0C8C: "Control",
-    0xE0C8D: "Control",
-    0xE0C8E: "Control",
-    0xE0C8F: "Control",
-    0xE0C90: "Control",
-    0xE0C91: "Control",
-    0xE0C92: "Control",
-    0xE0C93: "Control",
-    0xE0C94: "Control",
-    0xE0C95: "Control",
-    0xE0C96: "Control",
-    0xE0C97: "Control",
-    0xE0C98: "Control",
-    0xE0C99: "Control",
-    0xE0C9A: "Control",
-    0xE0C9B: "Control",
-    0xE0C9C: "Control",
-    0xE0C9D: "Control",
-    0xE0C9E: "Control",
-    0xE0C9F: "Control",
-    0xE0CA0: "Control",
-    0xE0CA1: "Control",
-    0xE0CA2: "Control",
-    0xE0CA3: "Control",
-    0xE0CA4: "Control",
-    0xE0CA5: "Control",
-    0xE0CA6: "Control",
-    0xE0CA7: "Control",
-    0xE0CA8: "Control",
-    0xE0CA9: "Control",
-    0xE0CAA: "Control",
-    0xE0CAB: "Control",
-    0xE0CAC: "Control",
-    0xE0CAD: "Control",
-    0xE0CAE: "Control",
-    0xE0CAF: "Control",
-    0xE0CB0: "Control",
-    0xE0CB1: "Control",
-    0xE0CB2: "Control",
-    0xE0CB3: "Control",
-    0xE0CB4: "Control",
-    0xE0CB5: "Control",
-    0xE0CB6: "Control",
-    0xE0CB7: "Control",
-    0xE0CB8: "Control",
-    0xE0CB9: "Control",
-    0xE0CBA: "Control",
-    0xE0CBB: "Control",
-    0xE0CBC: "Control",
-    0xE0CBD: "Control",
-    0xE0CBE: "Control",
-    0xE0CBF: "Control",
-    0xE0CC0: "Control",
-    0xE0CC1: "Control",
-    0xE0CC2: "Control",
-    0xE0CC3: "Control",
-    0xE0CC4: "Control",
-    0xE0CC5: "Control",
-    0xE0CC6: "Control",
-    0xE0CC7: "Control",
-    0xE0CC8: "Control",
-    0xE0CC9: "Control",
-    0xE0CCA: "Control",
-    0xE0CCB: "Control",
-    0xE0CCC: "Control",
-    0xE0CCD: "Control",
-    0xE0CCE: "Control",
-    0xE0CCF: "Control",
-    0xE0CD0: "Control",
-    0xE0CD1: "Control",
-    0xE0CD2: "Control",
-    0xE0CD3: "Control",
-    0xE0CD4: "Control",
-    0xE0CD5: "Control",
-    0xE0CD6: "Control",
-    0xE0CD7: "Control",
-    0xE0CD8: "Control",
-    0xE0CD9: "Control",
-    0xE0CDA: "Control",
-    0xE0CDB: "Control",
-    0xE0CDC: "Control",
-    0xE0CDD: "Control",
-    0xE0CDE: "Control",
-    0xE0CDF: "Control",
-    0xE0CE0: "Control",
-    0xE0CE1: "Control",
-    0xE0CE2: "Control",
-    0xE0CE3: "Control",
-    0xE0CE4: "Control",
-    0xE0CE5: "Control",
-    0xE0CE6: "Control",
-    0xE0CE7: "Control",
-    0xE0CE8: "Control",
-    0xE0CE9: "Control",
-    0xE0CEA: "Control",
-    0xE0CEB: "Control",
-    0xE0CEC: "Control",
-    0xE0CED: "Control",
-    0xE0CEE: "Control",
-    0xE0CEF: "Control",
-    0xE0CF0: "Control",
-    0xE0CF1: "Control",
-    0xE0CF2: "Control",
-    0xE0CF3: "Control",
-    0xE0CF4: "Control",
-    0xE0CF5: "Control",
-    0xE0CF6: "Control",
-    0xE0CF7: "Control",
-    0xE0CF8: "Control",
-    0xE0CF9: "Control",
-    0xE0CFA: "Control",
-    0xE0CFB: "Control",
-    0xE0CFC: "Control",
-    0xE0CFD: "Control",
-    0xE0CFE: "Control",
-    0xE0CFF: "Control",
-    0xE0D00: "Control",
-    0xE0D01: "Control",
-    0xE0D02: "Control",
-    0xE0D03: "Control",
-    0xE0D04: "Control",
-    0xE0D05: "Control",
-    0xE0D06: "Control",
-    0xE0D07: "Control",
-    0xE0D08: "Control",
-    0xE0D09: "Control",
-    0xE0D0A: "Control",
-    0xE0D0B: "Control",
-    0xE0D0C: "Control",
-    0xE0D0D: "Control",
-    0xE0D0E: "Control",
-    0xE0D0F: "Control",
-    0xE0D10: "Control",
-    0xE0D11: "Control",
-    0xE0D12: "Control",
-    0xE0D13: "Control",
-    0xE0D14: "Control",
-    0xE0D15: "Control",
-    0xE0D16: "Control",
-    0xE0D17: "Control",
-    0xE0D18: "Control",
-    0xE0D19: "Control",
-    0xE0D1A: "Control",
-    0xE0D1B: "Control",
-    0xE0D1C: "Control",
-    0xE0D1D: "Control",
-    0xE0D1E: "Control",
-    0xE0D1F: "Control",
-    0xE0D20: "Control",
-    0xE0D21: "Control",
-    0xE0D22: "Control",
-    0xE0D23: "Control",
-    0xE0D24: "Control",
-    0xE0D25: "Control",
-    0xE0D26: "Control",
-    0xE0D27: "Control",
-    0xE0D28: "Control",
-    0xE0D29: "Control",
-    0xE0D2A: "Control",
-    0xE0D2B: "Control",
-    0xE0D2C: "Control",
-    0xE0D2D: "Control",
-    0xE0D2E: "Control",
-    0xE0D2F: "Control",
-    0xE0D30: "Control",
-    0xE0D31: "Control",
-    0xE0D32: "Control",
-    0xE0D33: "Control",
-    0xE0D34: "Control",
-    0xE0D35: "Control",
-    0xE0D36: "Control",
-    0xE0D37: "Control",
-    0xE0D38: "Control",
-    0xE0D39: "Control",
-    0xE0D3A: "Control",
-    0xE0D3B: "Control",
-    0xE0D3C: "Control",
-    0xE0D3D: "Control",
-    0xE0D3E: "Control",
-    0xE0D3F: "Control",
-    0xE0D40: "Control",
-    0xE0D41: "Control",
-    0xE0D42: "Control",
-    0xE0D43: "Control",
-    0xE0D44: "Control",
-    0xE0D45: "Control",
-    0xE0D46: "Control",
-    0xE0D47: "Control",
-    0xE0D48: "Control",
-    0xE0D49: "Control",
-    0xE0D4A: "Control",
-    0xE0D4B: "Control",
-    0xE0D4C: "Control",
-    0xE0D4D: "Control",
-    0xE0D4E: "Control",
-    0xE0D4F: "Control",
-    0xE0D50: "Control",
-    0xE0D51: "Control",
-    0xE0D52: "Control",
-    0xE0D53: "Control",
-    0xE0D54: "Control",
-    0xE0D55: "Control",
-    0xE0D56: "Control",
-    0xE0D57: "Control",
-    0xE0D58: "Control",
-    0xE0D59: "Control",
-    0xE0D5A: "Control",
-    0xE0D5B: "Control",
-    0xE0D5C: "Control",
-    0xE0D5D: "Control",
-    0xE0D5E: "Control",
-    0xE0D5F: "Control",
-    0xE0D60: "Control",
-    0xE0D61: "Control",
-    0xE0D62: "Control",
-    0xE0D63: "Control",
-    0xE0D64: "Control",
-    0xE0D65: "Control",
-    0xE0D66: "Control",
-    0xE0D67: "Control",
-    0xE0D68: "Control",
-    0xE0D69: "Control",
-    0xE0D6A: "Control",
-    0xE0D6B: "Control",
-    0xE0D6C: "Control",
-    0xE0D6D: "Control",
-    0xE0D6E: "Control",
-    0xE0D6F: "Control",
-    0xE0D70: "Control",
-    0xE0D71: "Control",
-    0xE0D72: "Control",
-    0xE0D73: "Control",
-    0xE0D74: "Control",
-    0xE0D75: "Control",
-    0xE0D76: "Control",
-    0xE0D77: "Control",
-    0xE0D78: "Control",
-    0xE0D79: "Control",
-    0xE0D7A: "Control",
-    0xE0D7B: "Control",
-    0xE0D7C: "Control",
-    0xE0D7D: "Control",
-    0xE0D7E: "Control",
-    0xE0D7F: "Control",
-    0xE0D80: "Control",
-    0xE0D81: "Control",
-    0xE0D82: "Control",
-    0xE0D83: "Control",
-    0xE0D84: "Control",
-    0xE0D85: "Control",
-    0xE0D86: "Control",
-    0xE0D87: "Control",
-    0xE0D88: "Control",
-    0xE0D89: "Control",
-    0xE0D8A: "Control",
-    0xE0D8B: "Control",
-    0xE0D8C: "Control",
-    0xE0D8D: "Control",
-    0xE0D8E: "Control",
-    0xE0D8F: "Control",
-    0xE0D90: "Control",
-    0xE0D91: "Control",
-    0xE0D92: "Control",
-    0xE0D93: "Control",
-    0xE0D94: "Control",
-    0xE0D95: "Control",
-    0xE0D96: "Control",
-    0xE0D97: "Control",
-    0xE0D98: "Control",
-    0xE0D99: "Control",
-    0xE0D9A: "Control",
-    0xE0D9B: "Control",
-    0xE0D9C: "Control",
-    0xE0D9D: "Control",
-    0xE0D9E: "Control",
-    0xE0D9F: "Control",
-    0xE0DA0: "Control",
-    0xE0DA1: "Control",
-    0xE0DA2: "Control",
-    0xE0DA3: "Control",
-    0xE0DA4: "Control",
-    0xE0DA5: "Control",
-    0xE0DA6: "Control",
-    0xE0DA7: "Control",
-    0xE0DA8: "Control",
-    0xE0DA9: "Control",
-    0xE0DAA: "Control",
-    0xE0DAB: "Control",
-    0xE0DAC: "Control",
-    0xE0DAD: "Control",
-    0xE0DAE: "Control",
-    0xE0DAF: "Control",
-    0xE0DB0: "Control",
-    0xE0DB1: "Control",
-    0xE0DB2: "Control",
-    0xE0DB3: "Control",
-    0xE0DB4: "Control",
-    0xE0DB5: "Control",
-    0xE0DB6: "Control",
-    0xE0DB7: "Control",
-    0xE0DB8: "Control",
-    0xE0DB9: "Control",
-    0xE0DBA: "Control",
-    0xE0DBB: "Control",
-    0xE0DBC: "Control",
-    0xE0DBD: "Control",
-    0xE0DBE: "Control",
-    0xE0DBF: "Control",
-    0xE0DC0: "Control",
-    0xE0DC1: "Control",
-    0xE0DC2: "Control",
-    0xE0DC3: "Control",
-    0xE0DC4: "Control",
-    0xE0DC5: "Control",
-    0xE0DC6: "Control",
-    0xE0DC7: "Control",
-    0xE0DC8: "Control",
-    0xE0DC9: "Control",
-    0xE0DCA: "Control",
-    0xE0DCB: "Control",
-    0xE0DCC: "Control",
-    0xE0DCD: "Control",
-    0xE0DCE: "Control",
-    0xE0DCF: "Control",
-    0xE0DD0: "Control",
-    0xE0DD1: "Control",
-    0xE0DD2: "Control",
-    0xE0DD3: "Control",
-    0xE0DD4: "Control",
-    0xE0DD5: "Control",
-    0xE0DD6: "Control",
-    0xE0DD7: "Control",
-    0xE0DD8: "Control",
-    0xE0DD9: "Control",
-    0xE0DDA: "Control",
-    0xE0DDB: "Control",
-    0xE0DDC: "Control",
-    0xE0DDD: "Control",
-    0xE0DDE: "Control",
-    0xE0DDF: "Control",
-    0xE0DE0: "Control",
-    0xE0DE1: "Control",
-    0xE0DE2: "Control",
-    0xE0DE3: "Control",
-    0xE0DE4: "Control",
-    0xE0DE5: "Control",
-    0xE0DE6: "Control",
-    0xE0DE7: "Control",
-    0xE0DE8: "Control",
-    0xE0DE9: "Control",
-    0xE0DEA: "Control",
-    0xE0DEB: "Control",
-    0xE0DEC: "Control",
-    0xE0DED: "Control",
-    0xE0DEE: "Control",
-    0xE0DEF: "Control",
-    0xE0DF0: "Control",
-    0xE0DF1: "Control",
-    0xE0DF2: "Control",
-    0xE0DF3: "Control",
-    0xE0DF4: "Control",
-    0xE0DF5: "Control",
-    0xE0DF6: "Control",
-    0xE0DF7: "Control",
-    0xE0DF8: "Control",
-    0xE0DF9: "Control",
-    0xE0DFA: "Control",
-    0xE0DFB: "Control",
-    0xE0DFC: "Control",
-    0xE0DFD: "Control",
-    0xE0DFE: "Control",
-    0xE0DFF: "Control",
-    0xE0E00: "Control",
-    0xE0E01: "Control",
-    0xE0E02: "Control",
-    0xE0E03: "Control",
-    0xE0E04: "Control",
-    0xE0E05: "Control",
-    0xE0E06: "Control",
-    0xE0E07: "Control",
-    0xE0E08: "Control",
-    0xE0E09: "Control",
-    0xE0E0A: "Control",
-    0xE0E0B: "Control",
-    0xE0E0C: "Control",
-    0xE0E0D: "Control",
-    0xE0E0E: "Control",
-    0xE0E0F: "Control",
-    0xE0E10: "Control",
-    0xE0E11: "Control",
-    0xE0E12: "Control",
-    0xE0E13: "Control",
-    0xE0E14: "Control",
-    0xE0E15: "Control",
-    0xE0E16: "Control",
-    0xE0E17: "Control",
-    0xE0E18: "Control",
-    0xE0E19: "Control",
-    0xE0E1A: "Control",
-    0xE0E1B: "Control",
-    0xE0E1C: "Control",
-    0xE0E1D: "Control",
-    0xE0E1E: "Control",
-    0xE0E1F: "Control",
-    0xE0E20: "Control",
-    0xE0E21: "Control",
-    0xE0E22: "Control",
-    0xE0E23: "Control",
-    0xE0E24: "Control",
-    0xE0E25: "Control",
-    0xE0E26: "Control",
-    0xE0E27: "Control",
-    0xE0E28: "Control",
-    0xE0E29: "Control",
-    0xE0E2A: "Control",
-    0xE0E2B: "Control",
-    0xE0E2C: "Control",
-    0xE0E2D: "Control",
-    0xE0E2E: "Control",
-    0xE0E2F: "Control",
-    0xE0E30: "Control",
-    0xE0E31: "Control",
-    0xE0E32: "Control",
-    0xE0E33: "Control",
-    0xE0E34: "Control",
-    0xE0E35: "Control",
-    0xE0E36: "Control",
-    0xE0E37: "Control",
-    0xE0E38: "Control",
-    0xE0E39: "Control",
-    0xE0E3A: "Control",
-    0xE0E3B: "Control",
-    0xE0E3C: "Control",
-    0xE0E3D: "Control",
-    0xE0E3E: "Control",
-    0xE0E3F: "Control",
-    0xE0E40: "Control",
-    0xE0E41: "Control",
-    0xE0E42: "Control",
-    0xE0E43: "Control",
-    0xE0E44: "Control",
-    0xE0E45: "Control",
-    0xE0E46: "Control",
-    0xE0E47: "Control",
-    0xE0E48: "Control",
-    0xE0E49: "Control",
-    0xE0E4A: "Control",
-    0xE0E4B: "Control",
-    0xE0E4C: "Control",
-    0xE0E4D: "Control",
-    0xE0E4E: "Control",
-    0xE0E4F: "Control",
-    0xE0E50: "Control",
-    0xE0E51: "Control",
-    0xE0E52: "Control",
-    0xE0E53: "Control",
-    0xE0E54: "Control",
-    0xE0E55: "Control",
-    0xE0E56: "Control",
-    0xE0E57: "Control",
-    0xE0E58: "Control",
-    0xE0E59: "Control",
-    0xE0E5A: "Control",
-    0xE0E5B: "Control",
-    0xE0E5C: "Control",
-    0xE0E5D: "Control",
-    0xE0E5E: "Control",
-    0xE0E5F: "Control",
-    0xE0E60: "Control",
-    0xE0E61: "Control",
-    0xE0E62: "Control",
-    0xE0E63: "Control",
-    0xE0E64: "Control",
-    0xE0E65: "Control",
-    0xE0E66: "Control",
-    0xE0E67: "Control",
-    0xE0E68: "Control",
-    0xE0E69: "Control",
-    0xE0E6A: "Control",
-    0xE0E6B: "Control",
-    0xE0E6C: "Control",
-    0xE0E6D: "Control",
-    0xE0E6E: "Control",
-    0xE0E6F: "Control",
-    0xE0E70: "Control",
-    0xE0E71: "Control",
-    0xE0E72: "Control",
-    0xE0E73: "Control",
-    0xE0E74: "Control",
-    0xE0E75: "Control",
-    0xE0E76: "Control",
-    0xE0E77: "Control",
-    0xE0E78: "Control",
-    0xE0E79: "Control",
-    0xE0E7A: "Control",
-    0xE0E7B: "Control",
-    0xE0E7C: "Control",
-    0xE0E7D: "Control",
-    0xE0E7E: "Control",
-    0xE0E7F: "Control",
-    0xE0E80: "Control",
-    0xE0E81: "Control",
-    0xE0E82: "Control",
-    0xE0E83: "Control",
-    0xE0E84: "Control",
-    0xE0E85: "Control",
-    0xE0E86: "Control",
-    0xE0E87: "Control",
-    0xE0E88: "Control",
-    0xE0E89: "Control",
-    0xE0E8A: "Control",
-    0xE0E8B: "Control",
-    0xE0E8C: "Control",
-    0xE0E8D: "Control",
-    0xE0E8E: "Control",
-    0xE0E8F: "Control",
-    0xE0E90: "Control",
-    0xE0E91: "Control",
-    0xE0E92: "Control",
-    0xE0E93: "Control",
-    0xE0E94: "Control",
-    0xE0E95: "Control",
-    0xE0E96: "Control",
-    0xE0E97: "Control",
-    0xE0E98: "Control",
-    0xE0E99: "Control",
-    0xE0E9A: "Control",
-    0xE0E9B: "Control",
-    0xE0E9C: "Control",
-    0xE0E9D: "Control",
-    0xE0E9E: "Control",
-    0xE0E9F: "Control",
-    0xE0EA0: "Control",
-    0xE0EA1: "Control",
-    0xE0EA2: "Control",
-    0xE0EA3: "Control",
-    0xE0EA4: "Control",
-    0xE0EA5: "Control",
-    0xE0EA6: "Control",
-    0xE0EA7: "Control",
-    0xE0EA8: "Control",
-    0xE0EA9: "Control",
-    0xE0EAA: "Control",
-    0xE0EAB: "Control",
-    0xE0EAC: "Control",
-    0xE0EAD: "Control",
-    0xE0EAE: "Control",
-    0xE0EAF: "Control",
-    0xE0EB0: "Control",
-    0xE0EB1: "Control",
-    0xE0EB2: "Control",
-    0xE0EB3: "Control",
-    0xE0EB4: "Control",
-    0xE0EB5: "Control",
-    0xE0EB6: "Control",
-    0xE0EB7: "Control",
-    0xE0EB8: "Control",
-    0xE0EB9: "Control",
-    0xE0EBA: "Control",
-    0xE0EBB: "Control",
-    0xE0EBC: "Control",
-    0xE0EBD: "Control",
-    0xE0EBE: "Control",
-    0xE0EBF: "Control",
-    0xE0EC0: "Control",
-    0xE0EC1: "Control",
-    0xE0EC2: "Control",
-    0xE0EC3: "Control",
-    0xE0EC4: "Control",
-    0xE0EC5: "Control",
-    0xE0EC6: "Control",
-    0xE0EC7: "Control",
-    0xE0EC8: "Control",
-    0xE0EC9: "Control",
-    0xE0ECA: "Control",
-    0xE0ECB: "Control",
-    0xE0ECC: "Control",
-    0xE0ECD: "Control",
-    0xE0ECE: "Control",
-    0xE0ECF: "Control",
-    0xE0ED0: "Control",
-    0xE0ED1: "Control",
-    0xE0ED2: "Control",
-    0xE0ED3: "Control",
-    0xE0ED4: "Control",
-    0xE0ED5: "Control",
-    0xE0ED6: "Control",
-    0xE0ED7: "Control",
-    0xE0ED8: "Control",
-    0xE0ED9: "Control",
-    0xE0EDA: "Control",
-    0xE0EDB: "Control",
-    0xE0EDC: "Control",
-    0xE0EDD: "Control",
-    0xE0EDE: "Control",
-    0xE0EDF: "Control",
-    0xE0EE0: "Control",
-    0xE0EE1: "Control",
-    0xE0EE2: "Control",
-    0xE0EE3: "Control",
-    0xE0EE4: "Control",
-    0xE0EE5: "Control",
-    0xE0EE6: "Control",
-    0xE0EE7: "Control",
-    0xE0EE8: "Control",
-    0xE0EE9: "Control",
-    0xE0EEA: "Control",
-    0xE0EEB: "Control",
-    0xE0EEC: "Control",
-    0xE0EED: "Control",
-    0xE0EEE: "Control",
-    0xE0EEF: "Control",
-    0xE0EF0: "Control",
-    0xE0EF1: "Control",
-    0xE0EF2: "Control",
-    0xE0EF3: "Control",
-    0xE0EF4: "Control",
-    0xE0EF5: "Control",
-    0xE0EF6: "Control",
-    0xE0EF7: "Control",
-    0xE0EF8: "Control",
-    0xE0EF9: "Control",
-    0xE0EFA: "Control",
-    0xE0EFB: "Control",
-    0xE0EFC: "Control",
-    0xE0EFD: "Control",
-    0xE0EFE: "Control",
-    0xE0EFF: "Control",
-    0xE0F00: "Control",
-    0xE0F01: "Control",
-    0xE0F02: "Control",
-    0xE0F03: "Control",
-    0xE0F04: "Control",
-    0xE0F05: "Control",
-    0xE0F06: "Control",
-    0xE0F07: "Control",
-    0xE0F08: "Control",
-    0xE0F09: "Control",
-    0xE0F0A: "Control",
-    0xE0F0B: "Control",
-    0xE0F0C: "Control",
-    0xE0F0D: "Control",
-    0xE0F0E: "Control",
-    0xE0F0F: "Control",
-    0xE0F10: "Control",
-    0xE0F11: "Control",
-    0xE0F12: "Control",
-    0xE0F13: "Control",
-    0xE0F14: "Control",
-    0xE0F15: "Control",
-    0xE0F16: "Control",
-    0xE0F17: "Control",
-    0xE0F18: "Control",
-    0xE0F19: "Control",
-    0xE0F1A: "Control",
-    0xE0F1B: "Control",
-    0xE0F1C: "Control",
-    0xE0F1D: "Control",
-    0xE0F1E: "Control",
-    0xE0F1F: "Control",
-    0xE0F20: "Control",
-    0xE0F21: "Control",
-    0xE0F22: "Control",
-    0xE0F23: "Control",
-    0xE0F24: "Control",
-    0xE0F25: "Control",
-    0xE0F26: "Control",
-    0xE0F27: "Control",
-    0xE0F28: "Control",
-    0xE0F29: "Control",
-    0xE0F2A: "Control",
-    0xE0F2B: "Control",
-    0xE0F2C: "Control",
-    0xE0F2D: "Control",
-    0xE0F2E: "Control",
-    0xE0F2F: "Control",
-    0xE0F30: "Control",
-    0xE0F31: "Control",
-    0xE0F32: "Control",
-    0xE0F33: "Control",
-    0xE0F34: "Control",
-    0xE0F35: "Control",
-    0xE0F36: "Control",
-    0xE0F37: "Control",
-    0xE0F38: "Control",
-    0xE0F39: "Control",
-    0xE0F3A: "Control",
-    0xE0F3B: "Control",
-    0xE0F3C: "Control",
-    0xE0F3D: "Control",
-    0xE0F3E: "Control",
-    0xE0F3F: "Control",
-    0xE0F40: "Control",
-    0xE0F41: "Control",
-    0xE0F42: "Control",
-    0xE0F43: "Control",
-    0xE0F44: "Control",
-    0xE0F45: "Control",
-    0xE0F46: "Control",
-    0xE0F47: "Control",
-    0xE0F48: "Control",
-    0xE0F49: "Control",
-    0xE0F4A: "Control",
-    0xE0F4B: "Control",
-    0xE0F4C: "Control",
-    0xE0F4D: "Control",
-    0xE0F4E: "Control",
-    0xE0F4F: "Control",
-    0xE0F50: "Control",
-    0xE0F51: "Control",
-    0xE0F52: "Control",
-    0xE0F53: "Control",
-    0xE0F54: "Control",
-    0xE0F55: "Control",
-    0xE0F56: "Control",
-    0xE0F57: "Control",
-    0xE0F58: "Control",
-    0xE0F59: "Control",
-    0xE0F5A: "Control",
-    0xE0F5B: "Control",
-    0xE0F5C: "Control",
-    0xE0F5D: "Control",
-    0xE0F5E: "Control",
-    0xE0F5F: "Control",
-    0xE0F60: "Control",
-    0xE0F61: "Control",
-    0xE0F62: "Control",
-    0xE0F63: "Control",
-    0xE0F64: "Control",
-    0xE0F65: "Control",
-    0xE0F66: "Control",
-    0xE0F67: "Control",
-    0xE0F68: "Control",
-    0xE0F69: "Control",
-    0xE0F6A: "Control",
-    0xE0F6B: "Control",
-    0xE0F6C: "Control",
-    0xE0F6D: "Control",
-    0xE0F6E: "Control",
-    0xE0F6F: "Control",
-    0xE0F70: "Control",
-    0xE0F71: "Control",
-    0xE0F72: "Control",
-    0xE0F73: "Control",
-    0xE0F74: "Control",
-    0xE0F75: "Control",
-    0xE0F76: "Control",
-    0xE0F77: "Control",
-    0xE0F78: "Control",
-    0xE0F79: "Control",
-    0xE0F7A: "Control",
-    0xE0F7B: "Control",
-    0xE0F7C: "Control",
-    0xE0F7D: "Control",
-    0xE0F7E: "Control",
-    0xE0F7F: "Control",
-    0xE0F80: "Control",
-    0xE0F81: "Control",
-    0xE0F82: "Control",
-    0xE0F83: "Control",
-    0xE0F84: "Control",
-    0xE0F85: "Control",
-    0xE0F86: "Control",
-    0xE0F87: "Control",
-    0xE0F88: "Control",
-    0xE0F89: "Control",
-    0xE0F8A: "Control",
-    0xE0F8B: "Control",
-    0xE0F8C: "Control",
-    0xE0F8D: "Control",
-    0xE0F8E: "Control",
-    0xE0F8F: "Control",
-    0xE0F90: "Control",
-    0xE0F91: "Control",
-    0xE0F92: "Control",
-    0xE0F93: "Control",
-    0xE0F94: "Control",
-    0xE0F95: "Control",
-    0xE0F96: "Control",
-    0xE0F97: "Control",
-    0xE0F98: "Control",
-    0xE0F99: "Control",
-    0xE0F9A: "Control",
-    0xE0F9B: "Control",
-    0xE0F9C: "Control",
-    0xE0F9D: "Control",
-    0xE0F9E: "Control",
-    0xE0F9F: "Control",
-    0xE0FA0: "Control",
-    0xE0FA1: "Control",
-    0xE0FA2: "Control",
-    0xE0FA3: "Control",
-    0xE0FA4: "Control",
-    0xE0FA5: "Control",
-    0xE0FA6: "Control",
-    0xE0FA7: "Control",
-    0xE0FA8: "Control",
-    0xE0FA9: "Control",
-    0xE0FAA: "Control",
-    0xE0FAB: "Control",
-    0xE0FAC: "Control",
-    0xE0FAD: "Control",
-    0xE0FAE: "Control",
-    0xE0FAF: "Control",
-    0xE0FB0: "Control",
-    0xE0FB1: "Control",
-    0xE0FB2: "Control",
-    0xE0FB3: "Control",
-    0xE0FB4: "Control",
-    0xE0FB5: "Control",
-    0xE0FB6: "Control",
-    0xE0FB7: "Control",
-    0xE0FB8: "Control",
-    0xE0FB9: "Control",
-    0xE0FBA: "Control",
-    0xE0FBB: "Control",
-    0xE0FBC: "Control",
-    0xE0FBD: "Control",
-    0xE0FBE: "Control",
-    0xE0FBF: "Control",
-    0xE0FC0: "Control",
-    0xE0FC1: "Control",
-    0xE0FC2: "Control",
-    0xE0FC3: "Control",
-    0xE0FC4: "Control",
-    0xE0FC5: "Control",
-    0xE0FC6: "Control",
-    0xE0FC7: "Control",
-    0xE0FC8: "Control",
-    0xE0FC9: "Control",
-    0xE0FCA: "Control",
-    0xE0FCB: "Control",
-    0xE0FCC: "Control",
-    0xE0FCD: "Control",
-    0xE0FCE: "Control",
-    0xE0FCF: "Control",
-    0xE0FD0: "Control",
-    0xE0FD1: "Control",
-    0xE0FD2: "Control",
-    0xE0FD3: "Control",
-    0xE0FD4: "Control",
-    0xE0FD5: "Control",
-    0xE0FD6: "Control",
-    0xE0FD7: "Control",
-    0xE0FD8: "Control",
-    0xE0FD9: "Control",
-    0xE0FDA: "Control",
-    0xE0FDB: "Control",
-    0xE0FDC: "Control",
-    0xE0FDD: "Control",
-    0xE0FDE: "Control",
-    0xE0FDF: "Control",
-    0xE0FE0: "Control",
-    0xE0FE1: "Control",
-    0xE0FE2: "Control",
-    0xE0FE3: "Control",
-    0xE0FE4: "Control",
-    0xE0FE5: "Control",
-    0xE0FE6: "Control",
-    0xE0FE7: "Control",
-    0xE0FE8: "Control",
-    0xE0FE9: "Control",
-    0xE0FEA: "Control",
-    0xE0FEB: "Control",
-    0xE0FEC: "Control",
-    0xE0FED: "Control",
-    0xE0FEE: "Control",
-    0xE0FEF: "Control",
-    0xE0FF0: "Control",
-    0xE0FF1: "Control",
-    0xE0FF2: "Control",
-    0xE0FF3: "Control",
-    0xE0FF4: "Control",
-    0xE0FF5: "Control",
-    0xE0FF6: "Control",
-    0xE0FF7: "Control",
-    0xE0FF8: "Control",
-    0xE0FF9: "Control",
-    0xE0FFA: "Control",
-    0xE0FFB: "Control",
-    0xE0FFC: "Control",
-    0xE0FFD: "Control",
-    0xE0FFE: "Control",
-    0xE0FFF: "Control",
-    0x00300: "Extend",
-    0x00301: "Extend",
-    0x00302: "Extend",
-    0x00303: "Extend",
-    0x00304: "Extend",
-    0x00305: "Extend",
-    0x00306: "Extend",
-    0x00307: "Extend",
-    0x00308: "Extend",
-    0x00309: "Extend",
-    0x0030A: "Extend",
-    0x0030B: "Extend",
-    0x0030C: "Extend",
-    0x0030D: "Extend",
-    0x0030E: "Extend",
-    0x0030F: "Extend",
-    0x00310: "Extend",
-    0x00311: "Extend",
-    0x00312: "Extend",
-    0x00313: "Extend",
-    0x00314: "Extend",
-    0x00315: "Extend",
-    0x00316: "Extend",
-    0x00317: "Extend",
-    0x00318: "Extend",
-    0x00319: "Extend",
-    0x0031A: "Extend",
-    0x0031B: "Extend",
-    0x0031C: "Extend",
-    0x0031D: "Extend",
-    0x0031E: "Extend",
-    0x0031F: "Extend",
-    0x00320: "Extend",
-    0x00321: "Extend",
-    0x00322: "Extend",
-    0x00323: "Extend",
-    0x00324: "Extend",
-    0x00325: "Extend",
-    0x00326: "Extend",
-    0x00327: "Extend",
-    0x00328: "Extend",
-    0x00329: "Extend",
-    0x0032A: "Extend",
-    0x0032B: "Extend",
-    0x0032C: "Extend",
-    0x0032D: "Extend",
-    0x0032E: "Extend",
-    0x0032F: "Extend",
-    0x00330: "Extend",
-    0x00331: "Extend",
-    0x00332: "Extend",
-    0x00333: "Extend",
-    0x00334: "Extend",
-    0x00335: "Extend",
-    0x00336: "Extend",
-    0x00337: "Extend",
-    0x00338: "Extend",
-    0x00339: "Extend",
-    0x0033A: "Extend",
-    0x0033B: "Extend",
-    0x0033C: "Extend",
-    0x0033D: "Extend",
-    0x0033E: "Extend",
-    0x0033F: "Extend",
-    0x00340: "Extend",
-    0x00341: "Extend",
-    0x00342: "Extend",
-    0x00343: "Extend",
-    0x00344: "Extend",
-    0x00345: "Extend",
-    0x00346: "Extend",
-    0x00347: "Extend",
-    0x00348: "Extend",
-    0x00349: "Extend",
-    0x0034A: "Extend",
-    0x0034B: "Extend",
-    0x0034C: "Extend",
-    0x0034D: "Extend",
-    0x0034E: "Extend",
-    0x0034F: "Extend",
-    0x00350: "Extend",
-    0x00351: "Extend",
-    0x00352: "Extend",
-    0x00353: "Extend",
-    0x00354: "Extend",
-    0x00355: "Extend",
-    0x00356: "Extend",
-    0x00357: "Extend",
-    0x00358: "Extend",
-    0x00359: "Extend",
-    0x0035A: "Extend",
-    0x0035B: "Extend",
-    0x0035C: "Extend",
-    0x0035D: "Extend",
-    0x0035E: "Extend",
-    0x0035F: "Extend",
-    0x00360: "Extend",
-    0x00361: "Extend",
-    0x00362: "Extend",
-    0x00363: "Extend",
-    0x00364: "Extend",
-    0x00365: "Extend",
-    0x00366: "Extend",
-    0x00367: "Extend",
-    0x00368: "Extend",
-    0x00369: "Extend",
-    0x0036A: "Extend",
-    0x0036B: "Extend",
-    0x0036C: "Extend",
-    0x0036D: "Extend",
-    0x0036E: "Extend",
-    0x0036F: "Extend",
-    0x00483: "Extend",
-    0x00484: "Extend",
-    0x00485: "Extend",
-    0x00486: "Extend",
-    0x00487: "Extend",
-    0x00488: "Extend",
-    0x00489: "Extend",
-    0x00591: "Extend",
-    0x00592: "Extend",
-    0x00593: "Extend",
-    0x00594: "Extend",
-    0x00595: "Extend",
-    0x00596: "Extend",
-    0x00597: "Extend",
-    0x00598: "Extend",
-    0x00599: "Extend",
-    0x0059A: "Extend",
-    0x0059B: "Extend",
-    0x0059C: "Extend",
-    0x0059D: "Extend",
-    0x0059E: "Extend",
-    0x0059F: "Extend",
-    0x005A0: "Extend",
-    0x005A1: "Extend",
-    0x005A2: "Extend",
-    0x005A3: "Extend",
-    0x005A4: "Extend",
-    0x005A5: "Extend",
-    0x005A6: "Extend",
-    0x005A7: "Extend",
-    0x005A8: "Extend",
-    0x005A9: "Extend",
-    0x005AA: "Extend",
-    0x005AB: "Extend",
-    0x005AC: "Extend",
-    0x005AD: "Extend",
-    0x005AE: "Extend",
-    0x005AF: "Extend",
-    0x005B0: "Extend",
-    0x005B1: "Extend",
-    0x005B2: "Extend",
-    0x005B3: "Extend",
-    0x005B4: "Extend",
-    0x005B5: "Extend",
-    0x005B6: "Extend",
-    0x005B7: "Extend",
-    0x005B8: "Extend",
-    0x005B9: "Extend",
-    0x005BA: "Extend",
-    0x005BB: "Extend",
-    0x005BC: "Extend",
-    0x005BD: "Extend",
-    0x005BF: "Extend",
-    0x005C1: "Extend",
-    0x005C2: "Extend",
-    0x005C4: "Extend",
-    0x005C5: "Extend",
-    0x005C7: "Extend",
-    0x00610: "Extend",
-    0x00611: "Extend",
-    0x00612: "Extend",
-    0x00613: "Extend",
-    0x00614: "Extend",
-    0x00615: "Extend",
-    0x00616: "Extend",
-    0x00617: "Extend",
-    0x00618: "Extend",
-    0x00619: "Extend",
-    0x0061A: "Extend",
-    0x0064B: "Extend",
-    0x0064C: "Extend",
-    0x0064D: "Extend",
-    0x0064E: "Extend",
-    0x0064F: "Extend",
-    0x00650: "Extend",
-    0x00651: "Extend",
-    0x00652: "Extend",
-    0x00653: "Extend",
-    0x00654: "Extend",
-    0x00655: "Extend",
-    0x00656: "Extend",
-    0x00657: "Extend",
-    0x00658: "Extend",
-    0x00659: "Extend",
-    0x0065A: "Extend",
-    0x0065B: "Extend",
-    0x0065C: "Extend",
-    0x0065D: "Extend",
-    0x0065E: "Extend",
-    0x0065F: "Extend",
-    0x00670: "Extend",
-    0x006D6: "Extend",
-    0x006D7: "Extend",
-    0x006D8: "Extend",
-    0x006D9: "Extend",
-    0x006DA: "Extend",
-    0x006DB: "Extend",
-    0x006DC: "Extend",
-    0x006DF: "Extend",
-    0x006E0: "Extend",
-    0x006E1: "Extend",
-    0x006E2: "Extend",
-    0x006E3: "Extend",
-    0x006E4: "Extend",
-    0x006E7: "Extend",
-    0x006E8: "Extend",
-    0x006EA: "Extend",
-    0x006EB: "Extend",
-    0x006EC: "Extend",
-    0x006ED: "Extend",
-    0x00711: "Extend",
-    0x00730: "Extend",
-    0x00731: "Extend",
-    0x00732: "Extend",
-    0x00733: "Extend",
-    0x00734: "Extend",
-    0x00735: "Extend",
-    0x00736: "Extend",
-    0x00737: "Extend",
-    0x00738: "Extend",
-    0x00739: "Extend",
-    0x0073A: "Extend",
-    0x0073B: "Extend",
-    0x0073C: "Extend",
-    0x0073D: "Extend",
-    0x0073E: "Extend",
-    0x0073F: "Extend",
-    0x00740: "Extend",
-    0x00741: "Extend",
-    0x00742: "Extend",
-    0x00743: "Extend",
-    0x00744: "Extend",
-    0x00745: "Extend",
-    0x00746: "Extend",
-    0x00747: "Extend",
-    0x00748: "Extend",
-    0x00749: "Extend",
-    0x0074A: "Extend",
-    0x007A6: "Extend",
-    0x007A7: "Extend",
-    0x007A8: "Extend",
-    0x007A9: "Extend",
-    0x007AA: "Extend",
-    0x007AB: "Extend",
-    0x007AC: "Extend",
-    0x007AD: "Extend",
-    0x007AE: "Extend",
-    0x007AF: "Extend",
-    0x007B0: "Extend",
-    0x007EB: "Extend",
-    0x007EC: "Extend",
-    0x007ED: "Extend",
-    0x007EE: "Extend",
-    0x007EF: "Extend",
-    0x007F0: "Extend",
-    0x007F1: "Extend",
-    0x007F2: "Extend",
-    0x007F3: "Extend",
-    0x007FD: "Extend",
-    0x00816: "Extend",
-    0x00817: "Extend",
-    0x00818: "Extend",
-    0x00819: "Extend",
-    0x0081B: "Extend",
-    0x0081C: "Extend",
-    0x0081D: "Extend",
-    0x0081E: "Extend",
-    0x0081F: "Extend",
-    0x00820: "Extend",
-    0x00821: "Extend",
-    0x00822: "Extend",
-    0x00823: "Extend",
-    0x00825: "Extend",
-    0x00826: "Extend",
-    0x00827: "Extend",
-    0x00829: "Extend",
-    0x0082A: "Extend",
-    0x0082B: "Extend",
-    0x0082C: "Extend",
-    0x0082D: "Extend",
-    0x00859: "Extend",
-    0x0085A: "Extend",
-    0x0085B: "Extend",
-    0x00897: "Extend",
-    0x00898: "Extend",
-    0x00899: "Extend",
-    0x0089A: "Extend",
-    0x0089B: "Extend",
-    0x0089C: "Extend",
-    0x0089D: "Extend",
-    0x0089E: "Extend",
-    0x0089F: "Extend",
-    0x008CA: "Extend",
-    0x008CB: "Extend",
-    0x008CC: "Extend",
-    0x008CD: "Extend",
-    0x008CE: "Extend",
-    0x008CF: "Extend",
-    0x008D0: "Extend",
-    0x008D1: "Extend",
-    0x008D2: "Extend",
-    0x008D3: "Extend",
-    0x008D4: "Extend",
-    0x008D5: "Extend",
-    0x008D6: "Extend",
-    0x008D7: "Extend",
-    0x008D8: "Extend",
-    0x008D9: "Extend",
-    0x008DA: "Extend",
-    0x008DB: "Extend",
-    0x008DC: "Extend",
-    0x008DD: "Extend",
-    0x008DE: "Extend",
-    0x008DF: "Extend",
-    0x008E0: "Extend",
-    0x008E1: "Extend",
-    0x008E3: "Extend",
-    0x008E4: "Extend",
-    0x008E5: "Extend",
-    0x008E6: "Extend",
-    0x008E7: "Extend",
-    0x008E8: "Extend",
-    0x008E9: "Extend",
-    0x008EA: "Extend",
-    0x008EB: "Extend",
-    0x008EC: "Extend",
-    0x008ED: "Extend",
-    0x008EE: "Extend",
-    0x008EF: "Extend",
-    0x008F0: "Extend",
-    0x008F1: "Extend",
-    0x008F2: "Extend",
-    0x008F3: "Extend",
-    0x008F4: "Extend",
-    0x008F5: "Extend",
-    0x008F6: "Extend",
-    0x008F7: "Extend",
-    0x008F8: "Extend",
-    0x008F9: "Extend",
-    0x008FA: "Extend",
-    0x008FB: "Extend",
-    0x008FC: "Extend",
-    0x008FD: "Extend",
-    0x008FE: "Extend",
-    0x008FF: "Extend",
-    0x00900: "Extend",
-    0x00901: "Extend",
-    0x00902: "Extend",
-    0x0093A: "Extend",
-    0x0093C: "Extend",
-    0x00941: "Extend",
-    0x00942: "Extend",
-    0x00943: "Extend",
-    0x00944: "Extend",
-    0x00945: "Extend",
-    0x00946: "Extend",
-    0x00947: "Extend",
-    0x00948: "Extend",
-    0x0094D: "Extend",
-    0x00951: "Extend",
-    0x00952: "Extend",
-    0x00953: "Extend",
-    0x00954: "Extend",
-    0x00955: "Extend",
-    0x00956: "Extend",
-    0x00957: "Extend",
-    0x00962: "Extend",
-    0x00963: "Extend",
-    0x00981: "Extend",
-    0x009BC: "Extend",
-    0x009BE: "Extend",
-    0x009C1: "Extend",
-    0x009C2: "Extend",
-    0x009C3: "Extend",
-    0x009C4: "Extend",
-    0x009CD: "Extend",
-    0x009D7: "Extend",
-    0x009E2: "Extend",
-    0x009E3: "Extend",
-    0x009FE: "Extend",
-    0x00A01: "Extend",
-    0x00A02: "Extend",
-    0x00A3C: "Extend",
-    0x00A41: "Extend",
-    0x00A42: "Extend",
-    0x00A47: "Extend",
-    0x00A48: "Extend",
-    0x00A4B: "Extend",
-    0x00A4C: "Extend",
-    0x00A4D: "Extend",
-    0x00A51: "Extend",
-    0x00A70: "Extend",
-    0x00A71: "Extend",
-    0x00A75: "Extend",
-    0x00A81: "Extend",
-    0x00A82: "Extend",
-    0x00ABC: "Extend",
-    0x00AC1: "Extend",
-    0x00AC2: "Extend",
-    0x00AC3: "Extend",
-    0x00AC4: "Extend",
-    0x00AC5: "Extend",
-    0x00AC7: "Extend",
-    0x00AC8: "Extend",
-    0x00ACD: "Extend",
-    0x00AE2: "Extend",
-    0x00AE3: "Extend",
-    0x00AFA: "Extend",
-    0x00AFB: "Extend",
-    0x00AFC: "Extend",
-    0x00AFD: "Extend",
-    0x00AFE: "Extend",
-    0x00AFF: "Extend",
-    0x00B01: "Extend",
-    0x00B3C: "Extend",
-    0x00B3E: "Extend",
-    0x00B3F: "Extend",
-    0x00B41: "Extend",
-    0x00B42: "Extend",
-    0x00B43: "Extend",
-    0x00B44: "Extend",
-    0x00B4D: "Extend",
-    0x00B55: "Extend",
-    0x00B56: "Extend",
-    0x00B57: "Extend",
-    0x00B62: "Extend",
-    0x00B63: "Extend",
-    0x00B82: "Extend",
-    0x00BBE: "Extend",
-    0x00BC0: "Extend",
-    0x00BCD: "Extend",
-    0x00BD7: "Extend",
-    0x00C00: "Extend",
-    0x00C04: "Extend",
-    0x00C3C: "Extend",
-    0x00C3E: "Extend",
-    0x00C3F: "Extend",
-    0x00C40: "Extend",
-    0x00C46: "Extend",
-    0x00C47: "Extend",
-    0x00C48: "Extend",
-    0x00C4A: "Extend",
-    0x00C4B: "Extend",
-    0x00C4C: "Extend",
-    0x00C4D: "Extend",
-    0x00C55: "Extend",
-    0x00C56: "Extend",
-    0x00C62: "Extend",
-    0x00C63: "Extend",
-    0x00C81: "Extend",
-    0x00CBC: "Extend",
-    0x00CBF: "Extend",
-    0x00CC0: "Extend",
-    0x00CC2: "Extend",
-    0x00CC6: "Extend",
-    0x00CC7: "Extend",
-    0x00CC8: "Extend",
-    0x00CCA: "Extend",
-    0x00CCB: "Extend",
-    0x00CCC: "Extend",
-    0x00CCD: "Extend",
-    0x00CD5: "Extend",
-    0x00CD6: "Extend",
-    0x00CE2: "Extend",
-    0x00CE3: "Extend",
-    0x00D00: "Extend",
-    0x00D01: "Extend",
-    0x00D3B: "Extend",
-    0x00D3C: "Extend",
-    0x00D3E: "Extend",
-    0x00D41: "Extend",
-    0x00D42: "Extend",
-    0x00D43: "Extend",
-    0x00D44: "Extend",
-    0x00D4D: "Extend",
-    0x00D57: "Extend",
-    0x00D62: "Extend",
-    0x00D63: "Extend",
-    0x00D81: "Extend",
-    0x00DCA: "Extend",
-    0x00DCF: "Extend",
-    0x00DD2: "Extend",
-    0x00DD3: "Extend",
-    0x00DD4: "Extend",
-    0x00DD6: "Extend",
-    0x00DDF: "Extend",
-    0x00E31: "Extend",
-    0x00E34: "Extend",
-    0x00E35: "Extend",
-    0x00E36: "Extend",
-    0x00E37: "Extend",
-    0x00E38: "Extend",
-    0x00E39: "Extend",
-    0x00E3A: "Extend",
-    0x00E47: "Extend",
-    0x00E48: "Extend",
-    0x00E49: "Extend",
-    0x00E4A: "Extend",
-    0x00E4B: "Extend",
-    0x00E4C: "Extend",
-    0x00E4D: "Extend",
-    0x00E4E: "Extend",
-    0x00EB1: "Extend",
-    0x00EB4: "Extend",
-    0x00EB5: "Extend",
-    0x00EB6: "Extend",
-    0x00EB7: "Extend",
-    0x00EB8: "Extend",
-    0x00EB9: "Extend",
-    0x00EBA: "Extend",
-    0x00EBB: "Extend",
-    0x00EBC: "Extend",
-    0x00EC8: "Extend",
-    0x00EC9: "Extend",
-    0x00ECA: "Extend",
-    0x00ECB: "Extend",
-    0x00ECC: "Extend",
-    0x00ECD: "Extend",
-    0x00ECE: "Extend",
-    0x00F18: "Extend",
-    0x00F19: "Extend",
-    0x00F35: "Extend",
-    0x00F37: "Extend",
-    0x00F39: "Extend",
-    0x00F71: "Extend",
-    0x00F72: "Extend",
-    0x00F73: "Extend",
-    0x00F74: "Extend",
-    0x00F75: "Extend",
-    0x00F76: "Extend",
-    0x00F77: "Extend",
-    0x00F78: "Extend",
-    0x00F79: "Extend",
-    0x00F7A: "Extend",
-    0x00F7B: "Extend",
-    0x00F7C: "Extend",
-    0x00F7D: "Extend",
-    0x00F7E: "Extend",
-    0x00F80: "Extend",
-    0x00F81: "Extend",
-    0x00F82: "Extend",
-    0x00F83: "Extend",
-    0x00F84: "Extend",
-    0x00F86: "Extend",
-    0x00F87: "Extend",
-    0x00F8D: "Extend",
-    0x00F8E: "Extend",
-    0x00F8F: "Extend",
-    0x00F90: "Extend",
-    0x00F91: "Extend",
-    0x00F92: "Extend",
-    0x00F93: "Extend",
-    0x00F94: "Extend",
-    0x00F95: "Extend",
-    0x00F96: "Extend",
-    0x00F97: "Extend",
-    0x00F99: "Extend",
-    0x00F9A: "Extend",
-    0x00F9B: "Extend",
-    0x00F9C: "Extend",
-    0x00F9D: "Extend",
-    0x00F9E: "Extend",
-    0x00F9F: "Extend",
-    0x00FA0: "Extend",
-    0x00FA1: "Extend",
-    0x00FA2: "Extend",
-    0x00FA3: "Extend",
-    0x00FA4: "Extend",
-    0x00FA5: "Extend",
-    0x00FA6: "Extend",
-    0x00FA7: "Extend",
-    0x00FA8: "Extend",
-    0x00FA9: "Extend",
-    0x00FAA: "Extend",
-    0x00FAB: "Extend",
-    0x00FAC: "Extend",
-    0x00FAD: "Extend",
-    0x00FAE: "Extend",
-    0x00FAF: "Extend",
-    0x00FB0: "Extend",
-    0x00FB1: "Extend",
-    0x00FB2: "Extend",
-    0x00FB3: "Extend",
-    0x00FB4: "Extend",
-    0x00FB5: "Extend",
-    0x00FB6: "Extend",
-    0x00FB7: "Extend",
-    0x00FB8: "Extend",
-    0x00FB9: "Extend",
-    0x00FBA: "Extend",
-    0x00FBB: "Extend",
-    0x00FBC: "Extend",
-    0x00FC6: "Extend",
-    0x0102D: "Extend",
-    0x0102E: "Extend",
-    0x0102F: "Extend",
-    0x01030: "Extend",
-    0x01032: "Extend",
-    0x01033: "Extend",
-    0x01034: "Extend",
-    0x01035: "Extend",
-    0x01036: "Extend",
-    0x01037: "Extend",
-    0x01039: "Extend",
-    0x0103A: "Extend",
-    0x0103D: "Extend",
-    0x0103E: "Extend",
-    0x01058: "Extend",
-    0x01059: "Extend",
-    0x0105E: "Extend",
-    0x0105F: "Extend",
-    0x01060: "Extend",
-    0x01071: "Extend",
-    0x01072: "Extend",
-    0x01073: "Extend",
-    0x01074: "Extend",
-    0x01082: "Extend",
-    0x01085: "Extend",
-    0x01086: "Extend",
-    0x0108D: "Extend",
-    0x0109D: "Extend",
-    0x0135D: "Extend",
-    0x0135E: "Extend",
-    0x0135F: "Extend",
-    0x01712: "Extend",
-    0x01713: "Extend",
-    0x01714: "Extend",
-    0x01715: "Extend",
-    0x01732: "Extend",
-    0x01733: "Extend",
-    0x01734: "Extend",
-    0x01752: "Extend",
-    0x01753: "Extend",
-    0x01772: "Extend",
-    0x01773: "Extend",
-    0x017B4: "Extend",
-    0x017B5: "Extend",
-    0x017B7: "Extend",
-    0x017B8: "Extend",
-    0x017B9: "Extend",
-    0x017BA: "Extend",
-    0x017BB: "Extend",
-    0x017BC: "Extend",
-    0x017BD: "Extend",
-    0x017C6: "Extend",
-    0x017C9: "Extend",
-    0x017CA: "Extend",
-    0x017CB: "Extend",
-    0x017CC: "Extend",
-    0x017CD: "Extend",
-    0x017CE: "Extend",
-    0x017CF: "Extend",
-    0x017D0: "Extend",
-    0x017D1: "Extend",
-    0x017D2: "Extend",
-    0x017D3: "Extend",
-    0x017DD: "Extend",
-    0x0180B: "Extend",
-    0x0180C: "Extend",
-    0x0180D: "Extend",
-    0x0180F: "Extend",
-    0x01885: "Extend",
-    0x01886: "Extend",
-    0x018A9: "Extend",
-    0x01920: "Extend",
-    0x01921: "Extend",
-    0x01922: "Extend",
-    0x01927: "Extend",
-    0x01928: "Extend",
-    0x01932: "Extend",
-    0x01939: "Extend",
-    0x0193A: "Extend",
-    0x0193B: "Extend",
-    0x01A17: "Extend",
-    0x01A18: "Extend",
-    0x01A1B: "Extend",
-    0x01A56: "Extend",
-    0x01A58: "Extend",
-    0x01A59: "Extend",
-    0x01A5A: "Extend",
-    0x01A5B: "Extend",
-    0x01A5C: "Extend",
-    0x01A5D: "Extend",
-    0x01A5E: "Extend",
-    0x01A60: "Extend",
-    0x01A62: "Extend",
-    0x01A65: "Extend",
-    0x01A66: "Extend",
-    0x01A67: "Extend",
-    0x01A68: "Extend",
-    0x01A69: "Extend",
-    0x01A6A: "Extend",
-    0x01A6B: "Extend",
-    0x01A6C: "Extend",
-    0x01A73: "Extend",
-    0x01A74: "Extend",
-    0x01A75: "Extend",
-    0x01A76: "Extend",
-    0x01A77: "Extend",
-    0x01A78: "Extend",
-    0x01A79: "Extend",
-    0x01A7A: "Extend",
-    0x01A7B: "Extend",
-    0x01A7C: "Extend",
-    0x01A7F: "Extend",
-    0x01AB0: "Extend",
-    0x01AB1: "Extend",
-    0x01AB2: "Extend",
-    0x01AB3: "Extend",
-    0x01AB4: "Extend",
-    0x01AB5: "Extend",
-    0x01AB6: "Extend",
-    0x01AB7: "Extend",
-    0x01AB8: "Extend",
-    0x01AB9: "Extend",
-    0x01ABA: "Extend",
-    0x01ABB: "Extend",
-    0x01ABC: "Extend",
-    0x01ABD: "Extend",
-    0x01ABE: "Extend",
-    0x01ABF: "Extend",
-    0x01AC0: "Extend",
-    0x01AC1: "Extend",
-    0x01AC2: "Extend",
-    0x01AC3: "Extend",
-    0x01AC4: "Extend",
-    0x01AC5: "Extend",
-    0x01AC6: "Extend",
-    0x01AC7: "Extend",
-    0x01AC8: "Extend",
-    0x01AC9: "Extend",
-    0x01ACA: "Extend",
-    0x01ACB: "Extend",
-    0x01ACC: "Extend",
-    0x01ACD: "Extend",
-    0x01ACE: "Extend",
-    0x01B00: "Extend",
-    0x01B01: "Extend",
-    0x01B02: "Extend",
-    0x01B03: "Extend",
-    0x01B34: "Extend",
-    0x01B35: "Extend",
-    0x01B36: "Extend",
-    0x01B37: "Extend",
-    0x01B38: "Extend",
-    0x01B39: "Extend",
-    0x01B3A: "Extend",
-    0x01B3B: "Extend",
-    0x01B3C: "Extend",
-    0x01B3D: "Extend",
-    0x01B42: "Extend",
-    0x01B43: "Extend",
-    0x01B44: "Extend",
-    0x01B6B: "Extend",
-    0x01B6C: "Extend",
-    0x01B6D: "Extend",
-    0x01B6E: "Extend",
-    0x01B6F: "Extend",
-    0x01B70: "Extend",
-    0x01B71: "Extend",
-    0x01B72: "Extend",
-    0x01B73: "Extend",
-    0x01B80: "Extend",
-    0x01B81: "Extend",
-    0x01BA2: "Extend",
-    0x01BA3: "Extend",
-    0x01BA4: "Extend",
-    0x01BA5: "Extend",
-    0x01BA8: "Extend",
-    0x01BA9: "Extend",
-    0x01BAA: "Extend",
-    0x01BAB: "Extend",
-    0x01BAC: "Extend",
-    0x01BAD: "Extend",
-    0x01BE6: "Extend",
-    0x01BE8: "Extend",
-    0x01BE9: "Extend",
-    0x01BED: "Extend",
-    0x01BEF: "Extend",
-    0x01BF0: "Extend",
-    0x01BF1: "Extend",
-    0x01BF2: "Extend",
-    0x01BF3: "Extend",
-    0x01C2C: "Extend",
-    0x01C2D: "Extend",
-    0x01C2E: "Extend",
-    0x01C2F: "Extend",
-    0x01C30: "Extend",
-    0x01C31: "Extend",
-    0x01C32: "Extend",
-    0x01C33: "Extend",
-    0x01C36: "Extend",
-    0x01C37: "Extend",
-    0x01CD0: "Extend",
-    0x01CD1: "Extend",
-    0x01CD2: "Extend",
-    0x01CD4: "Extend",
-    0x01CD5: "Extend",
-    0x01CD6: "Extend",
-    0x01CD7: "Extend",
-    0x01CD8: "Extend",
-    0x01CD9: "Extend",
-    0x01CDA: "Extend",
-    0x01CDB: "Extend",
-    0x01CDC: "Extend",
-    0x01CDD: "Extend",
-    0x01CDE: "Extend",
-    0x01CDF: "Extend",
-    0x01CE0: "Extend",
-    0x01CE2: "Extend",
-    0x01CE3: "Extend",
-    0x01CE4: "Extend",
-    0x01CE5: "Extend",
-    0x01CE6: "Extend",
-    0x01CE7: "Extend",
-    0x01CE8: "Extend",
-    0x01CED: "Extend",
-    0x01CF4: "Extend",
-    0x01CF8: "Extend",
-    0x01CF9: "Extend",
-    0x01DC0: "Extend",
-    0x01DC1: "Extend",
-    0x01DC2: "Extend",
-    0x01DC3: "Extend",
-    0x01DC4: "Extend",
-    0x01DC5: "Extend",
-    0x01DC6: "Extend",
-    0x01DC7: "Extend",
-    0x01DC8: "Extend",
-    0x01DC9: "Extend",
-    0x01DCA: "Extend",
-    0x01DCB: "Extend",
-    0x01DCC: "Extend",
-    0x01DCD: "Extend",
-    0x01DCE: "Extend",
-    0x01DCF: "Extend",
-    0x01DD0: "Extend",
-    0x01DD1: "Extend",
-    0x01DD2: "Extend",
-    0x01DD3: "Extend",
-    0x01DD4: "Extend",
-    0x01DD5: "Extend",
-    0x01DD6: "Extend",
-    0x01DD7: "Extend",
-    0x01DD8: "Extend",
-    0x01DD9: "Extend",
-    0x01DDA: "Extend",
-    0x01DDB: "Extend",
-    0x01DDC: "Extend",
-    0x01DDD: "Extend",
-    0x01DDE: "Extend",
-    0x01DDF: "Extend",
-    0x01DE0: "Extend",
-    0x01DE1: "Extend",
-    0x01DE2: "Extend",
-    0x01DE3: "Extend",
-    0x01DE4: "Extend",
-    0x01DE5: "Extend",
-    0x01DE6: "Extend",
-    0x01DE7: "Extend",
-    0x01DE8: "Extend",
-    0x01DE9: "Extend",
-    0x01DEA: "Extend",
-    0x01DEB: "Extend",
-    0x01DEC: "Extend",
-    0x01DED: "Extend",
-    0x01DEE: "Extend",
-    0x01DEF: "Extend",
-    0x01DF0: "Extend",
-    0x01DF1: "Extend",
-    0x01DF2: "Extend",
-    0x01DF3: "Extend",
-    0x01DF4: "Extend",
-    0x01DF5: "Extend",
-    0x01DF6: "Extend",
-    0x01DF7: "Extend",
-    0x01DF8: "Extend",
-    0x01DF9: "Extend",
-    0x01DFA: "Extend",
-    0x01DFB: "Extend",
-    0x01DFC: "Extend",
-    0x01DFD: "Extend",
-    0x01DFE: "Extend",
-    0x01DFF: "Extend",
-    0x0200C: "Extend",
-    0x020D0: "Extend",
-    0x020D1: "Extend",
-    0x020D2: "Extend",
-    0x020D3: "Extend",
-    0x020D4: "Extend",
-    0x020D5: "Extend",
-    0x020D6: "Extend",
-    0x020D7: "Extend",
-    0x020D8: "Extend",
-    0x020D9: "Extend",
-    0x020DA: "Extend",
-    0x020DB: "Extend",
-    0x020DC: "Extend",
-    0x020DD: "Extend",
-    0x020DE: "Extend",
-    0x020DF: "Extend",
-    0x020E0: "Extend",
-    0x020E1: "Extend",
-    0x020E2: "Extend",
-    0x020E3: "Extend",
-    0x020E4: "Extend",
-    0x020E5: "Extend",
-    0x020E6: "Extend",
-    0x020E7: "Extend",
-    0x020E8: "Extend",
-    0x020E9: "Extend",
-    0x020EA: "Extend",
-    0x020EB: "Extend",
-    0x020EC: "Extend",
-    0x020ED: "Extend",
-    0x020EE: "Extend",
-    0x020EF: "Extend",
-    0x020F0: "Extend",
-    0x02CEF: "Extend",
-    0x02CF0: "Extend",
-    0x02CF1: "Extend",
-    0x02D7F: "Extend",
-    0x02DE0: "Extend",
-    0x02DE1: "Extend",
-    0x02DE2: "Extend",
-    0x02DE3: "Extend",
-    0x02DE4: "Extend",
-    0x02DE5: "Extend",
-    0x02DE6: "Extend",
-    0x02DE7: "Extend",
-    0x02DE8: "Extend",
-    0x02DE9: "Extend",
-    0x02DEA: "Extend",
-    0x02DEB: "Extend",
-    0x02DEC: "Extend",
-    0x02DED: "Extend",
-    0x02DEE: "Extend",
-    0x02DEF: "Extend",
-    0x02DF0: "Extend",
-    0x02DF1: "Extend",
-    0x02DF2: "Extend",
-    0x02DF3: "Extend",
-    0x02DF4: "Extend",
-    0x02DF5: "Extend",
-    0x02DF6: "Extend",
-    0x02DF7: "Extend",
-    0x02DF8: "Extend",
-    0x02DF9: "Extend",
-    0x02DFA: "Extend",
-    0x02DFB: "Extend",
-    0x02DFC: "Extend",
-    0x02DFD: "Extend",
-    0x02DFE: "Extend",
-    0x02DFF: "Extend",
-    0x0302A: "Extend",
-    0x0302B: "Extend",
-    0x0302C: "Extend",
-    0x0302D: "Extend",
-    0x0302E: "Extend",
-    0x0302F: "Extend",
-    0x03099: "Extend",
-    0x0309A: "Extend",
-    0x0A66F: "Extend",
-    0x0A670: "Extend",
-    0x0A671: "Extend",
-    0x0A672: "Extend",
-    0x0A674: "Extend",
-    0x0A675: "Extend",
-    0x0A676: "Extend",
-    0x0A677: "Extend",
-    0x0A678: "Extend",
-    0x0A679: "Extend",
-    0x0A67A: "Extend",
-    0x0A67B: "Extend",
-    0x0A67C: "Extend",
-    0x0A67D: "Extend",
-    0x0A69E: "Extend",
-    0x0A69F: "Extend",
-    0x0A6F0: "Extend",
-    0x0A6F1: "Extend",
-    0x0A802: "Extend",
-    0x0A806: "Extend",
-    0x0A80B: "Extend",
-    0x0A825: "Extend",
-    0x0A826: "Extend",
-    0x0A82C: "Extend",
-    0x0A8C4: "Extend",
-    0x0A8C5: "Extend",
-    0x0A8E0: "Extend",
-    0x0A8E1: "Extend",
-    0x0A8E2: "Extend",
-    0x0A8E3: "Extend",
-    0x0A8E4: "Extend",
-    0x0A8E5: "Extend",
-    0x0A8E6: "Extend",
-    0x0A8E7: "Extend",
-    0x0A8E8: "Extend",
-    0x0A8E9: "Extend",
-    0x0A8EA: "Extend",
-    0x0A8EB: "Extend",
-    0x0A8EC: "Extend",
-    0x0A8ED: "Extend",
-    0x0A8EE: "Extend",
-    0x0A8EF: "Extend",
-    0x0A8F0: "Extend",
-    0x0A8F1: "Extend",
-    0x0A8FF: "Extend",
-    0x0A926: "Extend",
-    0x0A927: "Extend",
-    0x0A928: "Extend",
-    0x0A929: "Extend",
-    0x0A92A: "Extend",
-    0x0A92B: "Extend",
-    0x0A92C: "Extend",
-    0x0A92D: "Extend",
-    0x0A947: "Extend",
-    0x0A948: "Extend",
-    0x0A949: "Extend",
-    0x0A94A: "Extend",
-    0x0A94B: "Extend",
-    0x0A94C: "Extend",
-    0x0A94D: "Extend",
-    0x0A94E: "Extend",
-    0x0A94F: "Extend",
-    0x0A950: "Extend",
-    0x0A951: "Extend",
-    0x0A953: "Extend",
-    0x0A980: "Extend",
-    0x0A981: "Extend",
-    0x0A982: "Extend",
-    0x0A9B3: "Extend",
-    0x0A9B6: "Extend",
-    0x0A9B7: "Extend",
-    0x0A9B8: "Extend",
-    0x0A9B9: "Extend",
-    0x0A9BC: "Extend",
-    0x0A9BD: "Extend",
-    0x0A9C0: "Extend",
-    0x0A9E5: "Extend",
-    0x0AA29: "Extend",
-    0x0AA2A: "Extend",
-    0x0AA2B: "Extend",
-    0x0AA2C: "Extend",
-    0x0AA2D: "Extend",
-    0x0AA2E: "Extend",
-    0x0AA31: "Extend",
-    0x0AA32: "Extend",
-    0x0AA35: "Extend",
-    0x0AA36: "Extend",
-    0x0AA43: "Extend",
-    0x0AA4C: "Extend",
-    0x0AA7C: "Extend",
-    0x0AAB0: "Extend",
-    0x0AAB2: "Extend",
-    0x0AAB3: "Extend",
-    0x0AAB4: "Extend",
-    0x0AAB7: "Extend",
-    0x0AAB8: "Extend",
-    0x0AABE: "Extend",
-    0x0AABF: "Extend",
-    0x0AAC1: "Extend",
-    0x0AAEC: "Extend",
-    0x0AAED: "Extend",
-    0x0AAF6: "Extend",
-    0x0ABE5: "Extend",
-    0x0ABE8: "Extend",
-    0x0ABED: "Extend",
-    0x0FB1E: "Extend",
-    0x0FE00: "Extend",
-    0x0FE01: "Extend",
-    0x0FE02: "Extend",
-    0x0FE03: "Extend",
-    0x0FE04: "Extend",
-    0x0FE05: "Extend",
-    0x0FE06: "Extend",
-    0x0FE07: "Extend",
-    0x0FE08: "Extend",
-    0x0FE09: "Extend",
-    0x0FE0A: "Extend",
-    0x0FE0B: "Extend",
-    0x0FE0C: "Extend",
-    0x0FE0D: "Extend",
-    0x0FE0E: "Extend",
-    0x0FE0F: "Extend",
-    0x0FE20: "Extend",
-    0x0FE21: "Extend",
-    0x0FE22: "Extend",
-    0x0FE23: "Extend",
-    0x0FE24: "Extend",
-    0x0FE25: "Extend",
-    0x0FE26: "Extend",
-    0x0FE27: "Extend",
-    0x0FE28: "Extend",
-    0x0FE29: "Extend",
-    0x0FE2A: "Extend",
-    0x0FE2B: "Extend",
-    0x0FE2C: "Extend",
-    0x0FE2D: "Extend",
-    0x0FE2E: "Extend",
-    0x0FE2F: "Extend",
-    0x0FF9E: "Extend",
-    0x0FF9F: "Extend",
-    0x101FD: "Extend",
-    0x102E0: "Extend",
-    0x10376: "Extend",
-    0x10377: "Extend",
-    0x10378: "Extend",
-    0x10379: "Extend",
-    0x1037A: "Extend",
-    0x10A01: "Extend",
-    0x10A02: "Extend",
-    0x10A03: "Extend",
-    0x10A05: "Extend",
-    0x10A06: "Extend",
-    0x10A0C: "Extend",
-    0x10A0D: "Extend",
-    0x10A0E: "Extend",
-    0x10A0F: "Extend",
-    0x10A38: "Extend",
-    0x10A39: "Extend",
-    0x10A3A: "Extend",
-    0x10A3F: "Extend",
-    0x10AE5: "Extend",
-    0x10AE6: "Extend",
-    0x10D24: "Extend",
-    0x10D25: "Extend",
-    0x10D26: "Extend",
-    0x10D27: "Extend",
-    0x10D69: "Extend",
-    0x10D6A: "Extend",
-    0x10D6B: "Extend",
-    0x10D6C: "Extend",
-    0x10D6D: "Extend",
-    0x10EAB: "Extend",
-    0x10EAC: "Extend",
-    0x10EFC: "Extend",
-    0x10EFD: "Extend",
-    0x10EFE: "Extend",
-    0x10EFF: "Extend",
-    0x10F46: "Extend",
-    0x10F47: "Extend",
-    0x10F48: "Extend",
-    0x10F49: "Extend",
-    0x10F4A: "Extend",
-    0x10F4B: "Extend",
-    0x10F4C: "Extend",
-    0x10F4D: "Extend",
-    0x10F4E: "Extend",
-    0x10F4F: "Extend",
-    0x10F50: "Extend",
-    0x10F82: "Extend",
-    0x10F83: "Extend",
-    0x10F84: "Extend",
-    0x10F85: "Extend",
-    0x11001: "Extend",
-    0x11038: "Extend",
-    0x11039: "Extend",
-    0x1103A: "Extend",
-    0x1103B: "Extend",
-    0x1103C: "Extend",
-    0x1103D: "Extend",
-    0x1103E: "Extend",
-    0x1103F: "Extend",
-    0x11040: "Extend",
-    0x11041: "Extend",
-    0x11042: "Extend",
-    0x11043: "Extend",
-    0x11044: "Extend",
-    0x11045: "Extend",
-    0x11046: "Extend",
-    0x11070: "Extend",
-    0x11073: "Extend",
-    0x11074: "Extend",
-    0x1107F: "Extend",
-    0x11080: "Extend",
-    0x11081: "Extend",
-    0x110B3: "Extend",
-    0x110B4: "Extend",
-    0x110B5: "Extend",
-    0x110B6: "Extend",
-    0x110B9: "Extend",
-    0x110BA: "Extend",
-    0x110C2: "Extend",
-    0x11100: "Extend",
-    0x11101: "Extend",
-    0x11102: "Extend",
-    0x11127: "Extend",
-    0x11128: "Extend",
-    0x11129: "Extend",
-    0x1112A: "Extend",
-    0x1112B: "Extend",
-    0x1112D: "Extend",
-    0x1112E: "Extend",
-    0x1112F: "Extend",
-    0x11130: "Extend",
-    0x11131: "Extend",
-    0x11132: "Extend",
-    0x11133: "Extend",
-    0x11134: "Extend",
-    0x11173: "Extend",
-    0x11180: "Extend",
-    0x11181: "Extend",
-    0x111B6: "Extend",
-    0x111B7: "Extend",
-    0x111B8: "Extend",
-    0x111B9: "Extend",
-    0x111BA: "Extend",
-    0x111BB: "Extend",
-    0x111BC: "Extend",
-    0x111BD: "Extend",
-    0x111BE: "Extend",
-    0x111C0: "Extend",
-    0x111C9: "Extend",
-    0x111CA: "Extend",
-    0x111CB: "Extend",
-    0x111CC: "Extend",
-    0x111CF: "Extend",
-    0x1122F: "Extend",
-    0x11230: "Extend",
-    0x11231: "Extend",
-    0x11234: "Extend",
-    0x11235: "Extend",
-    0x11236: "Extend",
-    0x11237: "Extend",
-    0x1123E: "Extend",
-    0x11241: "Extend",
-    0x112DF: "Extend",
-    0x112E3: "Extend",
-    0x112E4: "Extend",
-    0x112E5: "Extend",
-    0x112E6: "Extend",
-    0x112E7: "Extend",
-    0x112E8: "Extend",
-    0x112E9: "Extend",
-    0x112EA: "Extend",
-    0x11300: "Extend",
-    0x11301: "Extend",
-    0x1133B: "Extend",
-    0x1133C: "Extend",
-    0x1133E: "Extend",
-    0x11340: "Extend",
-    0x1134D: "Extend",
-    0x11357: "Extend",
-    0x11366: "Extend",
-    0x11367: "Extend",
-    0x11368: "Extend",
-    0x11369: "Extend",
-    0x1136A: "Extend",
-    0x1136B: "Extend",
-    0x1136C: "Extend",
-    0x11370: "Extend",
-    0x11371: "Extend",
-    0x11372: "Extend",
-    0x11373: "Extend",
-    0x11374: "Extend",
-    0x113B8: "Extend",
-    0x113BB: "Extend",
-    0x113BC: "Extend",
-    0x113BD: "Extend",
-    0x113BE: "Extend",
-    0x113BF: "Extend",
-    0x113C0: "Extend",
-    0x113C2: "Extend",
-    0x113C5: "Extend",
-    0x113C7: "Extend",
-    0x113C8: "Extend",
-    0x113C9: "Extend",
-    0x113CE: "Extend",
-    0x113CF: "Extend",
-    0x113D0: "Extend",
-    0x113D2: "Extend",
-    0x113E1: "Extend",
-    0x113E2: "Extend",
-    0x11438: "Extend",
-    0x11439: "Extend",
-    0x1143A: "Extend",
-    0x1143B: "Extend",
-    0x1143C: "Extend",
-    0x1143D: "Extend",
-    0x1143E: "Extend",
-    0x1143F: "Extend",
-    0x11442: "Extend",
-    0x11443: "Extend",
-    0x11444: "Extend",
-    0x11446: "Extend",
-    0x1145E: "Extend",
-    0x114B0: "Extend",
-    0x114B3: "Extend",
-    0x114B4: "Extend",
-    0x114B5: "Extend",
-    0x114B6: "Extend",
-    0x114B7: "Extend",
-    0x114B8: "Extend",
-    0x114BA: "Extend",
-    0x114BD: "Extend",
-    0x114BF: "Extend",
-    0x114C0: "Extend",
-    0x114C2: "Extend",
-    0x114C3: "Extend",
-    0x115AF: "Extend",
-    0x115B2: "Extend",
-    0x115B3: "Extend",
-    0x115B4: "Extend",
-    0x115B5: "Extend",
-    0x115BC: "Extend",
-    0x115BD: "Extend",
-    0x115BF: "Extend",
-    0x115C0: "Extend",
-    0x115DC: "Extend",
-    0x115DD: "Extend",
-    0x11633: "Extend",
-    0x11634: "Extend",
-    0x11635: "Extend",
-    0x11636: "Extend",
-    0x11637: "Extend",
-    0x11638: "Extend",
-    0x11639: "Extend",
-    0x1163A: "Extend",
-    0x1163D: "Extend",
-    0x1163F: "Extend",
-    0x11640: "Extend",
-    0x116AB: "Extend",
-    0x116AD: "Extend",
-    0x116B0: "Extend",
-    0x116B1: "Extend",
-    0x116B2: "Extend",
-    0x116B3: "Extend",
-    0x116B4: "Extend",
-    0x116B5: "Extend",
-    0x116B6: "Extend",
-    0x116B7: "Extend",
-    0x1171D: "Extend",
-    0x1171F: "Extend",
-    0x11722: "Extend",
-    0x11723: "Extend",
-    0x11724: "Extend",
-    0x11725: "Extend",
-    0x11727: "Extend",
-    0x11728: "Extend",
-    0x11729: "Extend",
-    0x1172A: "Extend",
-    0x1172B: "Extend",
-    0x1182F: "Extend",
-    0x11830: "Extend",
-    0x11831: "Extend",
-    0x11832: "Extend",
-    0x11833: "Extend",
-    0x11834: "Extend",
-    0x11835: "Extend",
-    0x11836: "Extend",
-    0x11837: "Extend",
-    0x11839: "Extend",
-    0x1183A: "Extend",
-    0x11930: "Extend",
-    0x1193B: "Extend",
-    0x1193C: "Extend",
-    0x1193D: "Extend",
-    0x1193E: "Extend",
-    0x11943: "Extend",
-    0x119D4: "Extend",
-    0x119D5: "Extend",
-    0x119D6: "Extend",
-    0x119D7: "Extend",
-    0x119DA: "Extend",
-    0x119DB: "Extend",
-    0x119E0: "Extend",
-    0x11A01: "Extend",
-    0x11A02: "Extend",
-    0x11A03: "Extend",
-    0x11A04: "Extend",
-    0x11A05: "Extend",
-    0x11A06: "Extend",
-    0x11A07: "Extend",
-    0x11A08: "Extend",
-    0x11A09: "Extend",
-    0x11A0A: "Extend",
-    0x11A33: "Extend",
-    0x11A34: "Extend",
-    0x11A35: "Extend",
-    0x11A36: "Extend",
-    0x11A37: "Extend",
-    0x11A38: "Extend",
-    0x11A3B: "Extend",
-    0x11A3C: "Extend",
-    0x11A3D: "Extend",
-    0x11A3E: "Extend",
-    0x11A47: "Extend",
-    0x11A51: "Extend",
-    0x11A52: "Extend",
-    0x11A53: "Extend",
-    0x11A54: "Extend",
-    0x11A55: "Extend",
-    0x11A56: "Extend",
-    0x11A59: "Extend",
-    0x11A5A: "Extend",
-    0x11A5B: "Extend",
-    0x11A8A: "Extend",
-    0x11A8B: "Extend",
-    0x11A8C: "Extend",
-    0x11A8D: "Extend",
-    0x11A8E: "Extend",
-    0x11A8F: "Extend",
-    0x11A90: "Extend",
-    0x11A91: "Extend",
-    0x11A92: "Extend",
-    0x11A93: "Extend",
-    0x11A94: "Extend",
-    0x11A95: "Extend",
-    0x11A96: "Extend",
-    0x11A98: "Extend",
-    0x11A99: "Extend",
-    0x11C30: "Extend",
-    0x11C31: "Extend",
-    0x11C32: "Extend",
-    0x11C33: "Extend",
-    0x11C34: "Extend",
-    0x11C35: "Extend",
-    0x11C36: "Extend",
-    0x11C38: "Extend",
-    0x11C39: "Extend",
-    0x11C3A: "Extend",
-    0x11C3B: "Extend",
-    0x11C3C: "Extend",
-    0x11C3D: "Extend",
-    0x11C3F: "Extend",
-    0x11C92: "Extend",
-    0x11C93: "Extend",
-    0x11C94: "Extend",
-    0x11C95: "Extend",
-    0x11C96: "Extend",
-    0x11C97: "Extend",
-    0x11C98: "Extend",
-    0x11C99: "Extend",
-    0x11C9A: "Extend",
-    0x11C9B: "Extend",
-    0x11C9C: "Extend",
-    0x11C9D: "Extend",
-    0x11C9E: "Extend",
-    0x11C9F: "Extend",
-    0x11CA0: "Extend",
-    0x11CA1: "Extend",
-    0x11CA2: "Extend",
-    0x11CA3: "Extend",
-    0x11CA4: "Extend",
-    0x11CA5: "Extend",
-    0x11CA6: "Extend",
-    0x11CA7: "Extend",
-    0x11CAA: "Extend",
-    0x11CAB: "Extend",
-    0x11CAC: "Extend",
-    0x11CAD: "Extend",
-    0x11CAE: "Extend",
-    0x11CAF: "Extend",
-    0x11CB0: "Extend",
-    0x11CB2: "Extend",
-    0x11CB3: "Extend",
-    0x11CB5: "Extend",
-    0x11CB6: "Extend",
-    0x11D31: "Extend",
-    0x11D32: "Extend",
-    0x11D33: "Extend",
-    0x11D34: "Extend",
-    0x11D35: "Extend",
-    0x11D36: "Extend",
-    0x11D3A: "Extend",
-    0x11D3C: "Extend",
-    0x11D3D: "Extend",
-    0x11D3F: "Extend",
-    0x11D40: "Extend",
-    0x11D41: "Extend",
-    0x11D42: "Extend",
-    0x11D43: "Extend",
-    0x11D44: "Extend",
-    0x11D45: "Extend",
-    0x11D47: "Extend",
-    0x11D90: "Extend",
-    0x11D91: "Extend",
-    0x11D95: "Extend",
-    0x11D97: "Extend",
-    0x11EF3: "Extend",
-    0x11EF4: "Extend",
-    0x11F00: "Extend",
-    0x11F01: "Extend",
-    0x11F36: "Extend",
-    0x11F37: "Extend",
-    0x11F38: "Extend",
-    0x11F39: "Extend",
-    0x11F3A: "Extend",
-    0x11F40: "Extend",
-    0x11F41: "Extend",
-    0x11F42: "Extend",
-    0x11F5A: "Extend",
-    0x13440: "Extend",
-    0x13447: "Extend",
-    0x13448: "Extend",
-    0x13449: "Extend",
-    0x1344A: "Extend",
-    0x1344B: "Extend",
-    0x1344C: "Extend",
-    0x1344D: "Extend",
-    0x1344E: "Extend",
-    0x1344F: "Extend",
-    0x13450: "Extend",
-    0x13451: "Extend",
-    0x13452: "Extend",
-    0x13453: "Extend",
-    0x13454: "Extend",
-    0x13455: "Extend",
-    0x1611E: "Extend",
-    0x1611F: "Extend",
-    0x16120: "Extend",
-    0x16121: "Extend",
-    0x16122: "Extend",
-    0x16123: "Extend",
-    0x16124: "Extend",
-    0x16125: "Extend",
-    0x16126: "Extend",
-    0x16127: "Extend",
-    0x16128: "Extend",
-    0x16129: "Extend",
-    0x1612D: "Extend",
-    0x1612E: "Extend",
-    0x1612F: "Extend",
-    0x16AF0: "Extend",
-    0x16AF1: "Extend",
-    0x16AF2: "Extend",
-    0x16AF3: "Extend",
-    0x16AF4: "Extend",
-    0x16B30: "Extend",
-    0x16B31: "Extend",
-    0x16B32: "Extend",
-    0x16B33: "Extend",
-    0x16B34: "Extend",
-    0x16B35: "Extend",
-    0x16B36: "Extend",
-    0x16F4F: "Extend",
-    0x16F8F: "Extend",
-    0x16F90: "Extend",
-    0x16F91: "Extend",
-    0x16F92: "Extend",
-    0x16FE4: "Extend",
-    0x16FF0: "Extend",
-    0x16FF1: "Extend",
-    0x1BC9D: "Extend",
-    0x1BC9E: "Extend",
-    0x1CF00: "Extend",
-    0x1CF01: "Extend",
-    0x1CF02: "Extend",
-    0x1CF03: "Extend",
-    0x1CF04: "Extend",
-    0x1CF05: "Extend",
-    0x1CF06: "Extend",
-    0x1CF07: "Extend",
-    0x1CF08: "Extend",
-    0x1CF09: "Extend",
-    0x1CF0A: "Extend",
-    0x1CF0B: "Extend",
-    0x1CF0C: "Extend",
-    0x1CF0D: "Extend",
-    0x1CF0E: "Extend",
-    0x1CF0F: "Extend",
-    0x1CF10: "Extend",
-    0x1CF11: "Extend",
-    0x1CF12: "Extend",
-    0x1CF13: "Extend",
-    0x1CF14: "Extend",
-    0x1CF15: "Extend",
-    0x1CF16: "Extend",
-    0x1CF17: "Extend",
-    0x1CF18: "Extend",
-    0x1CF19: "Extend",
-    0x1CF1A: "Extend",
-    0x1CF1B: "Extend",
-    0x1CF1C: "Extend",
-    0x1CF1D: "Extend",
-    0x1CF1E: "Extend",
-    0x1CF1F: "Extend",
-    0x1CF20: "Extend",
-    0x1CF21: "Extend",
-    0x1CF22: "Extend",
-    0x1CF23: "Extend",
-    0x1CF24: "Extend",
-    0x1CF25: "Extend",
-    0x1CF26: "Extend",
-    0x1CF27: "Extend",
-    0x1CF28: "Extend",
-    0x1CF29: "Extend",
-    0x1CF2A: "Extend",
-    0x1CF2B: "Extend",
-    0x1CF2C: "Extend",
-    0x1CF2D: "Extend",
-    0x1CF30: "Extend",
-    0x1CF31: "Extend",
-    0x1CF32: "Extend",
-    0x1CF33: "Extend",
-    0x1CF34: "Extend",
-    0x1CF35: "Extend",
-    0x1CF36: "Extend",
-    0x1CF37: "Extend",
-    0x1CF38: "Extend",
-    0x1CF39: "Extend",
-    0x1CF3A: "Extend",
-    0x1CF3B: "Extend",
-    0x1CF3C: "Extend",
-    0x1CF3D: "Extend",
-    0x1CF3E: "Extend",
-    0x1CF3F: "Extend",
-    0x1CF40: "Extend",
-    0x1CF41: "Extend",
-    0x1CF42: "Extend",
-    0x1CF43: "Extend",
-    0x1CF44: "Extend",
-    0x1CF45: "Extend",
-    0x1CF46: "Extend",
-    0x1D165: "Extend",
-    0x1D166: "Extend",
-    0x1D167: "Extend",
-    0x1D168: "Extend",
-    0x1D169: "Extend",
-    0x1D16D: "Extend",
-    0x1D16E: "Extend",
-    0x1D16F: "Extend",
-    0x1D170: "Extend",
-    0x1D171: "Extend",
-    0x1D172: "Extend",
-    0x1D17B: "Extend",
-    0x1D17C: "Extend",
-    0x1D17D: "Extend",
-    0x1D17E: "Extend",
-    0x1D17F: "Extend",
-    0x1D180: "Extend",
-    0x1D181: "Extend",
-    0x1D182: "Extend",
-    0x1D185: "Extend",
-    0x1D186: "Extend",
-    0x1D187: "Extend",
-    0x1D188: "Extend",
-    0x1D189: "Extend",
-    0x1D18A: "Extend",
-    0x1D18B: "Extend",
-    0x1D1AA: "Extend",
-    0x1D1AB: "Extend",
-    0x1D1AC: "Extend",
-    0x1D1AD: "Extend",
-    0x1D242: "Extend",
-    0x1D243: "Extend",
-    0x1D244: "Extend",
-    0x1DA00: "Extend",
-    0x1DA01: "Extend",
-    0x1DA02: "Extend",
-    0x1DA03: "Extend",
-    0x1DA04: "Extend",
-    0x1DA05: "Extend",
-    0x1DA06: "Extend",
-    0x1DA07: "Extend",
-    0x1DA08: "Extend",
-    0x1DA09: "Extend",
-    0x1DA0A: "Extend",
-    0x1DA0B: "Extend",
-    0x1DA0C: "Extend",
-    0x1DA0D: "Extend",
-    0x1DA0E: "Extend",
-    0x1DA0F: "Extend",
-    0x1DA10: "Extend",
-    0x1DA11: "Extend",
-    0x1DA12: "Extend",
-    0x1DA13: "Extend",
-    0x1DA14: "Extend",
-    0x1DA15: "Extend",
-    0x1DA16: "Extend",
-    0x1DA17: "Extend",
-    0x1DA18: "Extend",
-    0x1DA19: "Extend",
-    0x1DA1A: "Extend",
-    0x1DA1B: "Extend",
-    0x1DA1C: "Extend",
-    0x1DA1D: "Extend",
-    0x1DA1E: "Extend",
-    0x1DA1F: "Extend",
-    0x1DA20: "Extend",
-    0x1DA21: "Extend",
-    0x1DA22: "Extend",
-    0x1DA23: "Extend",
-    0x1DA24: "Extend",
-    0x1DA25: "Extend",
-    0x1DA26: "Extend",
-    0x1DA27: "Extend",
-    0x1DA28: "Extend",
-    0x1DA29: "Extend",
-    0x1DA2A: "Extend",
-    0x1DA2B: "Extend",
-    0x1DA2C: "Extend",
-    0x1DA2D: "Extend",
-    0x1DA2E: "Extend",
-    0x1DA2F: "Extend",
-    0x1DA30: "Extend",
-    0x1DA31: "Extend",
-    0x1DA32: "Extend",
-    0x1DA33: "Extend",
-    0x1DA34: "Extend",
-    0x1DA35: "Extend",
-    0x1DA36: "Extend",
-    0x1DA3B: "Extend",
-    0x1DA3C: "Extend",
-    0x1DA3D: "Extend",
-    0x1DA3E: "Extend",
-    0x1DA3F: "Extend",
-    0x1DA40: "Extend",
-    0x1DA41: "Extend",
-    0x1DA42: "Extend",
-    0x1DA43: "Extend",
-    0x1DA44: "Extend",
-    0x1DA45: "Extend",
-    0x1DA46: "Extend",
-    0x1DA47: "Extend",
-    0x1DA48: "Extend",
-    0x1DA49: "Extend",
-    0x1DA4A: "Extend",
-    0x1DA4B: "Extend",
-    0x1DA4C: "Extend",
-    0x1DA4D: "Extend",
-    0x1DA4E: "Extend",
-    0x1DA4F: "Extend",
-    0x1DA50: "Extend",
-    0x1DA51: "Extend",
-    0x1DA52: "Extend",
-    0x1DA53: "Extend",
-    0x1DA54: "Extend",
-    0x1DA55: "Extend",
-    0x1DA56: "Extend",
-    0x1DA57: "Extend",
-    0x1DA58: "Extend",
-    0x1DA59: "Extend",
-    0x1DA5A: "Extend",
-    0x1DA5B: "Extend",
-    0x1DA5C: "Extend",
-    0x1DA5D: "Extend",
-    0x1DA5E: "Extend",
-    0x1DA5F: "Extend",
-    0x1DA60: "Extend",
-    0x1DA61: "Extend",
-    0x1DA62: "Extend",
-    0x1DA63: "Extend",
-    0x1DA64: "Extend",
-    0x1DA65: "Extend",
-    0x1DA66: "Extend",
-    0x1DA67: "Extend",
-    0x1DA68: "Extend",
-    0x1DA69: "Extend",
-    0x1DA6A: "Extend",
-    0x1DA6B: "Extend",
-    0x1DA6C: "Extend",
-    0x1DA75: "Extend",
-    0x1DA84: "Extend",
-    0x1DA9B: "Extend",
-    0x1DA9C: "Extend",
-    0x1DA9D: "Extend",
-    0x1DA9E: "Extend",
-    0x1DA9F: "Extend",
-    0x1DAA1: "Extend",
-    0x1DAA2: "Extend",
-    0x1DAA3: "Extend",
-    0x1DAA4: "Extend",
-    0x1DAA5: "Extend",
-    0x1DAA6: "Extend",
-    0x1DAA7: "Extend",
-    0x1DAA8: "Extend",
-    0x1DAA9: "Extend",
-    0x1DAAA: "Extend",
-    0x1DAAB: "Extend",
-    0x1DAAC: "Extend",
-    0x1DAAD: "Extend",
-    0x1DAAE: "Extend",
-    0x1DAAF: "Extend",
-    0x1E000: "Extend",
-    0x1E001: "Extend",
-    0x1E002: "Extend",
-    0x1E003: "Extend",
-    0x1E004: "Extend",
-    0x1E005: "Extend",
-    0x1E006: "Extend",
-    0x1E008: "Extend",
-    0x1E009: "Extend",
-    0x1E00A: "Extend",
-    0x1E00B: "Extend",
-    0x1E00C: "Extend",
-    0x1E00D: "Extend",
-    0x1E00E: "Extend",
-    0x1E00F: "Extend",
-    0x1E010: "Extend",
-    0x1E011: "Extend",
-    0x1E012: "Extend",
-    0x1E013: "Extend",
-    0x1E014: "Extend",
-    0x1E015: "Extend",
-    0x1E016: "Extend",
-    0x1E017: "Extend",
-    0x1E018: "Extend",
-    0x1E01B: "Extend",
-    0x1E01C: "Extend",
-    0x1E01D: "Extend",
-    0x1E01E: "Extend",
-    0x1E01F: "Extend",
-    0x1E020: "Extend",
-    0x1E021: "Extend",
-    0x1E023: "Extend",
-    0x1E024: "Extend",
-    0x1E026: "Extend",
-    0x1E027: "Extend",
-    0x1E028: "Extend",
-    0x1E029: "Extend",
-    0x1E02A: "Extend",
-    0x1E08F: "Extend",
-    0x1E130: "Extend",
-    0x1E131: "Extend",
-    0x1E132: "Extend",
-    0x1E133: "Extend",
-    0x1E134: "Extend",
-    0x1E135: "Extend",
-    0x1E136: "Extend",
-    0x1E2AE: "Extend",
-    0x1E2EC: "Extend",
-    0x1E2ED: "Extend",
-    0x1E2EE: "Extend",
-    0x1E2EF: "Extend",
-    0x1E4EC: "Extend",
-    0x1E4ED: "Extend",
-    0x1E4EE: "Extend",
-    0x1E4EF: "Extend",
-    0x1E5EE: "Extend",
-    0x1E5EF: "Extend",
-    0x1E8D0: "Extend",
-    0x1E8D1: "Extend",
-    0x1E8D2: "Extend",
-    0x1E8D3: "Extend",
-    0x1E8D4: "Extend",
-    0x1E8D5: "Extend",
-    0x1E8D6: "Extend",
-    0x1E944: "Extend",
-    0x1E945: "Extend",
-    0x1E946: "Extend",
-    0x1E947: "Extend",
-    0x1E948: "Extend",
-    0x1E949: "Extend",
-    0x1E94A: "Extend",
-    0x1F3FB: "Extend",
-    0x1F3FC: "Extend",
-    0x1F3FD: "Extend",
-    0x1F3FE: "Extend",
-    0x1F3FF: "Extend",
-    0xE0020: "Extend",
-    0xE0021: "Extend",
-    0xE0022: "Extend",
-    0xE0023: "Extend",
-    0xE0024: "Extend",
-    0xE0025: "Extend",
-    0xE0026: "Extend",
-    0xE0027: "Extend",
-    0xE0028: "Extend",
-    0xE0029: "Extend",
-    0xE002A: "Extend",
-    0xE002B: "Extend",
-    0xE002C: "Extend",
-    0xE002D: "Extend",
-    0xE002E: "Extend",
-    0xE002F: "Extend",
-    0xE0030: "Extend",
-    0xE0031: "Extend",
-    0xE0032: "Extend",
-    0xE0033: "Extend",
-    0xE0034: "Extend",
-    0xE0035: "Extend",
-    0xE0036: "Extend",
-    0xE0037: "Extend",
-    0xE0038: "Extend",
-    0xE0039: "Extend",
-    0xE003A: "Extend",
-    0xE003B: "Extend",
-    0xE003C: "Extend",
-    0xE003D: "Extend",
-    0xE003E: "Extend",
-    0xE003F: "Extend",
-    0xE0040: "Extend",
-    0xE0041: "Extend",
-    0xE0042: "Extend",
-    0xE0043: "Extend",
-    0xE0044: "Extend",
-    0xE0045: "Extend",
-    0xE0046: "Extend",
-    0xE0047: "Extend",
-    0xE0048: "Extend",
-    0xE0049: "Extend",
-    0xE004A: "Extend",
-    0xE004B: "Extend",
-    0xE004C: "Extend",
-    0xE004D: "Extend",
-    0xE004E: "Extend",
-    0xE004F: "Extend",
-    0xE0050: "Extend",
-    0xE0051: "Extend",
-    0xE0052: "Extend",
-    0xE0053: "Extend",
-    0xE0054: "Extend",
-    0xE0055: "Extend",
-    0xE0056: "Extend",
-    0xE0057: "Extend",
-    0xE0058: "Extend",
-    0xE0059: "Extend",
-    0xE005A: "Extend",
-    0xE005B: "Extend",
-    0xE005C: "Extend",
-    0xE005D: "Extend",
-    0xE005E: "Extend",
-    0xE005F: "Extend",
-    0xE0060: "Extend",
-    0xE0061: "Extend",
-    0xE0062: "Extend",
-    0xE0063: "Extend",
-    0xE0064: "Extend",
-    0xE0065: "Extend",
-    0xE0066: "Extend",
-    0xE0067: "Extend",
-    0xE0068: "Extend",
-    0xE0069: "Extend",
-    0xE006A: "Extend",
-    0xE006B: "Extend",
-    0xE006C: "Extend",
-    0xE006D: "Extend",
-    0xE006E: "Extend",
-    0xE006F: "Extend",
-    0xE0070: "Extend",
-    0xE0071: "Extend",
-    0xE0072: "Extend",
-    0xE0073: "Extend",
-    0xE0074: "Extend",
-    0xE0075: "Extend",
-    0xE0076: "Extend",
-    0xE0077: "Extend",
-    0xE0078: "Extend",
-    0xE0079: "Extend",
-    0xE007A: "Extend",
-    0xE007B: "Extend",
-    0xE007C: "Extend",
-    0xE007D: "Extend",
-    0xE007E: "Extend",
-    0xE007F: "Extend",
-    0xE0100: "Extend",
-    0xE0101: "Extend",
-    0xE0102: "Extend",
-    0xE0103: "Extend",
-    0xE0104: "Extend",
-    0xE0105: "Extend",
-    0xE0106: "Extend",
-    0xE0107: "Extend",
-    0xE0108: "Extend",
-    0xE0109: "Extend",
-    0xE010A: "Extend",
-    0xE010B: "Extend",
-    0xE010C: "Extend",
-    0xE010D: "Extend",
-    0xE010E: "Extend",
-    0xE010F: "Extend",
-    0xE0110: "Extend",
-    0xE0111: "Extend",
-    0xE0112: "Extend",
-    0xE0113: "Extend",
-    0xE0114: "Extend",
-    0xE0115: "Extend",
-    0xE0116: "Extend",
-    0xE0117: "Extend",
-    0xE0118: "Extend",
-    0xE0119: "Extend",
-    0xE011A: "Extend",
-    0xE011B: "Extend",
-    0xE011C: "Extend",
-    0xE011D: "Extend",
-    0xE011E: "Extend",
-    0xE011F: "Extend",
-    0xE0120: "Extend",
-    0xE0121: "Extend",
-    0xE0122: "Extend",
-    0xE0123: "Extend",
-    0xE0124: "Extend",
-    0xE0125: "Extend",
-    0xE0126: "Extend",
-    0xE0127: "Extend",
-    0xE0128: "Extend",
-    0xE0129: "Extend",
-    0xE012A: "Extend",
-    0xE012B: "Extend",
-    0xE012C: "Extend",
-    0xE012D: "Extend",
-    0xE012E: "Extend",
-    0xE012F: "Extend",
-    0xE0130: "Extend",
-    0xE0131: "Extend",
-    0xE0132: "Extend",
-    0xE0133: "Extend",
-    0xE0134: "Extend",
-    0xE0135: "Extend",
-    0xE0136: "Extend",
-    0xE0137: "Extend",
-    0xE0138: "Extend",
-    0xE0139: "Extend",
-    0xE013A: "Extend",
-    0xE013B: "Extend",
-    0xE013C: "Extend",
-    0xE013D: "Extend",
-    0xE013E: "Extend",
-    0xE013F: "Extend",
-    0xE0140: "Extend",
-    0xE0141: "Extend",
-    0xE0142: "Extend",
-    0xE0143: "Extend",
-    0xE0144: "Extend",
-    0xE0145: "Extend",
-    0xE0146: "Extend",
-    0xE0147: "Extend",
-    0xE0148: "Extend",
-    0xE0149: "Extend",
-    0xE014A: "Extend",
-    0xE014B: "Extend",
-    0xE014C: "Extend",
-    0xE014D: "Extend",
-    0xE014E: "Extend",
-    0xE014F: "Extend",
-    0xE0150: "Extend",
-    0xE0151: "Extend",
-    0xE0152: "Extend",
-    0xE0153: "Extend",
-    0xE0154: "Extend",
-    0xE0155: "Extend",
-    0xE0156: "Extend",
-    0xE0157: "Extend",
-    0xE0158: "Extend",
-    0xE0159: "Extend",
-    0xE015A: "Extend",
-    0xE015B: "Extend",
-    0xE015C: "Extend",
-    0xE015D: "Extend",
-    0xE015E: "Extend",
-    0xE015F: "Extend",
-    0xE0160: "Extend",
-    0xE0161: "Extend",
-    0xE0162: "Extend",
-    0xE0163: "Extend",
-    0xE0164: "Extend",
-    0xE0165: "Extend",
-    0xE0166: "Extend",
-    0xE0167: "Extend",
-    0xE0168: "Extend",
-    0xE0169: "Extend",
-    0xE016A: "Extend",
-    0xE016B: "Extend",
-    0xE016C: "Extend",
-    0xE016D: "Extend",
-    0xE016E: "Extend",
-    0xE016F: "Extend",
-    0xE0170: "Extend",
-    0xE0171: "Extend",
-    0xE0172: "Extend",
-    0xE0173: "Extend",
-    0xE0174: "Extend",
-    0xE0175: "Extend",
-    0xE0176: "Extend",
-    0xE0177: "Extend",
-    0xE0178: "Extend",
-    0xE0179: "Extend",
-    0xE017A: "Extend",
-    0xE017B: "Extend",
-    0xE017C: "Extend",
-    0xE017D: "Extend",
-    0xE017E: "Extend",
-    0xE017F: "Extend",
-    0xE0180: "Extend",
-    0xE0181: "Extend",
-    0xE0182: "Extend",
-    0xE0183: "Extend",
-    0xE0184: "Extend",
-    0xE0185: "Extend",
-    0xE0186: "Extend",
-    0xE0187: "Extend",
-    0xE0188: "Extend",
-    0xE0189: "Extend",
-    0xE018A: "Extend",
-    0xE018B: "Extend",
-    0xE018C: "Extend",
-    0xE018D: "Extend",
-    0xE018E: "Extend",
-    0xE018F: "Extend",
-    0xE0190: "Extend",
-    0xE0191: "Extend",
-    0xE0192: "Extend",
-    0xE0193: "Extend",
-    0xE0194: "Extend",
-    0xE0195: "Extend",
-    0xE0196: "Extend",
-    0xE0197: "Extend",
-    0xE0198: "Extend",
-    0xE0199: "Extend",
-    0xE019A: "Extend",
-    0xE019B: "Extend",
-    0xE019C: "Extend",
-    0xE019D: "Extend",
-    0xE019E: "Extend",
-    0xE019F: "Extend",
-    0xE01A0: "Extend",
-    0xE01A1: "Extend",
-    0xE01A2: "Extend",
-    0xE01A3: "Extend",
-    0xE01A4: "Extend",
-    0xE01A5: "Extend",
-    0xE01A6: "Extend",
-    0xE01A7: "Extend",
-    0xE01A8: "Extend",
-    0xE01A9: "Extend",
-    0xE01AA: "Extend",
-    0xE01AB: "Extend",
-    0xE01AC: "Extend",
-    0xE01AD: "Extend",
-    0xE01AE: "Extend",
-    0xE01AF: "Extend",
-    0xE01B0: "Extend",
-    0xE01B1: "Extend",
-    0xE01B2: "Extend",
-    0xE01B3: "Extend",
-    0xE01B4: "Extend",
-    0xE01B5: "Extend",
-    0xE01B6: "Extend",
-    0xE01B7: "Extend",
-    0xE01B8: "Extend",
-    0xE01B9: "Extend",
-    0xE01BA: "Extend",
-    0xE01BB: "Extend",
-    0xE01BC: "Extend",
-    0xE01BD: "Extend",
-    0xE01BE: "Extend",
-    0xE01BF: "Extend",
-    0xE01C0: "Extend",
-    0xE01C1: "Extend",
-    0xE01C2: "Extend",
-    0xE01C3: "Extend",
-    0xE01C4: "Extend",
-    0xE01C5: "Extend",
-    0xE01C6: "Extend",
-    0xE01C7: "Extend",
-    0xE01C8: "Extend",
-    0xE01C9: "Extend",
-    0xE01CA: "Extend",
-    0xE01CB: "Extend",
-    0xE01CC: "Extend",
-    0xE01CD: "Extend",
-    0xE01CE: "Extend",
-    0xE01CF: "Extend",
-    0xE01D0: "Extend",
-    0xE01D1: "Extend",
-    0xE01D2: "Extend",
-    0xE01D3: "Extend",
-    0xE01D4: "Extend",
-    0xE01D5: "Extend",
-    0xE01D6: "Extend",
-    0xE01D7: "Extend",
-    0xE01D8: "Extend",
-    0xE01D9: "Extend",
-    0xE01DA: "Extend",
-    0xE01DB: "Extend",
-    0xE01DC: "Extend",
-    0xE01DD: "Extend",
-    0xE01DE: "Extend",
-    0xE01DF: "Extend",
-    0xE01E0: "Extend",
-    0xE01E1: "Extend",
-    0xE01E2: "Extend",
-    0xE01E3: "Extend",
-    0xE01E4: "Extend",
-    0xE01E5: "Extend",
-    0xE01E6: "Extend",
-    0xE01E7: "Extend",
-    0xE01E8: "Extend",
-    0xE01E9: "Extend",
-    0xE01EA: "Extend",
-    0xE01EB: "Extend",
-    0xE01EC: "Extend",
-    0xE01ED: "Extend",
-    0xE01EE: "Extend",
-    0xE01EF: "Extend",
-    0x1F1E6: "Regional_Indicator",
-    0x1F1E7: "Regional_Indicator",
-    0x1F1E8: "Regional_Indicator",
-    0x1F1E9: "Regional_Indicator",
-    0x1F1EA: "Regional_Indicator",
-    0x1F1EB: "Regional_Indicator",
-    0x1F1EC: "Regional_Indicator",
-    0x1F1ED: "Regional_Indicator",
-    0x1F1EE: "Regional_Indicator",
-    0x1F1EF: "Regional_Indicator",
-    0x1F1F0: "Regional_Indicator",
-    0x1F1F1: "Regional_Indicator",
-    0x1F1F2: "Regional_Indicator",
-    0x1F1F3: "Regional_Indicator",
-    0x1F1F4: "Regional_Indicator",
-    0x1F1F5: "Regional_Indicator",
-    0x1F1F6: "Regional_Indicator",
-    0x1F1F7: "Regional_Indicator",
-    0x1F1F8: "Regional_Indicator",
-    0x1F1F9: "Regional_Indicator",
-    0x1F1FA: "Regional_Indicator",
-    0x1F1FB: "Regional_Indicator",
-    0x1F1FC: "Regional_Indicator",
-    0x1F1FD: "Regional_Indicator",
-    0x1F1FE: "Regional_Indicator",
-    0x1F1FF: "Regional_Indicator",
-    0x00903: "SpacingMark",
-    0x0093B: "SpacingMark",
-    0x0093E: "SpacingMark",
-    0x0093F: "SpacingMark",
-    0x00940: "SpacingMark",
-    0x00949: "SpacingMark",
-    0x0094A: "SpacingMark",
-    0x0094B: "SpacingMark",
-    0x0094C: "SpacingMark",
-    0x0094E: "SpacingMark",
-    0x0094F: "SpacingMark",
-    0x00982: "SpacingMark",
-    0x00983: "SpacingMark",
-    0x009BF: "SpacingMark",
-    0x009C0: "SpacingMark",
-    0x009C7: "SpacingMark",
-    0x009C8: "SpacingMark",
-    0x009CB: "SpacingMark",
-    0x009CC: "SpacingMark",
-    0x00A03: "SpacingMark",
-    0x00A3E: "SpacingMark",
-    0x00A3F: "SpacingMark",
-    0x00A40: "SpacingMark",
-    0x00A83: "SpacingMark",
-    0x00ABE: "SpacingMark",
-    0x00ABF: "SpacingMark",
-    0x00AC0: "SpacingMark",
-    0x00AC9: "SpacingMark",
-    0x00ACB: "SpacingMark",
-    0x00ACC: "SpacingMark",
-    0x00B02: "SpacingMark",
-    0x00B03: "SpacingMark",
-    0x00B40: "SpacingMark",
-    0x00B47: "SpacingMark",
-    0x00B48: "SpacingMark",
-    0x00B4B: "SpacingMark",
-    0x00B4C: "SpacingMark",
-    0x00BBF: "SpacingMark",
-    0x00BC1: "SpacingMark",
-    0x00BC2: "SpacingMark",
-    0x00BC6: "SpacingMark",
-    0x00BC7: "SpacingMark",
-    0x00BC8: "SpacingMark",
-    0x00BCA: "SpacingMark",
-    0x00BCB: "SpacingMark",
-    0x00BCC: "SpacingMark",
-    0x00C01: "SpacingMark",
-    0x00C02: "SpacingMark",
-    0x00C03: "SpacingMark",
-    0x00C41: "SpacingMark",
-    0x00C42: "SpacingMark",
-    0x00C43: "SpacingMark",
-    0x00C44: "SpacingMark",
-    0x00C82: "SpacingMark",
-    0x00C83: "SpacingMark",
-    0x00CBE: "SpacingMark",
-    0x00CC1: "SpacingMark",
-    0x00CC3: "SpacingMark",
-    0x00CC4: "SpacingMark",
-    0x00CF3: "SpacingMark",
-    0x00D02: "SpacingMark",
-    0x00D03: "SpacingMark",
-    0x00D3F: "SpacingMark",
-    0x00D40: "SpacingMark",
-    0x00D46: "SpacingMark",
-    0x00D47: "SpacingMark",
-    0x00D48: "SpacingMark",
-    0x00D4A: "SpacingMark",
-    0x00D4B: "SpacingMark",
-    0x00D4C: "SpacingMark",
-    0x00D82: "SpacingMark",
-    0x00D83: "SpacingMark",
-    0x00DD0: "SpacingMark",
-    0x00DD1: "SpacingMark",
-    0x00DD8: "SpacingMark",
-    0x00DD9: "SpacingMark",
-    0x00DDA: "SpacingMark",
-    0x00DDB: "SpacingMark",
-    0x00DDC: "SpacingMark",
-    0x00DDD: "SpacingMark",
-    0x00DDE: "SpacingMark",
-    0x00DF2: "SpacingMark",
-    0x00DF3: "SpacingMark",
-    0x00E33: "SpacingMark",
-    0x00EB3: "SpacingMark",
-    0x00F3E: "SpacingMark",
-    0x00F3F: "SpacingMark",
-    0x00F7F: "SpacingMark",
-    0x01031: "SpacingMark",
-    0x0103B: "SpacingMark",
-    0x0103C: "SpacingMark",
-    0x01056: "SpacingMark",
-    0x01057: "SpacingMark",
-    0x01084: "SpacingMark",
-    0x017B6: "SpacingMark",
-    0x017BE: "SpacingMark",
-    0x017BF: "SpacingMark",
-    0x017C0: "SpacingMark",
-    0x017C1: "SpacingMark",
-    0x017C2: "SpacingMark",
-    0x017C3: "SpacingMark",
-    0x017C4: "SpacingMark",
-    0x017C5: "SpacingMark",
-    0x017C7: "SpacingMark",
-    0x017C8: "SpacingMark",
-    0x01923: "SpacingMark",
-    0x01924: "SpacingMark",
-    0x01925: "SpacingMark",
-    0x01926: "SpacingMark",
-    0x01929: "SpacingMark",
-    0x0192A: "SpacingMark",
-    0x0192B: "SpacingMark",
-    0x01930: "SpacingMark",
-    0x01931: "SpacingMark",
-    0x01933: "SpacingMark",
-    0x01934: "SpacingMark",
-    0x01935: "SpacingMark",
-    0x01936: "SpacingMark",
-    0x01937: "SpacingMark",
-    0x01938: "SpacingMark",
-    0x01A19: "SpacingMark",
-    0x01A1A: "SpacingMark",
-    0x01A55: "SpacingMark",
-    0x01A57: "SpacingMark",
-    0x01A6D: "SpacingMark",
-    0x01A6E: "SpacingMark",
-    0x01A6F: "SpacingMark",
-    0x01A70: "SpacingMark",
-    0x01A71: "SpacingMark",
-    0x01A72: "SpacingMark",
-    0x01B04: "SpacingMark",
-    0x01B3E: "SpacingMark",
-    0x01B3F: "SpacingMark",
-    0x01B40: "SpacingMark",
-    0x01B41: "SpacingMark",
-    0x01B82: "SpacingMark",
-    0x01BA1: "SpacingMark",
-    0x01BA6: "SpacingMark",
-    0x01BA7: "SpacingMark",
-    0x01BE7: "SpacingMark",
-    0x01BEA: "SpacingMark",
-    0x01BEB: "SpacingMark",
-    0x01BEC: "SpacingMark",
-    0x01BEE: "SpacingMark",
-    0x01C24: "SpacingMark",
-    0x01C25: "SpacingMark",
-    0x01C26: "SpacingMark",
-    0x01C27: "SpacingMark",
-    0x01C28: "SpacingMark",
-    0x01C29: "SpacingMark",
-    0x01C2A: "SpacingMark",
-    0x01C2B: "SpacingMark",
-    0x01C34: "SpacingMark",
-    0x01C35: "SpacingMark",
-    0x01CE1: "SpacingMark",
-    0x01CF7: "SpacingMark",
-    0x0A823: "SpacingMark",
-    0x0A824: "SpacingMark",
-    0x0A827: "SpacingMark",
-    0x0A880: "SpacingMark",
-    0x0A881: "SpacingMark",
-    0x0A8B4: "SpacingMark",
-    0x0A8B5: "SpacingMark",
-    0x0A8B6: "SpacingMark",
-    0x0A8B7: "SpacingMark",
-    0x0A8B8: "SpacingMark",
-    0x0A8B9: "SpacingMark",
-    0x0A8BA: "SpacingMark",
-    0x0A8BB: "SpacingMark",
-    0x0A8BC: "SpacingMark",
-    0x0A8BD: "SpacingMark",
-    0x0A8BE: "SpacingMark",
-    0x0A8BF: "SpacingMark",
-    0x0A8C0: "SpacingMark",
-    0x0A8C1: "SpacingMark",
-    0x0A8C2: "SpacingMark",
-    0x0A8C3: "SpacingMark",
-    0x0A952: "SpacingMark",
-    0x0A983: "SpacingMark",
-    0x0A9B4: "SpacingMark",
-    0x0A9B5: "SpacingMark",
-    0x0A9BA: "SpacingMark",
-    0x0A9BB: "SpacingMark",
-    0x0A9BE: "SpacingMark",
-    0x0A9BF: "SpacingMark",
-    0x0AA2F: "SpacingMark",
-    0x0AA30: "SpacingMark",
-    0x0AA33: "SpacingMark",
-    0x0AA34: "SpacingMark",
-    0x0AA4D: "SpacingMark",
-    0x0AAEB: "SpacingMark",
-    0x0AAEE: "SpacingMark",
-    0x0AAEF: "SpacingMark",
-    0x0AAF5: "SpacingMark",
-    0x0ABE3: "SpacingMark",
-    0x0ABE4: "SpacingMark",
-    0x0ABE6: "SpacingMark",
-    0x0ABE7: "SpacingMark",
-    0x0ABE9: "SpacingMark",
-    0x0ABEA: "SpacingMark",
-    0x0ABEC: "SpacingMark",
-    0x11000: "SpacingMark",
-    0x11002: "SpacingMark",
-    0x11082: "SpacingMark",
-    0x110B0: "SpacingMark",
-    0x110B1: "SpacingMark",
-    0x110B2: "SpacingMark",
-    0x110B7: "SpacingMark",
-    0x110B8: "SpacingMark",
-    0x1112C: "SpacingMark",
-    0x11145: "SpacingMark",
-    0x11146: "SpacingMark",
-    0x11182: "SpacingMark",
-    0x111B3: "SpacingMark",
-    0x111B4: "SpacingMark",
-    0x111B5: "SpacingMark",
-    0x111BF: "SpacingMark",
-    0x111CE: "SpacingMark",
-    0x1122C: "SpacingMark",
-    0x1122D: "SpacingMark",
-    0x1122E: "SpacingMark",
-    0x11232: "SpacingMark",
-    0x11233: "SpacingMark",
-    0x112E0: "SpacingMark",
-    0x112E1: "SpacingMark",
-    0x112E2: "SpacingMark",
-    0x11302: "SpacingMark",
-    0x11303: "SpacingMark",
-    0x1133F: "SpacingMark",
-    0x11341: "SpacingMark",
-    0x11342: "SpacingMark",
-    0x11343: "SpacingMark",
-    0x11344: "SpacingMark",
-    0x11347: "SpacingMark",
-    0x11348: "SpacingMark",
-    0x1134B: "SpacingMark",
-    0x1134C: "SpacingMark",
-    0x11362: "SpacingMark",
-    0x11363: "SpacingMark",
-    0x113B9: "SpacingMark",
-    0x113BA: "SpacingMark",
-    0x113CA: "SpacingMark",
-    0x113CC: "SpacingMark",
-    0x113CD: "SpacingMark",
-    0x11435: "SpacingMark",
-    0x11436: "SpacingMark",
-    0x11437: "SpacingMark",
-    0x11440: "SpacingMark",
-    0x11441: "SpacingMark",
-    0x11445: "SpacingMark",
-    0x114B1: "SpacingMark",
-    0x114B2: "SpacingMark",
-    0x114B9: "SpacingMark",
-    0x114BB: "SpacingMark",
-    0x114BC: "SpacingMark",
-    0x114BE: "SpacingMark",
-    0x114C1: "SpacingMark",
-    0x115B0: "SpacingMark",
-    0x115B1: "SpacingMark",
-    0x115B8: "SpacingMark",
-    0x115B9: "SpacingMark",
-    0x115BA: "SpacingMark",
-    0x115BB: "SpacingMark",
-    0x115BE: "SpacingMark",
-    0x11630: "SpacingMark",
-    0x11631: "SpacingMark",
-    0x11632: "SpacingMark",
-    0x1163B: "SpacingMark",
-    0x1163C: "SpacingMark",
-    0x1163E: "SpacingMark",
-    0x116AC: "SpacingMark",
-    0x116AE: "SpacingMark",
-    0x116AF: "SpacingMark",
-    0x1171E: "SpacingMark",
-    0x11726: "SpacingMark",
-    0x1182C: "SpacingMark",
-    0x1182D: "SpacingMark",
-    0x1182E: "SpacingMark",
-    0x11838: "SpacingMark",
-    0x11931: "SpacingMark",
-    0x11932: "SpacingMark",
-    0x11933: "SpacingMark",
-    0x11934: "SpacingMark",
-    0x11935: "SpacingMark",
-    0x11937: "SpacingMark",
-    0x11938: "SpacingMark",
-    0x11940: "SpacingMark",
-    0x11942: "SpacingMark",
-    0x119D1: "SpacingMark",
-    0x119D2: "SpacingMark",
-    0x119D3: "SpacingMark",
-    0x119DC: "SpacingMark",
-    0x119DD: "SpacingMark",
-    0x119DE: "SpacingMark",
-    0x119DF: "SpacingMark",
-    0x119E4: "SpacingMark",
-    0x11A39: "SpacingMark",
-    0x11A57: "SpacingMark",
-    0x11A58: "SpacingMark",
-    0x11A97: "SpacingMark",
-    0x11C2F: "SpacingMark",
-    0x11C3E: "SpacingMark",
-    0x11CA9: "SpacingMark",
-    0x11CB1: "SpacingMark",
-    0x11CB4: "SpacingMark",
-    0x11D8A: "SpacingMark",
-    0x11D8B: "SpacingMark",
-    0x11D8C: "SpacingMark",
-    0x11D8D: "SpacingMark",
-    0x11D8E: "SpacingMark",
-    0x11D93: "SpacingMark",
-    0x11D94: "SpacingMark",
-    0x11D96: "SpacingMark",
-    0x11EF5: "SpacingMark",
-    0x11EF6: "SpacingMark",
-    0x11F03: "SpacingMark",
-    0x11F34: "SpacingMark",
-    0x11F35: "SpacingMark",
-    0x11F3E: "SpacingMark",
-    0x11F3F: "SpacingMark",
-    0x1612A: "SpacingMark",
-    0x1612B: "SpacingMark",
-    0x1612C: "SpacingMark",
-    0x16F51: "SpacingMark",
-    0x16F52: "SpacingMark",
-    0x16F53: "SpacingMark",
-    0x16F54: "SpacingMark",
-    0x16F55: "SpacingMark",
-    0x16F56: "SpacingMark",
-    0x16F57: "SpacingMark",
-    0x16F58: "SpacingMark",
-    0x16F59: "SpacingMark",
-    0x16F5A: "SpacingMark",
-    0x16F5B: "SpacingMark",
-    0x16F5C: "SpacingMark",
-    0x16F5D: "SpacingMark",
-    0x16F5E: "SpacingMark",
-    0x16F5F: "SpacingMark",
-    0x16F60: "SpacingMark",
-    0x16F61: "SpacingMark",
-    0x16F62: "SpacingMark",
-    0x16F63: "SpacingMark",
-    0x16F64: "SpacingMark",
-    0x16F65: "SpacingMark",
-    0x16F66: "SpacingMark",
-    0x16F67: "SpacingMark",
-    0x16F68: "SpacingMark",
-    0x16F69: "SpacingMark",
-    0x16F6A: "SpacingMark",
-    0x16F6B: "SpacingMark",
-    0x16F6C: "SpacingMark",
-    0x16F6D: "SpacingMark",
-    0x16F6E: "SpacingMark",
-    0x16F6F: "SpacingMark",
-    0x16F70: "SpacingMark",
-    0x16F71: "SpacingMark",
-    0x16F72: "SpacingMark",
-    0x16F73: "SpacingMark",
-    0x16F74: "SpacingMark",
-    0x16F75: "SpacingMark",
-    0x16F76: "SpacingMark",
-    0x16F77: "SpacingMark",
-    0x16F78: "SpacingMark",
-    0x16F79: "SpacingMark",
-    0x16F7A: "SpacingMark",
-    0x16F7B: "SpacingMark",
-    0x16F7C: "SpacingMark",
-    0x16F7D: "SpacingMark",
-    0x16F7E: "SpacingMark",
-    0x16F7F: "SpacingMark",
-    0x16F80: "SpacingMark",
-    0x16F81: "SpacingMark",
-    0x16F82: "SpacingMark",
-    0x16F83: "SpacingMark",
-    0x16F84: "SpacingMark",
-    0x16F85: "SpacingMark",
-    0x16F86: "SpacingMark",
-    0x16F87: "SpacingMark",
-    0x01100: "L",
-    0x01101: "L",
-    0x01102: "L",
-    0x01103: "L",
-    0x01104: "L",
-    0x01105: "L",
-    0x01106: "L",
-    0x01107: "L",
-    0x01108: "L",
-    0x01109: "L",
-    0x0110A: "L",
-    0x0110B: "L",
-    0x0110C: "L",
-    0x0110D: "L",
-    0x0110E: "L",
-    0x0110F: "L",
-    0x01110: "L",
-    0x01111: "L",
-    0x01112: "L",
-    0x01113: "L",
-    0x01114: "L",
-    0x01115: "L",
-    0x01116: "L",
-    0x01117: "L",
-    0x01118: "L",
-    0x01119: "L",
-    0x0111A: "L",
-    0x0111B: "L",
-    0x0111C: "L",
-    0x0111D: "L",
-    0x0111E: "L",
-    0x0111F: "L",
-    0x01120: "L",
-    0x01121: "L",
-    0x01122: "L",
-    0x01123: "L",
-    0x01124: "L",
-    0x01125: "L",
-    0x01126: "L",
-    0x01127: "L",
-    0x01128: "L",
-    0x01129: "L",
-    0x0112A: "L",
-    0x0112B: "L",
-    0x0112C: "L",
-    0x0112D: "L",
-    0x0112E: "L",
-    0x0112F: "L",
-    0x01130: "L",
-    0x01131: "L",
-    0x01132: "L",
-    0x01133: "L",
-    0x01134: "L",
-    0x01135: "L",
-    0x01136: "L",
-    0x01137: "L",
-    0x01138: "L",
-    0x01139: "L",
-    0x0113A: "L",
-    0x0113B: "L",
-    0x0113C: "L",
-    0x0113D: "L",
-    0x0113E: "L",
-    0x0113F: "L",
-    0x01140: "L",
-    0x01141: "L",
-    0x01142: "L",
-    0x01143: "L",
-    0x01144: "L",
-    0x01145: "L",
-    0x01146: "L",
-    0x01147: "L",
-    0x01148: "L",
-    0x01149: "L",
-    0x0114A: "L",
-    0x0114B: "L",
-    0x0114C: "L",
-    0x0114D: "L",
-    0x0114E: "L",
-    0x0114F: "L",
-    0x01150: "L",
-    0x01151: "L",
-    0x01152: "L",
-    0x01153: "L",
-    0x01154: "L",
-    0x01155: "L",
-    0x01156: "L",
-    0x01157: "L",
-    0x01158: "L",
-    0x01159: "L",
-    0x0115A: "L",
-    0x0115B: "L",
-    0x0115C: "L",
-    0x0115D: "L",
-    0x0115E: "L",
-    0x0115F: "L",
-    0x0A960: "L",
-    0x0A961: "L",
-    0x0A962: "L",
-    0x0A963: "L",
-    0x0A964: "L",
-    0x0A965: "L",
-    0x0A966: "L",
-    0x0A967: "L",
-    0x0A968: "L",
-    0x0A969: "L",
-    0x0A96A: "L",
-    0x0A96B: "L",
-    0x0A96C: "L",
-    0x0A96D: "L",
-    0x0A96E: "L",
-    0x0A96F: "L",
-    0x0A970: "L",
-    0x0A971: "L",
-    0x0A972: "L",
-    0x0A973: "L",
-    0x0A974: "L",
-    0x0A975: "L",
-    0x0A976: "L",
-    0x0A977: "L",
-    0x0A978: "L",
-    0x0A979: "L",
-    0x0A97A: "L",
-    0x0A97B: "L",
-    0x0A97C: "L",
-    0x01160: "V",
-    0x01161: "V",
-    0x01162: "V",
-    0x01163: "V",
-    0x01164: "V",
-    0x01165: "V",
-    0x01166: "V",
-    0x01167: "V",
-    0x01168: "V",
-    0x01169: "V",
-    0x0116A: "V",
-    0x0116B: "V",
-    0x0116C: "V",
-    0x0116D: "V",
-    0x0116E: "V",
-    0x0116F: "V",
-    0x01170: "V",
-    0x01171: "V",
-    0x01172: "V",
-    0x01173: "V",
-    0x01174: "V",
-    0x01175: "V",
-    0x01176: "V",
-    0x01177: "V",
-    0x01178: "V",
-    0x01179: "V",
-    0x0117A: "V",
-    0x0117B: "V",
-    0x0117C: "V",
-    0x0117D: "V",
-    0x0117E: "V",
-    0x0117F: "V",
-    0x01180: "V",
-    0x01181: "V",
-    0x01182: "V",
-    0x01183: "V",
-    0x01184: "V",
-    0x01185: "V",
-    0x01186: "V",
-    0x01187: "V",
-    0x01188: "V",
-    0x01189: "V",
-    0x0118A: "V",
-    0x0118B: "V",
-    0x0118C: "V",
-    0x0118D: "V",
-    0x0118E: "V",
-    0x0118F: "V",
-    0x01190: "V",
-    0x01191: "V",
-    0x01192: "V",
-    0x01193: "V",
-    0x01194: "V",
-    0x01195: "V",
-    0x01196: "V",
-    0x01197: "V",
-    0x01198: "V",
-    0x01199: "V",
-    0x0119A: "V",
-    0x0119B: "V",
-    0x0119C: "V",
-    0x0119D: "V",
-    0x0119E: "V",
-    0x0119F: "V",
-    0x011A0: "V",
-    0x011A1: "V",
-    0x011A2: "V",
-    0x011A3: "V",
-    0x011A4: "V",
-    0x011A5: "V",
-    0x011A6: "V",
-    0x011A7: "V",
-    0x0D7B0: "V",
-    0x0D7B1: "V",
-    0x0D7B2: "V",
-    0x0D7B3: "V",
-    0x0D7B4: "V",
-    0x0D7B5: "V",
-    0x0D7B6: "V",
-    0x0D7B7: "V",
-    0x0D7B8: "V",
-    0x0D7B9: "V",
-    0x0D7BA: "V",
-    0x0D7BB: "V",
-    0x0D7BC: "V",
-    0x0D7BD: "V",
-    0x0D7BE: "V",
-    0x0D7BF: "V",
-    0x0D7C0: "V",
-    0x0D7C1: "V",
-    0x0D7C2: "V",
-    0x0D7C3: "V",
-    0x0D7C4: "V",
-    0x0D7C5: "V",
-    0x0D7C6: "V",
-    0x16D63: "V",
-    0x16D67: "V",
-    0x16D68: "V",
-    0x16D69: "V",
-    0x16D6A: "V",
-    0x011A8: "T",
-    0x011A9: "T",
-    0x011AA: "T",
-    0x011AB: "T",
-    0x011AC: "T",
-    0x011AD: "T",
-    0x011AE: "T",
-    0x011AF: "T",
-    0x011B0: "T",
-    0x011B1: "T",
-    0x011B2: "T",
-    0x011B3: "T",
-    0x011B4: "T",
-    0x011B5: "T",
-    0x011B6: "T",
-    0x011B7: "T",
-    0x011B8: "T",
-    0x011B9: "T",
-    0x011BA: "T",
-    0x011BB: "T",
-    0x011BC: "T",
-    0x011BD: "T",
-    0x011BE: "T",
-    0x011BF: "T",
-    0x011C0: "T",
-    0x011C1: "T",
-    0x011C2: "T",
-    0x011C3: "T",
-    0x011C4: "T",
-    0x011C5: "T",
-    0x011C6: "T",
-    0x011C7: "T",
-    0x011C8: "T",
-    0x011C9: "T",
-    0x011CA: "T",
-    0x011CB: "T",
-    0x011CC: "T",
-    0x011CD: "T",
-    0x011CE: "T",
-    0x011CF: "T",
-    0x011D0: "T",
-    0x011D1: "T",
-    0x011D2: "T",
-    0x011D3: "T",
-    0x011D4: "T",
-    0x011D5: "T",
-    0x011D6: "T",
-    0x011D7: "T",
-    0x011D8: "T",
-    0x011D9: "T",
-    0x011DA: "T",
-    0x011DB: "T",
-    0x011DC: "T",
-    0x011DD: "T",
-    0x011DE: "T",
-    0x011DF: "T",
-    0x011E0: "T",
-    0x011E1: "T",
-    0x011E2: "T",
-    0x011E3: "T",
-    0x011E4: "T",
-    0x011E5: "T",
-    0x011E6: "T",
-    0x011E7: "T",
-    0x011E8: "T",
-    0x011E9: "T",
-    0x011EA: "T",
-    0x011EB: "T",
-    0x011EC: "T",
-    0x011ED: "T",
-    0x011EE: "T",
-    0x011EF: "T",
-    0x011F0: "T",
-    0x011F1: "T",
-    0x011F2: "T",
-    0x011F3: "T",
-    0x011F4: "T",
-    0x011F5: "T",
-    0x011F6: "T",
-    0x011F7: "T",
-    0x011F8: "T",
-    0x011F9: "T",
-    0x011FA: "T",
-    0x011FB: "T",
-    0x011FC: "T",
-    0x011FD: "T",
-    0x011FE: "T",
-    0x011FF: "T",
-    0x0D7CB: "T",
-    0x0D7CC: "T",
-    0x0D7CD: "T",
-    0x0D7CE: "T",
-    0x0D7CF: "T",
-    0x0D7D0: "T",
-    0x0D7D1: "T",
-    0x0D7D2: "T",
-    0x0D7D3: "T",
-    0x0D7D4: "T",
-    0x0D7D5: "T",
-    0x0D7D6: "T",
-    0x0D7D7: "T",
-    0x0D7D8: "T",
-    0x0D7D9: "T",
-    0x0D7DA: "T",
-    0x0D7DB: "T",
-    0x0D7DC: "T",
-    0x0D7DD: "T",
-    0x0D7DE: "T",
-    0x0D7DF: "T",
-    0x0D7E0: "T",
-    0x0D7E1: "T",
-    0x0D7E2: "T",
-    0x0D7E3: "T",
-    0x0D7E4: "T",
-    0x0D7E5: "T",
-    0x0D7E6: "T",
-    0x0D7E7: "T",
-    0x0D7E8: "T",
-    0x0D7E9: "T",
-    0x0D7EA: "T",
-    0x0D7EB: "T",
-    0x0D7EC: "T",
-    0x0D7ED: "T",
-    0x0D7EE: "T",
-    0x0D7EF: "T",
-    0x0D7F0: "T",
-    0x0D7F1: "T",
-    0x0D7F2: "T",
-    0x0D7F3: "T",
-    0x0D7F4: "T",
-    0x0D7F5: "T",
-    0x0D7F6: "T",
-    0x0D7F7: "T",
-    0x0D7F8: "T",
-    0x0D7F9: "T",
-    0x0D7FA: "T",
-    0x0D7FB: "T",
-    0x0AC00: "LV",
-    0x0AC1C: "LV",
-    0x0AC38: "LV",
-    0x0AC54: "LV",
-    0x0AC70: "LV",
-    0x0AC8C: "LV",
-    0x0ACA8: "LV",
-    0x0ACC4: "LV",
-    0x0ACE0: "LV",
-    0x0ACFC: "LV",
-    0x0AD18: "LV",
-    0x0AD34: "LV",
-    0x0AD50: "LV",
-    0x0AD6C: "LV",
-    0x0AD88: "LV",
-    0x0ADA4: "LV",
-    0x0ADC0: "LV",
-    0x0ADDC: "LV",
-    0x0ADF8: "LV",
-    0x0AE14: "LV",
-    0x0AE30: "LV",
-    0x0AE4C: "LV",
-    0x0AE68: "LV",
-    0x0AE84: "LV",
-    0x0AEA0: "LV",
-    0x0AEBC: "LV",
-    0x0AED8: "LV",
-    0x0AEF4: "LV",
-    0x0AF10: "LV",
-    0x0AF2C: "LV",
-    0x0AF48: "LV",
-    0x0AF64: "LV",
-    0x0AF80: "LV",
-    0x0AF9C: "LV",
-    0x0AFB8: "LV",
-    0x0AFD4: "LV",
-    0x0AFF0: "LV",
-    0x0B00C: "LV",
-    0x0B028: "LV",
-    0x0B044: "LV",
-    0x0B060: "LV",
-    0x0B07C: "LV",
-    0x0B098: "LV",
-    0x0B0B4: "LV",
-    0x0B0D0: "LV",
-    0x0B0EC: "LV",
-    0x0B108: "LV",
-    0x0B124: "LV",
-    0x0B140: "LV",
-    0x0B15C: "LV",
-    0x0B178: "LV",
-    0x0B194: "LV",
-    0x0B1B0: "LV",
-    0x0B1CC: "LV",
-    0x0B1E8: "LV",
-    0x0B204: "LV",
-    0x0B220: "LV",
-    0x0B23C: "LV",
-    0x0B258: "LV",
-    0x0B274: "LV",
-    0x0B290: "LV",
-    0x0B2AC: "LV",
-    0x0B2C8: "LV",
-    0x0B2E4: "LV",
-    0x0B300: "LV",
-    0x0B31C: "LV",
-    0x0B338: "LV",
-    0x0B354: "LV",
-    0x0B370: "LV",
-    0x0B38C: "LV",
-    0x0B3A8: "LV",
-    0x0B3C4: "LV",
-    0x0B3E0: "LV",
-    0x0B3FC: "LV",
-    0x0B418: "LV",
-    0x0B434: "LV",
-    0x0B450: "LV",
-    0x0B46C: "LV",
-    0x0B488: "LV",
-    0x0B4A4: "LV",
-    0x0B4C0: "LV",
-    0x0B4DC: "LV",
-    0x0B4F8: "LV",
-    0x0B514: "LV",
-    0x0B530: "LV",
-    0x0B54C: "LV",
-    0x0B568: "LV",
-    0x0B584: "LV",
-    0x0B5A0: "LV",
-    0x0B5BC: "LV",
-    0x0B5D8: "LV",
-    0x0B5F4: "LV",
-    0x0B610: "LV",
-    0x0B62C: "LV",
-    0x0B648: "LV",
-    0x0B664: "LV",
-    0x0B680: "LV",
-    0x0B69C: "LV",
-    0x0B6B8: "LV",
-    0x0B6D4: "LV",
-    0x0B6F0: "LV",
-    0x0B70C: "LV",
-    0x0B728: "LV",
-    0x0B744: "LV",
-    0x0B760: "LV",
-    0x0B77C: "LV",
-    0x0B798: "LV",
-    0x0B7B4: "LV",
-    0x0B7D0: "LV",
-    0x0B7EC: "LV",
-    0x0B808: "LV",
-    0x0B824: "LV",
-    0x0B840: "LV",
-    0x0B85C: "LV",
-    0x0B878: "LV",
-    0x0B894: "LV",
-    0x0B8B0: "LV",
-    0x0B8CC: "LV",
-    0x0B8E8: "LV",
-    0x0B904: "LV",
-    0x0B920: "LV",
-    0x0B93C: "LV",
-    0x0B958: "LV",
-    0x0B974: "LV",
-    0x0B990: "LV",
-    0x0B9AC: "LV",
-    0x0B9C8: "LV",
-    0x0B9E4: "LV",
-    0x0BA00: "LV",
-    0x0BA1C: "LV",
-    0x0BA38: "LV",
-    0x0BA54: "LV",
-    0x0BA70: "LV",
-    0x0BA8C: "LV",
-    0x0BAA8: "LV",
-    0x0BAC4: "LV",
-    0x0BAE0: "LV",
-    0x0BAFC: "LV",
-    0x0BB18: "LV",
-    0x0BB34: "LV",
-    0x0BB50: "LV",
-    0x0BB6C: "LV",
-    0x0BB88: "LV",
-    0x0BBA4: "LV",
-    0x0BBC0: "LV",
-    0x0BBDC: "LV",
-    0x0BBF8: "LV",
-    0x0BC14: "LV",
-    0x0BC30: "LV",
-    0x0BC4C: "LV",
-    0x0BC68: "LV",
-    0x0BC84: "LV",
-    0x0BCA0: "LV",
-    0x0BCBC: "LV",
-    0x0BCD8: "LV",
-    0x0BCF4: "LV",
-    0x0BD10: "LV",
-    0x0BD2C: "LV",
-    0x0BD48: "LV",
-    0x0BD64: "LV",
-    0x0BD80: "LV",
-    0x0BD9C: "LV",
-    0x0BDB8: "LV",
-    0x0BDD4: "LV",
-    0x0BDF0: "LV",
-    0x0BE0C: "LV",
-    0x0BE28: "LV",
-    0x0BE44: "LV",
-    0x0BE60: "LV",
-    0x0BE7C: "LV",
-    0x0BE98: "LV",
-    0x0BEB4: "LV",
-    0x0BED0: "LV",
-    0x0BEEC: "LV",
-    0x0BF08: "LV",
-    0x0BF24: "LV",
-    0x0BF40: "LV",
-    0x0BF5C: "LV",
-    0x0BF78: "LV",
-    0x0BF94: "LV",
-    0x0BFB0: "LV",
-    0x0BFCC: "LV",
-    0x0BFE8: "LV",
-    0x0C004: "LV",
-    0x0C020: "LV",
-    0x0C03C: "LV",
-    0x0C058: "LV",
-    0x0C074: "LV",
-    0x0C090: "LV",
-    0x0C0AC: "LV",
-    0x0C0C8: "LV",
-    0x0C0E4: "LV",
-    0x0C100: "LV",
-    0x0C11C: "LV",
-    0x0C138: "LV",
-    0x0C154: "LV",
-    0x0C170: "LV",
-    0x0C18C: "LV",
-    0x0C1A8: "LV",
-    0x0C1C4: "LV",
-    0x0C1E0: "LV",
-    0x0C1FC: "LV",
-    0x0C218: "LV",
-    0x0C234: "LV",
-    0x0C250: "LV",
-    0x0C26C: "LV",
-    0x0C288: "LV",
-    0x0C2A4: "LV",
-    0x0C2C0: "LV",
-    0x0C2DC: "LV",
-    0x0C2F8: "LV",
-    0x0C314: "LV",
-    0x0C330: "LV",
-    0x0C34C: "LV",
-    0x0C368: "LV",
-    0x0C384: "LV",
-    0x0C3A0: "LV",
-    0x0C3BC: "LV",
-    0x0C3D8: "LV",
-    0x0C3F4: "LV",
-    0x0C410: "LV",
-    0x0C42C: "LV",
-    0x0C448: "LV",
-    0x0C464: "LV",
-    0x0C480: "LV",
-    0x0C49C: "LV",
-    0x0C4B8: "LV",
-    0x0C4D4: "LV",
-    0x0C4F0: "LV",
-    0x0C50C: "LV",
-    0x0C528: "LV",
-    0x0C544: "LV",
-    0x0C560: "LV",
-    0x0C57C: "LV",
-    0x0C598: "LV",
-    0x0C5B4: "LV",
-    0x0C5D0: "LV",
-    0x0C5EC: "LV",
-    0x0C608: "LV",
-    0x0C624: "LV",
-    0x0C640: "LV",
-    0x0C65C: "LV",
-    0x0C678: "LV",
-    0x0C694: "LV",
-    0x0C6B0: "LV",
-    0x0C6CC: "LV",
-    0x0C6E8: "LV",
-    0x0C704: "LV",
-    0x0C720: "LV",
-    0x0C73C: "LV",
-    0x0C758: "LV",
-    0x0C774: "LV",
-    0x0C790: "LV",
-    0x0C7AC: "LV",
-    0x0C7C8: "LV",
-    0x0C7E4: "LV",
-    0x0C800: "LV",
-    0x0C81C: "LV",
-    0x0C838: "LV",
-    0x0C854: "LV",
-    0x0C870: "LV",
-    0x0C88C: "LV",
-    0x0C8A8: "LV",
-    0x0C8C4: "LV",
-    0x0C8E0: "LV",
-    0x0C8FC: "LV",
-    0x0C918: "LV",
-    0x0C934: "LV",
-    0x0C950: "LV",
-    0x0C96C: "LV",
-    0x0C988: "LV",
-    0x0C9A4: "LV",
-    0x0C9C0: "LV",
-    0x0C9DC: "LV",
-    0x0C9F8: "LV",
-    0x0CA14: "LV",
-    0x0CA30: "LV",
-    0x0CA4C: "LV",
-    0x0CA68: "LV",
-    0x0CA84: "LV",
-    0x0CAA0: "LV",
-    0x0CABC: "LV",
-    0x0CAD8: "LV",
-    0x0CAF4: "LV",
-    0x0CB10: "LV",
-    0x0CB2C: "LV",
-    0x0CB48: "LV",
-    0x0CB64: "LV",
-    0x0CB80: "LV",
-    0x0CB9C: "LV",
-    0x0CBB8: "LV",
-    0x0CBD4: "LV",
-    0x0CBF0: "LV",
-    0x0CC0C: "LV",
-    0x0CC28: "LV",
-    0x0CC44: "LV",
-    0x0CC60: "LV",
-    0x0CC7C: "LV",
-    0x0CC98: "LV",
-    0x0CCB4: "LV",
-    0x0CCD0: "LV",
-    0x0CCEC: "LV",
-    0x0CD08: "LV",
-    0x0CD24: "LV",
-    0x0CD40: "LV",
-    0x0CD5C: "LV",
-    0x0CD78: "LV",
-    0x0CD94: "LV",
-    0x0CDB0: "LV",
-    0x0CDCC: "LV",
-    0x0CDE8: "LV",
-    0x0CE04: "LV",
-    0x0CE20: "LV",
-    0x0CE3C: "LV",
-    0x0CE58: "LV",
-    0x0CE74: "LV",
-    0x0CE90: "LV",
-    0x0CEAC: "LV",
-    0x0CEC8: "LV",
-    0x0CEE4: "LV",
-    0x0CF00: "LV",
-    0x0CF1C: "LV",
-    0x0CF38: "LV",
-    0x0CF54: "LV",
-    0x0CF70: "LV",
-    0x0CF8C: "LV",
-    0x0CFA8: "LV",
-    0x0CFC4: "LV",
-    0x0CFE0: "LV",
-    0x0CFFC: "LV",
-    0x0D018: "LV",
-    0x0D034: "LV",
-    0x0D050: "LV",
-    0x0D06C: "LV",
-    0x0D088: "LV",
-    0x0D0A4: "LV",
-    0x0D0C0: "LV",
-    0x0D0DC: "LV",
-    0x0D0F8: "LV",
-    0x0D114: "LV",
-    0x0D130: "LV",
-    0x0D14C: "LV",
-    0x0D168: "LV",
-    0x0D184: "LV",
-    0x0D1A0: "LV",
-    0x0D1BC: "LV",
-    0x0D1D8: "LV",
-    0x0D1F4: "LV",
-    0x0D210: "LV",
-    0x0D22C: "LV",
-    0x0D248: "LV",
-    0x0D264: "LV",
-    0x0D280: "LV",
-    0x0D29C: "LV",
-    0x0D2B8: "LV",
-    0x0D2D4: "LV",
-    0x0D2F0: "LV",
-    0x0D30C: "LV",
-    0x0D328: "LV",
-    0x0D344: "LV",
-    0x0D360: "LV",
-    0x0D37C: "LV",
-    0x0D398: "LV",
-    0x0D3B4: "LV",
-    0x0D3D0: "LV",
-    0x0D3EC: "LV",
-    0x0D408: "LV",
-    0x0D424: "LV",
-    0x0D440: "LV",
-    0x0D45C: "LV",
-    0x0D478: "LV",
-    0x0D494: "LV",
-    0x0D4B0: "LV",
-    0x0D4CC: "LV",
-    0x0D4E8: "LV",
-    0x0D504: "LV",
-    0x0D520: "LV",
-    0x0D53C: "LV",
-    0x0D558: "LV",
-    0x0D574: "LV",
-    0x0D590: "LV",
-    0x0D5AC: "LV",
-    0x0D5C8: "LV",
-    0x0D5E4: "LV",
-    0x0D600: "LV",
-    0x0D61C: "LV",
-    0x0D638: "LV",
-    0x0D654: "LV",
-    0x0D670: "LV",
-    0x0D68C: "LV",
-    0x0D6A8: "LV",
-    0x0D6C4: "LV",
-    0x0D6E0: "LV",
-    0x0D6FC: "LV",
-    0x0D718: "LV",
-    0x0D734: "LV",
-    0x0D750: "LV",
-    0x0D76C: "LV",
-    0x0D788: "LV",
-    0x0AC01: "LVT",
-    0x0AC02: "LVT",
-    0x0AC03: "LVT",
-    0x0AC04: "LVT",
-    0x0AC05: "LVT",
-    0x0AC06: "LVT",
-    0x0AC07: "LVT",
-    0x0AC08: "LVT",
-    0x0AC09: "LVT",
-    0x0AC0A: "LVT",
-    0x0AC0B: "LVT",
-    0x0AC0C: "LVT",
-    0x0AC0D: "LVT",
-    0x0AC0E: "LVT",
-    0x0AC0F: "LVT",
-    0x0AC10: "LVT",
-    0x0AC11: "LVT",
-    0x0AC12: "LVT",
-    0x0AC13: "LVT",
-    0x0AC14: "LVT",
-    0x0AC15: "LVT",
-    0x0AC16: "LVT",
-    0x0AC17: "LVT",
-    0x0AC18: "LVT",
-    0x0AC19: "LVT",
-    0x0AC1A: "LVT",
-    0x0AC1B: "LVT",
-    0x0AC1D: "LVT",
-    0x0AC1E: "LVT",
-    0x0AC1F: "LVT",
-    0x0AC20: "LVT",
-    0x0AC21: "LVT",
-    0x0AC22: "LVT",
-    0x0AC23: "LVT",
-    0x0AC24: "LVT",
-    0x0AC25: "LVT",
-    0x0AC26: "LVT",
-    0x0AC27: "LVT",
-    0x0AC28: "LVT",
-    0x0AC29: "LVT",
-    0x0AC2A: "LVT",
-    0x0AC2B: "LVT",
-    0x0AC2C: "LVT",
-    0x0AC2D: "LVT",
-    0x0AC2E: "LVT",
-    0x0AC2F: "LVT",
-    0x0AC30: "LVT",
-    0x0AC31: "LVT",
-    0x0AC32: "LVT",
-    0x0AC33: "LVT",
-    0x0AC34: "LVT",
-    0x0AC35: "LVT",
-    0x0AC36: "LVT",
-    0x0AC37: "LVT",
-    0x0AC39: "LVT",
-    0x0AC3A: "LVT",
-    0x0AC3B: "LVT",
-    0x0AC3C: "LVT",
-    0x0AC3D: "LVT",
-    0x0AC3E: "LVT",
-    0x0AC3F: "LVT",
-    0x0AC40: "LVT",
-    0x0AC41: "LVT",
-    0x0AC42: "LVT",
-    0x0AC43: "LVT",
-    0x0AC44: "LVT",
-    0x0AC45: "LVT",
-    0x0AC46: "LVT",
-    0x0AC47: "LVT",
-    0x0AC48: "LVT",
-    0x0AC49: "LVT",
-    0x0AC4A: "LVT",
-    0x0AC4B: "LVT",
-    0x0AC4C: "LVT",
-    0x0AC4D: "LVT",
-    0x0AC4E: "LVT",
-    0x0AC4F: "LVT",
-    0x0AC50: "LVT",
-    0x0AC51: "LVT",
-    0x0AC52: "LVT",
-    0x0AC53: "LVT",
-    0x0AC55: "LVT",
-    0x0AC56: "LVT",
-    0x0AC57: "LVT",
-    0x0AC58: "LVT",
-    0x0AC59: "LVT",
-    0x0AC5A: "LVT",
-    0x0AC5B: "LVT",
-    0x0AC5C: "LVT",
-    0x0AC5D: "LVT",
-    0x0AC5E: "LVT",
-    0x0AC5F: "LVT",
-    0x0AC60: "LVT",
-    0x0AC61: "LVT",
-    0x0AC62: "LVT",
-    0x0AC63: "LVT",
-    0x0AC64: "LVT",
-    0x0AC65: "LVT",
-    0x0AC66: "LVT",
-    0x0AC67: "LVT",
-    0x0AC68: "LVT",
-    0x0AC69: "LVT",
-    0x0AC6A: "LVT",
-    0x0AC6B: "LVT",
-    0x0AC6C: "LVT",
-    0x0AC6D: "LVT",
-    0x0AC6E: "LVT",
-    0x0AC6F: "LVT",
-    0x0AC71: "LVT",
-    0x0AC72: "LVT",
-    0x0AC73: "LVT",
-    0x0AC74: "LVT",
-    0x0AC75: "LVT",
-    0x0AC76: "LVT",
-    0x0AC77: "LVT",
-    0x0AC78: "LVT",
-    0x0AC79: "LVT",
-    0x0AC7A: "LVT",
-    0x0AC7B: "LVT",
-    0x0AC7C: "LVT",
-    0x0AC7D: "LVT",
-    0x0AC7E: "LVT",
-    0x0AC7F: "LVT",
-    0x0AC80: "LVT",
-    0x0AC81: "LVT",
-    0x0AC82: "LVT",
-    0x0AC83: "LVT",
-    0x0AC84: "LVT",
-    0x0AC85: "LVT",
-    0x0AC86: "LVT",
-    0x0AC87: "LVT",
-    0x0AC88: "LVT",
-    0x0AC89: "LVT",
-    0x0AC8A: "LVT",
-    0x0AC8B: "LVT",
-    0x0AC8D: "LVT",
-    0x0AC8E: "LVT",
-    0x0AC8F: "LVT",
-    0x0AC90: "LVT",
-    0x0AC91: "LVT",
-    0x0AC92: "LVT",
-    0x0AC93: "LVT",
-    0x0AC94: "LVT",
-    0x0AC95: "LVT",
-    0x0AC96: "LVT",
-    0x0AC97: "LVT",
-    0x0AC98: "LVT",
-    0x0AC99: "LVT",
-    0x0AC9A: "LVT",
-    0x0AC9B: "LVT",
-    0x0AC9C: "LVT",
-    0x0AC9D: "LVT",
-    0x0AC9E: "LVT",
-    0x0AC9F: "LVT",
-    0x0ACA0: "LVT",
-    0x0ACA1: "LVT",
-    0x0ACA2: "LVT",
-    0x0ACA3: "LVT",
-    0x0ACA4: "LVT",
-    0x0ACA5: "LVT",
-    0x0ACA6: "LVT",
-    0x0ACA7: "LVT",
-    0x0ACA9: "LVT",
-    0x0ACAA: "LVT",
-    0x0ACAB: "LVT",
-    0x0ACAC: "LVT",
-    0x0ACAD: "LVT",
-    0x0ACAE: "LVT",
-    0x0ACAF: "LVT",
-    0x0ACB0: "LVT",
-    0x0ACB1: "LVT",
-    0x0ACB2: "LVT",
-    0x0ACB3: "LVT",
-    0x0ACB4: "LVT",
-    0x0ACB5: "LVT",
-    0x0ACB6: "LVT",
-    0x0ACB7: "LVT",
-    0x0ACB8: "LVT",
-    0x0ACB9: "LVT",
-    0x0ACBA: "LVT",
-    0x0ACBB: "LVT",
-    0x0ACBC: "LVT",
-    0x0ACBD: "LVT",
-    0x0ACBE: "LVT",
-    0x0ACBF: "LVT",
-    0x0ACC0: "LVT",
-    0x0ACC1: "LVT",
-    0x0ACC2: "LVT",
-    0x0ACC3: "LVT",
-    0x0ACC5: "LVT",
-    0x0ACC6: "LVT",
-    0x0ACC7: "LVT",
-    0x0ACC8: "LVT",
-    0x0ACC9: "LVT",
-    0x0ACCA: "LVT",
-    0x0ACCB: "LVT",
-    0x0ACCC: "LVT",
-    0x0ACCD: "LVT",
-    0x0ACCE: "LVT",
-    0x0ACCF: "LVT",
-    0x0ACD0: "LVT",
-    0x0ACD1: "LVT",
-    0x0ACD2: "LVT",
-    0x0ACD3: "LVT",
-    0x0ACD4: "LVT",
-    0x0ACD5: "LVT",
-    0x0ACD6: "LVT",
-    0x0ACD7: "LVT",
-    0x0ACD8: "LVT",
-    0x0ACD9: "LVT",
-    0x0ACDA: "LVT",
-    0x0ACDB: "LVT",
-    0x0ACDC: "LVT",
-    0x0ACDD: "LVT",
-    0x0ACDE: "LVT",
-    0x0ACDF: "LVT",
-    0x0ACE1: "LVT",
-    0x0ACE2: "LVT",
-    0x0ACE3: "LVT",
-    0x0ACE4: "LVT",
-    0x0ACE5: "LVT",
-    0x0ACE6: "LVT",
-    0x0ACE7: "LVT",
-    0x0ACE8: "LVT",
-    0x0ACE9: "LVT",
-    0x0ACEA: "LVT",
-    0x0ACEB: "LVT",
-    0x0ACEC: "LVT",
-    0x0ACED: "LVT",
-    0x0ACEE: "LVT",
-    0x0ACEF: "LVT",
-    0x0ACF0: "LVT",
-    0x0ACF1: "LVT",
-    0x0ACF2: "LVT",
-    0x0ACF3: "LVT",
-    0x0ACF4: "LVT",
-    0x0ACF5: "LVT",
-    0x0ACF6: "LVT",
-    0x0ACF7: "LVT",
-    0x0ACF8: "LVT",
-    0x0ACF9: "LVT",
-    0x0ACFA: "LVT",
-    0x0ACFB: "LVT",
-    0x0ACFD: "LVT",
-    0x0ACFE: "LVT",
-    0x0ACFF: "LVT",
-    0x0AD00: "LVT",
-    0x0AD01: "LVT",
-    0x0AD02: "LVT",
-    0x0AD03: "LVT",
-    0x0AD04: "LVT",
-    0x0AD05: "LVT",
-    0x0AD06: "LVT",
-    0x0AD07: "LVT",
-    0x0AD08: "LVT",
-    0x0AD09: "LVT",
-    0x0AD0A: "LVT",
-    0x0AD0B: "LVT",
-    0x0AD0C: "LVT",
-    0x0AD0D: "LVT",
-    0x0AD0E: "LVT",
-    0x0AD0F: "LVT",
-    0x0AD10: "LVT",
-    0x0AD11: "LVT",
-    0x0AD12: "LVT",
-    0x0AD13: "LVT",
-    0x0AD14: "LVT",
-    0x0AD15: "LVT",
-    0x0AD16: "LVT",
-    0x0AD17: "LVT",
-    0x0AD19: "LVT",
-    0x0AD1A: "LVT",
-    0x0AD1B: "LVT",
-    0x0AD1C: "LVT",
-    0x0AD1D: "LVT",
-    0x0AD1E: "LVT",
-    0x0AD1F: "LVT",
-    0x0AD20: "LVT",
-    0x0AD21: "LVT",
-    0x0AD22: "LVT",
-    0x0AD23: "LVT",
-    0x0AD24: "LVT",
-    0x0AD25: "LVT",
-    0x0AD26: "LVT",
-    0x0AD27: "LVT",
-    0x0AD28: "LVT",
-    0x0AD29: "LVT",
-    0x0AD2A: "LVT",
-    0x0AD2B: "LVT",
-    0x0AD2C: "LVT",
-    0x0AD2D: "LVT",
-    0x0AD2E: "LVT",
-    0x0AD2F: "LVT",
-    0x0AD30: "LVT",
-    0x0AD31: "LVT",
-    0x0AD32: "LVT",
-    0x0AD33: "LVT",
-    0x0AD35: "LVT",
-    0x0AD36: "LVT",
-    0x0AD37: "LVT",
-    0x0AD38: "LVT",
-    0x0AD39: "LVT",
-    0x0AD3A: "LVT",
-    0x0AD3B: "LVT",
-    0x0AD3C: "LVT",
-    0x0AD3D: "LVT",
-    0x0AD3E: "LVT",
-    0x0AD3F: "LVT",
-    0x0AD40: "LVT",
-    0x0AD41: "LVT",
-    0x0AD42: "LVT",
-    0x0AD43: "LVT",
-    0x0AD44: "LVT",
-    0x0AD45: "LVT",
-    0x0AD46: "LVT",
-    0x0AD47: "LVT",
-    0x0AD48: "LVT",
-    0x0AD49: "LVT",
-    0x0AD4A: "LVT",
-    0x0AD4B: "LVT",
-    0x0AD4C: "LVT",
-    0x0AD4D: "LVT",
-    0x0AD4E: "LVT",
-    0x0AD4F: "LVT",
-    0x0AD51: "LVT",
-    0x0AD52: "LVT",
-    0x0AD53: "LVT",
-    0x0AD54: "LVT",
-    0x0AD55: "LVT",
-    0x0AD56: "LVT",
-    0x0AD57: "LVT",
-    0x0AD58: "LVT",
-    0x0AD59: "LVT",
-    0x0AD5A: "LVT",
-    0x0AD5B: "LVT",
-    0x0AD5C: "LVT",
-    0x0AD5D: "LVT",
-    0x0AD5E: "LVT",
-    0x0AD5F: "LVT",
-    0x0AD60: "LVT",
-    0x0AD61: "LVT",
-    0x0AD62: "LVT",
-    0x0AD63: "LVT",
-    0x0AD64: "LVT",
-    0x0AD65: "LVT",
-    0x0AD66: "LVT",
-    0x0AD67: "LVT",
-    0x0AD68: "LVT",
-    0x0AD69: "LVT",
-    0x0AD6A: "LVT",
-    0x0AD6B: "LVT",
-    0x0AD6D: "LVT",
-    0x0AD6E: "LVT",
-    0x0AD6F: "LVT",
-    0x0AD70: "LVT",
-    0x0AD71: "LVT",
-    0x0AD72: "LVT",
-    0x0AD73: "LVT",
-    0x0AD74: "LVT",
-    0x0AD75: "LVT",
-    0x0AD76: "LVT",
-    0x0AD77: "LVT",
-    0x0AD78: "LVT",
-    0x0AD79: "LVT",
-    0x0AD7A: "LVT",
-    0x0AD7B: "LVT",
-    0x0AD7C: "LVT",
-    0x0AD7D: "LVT",
-    0x0AD7E: "LVT",
-    0x0AD7F: "LVT",
-    0x0AD80: "LVT",
-    0x0AD81: "LVT",
-    0x0AD82: "LVT",
-    0x0AD83: "LVT",
-    0x0AD84: "LVT",
-    0x0AD85: "LVT",
-    0x0AD86: "LVT",
-    0x0AD87: "LVT",
-    0x0AD89: "LVT",
-    0x0AD8A: "LVT",
-    0x0AD8B: "LVT",
-    0x0AD8C: "LVT",
-    0x0AD8D: "LVT",
-    0x0AD8E: "LVT",
-    0x0AD8F: "LVT",
-    0x0AD90: "LVT",
-    0x0AD91: "LVT",
-    0x0AD92: "LVT",
-    0x0AD93: "LVT",
-    0x0AD94: "LVT",
-    0x0AD95: "LVT",
-    0x0AD96: "LVT",
-    0x0AD97: "LVT",
-    0x0AD98: "LVT",
-    0x0AD99: "LVT",
-    0x0AD9A: "LVT",
-    0x0AD9B: "LVT",
-    0x0AD9C: "LVT",
-    0x0AD9D: "LVT",
-    0x0AD9E: "LVT",
-    0x0AD9F: "LVT",
-    0x0ADA0: "LVT",
-    0x0ADA1: "LVT",
-    0x0ADA2: "LVT",
-    0x0ADA3: "LVT",
-    0x0ADA5: "LVT",
-    0x0ADA6: "LVT",
-    0x0ADA7: "LVT",
-    0x0ADA8: "LVT",
-    0x0ADA9: "LVT",
-    0x0ADAA: "LVT",
-    0x0ADAB: "LVT",
-    0x0ADAC: "LVT",
-    0x0ADAD: "LVT",
-    0x0ADAE: "LVT",
-    0x0ADAF: "LVT",
-    0x0ADB0: "LVT",
-    0x0ADB1: "LVT",
-    0x0ADB2: "LVT",
-    0x0ADB3: "LVT",
-    0x0ADB4: "LVT",
-    0x0ADB5: "LVT",
-    0x0ADB6: "LVT",
-    0x0ADB7: "LVT",
-    0x0ADB8: "LVT",
-    0x0ADB9: "LVT",
-    0x0ADBA: "LVT",
-    0x0ADBB: "LVT",
-    0x0ADBC: "LVT",
-    0x0ADBD: "LVT",
-    0x0ADBE: "LVT",
-    0x0ADBF: "LVT",
-    0x0ADC1: "LVT",
-    0x0ADC2: "LVT",
-    0x0ADC3: "LVT",
-    0x0ADC4: "LVT",
-    0x0ADC5: "LVT",
-    0x0ADC6: "LVT",
-    0x0ADC7: "LVT",
-    0x0ADC8: "LVT",
-    0x0ADC9: "LVT",
-    0x0ADCA: "LVT",
-    0x0ADCB: "LVT",
-    0x0ADCC: "LVT",
-    0x0ADCD: "LVT",
-    0x0ADCE: "LVT",
-    0x0ADCF: "LVT",
-    0x0ADD0: "LVT",
-    0x0ADD1: "LVT",
-    0x0ADD2: "LVT",
-    0x0ADD3: "LVT",
-    0x0ADD4: "LVT",
-    0x0ADD5: "LVT",
-    0x0ADD6: "LVT",
-    0x0ADD7: "LVT",
-    0x0ADD8: "LVT",
-    0x0ADD9: "LVT",
-    0x0ADDA: "LVT",
-    0x0ADDB: "LVT",
-    0x0ADDD: "LVT",
-    0x0ADDE: "LVT",
-    0x0ADDF: "LVT",
-    0x0ADE0: "LVT",
-    0x0ADE1: "LVT",
-    0x0ADE2: "LVT",
-    0x0ADE3: "LVT",
-    0x0ADE4: "LVT",
-    0x0ADE5: "LVT",
-    0x0ADE6: "LVT",
-    0x0ADE7: "LVT",
-    0x0ADE8: "LVT",
-    0x0ADE9: "LVT",
-    0x0ADEA: "LVT",
-    0x0ADEB: "LVT",
-    0x0ADEC: "LVT",
-    0x0ADED: "LVT",
-    0x0ADEE: "LVT",
-    0x0ADEF: "LVT",
-    0x0ADF0: "LVT",
-    0x0ADF1: "LVT",
-    0x0ADF2: "LVT",
-    0x0ADF3: "LVT",
-    0x0ADF4: "LVT",
-    0x0ADF5: "LVT",
-    0x0ADF6: "LVT",
-    0x0ADF7: "LVT",
-    0x0ADF9: "LVT",
-    0x0ADFA: "LVT",
-    0x0ADFB: "LVT",
-    0x0ADFC: "LVT",
-    0x0ADFD: "LVT",
-    0x0ADFE: "LVT",
-    0x0ADFF: "LVT",
-    0x0AE00: "LVT",
-    0x0AE01: "LVT",
-    0x0AE02: "LVT",
-    0x0AE03: "LVT",
-    0x0AE04: "LVT",
-    0x0AE05: "LVT",
-    0x0AE06: "LVT",
-    0x0AE07: "LVT",
-    0x0AE08: "LVT",
-    0x0AE09: "LVT",
-    0x0AE0A: "LVT",
-    0x0AE0B: "LVT",
-    0x0AE0C: "LVT",
-    0x0AE0D: "LVT",
-    0x0AE0E: "LVT",
-    0x0AE0F: "LVT",
-    0x0AE10: "LVT",
-    0x0AE11: "LVT",
-    0x0AE12: "LVT",
-    0x0AE13: "LVT",
-    0x0AE15: "LVT",
-    0x0AE16: "LVT",
-    0x0AE17: "LVT",
-    0x0AE18: "LVT",
-    0x0AE19: "LVT",
-    0x0AE1A: "LVT",
-    0x0AE1B: "LVT",
-    0x0AE1C: "LVT",
-    0x0AE1D: "LVT",
-    0x0AE1E: "LVT",
-    0x0AE1F: "LVT",
-    0x0AE20: "LVT",
-    0x0AE21: "LVT",
-    0x0AE22: "LVT",
-    0x0AE23: "LVT",
-    0x0AE24: "LVT",
-    0x0AE25: "LVT",
-    0x0AE26: "LVT",
-    0x0AE27: "LVT",
-    0x0AE28: "LVT",
-    0x0AE29: "LVT",
-    0x0AE2A: "LVT",
-    0x0AE2B: "LVT",
-    0x0AE2C: "LVT",
-    0x0AE2D: "LVT",
-    0x0AE2E: "LVT",
-    0x0AE2F: "LVT",
-    0x0AE31: "LVT",
-    0x0AE32: "LVT",
-    0x0AE33: "LVT",
-    0x0AE34: "LVT",
-    0x0AE35: "LVT",
-    0x0AE36: "LVT",
-    0x0AE37: "LVT",
-    0x0AE38: "LVT",
-    0x0AE39: "LVT",
-    0x0AE3A: "LVT",
-    0x0AE3B: "LVT",
-    0x0AE3C: "LVT",
-    0x0AE3D: "LVT",
-    0x0AE3E: "LVT",
-    0x0AE3F: "LVT",
-    0x0AE40: "LVT",
-    0x0AE41: "LVT",
-    0x0AE42: "LVT",
-    0x0AE43: "LVT",
-    0x0AE44: "LVT",
-    0x0AE45: "LVT",
-    0x0AE46: "LVT",
-    0x0AE47: "LVT",
-    0x0AE48: "LVT",
-    0x0AE49: "LVT",
-    0x0AE4A: "LVT",
-    0x0AE4B: "LVT",
-    0x0AE4D: "LVT",
-    0x0AE4E: "LVT",
-    0x0AE4F: "LVT",
-    0x0AE50: "LVT",
-    0x0AE51: "LVT",
-    0x0AE52: "LVT",
-    0x0AE53: "LVT",
-    0x0AE54: "LVT",
-    0x0AE55: "LVT",
-    0x0AE56: "LVT",
-    0x0AE57: "LVT",
-    0x0AE58: "LVT",
-    0x0AE59: "LVT",
-    0x0AE5A: "LVT",
-    0x0AE5B: "LVT",
-    0x0AE5C: "LVT",
-    0x0AE5D: "LVT",
-    0x0AE5E: "LVT",
-    0x0AE5F: "LVT",
-    0x0AE60: "LVT",
-    0x0AE61: "LVT",
-    0x0AE62: "LVT",
-    0x0AE63: "LVT",
-    0x0AE64: "LVT",
-    0x0AE65: "LVT",
-    0x0AE66: "LVT",
-    0x0AE67: "LVT",
-    0x0AE69: "LVT",
-    0x0AE6A: "LVT",
-    0x0AE6B: "LVT",
-    0x0AE6C: "LVT",
-    0x0AE6D: "LVT",
-    0x0AE6E: "LVT",
-    0x0AE6F: "LVT",
-    0x0AE70: "LVT",
-    0x0AE71: "LVT",
-    0x0AE72: "LVT",
-    0x0AE73: "LVT",
-    0x0AE74: "LVT",
-    0x0AE75: "LVT",
-    0x0AE76: "LVT",
-    0x0AE77: "LVT",
-    0x0AE78: "LVT",
-    0x0AE79: "LVT",
-    0x0AE7A: "LVT",
-    0x0AE7B: "LVT",
-    0x0AE7C: "LVT",
-    0x0AE7D: "LVT",
-    0x0AE7E: "LVT",
-    0x0AE7F: "LVT",
-    0x0AE80: "LVT",
-    0x0AE81: "LVT",
-    0x0AE82: "LVT",
-    0x0AE83: "LVT",
-    0x0AE85: "LVT",
-    0x0AE86: "LVT",
-    0x0AE87: "LVT",
-    0x0AE88: "LVT",
-    0x0AE89: "LVT",
-    0x0AE8A: "LVT",
-    0x0AE8B: "LVT",
-    0x0AE8C: "LVT",
-    0x0AE8D: "LVT",
-    0x0AE8E: "LVT",
-    0x0AE8F: "LVT",
-    0x0AE90: "LVT",
-    0x0AE91: "LVT",
-    0x0AE92: "LVT",
-    0x0AE93: "LVT",
-    0x0AE94: "LVT",
-    0x0AE95: "LVT",
-    0x0AE96: "LVT",
-    0x0AE97: "LVT",
-    0x0AE98: "LVT",
-    0x0AE99: "LVT",
-    0x0AE9A: "LVT",
-    0x0AE9B: "LVT",
-    0x0AE9C: "LVT",
-    0x0AE9D: "LVT",
-    0x0AE9E: "LVT",
-    0x0AE9F: "LVT",
-    0x0AEA1: "LVT",
-    0x0AEA2: "LVT",
-    0x0AEA3: "LVT",
-    0x0AEA4: "LVT",
-    0x0AEA5: "LVT",
-    0x0AEA6: "LVT",
-    0x0AEA7: "LVT",
-    0x0AEA8: "LVT",
-    0x0AEA9: "LVT",
-    0x0AEAA: "LVT",
-    0x0AEAB: "LVT",
-    0x0AEAC: "LVT",
-    0x0AEAD: "LVT",
-    0x0AEAE: "LVT",
-    0x0AEAF: "LVT",
-    0x0AEB0: "LVT",
-    0x0AEB1: "LVT",
-    0x0AEB2: "LVT",
-    0x0AEB3: "LVT",
-    0x0AEB4: "LVT",
-    0x0AEB5: "LVT",
-    0x0AEB6: "LVT",
-    0x0AEB7: "LVT",
-    0x0AEB8: "LVT",
-    0x0AEB9: "LVT",
-    0x0AEBA: "LVT",
-    0x0AEBB: "LVT",
-    0x0AEBD: "LVT",
-    0x0AEBE: "LVT",
-    0x0AEBF: "LVT",
-    0x0AEC0: "LVT",
-    0x0AEC1: "LVT",
-    0x0AEC2: "LVT",
-    0x0AEC3: "LVT",
-    0x0AEC4: "LVT",
-    0x0AEC5: "LVT",
-    0x0AEC6: "LVT",
-    0x0AEC7: "LVT",
-    0x0AEC8: "LVT",
-    0x0AEC9: "LVT",
-    0x0AECA: "LVT",
-    0x0AECB: "LVT",
-    0x0AECC: "LVT",
-    0x0AECD: "LVT",
-    0x0AECE: "LVT",
-    0x0AECF: "LVT",
-    0x0AED0: "LVT",
-    0x0AED1: "LVT",
-    0x0AED2: "LVT",
-    0x0AED3: "LVT",
-    0x0AED4: "LVT",
-    0x0AED5: "LVT",
-    0x0AED6: "LVT",
-    0x0AED7: "LVT",
-    0x0AED9: "LVT",
-    0x0AEDA: "LVT",
-    0x0AEDB: "LVT",
-    0x0AEDC: "LVT",
-    0x0AEDD: "LVT",
-    0x0AEDE: "LVT",
-    0x0AEDF: "LVT",
-    0x0AEE0: "LVT",
-    0x0AEE1: "LVT",
-    0x0AEE2: "LVT",
-    0x0AEE3: "LVT",
-    0x0AEE4: "LVT",
-    0x0AEE5: "LVT",
-    0x0AEE6: "LVT",
-    0x0AEE7: "LVT",
-    0x0AEE8: "LVT",
-    0x0AEE9: "LVT",
-    0x0AEEA: "LVT",
-    0x0AEEB: "LVT",
-    0x0AEEC: "LVT",
-    0x0AEED: "LVT",
-    0x0AEEE: "LVT",
-    0x0AEEF: "LVT",
-    0x0AEF0: "LVT",
-    0x0AEF1: "LVT",
-    0x0AEF2: "LVT",
-    0x0AEF3: "LVT",
-    0x0AEF5: "LVT",
-    0x0AEF6: "LVT",
-    0x0AEF7: "LVT",
-    0x0AEF8: "LVT",
-    0x0AEF9: "LVT",
-    0x0AEFA: "LVT",
-    0x0AEFB: "LVT",
-    0x0AEFC: "LVT",
-    0x0AEFD: "LVT",
-    0x0AEFE: "LVT",
-    0x0AEFF: "LVT",
-    0x0AF00: "LVT",
-    0x0AF01: "LVT",
-    0x0AF02: "LVT",
-    0x0AF03: "LVT",
-    0x0AF04: "LVT",
-    0x0AF05: "LVT",
-    0x0AF06: "LVT",
-    0x0AF07: "LVT",
-    0x0AF08: "LVT",
-    0x0AF09: "LVT",
-    0x0AF0A: "LVT",
-    0x0AF0B: "LVT",
-    0x0AF0C: "LVT",
-    0x0AF0D: "LVT",
-    0x0AF0E: "LVT",
-    0x0AF0F: "LVT",
-    0x0AF11: "LVT",
-    0x0AF12: "LVT",
-    0x0AF13: "LVT",
-    0x0AF14: "LVT",
-    0x0AF15: "LVT",
-    0x0AF16: "LVT",
-    0x0AF17: "LVT",
-    0x0AF18: "LVT",
-    0x0AF19: "LVT",
-    0x0AF1A: "LVT",
-    0x0AF1B: "LVT",
-    0x0AF1C: "LVT",
-    0x0AF1D: "LVT",
-    0x0AF1E: "LVT",
-    0x0AF1F: "LVT",
-    0x0AF20: "LVT",
-    0x0AF21: "LVT",
-    0x0AF22: "LVT",
-    0x0AF23: "LVT",
-    0x0AF24: "LVT",
-    0x0AF25: "LVT",
-    0x0AF26: "LVT",
-    0x0AF27: "LVT",
-    0x0AF28: "LVT",
-    0x0AF29: "LVT",
-    0x0AF2A: "LVT",
-    0x0AF2B: "LVT",
-    0x0AF2D: "LVT",
-    0x0AF2E: "LVT",
-    0x0AF2F: "LVT",
-    0x0AF30: "LVT",
-    0x0AF31: "LVT",
-    0x0AF32: "LVT",
-    0x0AF33: "LVT",
-    0x0AF34: "LVT",
-    0x0AF35: "LVT",
-    0x0AF36: "LVT",
-    0x0AF37: "LVT",
-    0x0AF38: "LVT",
-    0x0AF39: "LVT",
-    0x0AF3A: "LVT",
-    0x0AF3B: "LVT",
-    0x0AF3C: "LVT",
-    0x0AF3D: "LVT",
-    0x0AF3E: "LVT",
-    0x0AF3F: "LVT",
-    0x0AF40: "LVT",
-    0x0AF41: "LVT",
-    0x0AF42: "LVT",
-    0x0AF43: "LVT",
-    0x0AF44: "LVT",
-    0x0AF45: "LVT",
-    0x0AF46: "LVT",
-    0x0AF47: "LVT",
-    0x0AF49: "LVT",
-    0x0AF4A: "LVT",
-    0x0AF4B: "LVT",
-    0x0AF4C: "LVT",
-    0x0AF4D: "LVT",
-    0x0AF4E: "LVT",
-    0x0AF4F: "LVT",
-    0x0AF50: "LVT",
-    0x0AF51: "LVT",
-    0x0AF52: "LVT",
-    0x0AF53: "LVT",
-    0x0AF54: "LVT",
-    0x0AF55: "LVT",
-    0x0AF56: "LVT",
-    0x0AF57: "LVT",
-    0x0AF58: "LVT",
-    0x0AF59: "LVT",
-    0x0AF5A: "LVT",
-    0x0AF5B: "LVT",
-    0x0AF5C: "LVT",
-    0x0AF5D: "LVT",
-    0x0AF5E: "LVT",
-    0x0AF5F: "LVT",
-    0x0AF60: "LVT",
-    0x0AF61: "LVT",
-    0x0AF62: "LVT",
-    0x0AF63: "LVT",
-    0x0AF65: "LVT",
-    0x0AF66: "LVT",
-    0x0AF67: "LVT",
-    0x0AF68: "LVT",
-    0x0AF69: "LVT",
-    0x0AF6A: "LVT",
-    0x0AF6B: "LVT",
-    0x0AF6C: "LVT",
-    0x0AF6D: "LVT",
-    0x0AF6E: "LVT",
-    0x0AF6F: "LVT",
-    0x0AF70: "LVT",
-    0x0AF71: "LVT",
-    0x0AF72: "LVT",
-    0x0AF73: "LVT",
-    0x0AF74: "LVT",
-    0x0AF75: "LVT",
-    0x0AF76: "LVT",
-    0x0AF77: "LVT",
-    0x0AF78: "LVT",
-    0x0AF79: "LVT",
-    0x0AF7A: "LVT",
-    0x0AF7B: "LVT",
-    0x0AF7C: "LVT",
-    0x0AF7D: "LVT",
-    0x0AF7E: "LVT",
-    0x0AF7F: "LVT",
-    0x0AF81: "LVT",
-    0x0AF82: "LVT",
-    0x0AF83: "LVT",
-    0x0AF84: "LVT",
-    0x0AF85: "LVT",
-    0x0AF86: "LVT",
-    0x0AF87: "LVT",
-    0x0AF88: "LVT",
-    0x0AF89: "LVT",
-    0x0AF8A: "LVT",
-    0x0AF8B: "LVT",
-    0x0AF8C: "LVT",
-    0x0AF8D: "LVT",
-    0x0AF8E: "LVT",
-    0x0AF8F: "LVT",
-    0x0AF90: "LVT",
-    0x0AF91: "LVT",
-    0x0AF92: "LVT",
-    0x0AF93: "LVT",
-    0x0AF94: "LVT",
-    0x0AF95: "LVT",
-    0x0AF96: "LVT",
-    0x0AF97: "LVT",
-    0x0AF98: "LVT",
-    0x0AF99: "LVT",
-    0x0AF9A: "LVT",
-    0x0AF9B: "LVT",
-    0x0AF9D: "LVT",
-    0x0AF9E: "LVT",
-    0x0AF9F: "LVT",
-    0x0AFA0: "LVT",
-    0x0AFA1: "LVT",
-    0x0AFA2: "LVT",
-    0x0AFA3: "LVT",
-    0x0AFA4: "LVT",
-    0x0AFA5: "LVT",
-    0x0AFA6: "LVT",
-    0x0AFA7: "LVT",
-    0x0AFA8: "LVT",
-    0x0AFA9: "LVT",
-    0x0AFAA: "LVT",
-    0x0AFAB: "LVT",
-    0x0AFAC: "LVT",
-    0x0AFAD: "LVT",
-    0x0AFAE: "LVT",
-    0x0AFAF: "LVT",
-    0x0AFB0: "LVT",
-    0x0AFB1: "LVT",
-    0x0AFB2: "LVT",
-    0x0AFB3: "LVT",
-    0x0AFB4: "LVT",
-    0x0AFB5: "LVT",
-    0x0AFB6: "LVT",
-    0x0AFB7: "LVT",
-    0x0AFB9: "LVT",
-    0x0AFBA: "LVT",
-    0x0AFBB: "LVT",
-    0x0AFBC: "LVT",
-    0x0AFBD: "LVT",
-    0x0AFBE: "LVT",
-    0x0AFBF: "LVT",
-    0x0AFC0: "LVT",
-    0x0AFC1: "LVT",
-    0x0AFC2: "LVT",
-    0x0AFC3: "LVT",
-    0x0AFC4: "LVT",
-    0x0AFC5: "LVT",
-    0x0AFC6: "LVT",
-    0x0AFC7: "LVT",
-    0x0AFC8: "LVT",
-    0x0AFC9: "LVT",
-    0x0AFCA: "LVT",
-    0x0AFCB: "LVT",
-    0x0AFCC: "LVT",
-    0x0AFCD: "LVT",
-    0x0AFCE: "LVT",
-    0x0AFCF: "LVT",
-    0x0AFD0: "LVT",
-    0x0AFD1: "LVT",
-    0x0AFD2: "LVT",
-    0x0AFD3: "LVT",
-    0x0AFD5: "LVT",
-    0x0AFD6: "LVT",
-    0x0AFD7: "LVT",
-    0x0AFD8: "LVT",
-    0x0AFD9: "LVT",
-    0x0AFDA: "LVT",
-    0x0AFDB: "LVT",
-    0x0AFDC: "LVT",
-    0x0AFDD: "LVT",
-    0x0AFDE: "LVT",
-    0x0AFDF: "LVT",
-    0x0AFE0: "LVT",
-    0x0AFE1: "LVT",
-    0x0AFE2: "LVT",
-    0x0AFE3: "LVT",
-    0x0AFE4: "LVT",
-    0x0AFE5: "LVT",
-    0x0AFE6: "LVT",
-    0x0AFE7: "LVT",
-    0x0AFE8: "LVT",
-    0x0AFE9: "LVT",
-    0x0AFEA: "LVT",
-    0x0AFEB: "LVT",
-    0x0AFEC: "LVT",
-    0x0AFED: "LVT",
-    0x0AFEE: "LVT",
-    0x0AFEF: "LVT",
-    0x0AFF1: "LVT",
-    0x0AFF2: "LVT",
-    0x0AFF3: "LVT",
-    0x0AFF4: "LVT",
-    0x0AFF5: "LVT",
-    0x0AFF6: "LVT",
-    0x0AFF7: "LVT",
-    0x0AFF8: "LVT",
-    0x0AFF9: "LVT",
-    0x0AFFA: "LVT",
-    0x0AFFB: "LVT",
-    0x0AFFC: "LVT",
-    0x0AFFD: "LVT",
-    0x0AFFE: "LVT",
-    0x0AFFF: "LVT",
-    0x0B000: "LVT",
-    0x0B001: "LVT",
-    0x0B002: "LVT",
-    0x0B003: "LVT",
-    0x0B004: "LVT",
-    0x0B005: "LVT",
-    0x0B006: "LVT",
-    0x0B007: "LVT",
-    0x0B008: "LVT",
-    0x0B009: "LVT",
-    0x0B00A: "LVT",
-    0x0B00B: "LVT",
-    0x0B00D: "LVT",
-    0x0B00E: "LVT",
-    0x0B00F: "LVT",
-    0x0B010: "LVT",
-    0x0B011: "LVT",
-    0x0B012: "LVT",
-    0x0B013: "LVT",
-    0x0B014: "LVT",
-    0x0B015: "LVT",
-    0x0B016: "LVT",
-    0x0B017: "LVT",
-    0x0B018: "LVT",
-    0x0B019: "LVT",
-    0x0B01A: "LVT",
-    0x0B01B: "LVT",
-    0x0B01C: "LVT",
-    0x0B01D: "LVT",
-    0x0B01E: "LVT",
-    0x0B01F: "LVT",
-    0x0B020: "LVT",
-    0x0B021: "LVT",
-    0x0B022: "LVT",
-    0x0B023: "LVT",
-    0x0B024: "LVT",
-    0x0B025: "LVT",
-    0x0B026: "LVT",
-    0x0B027: "LVT",
-    0x0B029: "LVT",
-    0x0B02A: "LVT",
-    0x0B02B: "LVT",
-    0x0B02C: "LVT",
-    0x0B02D: "LVT",
-    0x0B02E: "LVT",
-    0x0B02F: "LVT",
-    0x0B030: "LVT",
-    0x0B031: "LVT",
-    0x0B032: "LVT",
-    0x0B033: "LVT",
-    0x0B034: "LVT",
-    0x0B035: "LVT",
-    0x0B036: "LVT",
-    0x0B037: "LVT",
-    0x0B038: "LVT",
-    0x0B039: "LVT",
-    0x0B03A: "LVT",
-    0x0B03B: "LVT",
-    0x0B03C: "LVT",
-    0x0B03D: "LVT",
-    0x0B03E: "LVT",
-    0x0B03F: "LVT",
-    0x0B040: "LVT",
-    0x0B041: "LVT",
-    0x0B042: "LVT",
-    0x0B043: "LVT",
-    0x0B045: "LVT",
-    0x0B046: "LVT",
-    0x0B047: "LVT",
-    0x0B048: "LVT",
-    0x0B049: "LVT",
-    0x0B04A: "LVT",
-    0x0B04B: "LVT",
-    0x0B04C: "LVT",
-    0x0B04D: "LVT",
-    0x0B04E: "LVT",
-    0x0B04F: "LVT",
-    0x0B050: "LVT",
-    0x0B051: "LVT",
-    0x0B052: "LVT",
-    0x0B053: "LVT",
-    0x0B054: "LVT",
-    0x0B055: "LVT",
-    0x0B056: "LVT",
-    0x0B057: "LVT",
-    0x0B058: "LVT",
-    0x0B059: "LVT",
-    0x0B05A: "LVT",
-    0x0B05B: "LVT",
-    0x0B05C: "LVT",
-    0x0B05D: "LVT",
-    0x0B05E: "LVT",
-    0x0B05F: "LVT",
-    0x0B061: "LVT",
-    0x0B062: "LVT",
-    0x0B063: "LVT",
-    0x0B064: "LVT",
-    0x0B065: "LVT",
-    0x0B066: "LVT",
-    0x0B067: "LVT",
-    0x0B068: "LVT",
-    0x0B069: "LVT",
-    0x0B06A: "LVT",
-    0x0B06B: "LVT",
-    0x0B06C: "LVT",
-    0x0B06D: "LVT",
-    0x0B06E: "LVT",
-    0x0B06F: "LVT",
-    0x0B070: "LVT",
-    0x0B071: "LVT",
-    0x0B072: "LVT",
-    0x0B073: "LVT",
-    0x0B074: "LVT",
-    0x0B075: "LVT",
-    0x0B076: "LVT",
-    0x0B077: "LVT",
-    0x0B078: "LVT",
-    0x0B079: "LVT",
-    0x0B07A: "LVT",
-    0x0B07B: "LVT",
-    0x0B07D: "LVT",
-    0x0B07E: "LVT",
-    0x0B07F: "LVT",
-    0x0B080: "LVT",
-    0x0B081: "LVT",
-    0x0B082: "LVT",
-    0x0B083: "LVT",
-    0x0B084: "LVT",
-    0x0B085: "LVT",
-    0x0B086: "LVT",
-    0x0B087: "LVT",
-    0x0B088: "LVT",
-    0x0B089: "LVT",
-    0x0B08A: "LVT",
-    0x0B08B: "LVT",
-    0x0B08C: "LVT",
-    0x0B08D: "LVT",
-    0x0B08E: "LVT",
-    0x0B08F: "LVT",
-    0x0B090: "LVT",
-    0x0B091: "LVT",
-    0x0B092: "LVT",
-    0x0B093: "LVT",
-    0x0B094: "LVT",
-    0x0B095: "LVT",
-    0x0B096: "LVT",
-    0x0B097: "LVT",
-    0x0B099: "LVT",
-    0x0B09A: "LVT",
-    0x0B09B: "LVT",
-    0x0B09C: "LVT",
-    0x0B09D: "LVT",
-    0x0B09E: "LVT",
-    0x0B09F: "LVT",
-    0x0B0A0: "LVT",
-    0x0B0A1: "LVT",
-    0x0B0A2: "LVT",
-    0x0B0A3: "LVT",
-    0x0B0A4: "LVT",
-    0x0B0A5: "LVT",
-    0x0B0A6: "LVT",
-    0x0B0A7: "LVT",
-    0x0B0A8: "LVT",
-    0x0B0A9: "LVT",
-    0x0B0AA: "LVT",
-    0x0B0AB: "LVT",
-    0x0B0AC: "LVT",
-    0x0B0AD: "LVT",
-    0x0B0AE: "LVT",
-    0x0B0AF: "LVT",
-    0x0B0B0: "LVT",
-    0x0B0B1: "LVT",
-    0x0B0B2: "LVT",
-    0x0B0B3: "LVT",
-    0x0B0B5: "LVT",
-    0x0B0B6: "LVT",
-    0x0B0B7: "LVT",
-    0x0B0B8: "LVT",
-    0x0B0B9: "LVT",
-    0x0B0BA: "LVT",
-    0x0B0BB: "LVT",
-    0x0B0BC: "LVT",
-    0x0B0BD: "LVT",
-    0x0B0BE: "LVT",
-    0x0B0BF: "LVT",
-    0x0B0C0: "LVT",
-    0x0B0C1: "LVT",
-    0x0B0C2: "LVT",
-    0x0B0C3: "LVT",
-    0x0B0C4: "LVT",
-    0x0B0C5: "LVT",
-    0x0B0C6: "LVT",
-    0x0B0C7: "LVT",
-    0x0B0C8: "LVT",
-    0x0B0C9: "LVT",
-    0x0B0CA: "LVT",
-    0x0B0CB: "LVT",
-    0x0B0CC: "LVT",
-    0x0B0CD: "LVT",
-    0x0B0CE: "LVT",
-    0x0B0CF: "LVT",
-    0x0B0D1: "LVT",
-    0x0B0D2: "LVT",
-    0x0B0D3: "LVT",
-    0x0B0D4: "LVT",
-    0x0B0D5: "LVT",
-    0x0B0D6: "LVT",
-    0x0B0D7: "LVT",
-    0x0B0D8: "LVT",
-    0x0B0D9: "LVT",
-    0x0B0DA: "LVT",
-    0x0B0DB: "LVT",
-    0x0B0DC: "LVT",
-    0x0B0DD: "LVT",
-    0x0B0DE: "LVT",
-    0x0B0DF: "LVT",
-    0x0B0E0: "LVT",
-    0x0B0E1: "LVT",
-    0x0B0E2: "LVT",
-    0x0B0E3: "LVT",
-    0x0B0E4: "LVT",
-    0x0B0E5: "LVT",
-    0x0B0E6: "LVT",
-    0x0B0E7: "LVT",
-    0x0B0E8: "LVT",
-    0x0B0E9: "LVT",
-    0x0B0EA: "LVT",
-    0x0B0EB: "LVT",
-    0x0B0ED: "LVT",
-    0x0B0EE: "LVT",
-    0x0B0EF: "LVT",
-    0x0B0F0: "LVT",
-    0x0B0F1: "LVT",
-    0x0B0F2: "LVT",
-    0x0B0F3: "LVT",
-    0x0B0F4: "LVT",
-    0x0B0F5: "LVT",
-    0x0B0F6: "LVT",
-    0x0B0F7: "LVT",
-    0x0B0F8: "LVT",
-    0x0B0F9: "LVT",
-    0x0B0FA: "LVT",
-    0x0B0FB: "LVT",
-    0x0B0FC: "LVT",
-    0x0B0FD: "LVT",
-    0x0B0FE: "LVT",
-    0x0B0FF: "LVT",
-    0x0B100: "LVT",
-    0x0B101: "LVT",
-    0x0B102: "LVT",
-    0x0B103: "LVT",
-    0x0B104: "LVT",
-    0x0B105: "LVT",
-    0x0B106: "LVT",
-    0x0B107: "LVT",
-    0x0B109: "LVT",
-    0x0B10A: "LVT",
-    0x0B10B: "LVT",
-    0x0B10C: "LVT",
-    0x0B10D: "LVT",
-    0x0B10E: "LVT",
-    0x0B10F: "LVT",
-    0x0B110: "LVT",
-    0x0B111: "LVT",
-    0x0B112: "LVT",
-    0x0B113: "LVT",
-    0x0B114: "LVT",
-    0x0B115: "LVT",
-    0x0B116: "LVT",
-    0x0B117: "LVT",
-    0x0B118: "LVT",
-    0x0B119: "LVT",
-    0x0B11A: "LVT",
-    0x0B11B: "LVT",
-    0x0B11C: "LVT",
-    0x0B11D: "LVT",
-    0x0B11E: "LVT",
-    0x0B11F: "LVT",
-    0x0B120: "LVT",
-    0x0B121: "LVT",
-    0x0B122: "LVT",
-    0x0B123: "LVT",
-    0x0B125: "LVT",
-    0x0B126: "LVT",
-    0x0B127: "LVT",
-    0x0B128: "LVT",
-    0x0B129: "LVT",
-    0x0B12A: "LVT",
-    0x0B12B: "LVT",
-    0x0B12C: "LVT",
-    0x0B12D: "LVT",
-    0x0B12E: "LVT",
-    0x0B12F: "LVT",
-    0x0B130: "LVT",
-    0x0B131: "LVT",
-    0x0B132: "LVT",
-    0x0B133: "LVT",
-    0x0B134: "LVT",
-    0x0B135: "LVT",
-    0x0B136: "LVT",
-    0x0B137: "LVT",
-    0x0B138: "LVT",
-    0x0B139: "LVT",
-    0x0B13A: "LVT",
-    0x0B13B: "LVT",
-    0x0B13C: "LVT",
-    0x0B13D: "LVT",
-    0x0B13E: "LVT",
-    0x0B13F: "LVT",
-    0x0B141: "LVT",
-    0x0B142: "LVT",
-    0x0B143: "LVT",
-    0x0B144: "LVT",
-    0x0B145: "LVT",
-    0x0B146: "LVT",
-    0x0B147: "LVT",
-    0x0B148: "LVT",
-    0x0B149: "LVT",
-    0x0B14A: "LVT",
-    0x0B14B: "LVT",
-    0x0B14C: "LVT",
-    0x0B14D: "LVT",
-    0x0B14E: "LVT",
-    0x0B14F: "LVT",
-    0x0B150: "LVT",
-    0x0B151: "LVT",
-    0x0B152: "LVT",
-    0x0B153: "LVT",
-    0x0B154: "LVT",
-    0x0B155: "LVT",
-    0x0B156: "LVT",
-    0x0B157: "LVT",
-    0x0B158: "LVT",
-    0x0B159: "LVT",
-    0x0B15A: "LVT",
-    0x0B15B: "LVT",
-    0x0B15D: "LVT",
-    0x0B15E: "LVT",
-    0x0B15F: "LVT",
-    0x0B160: "LVT",
-    0x0B161: "LVT",
-    0x0B162: "LVT",
-    0x0B163: "LVT",
-    0x0B164: "LVT",
-    0x0B165: "LVT",
-    0x0B166: "LVT",
-    0x0B167: "LVT",
-    0x0B168: "LVT",
-    0x0B169: "LVT",
-    0x0B16A: "LVT",
-    0x0B16B: "LVT",
-    0x0B16C: "LVT",
-    0x0B16D: "LVT",
-    0x0B16E: "LVT",
-    0x0B16F: "LVT",
-    0x0B170: "LVT",
-    0x0B171: "LVT",
-    0x0B172: "LVT",
-    0x0B173: "LVT",
-    0x0B174: "LVT",
-    0x0B175: "LVT",
-    0x0B176: "LVT",
-    0x0B177: "LVT",
-    0x0B179: "LVT",
-    0x0B17A: "LVT",
-    0x0B17B: "LVT",
-    0x0B17C: "LVT",
-    0x0B17D: "LVT",
-    0x0B17E: "LVT",
-    0x0B17F: "LVT",
-    0x0B180: "LVT",
-    0x0B181: "LVT",
-    0x0B182: "LVT",
-    0x0B183: "LVT",
-    0x0B184: "LVT",
-    0x0B185: "LVT",
-    0x0B186: "LVT",
-    0x0B187: "LVT",
-    0x0B188: "LVT",
-    0x0B189: "LVT",
-    0x0B18A: "LVT",
-    0x0B18B: "LVT",
-    0x0B18C: "LVT",
-    0x0B18D: "LVT",
-    0x0B18E: "LVT",
-    0x0B18F: "LVT",
-    0x0B190: "LVT",
-    0x0B191: "LVT",
-    0x0B192: "LVT",
-    0x0B193: "LVT",
-    0x0B195: "LVT",
-    0x0B196: "LVT",
-    0x0B197: "LVT",
-    0x0B198: "LVT",
-    0x0B199: "LVT",
-    0x0B19A: "LVT",
-    0x0B19B: "LVT",
-    0x0B19C: "LVT",
-    0x0B19D: "LVT",
-    0x0B19E: "LVT",
-    0x0B19F: "LVT",
-    0x0B1A0: "LVT",
-    0x0B1A1: "LVT",
-    0x0B1A2: "LVT",
-    0x0B1A3: "LVT",
-    0x0B1A4: "LVT",
-    0x0B1A5: "LVT",
-    0x0B1A6: "LVT",
-    0x0B1A7: "LVT",
-    0x0B1A8: "LVT",
-    0x0B1A9: "LVT",
-    0x0B1AA: "LVT",
-    0x0B1AB: "LVT",
-    0x0B1AC: "LVT",
-    0x0B1AD: "LVT",
-    0x0B1AE: "LVT",
-    0x0B1AF: "LVT",
-    0x0B1B1: "LVT",
-    0x0B1B2: "LVT",
-    0x0B1B3: "LVT",
-    0x0B1B4: "LVT",
-    0x0B1B5: "LVT",
-    0x0B1B6: "LVT",
-    0x0B1B7: "LVT",
-    0x0B1B8: "LVT",
-    0x0B1B9: "LVT",
-    0x0B1BA: "LVT",
-    0x0B1BB: "LVT",
-    0x0B1BC: "LVT",
-    0x0B1BD: "LVT",
-    0x0B1BE: "LVT",
-    0x0B1BF: "LVT",
-    0x0B1C0: "LVT",
-    0x0B1C1: "LVT",
-    0x0B1C2: "LVT",
-    0x0B1C3: "LVT",
-    0x0B1C4: "LVT",
-    0x0B1C5: "LVT",
-    0x0B1C6: "LVT",
-    0x0B1C7: "LVT",
-    0x0B1C8: "LVT",
-    0x0B1C9: "LVT",
-    0x0B1CA: "LVT",
-    0x0B1CB: "LVT",
-    0x0B1CD: "LVT",
-    0x0B1CE: "LVT",
-    0x0B1CF: "LVT",
-    0x0B1D0: "LVT",
-    0x0B1D1: "LVT",
-    0x0B1D2: "LVT",
-    0x0B1D3: "LVT",
-    0x0B1D4: "LVT",
-    0x0B1D5: "LVT",
-    0x0B1D6: "LVT",
-    0x0B1D7: "LVT",
-    0x0B1D8: "LVT",
-    0x0B1D9: "LVT",
-    0x0B1DA: "LVT",
-    0x0B1DB: "LVT",
-    0x0B1DC: "LVT",
-    0x0B1DD: "LVT",
-    0x0B1DE: "LVT",
-    0x0B1DF: "LVT",
-    0x0B1E0: "LVT",
-    0x0B1E1: "LVT",
-    0x0B1E2: "LVT",
-    0x0B1E3: "LVT",
-    0x0B1E4: "LVT",
-    0x0B1E5: "LVT",
-    0x0B1E6: "LVT",
-    0x0B1E7: "LVT",
-    0x0B1E9: "LVT",
-    0x0B1EA: "LVT",
-    0x0B1EB: "LVT",
-    0x0B1EC: "LVT",
-    0x0B1ED: "LVT",
-    0x0B1EE: "LVT",
-    0x0B1EF: "LVT",
-    0x0B1F0: "LVT",
-    0x0B1F1: "LVT",
-    0x0B1F2: "LVT",
-    0x0B1F3: "LVT",
-    0x0B1F4: "LVT",
-    0x0B1F5: "LVT",
-    0x0B1F6: "LVT",
-    0x0B1F7: "LVT",
-    0x0B1F8: "LVT",
-    0x0B1F9: "LVT",
-    0x0B1FA: "LVT",
-    0x0B1FB: "LVT",
-    0x0B1FC: "LVT",
-    0x0B1FD: "LVT",
-    0x0B1FE: "LVT",
-    0x0B1FF: "LVT",
-    0x0B200: "LVT",
-    0x0B201: "LVT",
-    0x0B202: "LVT",
-    0x0B203: "LVT",
-    0x0B205: "LVT",
-    0x0B206: "LVT",
-    0x0B207: "LVT",
-    0x0B208: "LVT",
-    0x0B209: "LVT",
-    0x0B20A: "LVT",
-    0x0B20B: "LVT",
-    0x0B20C: "LVT",
-    0x0B20D: "LVT",
-    0x0B20E: "LVT",
-    0x0B20F: "LVT",
-    0x0B210: "LVT",
-    0x0B211: "LVT",
-    0x0B212: "LVT",
-    0x0B213: "LVT",
-    0x0B214: "LVT",
-    0x0B215: "LVT",
-    0x0B216: "LVT",
-    0x0B217: "LVT",
-    0x0B218: "LVT",
-    0x0B219: "LVT",
-    0x0B21A: "LVT",
-    0x0B21B: "LVT",
-    0x0B21C: "LVT",
-    0x0B21D: "LVT",
-    0x0B21E: "LVT",
-    0x0B21F: "LVT",
-    0x0B221: "LVT",
-    0x0B222: "LVT",
-    0x0B223: "LVT",
-    0x0B224: "LVT",
-    0x0B225: "LVT",
-    0x0B226: "LVT",
-    0x0B227: "LVT",
-    0x0B228: "LVT",
-    0x0B229: "LVT",
-    0x0B22A: "LVT",
-    0x0B22B: "LVT",
-    0x0B22C: "LVT",
-    0x0B22D: "LVT",
-    0x0B22E: "LVT",
-    0x0B22F: "LVT",
-    0x0B230: "LVT",
-    0x0B231: "LVT",
-    0x0B232: "LVT",
-    0x0B233: "LVT",
-    0x0B234: "LVT",
-    0x0B235: "LVT",
-    0x0B236: "LVT",
-    0x0B237: "LVT",
-    0x0B238: "LVT",
-    0x0B239: "LVT",
-    0x0B23A: "LVT",
-    0x0B23B: "LVT",
-    0x0B23D: "LVT",
-    0x0B23E: "LVT",
-    0x0B23F: "LVT",
-    0x0B240: "LVT",
-    0x0B241: "LVT",
-    0x0B242: "LVT",
-    0x0B243: "LVT",
-    0x0B244: "LVT",
-    0x0B245: "LVT",
-    0x0B246: "LVT",
-    0x0B247: "LVT",
-    0x0B248: "LVT",
-    0x0B249: "LVT",
-    0x0B24A: "LVT",
-    0x0B24B: "LVT",
-    0x0B24C: "LVT",
-    0x0B24D: "LVT",
-    0x0B24E: "LVT",
-    0x0B24F: "LVT",
-    0x0B250: "LVT",
-    0x0B251: "LVT",
-    0x0B252: "LVT",
-    0x0B253: "LVT",
-    0x0B254: "LVT",
-    0x0B255: "LVT",
-    0x0B256: "LVT",
-    0x0B257: "LVT",
-    0x0B259: "LVT",
-    0x0B25A: "LVT",
-    0x0B25B: "LVT",
-    0x0B25C: "LVT",
-    0x0B25D: "LVT",
-    0x0B25E: "LVT",
-    0x0B25F: "LVT",
-    0x0B260: "LVT",
-    0x0B261: "LVT",
-    0x0B262: "LVT",
-    0x0B263: "LVT",
-    0x0B264: "LVT",
-    0x0B265: "LVT",
-    0x0B266: "LVT",
-    0x0B267: "LVT",
-    0x0B268: "LVT",
-    0x0B269: "LVT",
-    0x0B26A: "LVT",
-    0x0B26B: "LVT",
-    0x0B26C: "LVT",
-    0x0B26D: "LVT",
-    0x0B26E: "LVT",
-    0x0B26F: "LVT",
-    0x0B270: "LVT",
-    0x0B271: "LVT",
-    0x0B272: "LVT",
-    0x0B273: "LVT",
-    0x0B275: "LVT",
-    0x0B276: "LVT",
-    0x0B277: "LVT",
-    0x0B278: "LVT",
-    0x0B279: "LVT",
-    0x0B27A: "LVT",
-    0x0B27B: "LVT",
-    0x0B27C: "LVT",
-    0x0B27D: "LVT",
-    0x0B27E: "LVT",
-    0x0B27F: "LVT",
-    0x0B280: "LVT",
-    0x0B281: "LVT",
-    0x0B282: "LVT",
-    0x0B283: "LVT",
-    0x0B284: "LVT",
-    0x0B285: "LVT",
-    0x0B286: "LVT",
-    0x0B287: "LVT",
-    0x0B288: "LVT",
-    0x0B289: "LVT",
-    0x0B28A: "LVT",
-    0x0B28B: "LVT",
-    0x0B28C: "LVT",
-    0x0B28D: "LVT",
-    0x0B28E: "LVT",
-    0x0B28F: "LVT",
-    0x0B291: "LVT",
-    0x0B292: "LVT",
-    0x0B293: "LVT",
-    0x0B294: "LVT",
-    0x0B295: "LVT",
-    0x0B296: "LVT",
-    0x0B297: "LVT",
-    0x0B298: "LVT",
-    0x0B299: "LVT",
-    0x0B29A: "LVT",
-    0x0B29B: "LVT",
-    0x0B29C: "LVT",
-    0x0B29D: "LVT",
-    0x0B29E: "LVT",
-    0x0B29F: "LVT",
-    0x0B2A0: "LVT",
-    0x0B2A1: "LVT",
-    0x0B2A2: "LVT",
-    0x0B2A3: "LVT",
-    0x0B2A4: "LVT",
-    0x0B2A5: "LVT",
-    0x0B2A6: "LVT",
-    0x0B2A7: "LVT",
-    0x0B2A8: "LVT",
-    0x0B2A9: "LVT",
-    0x0B2AA: "LVT",
-    0x0B2AB: "LVT",
-    0x0B2AD: "LVT",
-    0x0B2AE: "LVT",
-    0x0B2AF: "LVT",
-    0x0B2B0: "LVT",
-    0x0B2B1: "LVT",
-    0x0B2B2: "LVT",
-    0x0B2B3: "LVT",
-    0x0B2B4: "LVT",
-    0x0B2B5: "LVT",
-    0x0B2B6: "LVT",
-    0x0B2B7: "LVT",
-    0x0B2B8: "LVT",
-    0x0B2B9: "LVT",
-    0x0B2BA: "LVT",
-    0x0B2BB: "LVT",
-    0x0B2BC: "LVT",
-    0x0B2BD: "LVT",
-    0x0B2BE: "LVT",
-    0x0B2BF: "LVT",
-    0x0B2C0: "LVT",
-    0x0B2C1: "LVT",
-    0x0B2C2: "LVT",
-    0x0B2C3: "LVT",
-    0x0B2C4: "LVT",
-    0x0B2C5: "LVT",
-    0x0B2C6: "LVT",
-    0x0B2C7: "LVT",
-    0x0B2C9: "LVT",
-    0x0B2CA: "LVT",
-    0x0B2CB: "LVT",
-    0x0B2CC: "LVT",
-    0x0B2CD: "LVT",
-    0x0B2CE: "LVT",
-    0x0B2CF: "LVT",
-    0x0B2D0: "LVT",
-    0x0B2D1: "LVT",
-    0x0B2D2: "LVT",
-    0x0B2D3: "LVT",
-    0x0B2D4: "LVT",
-    0x0B2D5: "LVT",
-    0x0B2D6: "LVT",
-    0x0B2D7: "LVT",
-    0x0B2D8: "LVT",
-    0x0B2D9: "LVT",
-    0x0B2DA: "LVT",
-    0x0B2DB: "LVT",
-    0x0B2DC: "LVT",
-    0x0B2DD: "LVT",
-    0x0B2DE: "LVT",
-    0x0B2DF: "LVT",
-    0x0B2E0: "LVT",
-    0x0B2E1: "LVT",
-    0x0B2E2: "LVT",
-    0x0B2E3: "LVT",
-    0x0B2E5: "LVT",
-    0x0B2E6: "LVT",
-    0x0B2E7: "LVT",
-    0x0B2E8: "LVT",
-    0x0B2E9: "LVT",
-    0x0B2EA: "LVT",
-    0x0B2EB: "LVT",
-    0x0B2EC: "LVT",
-    0x0B2ED: "LVT",
-    0x0B2EE: "LVT",
-    0x0B2EF: "LVT",
-    0x0B2F0: "LVT",
-    0x0B2F1: "LVT",
-    0x0B2F2: "LVT",
-    0x0B2F3: "LVT",
-    0x0B2F4: "LVT",
-    0x0B2F5: "LVT",
-    0x0B2F6: "LVT",
-    0x0B2F7: "LVT",
-    0x0B2F8: "LVT",
-    0x0B2F9: "LVT",
-    0x0B2FA: "LVT",
-    0x0B2FB: "LVT",
-    0x0B2FC: "LVT",
-    0x0B2FD: "LVT",
-    0x0B2FE: "LVT",
-    0x0B2FF: "LVT",
-    0x0B301: "LVT",
-    0x0B302: "LVT",
-    0x0B303: "LVT",
-    0x0B304: "LVT",
-    0x0B305: "LVT",
-    0x0B306: "LVT",
-    0x0B307: "LVT",
-    0x0B308: "LVT",
-    0x0B309: "LVT",
-    0x0B30A: "LVT",
-    0x0B30B: "LVT",
-    0x0B30C: "LVT",
-    0x0B30D: "LVT",
-    0x0B30E: "LVT",
-    0x0B30F: "LVT",
-    0x0B310: "LVT",
-    0x0B311: "LVT",
-    0x0B312: "LVT",
-    0x0B313: "LVT",
-    0x0B314: "LVT",
-    0x0B315: "LVT",
-    0x0B316: "LVT",
-    0x0B317: "LVT",
-    0x0B318: "LVT",
-    0x0B319: "LVT",
-    0x0B31A: "LVT",
-    0x0B31B: "LVT",
-    0x0B31D: "LVT",
-    0x0B31E: "LVT",
-    0x0B31F: "LVT",
-    0x0B320: "LVT",
-    0x0B321: "LVT",
-    0x0B322: "LVT",
-    0x0B323: "LVT",
-    0x0B324: "LVT",
-    0x0B325: "LVT",
-    0x0B326: "LVT",
-    0x0B327: "LVT",
-    0x0B328: "LVT",
-    0x0B329: "LVT",
-    0x0B32A: "LVT",
-    0x0B32B: "LVT",
-    0x0B32C: "LVT",
-    0x0B32D: "LVT",
-    0x0B32E: "LVT",
-    0x0B32F: "LVT",
-    0x0B330: "LVT",
-    0x0B331: "LVT",
-    0x0B332: "LVT",
-    0x0B333: "LVT",
-    0x0B334: "LVT",
-    0x0B335: "LVT",
-    0x0B336: "LVT",
-    0x0B337: "LVT",
-    0x0B339: "LVT",
-    0x0B33A: "LVT",
-    0x0B33B: "LVT",
-    0x0B33C: "LVT",
-    0x0B33D: "LVT",
-    0x0B33E: "LVT",
-    0x0B33F: "LVT",
-    0x0B340: "LVT",
-    0x0B341: "LVT",
-    0x0B342: "LVT",
-    0x0B343: "LVT",
-    0x0B344: "LVT",
-    0x0B345: "LVT",
-    0x0B346: "LVT",
-    0x0B347: "LVT",
-    0x0B348: "LVT",
-    0x0B349: "LVT",
-    0x0B34A: "LVT",
-    0x0B34B: "LVT",
-    0x0B34C: "LVT",
-    0x0B34D: "LVT",
-    0x0B34E: "LVT",
-    0x0B34F: "LVT",
-    0x0B350: "LVT",
-    0x0B351: "LVT",
-    0x0B352: "LVT",
-    0x0B353: "LVT",
-    0x0B355: "LVT",
-    0x0B356: "LVT",
-    0x0B357: "LVT",
-    0x0B358: "LVT",
-    0x0B359: "LVT",
-    0x0B35A: "LVT",
-    0x0B35B: "LVT",
-    0x0B35C: "LVT",
-    0x0B35D: "LVT",
-    0x0B35E: "LVT",
-    0x0B35F: "LVT",
-    0x0B360: "LVT",
-    0x0B361: "LVT",
-    0x0B362: "LVT",
-    0x0B363: "LVT",
-    0x0B364: "LVT",
-    0x0B365: "LVT",
-    0x0B366: "LVT",
-    0x0B367: "LVT",
-    0x0B368: "LVT",
-    0x0B369: "LVT",
-    0x0B36A: "LVT",
-    0x0B36B: "LVT",
-    0x0B36C: "LVT",
-    0x0B36D: "LVT",
-    0x0B36E: "LVT",
-    0x0B36F: "LVT",
-    0x0B371: "LVT",
-    0x0B372: "LVT",
-    0x0B373: "LVT",
-    0x0B374: "LVT",
-    0x0B375: "LVT",
-    0x0B376: "LVT",
-    0x0B377: "LVT",
-    0x0B378: "LVT",
-    0x0B379: "LVT",
-    0x0B37A: "LVT",
-    0x0B37B: "LVT",
-    0x0B37C: "LVT",
-    0x0B37D: "LVT",
-    0x0B37E: "LVT",
-    0x0B37F: "LVT",
-    0x0B380: "LVT",
-    0x0B381: "LVT",
-    0x0B382: "LVT",
-    0x0B383: "LVT",
-    0x0B384: "LVT",
-    0x0B385: "LVT",
-    0x0B386: "LVT",
-    0x0B387: "LVT",
-    0x0B388: "LVT",
-    0x0B389: "LVT",
-    0x0B38A: "LVT",
-    0x0B38B: "LVT",
-    0x0B38D: "LVT",
-    0x0B38E: "LVT",
-    0x0B38F: "LVT",
-    0x0B390: "LVT",
-    0x0B391: "LVT",
-    0x0B392: "LVT",
-    0x0B393: "LVT",
-    0x0B394: "LVT",
-    0x0B395: "LVT",
-    0x0B396: "LVT",
-    0x0B397: "LVT",
-    0x0B398: "LVT",
-    0x0B399: "LVT",
-    0x0B39A: "LVT",
-    0x0B39B: "LVT",
-    0x0B39C: "LVT",
-    0x0B39D: "LVT",
-    0x0B39E: "LVT",
-    0x0B39F: "LVT",
-    0x0B3A0: "LVT",
-    0x0B3A1: "LVT",
-    0x0B3A2: "LVT",
-    0x0B3A3: "LVT",
-    0x0B3A4: "LVT",
-    0x0B3A5: "LVT",
-    0x0B3A6: "LVT",
-    0x0B3A7: "LVT",
-    0x0B3A9: "LVT",
-    0x0B3AA: "LVT",
-    0x0B3AB: "LVT",
-    0x0B3AC: "LVT",
-    0x0B3AD: "LVT",
-    0x0B3AE: "LVT",
-    0x0B3AF: "LVT",
-    0x0B3B0: "LVT",
-    0x0B3B1: "LVT",
-    0x0B3B2: "LVT",
-    0x0B3B3: "LVT",
-    0x0B3B4: "LVT",
-    0x0B3B5: "LVT",
-    0x0B3B6: "LVT",
-    0x0B3B7: "LVT",
-    0x0B3B8: "LVT",
-    0x0B3B9: "LVT",
-    0x0B3BA: "LVT",
-    0x0B3BB: "LVT",
-    0x0B3BC: "LVT",
-    0x0B3BD: "LVT",
-    0x0B3BE: "LVT",
-    0x0B3BF: "LVT",
-    0x0B3C0: "LVT",
-    0x0B3C1: "LVT",
-    0x0B3C2: "LVT",
-    0x0B3C3: "LVT",
-    0x0B3C5: "LVT",
-    0x0B3C6: "LVT",
-    0x0B3C7: "LVT",
-    0x0B3C8: "LVT",
-    0x0B3C9: "LVT",
-    0x0B3CA: "LVT",
-    0x0B3CB: "LVT",
-    0x0B3CC: "LVT",
-    0x0B3CD: "LVT",
-    0x0B3CE: "LVT",
-    0x0B3CF: "LVT",
-    0x0B3D0: "LVT",
-    0x0B3D1: "LVT",
-    0x0B3D2: "LVT",
-    0x0B3D3: "LVT",
-    0x0B3D4: "LVT",
-    0x0B3D5: "LVT",
-    0x0B3D6: "LVT",
-    0x0B3D7: "LVT",
-    0x0B3D8: "LVT",
-    0x0B3D9: "LVT",
-    0x0B3DA: "LVT",
-    0x0B3DB: "LVT",
-    0x0B3DC: "LVT",
-    0x0B3DD: "LVT",
-    0x0B3DE: "LVT",
-    0x0B3DF: "LVT",
-    0x0B3E1: "LVT",
-    0x0B3E2: "LVT",
-    0x0B3E3: "LVT",
-    0x0B3E4: "LVT",
-    0x0B3E5: "LVT",
-    0x0B3E6: "LVT",
-    0x0B3E7: "LVT",
-    0x0B3E8: "LVT",
-    0x0B3E9: "LVT",
-    0x0B3EA: "LVT",
-    0x0B3EB: "LVT",
-    0x0B3EC: "LVT",
-    0x0B3ED: "LVT",
-    0x0B3EE: "LVT",
-    0x0B3EF: "LVT",
-    0x0B3F0: "LVT",
-    0x0B3F1: "LVT",
-    0x0B3F2: "LVT",
-    0x0B3F3: "LVT",
-    0x0B3F4: "LVT",
-    0x0B3F5: "LVT",
-    0x0B3F6: "LVT",
-    0x0B3F7: "LVT",
-    0x0B3F8: "LVT",
-    0x0B3F9: "LVT",
-    0x0B3FA: "LVT",
-    0x0B3FB: "LVT",
-    0x0B3FD: "LVT",
-    0x0B3FE: "LVT",
-    0x0B3FF: "LVT",
-    0x0B400: "LVT",
-    0x0B401: "LVT",
-    0x0B402: "LVT",
-    0x0B403: "LVT",
-    0x0B404: "LVT",
-    0x0B405: "LVT",
-    0x0B406: "LVT",
-    0x0B407: "LVT",
-    0x0B408: "LVT",
-    0x0B409: "LVT",
-    0x0B40A: "LVT",
-    0x0B40B: "LVT",
-    0x0B40C: "LVT",
-    0x0B40D: "LVT",
-    0x0B40E: "LVT",
-    0x0B40F: "LVT",
-    0x0B410: "LVT",
-    0x0B411: "LVT",
-    0x0B412: "LVT",
-    0x0B413: "LVT",
-    0x0B414: "LVT",
-    0x0B415: "LVT",
-    0x0B416: "LVT",
-    0x0B417: "LVT",
-    0x0B419: "LVT",
-    0x0B41A: "LVT",
-    0x0B41B: "LVT",
-    0x0B41C: "LVT",
-    0x0B41D: "LVT",
-    0x0B41E: "LVT",
-    0x0B41F: "LVT",
-    0x0B420: "LVT",
-    0x0B421: "LVT",
-    0x0B422: "LVT",
-    0x0B423: "LVT",
-    0x0B424: "LVT",
-    0x0B425: "LVT",
-    0x0B426: "LVT",
-    0x0B427: "LVT",
-    0x0B428: "LVT",
-    0x0B429: "LVT",
-    0x0B42A: "LVT",
-    0x0B42B: "LVT",
-    0x0B42C: "LVT",
-    0x0B42D: "LVT",
-    0x0B42E: "LVT",
-    0x0B42F: "LVT",
-    0x0B430: "LVT",
-    0x0B431: "LVT",
-    0x0B432: "LVT",
-    0x0B433: "LVT",
-    0x0B435: "LVT",
-    0x0B436: "LVT",
-    0x0B437: "LVT",
-    0x0B438: "LVT",
-    0x0B439: "LVT",
-    0x0B43A: "LVT",
-    0x0B43B: "LVT",
-    0x0B43C: "LVT",
-    0x0B43D: "LVT",
-    0x0B43E: "LVT",
-    0x0B43F: "LVT",
-    0x0B440: "LVT",
-    0x0B441: "LVT",
-    0x0B442: "LVT",
-    0x0B443: "LVT",
-    0x0B444: "LVT",
-    0x0B445: "LVT",
-    0x0B446: "LVT",
-    0x0B447: "LVT",
-    0x0B448: "LVT",
-    0x0B449: "LVT",
-    0x0B44A: "LVT",
-    0x0B44B: "LVT",
-    0x0B44C: "LVT",
-    0x0B44D: "LVT",
-    0x0B44E: "LVT",
-    0x0B44F: "LVT",
-    0x0B451: "LVT",
-    0x0B452: "LVT",
-    0x0B453: "LVT",
-    0x0B454: "LVT",
-    0x0B455: "LVT",
-    0x0B456: "LVT",
-    0x0B457: "LVT",
-    0x0B458: "LVT",
-    0x0B459: "LVT",
-    0x0B45A: "LVT",
-    0x0B45B: "LVT",
-    0x0B45C: "LVT",
-    0x0B45D: "LVT",
-    0x0B45E: "LVT",
-    0x0B45F: "LVT",
-    0x0B460: "LVT",
-    0x0B461: "LVT",
-    0x0B462: "LVT",
-    0x0B463: "LVT",
-    0x0B464: "LVT",
-    0x0B465: "LVT",
-    0x0B466: "LVT",
-    0x0B467: "LVT",
-    0x0B468: "LVT",
-    0x0B469: "LVT",
-    0x0B46A: "LVT",
-    0x0B46B: "LVT",
-    0x0B46D: "LVT",
-    0x0B46E: "LVT",
-    0x0B46F: "LVT",
-    0x0B470: "LVT",
-    0x0B471: "LVT",
-    0x0B472: "LVT",
-    0x0B473: "LVT",
-    0x0B474: "LVT",
-    0x0B475: "LVT",
-    0x0B476: "LVT",
-    0x0B477: "LVT",
-    0x0B478: "LVT",
-    0x0B479: "LVT",
-    0x0B47A: "LVT",
-    0x0B47B: "LVT",
-    0x0B47C: "LVT",
-    0x0B47D: "LVT",
-    0x0B47E: "LVT",
-    0x0B47F: "LVT",
-    0x0B480: "LVT",
-    0x0B481: "LVT",
-    0x0B482: "LVT",
-    0x0B483: "LVT",
-    0x0B484: "LVT",
-    0x0B485: "LVT",
-    0x0B486: "LVT",
-    0x0B487: "LVT",
-    0x0B489: "LVT",
-    0x0B48A: "LVT",
-    0x0B48B: "LVT",
-    0x0B48C: "LVT",
-    0x0B48D: "LVT",
-    0x0B48E: "LVT",
-    0x0B48F: "LVT",
-    0x0B490: "LVT",
-    0x0B491: "LVT",
-    0x0B492: "LVT",
-    0x0B493: "LVT",
-    0x0B494: "LVT",
-    0x0B495: "LVT",
-    0x0B496: "LVT",
-    0x0B497: "LVT",
-    0x0B498: "LVT",
-    0x0B499: "LVT",
-    0x0B49A: "LVT",
-    0x0B49B: "LVT",
-    0x0B49C: "LVT",
-    0x0B49D: "LVT",
-    0x0B49E: "LVT",
-    0x0B49F: "LVT",
-    0x0B4A0: "LVT",
-    0x0B4A1: "LVT",
-    0x0B4A2: "LVT",
-    0x0B4A3: "LVT",
-    0x0B4A5: "LVT",
-    0x0B4A6: "LVT",
-    0x0B4A7: "LVT",
-    0x0B4A8: "LVT",
-    0x0B4A9: "LVT",
-    0x0B4AA: "LVT",
-    0x0B4AB: "LVT",
-    0x0B4AC: "LVT",
-    0x0B4AD: "LVT",
-    0x0B4AE: "LVT",
-    0x0B4AF: "LVT",
-    0x0B4B0: "LVT",
-    0x0B4B1: "LVT",
-    0x0B4B2: "LVT",
-    0x0B4B3: "LVT",
-    0x0B4B4: "LVT",
-    0x0B4B5: "LVT",
-    0x0B4B6: "LVT",
-    0x0B4B7: "LVT",
-    0x0B4B8: "LVT",
-    0x0B4B9: "LVT",
-    0x0B4BA: "LVT",
-    0x0B4BB: "LVT",
-    0x0B4BC: "LVT",
-    0x0B4BD: "LVT",
-    0x0B4BE: "LVT",
-    0x0B4BF: "LVT",
-    0x0B4C1: "LVT",
-    0x0B4C2: "LVT",
-    0x0B4C3: "LVT",
-    0x0B4C4: "LVT",
-    0x0B4C5: "LVT",
-    0x0B4C6: "LVT",
-    0x0B4C7: "LVT",
-    0x0B4C8: "LVT",
-    0x0B4C9: "LVT",
-    0x0B4CA: "LVT",
-    0x0B4CB: "LVT",
-    0x0B4CC: "LVT",
-    0x0B4CD: "LVT",
-    0x0B4CE: "LVT",
-    0x0B4CF: "LVT",
-    0x0B4D0: "LVT",
-    0x0B4D1: "LVT",
-    0x0B4D2: "LVT",
-    0x0B4D3: "LVT",
-    0x0B4D4: "LVT",
-    0x0B4D5: "LVT",
-    0x0B4D6: "LVT",
-    0x0B4D7: "LVT",
-    0x0B4D8: "LVT",
-    0x0B4D9: "LVT",
-    0x0B4DA: "LVT",
-    0x0B4DB: "LVT",
-    0x0B4DD: "LVT",
-    0x0B4DE: "LVT",
-    0x0B4DF: "LVT",
-    0x0B4E0: "LVT",
-    0x0B4E1: "LVT",
-    0x0B4E2: "LVT",
-    0x0B4E3: "LVT",
-    0x0B4E4: "LVT",
-    0x0B4E5: "LVT",
-    0x0B4E6: "LVT",
-    0x0B4E7: "LVT",
-    0x0B4E8: "LVT",
-    0x0B4E9: "LVT",
-    0x0B4EA: "LVT",
-    0x0B4EB: "LVT",
-    0x0B4EC: "LVT",
-    0x0B4ED: "LVT",
-    0x0B4EE: "LVT",
-    0x0B4EF: "LVT",
-    0x0B4F0: "LVT",
-    0x0B4F1: "LVT",
-    0x0B4F2: "LVT",
-    0x0B4F3: "LVT",
-    0x0B4F4: "LVT",
-    0x0B4F5: "LVT",
-    0x0B4F6: "LVT",
-    0x0B4F7: "LVT",
-    0x0B4F9: "LVT",
-    0x0B4FA: "LVT",
-    0x0B4FB: "LVT",
-    0x0B4FC: "LVT",
-    0x0B4FD: "LVT",
-    0x0B4FE: "LVT",
-    0x0B4FF: "LVT",
-    0x0B500: "LVT",
-    0x0B501: "LVT",
-    0x0B502: "LVT",
-    0x0B503: "LVT",
-    0x0B504: "LVT",
-    0x0B505: "LVT",
-    0x0B506: "LVT",
-    0x0B507: "LVT",
-    0x0B508: "LVT",
-    0x0B509: "LVT",
-    0x0B50A: "LVT",
-    0x0B50B: "LVT",
-    0x0B50C: "LVT",
-    0x0B50D: "LVT",
-    0x0B50E: "LVT",
-    0x0B50F: "LVT",
-    0x0B510: "LVT",
-    0x0B511: "LVT",
-    0x0B512: "LVT",
-    0x0B513: "LVT",
-    0x0B515: "LVT",
-    0x0B516: "LVT",
-    0x0B517: "LVT",
-    0x0B518: "LVT",
-    0x0B519: "LVT",
-    0x0B51A: "LVT",
-    0x0B51B: "LVT",
-    0x0B51C: "LVT",
-    0x0B51D: "LVT",
-    0x0B51E: "LVT",
-    0x0B51F: "LVT",
-    0x0B520: "LVT",
-    0x0B521: "LVT",
-    0x0B522: "LVT",
-    0x0B523: "LVT",
-    0x0B524: "LVT",
-    0x0B525: "LVT",
-    0x0B526: "LVT",
-    0x0B527: "LVT",
-    0x0B528: "LVT",
-    0x0B529: "LVT",
-    0x0B52A: "LVT",
-    0x0B52B: "LVT",
-    0x0B52C: "LVT",
-    0x0B52D: "LVT",
-    0x0B52E: "LVT",
-    0x0B52F: "LVT",
-    0x0B531: "LVT",
-    0x0B532: "LVT",
-    0x0B533: "LVT",
-    0x0B534: "LVT",
-    0x0B535: "LVT",
-    0x0B536: "LVT",
-    0x0B537: "LVT",
-    0x0B538: "LVT",
-    0x0B539: "LVT",
-    0x0B53A: "LVT",
-    0x0B53B: "LVT",
-    0x0B53C: "LVT",
-    0x0B53D: "LVT",
-    0x0B53E: "LVT",
-    0x0B53F: "LVT",
-    0x0B540: "LVT",
-    0x0B541: "LVT",
-    0x0B542: "LVT",
-    0x0B543: "LVT",
-    0x0B544: "LVT",
-    0x0B545: "LVT",
-    0x0B546: "LVT",
-    0x0B547: "LVT",
-    0x0B548: "LVT",
-    0x0B549: "LVT",
-    0x0B54A: "LVT",
-    0x0B54B: "LVT",
-    0x0B54D: "LVT",
-    0x0B54E: "LVT",
-    0x0B54F: "LVT",
-    0x0B550: "LVT",
-    0x0B551: "LVT",
-    0x0B552: "LVT",
-    0x0B553: "LVT",
-    0x0B554: "LVT",
-    0x0B555: "LVT",
-    0x0B556: "LVT",
-    0x0B557: "LVT",
-    0x0B558: "LVT",
-    0x0B559: "LVT",
-    0x0B55A: "LVT",
-    0x0B55B: "LVT",
-    0x0B55C: "LVT",
-    0x0B55D: "LVT",
-    0x0B55E: "LVT",
-    0x0B55F: "LVT",
-    0x0B560: "LVT",
-    0x0B561: "LVT",
-    0x0B562: "LVT",
-    0x0B563: "LVT",
-    0x0B564: "LVT",
-    0x0B565: "LVT",
-    0x0B566: "LVT",
-    0x0B567: "LVT",
-    0x0B569: "LVT",
-    0x0B56A: "LVT",
-    0x0B56B: "LVT",
-    0x0B56C: "LVT",
-    0x0B56D: "LVT",
-    0x0B56E: "LVT",
-    0x0B56F: "LVT",
-    0x0B570: "LVT",
-    0x0B571: "LVT",
-    0x0B572: "LVT",
-    0x0B573: "LVT",
-    0x0B574: "LVT",
-    0x0B575: "LVT",
-    0x0B576: "LVT",
-    0x0B577: "LVT",
-    0x0B578: "LVT",
-    0x0B579: "LVT",
-    0x0B57A: "LVT",
-    0x0B57B: "LVT",
-    0x0B57C: "LVT",
-    0x0B57D: "LVT",
-    0x0B57E: "LVT",
-    0x0B57F: "LVT",
-    0x0B580: "LVT",
-    0x0B581: "LVT",
-    0x0B582: "LVT",
-    0x0B583: "LVT",
-    0x0B585: "LVT",
-    0x0B586: "LVT",
-    0x0B587: "LVT",
-    0x0B588: "LVT",
-    0x0B589: "LVT",
-    0x0B58A: "LVT",
-    0x0B58B: "LVT",
-    0x0B58C: "LVT",
-    0x0B58D: "LVT",
-    0x0B58E: "LVT",
-    0x0B58F: "LVT",
-    0x0B590: "LVT",
-    0x0B591: "LVT",
-    0x0B592: "LVT",
-    0x0B593: "LVT",
-    0x0B594: "LVT",
-    0x0B595: "LVT",
-    0x0B596: "LVT",
-    0x0B597: "LVT",
-    0x0B598: "LVT",
-    0x0B599: "LVT",
-    0x0B59A: "LVT",
-    0x0B59B: "LVT",
-    0x0B59C: "LVT",
-    0x0B59D: "LVT",
-    0x0B59E: "LVT",
-    0x0B59F: "LVT",
-    0x0B5A1: "LVT",
-    0x0B5A2: "LVT",
-    0x0B5A3: "LVT",
-    0x0B5A4: "LVT",
-    0x0B5A5: "LVT",
-    0x0B5A6: "LVT",
-    0x0B5A7: "LVT",
-    0x0B5A8: "LVT",
-    0x0B5A9: "LVT",
-    0x0B5AA: "LVT",
-    0x0B5AB: "LVT",
-    0x0B5AC: "LVT",
-    0x0B5AD: "LVT",
-    0x0B5AE: "LVT",
-    0x0B5AF: "LVT",
-    0x0B5B0: "LVT",
-    0x0B5B1: "LVT",
-    0x0B5B2: "LVT",
-    0x0B5B3: "LVT",
-    0x0B5B4: "LVT",
-    0x0B5B5: "LVT",
-    0x0B5B6: "LVT",
-    0x0B5B7: "LVT",
-    0x0B5B8: "LVT",
-    0x0B5B9: "LVT",
-    0x0B5BA: "LVT",
-    0x0B5BB: "LVT",
-    0x0B5BD: "LVT",
-    0x0B5BE: "LVT",
-    0x0B5BF: "LVT",
-    0x0B5C0: "LVT",
-    0x0B5C1: "LVT",
-    0x0B5C2: "LVT",
-    0x0B5C3: "LVT",
-    0x0B5C4: "LVT",
-    0x0B5C5: "LVT",
-    0x0B5C6: "LVT",
-    0x0B5C7: "LVT",
-    0x0B5C8: "LVT",
-    0x0B5C9: "LVT",
-    0x0B5CA: "LVT",
-    0x0B5CB: "LVT",
-    0x0B5CC: "LVT",
-    0x0B5CD: "LVT",
-    0x0B5CE: "LVT",
-    0x0B5CF: "LVT",
-    0x0B5D0: "LVT",
-    0x0B5D1: "LVT",
-    0x0B5D2: "LVT",
-    0x0B5D3: "LVT",
-    0x0B5D4: "LVT",
-    0x0B5D5: "LVT",
-    0x0B5D6: "LVT",
-    0x0B5D7: "LVT",
-    0x0B5D9: "LVT",
-    0x0B5DA: "LVT",
-    0x0B5DB: "LVT",
-    0x0B5DC: "LVT",
-    0x0B5DD: "LVT",
-    0x0B5DE: "LVT",
-    0x0B5DF: "LVT",
-    0x0B5E0: "LVT",
-    0x0B5E1: "LVT",
-    0x0B5E2: "LVT",
-    0x0B5E3: "LVT",
-    0x0B5E4: "LVT",
-    0x0B5E5: "LVT",
-    0x0B5E6: "LVT",
-    0x0B5E7: "LVT",
-    0x0B5E8: "LVT",
-    0x0B5E9: "LVT",
-    0x0B5EA: "LVT",
-    0x0B5EB: "LVT",
-    0x0B5EC: "LVT",
-    0x0B5ED: "LVT",
-    0x0B5EE: "LVT",
-    0x0B5EF: "LVT",
-    0x0B5F0: "LVT",
-    0x0B5F1: "LVT",
-    0x0B5F2: "LVT",
-    0x0B5F3: "LVT",
-    0x0B5F5: "LVT",
-    0x0B5F6: "LVT",
-    0x0B5F7: "LVT",
-    0x0B5F8: "LVT",
-    0x0B5F9: "LVT",
-    0x0B5FA: "LVT",
-    0x0B5FB: "LVT",
-    0x0B5FC: "LVT",
-    0x0B5FD: "LVT",
-    0x0B5FE: "LVT",
-    0x0B5FF: "LVT",
-    0x0B600: "LVT",
-    0x0B601: "LVT",
-    0x0B602: "LVT",
-    0x0B603: "LVT",
-    0x0B604: "LVT",
-    0x0B605: "LVT",
-    0x0B606: "LVT",
-    0x0B607: "LVT",
-    0x0B608: "LVT",
-    0x0B609: "LVT",
-    0x0B60A: "LVT",
-    0x0B60B: "LVT",
-    0x0B60C: "LVT",
-    0x0B60D: "LVT",
-    0x0B60E: "LVT",
-    0x0B60F: "LVT",
-    0x0B611: "LVT",
-    0x0B612: "LVT",
-    0x0B613: "LVT",
-    0x0B614: "LVT",
-    0x0B615: "LVT",
-    0x0B616: "LVT",
-    0x0B617: "LVT",
-    0x0B618: "LVT",
-    0x0B619: "LVT",
-    0x0B61A: "LVT",
-    0x0B61B: "LVT",
-    0x0B61C: "LVT",
-    0x0B61D: "LVT",
-    0x0B61E: "LVT",
-    0x0B61F: "LVT",
-    0x0B620: "LVT",
-    0x0B621: "LVT",
-    0x0B622: "LVT",
-    0x0B623: "LVT",
-    0x0B624: "LVT",
-    0x0B625: "LVT",
-    0x0B626: "LVT",
-    0x0B627: "LVT",
-    0x0B628: "LVT",
-    0x0B629: "LVT",
-    0x0B62A: "LVT",
-    0x0B62B: "LVT",
-    0x0B62D: "LVT",
-    0x0B62E: "LVT",
-    0x0B62F: "LVT",
-    0x0B630: "LVT",
-    0x0B631: "LVT",
-    0x0B632: "LVT",
-    0x0B633: "LVT",
-    0x0B634: "LVT",
-    0x0B635: "LVT",
-    0x0B636: "LVT",
-    0x0B637: "LVT",
-    0x0B638: "LVT",
-    0x0B639: "LVT",
-    0x0B63A: "LVT",
-    0x0B63B: "LVT",
-    0x0B63C: "LVT",
-    0x0B63D: "LVT",
-    0x0B63E: "LVT",
-    0x0B63F: "LVT",
-    0x0B640: "LVT",
-    0x0B641: "LVT",
-    0x0B642: "LVT",
-    0x0B643: "LVT",
-    0x0B644: "LVT",
-    0x0B645: "LVT",
-    0x0B646: "LVT",
-    0x0B647: "LVT",
-    0x0B649: "LVT",
-    0x0B64A: "LVT",
-    0x0B64B: "LVT",
-    0x0B64C: "LVT",
-    0x0B64D: "LVT",
-    0x0B64E: "LVT",
-    0x0B64F: "LVT",
-    0x0B650: "LVT",
-    0x0B651: "LVT",
-    0x0B652: "LVT",
-    0x0B653: "LVT",
-    0x0B654: "LVT",
-    0x0B655: "LVT",
-    0x0B656: "LVT",
-    0x0B657: "LVT",
-    0x0B658: "LVT",
-    0x0B659: "LVT",
-    0x0B65A: "LVT",
-    0x0B65B: "LVT",
-    0x0B65C: "LVT",
-    0x0B65D: "LVT",
-    0x0B65E: "LVT",
-    0x0B65F: "LVT",
-    0x0B660: "LVT",
-    0x0B661: "LVT",
-    0x0B662: "LVT",
-    0x0B663: "LVT",
-    0x0B665: "LVT",
-    0x0B666: "LVT",
-    0x0B667: "LVT",
-    0x0B668: "LVT",
-    0x0B669: "LVT",
-    0x0B66A: "LVT",
-    0x0B66B: "LVT",
-    0x0B66C: "LVT",
-    0x0B66D: "LVT",
-    0x0B66E: "LVT",
-    0x0B66F: "LVT",
-    0x0B670: "LVT",
-    0x0B671: "LVT",
-    0x0B672: "LVT",
-    0x0B673: "LVT",
-    0x0B674: "LVT",
-    0x0B675: "LVT",
-    0x0B676: "LVT",
-    0x0B677: "LVT",
-    0x0B678: "LVT",
-    0x0B679: "LVT",
-    0x0B67A: "LVT",
-    0x0B67B: "LVT",
-    0x0B67C: "LVT",
-    0x0B67D: "LVT",
-    0x0B67E: "LVT",
-    0x0B67F: "LVT",
-    0x0B681: "LVT",
-    0x0B682: "LVT",
-    0x0B683: "LVT",
-    0x0B684: "LVT",
-    0x0B685: "LVT",
-    0x0B686: "LVT",
-    0x0B687: "LVT",
-    0x0B688: "LVT",
-    0x0B689: "LVT",
-    0x0B68A: "LVT",
-    0x0B68B: "LVT",
-    0x0B68C: "LVT",
-    0x0B68D: "LVT",
-    0x0B68E: "LVT",
-    0x0B68F: "LVT",
-    0x0B690: "LVT",
-    0x0B691: "LVT",
-    0x0B692: "LVT",
-    0x0B693: "LVT",
-    0x0B694: "LVT",
-    0x0B695: "LVT",
-    0x0B696: "LVT",
-    0x0B697: "LVT",
-    0x0B698: "LVT",
-    0x0B699: "LVT",
-    0x0B69A: "LVT",
-    0x0B69B: "LVT",
-    0x0B69D: "LVT",
-    0x0B69E: "LVT",
-    0x0B69F: "LVT",
-    0x0B6A0: "LVT",
-    0x0B6A1: "LVT",
-    0x0B6A2: "LVT",
-    0x0B6A3: "LVT",
-    0x0B6A4: "LVT",
-    0x0B6A5: "LVT",
-    0x0B6A6: "LVT",
-    0x0B6A7: "LVT",
-    0x0B6A8: "LVT",
-    0x0B6A9: "LVT",
-    0x0B6AA: "LVT",
-    0x0B6AB: "LVT",
-    0x0B6AC: "LVT",
-    0x0B6AD: "LVT",
-    0x0B6AE: "LVT",
-    0x0B6AF: "LVT",
-    0x0B6B0: "LVT",
-    0x0B6B1: "LVT",
-    0x0B6B2: "LVT",
-    0x0B6B3: "LVT",
-    0x0B6B4: "LVT",
-    0x0B6B5: "LVT",
-    0x0B6B6: "LVT",
-    0x0B6B7: "LVT",
-    0x0B6B9: "LVT",
-    0x0B6BA: "LVT",
-    0x0B6BB: "LVT",
-    0x0B6BC: "LVT",
-    0x0B6BD: "LVT",
-    0x0B6BE: "LVT",
-    0x0B6BF: "LVT",
-    0x0B6C0: "LVT",
-    0x0B6C1: "LVT",
-    0x0B6C2: "LVT",
-    0x0B6C3: "LVT",
-    0x0B6C4: "LVT",
-    0x0B6C5: "LVT",
-    0x0B6C6: "LVT",
-    0x0B6C7: "LVT",
-    0x0B6C8: "LVT",
-    0x0B6C9: "LVT",
-    0x0B6CA: "LVT",
-    0x0B6CB: "LVT",
-    0x0B6CC: "LVT",
-    0x0B6CD: "LVT",
-    0x0B6CE: "LVT",
-    0x0B6CF: "LVT",
-    0x0B6D0: "LVT",
-    0x0B6D1: "LVT",
-    0x0B6D2: "LVT",
-    0x0B6D3: "LVT",
-    0x0B6D5: "LVT",
-    0x0B6D6: "LVT",
-    0x0B6D7: "LVT",
-    0x0B6D8: "LVT",
-    0x0B6D9: "LVT",
-    0x0B6DA: "LVT",
-    0x0B6DB: "LVT",
-    0x0B6DC: "LVT",
-    0x0B6DD: "LVT",
-    0x0B6DE: "LVT",
-    0x0B6DF: "LVT",
-    0x0B6E0: "LVT",
-    0x0B6E1: "LVT",
-    0x0B6E2: "LVT",
-    0x0B6E3: "LVT",
-    0x0B6E4: "LVT",
-    0x0B6E5: "LVT",
-    0x0B6E6: "LVT",
-    0x0B6E7: "LVT",
-    0x0B6E8: "LVT",
-    0x0B6E9: "LVT",
-    0x0B6EA: "LVT",
-    0x0B6EB: "LVT",
-    0x0B6EC: "LVT",
-    0x0B6ED: "LVT",
-    0x0B6EE: "LVT",
-    0x0B6EF: "LVT",
-    0x0B6F1: "LVT",
-    0x0B6F2: "LVT",
-    0x0B6F3: "LVT",
-    0x0B6F4: "LVT",
-    0x0B6F5: "LVT",
-    0x0B6F6: "LVT",
-    0x0B6F7: "LVT",
-    0x0B6F8: "LVT",
-    0x0B6F9: "LVT",
-    0x0B6FA: "LVT",
-    0x0B6FB: "LVT",
-    0x0B6FC: "LVT",
-    0x0B6FD: "LVT",
-    0x0B6FE: "LVT",
-    0x0B6FF: "LVT",
-    0x0B700: "LVT",
-    0x0B701: "LVT",
-    0x0B702: "LVT",
-    0x0B703: "LVT",
-    0x0B704: "LVT",
-    0x0B705: "LVT",
-    0x0B706: "LVT",
-    0x0B707: "LVT",
-    0x0B708: "LVT",
-    0x0B709: "LVT",
-    0x0B70A: "LVT",
-    0x0B70B: "LVT",
-    0x0B70D: "LVT",
-    0x0B70E: "LVT",
-    0x0B70F: "LVT",
-    0x0B710: "LVT",
-    0x0B711: "LVT",
-    0x0B712: "LVT",
-    0x0B713: "LVT",
-    0x0B714: "LVT",
-    0x0B715: "LVT",
-    0x0B716: "LVT",
-    0x0B717: "LVT",
-    0x0B718: "LVT",
-    0x0B719: "LVT",
-    0x0B71A: "LVT",
-    0x0B71B: "LVT",
-    0x0B71C: "LVT",
-    0x0B71D: "LVT",
-    0x0B71E: "LVT",
-    0x0B71F: "LVT",
-    0x0B720: "LVT",
-    0x0B721: "LVT",
-    0x0B722: "LVT",
-    0x0B723: "LVT",
-    0x0B724: "LVT",
-    0x0B725: "LVT",
-    0x0B726: "LVT",
-    0x0B727: "LVT",
-    0x0B729: "LVT",
-    0x0B72A: "LVT",
-    0x0B72B: "LVT",
-    0x0B72C: "LVT",
-    0x0B72D: "LVT",
-    0x0B72E: "LVT",
-    0x0B72F: "LVT",
-    0x0B730: "LVT",
-    0x0B731: "LVT",
-    0x0B732: "LVT",
-    0x0B733: "LVT",
-    0x0B734: "LVT",
-    0x0B735: "LVT",
-    0x0B736: "LVT",
-    0x0B737: "LVT",
-    0x0B738: "LVT",
-    0x0B739: "LVT",
-    0x0B73A: "LVT",
-    0x0B73B: "LVT",
-    0x0B73C: "LVT",
-    0x0B73D: "LVT",
-    0x0B73E: "LVT",
-    0x0B73F: "LVT",
-    0x0B740: "LVT",
-    0x0B741: "LVT",
-    0x0B742: "LVT",
-    0x0B743: "LVT",
-    0x0B745: "LVT",
-    0x0B746: "LVT",
-    0x0B747: "LVT",
-    0x0B748: "LVT",
-    0x0B749: "LVT",
-    0x0B74A: "LVT",
-    0x0B74B: "LVT",
-    0x0B74C: "LVT",
-    0x0B74D: "LVT",
-    0x0B74E: "LVT",
-    0x0B74F: "LVT",
-    0x0B750: "LVT",
-    0x0B751: "LVT",
-    0x0B752: "LVT",
-    0x0B753: "LVT",
-    0x0B754: "LVT",
-    0x0B755: "LVT",
-    0x0B756: "LVT",
-    0x0B757: "LVT",
-    0x0B758: "LVT",
-    0x0B759: "LVT",
-    0x0B75A: "LVT",
-    0x0B75B: "LVT",
-    0x0B75C: "LVT",
-    0x0B75D: "LVT",
-    0x0B75E: "LVT",
-    0x0B75F: "LVT",
-    0x0B761: "LVT",
-    0x0B762: "LVT",
-    0x0B763: "LVT",
-    0x0B764: "LVT",
-    0x0B765: "LVT",
-    0x0B766: "LVT",
-    0x0B767: "LVT",
-    0x0B768: "LVT",
-    0x0B769: "LVT",
-    0x0B76A: "LVT",
-    0x0B76B: "LVT",
-    0x0B76C: "LVT",
-    0x0B76D: "LVT",
-    0x0B76E: "LVT",
-    0x0B76F: "LVT",
-    0x0B770: "LVT",
-    0x0B771: "LVT",
-    0x0B772: "LVT",
-    0x0B773: "LVT",
-    0x0B774: "LVT",
-    0x0B775: "LVT",
-    0x0B776: "LVT",
-    0x0B777: "LVT",
-    0x0B778: "LVT",
-    0x0B779: "LVT",
-    0x0B77A: "LVT",
-    0x0B77B: "LVT",
-    0x0B77D: "LVT",
-    0x0B77E: "LVT",
-    0x0B77F: "LVT",
-    0x0B780: "LVT",
-    0x0B781: "LVT",
-    0x0B782: "LVT",
-    0x0B783: "LVT",
-    0x0B784: "LVT",
-    0x0B785: "LVT",
-    0x0B786: "LVT",
-    0x0B787: "LVT",
-    0x0B788: "LVT",
-    0x0B789: "LVT",
-    0x0B78A: "LVT",
-    0x0B78B: "LVT",
-    0x0B78C: "LVT",
-    0x0B78D: "LVT",
-    0x0B78E: "LVT",
-    0x0B78F: "LVT",
-    0x0B790: "LVT",
-    0x0B791: "LVT",
-    0x0B792: "LVT",
-    0x0B793: "LVT",
-    0x0B794: "LVT",
-    0x0B795: "LVT",
-    0x0B796: "LVT",
-    0x0B797: "LVT",
-    0x0B799: "LVT",
-    0x0B79A: "LVT",
-    0x0B79B: "LVT",
-    0x0B79C: "LVT",
-    0x0B79D: "LVT",
-    0x0B79E: "LVT",
-    0x0B79F: "LVT",
-    0x0B7A0: "LVT",
-    0x0B7A1: "LVT",
-    0x0B7A2: "LVT",
-    0x0B7A3: "LVT",
-    0x0B7A4: "LVT",
-    0x0B7A5: "LVT",
-    0x0B7A6: "LVT",
-    0x0B7A7: "LVT",
-    0x0B7A8: "LVT",
-    0x0B7A9: "LVT",
-    0x0B7AA: "LVT",
-    0x0B7AB: "LVT",
-    0x0B7AC: "LVT",
-    0x0B7AD: "LVT",
-    0x0B7AE: "LVT",
-    0x0B7AF: "LVT",
-    0x0B7B0: "LVT",
-    0x0B7B1: "LVT",
-    0x0B7B2: "LVT",
-    0x0B7B3: "LVT",
-    0x0B7B5: "LVT",
-    0x0B7B6: "LVT",
-    0x0B7B7: "LVT",
-    0x0B7B8: "LVT",
-    0x0B7B9: "LVT",
-    0x0B7BA: "LVT",
-    0x0B7BB: "LVT",
-    0x0B7BC: "LVT",
-    0x0B7BD: "LVT",
-    0x0B7BE: "LVT",
-    0x0B7BF: "LVT",
-    0x0B7C0: "LVT",
-    0x0B7C1: "LVT",
-    0x0B7C2: "LVT",
-    0x0B7C3: "LVT",
-    0x0B7C4: "LVT",
-    0x0B7C5: "LVT",
-    0x0B7C6: "LVT",
-    0x0B7C7: "LVT",
-    0x0B7C8: "LVT",
-    0x0B7C9: "LVT",
-    0x0B7CA: "LVT",
-    0x0B7CB: "LVT",
-    0x0B7CC: "LVT",
-    0x0B7CD: "LVT",
-    0x0B7CE: "LVT",
-    0x0B7CF: "LVT",
-    0x0B7D1: "LVT",
-    0x0B7D2: "LVT",
-    0x0B7D3: "LVT",
-    0x0B7D4: "LVT",
-    0x0B7D5: "LVT",
-    0x0B7D6: "LVT",
-    0x0B7D7: "LVT",
-    0x0B7D8: "LVT",
-    0x0B7D9: "LVT",
-    0x0B7DA: "LVT",
-    0x0B7DB: "LVT",
-    0x0B7DC: "LVT",
-    0x0B7DD: "LVT",
-    0x0B7DE: "LVT",
-    0x0B7DF: "LVT",
-    0x0B7E0: "LVT",
-    0x0B7E1: "LVT",
-    0x0B7E2: "LVT",
-    0x0B7E3: "LVT",
-    0x0B7E4: "LVT",
-    0x0B7E5: "LVT",
-    0x0B7E6: "LVT",
-    0x0B7E7: "LVT",
-    0x0B7E8: "LVT",
-    0x0B7E9: "LVT",
-    0x0B7EA: "LVT",
-    0x0B7EB: "LVT",
-    0x0B7ED: "LVT",
-    0x0B7EE: "LVT",
-    0x0B7EF: "LVT",
-    0x0B7F0: "LVT",
-    0x0B7F1: "LVT",
-    0x0B7F2: "LVT",
-    0x0B7F3: "LVT",
-    0x0B7F4: "LVT",
-    0x0B7F5: "LVT",
-    0x0B7F6: "LVT",
-    0x0B7F7: "LVT",
-    0x0B7F8: "LVT",
-    0x0B7F9: "LVT",
-    0x0B7FA: "LVT",
-    0x0B7FB: "LVT",
-    0x0B7FC: "LVT",
-    0x0B7FD: "LVT",
-    0x0B7FE: "LVT",
-    0x0B7FF: "LVT",
-    0x0B800: "LVT",
-    0x0B801: "LVT",
-    0x0B802: "LVT",
-    0x0B803: "LVT",
-    0x0B804: "LVT",
-    0x0B805: "LVT",
-    0x0B806: "LVT",
-    0x0B807: "LVT",
-    0x0B809: "LVT",
-    0x0B80A: "LVT",
-    0x0B80B: "LVT",
-    0x0B80C: "LVT",
-    0x0B80D: "LVT",
-    0x0B80E: "LVT",
-    0x0B80F: "LVT",
-    0x0B810: "LVT",
-    0x0B811: "LVT",
-    0x0B812: "LVT",
-    0x0B813: "LVT",
-    0x0B814: "LVT",
-    0x0B815: "LVT",
-    0x0B816: "LVT",
-    0x0B817: "LVT",
-    0x0B818: "LVT",
-    0x0B819: "LVT",
-    0x0B81A: "LVT",
-    0x0B81B: "LVT",
-    0x0B81C: "LVT",
-    0x0B81D: "LVT",
-    0x0B81E: "LVT",
-    0x0B81F: "LVT",
-    0x0B820: "LVT",
-    0x0B821: "LVT",
-    0x0B822: "LVT",
-    0x0B823: "LVT",
-    0x0B825: "LVT",
-    0x0B826: "LVT",
-    0x0B827: "LVT",
-    0x0B828: "LVT",
-    0x0B829: "LVT",
-    0x0B82A: "LVT",
-    0x0B82B: "LVT",
-    0x0B82C: "LVT",
-    0x0B82D: "LVT",
-    0x0B82E: "LVT",
-    0x0B82F: "LVT",
-    0x0B830: "LVT",
-    0x0B831: "LVT",
-    0x0B832: "LVT",
-    0x0B833: "LVT",
-    0x0B834: "LVT",
-    0x0B835: "LVT",
-    0x0B836: "LVT",
-    0x0B837: "LVT",
-    0x0B838: "LVT",
-    0x0B839: "LVT",
-    0x0B83A: "LVT",
-    0x0B83B: "LVT",
-    0x0B83C: "LVT",
-    0x0B83D: "LVT",
-    0x0B83E: "LVT",
-    0x0B83F: "LVT",
-    0x0B841: "LVT",
-    0x0B842: "LVT",
-    0x0B843: "LVT",
-    0x0B844: "LVT",
-    0x0B845: "LVT",
-    0x0B846: "LVT",
-    0x0B847: "LVT",
-    0x0B848: "LVT",
-    0x0B849: "LVT",
-    0x0B84A: "LVT",
-    0x0B84B: "LVT",
-    0x0B84C: "LVT",
-    0x0B84D: "LVT",
-    0x0B84E: "LVT",
-    0x0B84F: "LVT",
-    0x0B850: "LVT",
-    0x0B851: "LVT",
-    0x0B852: "LVT",
-    0x0B853: "LVT",
-    0x0B854: "LVT",
-    0x0B855: "LVT",
-    0x0B856: "LVT",
-    0x0B857: "LVT",
-    0x0B858: "LVT",
-    0x0B859: "LVT",
-    0x0B85A: "LVT",
-    0x0B85B: "LVT",
-    0x0B85D: "LVT",
-    0x0B85E: "LVT",
-    0x0B85F: "LVT",
-    0x0B860: "LVT",
-    0x0B861: "LVT",
-    0x0B862: "LVT",
-    0x0B863: "LVT",
-    0x0B864: "LVT",
-    0x0B865: "LVT",
-    0x0B866: "LVT",
-    0x0B867: "LVT",
-    0x0B868: "LVT",
-    0x0B869: "LVT",
-    0x0B86A: "LVT",
-    0x0B86B: "LVT",
-    0x0B86C: "LVT",
-    0x0B86D: "LVT",
-    0x0B86E: "LVT",
-    0x0B86F: "LVT",
-    0x0B870: "LVT",
-    0x0B871: "LVT",
-    0x0B872: "LVT",
-    0x0B873: "LVT",
-    0x0B874: "LVT",
-    0x0B875: "LVT",
-    0x0B876: "LVT",
-    0x0B877: "LVT",
-    0x0B879: "LVT",
-    0x0B87A: "LVT",
-    0x0B87B: "LVT",
-    0x0B87C: "LVT",
-    0x0B87D: "LVT",
-    0x0B87E: "LVT",
-    0x0B87F: "LVT",
-    0x0B880: "LVT",
-    0x0B881: "LVT",
-    0x0B882: "LVT",
-    0x0B883: "LVT",
-    0x0B884: "LVT",
-    0x0B885: "LVT",
-    0x0B886: "LVT",
-    0x0B887: "LVT",
-    0x0B888: "LVT",
-    0x0B889: "LVT",
-    0x0B88A: "LVT",
-    0x0B88B: "LVT",
-    0x0B88C: "LVT",
-    0x0B88D: "LVT",
-    0x0B88E: "LVT",
-    0x0B88F: "LVT",
-    0x0B890: "LVT",
-    0x0B891: "LVT",
-    0x0B892: "LVT",
-    0x0B893: "LVT",
-    0x0B895: "LVT",
-    0x0B896: "LVT",
-    0x0B897: "LVT",
-    0x0B898: "LVT",
-    0x0B899: "LVT",
-    0x0B89A: "LVT",
-    0x0B89B: "LVT",
-    0x0B89C: "LVT",
-    0x0B89D: "LVT",
-    0x0B89E: "LVT",
-    0x0B89F: "LVT",
-    0x0B8A0: "LVT",
-    0x0B8A1: "LVT",
-    0x0B8A2: "LVT",
-    0x0B8A3: "LVT",
-    0x0B8A4: "LVT",
-    0x0B8A5: "LVT",
-    0x0B8A6: "LVT",
-    0x0B8A7: "LVT",
-    0x0B8A8: "LVT",
-    0x0B8A9: "LVT",
-    0x0B8AA: "LVT",
-    0x0B8AB: "LVT",
-    0x0B8AC: "LVT",
-    0x0B8AD: "LVT",
-    0x0B8AE: "LVT",
-    0x0B8AF: "LVT",
-    0x0B8B1: "LVT",
-    0x0B8B2: "LVT",
-    0x0B8B3: "LVT",
-    0x0B8B4: "LVT",
-    0x0B8B5: "LVT",
-    0x0B8B6: "LVT",
-    0x0B8B7: "LVT",
-    0x0B8B8: "LVT",
-    0x0B8B9: "LVT",
-    0x0B8BA: "LVT",
-    0x0B8BB: "LVT",
-    0x0B8BC: "LVT",
-    0x0B8BD: "LVT",
-    0x0B8BE: "LVT",
-    0x0B8BF: "LVT",
-    0x0B8C0: "LVT",
-    0x0B8C1: "LVT",
-    0x0B8C2: "LVT",
-    0x0B8C3: "LVT",
-    0x0B8C4: "LVT",
-    0x0B8C5: "LVT",
-    0x0B8C6: "LVT",
-    0x0B8C7: "LVT",
-    0x0B8C8: "LVT",
-    0x0B8C9: "LVT",
-    0x0B8CA: "LVT",
-    0x0B8CB: "LVT",
-    0x0B8CD: "LVT",
-    0x0B8CE: "LVT",
-    0x0B8CF: "LVT",
-    0x0B8D0: "LVT",
-    0x0B8D1: "LVT",
-    0x0B8D2: "LVT",
-    0x0B8D3: "LVT",
-    0x0B8D4: "LVT",
-    0x0B8D5: "LVT",
-    0x0B8D6: "LVT",
-    0x0B8D7: "LVT",
-    0x0B8D8: "LVT",
-    0x0B8D9: "LVT",
-    0x0B8DA: "LVT",
-    0x0B8DB: "LVT",
-    0x0B8DC: "LVT",
-    0x0B8DD: "LVT",
-    0x0B8DE: "LVT",
-    0x0B8DF: "LVT",
-    0x0B8E0: "LVT",
-    0x0B8E1: "LVT",
-    0x0B8E2: "LVT",
-    0x0B8E3: "LVT",
-    0x0B8E4: "LVT",
-    0x0B8E5: "LVT",
-    0x0B8E6: "LVT",
-    0x0B8E7: "LVT",
-    0x0B8E9: "LVT",
-    0x0B8EA: "LVT",
-    0x0B8EB: "LVT",
-    0x0B8EC: "LVT",
-    0x0B8ED: "LVT",
-    0x0B8EE: "LVT",
-    0x0B8EF: "LVT",
-    0x0B8F0: "LVT",
-    0x0B8F1: "LVT",
-    0x0B8F2: "LVT",
-    0x0B8F3: "LVT",
-    0x0B8F4: "LVT",
-    0x0B8F5: "LVT",
-    0x0B8F6: "LVT",
-    0x0B8F7: "LVT",
-    0x0B8F8: "LVT",
-    0x0B8F9: "LVT",
-    0x0B8FA: "LVT",
-    0x0B8FB: "LVT",
-    0x0B8FC: "LVT",
-    0x0B8FD: "LVT",
-    0x0B8FE: "LVT",
-    0x0B8FF: "LVT",
-    0x0B900: "LVT",
-    0x0B901: "LVT",
-    0x0B902: "LVT",
-    0x0B903: "LVT",
-    0x0B905: "LVT",
-    0x0B906: "LVT",
-    0x0B907: "LVT",
-    0x0B908: "LVT",
-    0x0B909: "LVT",
-    0x0B90A: "LVT",
-    0x0B90B: "LVT",
-    0x0B90C: "LVT",
-    0x0B90D: "LVT",
-    0x0B90E: "LVT",
-    0x0B90F: "LVT",
-    0x0B910: "LVT",
-    0x0B911: "LVT",
-    0x0B912: "LVT",
-    0x0B913: "LVT",
-    0x0B914: "LVT",
-    0x0B915: "LVT",
-    0x0B916: "LVT",
-    0x0B917: "LVT",
-    0x0B918: "LVT",
-    0x0B919: "LVT",
-    0x0B91A: "LVT",
-    0x0B91B: "LVT",
-    0x0B91C: "LVT",
-    0x0B91D: "LVT",
-    0x0B91E: "LVT",
-    0x0B91F: "LVT",
-    0x0B921: "LVT",
-    0x0B922: "LVT",
-    0x0B923: "LVT",
-    0x0B924: "LVT",
-    0x0B925: "LVT",
-    0x0B926: "LVT",
-    0x0B927: "LVT",
-    0x0B928: "LVT",
-    0x0B929: "LVT",
-    0x0B92A: "LVT",
-    0x0B92B: "LVT",
-    0x0B92C: "LVT",
-    0x0B92D: "LVT",
-    0x0B92E: "LVT",
-    0x0B92F: "LVT",
-    0x0B930: "LVT",
-    0x0B931: "LVT",
-    0x0B932: "LVT",
-    0x0B933: "LVT",
-    0x0B934: "LVT",
-    0x0B935: "LVT",
-    0x0B936: "LVT",
-    0x0B937: "LVT",
-    0x0B938: "LVT",
-    0x0B939: "LVT",
-    0x0B93A: "LVT",
-    0x0B93B: "LVT",
-    0x0B93D: "LVT",
-    0x0B93E: "LVT",
-    0x0B93F: "LVT",
-    0x0B940: "LVT",
-    0x0B941: "LVT",
-    0x0B942: "LVT",
-    0x0B943: "LVT",
-    0x0B944: "LVT",
-    0x0B945: "LVT",
-    0x0B946: "LVT",
-    0x0B947: "LVT",
-    0x0B948: "LVT",
-    0x0B949: "LVT",
-    0x0B94A: "LVT",
-    0x0B94B: "LVT",
-    0x0B94C: "LVT",
-    0x0B94D: "LVT",
-    0x0B94E: "LVT",
-    0x0B94F: "LVT",
-    0x0B950: "LVT",
-    0x0B951: "LVT",
-    0x0B952: "LVT",
-    0x0B953: "LVT",
-    0x0B954: "LVT",
-    0x0B955: "LVT",
-    0x0B956: "LVT",
-    0x0B957: "LVT",
-    0x0B959: "LVT",
-    0x0B95A: "LVT",
-    0x0B95B: "LVT",
-    0x0B95C: "LVT",
-    0x0B95D: "LVT",
-    0x0B95E: "LVT",
-    0x0B95F: "LVT",
-    0x0B960: "LVT",
-    0x0B961: "LVT",
-    0x0B962: "LVT",
-    0x0B963: "LVT",
-    0x0B964: "LVT",
-    0x0B965: "LVT",
-    0x0B966: "LVT",
-    0x0B967: "LVT",
-    0x0B968: "LVT",
-    0x0B969: "LVT",
-    0x0B96A: "LVT",
-    0x0B96B: "LVT",
-    0x0B96C: "LVT",
-    0x0B96D: "LVT",
-    0x0B96E: "LVT",
-    0x0B96F: "LVT",
-    0x0B970: "LVT",
-    0x0B971: "LVT",
-    0x0B972: "LVT",
-    0x0B973: "LVT",
-    0x0B975: "LVT",
-    0x0B976: "LVT",
-    0x0B977: "LVT",
-    0x0B978: "LVT",
-    0x0B979: "LVT",
-    0x0B97A: "LVT",
-    0x0B97B: "LVT",
-    0x0B97C: "LVT",
-    0x0B97D: "LVT",
-    0x0B97E: "LVT",
-    0x0B97F: "LVT",
-    0x0B980: "LVT",
-    0x0B981: "LVT",
-    0x0B982: "LVT",
-    0x0B983: "LVT",
-    0x0B984: "LVT",
-    0x0B985: "LVT",
-    0x0B986: "LVT",
-    0x0B987: "LVT",
-    0x0B988: "LVT",
-    0x0B989: "LVT",
-    0x0B98A: "LVT",
-    0x0B98B: "LVT",
-    0x0B98C: "LVT",
-    0x0B98D: "LVT",
-    0x0B98E: "LVT",
-    0x0B98F: "LVT",
-    0x0B991: "LVT",
-    0x0B992: "LVT",
-    0x0B993: "LVT",
-    0x0B994: "LVT",
-    0x0B995: "LVT",
-    0x0B996: "LVT",
-    0x0B997: "LVT",
-    0x0B998: "LVT",
-    0x0B999: "LVT",
-    0x0B99A: "LVT",
-    0x0B99B: "LVT",
-    0x0B99C: "LVT",
-    0x0B99D: "LVT",
-    0x0B99E: "LVT",
-    0x0B99F: "LVT",
-    0x0B9A0: "LVT",
-    0x0B9A1: "LVT",
-    0x0B9A2: "LVT",
-    0x0B9A3: "LVT",
-    0x0B9A4: "LVT",
-    0x0B9A5: "LVT",
-    0x0B9A6: "LVT",
-    0x0B9A7: "LVT",
-    0x0B9A8: "LVT",
-    0x0B9A9: "LVT",
-    0x0B9AA: "LVT",
-    0x0B9AB: "LVT",
-    0x0B9AD: "LVT",
-    0x0B9AE: "LVT",
-    0x0B9AF: "LVT",
-    0x0B9B0: "LVT",
-    0x0B9B1: "LVT",
-    0x0B9B2: "LVT",
-    0x0B9B3: "LVT",
-    0x0B9B4: "LVT",
-    0x0B9B5: "LVT",
-    0x0B9B6: "LVT",
-    0x0B9B7: "LVT",
-    0x0B9B8: "LVT",
-    0x0B9B9: "LVT",
-    0x0B9BA: "LVT",
-    0x0B9BB: "LVT",
-    0x0B9BC: "LVT",
-    0x0B9BD: "LVT",
-    0x0B9BE: "LVT",
-    0x0B9BF: "LVT",
-    0x0B9C0: "LVT",
-    0x0B9C1: "LVT",
-    0x0B9C2: "LVT",
-    0x0B9C3: "LVT",
-    0x0B9C4: "LVT",
-    0x0B9C5: "LVT",
-    0x0B9C6: "LVT",
-    0x0B9C7: "LVT",
-    0x0B9C9: "LVT",
-    0x0B9CA: "LVT",
-    0x0B9CB: "LVT",
-    0x0B9CC: "LVT",
-    0x0B9CD: "LVT",
-    0x0B9CE: "LVT",
-    0x0B9CF: "LVT",
-    0x0B9D0: "LVT",
-    0x0B9D1: "LVT",
-    0x0B9D2: "LVT",
-    0x0B9D3: "LVT",
-    0x0B9D4: "LVT",
-    0x0B9D5: "LVT",
-    0x0B9D6: "LVT",
-    0x0B9D7: "LVT",
-    0x0B9D8: "LVT",
-    0x0B9D9: "LVT",
-    0x0B9DA: "LVT",
-    0x0B9DB: "LVT",
-    0x0B9DC: "LVT",
-    0x0B9DD: "LVT",
-    0x0B9DE: "LVT",
-    0x0B9DF: "LVT",
-    0x0B9E0: "LVT",
-    0x0B9E1: "LVT",
-    0x0B9E2: "LVT",
-    0x0B9E3: "LVT",
-    0x0B9E5: "LVT",
-    0x0B9E6: "LVT",
-    0x0B9E7: "LVT",
-    0x0B9E8: "LVT",
-    0x0B9E9: "LVT",
-    0x0B9EA: "LVT",
-    0x0B9EB: "LVT",
-    0x0B9EC: "LVT",
-    0x0B9ED: "LVT",
-    0x0B9EE: "LVT",
-    0x0B9EF: "LVT",
-    0x0B9F0: "LVT",
-    0x0B9F1: "LVT",
-    0x0B9F2: "LVT",
-    0x0B9F3: "LVT",
-    0x0B9F4: "LVT",
-    0x0B9F5: "LVT",
-    0x0B9F6: "LVT",
-    0x0B9F7: "LVT",
-    0x0B9F8: "LVT",
-    0x0B9F9: "LVT",
-    0x0B9FA: "LVT",
-    0x0B9FB: "LVT",
-    0x0B9FC: "LVT",
-    0x0B9FD: "LVT",
-    0x0B9FE: "LVT",
-    0x0B9FF: "LVT",
-    0x0BA01: "LVT",
-    0x0BA02: "LVT",
-    0x0BA03: "LVT",
-    0x0BA04: "LVT",
-    0x0BA05: "LVT",
-    0x0BA06: "LVT",
-    0x0BA07: "LVT",
-    0x0BA08: "LVT",
-    0x0BA09: "LVT",
-    0x0BA0A: "LVT",
-    0x0BA0B: "LVT",
-    0x0BA0C: "LVT",
-    0x0BA0D: "LVT",
-    0x0BA0E: "LVT",
-    0x0BA0F: "LVT",
-    0x0BA10: "LVT",
-    0x0BA11: "LVT",
-    0x0BA12: "LVT",
-    0x0BA13: "LVT",
-    0x0BA14: "LVT",
-    0x0BA15: "LVT",
-    0x0BA16: "LVT",
-    0x0BA17: "LVT",
-    0x0BA18: "LVT",
-    0x0BA19: "LVT",
-    0x0BA1A: "LVT",
-    0x0BA1B: "LVT",
-    0x0BA1D: "LVT",
-    0x0BA1E: "LVT",
-    0x0BA1F: "LVT",
-    0x0BA20: "LVT",
-    0x0BA21: "LVT",
-    0x0BA22: "LVT",
-    0x0BA23: "LVT",
-    0x0BA24: "LVT",
-    0x0BA25: "LVT",
-    0x0BA26: "LVT",
-    0x0BA27: "LVT",
-    0x0BA28: "LVT",
-    0x0BA29: "LVT",
-    0x0BA2A: "LVT",
-    0x0BA2B: "LVT",
-    0x0BA2C: "LVT",
-    0x0BA2D: "LVT",
-    0x0BA2E: "LVT",
-    0x0BA2F: "LVT",
-    0x0BA30: "LVT",
-    0x0BA31: "LVT",
-    0x0BA32: "LVT",
-    0x0BA33: "LVT",
-    0x0BA34: "LVT",
-    0x0BA35: "LVT",
-    0x0BA36: "LVT",
-    0x0BA37: "LVT",
-    0x0BA39: "LVT",
-    0x0BA3A: "LVT",
-    0x0BA3B: "LVT",
-    0x0BA3C: "LVT",
-    0x0BA3D: "LVT",
-    0x0BA3E: "LVT",
-    0x0BA3F: "LVT",
-    0x0BA40: "LVT",
-    0x0BA41: "LVT",
-    0x0BA42: "LVT",
-    0x0BA43: "LVT",
-    0x0BA44: "LVT",
-    0x0BA45: "LVT",
-    0x0BA46: "LVT",
-    0x0BA47: "LVT",
-    0x0BA48: "LVT",
-    0x0BA49: "LVT",
-    0x0BA4A: "LVT",
-    0x0BA4B: "LVT",
-    0x0BA4C: "LVT",
-    0x0BA4D: "LVT",
-    0x0BA4E: "LVT",
-    0x0BA4F: "LVT",
-    0x0BA50: "LVT",
-    0x0BA51: "LVT",
-    0x0BA52: "LVT",
-    0x0BA53: "LVT",
-    0x0BA55: "LVT",
-    0x0BA56: "LVT",
-    0x0BA57: "LVT",
-    0x0BA58: "LVT",
-    0x0BA59: "LVT",
-    0x0BA5A: "LVT",
-    0x0BA5B: "LVT",
-    0x0BA5C: "LVT",
-    0x0BA5D: "LVT",
-    0x0BA5E: "LVT",
-    0x0BA5F: "LVT",
-    0x0BA60: "LVT",
-    0x0BA61: "LVT",
-    0x0BA62: "LVT",
-    0x0BA63: "LVT",
-    0x0BA64: "LVT",
-    0x0BA65: "LVT",
-    0x0BA66: "LVT",
-    0x0BA67: "LVT",
-    0x0BA68: "LVT",
-    0x0BA69: "LVT",
-    0x0BA6A: "LVT",
-    0x0BA6B: "LVT",
-    0x0BA6C: "LVT",
-    0x0BA6D: "LVT",
-    0x0BA6E: "LVT",
-    0x0BA6F: "LVT",
-    0x0BA71: "LVT",
-    0x0BA72: "LVT",
-    0x0BA73: "LVT",
-    0x0BA74: "LVT",
-    0x0BA75: "LVT",
-    0x0BA76: "LVT",
-    0x0BA77: "LVT",
-    0x0BA78: "LVT",
-    0x0BA79: "LVT",
-    0x0BA7A: "LVT",
-    0x0BA7B: "LVT",
-    0x0BA7C: "LVT",
-    0x0BA7D: "LVT",
-    0x0BA7E: "LVT",
-    0x0BA7F: "LVT",
-    0x0BA80: "LVT",
-    0x0BA81: "LVT",
-    0x0BA82: "LVT",
-    0x0BA83: "LVT",
-    0x0BA84: "LVT",
-    0x0BA85: "LVT",
-    0x0BA86: "LVT",
-    0x0BA87: "LVT",
-    0x0BA88: "LVT",
-    0x0BA89: "LVT",
-    0x0BA8A: "LVT",
-    0x0BA8B: "LVT",
-    0x0BA8D: "LVT",
-    0x0BA8E: "LVT",
-    0x0BA8F: "LVT",
-    0x0BA90: "LVT",
-    0x0BA91: "LVT",
-    0x0BA92: "LVT",
-    0x0BA93: "LVT",
-    0x0BA94: "LVT",
-    0x0BA95: "LVT",
-    0x0BA96: "LVT",
-    0x0BA97: "LVT",
-    0x0BA98: "LVT",
-    0x0BA99: "LVT",
-    0x0BA9A: "LVT",
-    0x0BA9B: "LVT",
-    0x0BA9C: "LVT",
-    0x0BA9D: "LVT",
-    0x0BA9E: "LVT",
-    0x0BA9F: "LVT",
-    0x0BAA0: "LVT",
-    0x0BAA1: "LVT",
-    0x0BAA2: "LVT",
-    0x0BAA3: "LVT",
-    0x0BAA4: "LVT",
-    0x0BAA5: "LVT",
-    0x0BAA6: "LVT",
-    0x0BAA7: "LVT",
-    0x0BAA9: "LVT",
-    0x0BAAA: "LVT",
-    0x0BAAB: "LVT",
-    0x0BAAC: "LVT",
-    0x0BAAD: "LVT",
-    0x0BAAE: "LVT",
-    0x0BAAF: "LVT",
-    0x0BAB0: "LVT",
-    0x0BAB1: "LVT",
-    0x0BAB2: "LVT",
-    0x0BAB3: "LVT",
-    0x0BAB4: "LVT",
-    0x0BAB5: "LVT",
-    0x0BAB6: "LVT",
-    0x0BAB7: "LVT",
-    0x0BAB8: "LVT",
-    0x0BAB9: "LVT",
-    0x0BABA: "LVT",
-    0x0BABB: "LVT",
-    0x0BABC: "LVT",
-    0x0BABD: "LVT",
-    0x0BABE: "LVT",
-    0x0BABF: "LVT",
-    0x0BAC0: "LVT",
-    0x0BAC1: "LVT",
-    0x0BAC2: "LVT",
-    0x0BAC3: "LVT",
-    0x0BAC5: "LVT",
-    0x0BAC6: "LVT",
-    0x0BAC7: "LVT",
-    0x0BAC8: "LVT",
-    0x0BAC9: "LVT",
-    0x0BACA: "LVT",
-    0x0BACB: "LVT",
-    0x0BACC: "LVT",
-    0x0BACD: "LVT",
-    0x0BACE: "LVT",
-    0x0BACF: "LVT",
-    0x0BAD0: "LVT",
-    0x0BAD1: "LVT",
-    0x0BAD2: "LVT",
-    0x0BAD3: "LVT",
-    0x0BAD4: "LVT",
-    0x0BAD5: "LVT",
-    0x0BAD6: "LVT",
-    0x0BAD7: "LVT",
-    0x0BAD8: "LVT",
-    0x0BAD9: "LVT",
-    0x0BADA: "LVT",
-    0x0BADB: "LVT",
-    0x0BADC: "LVT",
-    0x0BADD: "LVT",
-    0x0BADE: "LVT",
-    0x0BADF: "LVT",
-    0x0BAE1: "LVT",
-    0x0BAE2: "LVT",
-    0x0BAE3: "LVT",
-    0x0BAE4: "LVT",
-    0x0BAE5: "LVT",
-    0x0BAE6: "LVT",
-    0x0BAE7: "LVT",
-    0x0BAE8: "LVT",
-    0x0BAE9: "LVT",
-    0x0BAEA: "LVT",
-    0x0BAEB: "LVT",
-    0x0BAEC: "LVT",
-    0x0BAED: "LVT",
-    0x0BAEE: "LVT",
-    0x0BAEF: "LVT",
-    0x0BAF0: "LVT",
-    0x0BAF1: "LVT",
-    0x0BAF2: "LVT",
-    0x0BAF3: "LVT",
-    0x0BAF4: "LVT",
-    0x0BAF5: "LVT",
-    0x0BAF6: "LVT",
-    0x0BAF7: "LVT",
-    0x0BAF8: "LVT",
-    0x0BAF9: "LVT",
-    0x0BAFA: "LVT",
-    0x0BAFB: "LVT",
-    0x0BAFD: "LVT",
-    0x0BAFE: "LVT",
-    0x0BAFF: "LVT",
-    0x0BB00: "LVT",
-    0x0BB01: "LVT",
-    0x0BB02: "LVT",
-    0x0BB03: "LVT",
-    0x0BB04: "LVT",
-    0x0BB05: "LVT",
-    0x0BB06: "LVT",
-    0x0BB07: "LVT",
-    0x0BB08: "LVT",
-    0x0BB09: "LVT",
-    0x0BB0A: "LVT",
-    0x0BB0B: "LVT",
-    0x0BB0C: "LVT",
-    0x0BB0D: "LVT",
-    0x0BB0E: "LVT",
-    0x0BB0F: "LVT",
-    0x0BB10: "LVT",
-    0x0BB11: "LVT",
-    0x0BB12: "LVT",
-    0x0BB13: "LVT",
-    0x0BB14: "LVT",
-    0x0BB15: "LVT",
-    0x0BB16: "LVT",
-    0x0BB17: "LVT",
-    0x0BB19: "LVT",
-    0x0BB1A: "LVT",
-    0x0BB1B: "LVT",
-    0x0BB1C: "LVT",
-    0x0BB1D: "LVT",
-    0x0BB1E: "LVT",
-    0x0BB1F: "LVT",
-    0x0BB20: "LVT",
-    0x0BB21: "LVT",
-    0x0BB22: "LVT",
-    0x0BB23: "LVT",
-    0x0BB24: "LVT",
-    0x0BB25: "LVT",
-    0x0BB26: "LVT",
-    0x0BB27: "LVT",
-    0x0BB28: "LVT",
-    0x0BB29: "LVT",
-    0x0BB2A: "LVT",
-    0x0BB2B: "LVT",
-    0x0BB2C: "LVT",
-    0x0BB2D: "LVT",
-    0x0BB2E: "LVT",
-    0x0BB2F: "LVT",
-    0x0BB30: "LVT",
-    0x0BB31: "LVT",
-    0x0BB32: "LVT",
-    0x0BB33: "LVT",
-    0x0BB35: "LVT",
-    0x0BB36: "LVT",
-    0x0BB37: "LVT",
-    0x0BB38: "LVT",
-    0x0BB39: "LVT",
-    0x0BB3A: "LVT",
-    0x0BB3B: "LVT",
-    0x0BB3C: "LVT",
-    0x0BB3D: "LVT",
-    0x0BB3E: "LVT",
-    0x0BB3F: "LVT",
-    0x0BB40: "LVT",
-    0x0BB41: "LVT",
-    0x0BB42: "LVT",
-    0x0BB43: "LVT",
-    0x0BB44: "LVT",
-    0x0BB45: "LVT",
-    0x0BB46: "LVT",
-    0x0BB47: "LVT",
-    0x0BB48: "LVT",
-    0x0BB49: "LVT",
-    0x0BB4A: "LVT",
-    0x0BB4B: "LVT",
-    0x0BB4C: "LVT",
-    0x0BB4D: "LVT",
-    0x0BB4E: "LVT",
-    0x0BB4F: "LVT",
-    0x0BB51: "LVT",
-    0x0BB52: "LVT",
-    0x0BB53: "LVT",
-    0x0BB54: "LVT",
-    0x0BB55: "LVT",
-    0x0BB56: "LVT",
-    0x0BB57: "LVT",
-    0x0BB58: "LVT",
-    0x0BB59: "LVT",
-    0x0BB5A: "LVT",
-    0x0BB5B: "LVT",
-    0x0BB5C: "LVT",
-    0x0BB5D: "LVT",
-    0x0BB5E: "LVT",
-    0x0BB5F: "LVT",
-    0x0BB60: "LVT",
-    0x0BB61: "LVT",
-    0x0BB62: "LVT",
-    0x0BB63: "LVT",
-    0x0BB64: "LVT",
-    0x0BB65: "LVT",
-    0x0BB66: "LVT",
-    0x0BB67: "LVT",
-    0x0BB68: "LVT",
-    0x0BB69: "LVT",
-    0x0BB6A: "LVT",
-    0x0BB6B: "LVT",
-    0x0BB6D: "LVT",
-    0x0BB6E: "LVT",
-    0x0BB6F: "LVT",
-    0x0BB70: "LVT",
-    0x0BB71: "LVT",
-    0x0BB72: "LVT",
-    0x0BB73: "LVT",
-    0x0BB74: "LVT",
-    0x0BB75: "LVT",
-    0x0BB76: "LVT",
-    0x0BB77: "LVT",
-    0x0BB78: "LVT",
-    0x0BB79: "LVT",
-    0x0BB7A: "LVT",
-    0x0BB7B: "LVT",
-    0x0BB7C: "LVT",
-    0x0BB7D: "LVT",
-    0x0BB7E: "LVT",
-    0x0BB7F: "LVT",
-    0x0BB80: "LVT",
-    0x0BB81: "LVT",
-    0x0BB82: "LVT",
-    0x0BB83: "LVT",
-    0x0BB84: "LVT",
-    0x0BB85: "LVT",
-    0x0BB86: "LVT",
-    0x0BB87: "LVT",
-    0x0BB89: "LVT",
-    0x0BB8A: "LVT",
-    0x0BB8B: "LVT",
-    0x0BB8C: "LVT",
-    0x0BB8D: "LVT",
-    0x0BB8E: "LVT",
-    0x0BB8F: "LVT",
-    0x0BB90: "LVT",
-    0x0BB91: "LVT",
-    0x0BB92: "LVT",
-    0x0BB93: "LVT",
-    0x0BB94: "LVT",
-    0x0BB95: "LVT",
-    0x0BB96: "LVT",
-    0x0BB97: "LVT",
-    0x0BB98: "LVT",
-    0x0BB99: "LVT",
-    0x0BB9A: "LVT",
-    0x0BB9B: "LVT",
-    0x0BB9C: "LVT",
-    0x0BB9D: "LVT",
-    0x0BB9E: "LVT",
-    0x0BB9F: "LVT",
-    0x0BBA0: "LVT",
-    0x0BBA1: "LVT",
-    0x0BBA2: "LVT",
-    0x0BBA3: "LVT",
-    0x0BBA5: "LVT",
-    0x0BBA6: "LVT",
-    0x0BBA7: "LVT",
-    0x0BBA8: "LVT",
-    0x0BBA9: "LVT",
-    0x0BBAA: "LVT",
-    0x0BBAB: "LVT",
-    0x0BBAC: "LVT",
-    0x0BBAD: "LVT",
-    0x0BBAE: "LVT",
-    0x0BBAF: "LVT",
-    0x0BBB0: "LVT",
-    0x0BBB1: "LVT",
-    0x0BBB2: "LVT",
-    0x0BBB3: "LVT",
-    0x0BBB4: "LVT",
-    0x0BBB5: "LVT",
-    0x0BBB6: "LVT",
-    0x0BBB7: "LVT",
-    0x0BBB8: "LVT",
-    0x0BBB9: "LVT",
-    0x0BBBA: "LVT",
-    0x0BBBB: "LVT",
-    0x0BBBC: "LVT",
-    0x0BBBD: "LVT",
-    0x0BBBE: "LVT",
-    0x0BBBF: "LVT",
-    0x0BBC1: "LVT",
-    0x0BBC2: "LVT",
-    0x0BBC3: "LVT",
-    0x0BBC4: "LVT",
-    0x0BBC5: "LVT",
-    0x0BBC6: "LVT",
-    0x0BBC7: "LVT",
-    0x0BBC8: "LVT",
-    0x0BBC9: "LVT",
-    0x0BBCA: "LVT",
-    0x0BBCB: "LVT",
-    0x0BBCC: "LVT",
-    0x0BBCD: "LVT",
-    0x0BBCE: "LVT",
-    0x0BBCF: "LVT",
-    0x0BBD0: "LVT",
-    0x0BBD1: "LVT",
-    0x0BBD2: "LVT",
-    0x0BBD3: "LVT",
-    0x0BBD4: "LVT",
-    0x0BBD5: "LVT",
-    0x0BBD6: "LVT",
-    0x0BBD7: "LVT",
-    0x0BBD8: "LVT",
-    0x0BBD9: "LVT",
-    0x0BBDA: "LVT",
-    0x0BBDB: "LVT",
-    0x0BBDD: "LVT",
-    0x0BBDE: "LVT",
-    0x0BBDF: "LVT",
-    0x0BBE0: "LVT",
-    0x0BBE1: "LVT",
-    0x0BBE2: "LVT",
-    0x0BBE3: "LVT",
-    0x0BBE4: "LVT",
-    0x0BBE5: "LVT",
-    0x0BBE6: "LVT",
-    0x0BBE7: "LVT",
-    0x0BBE8: "LVT",
-    0x0BBE9: "LVT",
-    0x0BBEA: "LVT",
-    0x0BBEB: "LVT",
-    0x0BBEC: "LVT",
-    0x0BBED: "LVT",
-    0x0BBEE: "LVT",
-    0x0BBEF: "LVT",
-    0x0BBF0: "LVT",
-    0x0BBF1: "LVT",
-    0x0BBF2: "LVT",
-    0x0BBF3: "LVT",
-    0x0BBF4: "LVT",
-    0x0BBF5: "LVT",
-    0x0BBF6: "LVT",
-    0x0BBF7: "LVT",
-    0x0BBF9: "LVT",
-    0x0BBFA: "LVT",
-    0x0BBFB: "LVT",
-    0x0BBFC: "LVT",
-    0x0BBFD: "LVT",
-    0x0BBFE: "LVT",
-    0x0BBFF: "LVT",
-    0x0BC00: "LVT",
-    0x0BC01: "LVT",
-    0x0BC02: "LVT",
-    0x0BC03: "LVT",
-    0x0BC04: "LVT",
-    0x0BC05: "LVT",
-    0x0BC06: "LVT",
-    0x0BC07: "LVT",
-    0x0BC08: "LVT",
-    0x0BC09: "LVT",
-    0x0BC0A: "LVT",
-    0x0BC0B: "LVT",
-    0x0BC0C: "LVT",
-    0x0BC0D: "LVT",
-    0x0BC0E: "LVT",
-    0x0BC0F: "LVT",
-    0x0BC10: "LVT",
-    0x0BC11: "LVT",
-    0x0BC12: "LVT",
-    0x0BC13: "LVT",
-    0x0BC15: "LVT",
-    0x0BC16: "LVT",
-    0x0BC17: "LVT",
-    0x0BC18: "LVT",
-    0x0BC19: "LVT",
-    0x0BC1A: "LVT",
-    0x0BC1B: "LVT",
-    0x0BC1C: "LVT",
-    0x0BC1D: "LVT",
-    0x0BC1E: "LVT",
-    0x0BC1F: "LVT",
-    0x0BC20: "LVT",
-    0x0BC21: "LVT",
-    0x0BC22: "LVT",
-    0x0BC23: "LVT",
-    0x0BC24: "LVT",
-    0x0BC25: "LVT",
-    0x0BC26: "LVT",
-    0x0BC27: "LVT",
-    0x0BC28: "LVT",
-    0x0BC29: "LVT",
-    0x0BC2A: "LVT",
-    0x0BC2B: "LVT",
-    0x0BC2C: "LVT",
-    0x0BC2D: "LVT",
-    0x0BC2E: "LVT",
-    0x0BC2F: "LVT",
-    0x0BC31: "LVT",
-    0x0BC32: "LVT",
-    0x0BC33: "LVT",
-    0x0BC34: "LVT",
-    0x0BC35: "LVT",
-    0x0BC36: "LVT",
-    0x0BC37: "LVT",
-    0x0BC38: "LVT",
-    0x0BC39: "LVT",
-    0x0BC3A: "LVT",
-    0x0BC3B: "LVT",
-    0x0BC3C: "LVT",
-    0x0BC3D: "LVT",
-    0x0BC3E: "LVT",
-    0x0BC3F: "LVT",
-    0x0BC40: "LVT",
-    0x0BC41: "LVT",
-    0x0BC42: "LVT",
-    0x0BC43: "LVT",
-    0x0BC44: "LVT",
-    0x0BC45: "LVT",
-    0x0BC46: "LVT",
-    0x0BC47: "LVT",
-    0x0BC48: "LVT",
-    0x0BC49: "LVT",
-    0x0BC4A: "LVT",
-    0x0BC4B: "LVT",
-    0x0BC4D: "LVT",
-    0x0BC4E: "LVT",
-    0x0BC4F: "LVT",
-    0x0BC50: "LVT",
-    0x0BC51: "LVT",
-    0x0BC52: "LVT",
-    0x0BC53: "LVT",
-    0x0BC54: "LVT",
-    0x0BC55: "LVT",
-    0x0BC56: "LVT",
-    0x0BC57: "LVT",
-    0x0BC58: "LVT",
-    0x0BC59: "LVT",
-    0x0BC5A: "LVT",
-    0x0BC5B: "LVT",
-    0x0BC5C: "LVT",
-    0x0BC5D: "LVT",
-    0x0BC5E: "LVT",
-    0x0BC5F: "LVT",
-    0x0BC60: "LVT",
-    0x0BC61: "LVT",
-    0x0BC62: "LVT",
-    0x0BC63: "LVT",
-    0x0BC64: "LVT",
-    0x0BC65: "LVT",
-    0x0BC66: "LVT",
-    0x0BC67: "LVT",
-    0x0BC69: "LVT",
-    0x0BC6A: "LVT",
-    0x0BC6B: "LVT",
-    0x0BC6C: "LVT",
-    0x0BC6D: "LVT",
-    0x0BC6E: "LVT",
-    0x0BC6F: "LVT",
-    0x0BC70: "LVT",
-    0x0BC71: "LVT",
-    0x0BC72: "LVT",
-    0x0BC73: "LVT",
-    0x0BC74: "LVT",
-    0x0BC75: "LVT",
-    0x0BC76: "LVT",
-    0x0BC77: "LVT",
-    0x0BC78: "LVT",
-    0x0BC79: "LVT",
-    0x0BC7A: "LVT",
-    0x0BC7B: "LVT",
-    0x0BC7C: "LVT",
-    0x0BC7D: "LVT",
-    0x0BC7E: "LVT",
-    0x0BC7F: "LVT",
-    0x0BC80: "LVT",
-    0x0BC81: "LVT",
-    0x0BC82: "LVT",
-    0x0BC83: "LVT",
-    0x0BC85: "LVT",
-    0x0BC86: "LVT",
-    0x0BC87: "LVT",
-    0x0BC88: "LVT",
-    0x0BC89: "LVT",
-    0x0BC8A: "LVT",
-    0x0BC8B: "LVT",
-    0x0BC8C: "LVT",
-    0x0BC8D: "LVT",
-    0x0BC8E: "LVT",
-    0x0BC8F: "LVT",
-    0x0BC90: "LVT",
-    0x0BC91: "LVT",
-    0x0BC92: "LVT",
-    0x0BC93: "LVT",
-    0x0BC94: "LVT",
-    0x0BC95: "LVT",
-    0x0BC96: "LVT",
-    0x0BC97: "LVT",
-    0x0BC98: "LVT",
-    0x0BC99: "LVT",
-    0x0BC9A: "LVT",
-    0x0BC9B: "LVT",
-    0x0BC9C: "LVT",
-    0x0BC9D: "LVT",
-    0x0BC9E: "LVT",
-    0x0BC9F: "LVT",
-    0x0BCA1: "LVT",
-    0x0BCA2: "LVT",
-    0x0BCA3: "LVT",
-    0x0BCA4: "LVT",
-    0x0BCA5: "LVT",
-    0x0BCA6: "LVT",
-    0x0BCA7: "LVT",
-    0x0BCA8: "LVT",
-    0x0BCA9: "LVT",
-    0x0BCAA: "LVT",
-    0x0BCAB: "LVT",
-    0x0BCAC: "LVT",
-    0x0BCAD: "LVT",
-    0x0BCAE: "LVT",
-    0x0BCAF: "LVT",
-    0x0BCB0: "LVT",
-    0x0BCB1: "LVT",
-    0x0BCB2: "LVT",
-    0x0BCB3: "LVT",
-    0x0BCB4: "LVT",
-    0x0BCB5: "LVT",
-    0x0BCB6: "LVT",
-    0x0BCB7: "LVT",
-    0x0BCB8: "LVT",
-    0x0BCB9: "LVT",
-    0x0BCBA: "LVT",
-    0x0BCBB: "LVT",
-    0x0BCBD: "LVT",
-    0x0BCBE: "LVT",
-    0x0BCBF: "LVT",
-    0x0BCC0: "LVT",
-    0x0BCC1: "LVT",
-    0x0BCC2: "LVT",
-    0x0BCC3: "LVT",
-    0x0BCC4: "LVT",
-    0x0BCC5: "LVT",
-    0x0BCC6: "LVT",
-    0x0BCC7: "LVT",
-    0x0BCC8: "LVT",
-    0x0BCC9: "LVT",
-    0x0BCCA: "LVT",
-    0x0BCCB: "LVT",
-    0x0BCCC: "LVT",
-    0x0BCCD: "LVT",
-    0x0BCCE: "LVT",
-    0x0BCCF: "LVT",
-    0x0BCD0: "LVT",
-    0x0BCD1: "LVT",
-    0x0BCD2: "LVT",
-    0x0BCD3: "LVT",
-    0x0BCD4: "LVT",
-    0x0BCD5: "LVT",
-    0x0BCD6: "LVT",
-    0x0BCD7: "LVT",
-    0x0BCD9: "LVT",
-    0x0BCDA: "LVT",
-    0x0BCDB: "LVT",
-    0x0BCDC: "LVT",
-    0x0BCDD: "LVT",
-    0x0BCDE: "LVT",
-    0x0BCDF: "LVT",
-    0x0BCE0: "LVT",
-    0x0BCE1: "LVT",
-    0x0BCE2: "LVT",
-    0x0BCE3: "LVT",
-    0x0BCE4: "LVT",
-    0x0BCE5: "LVT",
-    0x0BCE6: "LVT",
-    0x0BCE7: "LVT",
-    0x0BCE8: "LVT",
-    0x0BCE9: "LVT",
-    0x0BCEA: "LVT",
-    0x0BCEB: "LVT",
-    0x0BCEC: "LVT",
-    0x0BCED: "LVT",
-    0x0BCEE: "LVT",
-    0x0BCEF: "LVT",
-    0x0BCF0: "LVT",
-    0x0BCF1: "LVT",
-    0x0BCF2: "LVT",
-    0x0BCF3: "LVT",
-    0x0BCF5: "LVT",
-    0x0BCF6: "LVT",
-    0x0BCF7: "LVT",
-    0x0BCF8: "LVT",
-    0x0BCF9: "LVT",
-    0x0BCFA: "LVT",
-    0x0BCFB: "LVT",
-    0x0BCFC: "LVT",
-    0x0BCFD: "LVT",
-    0x0BCFE: "LVT",
-    0x0BCFF: "LVT",
-    0x0BD00: "LVT",
-    0x0BD01: "LVT",
-    0x0BD02: "LVT",
-    0x0BD03: "LVT",
-    0x0BD04: "LVT",
-    0x0BD05: "LVT",
-    0x0BD06: "LVT",
-    0x0BD07: "LVT",
-    0x0BD08: "LVT",
-    0x0BD09: "LVT",
-    0x0BD0A: "LVT",
-    0x0BD0B: "LVT",
-    0x0BD0C: "LVT",
-    0x0BD0D: "LVT",
-    0x0BD0E: "LVT",
-    0x0BD0F: "LVT",
-    0x0BD11: "LVT",
-    0x0BD12: "LVT",
-    0x0BD13: "LVT",
-    0x0BD14: "LVT",
-    0x0BD15: "LVT",
-    0x0BD16: "LVT",
-    0x0BD17: "LVT",
-    0x0BD18: "LVT",
-    0x0BD19: "LVT",
-    0x0BD1A: "LVT",
-    0x0BD1B: "LVT",
-    0x0BD1C: "LVT",
-    0x0BD1D: "LVT",
-    0x0BD1E: "LVT",
-    0x0BD1F: "LVT",
-    0x0BD20: "LVT",
-    0x0BD21: "LVT",
-    0x0BD22: "LVT",
-    0x0BD23: "LVT",
-    0x0BD24: "LVT",
-    0x0BD25: "LVT",
-    0x0BD26: "LVT",
-    0x0BD27: "LVT",
-    0x0BD28: "LVT",
-    0x0BD29: "LVT",
-    0x0BD2A: "LVT",
-    0x0BD2B: "LVT",
-    0x0BD2D: "LVT",
-    0x0BD2E: "LVT",
-    0x0BD2F: "LVT",
-    0x0BD30: "LVT",
-    0x0BD31: "LVT",
-    0x0BD32: "LVT",
-    0x0BD33: "LVT",
-    0x0BD34: "LVT",
-    0x0BD35: "LVT",
-    0x0BD36: "LVT",
-    0x0BD37: "LVT",
-    0x0BD38: "LVT",
-    0x0BD39: "LVT",
-    0x0BD3A: "LVT",
-    0x0BD3B: "LVT",
-    0x0BD3C: "LVT",
-    0x0BD3D: "LVT",
-    0x0BD3E: "LVT",
-    0x0BD3F: "LVT",
-    0x0BD40: "LVT",
-    0x0BD41: "LVT",
-    0x0BD42: "LVT",
-    0x0BD43: "LVT",
-    0x0BD44: "LVT",
-    0x0BD45: "LVT",
-    0x0BD46: "LVT",
-    0x0BD47: "LVT",
-    0x0BD49: "LVT",
-    0x0BD4A: "LVT",
-    0x0BD4B: "LVT",
-    0x0BD4C: "LVT",
-    0x0BD4D: "LVT",
-    0x0BD4E: "LVT",
-    0x0BD4F: "LVT",
-    0x0BD50: "LVT",
-    0x0BD51: "LVT",
-    0x0BD52: "LVT",
-    0x0BD53: "LVT",
-    0x0BD54: "LVT",
-    0x0BD55: "LVT",
-    0x0BD56: "LVT",
-    0x0BD57: "LVT",
-    0x0BD58: "LVT",
-    0x0BD59: "LVT",
-    0x0BD5A: "LVT",
-    0x0BD5B: "LVT",
-    0x0BD5C: "LVT",
-    0x0BD5D: "LVT",
-    0x0BD5E: "LVT",
-    0x0BD5F: "LVT",
-    0x0BD60: "LVT",
-    0x0BD61: "LVT",
-    0x0BD62: "LVT",
-    0x0BD63: "LVT",
-    0x0BD65: "LVT",
-    0x0BD66: "LVT",
-    0x0BD67: "LVT",
-    0x0BD68: "LVT",
-    0x0BD69: "LVT",
-    0x0BD6A: "LVT",
-    0x0BD6B: "LVT",
-    0x0BD6C: "LVT",
-    0x0BD6D: "LVT",
-    0x0BD6E: "LVT",
-    0x0BD6F: "LVT",
-    0x0BD70: "LVT",
-    0x0BD71: "LVT",
-    0x0BD72: "LVT",
-    0x0BD73: "LVT",
-    0x0BD74: "LVT",
-    0x0BD75: "LVT",
-    0x0BD76: "LVT",
-    0x0BD77: "LVT",
-    0x0BD78: "LVT",
-    0x0BD79: "LVT",
-    0x0BD7A: "LVT",
-    0x0BD7B: "LVT",
-    0x0BD7C: "LVT",
-    0x0BD7D: "LVT",
-    0x0BD7E: "LVT",
-    0x0BD7F: "LVT",
-    0x0BD81: "LVT",
-    0x0BD82: "LVT",
-    0x0BD83: "LVT",
-    0x0BD84: "LVT",
-    0x0BD85: "LVT",
-    0x0BD86: "LVT",
-    0x0BD87: "LVT",
-    0x0BD88: "LVT",
-    0x0BD89: "LVT",
-    0x0BD8A: "LVT",
-    0x0BD8B: "LVT",
-    0x0BD8C: "LVT",
-    0x0BD8D: "LVT",
-    0x0BD8E: "LVT",
-    0x0BD8F: "LVT",
-    0x0BD90: "LVT",
-    0x0BD91: "LVT",
-    0x0BD92: "LVT",
-    0x0BD93: "LVT",
-    0x0BD94: "LVT",
-    0x0BD95: "LVT",
-    0x0BD96: "LVT",
-    0x0BD97: "LVT",
-    0x0BD98: "LVT",
-    0x0BD99: "LVT",
-    0x0BD9A: "LVT",
-    0x0BD9B: "LVT",
-    0x0BD9D: "LVT",
-    0x0BD9E: "LVT",
-    0x0BD9F: "LVT",
-    0x0BDA0: "LVT",
-    0x0BDA1: "LVT",
-    0x0BDA2: "LVT",
-    0x0BDA3: "LVT",
-    0x0BDA4: "LVT",
-    0x0BDA5: "LVT",
-    0x0BDA6: "LVT",
-    0x0BDA7: "LVT",
-    0x0BDA8: "LVT",
-    0x0BDA9: "LVT",
-    0x0BDAA: "LVT",
-    0x0BDAB: "LVT",
-    0x0BDAC: "LVT",
-    0x0BDAD: "LVT",
-    0x0BDAE: "LVT",
-    0x0BDAF: "LVT",
-    0x0BDB0: "LVT",
-    0x0BDB1: "LVT",
-    0x0BDB2: "LVT",
-    0x0BDB3: "LVT",
-    0x0BDB4: "LVT",
-    0x0BDB5: "LVT",
-    0x0BDB6: "LVT",
-    0x0BDB7: "LVT",
-    0x0BDB9: "LVT",
-    0x0BDBA: "LVT",
-    0x0BDBB: "LVT",
-    0x0BDBC: "LVT",
-    0x0BDBD: "LVT",
-    0x0BDBE: "LVT",
-    0x0BDBF: "LVT",
-    0x0BDC0: "LVT",
-    0x0BDC1: "LVT",
-    0x0BDC2: "LVT",
-    0x0BDC3: "LVT",
-    0x0BDC4: "LVT",
-    0x0BDC5: "LVT",
-    0x0BDC6: "LVT",
-    0x0BDC7: "LVT",
-    0x0BDC8: "LVT",
-    0x0BDC9: "LVT",
-    0x0BDCA: "LVT",
-    0x0BDCB: "LVT",
-    0x0BDCC: "LVT",
-    0x0BDCD: "LVT",
-    0x0BDCE: "LVT",
-    0x0BDCF: "LVT",
-    0x0BDD0: "LVT",
-    0x0BDD1: "LVT",
-    0x0BDD2: "LVT",
-    0x0BDD3: "LVT",
-    0x0BDD5: "LVT",
-    0x0BDD6: "LVT",
-    0x0BDD7: "LVT",
-    0x0BDD8: "LVT",
-    0x0BDD9: "LVT",
-    0x0BDDA: "LVT",
-    0x0BDDB: "LVT",
-    0x0BDDC: "LVT",
-    0x0BDDD: "LVT",
-    0x0BDDE: "LVT",
-    0x0BDDF: "LVT",
-    0x0BDE0: "LVT",
-    0x0BDE1: "LVT",
-    0x0BDE2: "LVT",
-    0x0BDE3: "LVT",
-    0x0BDE4: "LVT",
-    0x0BDE5: "LVT",
-    0x0BDE6: "LVT",
-    0x0BDE7: "LVT",
-    0x0BDE8: "LVT",
-    0x0BDE9: "LVT",
-    0x0BDEA: "LVT",
-    0x0BDEB: "LVT",
-    0x0BDEC: "LVT",
-    0x0BDED: "LVT",
-    0x0BDEE: "LVT",
-    0x0BDEF: "LVT",
-    0x0BDF1: "LVT",
-    0x0BDF2: "LVT",
-    0x0BDF3: "LVT",
-    0x0BDF4: "LVT",
-    0x0BDF5: "LVT",
-    0x0BDF6: "LVT",
-    0x0BDF7: "LVT",
-    0x0BDF8: "LVT",
-    0x0BDF9: "LVT",
-    0x0BDFA: "LVT",
-    0x0BDFB: "LVT",
-    0x0BDFC: "LVT",
-    0x0BDFD: "LVT",
-    0x0BDFE: "LVT",
-    0x0BDFF: "LVT",
-    0x0BE00: "LVT",
-    0x0BE01: "LVT",
-    0x0BE02: "LVT",
-    0x0BE03: "LVT",
-    0x0BE04: "LVT",
-    0x0BE05: "LVT",
-    0x0BE06: "LVT",
-    0x0BE07: "LVT",
-    0x0BE08: "LVT",
-    0x0BE09: "LVT",
-    0x0BE0A: "LVT",
-    0x0BE0B: "LVT",
-    0x0BE0D: "LVT",
-    0x0BE0E: "LVT",
-    0x0BE0F: "LVT",
-    0x0BE10: "LVT",
-    0x0BE11: "LVT",
-    0x0BE12: "LVT",
-    0x0BE13: "LVT",
-    0x0BE14: "LVT",
-    0x0BE15: "LVT",
-    0x0BE16: "LVT",
-    0x0BE17: "LVT",
-    0x0BE18: "LVT",
-    0x0BE19: "LVT",
-    0x0BE1A: "LVT",
-    0x0BE1B: "LVT",
-    0x0BE1C: "LVT",
-    0x0BE1D: "LVT",
-    0x0BE1E: "LVT",
-    0x0BE1F: "LVT",
-    0x0BE20: "LVT",
-    0x0BE21: "LVT",
-    0x0BE22: "LVT",
-    0x0BE23: "LVT",
-    0x0BE24: "LVT",
-    0x0BE25: "LVT",
-    0x0BE26: "LVT",
-    0x0BE27: "LVT",
-    0x0BE29: "LVT",
-    0x0BE2A: "LVT",
-    0x0BE2B: "LVT",
-    0x0BE2C: "LVT",
-    0x0BE2D: "LVT",
-    0x0BE2E: "LVT",
-    0x0BE2F: "LVT",
-    0x0BE30: "LVT",
-    0x0BE31: "LVT",
-    0x0BE32: "LVT",
-    0x0BE33: "LVT",
-    0x0BE34: "LVT",
-    0x0BE35: "LVT",
-    0x0BE36: "LVT",
-    0x0BE37: "LVT",
-    0x0BE38: "LVT",
-    0x0BE39: "LVT",
-    0x0BE3A: "LVT",
-    0x0BE3B: "LVT",
-    0x0BE3C: "LVT",
-    0x0BE3D: "LVT",
-    0x0BE3E: "LVT",
-    0x0BE3F: "LVT",
-    0x0BE40: "LVT",
-    0x0BE41: "LVT",
-    0x0BE42: "LVT",
-    0x0BE43: "LVT",
-    0x0BE45: "LVT",
-    0x0BE46: "LVT",
-    0x0BE47: "LVT",
-    0x0BE48: "LVT",
-    0x0BE49: "LVT",
-    0x0BE4A: "LVT",
-    0x0BE4B: "LVT",
-    0x0BE4C: "LVT",
-    0x0BE4D: "LVT",
-    0x0BE4E: "LVT",
-    0x0BE4F: "LVT",
-    0x0BE50: "LVT",
-    0x0BE51: "LVT",
-    0x0BE52: "LVT",
-    0x0BE53: "LVT",
-    0x0BE54: "LVT",
-    0x0BE55: "LVT",
-    0x0BE56: "LVT",
-    0x0BE57: "LVT",
-    0x0BE58: "LVT",
-    0x0BE59: "LVT",
-    0x0BE5A: "LVT",
-    0x0BE5B: "LVT",
-    0x0BE5C: "LVT",
-    0x0BE5D: "LVT",
-    0x0BE5E: "LVT",
-    0x0BE5F: "LVT",
-    0x0BE61: "LVT",
-    0x0BE62: "LVT",
-    0x0BE63: "LVT",
-    0x0BE64: "LVT",
-    0x0BE65: "LVT",
-    0x0BE66: "LVT",
-    0x0BE67: "LVT",
-    0x0BE68: "LVT",
-    0x0BE69: "LVT",
-    0x0BE6A: "LVT",
-    0x0BE6B: "LVT",
-    0x0BE6C: "LVT",
-    0x0BE6D: "LVT",
-    0x0BE6E: "LVT",
-    0x0BE6F: "LVT",
-    0x0BE70: "LVT",
-    0x0BE71: "LVT",
-    0x0BE72: "LVT",
-    0x0BE73: "LVT",
-    0x0BE74: "LVT",
-    0x0BE75: "LVT",
-    0x0BE76: "LVT",
-    0x0BE77: "LVT",
-    0x0BE78: "LVT",
-    0x0BE79: "LVT",
-    0x0BE7A: "LVT",
-    0x0BE7B: "LVT",
-    0x0BE7D: "LVT",
-    0x0BE7E: "LVT",
-    0x0BE7F: "LVT",
-    0x0BE80: "LVT",
-    0x0BE81: "LVT",
-    0x0BE82: "LVT",
-    0x0BE83: "LVT",
-    0x0BE84: "LVT",
-    0x0BE85: "LVT",
-    0x0BE86: "LVT",
-    0x0BE87: "LVT",
-    0x0BE88: "LVT",
-    0x0BE89: "LVT",
-    0x0BE8A: "LVT",
-    0x0BE8B: "LVT",
-    0x0BE8C: "LVT",
-    0x0BE8D: "LVT",
-    0x0BE8E: "LVT",
-    0x0BE8F: "LVT",
-    0x0BE90: "LVT",
-    0x0BE91: "LVT",
-    0x0BE92: "LVT",
-    0x0BE93: "LVT",
-    0x0BE94: "LVT",
-    0x0BE95: "LVT",
-    0x0BE96: "LVT",
-    0x0BE97: "LVT",
-    0x0BE99: "LVT",
-    0x0BE9A: "LVT",
-    0x0BE9B: "LVT",
-    0x0BE9C: "LVT",
-    0x0BE9D: "LVT",
-    0x0BE9E: "LVT",
-    0x0BE9F: "LVT",
-    0x0BEA0: "LVT",
-    0x0BEA1: "LVT",
-    0x0BEA2: "LVT",
-    0x0BEA3: "LVT",
-    0x0BEA4: "LVT",
-    0x0BEA5: "LVT",
-    0x0BEA6: "LVT",
-    0x0BEA7: "LVT",
-    0x0BEA8: "LVT",
-    0x0BEA9: "LVT",
-    0x0BEAA: "LVT",
-    0x0BEAB: "LVT",
-    0x0BEAC: "LVT",
-    0x0BEAD: "LVT",
-    0x0BEAE: "LVT",
-    0x0BEAF: "LVT",
-    0x0BEB0: "LVT",
-    0x0BEB1: "LVT",
-    0x0BEB2: "LVT",
-    0x0BEB3: "LVT",
-    0x0BEB5: "LVT",
-    0x0BEB6: "LVT",
-    0x0BEB7: "LVT",
-    0x0BEB8: "LVT",
-    0x0BEB9: "LVT",
-    0x0BEBA: "LVT",
-    0x0BEBB: "LVT",
-    0x0BEBC: "LVT",
-    0x0BEBD: "LVT",
-    0x0BEBE: "LVT",
-    0x0BEBF: "LVT",
-    0x0BEC0: "LVT",
-    0x0BEC1: "LVT",
-    0x0BEC2: "LVT",
-    0x0BEC3: "LVT",
-    0x0BEC4: "LVT",
-    0x0BEC5: "LVT",
-    0x0BEC6: "LVT",
-    0x0BEC7: "LVT",
-    0x0BEC8: "LVT",
-    0x0BEC9: "LVT",
-    0x0BECA: "LVT",
-    0x0BECB: "LVT",
-    0x0BECC: "LVT",
-    0x0BECD: "LVT",
-    0x0BECE: "LVT",
-    0x0BECF: "LVT",
-    0x0BED1: "LVT",
-    0x0BED2: "LVT",
-    0x0BED3: "LVT",
-    0x0BED4: "LVT",
-    0x0BED5: "LVT",
-    0x0BED6: "LVT",
-    0x0BED7: "LVT",
-    0x0BED8: "LVT",
-    0x0BED9: "LVT",
-    0x0BEDA: "LVT",
-    0x0BEDB: "LVT",
-    0x0BEDC: "LVT",
-    0x0BEDD: "LVT",
-    0x0BEDE: "LVT",
-    0x0BEDF: "LVT",
-    0x0BEE0: "LVT",
-    0x0BEE1: "LVT",
-    0x0BEE2: "LVT",
-    0x0BEE3: "LVT",
-    0x0BEE4: "LVT",
-    0x0BEE5: "LVT",
-    0x0BEE6: "LVT",
-    0x0BEE7: "LVT",
-    0x0BEE8: "LVT",
-    0x0BEE9: "LVT",
-    0x0BEEA: "LVT",
-    0x0BEEB: "LVT",
-    0x0BEED: "LVT",
-    0x0BEEE: "LVT",
-    0x0BEEF: "LVT",
-    0x0BEF0: "LVT",
-    0x0BEF1: "LVT",
-    0x0BEF2: "LVT",
-    0x0BEF3: "LVT",
-    0x0BEF4: "LVT",
-    0x0BEF5: "LVT",
-    0x0BEF6: "LVT",
-    0x0BEF7: "LVT",
-    0x0BEF8: "LVT",
-    0x0BEF9: "LVT",
-    0x0BEFA: "LVT",
-    0x0BEFB: "LVT",
-    0x0BEFC: "LVT",
-    0x0BEFD: "LVT",
-    0x0BEFE: "LVT",
-    0x0BEFF: "LVT",
-    0x0BF00: "LVT",
-    0x0BF01: "LVT",
-    0x0BF02: "LVT",
-    0x0BF03: "LVT",
-    0x0BF04: "LVT",
-    0x0BF05: "LVT",
-    0x0BF06: "LVT",
-    0x0BF07: "LVT",
-    0x0BF09: "LVT",
-    0x0BF0A: "LVT",
-    0x0BF0B: "LVT",
-    0x0BF0C: "LVT",
-    0x0BF0D: "LVT",
-    0x0BF0E: "LVT",
-    0x0BF0F: "LVT",
-    0x0BF10: "LVT",
-    0x0BF11: "LVT",
-    0x0BF12: "LVT",
-    0x0BF13: "LVT",
-    0x0BF14: "LVT",
-    0x0BF15: "LVT",
-    0x0BF16: "LVT",
-    0x0BF17: "LVT",
-    0x0BF18: "LVT",
-    0x0BF19: "LVT",
-    0x0BF1A: "LVT",
-    0x0BF1B: "LVT",
-    0x0BF1C: "LVT",
-    0x0BF1D: "LVT",
-    0x0BF1E: "LVT",
-    0x0BF1F: "LVT",
-    0x0BF20: "LVT",
-    0x0BF21: "LVT",
-    0x0BF22: "LVT",
-    0x0BF23: "LVT",
-    0x0BF25: "LVT",
-    0x0BF26: "LVT",
-    0x0BF27: "LVT",
-    0x0BF28: "LVT",
-    0x0BF29: "LVT",
-    0x0BF2A: "LVT",
-    0x0BF2B: "LVT",
-    0x0BF2C: "LVT",
-    0x0BF2D: "LVT",
-    0x0BF2E: "LVT",
-    0x0BF2F: "LVT",
-    0x0BF30: "LVT",
-    0x0BF31: "LVT",
-    0x0BF32: "LVT",
-    0x0BF33: "LVT",
-    0x0BF34: "LVT",
-    0x0BF35: "LVT",
-    0x0BF36: "LVT",
-    0x0BF37: "LVT",
-    0x0BF38: "LVT",
-    0x0BF39: "LVT",
-    0x0BF3A: "LVT",
-    0x0BF3B: "LVT",
-    0x0BF3C: "LVT",
-    0x0BF3D: "LVT",
-    0x0BF3E: "LVT",
-    0x0BF3F: "LVT",
-    0x0BF41: "LVT",
-    0x0BF42: "LVT",
-    0x0BF43: "LVT",
-    0x0BF44: "LVT",
-    0x0BF45: "LVT",
-    0x0BF46: "LVT",
-    0x0BF47: "LVT",
-    0x0BF48: "LVT",
-    0x0BF49: "LVT",
-    0x0BF4A: "LVT",
-    0x0BF4B: "LVT",
-    0x0BF4C: "LVT",
-    0x0BF4D: "LVT",
-    0x0BF4E: "LVT",
-    0x0BF4F: "LVT",
-    0x0BF50: "LVT",
-    0x0BF51: "LVT",
-    0x0BF52: "LVT",
-    0x0BF53: "LVT",
-    0x0BF54: "LVT",
-    0x0BF55: "LVT",
-    0x0BF56: "LVT",
-    0x0BF57: "LVT",
-    0x0BF58: "LVT",
-    0x0BF59: "LVT",
-    0x0BF5A: "LVT",
-    0x0BF5B: "LVT",
-    0x0BF5D: "LVT",
-    0x0BF5E: "LVT",
-    0x0BF5F: "LVT",
-    0x0BF60: "LVT",
-    0x0BF61: "LVT",
-    0x0BF62: "LVT",
-    0x0BF63: "LVT",
-    0x0BF64: "LVT",
-    0x0BF65: "LVT",
-    0x0BF66: "LVT",
-    0x0BF67: "LVT",
-    0x0BF68: "LVT",
-    0x0BF69: "LVT",
-    0x0BF6A: "LVT",
-    0x0BF6B: "LVT",
-    0x0BF6C: "LVT",
-    0x0BF6D: "LVT",
-    0x0BF6E: "LVT",
-    0x0BF6F: "LVT",
-    0x0BF70: "LVT",
-    0x0BF71: "LVT",
-    0x0BF72: "LVT",
-    0x0BF73: "LVT",
-    0x0BF74: "LVT",
-    0x0BF75: "LVT",
-    0x0BF76: "LVT",
-    0x0BF77: "LVT",
-    0x0BF79: "LVT",
-    0x0BF7A: "LVT",
-    0x0BF7B: "LVT",
-    0x0BF7C: "LVT",
-    0x0BF7D: "LVT",
-    0x0BF7E: "LVT",
-    0x0BF7F: "LVT",
-    0x0BF80: "LVT",
-    0x0BF81: "LVT",
-    0x0BF82: "LVT",
-    0x0BF83: "LVT",
-    0x0BF84: "LVT",
-    0x0BF85: "LVT",
-    0x0BF86: "LVT",
-    0x0BF87: "LVT",
-    0x0BF88: "LVT",
-    0x0BF89: "LVT",
-    0x0BF8A: "LVT",
-    0x0BF8B: "LVT",
-    0x0BF8C: "LVT",
-    0x0BF8D: "LVT",
-    0x0BF8E: "LVT",
-    0x0BF8F: "LVT",
-    0x0BF90: "LVT",
-    0x0BF91: "LVT",
-    0x0BF92: "LVT",
-    0x0BF93: "LVT",
-    0x0BF95: "LVT",
-    0x0BF96: "LVT",
-    0x0BF97: "LVT",
-    0x0BF98: "LVT",
-    0x0BF99: "LVT",
-    0x0BF9A: "LVT",
-    0x0BF9B: "LVT",
-    0x0BF9C: "LVT",
-    0x0BF9D: "LVT",
-    0x0BF9E: "LVT",
-    0x0BF9F: "LVT",
-    0x0BFA0: "LVT",
-    0x0BFA1: "LVT",
-    0x0BFA2: "LVT",
-    0x0BFA3: "LVT",
-    0x0BFA4: "LVT",
-    0x0BFA5: "LVT",
-    0x0BFA6: "LVT",
-    0x0BFA7: "LVT",
-    0x0BFA8: "LVT",
-    0x0BFA9: "LVT",
-    0x0BFAA: "LVT",
-    0x0BFAB: "LVT",
-    0x0BFAC: "LVT",
-    0x0BFAD: "LVT",
-    0x0BFAE: "LVT",
-    0x0BFAF: "LVT",
-    0x0BFB1: "LVT",
-    0x0BFB2: "LVT",
-    0x0BFB3: "LVT",
-    0x0BFB4: "LVT",
-    0x0BFB5: "LVT",
-    0x0BFB6: "LVT",
-    0x0BFB7: "LVT",
-    0x0BFB8: "LVT",
-    0x0BFB9: "LVT",
-    0x0BFBA: "LVT",
-    0x0BFBB: "LVT",
-    0x0BFBC: "LVT",
-    0x0BFBD: "LVT",
-    0x0BFBE: "LVT",
-    0x0BFBF: "LVT",
-    0x0BFC0: "LVT",
-    0x0BFC1: "LVT",
-    0x0BFC2: "LVT",
-    0x0BFC3: "LVT",
-    0x0BFC4: "LVT",
-    0x0BFC5: "LVT",
-    0x0BFC6: "LVT",
-    0x0BFC7: "LVT",
-    0x0BFC8: "LVT",
-    0x0BFC9: "LVT",
-    0x0BFCA: "LVT",
-    0x0BFCB: "LVT",
-    0x0BFCD: "LVT",
-    0x0BFCE: "LVT",
-    0x0BFCF: "LVT",
-    0x0BFD0: "LVT",
-    0x0BFD1: "LVT",
-    0x0BFD2: "LVT",
-    0x0BFD3: "LVT",
-    0x0BFD4: "LVT",
-    0x0BFD5: "LVT",
-    0x0BFD6: "LVT",
-    0x0BFD7: "LVT",
-    0x0BFD8: "LVT",
-    0x0BFD9: "LVT",
-    0x0BFDA: "LVT",
-    0x0BFDB: "LVT",
-    0x0BFDC: "LVT",
-    0x0BFDD: "LVT",
-    0x0BFDE: "LVT",
-    0x0BFDF: "LVT",
-    0x0BFE0: "LVT",
-    0x0BFE1: "LVT",
-    0x0BFE2: "LVT",
-    0x0BFE3: "LVT",
-    0x0BFE4: "LVT",
-    0x0BFE5: "LVT",
-    0x0BFE6: "LVT",
-    0x0BFE7: "LVT",
-    0x0BFE9: "LVT",
-    0x0BFEA: "LVT",
-    0x0BFEB: "LVT",
-    0x0BFEC: "LVT",
-    0x0BFED: "LVT",
-    0x0BFEE: "LVT",
-    0x0BFEF: "LVT",
-    0x0BFF0: "LVT",
-    0x0BFF1: "LVT",
-    0x0BFF2: "LVT",
-    0x0BFF3: "LVT",
-    0x0BFF4: "LVT",
-    0x0BFF5: "LVT",
-    0x0BFF6: "LVT",
-    0x0BFF7: "LVT",
-    0x0BFF8: "LVT",
-    0x0BFF9: "LVT",
-    0x0BFFA: "LVT",
-    0x0BFFB: "LVT",
-    0x0BFFC: "LVT",
-    0x0BFFD: "LVT",
-    0x0BFFE: "LVT",
-    0x0BFFF: "LVT",
-    0x0C000: "LVT",
-    0x0C001: "LVT",
-    0x0C002: "LVT",
-    0x0C003: "LVT",
-    0x0C005: "LVT",
-    0x0C006: "LVT",
-    0x0C007: "LVT",
-    0x0C008: "LVT",
-    0x0C009: "LVT",
-    0x0C00A: "LVT",
-    0x0C00B: "LVT",
-    0x0C00C: "LVT",
-    0x0C00D: "LVT",
-    0x0C00E: "LVT",
-    0x0C00F: "LVT",
-    0x0C010: "LVT",
-    0x0C011: "LVT",
-    0x0C012: "LVT",
-    0x0C013: "LVT",
-    0x0C014: "LVT",
-    0x0C015: "LVT",
-    0x0C016: "LVT",
-    0x0C017: "LVT",
-    0x0C018: "LVT",
-    0x0C019: "LVT",
-    0x0C01A: "LVT",
-    0x0C01B: "LVT",
-    0x0C01C: "LVT",
-    0x0C01D: "LVT",
-    0x0C01E: "LVT",
-    0x0C01F: "LVT",
-    0x0C021: "LVT",
-    0x0C022: "LVT",
-    0x0C023: "LVT",
-    0x0C024: "LVT",
-    0x0C025: "LVT",
-    0x0C026: "LVT",
-    0x0C027: "LVT",
-    0x0C028: "LVT",
-    0x0C029: "LVT",
-    0x0C02A: "LVT",
-    0x0C02B: "LVT",
-    0x0C02C: "LVT",
-    0x0C02D: "LVT",
-    0x0C02E: "LVT",
-    0x0C02F: "LVT",
-    0x0C030: "LVT",
-    0x0C031: "LVT",
-    0x0C032: "LVT",
-    0x0C033: "LVT",
-    0x0C034: "LVT",
-    0x0C035: "LVT",
-    0x0C036: "LVT",
-    0x0C037: "LVT",
-    0x0C038: "LVT",
-    0x0C039: "LVT",
-    0x0C03A: "LVT",
-    0x0C03B: "LVT",
-    0x0C03D: "LVT",
-    0x0C03E: "LVT",
-    0x0C03F: "LVT",
-    0x0C040: "LVT",
-    0x0C041: "LVT",
-    0x0C042: "LVT",
-    0x0C043: "LVT",
-    0x0C044: "LVT",
-    0x0C045: "LVT",
-    0x0C046: "LVT",
-    0x0C047: "LVT",
-    0x0C048: "LVT",
-    0x0C049: "LVT",
-    0x0C04A: "LVT",
-    0x0C04B: "LVT",
-    0x0C04C: "LVT",
-    0x0C04D: "LVT",
-    0x0C04E: "LVT",
-    0x0C04F: "LVT",
-    0x0C050: "LVT",
-    0x0C051: "LVT",
-    0x0C052: "LVT",
-    0x0C053: "LVT",
-    0x0C054: "LVT",
-    0x0C055: "LVT",
-    0x0C056: "LVT",
-    0x0C057: "LVT",
-    0x0C059: "LVT",
-    0x0C05A: "LVT",
-    0x0C05B: "LVT",
-    0x0C05C: "LVT",
-    0x0C05D: "LVT",
-    0x0C05E: "LVT",
-    0x0C05F: "LVT",
-    0x0C060: "LVT",
-    0x0C061: "LVT",
-    0x0C062: "LVT",
-    0x0C063: "LVT",
-    0x0C064: "LVT",
-    0x0C065: "LVT",
-    0x0C066: "LVT",
-    0x0C067: "LVT",
-    0x0C068: "LVT",
-    0x0C069: "LVT",
-    0x0C06A: "LVT",
-    0x0C06B: "LVT",
-    0x0C06C: "LVT",
-    0x0C06D: "LVT",
-    0x0C06E: "LVT",
-    0x0C06F: "LVT",
-    0x0C070: "LVT",
-    0x0C071: "LVT",
-    0x0C072: "LVT",
-    0x0C073: "LVT",
-    0x0C075: "LVT",
-    0x0C076: "LVT",
-    0x0C077: "LVT",
-    0x0C078: "LVT",
-    0x0C079: "LVT",
-    0x0C07A: "LVT",
-    0x0C07B: "LVT",
-    0x0C07C: "LVT",
-    0x0C07D: "LVT",
-    0x0C07E: "LVT",
-    0x0C07F: "LVT",
-    0x0C080: "LVT",
-    0x0C081: "LVT",
-    0x0C082: "LVT",
-    0x0C083: "LVT",
-    0x0C084: "LVT",
-    0x0C085: "LVT",
-    0x0C086: "LVT",
-    0x0C087: "LVT",
-    0x0C088: "LVT",
-    0x0C089: "LVT",
-    0x0C08A: "LVT",
-    0x0C08B: "LVT",
-    0x0C08C: "LVT",
-    0x0C08D: "LVT",
-    0x0C08E: "LVT",
-    0x0C08F: "LVT",
-    0x0C091: "LVT",
-    0x0C092: "LVT",
-    0x0C093: "LVT",
-    0x0C094: "LVT",
-    0x0C095: "LVT",
-    0x0C096: "LVT",
-    0x0C097: "LVT",
-    0x0C098: "LVT",
-    0x0C099: "LVT",
-    0x0C09A: "LVT",
-    0x0C09B: "LVT",
-    0x0C09C: "LVT",
-    0x0C09D: "LVT",
-    0x0C09E: "LVT",
-    0x0C09F: "LVT",
-    0x0C0A0: "LVT",
-    0x0C0A1: "LVT",
-    0x0C0A2: "LVT",
-    0x0C0A3: "LVT",
-    0x0C0A4: "LVT",
-    0x0C0A5: "LVT",
-    0x0C0A6: "LVT",
-    0x0C0A7: "LVT",
-    0x0C0A8: "LVT",
-    0x0C0A9: "LVT",
-    0x0C0AA: "LVT",
-    0x0C0AB: "LVT",
-    0x0C0AD: "LVT",
-    0x0C0AE: "LVT",
-    0x0C0AF: "LVT",
-    0x0C0B0: "LVT",
-    0x0C0B1: "LVT",
-    0x0C0B2: "LVT",
-    0x0C0B3: "LVT",
-    0x0C0B4: "LVT",
-    0x0C0B5: "LVT",
-    0x0C0B6: "LVT",
-    0x0C0B7: "LVT",
-    0x0C0B8: "LVT",
-    0x0C0B9: "LVT",
-    0x0C0BA: "LVT",
-    0x0C0BB: "LVT",
-    0x0C0BC: "LVT",
-    0x0C0BD: "LVT",
-    0x0C0BE: "LVT",
-    0x0C0BF: "LVT",
-    0x0C0C0: "LVT",
-    0x0C0C1: "LVT",
-    0x0C0C2: "LVT",
-    0x0C0C3: "LVT",
-    0x0C0C4: "LVT",
-    0x0C0C5: "LVT",
-    0x0C0C6: "LVT",
-    0x0C0C7: "LVT",
-    0x0C0C9: "LVT",
-    0x0C0CA: "LVT",
-    0x0C0CB: "LVT",
-    0x0C0CC: "LVT",
-    0x0C0CD: "LVT",
-    0x0C0CE: "LVT",
-    0x0C0CF: "LVT",
-    0x0C0D0: "LVT",
-    0x0C0D1: "LVT",
-    0x0C0D2: "LVT",
-    0x0C0D3: "LVT",
-    0x0C0D4: "LVT",
-    0x0C0D5: "LVT",
-    0x0C0D6: "LVT",
-    0x0C0D7: "LVT",
-    0x0C0D8: "LVT",
-    0x0C0D9: "LVT",
-    0x0C0DA: "LVT",
-    0x0C0DB: "LVT",
-    0x0C0DC: "LVT",
-    0x0C0DD: "LVT",
-    0x0C0DE: "LVT",
-    0x0C0DF: "LVT",
-    0x0C0E0: "LVT",
-    0x0C0E1: "LVT",
-    0x0C0E2: "LVT",
-    0x0C0E3: "LVT",
-    0x0C0E5: "LVT",
-    0x0C0E6: "LVT",
-    0x0C0E7: "LVT",
-    0x0C0E8: "LVT",
-    0x0C0E9: "LVT",
-    0x0C0EA: "LVT",
-    0x0C0EB: "LVT",
-    0x0C0EC: "LVT",
-    0x0C0ED: "LVT",
-    0x0C0EE: "LVT",
-    0x0C0EF: "LVT",
-    0x0C0F0: "LVT",
-    0x0C0F1: "LVT",
-    0x0C0F2: "LVT",
-    0x0C0F3: "LVT",
-    0x0C0F4: "LVT",
-    0x0C0F5: "LVT",
-    0x0C0F6: "LVT",
-    0x0C0F7: "LVT",
-    0x0C0F8: "LVT",
-    0x0C0F9: "LVT",
-    0x0C0FA: "LVT",
-    0x0C0FB: "LVT",
-    0x0C0FC: "LVT",
-    0x0C0FD: "LVT",
-    0x0C0FE: "LVT",
-    0x0C0FF: "LVT",
-    0x0C101: "LVT",
-    0x0C102: "LVT",
-    0x0C103: "LVT",
-    0x0C104: "LVT",
-    0x0C105: "LVT",
-    0x0C106: "LVT",
-    0x0C107: "LVT",
-    0x0C108: "LVT",
-    0x0C109: "LVT",
-    0x0C10A: "LVT",
-    0x0C10B: "LVT",
-    0x0C10C: "LVT",
-    0x0C10D: "LVT",
-    0x0C10E: "LVT",
-    0x0C10F: "LVT",
-    0x0C110: "LVT",
-    0x0C111: "LVT",
-    0x0C112: "LVT",
-    0x0C113: "LVT",
-    0x0C114: "LVT",
-    0x0C115: "LVT",
-    0x0C116: "LVT",
-    0x0C117: "LVT",
-    0x0C118: "LVT",
-    0x0C119: "LVT",
-    0x0C11A: "LVT",
-    0x0C11B: "LVT",
-    0x0C11D: "LVT",
-    0x0C11E: "LVT",
-    0x0C11F: "LVT",
-    0x0C120: "LVT",
-    0x0C121: "LVT",
-    0x0C122: "LVT",
-    0x0C123: "LVT",
-    0x0C124: "LVT",
-    0x0C125: "LVT",
-    0x0C126: "LVT",
-    0x0C127: "LVT",
-    0x0C128: "LVT",
-    0x0C129: "LVT",
-    0x0C12A: "LVT",
-    0x0C12B: "LVT",
-    0x0C12C: "LVT",
-    0x0C12D: "LVT",
-    0x0C12E: "LVT",
-    0x0C12F: "LVT",
-    0x0C130: "LVT",
-    0x0C131: "LVT",
-    0x0C132: "LVT",
-    0x0C133: "LVT",
-    0x0C134: "LVT",
-    0x0C135: "LVT",
-    0x0C136: "LVT",
-    0x0C137: "LVT",
-    0x0C139: "LVT",
-    0x0C13A: "LVT",
-    0x0C13B: "LVT",
-    0x0C13C: "LVT",
-    0x0C13D: "LVT",
-    0x0C13E: "LVT",
-    0x0C13F: "LVT",
-    0x0C140: "LVT",
-    0x0C141: "LVT",
-    0x0C142: "LVT",
-    0x0C143: "LVT",
-    0x0C144: "LVT",
-    0x0C145: "LVT",
-    0x0C146: "LVT",
-    0x0C147: "LVT",
-    0x0C148: "LVT",
-    0x0C149: "LVT",
-    0x0C14A: "LVT",
-    0x0C14B: "LVT",
-    0x0C14C: "LVT",
-    0x0C14D: "LVT",
-    0x0C14E: "LVT",
-    0x0C14F: "LVT",
-    0x0C150: "LVT",
-    0x0C151: "LVT",
-    0x0C152: "LVT",
-    0x0C153: "LVT",
-    0x0C155: "LVT",
-    0x0C156: "LVT",
-    0x0C157: "LVT",
-    0x0C158: "LVT",
-    0x0C159: "LVT",
-    0x0C15A: "LVT",
-    0x0C15B: "LVT",
-    0x0C15C: "LVT",
-    0x0C15D: "LVT",
-    0x0C15E: "LVT",
-    0x0C15F: "LVT",
-    0x0C160: "LVT",
-    0x0C161: "LVT",
-    0x0C162: "LVT",
-    0x0C163: "LVT",
-    0x0C164: "LVT",
-    0x0C165: "LVT",
-    0x0C166: "LVT",
-    0x0C167: "LVT",
-    0x0C168: "LVT",
-    0x0C169: "LVT",
-    0x0C16A: "LVT",
-    0x0C16B: "LVT",
-    0x0C16C: "LVT",
-    0x0C16D: "LVT",
-    0x0C16E: "LVT",
-    0x0C16F: "LVT",
-    0x0C171: "LVT",
-    0x0C172: "LVT",
-    0x0C173: "LVT",
-    0x0C174: "LVT",
-    0x0C175: "LVT",
-    0x0C176: "LVT",
-    0x0C177: "LVT",
-    0x0C178: "LVT",
-    0x0C179: "LVT",
-    0x0C17A: "LVT",
-    0x0C17B: "LVT",
-    0x0C17C: "LVT",
-    0x0C17D: "LVT",
-    0x0C17E: "LVT",
-    0x0C17F: "LVT",
-    0x0C180: "LVT",
-    0x0C181: "LVT",
-    0x0C182: "LVT",
-    0x0C183: "LVT",
-    0x0C184: "LVT",
-    0x0C185: "LVT",
-    0x0C186: "LVT",
-    0x0C187: "LVT",
-    0x0C188: "LVT",
-    0x0C189: "LVT",
-    0x0C18A: "LVT",
-    0x0C18B: "LVT",
-    0x0C18D: "LVT",
-    0x0C18E: "LVT",
-    0x0C18F: "LVT",
-    0x0C190: "LVT",
-    0x0C191: "LVT",
-    0x0C192: "LVT",
-    0x0C193: "LVT",
-    0x0C194: "LVT",
-    0x0C195: "LVT",
-    0x0C196: "LVT",
-    0x0C197: "LVT",
-    0x0C198: "LVT",
-    0x0C199: "LVT",
-    0x0C19A: "LVT",
-    0x0C19B: "LVT",
-    0x0C19C: "LVT",
-    0x0C19D: "LVT",
-    0x0C19E: "LVT",
-    0x0C19F: "LVT",
-    0x0C1A0: "LVT",
-    0x0C1A1: "LVT",
-    0x0C1A2: "LVT",
-    0x0C1A3: "LVT",
-    0x0C1A4: "LVT",
-    0x0C1A5: "LVT",
-    0x0C1A6: "LVT",
-    0x0C1A7: "LVT",
-    0x0C1A9: "LVT",
-    0x0C1AA: "LVT",
-    0x0C1AB: "LVT",
-    0x0C1AC: "LVT",
-    0x0C1AD: "LVT",
-    0x0C1AE: "LVT",
-    0x0C1AF: "LVT",
-    0x0C1B0: "LVT",
-    0x0C1B1: "LVT",
-    0x0C1B2: "LVT",
-    0x0C1B3: "LVT",
-    0x0C1B4: "LVT",
-    0x0C1B5: "LVT",
-    0x0C1B6: "LVT",
-    0x0C1B7: "LVT",
-    0x0C1B8: "LVT",
-    0x0C1B9: "LVT",
-    0x0C1BA: "LVT",
-    0x0C1BB: "LVT",
-    0x0C1BC: "LVT",
-    0x0C1BD: "LVT",
-    0x0C1BE: "LVT",
-    0x0C1BF: "LVT",
-    0x0C1C0: "LVT",
-    0x0C1C1: "LVT",
-    0x0C1C2: "LVT",
-    0x0C1C3: "LVT",
-    0x0C1C5: "LVT",
-    0x0C1C6: "LVT",
-    0x0C1C7: "LVT",
-    0x0C1C8: "LVT",
-    0x0C1C9: "LVT",
-    0x0C1CA: "LVT",
-    0x0C1CB: "LVT",
-    0x0C1CC: "LVT",
-    0x0C1CD: "LVT",
-    0x0C1CE: "LVT",
-    0x0C1CF: "LVT",
-    0x0C1D0: "LVT",
-    0x0C1D1: "LVT",
-    0x0C1D2: "LVT",
-    0x0C1D3: "LVT",
-    0x0C1D4: "LVT",
-    0x0C1D5: "LVT",
-    0x0C1D6: "LVT",
-    0x0C1D7: "LVT",
-    0x0C1D8: "LVT",
-    0x0C1D9: "LVT",
-    0x0C1DA: "LVT",
-    0x0C1DB: "LVT",
-    0x0C1DC: "LVT",
-    0x0C1DD: "LVT",
-    0x0C1DE: "LVT",
-    0x0C1DF: "LVT",
-    0x0C1E1: "LVT",
-    0x0C1E2: "LVT",
-    0x0C1E3: "LVT",
-    0x0C1E4: "LVT",
-    0x0C1E5: "LVT",
-    0x0C1E6: "LVT",
-    0x0C1E7: "LVT",
-    0x0C1E8: "LVT",
-    0x0C1E9: "LVT",
-    0x0C1EA: "LVT",
-    0x0C1EB: "LVT",
-    0x0C1EC: "LVT",
-    0x0C1ED: "LVT",
-    0x0C1EE: "LVT",
-    0x0C1EF: "LVT",
-    0x0C1F0: "LVT",
-    0x0C1F1: "LVT",
-    0x0C1F2: "LVT",
-    0x0C1F3: "LVT",
-    0x0C1F4: "LVT",
-    0x0C1F5: "LVT",
-    0x0C1F6: "LVT",
-    0x0C1F7: "LVT",
-    0x0C1F8: "LVT",
-    0x0C1F9: "LVT",
-    0x0C1FA: "LVT",
-    0x0C1FB: "LVT",
-    0x0C1FD: "LVT",
-    0x0C1FE: "LVT",
-    0x0C1FF: "LVT",
-    0x0C200: "LVT",
-    0x0C201: "LVT",
-    0x0C202: "LVT",
-    0x0C203: "LVT",
-    0x0C204: "LVT",
-    0x0C205: "LVT",
-    0x0C206: "LVT",
-    0x0C207: "LVT",
-    0x0C208: "LVT",
-    0x0C209: "LVT",
-    0x0C20A: "LVT",
-    0x0C20B: "LVT",
-    0x0C20C: "LVT",
-    0x0C20D: "LVT",
-    0x0C20E: "LVT",
-    0x0C20F: "LVT",
-    0x0C210: "LVT",
-    0x0C211: "LVT",
-    0x0C212: "LVT",
-    0x0C213: "LVT",
-    0x0C214: "LVT",
-    0x0C215: "LVT",
-    0x0C216: "LVT",
-    0x0C217: "LVT",
-    0x0C219: "LVT",
-    0x0C21A: "LVT",
-    0x0C21B: "LVT",
-    0x0C21C: "LVT",
-    0x0C21D: "LVT",
-    0x0C21E: "LVT",
-    0x0C21F: "LVT",
-    0x0C220: "LVT",
-    0x0C221: "LVT",
-    0x0C222: "LVT",
-    0x0C223: "LVT",
-    0x0C224: "LVT",
-    0x0C225: "LVT",
-    0x0C226: "LVT",
-    0x0C227: "LVT",
-    0x0C228: "LVT",
-    0x0C229: "LVT",
-    0x0C22A: "LVT",
-    0x0C22B: "LVT",
-    0x0C22C: "LVT",
-    0x0C22D: "LVT",
-    0x0C22E: "LVT",
-    0x0C22F: "LVT",
-    0x0C230: "LVT",
-    0x0C231: "LVT",
-    0x0C232: "LVT",
-    0x0C233: "LVT",
-    0x0C235: "LVT",
-    0x0C236: "LVT",
-    0x0C237: "LVT",
-    0x0C238: "LVT",
-    0x0C239: "LVT",
-    0x0C23A: "LVT",
-    0x0C23B: "LVT",
-    0x0C23C: "LVT",
-    0x0C23D: "LVT",
-    0x0C23E: "LVT",
-    0x0C23F: "LVT",
-    0x0C240: "LVT",
-    0x0C241: "LVT",
-    0x0C242: "LVT",
-    0x0C243: "LVT",
-    0x0C244: "LVT",
-    0x0C245: "LVT",
-    0x0C246: "LVT",
-    0x0C247: "LVT",
-    0x0C248: "LVT",
-    0x0C249: "LVT",
-    0x0C24A: "LVT",
-    0x0C24B: "LVT",
-    0x0C24C: "LVT",
-    0x0C24D: "LVT",
-    0x0C24E: "LVT",
-    0x0C24F: "LVT",
-    0x0C251: "LVT",
-    0x0C252: "LVT",
-    0x0C253: "LVT",
-    0x0C254: "LVT",
-    0x0C255: "LVT",
-    0x0C256: "LVT",
-    0x0C257: "LVT",
-    0x0C258: "LVT",
-    0x0C259: "LVT",
-    0x0C25A: "LVT",
-    0x0C25B: "LVT",
-    0x0C25C: "LVT",
-    0x0C25D: "LVT",
-    0x0C25E: "LVT",
-    0x0C25F: "LVT",
-    0x0C260: "LVT",
-    0x0C261: "LVT",
-    0x0C262: "LVT",
-    0x0C263: "LVT",
-    0x0C264: "LVT",
-    0x0C265: "LVT",
-    0x0C266: "LVT",
-    0x0C267: "LVT",
-    0x0C268: "LVT",
-    0x0C269: "LVT",
-    0x0C26A: "LVT",
-    0x0C26B: "LVT",
-    0x0C26D: "LVT",
-    0x0C26E: "LVT",
-    0x0C26F: "LVT",
-    0x0C270: "LVT",
-    0x0C271: "LVT",
-    0x0C272: "LVT",
-    0x0C273: "LVT",
-    0x0C274: "LVT",
-    0x0C275: "LVT",
-    0x0C276: "LVT",
-    0x0C277: "LVT",
-    0x0C278: "LVT",
-    0x0C279: "LVT",
-    0x0C27A: "LVT",
-    0x0C27B: "LVT",
-    0x0C27C: "LVT",
-    0x0C27D: "LVT",
-    0x0C27E: "LVT",
-    0x0C27F: "LVT",
-    0x0C280: "LVT",
-    0x0C281: "LVT",
-    0x0C282: "LVT",
-    0x0C283: "LVT",
-    0x0C284: "LVT",
-    0x0C285: "LVT",
-    0x0C286: "LVT",
-    0x0C287: "LVT",
-    0x0C289: "LVT",
-    0x0C28A: "LVT",
-    0x0C28B: "LVT",
-    0x0C28C: "LVT",
-    0x0C28D: "LVT",
-    0x0C28E: "LVT",
-    0x0C28F: "LVT",
-    0x0C290: "LVT",
-    0x0C291: "LVT",
-    0x0C292: "LVT",
-    0x0C293: "LVT",
-    0x0C294: "LVT",
-    0x0C295: "LVT",
-    0x0C296: "LVT",
-    0x0C297: "LVT",
-    0x0C298: "LVT",
-    0x0C299: "LVT",
-    0x0C29A: "LVT",
-    0x0C29B: "LVT",
-    0x0C29C: "LVT",
-    0x0C29D: "LVT",
-    0x0C29E: "LVT",
-    0x0C29F: "LVT",
-    0x0C2A0: "LVT",
-    0x0C2A1: "LVT",
-    0x0C2A2: "LVT",
-    0x0C2A3: "LVT",
-    0x0C2A5: "LVT",
-    0x0C2A6: "LVT",
-    0x0C2A7: "LVT",
-    0x0C2A8: "LVT",
-    0x0C2A9: "LVT",
-    0x0C2AA: "LVT",
-    0x0C2AB: "LVT",
-    0x0C2AC: "LVT",
-    0x0C2AD: "LVT",
-    0x0C2AE: "LVT",
-    0x0C2AF: "LVT",
-    0x0C2B0: "LVT",
-    0x0C2B1: "LVT",
-    0x0C2B2: "LVT",
-    0x0C2B3: "LVT",
-    0x0C2B4: "LVT",
-    0x0C2B5: "LVT",
-    0x0C2B6: "LVT",
-    0x0C2B7: "LVT",
-    0x0C2B8: "LVT",
-    0x0C2B9: "LVT",
-    0x0C2BA: "LVT",
-    0x0C2BB: "LVT",
-    0x0C2BC: "LVT",
-    0x0C2BD: "LVT",
-    0x0C2BE: "LVT",
-    0x0C2BF: "LVT",
-    0x0C2C1: "LVT",
-    0x0C2C2: "LVT",
-    0x0C2C3: "LVT",
-    0x0C2C4: "LVT",
-    0x0C2C5: "LVT",
-    0x0C2C6: "LVT",
-    0x0C2C7: "LVT",
-    0x0C2C8: "LVT",
-    0x0C2C9: "LVT",
-    0x0C2CA: "LVT",
-    0x0C2CB: "LVT",
-    0x0C2CC: "LVT",
-    0x0C2CD: "LVT",
-    0x0C2CE: "LVT",
-    0x0C2CF: "LVT",
-    0x0C2D0: "LVT",
-    0x0C2D1: "LVT",
-    0x0C2D2: "LVT",
-    0x0C2D3: "LVT",
-    0x0C2D4: "LVT",
-    0x0C2D5: "LVT",
-    0x0C2D6: "LVT",
-    0x0C2D7: "LVT",
-    0x0C2D8: "LVT",
-    0x0C2D9: "LVT",
-    0x0C2DA: "LVT",
-    0x0C2DB: "LVT",
-    0x0C2DD: "LVT",
-    0x0C2DE: "LVT",
-    0x0C2DF: "LVT",
-    0x0C2E0: "LVT",
-    0x0C2E1: "LVT",
-    0x0C2E2: "LVT",
-    0x0C2E3: "LVT",
-    0x0C2E4: "LVT",
-    0x0C2E5: "LVT",
-    0x0C2E6: "LVT",
-    0x0C2E7: "LVT",
-    0x0C2E8: "LVT",
-    0x0C2E9: "LVT",
-    0x0C2EA: "LVT",
-    0x0C2EB: "LVT",
-    0x0C2EC: "LVT",
-    0x0C2ED: "LVT",
-    0x0C2EE: "LVT",
-    0x0C2EF: "LVT",
-    0x0C2F0: "LVT",
-    0x0C2F1: "LVT",
-    0x0C2F2: "LVT",
-    0x0C2F3: "LVT",
-    0x0C2F4: "LVT",
-    0x0C2F5: "LVT",
-    0x0C2F6: "LVT",
-    0x0C2F7: "LVT",
-    0x0C2F9: "LVT",
-    0x0C2FA: "LVT",
-    0x0C2FB: "LVT",
-    0x0C2FC: "LVT",
-    0x0C2FD: "LVT",
-    0x0C2FE: "LVT",
-    0x0C2FF: "LVT",
-    0x0C300: "LVT",
-    0x0C301: "LVT",
-    0x0C302: "LVT",
-    0x0C303: "LVT",
-    0x0C304: "LVT",
-    0x0C305: "LVT",
-    0x0C306: "LVT",
-    0x0C307: "LVT",
-    0x0C308: "LVT",
-    0x0C309: "LVT",
-    0x0C30A: "LVT",
-    0x0C30B: "LVT",
-    0x0C30C: "LVT",
-    0x0C30D: "LVT",
-    0x0C30E: "LVT",
-    0x0C30F: "LVT",
-    0x0C310: "LVT",
-    0x0C311: "LVT",
-    0x0C312: "LVT",
-    0x0C313: "LVT",
-    0x0C315: "LVT",
-    0x0C316: "LVT",
-    0x0C317: "LVT",
-    0x0C318: "LVT",
-    0x0C319: "LVT",
-    0x0C31A: "LVT",
-    0x0C31B: "LVT",
-    0x0C31C: "LVT",
-    0x0C31D: "LVT",
-    0x0C31E: "LVT",
-    0x0C31F: "LVT",
-    0x0C320: "LVT",
-    0x0C321: "LVT",
-    0x0C322: "LVT",
-    0x0C323: "LVT",
-    0x0C324: "LVT",
-    0x0C325: "LVT",
-    0x0C326: "LVT",
-    0x0C327: "LVT",
-    0x0C328: "LVT",
-    0x0C329: "LVT",
-    0x0C32A: "LVT",
-    0x0C32B: "LVT",
-    0x0C32C: "LVT",
-    0x0C32D: "LVT",
-    0x0C32E: "LVT",
-    0x0C32F: "LVT",
-    0x0C331: "LVT",
-    0x0C332: "LVT",
-    0x0C333: "LVT",
-    0x0C334: "LVT",
-    0x0C335: "LVT",
-    0x0C336: "LVT",
-    0x0C337: "LVT",
-    0x0C338: "LVT",
-    0x0C339: "LVT",
-    0x0C33A: "LVT",
-    0x0C33B: "LVT",
-    0x0C33C: "LVT",
-    0x0C33D: "LVT",
-    0x0C33E: "LVT",
-    0x0C33F: "LVT",
-    0x0C340: "LVT",
-    0x0C341: "LVT",
-    0x0C342: "LVT",
-    0x0C343: "LVT",
-    0x0C344: "LVT",
-    0x0C345: "LVT",
-    0x0C346: "LVT",
-    0x0C347: "LVT",
-    0x0C348: "LVT",
-    0x0C349: "LVT",
-    0x0C34A: "LVT",
-    0x0C34B: "LVT",
-    0x0C34D: "LVT",
-    0x0C34E: "LVT",
-    0x0C34F: "LVT",
-    0x0C350: "LVT",
-    0x0C351: "LVT",
-    0x0C352: "LVT",
-    0x0C353: "LVT",
-    0x0C354: "LVT",
-    0x0C355: "LVT",
-    0x0C356: "LVT",
-    0x0C357: "LVT",
-    0x0C358: "LVT",
-    0x0C359: "LVT",
-    0x0C35A: "LVT",
-    0x0C35B: "LVT",
-    0x0C35C: "LVT",
-    0x0C35D: "LVT",
-    0x0C35E: "LVT",
-    0x0C35F: "LVT",
-    0x0C360: "LVT",
-    0x0C361: "LVT",
-    0x0C362: "LVT",
-    0x0C363: "LVT",
-    0x0C364: "LVT",
-    0x0C365: "LVT",
-    0x0C366: "LVT",
-    0x0C367: "LVT",
-    0x0C369: "LVT",
-    0x0C36A: "LVT",
-    0x0C36B: "LVT",
-    0x0C36C: "LVT",
-    0x0C36D: "LVT",
-    0x0C36E: "LVT",
-    0x0C36F: "LVT",
-    0x0C370: "LVT",
-    0x0C371: "LVT",
-    0x0C372: "LVT",
-    0x0C373: "LVT",
-    0x0C374: "LVT",
-    0x0C375: "LVT",
-    0x0C376: "LVT",
-    0x0C377: "LVT",
-    0x0C378: "LVT",
-    0x0C379: "LVT",
-    0x0C37A: "LVT",
-    0x0C37B: "LVT",
-    0x0C37C: "LVT",
-    0x0C37D: "LVT",
-    0x0C37E: "LVT",
-    0x0C37F: "LVT",
-    0x0C380: "LVT",
-    0x0C381: "LVT",
-    0x0C382: "LVT",
-    0x0C383: "LVT",
-    0x0C385: "LVT",
-    0x0C386: "LVT",
-    0x0C387: "LVT",
-    0x0C388: "LVT",
-    0x0C389: "LVT",
-    0x0C38A: "LVT",
-    0x0C38B: "LVT",
-    0x0C38C: "LVT",
-    0x0C38D: "LVT",
-    0x0C38E: "LVT",
-    0x0C38F: "LVT",
-    0x0C390: "LVT",
-    0x0C391: "LVT",
-    0x0C392: "LVT",
-    0x0C393: "LVT",
-    0x0C394: "LVT",
-    0x0C395: "LVT",
-    0x0C396: "LVT",
-    0x0C397: "LVT",
-    0x0C398: "LVT",
-    0x0C399: "LVT",
-    0x0C39A: "LVT",
-    0x0C39B: "LVT",
-    0x0C39C: "LVT",
-    0x0C39D: "LVT",
-    0x0C39E: "LVT",
-    0x0C39F: "LVT",
-    0x0C3A1: "LVT",
-    0x0C3A2: "LVT",
-    0x0C3A3: "LVT",
-    0x0C3A4: "LVT",
-    0x0C3A5: "LVT",
-    0x0C3A6: "LVT",
-    0x0C3A7: "LVT",
-    0x0C3A8: "LVT",
-    0x0C3A9: "LVT",
-    0x0C3AA: "LVT",
-    0x0C3AB: "LVT",
-    0x0C3AC: "LVT",
-    0x0C3AD: "LVT",
-    0x0C3AE: "LVT",
-    0x0C3AF: "LVT",
-    0x0C3B0: "LVT",
-    0x0C3B1: "LVT",
-    0x0C3B2: "LVT",
-    0x0C3B3: "LVT",
-    0x0C3B4: "LVT",
-    0x0C3B5: "LVT",
-    0x0C3B6: "LVT",
-    0x0C3B7: "LVT",
-    0x0C3B8: "LVT",
-    0x0C3B9: "LVT",
-    0x0C3BA: "LVT",
-    0x0C3BB: "LVT",
-    0x0C3BD: "LVT",
-    0x0C3BE: "LVT",
-    0x0C3BF: "LVT",
-    0x0C3C0: "LVT",
-    0x0C3C1: "LVT",
-    0x0C3C2: "LVT",
-    0x0C3C3: "LVT",
-    0x0C3C4: "LVT",
-    0x0C3C5: "LVT",
-    0x0C3C6: "LVT",
-    0x0C3C7: "LVT",
-    0x0C3C8: "LVT",
-    0x0C3C9: "LVT",
-    0x0C3CA: "LVT",
-    0x0C3CB: "LVT",
-    0x0C3CC: "LVT",
-    0x0C3CD: "LVT",
-    0x0C3CE: "LVT",
-    0x0C3CF: "LVT",
-    0x0C3D0: "LVT",
-    0x0C3D1: "LVT",
-    0x0C3D2: "LVT",
-    0x0C3D3: "LVT",
-    0x0C3D4: "LVT",
-    0x0C3D5: "LVT",
-    0x0C3D6: "LVT",
-    0x0C3D7: "LVT",
-    0x0C3D9: "LVT",
-    0x0C3DA: "LVT",
-    0x0C3DB: "LVT",
-    0x0C3DC: "LVT",
-    0x0C3DD: "LVT",
-    0x0C3DE: "LVT",
-    0x0C3DF: "LVT",
-    0x0C3E0: "LVT",
-    0x0C3E1: "LVT",
-    0x0C3E2: "LVT",
-    0x0C3E3: "LVT",
-    0x0C3E4: "LVT",
-    0x0C3E5: "LVT",
-    0x0C3E6: "LVT",
-    0x0C3E7: "LVT",
-    0x0C3E8: "LVT",
-    0x0C3E9: "LVT",
-    0x0C3EA: "LVT",
-    0x0C3EB: "LVT",
-    0x0C3EC: "LVT",
-    0x0C3ED: "LVT",
-    0x0C3EE: "LVT",
-    0x0C3EF: "LVT",
-    0x0C3F0: "LVT",
-    0x0C3F1: "LVT",
-    0x0C3F2: "LVT",
-    0x0C3F3: "LVT",
-    0x0C3F5: "LVT",
-    0x0C3F6: "LVT",
-    0x0C3F7: "LVT",
-    0x0C3F8: "LVT",
-    0x0C3F9: "LVT",
-    0x0C3FA: "LVT",
-    0x0C3FB: "LVT",
-    0x0C3FC: "LVT",
-    0x0C3FD: "LVT",
-    0x0C3FE: "LVT",
-    0x0C3FF: "LVT",
-    0x0C400: "LVT",
-    0x0C401: "LVT",
-    0x0C402: "LVT",
-    0x0C403: "LVT",
-    0x0C404: "LVT",
-    0x0C405: "LVT",
-    0x0C406: "LVT",
-    0x0C407: "LVT",
-    0x0C408: "LVT",
-    0x0C409: "LVT",
-    0x0C40A: "LVT",
-    0x0C40B: "LVT",
-    0x0C40C: "LVT",
-    0x0C40D: "LVT",
-    0x0C40E: "LVT",
-    0x0C40F: "LVT",
-    0x0C411: "LVT",
-    0x0C412: "LVT",
-    0x0C413: "LVT",
-    0x0C414: "LVT",
-    0x0C415: "LVT",
-    0x0C416: "LVT",
-    0x0C417: "LVT",
-    0x0C418: "LVT",
-    0x0C419: "LVT",
-    0x0C41A: "LVT",
-    0x0C41B: "LVT",
-    0x0C41C: "LVT",
-    0x0C41D: "LVT",
-    0x0C41E: "LVT",
-    0x0C41F: "LVT",
-    0x0C420: "LVT",
-    0x0C421: "LVT",
-    0x0C422: "LVT",
-    0x0C423: "LVT",
-    0x0C424: "LVT",
-    0x0C425: "LVT",
-    0x0C426: "LVT",
-    0x0C427: "LVT",
-    0x0C428: "LVT",
-    0x0C429: "LVT",
-    0x0C42A: "LVT",
-    0x0C42B: "LVT",
-    0x0C42D: "LVT",
-    0x0C42E: "LVT",
-    0x0C42F: "LVT",
-    0x0C430: "LVT",
-    0x0C431: "LVT",
-    0x0C432: "LVT",
-    0x0C433: "LVT",
-    0x0C434: "LVT",
-    0x0C435: "LVT",
-    0x0C436: "LVT",
-    0x0C437: "LVT",
-    0x0C438: "LVT",
-    0x0C439: "LVT",
-    0x0C43A: "LVT",
-    0x0C43B: "LVT",
-    0x0C43C: "LVT",
-    0x0C43D: "LVT",
-    0x0C43E: "LVT",
-    0x0C43F: "LVT",
-    0x0C440: "LVT",
-    0x0C441: "LVT",
-    0x0C442: "LVT",
-    0x0C443: "LVT",
-    0x0C444: "LVT",
-    0x0C445: "LVT",
-    0x0C446: "LVT",
-    0x0C447: "LVT",
-    0x0C449: "LVT",
-    0x0C44A: "LVT",
-    0x0C44B: "LVT",
-    0x0C44C: "LVT",
-    0x0C44D: "LVT",
-    0x0C44E: "LVT",
-    0x0C44F: "LVT",
-    0x0C450: "LVT",
-    0x0C451: "LVT",
-    0x0C452: "LVT",
-    0x0C453: "LVT",
-    0x0C454: "LVT",
-    0x0C455: "LVT",
-    0x0C456: "LVT",
-    0x0C457: "LVT",
-    0x0C458: "LVT",
-    0x0C459: "LVT",
-    0x0C45A: "LVT",
-    0x0C45B: "LVT",
-    0x0C45C: "LVT",
-    0x0C45D: "LVT",
-    0x0C45E: "LVT",
-    0x0C45F: "LVT",
-    0x0C460: "LVT",
-    0x0C461: "LVT",
-    0x0C462: "LVT",
-    0x0C463: "LVT",
-    0x0C465: "LVT",
-    0x0C466: "LVT",
-    0x0C467: "LVT",
-    0x0C468: "LVT",
-    0x0C469: "LVT",
-    0x0C46A: "LVT",
-    0x0C46B: "LVT",
-    0x0C46C: "LVT",
-    0x0C46D: "LVT",
-    0x0C46E: "LVT",
-    0x0C46F: "LVT",
-    0x0C470: "LVT",
-    0x0C471: "LVT",
-    0x0C472: "LVT",
-    0x0C473: "LVT",
-    0x0C474: "LVT",
-    0x0C475: "LVT",
-    0x0C476: "LVT",
-    0x0C477: "LVT",
-    0x0C478: "LVT",
-    0x0C479: "LVT",
-    0x0C47A: "LVT",
-    0x0C47B: "LVT",
-    0x0C47C: "LVT",
-    0x0C47D: "LVT",
-    0x0C47E: "LVT",
-    0x0C47F: "LVT",
-    0x0C481: "LVT",
-    0x0C482: "LVT",
-    0x0C483: "LVT",
-    0x0C484: "LVT",
-    0x0C485: "LVT",
-    0x0C486: "LVT",
-    0x0C487: "LVT",
-    0x0C488: "LVT",
-    0x0C489: "LVT",
-    0x0C48A: "LVT",
-    0x0C48B: "LVT",
-    0x0C48C: "LVT",
-    0x0C48D: "LVT",
-    0x0C48E: "LVT",
-    0x0C48F: "LVT",
-    0x0C490: "LVT",
-    0x0C491: "LVT",
-    0x0C492: "LVT",
-    0x0C493: "LVT",
-    0x0C494: "LVT",
-    0x0C495: "LVT",
-    0x0C496: "LVT",
-    0x0C497: "LVT",
-    0x0C498: "LVT",
-    0x0C499: "LVT",
-    0x0C49A: "LVT",
-    0x0C49B: "LVT",
-    0x0C49D: "LVT",
-    0x0C49E: "LVT",
-    0x0C49F: "LVT",
-    0x0C4A0: "LVT",
-    0x0C4A1: "LVT",
-    0x0C4A2: "LVT",
-    0x0C4A3: "LVT",
-    0x0C4A4: "LVT",
-    0x0C4A5: "LVT",
-    0x0C4A6: "LVT",
-    0x0C4A7: "LVT",
-    0x0C4A8: "LVT",
-    0x0C4A9: "LVT",
-    0x0C4AA: "LVT",
-    0x0C4AB: "LVT",
-    0x0C4AC: "LVT",
-    0x0C4AD: "LVT",
-    0x0C4AE: "LVT",
-    0x0C4AF: "LVT",
-    0x0C4B0: "LVT",
-    0x0C4B1: "LVT",
-    0x0C4B2: "LVT",
-    0x0C4B3: "LVT",
-    0x0C4B4: "LVT",
-    0x0C4B5: "LVT",
-    0x0C4B6: "LVT",
-    0x0C4B7: "LVT",
-    0x0C4B9: "LVT",
-    0x0C4BA: "LVT",
-    0x0C4BB: "LVT",
-    0x0C4BC: "LVT",
-    0x0C4BD: "LVT",
-    0x0C4BE: "LVT",
-    0x0C4BF: "LVT",
-    0x0C4C0: "LVT",
-    0x0C4C1: "LVT",
-    0x0C4C2: "LVT",
-    0x0C4C3: "LVT",
-    0x0C4C4: "LVT",
-    0x0C4C5: "LVT",
-    0x0C4C6: "LVT",
-    0x0C4C7: "LVT",
-    0x0C4C8: "LVT",
-    0x0C4C9: "LVT",
-    0x0C4CA: "LVT",
-    0x0C4CB: "LVT",
-    0x0C4CC: "LVT",
-    0x0C4CD: "LVT",
-    0x0C4CE: "LVT",
-    0x0C4CF: "LVT",
-    0x0C4D0: "LVT",
-    0x0C4D1: "LVT",
-    0x0C4D2: "LVT",
-    0x0C4D3: "LVT",
-    0x0C4D5: "LVT",
-    0x0C4D6: "LVT",
-    0x0C4D7: "LVT",
-    0x0C4D8: "LVT",
-    0x0C4D9: "LVT",
-    0x0C4DA: "LVT",
-    0x0C4DB: "LVT",
-    0x0C4DC: "LVT",
-    0x0C4DD: "LVT",
-    0x0C4DE: "LVT",
-    0x0C4DF: "LVT",
-    0x0C4E0: "LVT",
-    0x0C4E1: "LVT",
-    0x0C4E2: "LVT",
-    0x0C4E3: "LVT",
-    0x0C4E4: "LVT",
-    0x0C4E5: "LVT",
-    0x0C4E6: "LVT",
-    0x0C4E7: "LVT",
-    0x0C4E8: "LVT",
-    0x0C4E9: "LVT",
-    0x0C4EA: "LVT",
-    0x0C4EB: "LVT",
-    0x0C4EC: "LVT",
-    0x0C4ED: "LVT",
-    0x0C4EE: "LVT",
-    0x0C4EF: "LVT",
-    0x0C4F1: "LVT",
-    0x0C4F2: "LVT",
-    0x0C4F3: "LVT",
-    0x0C4F4: "LVT",
-    0x0C4F5: "LVT",
-    0x0C4F6: "LVT",
-    0x0C4F7: "LVT",
-    0x0C4F8: "LVT",
-    0x0C4F9: "LVT",
-    0x0C4FA: "LVT",
-    0x0C4FB: "LVT",
-    0x0C4FC: "LVT",
-    0x0C4FD: "LVT",
-    0x0C4FE: "LVT",
-    0x0C4FF: "LVT",
-    0x0C500: "LVT",
-    0x0C501: "LVT",
-    0x0C502: "LVT",
-    0x0C503: "LVT",
-    0x0C504: "LVT",
-    0x0C505: "LVT",
-    0x0C506: "LVT",
-    0x0C507: "LVT",
-    0x0C508: "LVT",
-    0x0C509: "LVT",
-    0x0C50A: "LVT",
-    0x0C50B: "LVT",
-    0x0C50D: "LVT",
-    0x0C50E: "LVT",
-    0x0C50F: "LVT",
-    0x0C510: "LVT",
-    0x0C511: "LVT",
-    0x0C512: "LVT",
-    0x0C513: "LVT",
-    0x0C514: "LVT",
-    0x0C515: "LVT",
-    0x0C516: "LVT",
-    0x0C517: "LVT",
-    0x0C518: "LVT",
-    0x0C519: "LVT",
-    0x0C51A: "LVT",
-    0x0C51B: "LVT",
-    0x0C51C: "LVT",
-    0x0C51D: "LVT",
-    0x0C51E: "LVT",
-    0x0C51F: "LVT",
-    0x0C520: "LVT",
-    0x0C521: "LVT",
-    0x0C522: "LVT",
-    0x0C523: "LVT",
-    0x0C524: "LVT",
-    0x0C525: "LVT",
-    0x0C526: "LVT",
-    0x0C527: "LVT",
-    0x0C529: "LVT",
-    0x0C52A: "LVT",
-    0x0C52B: "LVT",
-    0x0C52C: "LVT",
-    0x0C52D: "LVT",
-    0x0C52E: "LVT",
-    0x0C52F: "LVT",
-    0x0C530: "LVT",
-    0x0C531: "LVT",
-    0x0C532: "LVT",
-    0x0C533: "LVT",
-    0x0C534: "LVT",
-    0x0C535: "LVT",
-    0x0C536: "LVT",
-    0x0C537: "LVT",
-    0x0C538: "LVT",
-    0x0C539: "LVT",
-    0x0C53A: "LVT",
-    0x0C53B: "LVT",
-    0x0C53C: "LVT",
-    0x0C53D: "LVT",
-    0x0C53E: "LVT",
-    0x0C53F: "LVT",
-    0x0C540: "LVT",
-    0x0C541: "LVT",
-    0x0C542: "LVT",
-    0x0C543: "LVT",
-    0x0C545: "LVT",
-    0x0C546: "LVT",
-    0x0C547: "LVT",
-    0x0C548: "LVT",
-    0x0C549: "LVT",
-    0x0C54A: "LVT",
-    0x0C54B: "LVT",
-    0x0C54C: "LVT",
-    0x0C54D: "LVT",
-    0x0C54E: "LVT",
-    0x0C54F: "LVT",
-    0x0C550: "LVT",
-    0x0C551: "LVT",
-    0x0C552: "LVT",
-    0x0C553: "LVT",
-    0x0C554: "LVT",
-    0x0C555: "LVT",
-    0x0C556: "LVT",
-    0x0C557: "LVT",
-    0x0C558: "LVT",
-    0x0C559: "LVT",
-    0x0C55A: "LVT",
-    0x0C55B: "LVT",
-    0x0C55C: "LVT",
-    0x0C55D: "LVT",
-    0x0C55E: "LVT",
-    0x0C55F: "LVT",
-    0x0C561: "LVT",
-    0x0C562: "LVT",
-    0x0C563: "LVT",
-    0x0C564: "LVT",
-    0x0C565: "LVT",
-    0x0C566: "LVT",
-    0x0C567: "LVT",
-    0x0C568: "LVT",
-    0x0C569: "LVT",
-    0x0C56A: "LVT",
-    0x0C56B: "LVT",
-    0x0C56C: "LVT",
-    0x0C56D: "LVT",
-    0x0C56E: "LVT",
-    0x0C56F: "LVT",
-    0x0C570: "LVT",
-    0x0C571: "LVT",
-    0x0C572: "LVT",
-    0x0C573: "LVT",
-    0x0C574: "LVT",
-    0x0C575: "LVT",
-    0x0C576: "LVT",
-    0x0C577: "LVT",
-    0x0C578: "LVT",
-    0x0C579: "LVT",
-    0x0C57A: "LVT",
-    0x0C57B: "LVT",
-    0x0C57D: "LVT",
-    0x0C57E: "LVT",
-    0x0C57F: "LVT",
-    0x0C580: "LVT",
-    0x0C581: "LVT",
-    0x0C582: "LVT",
-    0x0C583: "LVT",
-    0x0C584: "LVT",
-    0x0C585: "LVT",
-    0x0C586: "LVT",
-    0x0C587: "LVT",
-    0x0C588: "LVT",
-    0x0C589: "LVT",
-    0x0C58A: "LVT",
-    0x0C58B: "LVT",
-    0x0C58C: "LVT",
-    0x0C58D: "LVT",
-    0x0C58E: "LVT",
-    0x0C58F: "LVT",
-    0x0C590: "LVT",
-    0x0C591: "LVT",
-    0x0C592: "LVT",
-    0x0C593: "LVT",
-    0x0C594: "LVT",
-    0x0C595: "LVT",
-    0x0C596: "LVT",
-    0x0C597: "LVT",
-    0x0C599: "LVT",
-    0x0C59A: "LVT",
-    0x0C59B: "LVT",
-    0x0C59C: "LVT",
-    0x0C59D: "LVT",
-    0x0C59E: "LVT",
-    0x0C59F: "LVT",
-    0x0C5A0: "LVT",
-    0x0C5A1: "LVT",
-    0x0C5A2: "LVT",
-    0x0C5A3: "LVT",
-    0x0C5A4: "LVT",
-    0x0C5A5: "LVT",
-    0x0C5A6: "LVT",
-    0x0C5A7: "LVT",
-    0x0C5A8: "LVT",
-    0x0C5A9: "LVT",
-    0x0C5AA: "LVT",
-    0x0C5AB: "LVT",
-    0x0C5AC: "LVT",
-    0x0C5AD: "LVT",
-    0x0C5AE: "LVT",
-    0x0C5AF: "LVT",
-    0x0C5B0: "LVT",
-    0x0C5B1: "LVT",
-    0x0C5B2: "LVT",
-    0x0C5B3: "LVT",
-    0x0C5B5: "LVT",
-    0x0C5B6: "LVT",
-    0x0C5B7: "LVT",
-    0x0C5B8: "LVT",
-    0x0C5B9: "LVT",
-    0x0C5BA: "LVT",
-    0x0C5BB: "LVT",
-    0x0C5BC: "LVT",
-    0x0C5BD: "LVT",
-    0x0C5BE: "LVT",
-    0x0C5BF: "LVT",
-    0x0C5C0: "LVT",
-    0x0C5C1: "LVT",
-    0x0C5C2: "LVT",
-    0x0C5C3: "LVT",
-    0x0C5C4: "LVT",
-    0x0C5C5: "LVT",
-    0x0C5C6: "LVT",
-    0x0C5C7: "LVT",
-    0x0C5C8: "LVT",
-    0x0C5C9: "LVT",
-    0x0C5CA: "LVT",
-    0x0C5CB: "LVT",
-    0x0C5CC: "LVT",
-    0x0C5CD: "LVT",
-    0x0C5CE: "LVT",
-    0x0C5CF: "LVT",
-    0x0C5D1: "LVT",
-    0x0C5D2: "LVT",
-    0x0C5D3: "LVT",
-    0x0C5D4: "LVT",
-    0x0C5D5: "LVT",
-    0x0C5D6: "LVT",
-    0x0C5D7: "LVT",
-    0x0C5D8: "LVT",
-    0x0C5D9: "LVT",
-    0x0C5DA: "LVT",
-    0x0C5DB: "LVT",
-    0x0C5DC: "LVT",
-    0x0C5DD: "LVT",
-    0x0C5DE: "LVT",
-    0x0C5DF: "LVT",
-    0x0C5E0: "LVT",
-    0x0C5E1: "LVT",
-    0x0C5E2: "LVT",
-    0x0C5E3: "LVT",
-    0x0C5E4: "LVT",
-    0x0C5E5: "LVT",
-    0x0C5E6: "LVT",
-    0x0C5E7: "LVT",
-    0x0C5E8: "LVT",
-    0x0C5E9: "LVT",
-    0x0C5EA: "LVT",
-    0x0C5EB: "LVT",
-    0x0C5ED: "LVT",
-    0x0C5EE: "LVT",
-    0x0C5EF: "LVT",
-    0x0C5F0: "LVT",
-    0x0C5F1: "LVT",
-    0x0C5F2: "LVT",
-    0x0C5F3: "LVT",
-    0x0C5F4: "LVT",
-    0x0C5F5: "LVT",
-    0x0C5F6: "LVT",
-    0x0C5F7: "LVT",
-    0x0C5F8: "LVT",
-    0x0C5F9: "LVT",
-    0x0C5FA: "LVT",
-    0x0C5FB: "LVT",
-    0x0C5FC: "LVT",
-    0x0C5FD: "LVT",
-    0x0C5FE: "LVT",
-    0x0C5FF: "LVT",
-    0x0C600: "LVT",
-    0x0C601: "LVT",
-    0x0C602: "LVT",
-    0x0C603: "LVT",
-    0x0C604: "LVT",
-    0x0C605: "LVT",
-    0x0C606: "LVT",
-    0x0C607: "LVT",
-    0x0C609: "LVT",
-    0x0C60A: "LVT",
-    0x0C60B: "LVT",
-    0x0C60C: "LVT",
-    0x0C60D: "LVT",
-    0x0C60E: "LVT",
-    0x0C60F: "LVT",
-    0x0C610: "LVT",
-    0x0C611: "LVT",
-    0x0C612: "LVT",
-    0x0C613: "LVT",
-    0x0C614: "LVT",
-    0x0C615: "LVT",
-    0x0C616: "LVT",
-    0x0C617: "LVT",
-    0x0C618: "LVT",
-    0x0C619: "LVT",
-    0x0C61A: "LVT",
-    0x0C61B: "LVT",
-    0x0C61C: "LVT",
-    0x0C61D: "LVT",
-    0x0C61E: "LVT",
-    0x0C61F: "LVT",
-    0x0C620: "LVT",
-    0x0C621: "LVT",
-    0x0C622: "LVT",
-    0x0C623: "LVT",
-    0x0C625: "LVT",
-    0x0C626: "LVT",
-    0x0C627: "LVT",
-    0x0C628: "LVT",
-    0x0C629: "LVT",
-    0x0C62A: "LVT",
-    0x0C62B: "LVT",
-    0x0C62C: "LVT",
-    0x0C62D: "LVT",
-    0x0C62E: "LVT",
-    0x0C62F: "LVT",
-    0x0C630: "LVT",
-    0x0C631: "LVT",
-    0x0C632: "LVT",
-    0x0C633: "LVT",
-    0x0C634: "LVT",
-    0x0C635: "LVT",
-    0x0C636: "LVT",
-    0x0C637: "LVT",
-    0x0C638: "LVT",
-    0x0C639: "LVT",
-    0x0C63A: "LVT",
-    0x0C63B: "LVT",
-    0x0C63C: "LVT",
-    0x0C63D: "LVT",
-    0x0C63E: "LVT",
-    0x0C63F: "LVT",
-    0x0C641: "LVT",
-    0x0C642: "LVT",
-    0x0C643: "LVT",
-    0x0C644: "LVT",
-    0x0C645: "LVT",
-    0x0C646: "LVT",
-    0x0C647: "LVT",
-    0x0C648: "LVT",
-    0x0C649: "LVT",
-    0x0C64A: "LVT",
-    0x0C64B: "LVT",
-    0x0C64C: "LVT",
-    0x0C64D: "LVT",
-    0x0C64E: "LVT",
-    0x0C64F: "LVT",
-    0x0C650: "LVT",
-    0x0C651: "LVT",
-    0x0C652: "LVT",
-    0x0C653: "LVT",
-    0x0C654: "LVT",
-    0x0C655: "LVT",
-    0x0C656: "LVT",
-    0x0C657: "LVT",
-    0x0C658: "LVT",
-    0x0C659: "LVT",
-    0x0C65A: "LVT",
-    0x0C65B: "LVT",
-    0x0C65D: "LVT",
-    0x0C65E: "LVT",
-    0x0C65F: "LVT",
-    0x0C660: "LVT",
-    0x0C661: "LVT",
-    0x0C662: "LVT",
-    0x0C663: "LVT",
-    0x0C664: "LVT",
-    0x0C665: "LVT",
-    0x0C666: "LVT",
-    0x0C667: "LVT",
-    0x0C668: "LVT",
-    0x0C669: "LVT",
-    0x0C66A: "LVT",
-    0x0C66B: "LVT",
-    0x0C66C: "LVT",
-    0x0C66D: "LVT",
-    0x0C66E: "LVT",
-    0x0C66F: "LVT",
-    0x0C670: "LVT",
-    0x0C671: "LVT",
-    0x0C672: "LVT",
-    0x0C673: "LVT",
-    0x0C674: "LVT",
-    0x0C675: "LVT",
-    0x0C676: "LVT",
-    0x0C677: "LVT",
-    0x0C679: "LVT",
-    0x0C67A: "LVT",
-    0x0C67B: "LVT",
-    0x0C67C: "LVT",
-    0x0C67D: "LVT",
-    0x0C67E: "LVT",
-    0x0C67F: "LVT",
-    0x0C680: "LVT",
-    0x0C681: "LVT",
-    0x0C682: "LVT",
-    0x0C683: "LVT",
-    0x0C684: "LVT",
-    0x0C685: "LVT",
-    0x0C686: "LVT",
-    0x0C687: "LVT",
-    0x0C688: "LVT",
-    0x0C689: "LVT",
-    0x0C68A: "LVT",
-    0x0C68B: "LVT",
-    0x0C68C: "LVT",
-    0x0C68D: "LVT",
-    0x0C68E: "LVT",
-    0x0C68F: "LVT",
-    0x0C690: "LVT",
-    0x0C691: "LVT",
-    0x0C692: "LVT",
-    0x0C693: "LVT",
-    0x0C695: "LVT",
-    0x0C696: "LVT",
-    0x0C697: "LVT",
-    0x0C698: "LVT",
-    0x0C699: "LVT",
-    0x0C69A: "LVT",
-    0x0C69B: "LVT",
-    0x0C69C: "LVT",
-    0x0C69D: "LVT",
-    0x0C69E: "LVT",
-    0x0C69F: "LVT",
-    0x0C6A0: "LVT",
-    0x0C6A1: "LVT",
-    0x0C6A2: "LVT",
-    0x0C6A3: "LVT",
-    0x0C6A4: "LVT",
-    0x0C6A5: "LVT",
-    0x0C6A6: "LVT",
-    0x0C6A7: "LVT",
-    0x0C6A8: "LVT",
-    0x0C6A9: "LVT",
-    0x0C6AA: "LVT",
-    0x0C6AB: "LVT",
-    0x0C6AC: "LVT",
-    0x0C6AD: "LVT",
-    0x0C6AE: "LVT",
-    0x0C6AF: "LVT",
-    0x0C6B1: "LVT",
-    0x0C6B2: "LVT",
-    0x0C6B3: "LVT",
-    0x0C6B4: "LVT",
-    0x0C6B5: "LVT",
-    0x0C6B6: "LVT",
-    0x0C6B7: "LVT",
-    0x0C6B8: "LVT",
-    0x0C6B9: "LVT",
-    0x0C6BA: "LVT",
-    0x0C6BB: "LVT",
-    0x0C6BC: "LVT",
-    0x0C6BD: "LVT",
-    0x0C6BE: "LVT",
-    0x0C6BF: "LVT",
-    0x0C6C0: "LVT",
-    0x0C6C1: "LVT",
-    0x0C6C2: "LVT",
-    0x0C6C3: "LVT",
-    0x0C6C4: "LVT",
-    0x0C6C5: "LVT",
-    0x0C6C6: "LVT",
-    0x0C6C7: "LVT",
-    0x0C6C8: "LVT",
-    0x0C6C9: "LVT",
-    0x0C6CA: "LVT",
-    0x0C6CB: "LVT",
-    0x0C6CD: "LVT",
-    0x0C6CE: "LVT",
-    0x0C6CF: "LVT",
-    0x0C6D0: "LVT",
-    0x0C6D1: "LVT",
-    0x0C6D2: "LVT",
-    0x0C6D3: "LVT",
-    0x0C6D4: "LVT",
-    0x0C6D5: "LVT",
-    0x0C6D6: "LVT",
-    0x0C6D7: "LVT",
-    0x0C6D8: "LVT",
-    0x0C6D9: "LVT",
-    0x0C6DA: "LVT",
-    0x0C6DB: "LVT",
-    0x0C6DC: "LVT",
-    0x0C6DD: "LVT",
-    0x0C6DE: "LVT",
-    0x0C6DF: "LVT",
-    0x0C6E0: "LVT",
-    0x0C6E1: "LVT",
-    0x0C6E2: "LVT",
-    0x0C6E3: "LVT",
-    0x0C6E4: "LVT",
-    0x0C6E5: "LVT",
-    0x0C6E6: "LVT",
-    0x0C6E7: "LVT",
-    0x0C6E9: "LVT",
-    0x0C6EA: "LVT",
-    0x0C6EB: "LVT",
-    0x0C6EC: "LVT",
-    0x0C6ED: "LVT",
-    0x0C6EE: "LVT",
-    0x0C6EF: "LVT",
-    0x0C6F0: "LVT",
-    0x0C6F1: "LVT",
-    0x0C6F2: "LVT",
-    0x0C6F3: "LVT",
-    0x0C6F4: "LVT",
-    0x0C6F5: "LVT",
-    0x0C6F6: "LVT",
-    0x0C6F7: "LVT",
-    0x0C6F8: "LVT",
-    0x0C6F9: "LVT",
-    0x0C6FA: "LVT",
-    0x0C6FB: "LVT",
-    0x0C6FC: "LVT",
-    0x0C6FD: "LVT",
-    0x0C6FE: "LVT",
-    0x0C6FF: "LVT",
-    0x0C700: "LVT",
-    0x0C701: "LVT",
-    0x0C702: "LVT",
-    0x0C703: "LVT",
-    0x0C705: "LVT",
-    0x0C706: "LVT",
-    0x0C707: "LVT",
-    0x0C708: "LVT",
-    0x0C709: "LVT",
-    0x0C70A: "LVT",
-    0x0C70B: "LVT",
-    0x0C70C: "LVT",
-    0x0C70D: "LVT",
-    0x0C70E: "LVT",
-    0x0C70F: "LVT",
-    0x0C710: "LVT",
-    0x0C711: "LVT",
-    0x0C712: "LVT",
-    0x0C713: "LVT",
-    0x0C714: "LVT",
-    0x0C715: "LVT",
-    0x0C716: "LVT",
-    0x0C717: "LVT",
-    0x0C718: "LVT",
-    0x0C719: "LVT",
-    0x0C71A: "LVT",
-    0x0C71B: "LVT",
-    0x0C71C: "LVT",
-    0x0C71D: "LVT",
-    0x0C71E: "LVT",
-    0x0C71F: "LVT",
-    0x0C721: "LVT",
-    0x0C722: "LVT",
-    0x0C723: "LVT",
-    0x0C724: "LVT",
-    0x0C725: "LVT",
-    0x0C726: "LVT",
-    0x0C727: "LVT",
-    0x0C728: "LVT",
-    0x0C729: "LVT",
-    0x0C72A: "LVT",
-    0x0C72B: "LVT",
-    0x0C72C: "LVT",
-    0x0C72D: "LVT",
-    0x0C72E: "LVT",
-    0x0C72F: "LVT",
-    0x0C730: "LVT",
-    0x0C731: "LVT",
-    0x0C732: "LVT",
-    0x0C733: "LVT",
-    0x0C734: "LVT",
-    0x0C735: "LVT",
-    0x0C736: "LVT",
-    0x0C737: "LVT",
-    0x0C738: "LVT",
-    0x0C739: "LVT",
-    0x0C73A: "LVT",
-    0x0C73B: "LVT",
-    0x0C73D: "LVT",
-    0x0C73E: "LVT",
-    0x0C73F: "LVT",
-    0x0C740: "LVT",
-    0x0C741: "LVT",
-    0x0C742: "LVT",
-    0x0C743: "LVT",
-    0x0C744: "LVT",
-    0x0C745: "LVT",
-    0x0C746: "LVT",
-    0x0C747: "LVT",
-    0x0C748: "LVT",
-    0x0C749: "LVT",
-    0x0C74A: "LVT",
-    0x0C74B: "LVT",
-    0x0C74C: "LVT",
-    0x0C74D: "LVT",
-    0x0C74E: "LVT",
-    0x0C74F: "LVT",
-    0x0C750: "LVT",
-    0x0C751: "LVT",
-    0x0C752: "LVT",
-    0x0C753: "LVT",
-    0x0C754: "LVT",
-    0x0C755: "LVT",
-    0x0C756: "LVT",
-    0x0C757: "LVT",
-    0x0C759: "LVT",
-    0x0C75A: "LVT",
-    0x0C75B: "LVT",
-    0x0C75C: "LVT",
-    0x0C75D: "LVT",
-    0x0C75E: "LVT",
-    0x0C75F: "LVT",
-    0x0C760: "LVT",
-    0x0C761: "LVT",
-    0x0C762: "LVT",
-    0x0C763: "LVT",
-    0x0C764: "LVT",
-    0x0C765: "LVT",
-    0x0C766: "LVT",
-    0x0C767: "LVT",
-    0x0C768: "LVT",
-    0x0C769: "LVT",
-    0x0C76A: "LVT",
-    0x0C76B: "LVT",
-    0x0C76C: "LVT",
-    0x0C76D: "LVT",
-    0x0C76E: "LVT",
-    0x0C76F: "LVT",
-    0x0C770: "LVT",
-    0x0C771: "LVT",
-    0x0C772: "LVT",
-    0x0C773: "LVT",
-    0x0C775: "LVT",
-    0x0C776: "LVT",
-    0x0C777: "LVT",
-    0x0C778: "LVT",
-    0x0C779: "LVT",
-    0x0C77A: "LVT",
-    0x0C77B: "LVT",
-    0x0C77C: "LVT",
-    0x0C77D: "LVT",
-    0x0C77E: "LVT",
-    0x0C77F: "LVT",
-    0x0C780: "LVT",
-    0x0C781: "LVT",
-    0x0C782: "LVT",
-    0x0C783: "LVT",
-    0x0C784: "LVT",
-    0x0C785: "LVT",
-    0x0C786: "LVT",
-    0x0C787: "LVT",
-    0x0C788: "LVT",
-    0x0C789: "LVT",
-    0x0C78A: "LVT",
-    0x0C78B: "LVT",
-    0x0C78C: "LVT",
-    0x0C78D: "LVT",
-    0x0C78E: "LVT",
-    0x0C78F: "LVT",
-    0x0C791: "LVT",
-    0x0C792: "LVT",
-    0x0C793: "LVT",
-    0x0C794: "LVT",
-    0x0C795: "LVT",
-    0x0C796: "LVT",
-    0x0C797: "LVT",
-    0x0C798: "LVT",
-    0x0C799: "LVT",
-    0x0C79A: "LVT",
-    0x0C79B: "LVT",
-    0x0C79C: "LVT",
-    0x0C79D: "LVT",
-    0x0C79E: "LVT",
-    0x0C79F: "LVT",
-    0x0C7A0: "LVT",
-    0x0C7A1: "LVT",
-    0x0C7A2: "LVT",
-    0x0C7A3: "LVT",
-    0x0C7A4: "LVT",
-    0x0C7A5: "LVT",
-    0x0C7A6: "LVT",
-    0x0C7A7: "LVT",
-    0x0C7A8: "LVT",
-    0x0C7A9: "LVT",
-    0x0C7AA: "LVT",
-    0x0C7AB: "LVT",
-    0x0C7AD: "LVT",
-    0x0C7AE: "LVT",
-    0x0C7AF: "LVT",
-    0x0C7B0: "LVT",
-    0x0C7B1: "LVT",
-    0x0C7B2: "LVT",
-    0x0C7B3: "LVT",
-    0x0C7B4: "LVT",
-    0x0C7B5: "LVT",
-    0x0C7B6: "LVT",
-    0x0C7B7: "LVT",
-    0x0C7B8: "LVT",
-    0x0C7B9: "LVT",
-    0x0C7BA: "LVT",
-    0x0C7BB: "LVT",
-    0x0C7BC: "LVT",
-    0x0C7BD: "LVT",
-    0x0C7BE: "LVT",
-    0x0C7BF: "LVT",
-    0x0C7C0: "LVT",
-    0x0C7C1: "LVT",
-    0x0C7C2: "LVT",
-    0x0C7C3: "LVT",
-    0x0C7C4: "LVT",
-    0x0C7C5: "LVT",
-    0x0C7C6: "LVT",
-    0x0C7C7: "LVT",
-    0x0C7C9: "LVT",
-    0x0C7CA: "LVT",
-    0x0C7CB: "LVT",
-    0x0C7CC: "LVT",
-    0x0C7CD: "LVT",
-    0x0C7CE: "LVT",
-    0x0C7CF: "LVT",
-    0x0C7D0: "LVT",
-    0x0C7D1: "LVT",
-    0x0C7D2: "LVT",
-    0x0C7D3: "LVT",
-    0x0C7D4: "LVT",
-    0x0C7D5: "LVT",
-    0x0C7D6: "LVT",
-    0x0C7D7: "LVT",
-    0x0C7D8: "LVT",
-    0x0C7D9: "LVT",
-    0x0C7DA: "LVT",
-    0x0C7DB: "LVT",
-    0x0C7DC: "LVT",
-    0x0C7DD: "LVT",
-    0x0C7DE: "LVT",
-    0x0C7DF: "LVT",
-    0x0C7E0: "LVT",
-    0x0C7E1: "LVT",
-    0x0C7E2: "LVT",
-    0x0C7E3: "LVT",
-    0x0C7E5: "LVT",
-    0x0C7E6: "LVT",
-    0x0C7E7: "LVT",
-    0x0C7E8: "LVT",
-    0x0C7E9: "LVT",
-    0x0C7EA: "LVT",
-    0x0C7EB: "LVT",
-    0x0C7EC: "LVT",
-    0x0C7ED: "LVT",
-    0x0C7EE: "LVT",
-    0x0C7EF: "LVT",
-    0x0C7F0: "LVT",
-    0x0C7F1: "LVT",
-    0x0C7F2: "LVT",
-    0x0C7F3: "LVT",
-    0x0C7F4: "LVT",
-    0x0C7F5: "LVT",
-    0x0C7F6: "LVT",
-    0x0C7F7: "LVT",
-    0x0C7F8: "LVT",
-    0x0C7F9: "LVT",
-    0x0C7FA: "LVT",
-    0x0C7FB: "LVT",
-    0x0C7FC: "LVT",
-    0x0C7FD: "LVT",
-    0x0C7FE: "LVT",
-    0x0C7FF: "LVT",
-    0x0C801: "LVT",
-    0x0C802: "LVT",
-    0x0C803: "LVT",
-    0x0C804: "LVT",
-    0x0C805: "LVT",
-    0x0C806: "LVT",
-    0x0C807: "LVT",
-    0x0C808: "LVT",
-    0x0C809: "LVT",
-    0x0C80A: "LVT",
-    0x0C80B: "LVT",
-    0x0C80C: "LVT",
-    0x0C80D: "LVT",
-    0x0C80E: "LVT",
-    0x0C80F: "LVT",
-    0x0C810: "LVT",
-    0x0C811: "LVT",
-    0x0C812: "LVT",
-    0x0C813: "LVT",
-    0x0C814: "LVT",
-    0x0C815: "LVT",
-    0x0C816: "LVT",
-    0x0C817: "LVT",
-    0x0C818: "LVT",
-    0x0C819: "LVT",
-    0x0C81A: "LVT",
-    0x0C81B: "LVT",
-    0x0C81D: "LVT",
-    0x0C81E: "LVT",
-    0x0C81F: "LVT",
-    0x0C820: "LVT",
-    0x0C821: "LVT",
-    0x0C822: "LVT",
-    0x0C823: "LVT",
-    0x0C824: "LVT",
-    0x0C825: "LVT",
-    0x0C826: "LVT",
-    0x0C827: "LVT",
-    0x0C828: "LVT",
-    0x0C829: "LVT",
-    0x0C82A: "LVT",
-    0x0C82B: "LVT",
-    0x0C82C: "LVT",
-    0x0C82D: "LVT",
-    0x0C82E: "LVT",
-    0x0C82F: "LVT",
-    0x0C830: "LVT",
-    0x0C831: "LVT",
-    0x0C832: "LVT",
-    0x0C833: "LVT",
-    0x0C834: "LVT",
-    0x0C835: "LVT",
-    0x0C836: "LVT",
-    0x0C837: "LVT",
-    0x0C839: "LVT",
-    0x0C83A: "LVT",
-    0x0C83B: "LVT",
-    0x0C83C: "LVT",
-    0x0C83D: "LVT",
-    0x0C83E: "LVT",
-    0x0C83F: "LVT",
-    0x0C840: "LVT",
-    0x0C841: "LVT",
-    0x0C842: "LVT",
-    0x0C843: "LVT",
-    0x0C844: "LVT",
-    0x0C845: "LVT",
-    0x0C846: "LVT",
-    0x0C847: "LVT",
-    0x0C848: "LVT",
-    0x0C849: "LVT",
-    0x0C84A: "LVT",
-    0x0C84B: "LVT",
-    0x0C84C: "LVT",
-    0x0C84D: "LVT",
-    0x0C84E: "LVT",
-    0x0C84F: "LVT",
-    0x0C850: "LVT",
-    0x0C851: "LVT",
-    0x0C852: "LVT",
-    0x0C853: "LVT",
-    0x0C855: "LVT",
-    0x0C856: "LVT",
-    0x0C857: "LVT",
-    0x0C858: "LVT",
-    0x0C859: "LVT",
-    0x0C85A: "LVT",
-    0x0C85B: "LVT",
-    0x0C85C: "LVT",
-    0x0C85D: "LVT",
-    0x0C85E: "LVT",
-    0x0C85F: "LVT",
-    0x0C860: "LVT",
-    0x0C861: "LVT",
-    0x0C862: "LVT",
-    0x0C863: "LVT",
-    0x0C864: "LVT",
-    0x0C865: "LVT",
-    0x0C866: "LVT",
-    0x0C867: "LVT",
-    0x0C868: "LVT",
-    0x0C869: "LVT",
-    0x0C86A: "LVT",
-    0x0C86B: "LVT",
-    0x0C86C: "LVT",
-    0x0C86D: "LVT",
-    0x0C86E: "LVT",
-    0x0C86F: "LVT",
-    0x0C871: "LVT",
-    0x0C872: "LVT",
-    0x0C873: "LVT",
-    0x0C874: "LVT",
-    0x0C875: "LVT",
-    0x0C876: "LVT",
-    0x0C877: "LVT",
-    0x0C878: "LVT",
-    0x0C879: "LVT",
-    0x0C87A: "LVT",
-    0x0C87B: "LVT",
-    0x0C87C: "LVT",
-    0x0C87D: "LVT",
-    0x0C87E: "LVT",
-    0x0C87F: "LVT",
-    0x0C880: "LVT",
-    0x0C881: "LVT",
-    0x0C882: "LVT",
-    0x0C883: "LVT",
-    0x0C884: "LVT",
-    0x0C885: "LVT",
-    0x0C886: "LVT",
-    0x0C887: "LVT",
-    0x0C888: "LVT",
-    0x0C889: "LVT",
-    0x0C88A: "LVT",
-    0x0C88B: "LVT",
-    0x0C88D: "LVT",
-    0x0C88E: "LVT",
-    0x0C88F: "LVT",
-    0x0C890: "LVT",
-    0x0C891: "LVT",
-    0x0C892: "LVT",
-    0x0C893: "LVT",
-    0x0C894: "LVT",
-    0x0C895: "LVT",
-    0x0C896: "LVT",
-    0x0C897: "LVT",
-    0x0C898: "LVT",
-    0x0C899: "LVT",
-    0x0C89A: "LVT",
-    0x0C89B: "LVT",
-    0x0C89C: "LVT",
-    0x0C89D: "LVT",
-    0x0C89E: "LVT",
-    0x0C89F: "LVT",
-    0x0C8A0: "LVT",
-    0x0C8A1: "LVT",
-    0x0C8A2: "LVT",
-    0x0C8A3: "LVT",
-    0x0C8A4: "LVT",
-    0x0C8A5: "LVT",
-    0x0C8A6: "LVT",
-    0x0C8A7: "LVT",
-    0x0C8A9: "LVT",
-    0x0C8AA: "LVT",
-    0x0C8AB: "LVT",
-    0x0C8AC: "LVT",
-    0x0C8AD: "LVT",
-    0x0C8AE: "LVT",
-    0x0C8AF: "LVT",
-    0x0C8B0: "LVT",
-    0x0C8B1: "LVT",
-    0x0C8B2: "LVT",
-    0x0C8B3: "LVT",
-    0x0C8B4: "LVT",
-    0x0C8B5: "LVT",
-    0x0C8B6: "LVT",
-    0x0C8B7: "LVT",
-    0x0C8B8: "LVT",
-    0x0C8B9: "LVT",
-    0x0C8BA: "LVT",
-    0x0C8BB: "LVT",
-    0x0C8BC: "LVT",
-    0x0C8BD: "LVT",
-    0x0C8BE: "LVT",
-    0x0C8BF: "LVT",
-    0x0C8C0: "LVT",
-    0x0C8C1: "LVT",
-    0x0C8C2: "LVT",
-    0x0C8C3: "LVT",
-    0x0C8C5: "LVT",
-    0x0C8C6: "LVT",
-    0x0C8C7: "LVT",
-    0x0C8C8: "LVT",
-    0x0C8C9: "LVT",
-    0x0C8CA: "LVT",
-    0x0C8CB: "LVT",
-    0x0C8CC: "LVT",
-    0x0C8CD: "LVT",
-    0x0C8CE: "LVT",
-    0x0C8CF: "LVT",
-    0x0C8D0: "LVT",
-    0x0C8D1: "LVT",
-    0x0C8D2: "LVT",
-    0x0C8D3: "LVT",
-    0x0C8D4: "LVT",
-    0x0C8D5: "LVT",
-    0x0C8D6: "LVT",
-    0x0C8D7: "LVT",
-    0x0C8D8: "LVT",
-    0x0C8D9: "LVT",
-    0x0C8DA: "LVT",
-    0x0C8DB: "LVT",
-    0x0C8DC: "LVT",
-    0x0C8DD: "LVT",
-    0x0C8DE: "LVT",
-    0x0C8DF: "LVT",
-    0x0C8E1: "LVT",
-    0x0C8E2: "LVT",
-    0x0C8E3: "LVT",
-    0x0C8E4: "LVT",
-    0x0C8E5: "LVT",
-    0x0C8E6: "LVT",
-    0x0C8E7: "LVT",
-    0x0C8E8: "LVT",
-    0x0C8E9: "LVT",
-    0x0C8EA: "LVT",
-    0x0C8EB: "LVT",
-    0x0C8EC: "LVT",
-    0x0C8ED: "LVT",
-    0x0C8EE: "LVT",
-    0x0C8EF: "LVT",
-    0x0C8F0: "LVT",
-    0x0C8F1: "LVT",
-    0x0C8F2: "LVT",
-    0x0C8F3: "LVT",
-    0x0C8F4: "LVT",
-    0x0C8F5: "LVT",
-    0x0C8F6: "LVT",
-    0x0C8F7: "LVT",
-    0x0C8F8: "LVT",
-    0x0C8F9: "LVT",
-    0x0C8FA: "LVT",
-    0x0C8FB: "LVT",
-    0x0C8FD: "LVT",
-    0x0C8FE: "LVT",
-    0x0C8FF: "LVT",
-    0x0C900: "LVT",
-    0x0C901: "LVT",
-    0x0C902: "LVT",
-    0x0C903: "LVT",
-    0x0C904: "LVT",
-    0x0C905: "LVT",
-    0x0C906: "LVT",
-    0x0C907: "LVT",
-    0x0C908: "LVT",
-    0x0C909: "LVT",
-    0x0C90A: "LVT",
-    0x0C90B: "LVT",
-    0x0C90C: "LVT",
-    0x0C90D: "LVT",
-    0x0C90E: "LVT",
-    0x0C90F: "LVT",
-    0x0C910: "LVT",
-    0x0C911: "LVT",
-    0x0C912: "LVT",
-    0x0C913: "LVT",
-    0x0C914: "LVT",
-    0x0C915: "LVT",
-    0x0C916: "LVT",
-    0x0C917: "LVT",
-    0x0C919: "LVT",
-    0x0C91A: "LVT",
-    0x0C91B: "LVT",
-    0x0C91C: "LVT",
-    0x0C91D: "LVT",
-    0x0C91E: "LVT",
-    0x0C91F: "LVT",
-    0x0C920: "LVT",
-    0x0C921: "LVT",
-    0x0C922: "LVT",
-    0x0C923: "LVT",
-    0x0C924: "LVT",
-    0x0C925: "LVT",
-    0x0C926: "LVT",
-    0x0C927: "LVT",
-    0x0C928: "LVT",
-    0x0C929: "LVT",
-    0x0C92A: "LVT",
-    0x0C92B: "LVT",
-    0x0C92C: "LVT",
-    0x0C92D: "LVT",
-    0x0C92E: "LVT",
-    0x0C92F: "LVT",
-    0x0C930: "LVT",
-    0x0C931: "LVT",
-    0x0C932: "LVT",
-    0x0C933: "LVT",
-    0x0C935: "LVT",
-    0x0C936: "LVT",
-    0x0C937: "LVT",
-    0x0C938: "LVT",
-    0x0C939: "LVT",
-    0x0C93A: "LVT",
-    0x0C93B: "LVT",
-    0x0C93C: "LVT",
-    0x0C93D: "LVT",
-    0x0C93E: "LVT",
-    0x0C93F: "LVT",
-    0x0C940: "LVT",
-    0x0C941: "LVT",
-    0x0C942: "LVT",
-    0x0C943: "LVT",
-    0x0C944: "LVT",
-    0x0C945: "LVT",
-    0x0C946: "LVT",
-    0x0C947: "LVT",
-    0x0C948: "LVT",
-    0x0C949: "LVT",
-    0x0C94A: "LVT",
-    0x0C94B: "LVT",
-    0x0C94C: "LVT",
-    0x0C94D: "LVT",
-    0x0C94E: "LVT",
-    0x0C94F: "LVT",
-    0x0C951: "LVT",
-    0x0C952: "LVT",
-    0x0C953: "LVT",
-    0x0C954: "LVT",
-    0x0C955: "LVT",
-    0x0C956: "LVT",
-    0x0C957: "LVT",
-    0x0C958: "LVT",
-    0x0C959: "LVT",
-    0x0C95A: "LVT",
-    0x0C95B: "LVT",
-    0x0C95C: "LVT",
-    0x0C95D: "LVT",
-    0x0C95E: "LVT",
-    0x0C95F: "LVT",
-    0x0C960: "LVT",
-    0x0C961: "LVT",
-    0x0C962: "LVT",
-    0x0C963: "LVT",
-    0x0C964: "LVT",
-    0x0C965: "LVT",
-    0x0C966: "LVT",
-    0x0C967: "LVT",
-    0x0C968: "LVT",
-    0x0C969: "LVT",
-    0x0C96A: "LVT",
-    0x0C96B: "LVT",
-    0x0C96D: "LVT",
-    0x0C96E: "LVT",
-    0x0C96F: "LVT",
-    0x0C970: "LVT",
-    0x0C971: "LVT",
-    0x0C972: "LVT",
-    0x0C973: "LVT",
-    0x0C974: "LVT",
-    0x0C975: "LVT",
-    0x0C976: "LVT",
-    0x0C977: "LVT",
-    0x0C978: "LVT",
-    0x0C979: "LVT",
-    0x0C97A: "LVT",
-    0x0C97B: "LVT",
-    0x0C97C: "LVT",
-    0x0C97D: "LVT",
-    0x0C97E: "LVT",
-    0x0C97F: "LVT",
-    0x0C980: "LVT",
-    0x0C981: "LVT",
-    0x0C982: "LVT",
-    0x0C983: "LVT",
-    0x0C984: "LVT",
-    0x0C985: "LVT",
-    0x0C986: "LVT",
-    0x0C987: "LVT",
-    0x0C989: "LVT",
-    0x0C98A: "LVT",
-    0x0C98B: "LVT",
-    0x0C98C: "LVT",
-    0x0C98D: "LVT",
-    0x0C98E: "LVT",
-    0x0C98F: "LVT",
-    0x0C990: "LVT",
-    0x0C991: "LVT",
-    0x0C992: "LVT",
-    0x0C993: "LVT",
-    0x0C994: "LVT",
-    0x0C995: "LVT",
-    0x0C996: "LVT",
-    0x0C997: "LVT",
-    0x0C998: "LVT",
-    0x0C999: "LVT",
-    0x0C99A: "LVT",
-    0x0C99B: "LVT",
-    0x0C99C: "LVT",
-    0x0C99D: "LVT",
-    0x0C99E: "LVT",
-    0x0C99F: "LVT",
-    0x0C9A0: "LVT",
-    0x0C9A1: "LVT",
-    0x0C9A2: "LVT",
-    0x0C9A3: "LVT",
-    0x0C9A5: "LVT",
-    0x0C9A6: "LVT",
-    0x0C9A7: "LVT",
-    0x0C9A8: "LVT",
-    0x0C9A9: "LVT",
-    0x0C9AA: "LVT",
-    0x0C9AB: "LVT",
-    0x0C9AC: "LVT",
-    0x0C9AD: "LVT",
-    0x0C9AE: "LVT",
-    0x0C9AF: "LVT",
-    0x0C9B0: "LVT",
-    0x0C9B1: "LVT",
-    0x0C9B2: "LVT",
-    0x0C9B3: "LVT",
-    0x0C9B4: "LVT",
-    0x0C9B5: "LVT",
-    0x0C9B6: "LVT",
-    0x0C9B7: "LVT",
-    0x0C9B8: "LVT",
-    0x0C9B9: "LVT",
-    0x0C9BA: "LVT",
-    0x0C9BB: "LVT",
-    0x0C9BC: "LVT",
-    0x0C9BD: "LVT",
-    0x0C9BE: "LVT",
-    0x0C9BF: "LVT",
-    0x0C9C1: "LVT",
-    0x0C9C2: "LVT",
-    0x0C9C3: "LVT",
-    0x0C9C4: "LVT",
-    0x0C9C5: "LVT",
-    0x0C9C6: "LVT",
-    0x0C9C7: "LVT",
-    0x0C9C8: "LVT",
-    0x0C9C9: "LVT",
-    0x0C9CA: "LVT",
-    0x0C9CB: "LVT",
-    0x0C9CC: "LVT",
-    0x0C9CD: "LVT",
-    0x0C9CE: "LVT",
-    0x0C9CF: "LVT",
-    0x0C9D0: "LVT",
-    0x0C9D1: "LVT",
-    0x0C9D2: "LVT",
-    0x0C9D3: "LVT",
-    0x0C9D4: "LVT",
-    0x0C9D5: "LVT",
-    0x0C9D6: "LVT",
-    0x0C9D7: "LVT",
-    0x0C9D8: "LVT",
-    0x0C9D9: "LVT",
-    0x0C9DA: "LVT",
-    0x0C9DB: "LVT",
-    0x0C9DD: "LVT",
-    0x0C9DE: "LVT",
-    0x0C9DF: "LVT",
-    0x0C9E0: "LVT",
-    0x0C9E1: "LVT",
-    0x0C9E2: "LVT",
-    0x0C9E3: "LVT",
-    0x0C9E4: "LVT",
-    0x0C9E5: "LVT",
-    0x0C9E6: "LVT",
-    0x0C9E7: "LVT",
-    0x0C9E8: "LVT",
-    0x0C9E9: "LVT",
-    0x0C9EA: "LVT",
-    0x0C9EB: "LVT",
-    0x0C9EC: "LVT",
-    0x0C9ED: "LVT",
-    0x0C9EE: "LVT",
-    0x0C9EF: "LVT",
-    0x0C9F0: "LVT",
-    0x0C9F1: "LVT",
-    0x0C9F2: "LVT",
-    0x0C9F3: "LVT",
-    0x0C9F4: "LVT",
-    0x0C9F5: "LVT",
-    0x0C9F6: "LVT",
-    0x0C9F7: "LVT",
-    0x0C9F9: "LVT",
-    0x0C9FA: "LVT",
-    0x0C9FB: "LVT",
-    0x0C9FC: "LVT",
-    0x0C9FD: "LVT",
-    0x0C9FE: "LVT",
-    0x0C9FF: "LVT",
-    0x0CA00: "LVT",
-    0x0CA01: "LVT",
-    0x0CA02: "LVT",
-    0x0CA03: "LVT",
-    0x0CA04: "LVT",
-    0x0CA05: "LVT",
-    0x0CA06: "LVT",
-    0x0CA07: "LVT",
-    0x0CA08: "LVT",
-    0x0CA09: "LVT",
-    0x0CA0A: "LVT",
-    0x0CA0B: "LVT",
-    0x0CA0C: "LVT",
-    0x0CA0D: "LVT",
-    0x0CA0E: "LVT",
-    0x0CA0F: "LVT",
-    0x0CA10: "LVT",
-    0x0CA11: "LVT",
-    0x0CA12: "LVT",
-    0x0CA13: "LVT",
-    0x0CA15: "LVT",
-    0x0CA16: "LVT",
-    0x0CA17: "LVT",
-    0x0CA18: "LVT",
-    0x0CA19: "LVT",
-    0x0CA1A: "LVT",
-    0x0CA1B: "LVT",
-    0x0CA1C: "LVT",
-    0x0CA1D: "LVT",
-    0x0CA1E: "LVT",
-    0x0CA1F: "LVT",
-    0x0CA20: "LVT",
-    0x0CA21: "LVT",
-    0x0CA22: "LVT",
-    0x0CA23: "LVT",
-    0x0CA24: "LVT",
-    0x0CA25: "LVT",
-    0x0CA26: "LVT",
-    0x0CA27: "LVT",
-    0x0CA28: "LVT",
-    0x0CA29: "LVT",
-    0x0CA2A: "LVT",
-    0x0CA2B: "LVT",
-    0x0CA2C: "LVT",
-    0x0CA2D: "LVT",
-    0x0CA2E: "LVT",
-    0x0CA2F: "LVT",
-    0x0CA31: "LVT",
-    0x0CA32: "LVT",
-    0x0CA33: "LVT",
-    0x0CA34: "LVT",
-    0x0CA35: "LVT",
-    0x0CA36: "LVT",
-    0x0CA37: "LVT",
-    0x0CA38: "LVT",
-    0x0CA39: "LVT",
-    0x0CA3A: "LVT",
-    0x0CA3B: "LVT",
-    0x0CA3C: "LVT",
-    0x0CA3D: "LVT",
-    0x0CA3E: "LVT",
-    0x0CA3F: "LVT",
-    0x0CA40: "LVT",
-    0x0CA41: "LVT",
-    0x0CA42: "LVT",
-    0x0CA43: "LVT",
-    0x0CA44: "LVT",
-    0x0CA45: "LVT",
-    0x0CA46: "LVT",
-    0x0CA47: "LVT",
-    0x0CA48: "LVT",
-    0x0CA49: "LVT",
-    0x0CA4A: "LVT",
-    0x0CA4B: "LVT",
-    0x0CA4D: "LVT",
-    0x0CA4E: "LVT",
-    0x0CA4F: "LVT",
-    0x0CA50: "LVT",
-    0x0CA51: "LVT",
-    0x0CA52: "LVT",
-    0x0CA53: "LVT",
-    0x0CA54: "LVT",
-    0x0CA55: "LVT",
-    0x0CA56: "LVT",
-    0x0CA57: "LVT",
-    0x0CA58: "LVT",
-    0x0CA59: "LVT",
-    0x0CA5A: "LVT",
-    0x0CA5B: "LVT",
-    0x0CA5C: "LVT",
-    0x0CA5D: "LVT",
-    0x0CA5E: "LVT",
-    0x0CA5F: "LVT",
-    0x0CA60: "LVT",
-    0x0CA61: "LVT",
-    0x0CA62: "LVT",
-    0x0CA63: "LVT",
-    0x0CA64: "LVT",
-    0x0CA65: "LVT",
-    0x0CA66: "LVT",
-    0x0CA67: "LVT",
-    0x0CA69: "LVT",
-    0x0CA6A: "LVT",
-    0x0CA6B: "LVT",
-    0x0CA6C: "LVT",
-    0x0CA6D: "LVT",
-    0x0CA6E: "LVT",
-    0x0CA6F: "LVT",
-    0x0CA70: "LVT",
-    0x0CA71: "LVT",
-    0x0CA72: "LVT",
-    0x0CA73: "LVT",
-    0x0CA74: "LVT",
-    0x0CA75: "LVT",
-    0x0CA76: "LVT",
-    0x0CA77: "LVT",
-    0x0CA78: "LVT",
-    0x0CA79: "LVT",
-    0x0CA7A: "LVT",
-    0x0CA7B: "LVT",
-    0x0CA7C: "LVT",
-    0x0CA7D: "LVT",
-    0x0CA7E: "LVT",
-    0x0CA7F: "LVT",
-    0x0CA80: "LVT",
-    0x0CA81: "LVT",
-    0x0CA82: "LVT",
-    0x0CA83: "LVT",
-    0x0CA85: "LVT",
-    0x0CA86: "LVT",
-    0x0CA87: "LVT",
-    0x0CA88: "LVT",
-    0x0CA89: "LVT",
-    0x0CA8A: "LVT",
-    0x0CA8B: "LVT",
-    0x0CA8C: "LVT",
-    0x0CA8D: "LVT",
-    0x0CA8E: "LVT",
-    0x0CA8F: "LVT",
-    0x0CA90: "LVT",
-    0x0CA91: "LVT",
-    0x0CA92: "LVT",
-    0x0CA93: "LVT",
-    0x0CA94: "LVT",
-    0x0CA95: "LVT",
-    0x0CA96: "LVT",
-    0x0CA97: "LVT",
-    0x0CA98: "LVT",
-    0x0CA99: "LVT",
-    0x0CA9A: "LVT",
-    0x0CA9B: "LVT",
-    0x0CA9C: "LVT",
-    0x0CA9D: "LVT",
-    0x0CA9E: "LVT",
-    0x0CA9F: "LVT",
-    0x0CAA1: "LVT",
-    0x0CAA2: "LVT",
-    0x0CAA3: "LVT",
-    0x0CAA4: "LVT",
-    0x0CAA5: "LVT",
-    0x0CAA6: "LVT",
-    0x0CAA7: "LVT",
-    0x0CAA8: "LVT",
-    0x0CAA9: "LVT",
-    0x0CAAA: "LVT",
-    0x0CAAB: "LVT",
-    0x0CAAC: "LVT",
-    0x0CAAD: "LVT",
-    0x0CAAE: "LVT",
-    0x0CAAF: "LVT",
-    0x0CAB0: "LVT",
-    0x0CAB1: "LVT",
-    0x0CAB2: "LVT",
-    0x0CAB3: "LVT",
-    0x0CAB4: "LVT",
-    0x0CAB5: "LVT",
-    0x0CAB6: "LVT",
-    0x0CAB7: "LVT",
-    0x0CAB8: "LVT",
-    0x0CAB9: "LVT",
-    0x0CABA: "LVT",
-    0x0CABB: "LVT",
-    0x0CABD: "LVT",
-    0x0CABE: "LVT",
-    0x0CABF: "LVT",
-    0x0CAC0: "LVT",
-    0x0CAC1: "LVT",
-    0x0CAC2: "LVT",
-    0x0CAC3: "LVT",
-    0x0CAC4: "LVT",
-    0x0CAC5: "LVT",
-    0x0CAC6: "LVT",
-    0x0CAC7: "LVT",
-    0x0CAC8: "LVT",
-    0x0CAC9: "LVT",
-    0x0CACA: "LVT",
-    0x0CACB: "LVT",
-    0x0CACC: "LVT",
-    0x0CACD: "LVT",
-    0x0CACE: "LVT",
-    0x0CACF: "LVT",
-    0x0CAD0: "LVT",
-    0x0CAD1: "LVT",
-    0x0CAD2: "LVT",
-    0x0CAD3: "LVT",
-    0x0CAD4: "LVT",
-    0x0CAD5: "LVT",
-    0x0CAD6: "LVT",
-    0x0CAD7: "LVT",
-    0x0CAD9: "LVT",
-    0x0CADA: "LVT",
-    0x0CADB: "LVT",
-    0x0CADC: "LVT",
-    0x0CADD: "LVT",
-    0x0CADE: "LVT",
-    0x0CADF: "LVT",
-    0x0CAE0: "LVT",
-    0x0CAE1: "LVT",
-    0x0CAE2: "LVT",
-    0x0CAE3: "LVT",
-    0x0CAE4: "LVT",
-    0x0CAE5: "LVT",
-    0x0CAE6: "LVT",
-    0x0CAE7: "LVT",
-    0x0CAE8: "LVT",
-    0x0CAE9: "LVT",
-    0x0CAEA: "LVT",
-    0x0CAEB: "LVT",
-    0x0CAEC: "LVT",
-    0x0CAED: "LVT",
-    0x0CAEE: "LVT",
-    0x0CAEF: "LVT",
-    0x0CAF0: "LVT",
-    0x0CAF1: "LVT",
-    0x0CAF2: "LVT",
-    0x0CAF3: "LVT",
-    0x0CAF5: "LVT",
-    0x0CAF6: "LVT",
-    0x0CAF7: "LVT",
-    0x0CAF8: "LVT",
-    0x0CAF9: "LVT",
-    0x0CAFA: "LVT",
-    0x0CAFB: "LVT",
-    0x0CAFC: "LVT",
-    0x0CAFD: "LVT",
-    0x0CAFE: "LVT",
-    0x0CAFF: "LVT",
-    0x0CB00: "LVT",
-    0x0CB01: "LVT",
-    0x0CB02: "LVT",
-    0x0CB03: "LVT",
-    0x0CB04: "LVT",
-    0x0CB05: "LVT",
-    0x0CB06: "LVT",
-    0x0CB07: "LVT",
-    0x0CB08: "LVT",
-    0x0CB09: "LVT",
-    0x0CB0A: "LVT",
-    0x0CB0B: "LVT",
-    0x0CB0C: "LVT",
-    0x0CB0D: "LVT",
-    0x0CB0E: "LVT",
-    0x0CB0F: "LVT",
-    0x0CB11: "LVT",
-    0x0CB12: "LVT",
-    0x0CB13: "LVT",
-    0x0CB14: "LVT",
-    0x0CB15: "LVT",
-    0x0CB16: "LVT",
-    0x0CB17: "LVT",
-    0x0CB18: "LVT",
-    0x0CB19: "LVT",
-    0x0CB1A: "LVT",
-    0x0CB1B: "LVT",
-    0x0CB1C: "LVT",
-    0x0CB1D: "LVT",
-    0x0CB1E: "LVT",
-    0x0CB1F: "LVT",
-    0x0CB20: "LVT",
-    0x0CB21: "LVT",
-    0x0CB22: "LVT",
-    0x0CB23: "LVT",
-    0x0CB24: "LVT",
-    0x0CB25: "LVT",
-    0x0CB26: "LVT",
-    0x0CB27: "LVT",
-    0x0CB28: "LVT",
-    0x0CB29: "LVT",
-    0x0CB2A: "LVT",
-    0x0CB2B: "LVT",
-    0x0CB2D: "LVT",
-    0x0CB2E: "LVT",
-    0x0CB2F: "LVT",
-    0x0CB30: "LVT",
-    0x0CB31: "LVT",
-    0x0CB32: "LVT",
-    0x0CB33: "LVT",
-    0x0CB34: "LVT",
-    0x0CB35: "LVT",
-    0x0CB36: "LVT",
-    0x0CB37: "LVT",
-    0x0CB38: "LVT",
-    0x0CB39: "LVT",
-    0x0CB3A: "LVT",
-    0x0CB3B: "LVT",
-    0x0CB3C: "LVT",
-    0x0CB3D: "LVT",
-    0x0CB3E: "LVT",
-    0x0CB3F: "LVT",
-    0x0CB40: "LVT",
-    0x0CB41: "LVT",
-    0x0CB42: "LVT",
-    0x0CB43: "LVT",
-    0x0CB44: "LVT",
-    0x0CB45: "LVT",
-    0x0CB46: "LVT",
-    0x0CB47: "LVT",
-    0x0CB49: "LVT",
-    0x0CB4A: "LVT",
-    0x0CB4B: "LVT",
-    0x0CB4C: "LVT",
-    0x0CB4D: "LVT",
-    0x0CB4E: "LVT",
-    0x0CB4F: "LVT",
-    0x0CB50: "LVT",
-    0x0CB51: "LVT",
-    0x0CB52: "LVT",
-    0x0CB53: "LVT",
-    0x0CB54: "LVT",
-    0x0CB55: "LVT",
-    0x0CB56: "LVT",
-    0x0CB57: "LVT",
-    0x0CB58: "LVT",
-    0x0CB59: "LVT",
-    0x0CB5A: "LVT",
-    0x0CB5B: "LVT",
-    0x0CB5C: "LVT",
-    0x0CB5D: "LVT",
-    0x0CB5E: "LVT",
-    0x0CB5F: "LVT",
-    0x0CB60: "LVT",
-    0x0CB61: "LVT",
-    0x0CB62: "LVT",
-    0x0CB63: "LVT",
-    0x0CB65: "LVT",
-    0x0CB66: "LVT",
-    0x0CB67: "LVT",
-    0x0CB68: "LVT",
-    0x0CB69: "LVT",
-    0x0CB6A: "LVT",
-    0x0CB6B: "LVT",
-    0x0CB6C: "LVT",
-    0x0CB6D: "LVT",
-    0x0CB6E: "LVT",
-    0x0CB6F: "LVT",
-    0x0CB70: "LVT",
-    0x0CB71: "LVT",
-    0x0CB72: "LVT",
-    0x0CB73: "LVT",
-    0x0CB74: "LVT",
-    0x0CB75: "LVT",
-    0x0CB76: "LVT",
-    0x0CB77: "LVT",
-    0x0CB78: "LVT",
-    0x0CB79: "LVT",
-    0x0CB7A: "LVT",
-    0x0CB7B: "LVT",
-    0x0CB7C: "LVT",
-    0x0CB7D: "LVT",
-    0x0CB7E: "LVT",
-    0x0CB7F: "LVT",
-    0x0CB81: "LVT",
-    0x0CB82: "LVT",
-    0x0CB83: "LVT",
-    0x0CB84: "LVT",
-    0x0CB85: "LVT",
-    0x0CB86: "LVT",
-    0x0CB87: "LVT",
-    0x0CB88: "LVT",
-    0x0CB89: "LVT",
-    0x0CB8A: "LVT",
-    0x0CB8B: "LVT",
-    0x0CB8C: "LVT",
-    0x0CB8D: "LVT",
-    0x0CB8E: "LVT",
-    0x0CB8F: "LVT",
-    0x0CB90: "LVT",
-    0x0CB91: "LVT",
-    0x0CB92: "LVT",
-    0x0CB93: "LVT",
-    0x0CB94: "LVT",
-    0x0CB95: "LVT",
-    0x0CB96: "LVT",
-    0x0CB97: "LVT",
-    0x0CB98: "LVT",
-    0x0CB99: "LVT",
-    0x0CB9A: "LVT",
-    0x0CB9B: "LVT",
-    0x0CB9D: "LVT",
-    0x0CB9E: "LVT",
-    0x0CB9F: "LVT",
-    0x0CBA0: "LVT",
-    0x0CBA1: "LVT",
-    0x0CBA2: "LVT",
-    0x0CBA3: "LVT",
-    0x0CBA4: "LVT",
-    0x0CBA5: "LVT",
-    0x0CBA6: "LVT",
-    0x0CBA7: "LVT",
-    0x0CBA8: "LVT",
-    0x0CBA9: "LVT",
-    0x0CBAA: "LVT",
-    0x0CBAB: "LVT",
-    0x0CBAC: "LVT",
-    0x0CBAD: "LVT",
-    0x0CBAE: "LVT",
-    0x0CBAF: "LVT",
-    0x0CBB0: "LVT",
-    0x0CBB1: "LVT",
-    0x0CBB2: "LVT",
-    0x0CBB3: "LVT",
-    0x0CBB4: "LVT",
-    0x0CBB5: "LVT",
-    0x0CBB6: "LVT",
-    0x0CBB7: "LVT",
-    0x0CBB9: "LVT",
-    0x0CBBA: "LVT",
-    0x0CBBB: "LVT",
-    0x0CBBC: "LVT",
-    0x0CBBD: "LVT",
-    0x0CBBE: "LVT",
-    0x0CBBF: "LVT",
-    0x0CBC0: "LVT",
-    0x0CBC1: "LVT",
-    0x0CBC2: "LVT",
-    0x0CBC3: "LVT",
-    0x0CBC4: "LVT",
-    0x0CBC5: "LVT",
-    0x0CBC6: "LVT",
-    0x0CBC7: "LVT",
-    0x0CBC8: "LVT",
-    0x0CBC9: "LVT",
-    0x0CBCA: "LVT",
-    0x0CBCB: "LVT",
-    0x0CBCC: "LVT",
-    0x0CBCD: "LVT",
-    0x0CBCE: "LVT",
-    0x0CBCF: "LVT",
-    0x0CBD0: "LVT",
-    0x0CBD1: "LVT",
-    0x0CBD2: "LVT",
-    0x0CBD3: "LVT",
-    0x0CBD5: "LVT",
-    0x0CBD6: "LVT",
-    0x0CBD7: "LVT",
-    0x0CBD8: "LVT",
-    0x0CBD9: "LVT",
-    0x0CBDA: "LVT",
-    0x0CBDB: "LVT",
-    0x0CBDC: "LVT",
-    0x0CBDD: "LVT",
-    0x0CBDE: "LVT",
-    0x0CBDF: "LVT",
-    0x0CBE0: "LVT",
-    0x0CBE1: "LVT",
-    0x0CBE2: "LVT",
-    0x0CBE3: "LVT",
-    0x0CBE4: "LVT",
-    0x0CBE5: "LVT",
-    0x0CBE6: "LVT",
-    0x0CBE7: "LVT",
-    0x0CBE8: "LVT",
-    0x0CBE9: "LVT",
-    0x0CBEA: "LVT",
-    0x0CBEB: "LVT",
-    0x0CBEC: "LVT",
-    0x0CBED: "LVT",
-    0x0CBEE: "LVT",
-    0x0CBEF: "LVT",
-    0x0CBF1: "LVT",
-    0x0CBF2: "LVT",
-    0x0CBF3: "LVT",
-    0x0CBF4: "LVT",
-    0x0CBF5: "LVT",
-    0x0CBF6: "LVT",
-    0x0CBF7: "LVT",
-    0x0CBF8: "LVT",
-    0x0CBF9: "LVT",
-    0x0CBFA: "LVT",
-    0x0CBFB: "LVT",
-    0x0CBFC: "LVT",
-    0x0CBFD: "LVT",
-    0x0CBFE: "LVT",
-    0x0CBFF: "LVT",
-    0x0CC00: "LVT",
-    0x0CC01: "LVT",
-    0x0CC02: "LVT",
-    0x0CC03: "LVT",
-    0x0CC04: "LVT",
-    0x0CC05: "LVT",
-    0x0CC06: "LVT",
-    0x0CC07: "LVT",
-    0x0CC08: "LVT",
-    0x0CC09: "LVT",
-    0x0CC0A: "LVT",
-    0x0CC0B: "LVT",
-    0x0CC0D: "LVT",
-    0x0CC0E: "LVT",
-    0x0CC0F: "LVT",
-    0x0CC10: "LVT",
-    0x0CC11: "LVT",
-    0x0CC12: "LVT",
-    0x0CC13: "LVT",
-    0x0CC14: "LVT",
-    0x0CC15: "LVT",
-    0x0CC16: "LVT",
-    0x0CC17: "LVT",
-    0x0CC18: "LVT",
-    0x0CC19: "LVT",
-    0x0CC1A: "LVT",
-    0x0CC1B: "LVT",
-    0x0CC1C: "LVT",
-    0x0CC1D: "LVT",
-    0x0CC1E: "LVT",
-    0x0CC1F: "LVT",
-    0x0CC20: "LVT",
-    0x0CC21: "LVT",
-    0x0CC22: "LVT",
-    0x0CC23: "LVT",
-    0x0CC24: "LVT",
-    0x0CC25: "LVT",
-    0x0CC26: "LVT",
-    0x0CC27: "LVT",
-    0x0CC29: "LVT",
-    0x0CC2A: "LVT",
-    0x0CC2B: "LVT",
-    0x0CC2C: "LVT",
-    0x0CC2D: "LVT",
-    0x0CC2E: "LVT",
-    0x0CC2F: "LVT",
-    0x0CC30: "LVT",
-    0x0CC31: "LVT",
-    0x0CC32: "LVT",
-    0x0CC33: "LVT",
-    0x0CC34: "LVT",
-    0x0CC35: "LVT",
-    0x0CC36: "LVT",
-    0x0CC37: "LVT",
-    0x0CC38: "LVT",
-    0x0CC39: "LVT",
-    0x0CC3A: "LVT",
-    0x0CC3B: "LVT",
-    0x0CC3C: "LVT",
-    0x0CC3D: "LVT",
-    0x0CC3E: "LVT",
-    0x0CC3F: "LVT",
-    0x0CC40: "LVT",
-    0x0CC41: "LVT",
-    0x0CC42: "LVT",
-    0x0CC43: "LVT",
-    0x0CC45: "LVT",
-    0x0CC46: "LVT",
-    0x0CC47: "LVT",
-    0x0CC48: "LVT",
-    0x0CC49: "LVT",
-    0x0CC4A: "LVT",
-    0x0CC4B: "LVT",
-    0x0CC4C: "LVT",
-    0x0CC4D: "LVT",
-    0x0CC4E: "LVT",
-    0x0CC4F: "LVT",
-    0x0CC50: "LVT",
-    0x0CC51: "LVT",
-    0x0CC52: "LVT",
-    0x0CC53: "LVT",
-    0x0CC54: "LVT",
-    0x0CC55: "LVT",
-    0x0CC56: "LVT",
-    0x0CC57: "LVT",
-    0x0CC58: "LVT",
-    0x0CC59: "LVT",
-    0x0CC5A: "LVT",
-    0x0CC5B: "LVT",
-    0x0CC5C: "LVT",
-    0x0CC5D: "LVT",
-    0x0CC5E: "LVT",
-    0x0CC5F: "LVT",
-    0x0CC61: "LVT",
-    0x0CC62: "LVT",
-    0x0CC63: "LVT",
-    0x0CC64: "LVT",
-    0x0CC65: "LVT",
-    0x0CC66: "LVT",
-    0x0CC67: "LVT",
-    0x0CC68: "LVT",
-    0x0CC69: "LVT",
-    0x0CC6A: "LVT",
-    0x0CC6B: "LVT",
-    0x0CC6C: "LVT",
-    0x0CC6D: "LVT",
-    0x0CC6E: "LVT",
-    0x0CC6F: "LVT",
-    0x0CC70: "LVT",
-    0x0CC71: "LVT",
-    0x0CC72: "LVT",
-    0x0CC73: "LVT",
-    0x0CC74: "LVT",
-    0x0CC75: "LVT",
-    0x0CC76: "LVT",
-    0x0CC77: "LVT",
-    0x0CC78: "LVT",
-    0x0CC79: "LVT",
-    0x0CC7A: "LVT",
-    0x0CC7B: "LVT",
-    0x0CC7D: "LVT",
-    0x0CC7E: "LVT",
-    0x0CC7F: "LVT",
-    0x0CC80: "LVT",
-    0x0CC81: "LVT",
-    0x0CC82: "LVT",
-    0x0CC83: "LVT",
-    0x0CC84: "LVT",
-    0x0CC85: "LVT",
-    0x0CC86: "LVT",
-    0x0CC87: "LVT",
-    0x0CC88: "LVT",
-    0x0CC89: "LVT",
-    0x0CC8A: "LVT",
-    0x0CC8B: "LVT",
-    0x0CC8C: "LVT",
-    0x0CC8D: "LVT",
-    0x0CC8E: "LVT",
-    0x0CC8F: "LVT",
-    0x0CC90: "LVT",
-    0x0CC91: "LVT",
-    0x0CC92: "LVT",
-    0x0CC93: "LVT",
-    0x0CC94: "LVT",
-    0x0CC95: "LVT",
-    0x0CC96: "LVT",
-    0x0CC97: "LVT",
-    0x0CC99: "LVT",
-    0x0CC9A: "LVT",
-    0x0CC9B: "LVT",
-    0x0CC9C: "LVT",
-    0x0CC9D: "LVT",
-    0x0CC9E: "LVT",
-    0x0CC9F: "LVT",
-    0x0CCA0: "LVT",
-    0x0CCA1: "LVT",
-    0x0CCA2: "LVT",
-    0x0CCA3: "LVT",
-    0x0CCA4: "LVT",
-    0x0CCA5: "LVT",
-    0x0CCA6: "LVT",
-    0x0CCA7: "LVT",
-    0x0CCA8: "LVT",
-    0x0CCA9: "LVT",
-    0x0CCAA: "LVT",
-    0x0CCAB: "LVT",
-    0x0CCAC: "LVT",
-    0x0CCAD: "LVT",
-    0x0CCAE: "LVT",
-    0x0CCAF: "LVT",
-    0x0CCB0: "LVT",
-    0x0CCB1: "LVT",
-    0x0CCB2: "LVT",
-    0x0CCB3: "LVT",
-    0x0CCB5: "LVT",
-    0x0CCB6: "LVT",
-    0x0CCB7: "LVT",
-    0x0CCB8: "LVT",
-    0x0CCB9: "LVT",
-    0x0CCBA: "LVT",
-    0x0CCBB: "LVT",
-    0x0CCBC: "LVT",
-    0x0CCBD: "LVT",
-    0x0CCBE: "LVT",
-    0x0CCBF: "LVT",
-    0x0CCC0: "LVT",
-    0x0CCC1: "LVT",
-    0x0CCC2: "LVT",
-    0x0CCC3: "LVT",
-    0x0CCC4: "LVT",
-    0x0CCC5: "LVT",
-    0x0CCC6: "LVT",
-    0x0CCC7: "LVT",
-    0x0CCC8: "LVT",
-    0x0CCC9: "LVT",
-    0x0CCCA: "LVT",
-    0x0CCCB: "LVT",
-    0x0CCCC: "LVT",
-    0x0CCCD: "LVT",
-    0x0CCCE: "LVT",
-    0x0CCCF: "LVT",
-    0x0CCD1: "LVT",
-    0x0CCD2: "LVT",
-    0x0CCD3: "LVT",
-    0x0CCD4: "LVT",
-    0x0CCD5: "LVT",
-    0x0CCD6: "LVT",
-    0x0CCD7: "LVT",
-    0x0CCD8: "LVT",
-    0x0CCD9: "LVT",
-    0x0CCDA: "LVT",
-    0x0CCDB: "LVT",
-    0x0CCDC: "LVT",
-    0x0CCDD: "LVT",
-    0x0CCDE: "LVT",
-    0x0CCDF: "LVT",
-    0x0CCE0: "LVT",
-    0x0CCE1: "LVT",
-    0x0CCE2: "LVT",
-    0x0CCE3: "LVT",
-    0x0CCE4: "LVT",
-    0x0CCE5: "LVT",
-    0x0CCE6: "LVT",
-    0x0CCE7: "LVT",
-    0x0CCE8: "LVT",
-    0x0CCE9: "LVT",
-    0x0CCEA: "LVT",
-    0x0CCEB: "LVT",
-    0x0CCED: "LVT",
-    0x0CCEE: "LVT",
-    0x0CCEF: "LVT",
-    0x0CCF0: "LVT",
-    0x0CCF1: "LVT",
-    0x0CCF2: "LVT",
-    0x0CCF3: "LVT",
-    0x0CCF4: "LVT",
-    0x0CCF5: "LVT",
-    0x0CCF6: "LVT",
-    0x0CCF7: "LVT",
-    0x0CCF8: "LVT",
-    0x0CCF9: "LVT",
-    0x0CCFA: "LVT",
-    0x0CCFB: "LVT",
-    0x0CCFC: "LVT",
-    0x0CCFD: "LVT",
-    0x0CCFE: "LVT",
-    0x0CCFF: "LVT",
-    0x0CD00: "LVT",
-    0x0CD01: "LVT",
-    0x0CD02: "LVT",
-    0x0CD03: "LVT",
-    0x0CD04: "LVT",
-    0x0CD05: "LVT",
-    0x0CD06: "LVT",
-    0x0CD07: "LVT",
-    0x0CD09: "LVT",
-    0x0CD0A: "LVT",
-    0x0CD0B: "LVT",
-    0x0CD0C: "LVT",
-    0x0CD0D: "LVT",
-    0x0CD0E: "LVT",
-    0x0CD0F: "LVT",
-    0x0CD10: "LVT",
-    0x0CD11: "LVT",
-    0x0CD12: "LVT",
-    0x0CD13: "LVT",
-    0x0CD14: "LVT",
-    0x0CD15: "LVT",
-    0x0CD16: "LVT",
-    0x0CD17: "LVT",
-    0x0CD18: "LVT",
-    0x0CD19: "LVT",
-    0x0CD1A: "LVT",
-    0x0CD1B: "LVT",
-    0x0CD1C: "LVT",
-    0x0CD1D: "LVT",
-    0x0CD1E: "LVT",
-    0x0CD1F: "LVT",
-    0x0CD20: "LVT",
-    0x0CD21: "LVT",
-    0x0CD22: "LVT",
-    0x0CD23: "LVT",
-    0x0CD25: "LVT",
-    0x0CD26: "LVT",
-    0x0CD27: "LVT",
-    0x0CD28: "LVT",
-    0x0CD29: "LVT",
-    0x0CD2A: "LVT",
-    0x0CD2B: "LVT",
-    0x0CD2C: "LVT",
-    0x0CD2D: "LVT",
-    0x0CD2E: "LVT",
-    0x0CD2F: "LVT",
-    0x0CD30: "LVT",
-    0x0CD31: "LVT",
-    0x0CD32: "LVT",
-    0x0CD33: "LVT",
-    0x0CD34: "LVT",
-    0x0CD35: "LVT",
-    0x0CD36: "LVT",
-    0x0CD37: "LVT",
-    0x0CD38: "LVT",
-    0x0CD39: "LVT",
-    0x0CD3A: "LVT",
-    0x0CD3B: "LVT",
-    0x0CD3C: "LVT",
-    0x0CD3D: "LVT",
-    0x0CD3E: "LVT",
-    0x0CD3F: "LVT",
-    0x0CD41: "LVT",
-    0x0CD42: "LVT",
-    0x0CD43: "LVT",
-    0x0CD44: "LVT",
-    0x0CD45: "LVT",
-    0x0CD46: "LVT",
-    0x0CD47: "LVT",
-    0x0CD48: "LVT",
-    0x0CD49: "LVT",
-    0x0CD4A: "LVT",
-    0x0CD4B: "LVT",
-    0x0CD4C: "LVT",
-    0x0CD4D: "LVT",
-    0x0CD4E: "LVT",
-    0x0CD4F: "LVT",
-    0x0CD50: "LVT",
-    0x0CD51: "LVT",
-    0x0CD52: "LVT",
-    0x0CD53: "LVT",
-    0x0CD54: "LVT",
-    0x0CD55: "LVT",
-    0x0CD56: "LVT",
-    0x0CD57: "LVT",
-    0x0CD58: "LVT",
-    0x0CD59: "LVT",
-    0x0CD5A: "LVT",
-    0x0CD5B: "LVT",
-    0x0CD5D: "LVT",
-    0x0CD5E: "LVT",
-    0x0CD5F: "LVT",
-    0x0CD60: "LVT",
-    0x0CD61: "LVT",
-    0x0CD62: "LVT",
-    0x0CD63: "LVT",
-    0x0CD64: "LVT",
-    0x0CD65: "LVT",
-    0x0CD66: "LVT",
-    0x0CD67: "LVT",
-    0x0CD68: "LVT",
-    0x0CD69: "LVT",
-    0x0CD6A: "LVT",
-    0x0CD6B: "LVT",
-    0x0CD6C: "LVT",
-    0x0CD6D: "LVT",
-    0x0CD6E: "LVT",
-    0x0CD6F: "LVT",
-    0x0CD70: "LVT",
-    0x0CD71: "LVT",
-    0x0CD72: "LVT",
-    0x0CD73: "LVT",
-    0x0CD74: "LVT",
-    0x0CD75: "LVT",
-    0x0CD76: "LVT",
-    0x0CD77: "LVT",
-    0x0CD79: "LVT",
-    0x0CD7A: "LVT",
-    0x0CD7B: "LVT",
-    0x0CD7C: "LVT",
-    0x0CD7D: "LVT",
-    0x0CD7E: "LVT",
-    0x0CD7F: "LVT",
-    0x0CD80: "LVT",
-    0x0CD81: "LVT",
-    0x0CD82: "LVT",
-    0x0CD83: "LVT",
-    0x0CD84: "LVT",
-    0x0CD85: "LVT",
-    0x0CD86: "LVT",
-    0x0CD87: "LVT",
-    0x0CD88: "LVT",
-    0x0CD89: "LVT",
-    0x0CD8A: "LVT",
-    0x0CD8B: "LVT",
-    0x0CD8C: "LVT",
-    0x0CD8D: "LVT",
-    0x0CD8E: "LVT",
-    0x0CD8F: "LVT",
-    0x0CD90: "LVT",
-    0x0CD91: "LVT",
-    0x0CD92: "LVT",
-    0x0CD93: "LVT",
-    0x0CD95: "LVT",
-    0x0CD96: "LVT",
-    0x0CD97: "LVT",
-    0x0CD98: "LVT",
-    0x0CD99: "LVT",
-    0x0CD9A: "LVT",
-    0x0CD9B: "LVT",
-    0x0CD9C: "LVT",
-    0x0CD9D: "LVT",
-    0x0CD9E: "LVT",
-    0x0CD9F: "LVT",
-    0x0CDA0: "LVT",
-    0x0CDA1: "LVT",
-    0x0CDA2: "LVT",
-    0x0CDA3: "LVT",
-    0x0CDA4: "LVT",
-    0x0CDA5: "LVT",
-    0x0CDA6: "LVT",
-    0x0CDA7: "LVT",
-    0x0CDA8: "LVT",
-    0x0CDA9: "LVT",
-    0x0CDAA: "LVT",
-    0x0CDAB: "LVT",
-    0x0CDAC: "LVT",
-    0x0CDAD: "LVT",
-    0x0CDAE: "LVT",
-    0x0CDAF: "LVT",
-    0x0CDB1: "LVT",
-    0x0CDB2: "LVT",
-    0x0CDB3: "LVT",
-    0x0CDB4: "LVT",
-    0x0CDB5: "LVT",
-    0x0CDB6: "LVT",
-    0x0CDB7: "LVT",
-    0x0CDB8: "LVT",
-    0x0CDB9: "LVT",
-    0x0CDBA: "LVT",
-    0x0CDBB: "LVT",
-    0x0CDBC: "LVT",
-    0x0CDBD: "LVT",
-    0x0CDBE: "LVT",
-    0x0CDBF: "LVT",
-    0x0CDC0: "LVT",
-    0x0CDC1: "LVT",
-    0x0CDC2: "LVT",
-    0x0CDC3: "LVT",
-    0x0CDC4: "LVT",
-    0x0CDC5: "LVT",
-    0x0CDC6: "LVT",
-    0x0CDC7: "LVT",
-    0x0CDC8: "LVT",
-    0x0CDC9: "LVT",
-    0x0CDCA: "LVT",
-    0x0CDCB: "LVT",
-    0x0CDCD: "LVT",
-    0x0CDCE: "LVT",
-    0x0CDCF: "LVT",
-    0x0CDD0: "LVT",
-    0x0CDD1: "LVT",
-    0x0CDD2: "LVT",
-    0x0CDD3: "LVT",
-    0x0CDD4: "LVT",
-    0x0CDD5: "LVT",
-    0x0CDD6: "LVT",
-    0x0CDD7: "LVT",
-    0x0CDD8: "LVT",
-    0x0CDD9: "LVT",
-    0x0CDDA: "LVT",
-    0x0CDDB: "LVT",
-    0x0CDDC: "LVT",
-    0x0CDDD: "LVT",
-    0x0CDDE: "LVT",
-    0x0CDDF: "LVT",
-    0x0CDE0: "LVT",
-    0x0CDE1: "LVT",
-    0x0CDE2: "LVT",
-    0x0CDE3: "LVT",
-    0x0CDE4: "LVT",
-    0x0CDE5: "LVT",
-    0x0CDE6: "LVT",
-    0x0CDE7: "LVT",
-    0x0CDE9: "LVT",
-    0x0CDEA: "LVT",
-    0x0CDEB: "LVT",
-    0x0CDEC: "LVT",
-    0x0CDED: "LVT",
-    0x0CDEE: "LVT",
-    0x0CDEF: "LVT",
-    0x0CDF0: "LVT",
-    0x0CDF1: "LVT",
-    0x0CDF2: "LVT",
-    0x0CDF3: "LVT",
-    0x0CDF4: "LVT",
-    0x0CDF5: "LVT",
-    0x0CDF6: "LVT",
-    0x0CDF7: "LVT",
-    0x0CDF8: "LVT",
-    0x0CDF9: "LVT",
-    0x0CDFA: "LVT",
-    0x0CDFB: "LVT",
-    0x0CDFC: "LVT",
-    0x0CDFD: "LVT",
-    0x0CDFE: "LVT",
-    0x0CDFF: "LVT",
-    0x0CE00: "LVT",
-    0x0CE01: "LVT",
-    0x0CE02: "LVT",
-    0x0CE03: "LVT",
-    0x0CE05: "LVT",
-    0x0CE06: "LVT",
-    0x0CE07: "LVT",
-    0x0CE08: "LVT",
-    0x0CE09: "LVT",
-    0x0CE0A: "LVT",
-    0x0CE0B: "LVT",
-    0x0CE0C: "LVT",
-    0x0CE0D: "LVT",
-    0x0CE0E: "LVT",
-    0x0CE0F: "LVT",
-    0x0CE10: "LVT",
-    0x0CE11: "LVT",
-    0x0CE12: "LVT",
-    0x0CE13: "LVT",
-    0x0CE14: "LVT",
-    0x0CE15: "LVT",
-    0x0CE16: "LVT",
-    0x0CE17: "LVT",
-    0x0CE18: "LVT",
-    0x0CE19: "LVT",
-    0x0CE1A: "LVT",
-    0x0CE1B: "LVT",
-    0x0CE1C: "LVT",
-    0x0CE1D: "LVT",
-    0x0CE1E: "LVT",
-    0x0CE1F: "LVT",
-    0x0CE21: "LVT",
-    0x0CE22: "LVT",
-    0x0CE23: "LVT",
-    0x0CE24: "LVT",
-    0x0CE25: "LVT",
-    0x0CE26: "LVT",
-    0x0CE27: "LVT",
-    0x0CE28: "LVT",
-    0x0CE29: "LVT",
-    0x0CE2A: "LVT",
-    0x0CE2B: "LVT",
-    0x0CE2C: "LVT",
-    0x0CE2D: "LVT",
-    0x0CE2E: "LVT",
-    0x0CE2F: "LVT",
-    0x0CE30: "LVT",
-    0x0CE31: "LVT",
-    0x0CE32: "LVT",
-    0x0CE33: "LVT",
-    0x0CE34: "LVT",
-    0x0CE35: "LVT",
-    0x0CE36: "LVT",
-    0x0CE37: "LVT",
-    0x0CE38: "LVT",
-    0x0CE39: "LVT",
-    0x0CE3A: "LVT",
-    0x0CE3B: "LVT",
-    0x0CE3D: "LVT",
-    0x0CE3E: "LVT",
-    0x0CE3F: "LVT",
-    0x0CE40: "LVT",
-    0x0CE41: "LVT",
-    0x0CE42: "LVT",
-    0x0CE43: "LVT",
-    0x0CE44: "LVT",
-    0x0CE45: "LVT",
-    0x0CE46: "LVT",
-    0x0CE47: "LVT",
-    0x0CE48: "LVT",
-    0x0CE49: "LVT",
-    0x0CE4A: "LVT",
-    0x0CE4B: "LVT",
-    0x0CE4C: "LVT",
-    0x0CE4D: "LVT",
-    0x0CE4E: "LVT",
-    0x0CE4F: "LVT",
-    0x0CE50: "LVT",
-    0x0CE51: "LVT",
-    0x0CE52: "LVT",
-    0x0CE53: "LVT",
-    0x0CE54: "LVT",
-    0x0CE55: "LVT",
-    0x0CE56: "LVT",
-    0x0CE57: "LVT",
-    0x0CE59: "LVT",
-    0x0CE5A: "LVT",
-    0x0CE5B: "LVT",
-    0x0CE5C: "LVT",
-    0x0CE5D: "LVT",
-    0x0CE5E: "LVT",
-    0x0CE5F: "LVT",
-    0x0CE60: "LVT",
-    0x0CE61: "LVT",
-    0x0CE62: "LVT",
-    0x0CE63: "LVT",
-    0x0CE64: "LVT",
-    0x0CE65: "LVT",
-    0x0CE66: "LVT",
-    0x0CE67: "LVT",
-    0x0CE68: "LVT",
-    0x0CE69: "LVT",
-    0x0CE6A: "LVT",
-    0x0CE6B: "LVT",
-    0x0CE6C: "LVT",
-    0x0CE6D: "LVT",
-    0x0CE6E: "LVT",
-    0x0CE6F: "LVT",
-    0x0CE70: "LVT",
-    0x0CE71: "LVT",
-    0x0CE72: "LVT",
-    0x0CE73: "LVT",
-    0x0CE75: "LVT",
-    0x0CE76: "LVT",
-    0x0CE77: "LVT",
-    0x0CE78: "LVT",
-    0x0CE79: "LVT",
-    0x0CE7A: "LVT",
-    0x0CE7B: "LVT",
-    0x0CE7C: "LVT",
-    0x0CE7D: "LVT",
-    0x0CE7E: "LVT",
-    0x0CE7F: "LVT",
-    0x0CE80: "LVT",
-    0x0CE81: "LVT",
-    0x0CE82: "LVT",
-    0x0CE83: "LVT",
-    0x0CE84: "LVT",
-    0x0CE85: "LVT",
-    0x0CE86: "LVT",
-    0x0CE87: "LVT",
-    0x0CE88: "LVT",
-    0x0CE89: "LVT",
-    0x0CE8A: "LVT",
-    0x0CE8B: "LVT",
-    0x0CE8C: "LVT",
-    0x0CE8D: "LVT",
-    0x0CE8E: "LVT",
-    0x0CE8F: "LVT",
-    0x0CE91: "LVT",
-    0x0CE92: "LVT",
-    0x0CE93: "LVT",
-    0x0CE94: "LVT",
-    0x0CE95: "LVT",
-    0x0CE96: "LVT",
-    0x0CE97: "LVT",
-    0x0CE98: "LVT",
-    0x0CE99: "LVT",
-    0x0CE9A: "LVT",
-    0x0CE9B: "LVT",
-    0x0CE9C: "LVT",
-    0x0CE9D: "LVT",
-    0x0CE9E: "LVT",
-    0x0CE9F: "LVT",
-    0x0CEA0: "LVT",
-    0x0CEA1: "LVT",
-    0x0CEA2: "LVT",
-    0x0CEA3: "LVT",
-    0x0CEA4: "LVT",
-    0x0CEA5: "LVT",
-    0x0CEA6: "LVT",
-    0x0CEA7: "LVT",
-    0x0CEA8: "LVT",
-    0x0CEA9: "LVT",
-    0x0CEAA: "LVT",
-    0x0CEAB: "LVT",
-    0x0CEAD: "LVT",
-    0x0CEAE: "LVT",
-    0x0CEAF: "LVT",
-    0x0CEB0: "LVT",
-    0x0CEB1: "LVT",
-    0x0CEB2: "LVT",
-    0x0CEB3: "LVT",
-    0x0CEB4: "LVT",
-    0x0CEB5: "LVT",
-    0x0CEB6: "LVT",
-    0x0CEB7: "LVT",
-    0x0CEB8: "LVT",
-    0x0CEB9: "LVT",
-    0x0CEBA: "LVT",
-    0x0CEBB: "LVT",
-    0x0CEBC: "LVT",
-    0x0CEBD: "LVT",
-    0x0CEBE: "LVT",
-    0x0CEBF: "LVT",
-    0x0CEC0: "LVT",
-    0x0CEC1: "LVT",
-    0x0CEC2: "LVT",
-    0x0CEC3: "LVT",
-    0x0CEC4: "LVT",
-    0x0CEC5: "LVT",
-    0x0CEC6: "LVT",
-    0x0CEC7: "LVT",
-    0x0CEC9: "LVT",
-    0x0CECA: "LVT",
-    0x0CECB: "LVT",
-    0x0CECC: "LVT",
-    0x0CECD: "LVT",
-    0x0CECE: "LVT",
-    0x0CECF: "LVT",
-    0x0CED0: "LVT",
-    0x0CED1: "LVT",
-    0x0CED2: "LVT",
-    0x0CED3: "LVT",
-    0x0CED4: "LVT",
-    0x0CED5: "LVT",
-    0x0CED6: "LVT",
-    0x0CED7: "LVT",
-    0x0CED8: "LVT",
-    0x0CED9: "LVT",
-    0x0CEDA: "LVT",
-    0x0CEDB: "LVT",
-    0x0CEDC: "LVT",
-    0x0CEDD: "LVT",
-    0x0CEDE: "LVT",
-    0x0CEDF: "LVT",
-    0x0CEE0: "LVT",
-    0x0CEE1: "LVT",
-    0x0CEE2: "LVT",
-    0x0CEE3: "LVT",
-    0x0CEE5: "LVT",
-    0x0CEE6: "LVT",
-    0x0CEE7: "LVT",
-    0x0CEE8: "LVT",
-    0x0CEE9: "LVT",
-    0x0CEEA: "LVT",
-    0x0CEEB: "LVT",
-    0x0CEEC: "LVT",
-    0x0CEED: "LVT",
-    0x0CEEE: "LVT",
-    0x0CEEF: "LVT",
-    0x0CEF0: "LVT",
-    0x0CEF1: "LVT",
-    0x0CEF2: "LVT",
-    0x0CEF3: "LVT",
-    0x0CEF4: "LVT",
-    0x0CEF5: "LVT",
-    0x0CEF6: "LVT",
-    0x0CEF7: "LVT",
-    0x0CEF8: "LVT",
-    0x0CEF9: "LVT",
-    0x0CEFA: "LVT",
-    0x0CEFB: "LVT",
-    0x0CEFC: "LVT",
-    0x0CEFD: "LVT",
-    0x0CEFE: "LVT",
-    0x0CEFF: "LVT",
-    0x0CF01: "LVT",
-    0x0CF02: "LVT",
-    0x0CF03: "LVT",
-    0x0CF04: "LVT",
-    0x0CF05: "LVT",
-    0x0CF06: "LVT",
-    0x0CF07: "LVT",
-    0x0CF08: "LVT",
-    0x0CF09: "LVT",
-    0x0CF0A: "LVT",
-    0x0CF0B: "LVT",
-    0x0CF0C: "LVT",
-    0x0CF0D: "LVT",
-    0x0CF0E: "LVT",
-    0x0CF0F: "LVT",
-    0x0CF10: "LVT",
-    0x0CF11: "LVT",
-    0x0CF12: "LVT",
-    0x0CF13: "LVT",
-    0x0CF14: "LVT",
-    0x0CF15: "LVT",
-    0x0CF16: "LVT",
-    0x0CF17: "LVT",
-    0x0CF18: "LVT",
-    0x0CF19: "LVT",
-    0x0CF1A: "LVT",
-    0x0CF1B: "LVT",
-    0x0CF1D: "LVT",
-    0x0CF1E: "LVT",
-    0x0CF1F: "LVT",
-    0x0CF20: "LVT",
-    0x0CF21: "LVT",
-    0x0CF22: "LVT",
-    0x0CF23: "LVT",
-    0x0CF24: "LVT",
-    0x0CF25: "LVT",
-    0x0CF26: "LVT",
-    0x0CF27: "LVT",
-    0x0CF28: "LVT",
-    0x0CF29: "LVT",
-    0x0CF2A: "LVT",
-    0x0CF2B: "LVT",
-    0x0CF2C: "LVT",
-    0x0CF2D: "LVT",
-    0x0CF2E: "LVT",
-    0x0CF2F: "LVT",
-    0x0CF30: "LVT",
-    0x0CF31: "LVT",
-    0x0CF32: "LVT",
-    0x0CF33: "LVT",
-    0x0CF34: "LVT",
-    0x0CF35: "LVT",
-    0x0CF36: "LVT",
-    0x0CF37: "LVT",
-    0x0CF39: "LVT",
-    0x0CF3A: "LVT",
-    0x0CF3B: "LVT",
-    0x0CF3C: "LVT",
-    0x0CF3D: "LVT",
-    0x0CF3E: "LVT",
-    0x0CF3F: "LVT",
-    0x0CF40: "LVT",
-    0x0CF41: "LVT",
-    0x0CF42: "LVT",
-    0x0CF43: "LVT",
-    0x0CF44: "LVT",
-    0x0CF45: "LVT",
-    0x0CF46: "LVT",
-    0x0CF47: "LVT",
-    0x0CF48: "LVT",
-    0x0CF49: "LVT",
-    0x0CF4A: "LVT",
-    0x0CF4B: "LVT",
-    0x0CF4C: "LVT",
-    0x0CF4D: "LVT",
-    0x0CF4E: "LVT",
-    0x0CF4F: "LVT",
-    0x0CF50: "LVT",
-    0x0CF51: "LVT",
-    0x0CF52: "LVT",
-    0x0CF53: "LVT",
-    0x0CF55: "LVT",
-    0x0CF56: "LVT",
-    0x0CF57: "LVT",
-    0x0CF58: "LVT",
-    0x0CF59: "LVT",
-    0x0CF5A: "LVT",
-    0x0CF5B: "LVT",
-    0x0CF5C: "LVT",
-    0x0CF5D: "LVT",
-    0x0CF5E: "LVT",
-    0x0CF5F: "LVT",
-    0x0CF60: "LVT",
-    0x0CF61: "LVT",
-    0x0CF62: "LVT",
-    0x0CF63: "LVT",
-    0x0CF64: "LVT",
-    0x0CF65: "LVT",
-    0x0CF66: "LVT",
-    0x0CF67: "LVT",
-    0x0CF68: "LVT",
-    0x0CF69: "LVT",
-    0x0CF6A: "LVT",
-    0x0CF6B: "LVT",
-    0x0CF6C: "LVT",
-    0x0CF6D: "LVT",
-    0x0CF6E: "LVT",
-    0x0CF6F: "LVT",
-    0x0CF71: "LVT",
-    0x0CF72: "LVT",
-    0x0CF73: "LVT",
-    0x0CF74: "LVT",
-    0x0CF75: "LVT",
-    0x0CF76: "LVT",
-    0x0CF77: "LVT",
-    0x0CF78: "LVT",
-    0x0CF79: "LVT",
-    0x0CF7A: "LVT",
-    0x0CF7B: "LVT",
-    0x0CF7C: "LVT",
-    0x0CF7D: "LVT",
-    0x0CF7E: "LVT",
-    0x0CF7F: "LVT",
-    0x0CF80: "LVT",
-    0x0CF81: "LVT",
-    0x0CF82: "LVT",
-    0x0CF83: "LVT",
-    0x0CF84: "LVT",
-    0x0CF85: "LVT",
-    0x0CF86: "LVT",
-    0x0CF87: "LVT",
-    0x0CF88: "LVT",
-    0x0CF89: "LVT",
-    0x0CF8A: "LVT",
-    0x0CF8B: "LVT",
-    0x0CF8D: "LVT",
-    0x0CF8E: "LVT",
-    0x0CF8F: "LVT",
-    0x0CF90: "LVT",
-    0x0CF91: "LVT",
-    0x0CF92: "LVT",
-    0x0CF93: "LVT",
-    0x0CF94: "LVT",
-    0x0CF95: "LVT",
-    0x0CF96: "LVT",
-    0x0CF97: "LVT",
-    0x0CF98: "LVT",
-    0x0CF99: "LVT",
-    0x0CF9A: "LVT",
-    0x0CF9B: "LVT",
-    0x0CF9C: "LVT",
-    0x0CF9D: "LVT",
-    0x0CF9E: "LVT",
-    0x0CF9F: "LVT",
-    0x0CFA0: "LVT",
-    0x0CFA1: "LVT",
-    0x0CFA2: "LVT",
-    0x0CFA3: "LVT",
-    0x0CFA4: "LVT",
-    0x0CFA5: "LVT",
-    0x0CFA6: "LVT",
-    0x0CFA7: "LVT",
-    0x0CFA9: "LVT",
-    0x0CFAA: "LVT",
-    0x0CFAB: "LVT",
-    0x0CFAC: "LVT",
-    0x0CFAD: "LVT",
-    0x0CFAE: "LVT",
-    0x0CFAF: "LVT",
-    0x0CFB0: "LVT",
-    0x0CFB1: "LVT",
-    0x0CFB2: "LVT",
-    0x0CFB3: "LVT",
-    0x0CFB4: "LVT",
-    0x0CFB5: "LVT",
-    0x0CFB6: "LVT",
-    0x0CFB7: "LVT",
-    0x0CFB8: "LVT",
-    0x0CFB9: "LVT",
-    0x0CFBA: "LVT",
-    0x0CFBB: "LVT",
-    0x0CFBC: "LVT",
-    0x0CFBD: "LVT",
-    0x0CFBE: "LVT",
-    0x0CFBF: "LVT",
-    0x0CFC0: "LVT",
-    0x0CFC1: "LVT",
-    0x0CFC2: "LVT",
-    0x0CFC3: "LVT",
-    0x0CFC5: "LVT",
-    0x0CFC6: "LVT",
-    0x0CFC7: "LVT",
-    0x0CFC8: "LVT",
-    0x0CFC9: "LVT",
-    0x0CFCA: "LVT",
-    0x0CFCB: "LVT",
-    0x0CFCC: "LVT",
-    0x0CFCD: "LVT",
-    0x0CFCE: "LVT",
-    0x0CFCF: "LVT",
-    0x0CFD0: "LVT",
-    0x0CFD1: "LVT",
-    0x0CFD2: "LVT",
-    0x0CFD3: "LVT",
-    0x0CFD4: "LVT",
-    0x0CFD5: "LVT",
-    0x0CFD6: "LVT",
-    0x0CFD7: "LVT",
-    0x0CFD8: "LVT",
-    0x0CFD9: "LVT",
-    0x0CFDA: "LVT",
-    0x0CFDB: "LVT",
-    0x0CFDC: "LVT",
-    0x0CFDD: "LVT",
-    0x0CFDE: "LVT",
-    0x0CFDF: "LVT",
-    0x0CFE1: "LVT",
-    0x0CFE2: "LVT",
-    0x0CFE3: "LVT",
-    0x0CFE4: "LVT",
-    0x0CFE5: "LVT",
-    0x0CFE6: "LVT",
-    0x0CFE7: "LVT",
-    0x0CFE8: "LVT",
-    0x0CFE9: "LVT",
-    0x0CFEA: "LVT",
-    0x0CFEB: "LVT",
-    0x0CFEC: "LVT",
-    0x0CFED: "LVT",
-    0x0CFEE: "LVT",
-    0x0CFEF: "LVT",
-    0x0CFF0: "LVT",
-    0x0CFF1: "LVT",
-    0x0CFF2: "LVT",
-    0x0CFF3: "LVT",
-    0x0CFF4: "LVT",
-    0x0CFF5: "LVT",
-    0x0CFF6: "LVT",
-    0x0CFF7: "LVT",
-    0x0CFF8: "LVT",
-    0x0CFF9: "LVT",
-    0x0CFFA: "LVT",
-    0x0CFFB: "LVT",
-    0x0CFFD: "LVT",
-    0x0CFFE: "LVT",
-    0x0CFFF: "LVT",
-    0x0D000: "LVT",
-    0x0D001: "LVT",
-    0x0D002: "LVT",
-    0x0D003: "LVT",
-    0x0D004: "LVT",
-    0x0D005: "LVT",
-    0x0D006: "LVT",
-    0x0D007: "LVT",
-    0x0D008: "LVT",
-    0x0D009: "LVT",
-    0x0D00A: "LVT",
-    0x0D00B: "LVT",
-    0x0D00C: "LVT",
-    0x0D00D: "LVT",
-    0x0D00E: "LVT",
-    0x0D00F: "LVT",
-    0x0D010: "LVT",
-    0x0D011: "LVT",
-    0x0D012: "LVT",
-    0x0D013: "LVT",
-    0x0D014: "LVT",
-    0x0D015: "LVT",
-    0x0D016: "LVT",
-    0x0D017: "LVT",
-    0x0D019: "LVT",
-    0x0D01A: "LVT",
-    0x0D01B: "LVT",
-    0x0D01C: "LVT",
-    0x0D01D: "LVT",
-    0x0D01E: "LVT",
-    0x0D01F: "LVT",
-    0x0D020: "LVT",
-    0x0D021: "LVT",
-    0x0D022: "LVT",
-    0x0D023: "LVT",
-    0x0D024: "LVT",
-    0x0D025: "LVT",
-    0x0D026: "LVT",
-    0x0D027: "LVT",
-    0x0D028: "LVT",
-    0x0D029: "LVT",
-    0x0D02A: "LVT",
-    0x0D02B: "LVT",
-    0x0D02C: "LVT",
-    0x0D02D: "LVT",
-    0x0D02E: "LVT",
-    0x0D02F: "LVT",
-    0x0D030: "LVT",
-    0x0D031: "LVT",
-    0x0D032: "LVT",
-    0x0D033: "LVT",
-    0x0D035: "LVT",
-    0x0D036: "LVT",
-    0x0D037: "LVT",
-    0x0D038: "LVT",
-    0x0D039: "LVT",
-    0x0D03A: "LVT",
-    0x0D03B: "LVT",
-    0x0D03C: "LVT",
-    0x0D03D: "LVT",
-    0x0D03E: "LVT",
-    0x0D03F: "LVT",
-    0x0D040: "LVT",
-    0x0D041: "LVT",
-    0x0D042: "LVT",
-    0x0D043: "LVT",
-    0x0D044: "LVT",
-    0x0D045: "LVT",
-    0x0D046: "LVT",
-    0x0D047: "LVT",
-    0x0D048: "LVT",
-    0x0D049: "LVT",
-    0x0D04A: "LVT",
-    0x0D04B: "LVT",
-    0x0D04C: "LVT",
-    0x0D04D: "LVT",
-    0x0D04E: "LVT",
-    0x0D04F: "LVT",
-    0x0D051: "LVT",
-    0x0D052: "LVT",
-    0x0D053: "LVT",
-    0x0D054: "LVT",
-    0x0D055: "LVT",
-    0x0D056: "LVT",
-    0x0D057: "LVT",
-    0x0D058: "LVT",
-    0x0D059: "LVT",
-    0x0D05A: "LVT",
-    0x0D05B: "LVT",
-    0x0D05C: "LVT",
-    0x0D05D: "LVT",
-    0x0D05E: "LVT",
-    0x0D05F: "LVT",
-    0x0D060: "LVT",
-    0x0D061: "LVT",
-    0x0D062: "LVT",
-    0x0D063: "LVT",
-    0x0D064: "LVT",
-    0x0D065: "LVT",
-    0x0D066: "LVT",
-    0x0D067: "LVT",
-    0x0D068: "LVT",
-    0x0D069: "LVT",
-    0x0D06A: "LVT",
-    0x0D06B: "LVT",
-    0x0D06D: "LVT",
-    0x0D06E: "LVT",
-    0x0D06F: "LVT",
-    0x0D070: "LVT",
-    0x0D071: "LVT",
-    0x0D072: "LVT",
-    0x0D073: "LVT",
-    0x0D074: "LVT",
-    0x0D075: "LVT",
-    0x0D076: "LVT",
-    0x0D077: "LVT",
-    0x0D078: "LVT",
-    0x0D079: "LVT",
-    0x0D07A: "LVT",
-    0x0D07B: "LVT",
-    0x0D07C: "LVT",
-    0x0D07D: "LVT",
-    0x0D07E: "LVT",
-    0x0D07F: "LVT",
-    0x0D080: "LVT",
-    0x0D081: "LVT",
-    0x0D082: "LVT",
-    0x0D083: "LVT",
-    0x0D084: "LVT",
-    0x0D085: "LVT",
-    0x0D086: "LVT",
-    0x0D087: "LVT",
-    0x0D089: "LVT",
-    0x0D08A: "LVT",
-    0x0D08B: "LVT",
-    0x0D08C: "LVT",
-    0x0D08D: "LVT",
-    0x0D08E: "LVT",
-    0x0D08F: "LVT",
-    0x0D090: "LVT",
-    0x0D091: "LVT",
-    0x0D092: "LVT",
-    0x0D093: "LVT",
-    0x0D094: "LVT",
-    0x0D095: "LVT",
-    0x0D096: "LVT",
-    0x0D097: "LVT",
-    0x0D098: "LVT",
-    0x0D099: "LVT",
-    0x0D09A: "LVT",
-    0x0D09B: "LVT",
-    0x0D09C: "LVT",
-    0x0D09D: "LVT",
-    0x0D09E: "LVT",
-    0x0D09F: "LVT",
-    0x0D0A0: "LVT",
-    0x0D0A1: "LVT",
-    0x0D0A2: "LVT",
-    0x0D0A3: "LVT",
-    0x0D0A5: "LVT",
-    0x0D0A6: "LVT",
-    0x0D0A7: "LVT",
-    0x0D0A8: "LVT",
-    0x0D0A9: "LVT",
-    0x0D0AA: "LVT",
-    0x0D0AB: "LVT",
-    0x0D0AC: "LVT",
-    0x0D0AD: "LVT",
-    0x0D0AE: "LVT",
-    0x0D0AF: "LVT",
-    0x0D0B0: "LVT",
-    0x0D0B1: "LVT",
-    0x0D0B2: "LVT",
-    0x0D0B3: "LVT",
-    0x0D0B4: "LVT",
-    0x0D0B5: "LVT",
-    0x0D0B6: "LVT",
-    0x0D0B7: "LVT",
-    0x0D0B8: "LVT",
-    0x0D0B9: "LVT",
-    0x0D0BA: "LVT",
-    0x0D0BB: "LVT",
-    0x0D0BC: "LVT",
-    0x0D0BD: "LVT",
-    0x0D0BE: "LVT",
-    0x0D0BF: "LVT",
-    0x0D0C1: "LVT",
-    0x0D0C2: "LVT",
-    0x0D0C3: "LVT",
-    0x0D0C4: "LVT",
-    0x0D0C5: "LVT",
-    0x0D0C6: "LVT",
-    0x0D0C7: "LVT",
-    0x0D0C8: "LVT",
-    0x0D0C9: "LVT",
-    0x0D0CA: "LVT",
-    0x0D0CB: "LVT",
-    0x0D0CC: "LVT",
-    0x0D0CD: "LVT",
-    0x0D0CE: "LVT",
-    0x0D0CF: "LVT",
-    0x0D0D0: "LVT",
-    0x0D0D1: "LVT",
-    0x0D0D2: "LVT",
-    0x0D0D3: "LVT",
-    0x0D0D4: "LVT",
-    0x0D0D5: "LVT",
-    0x0D0D6: "LVT",
-    0x0D0D7: "LVT",
-    0x0D0D8: "LVT",
-    0x0D0D9: "LVT",
-    0x0D0DA: "LVT",
-    0x0D0DB: "LVT",
-    0x0D0DD: "LVT",
-    0x0D0DE: "LVT",
-    0x0D0DF: "LVT",
-    0x0D0E0: "LVT",
-    0x0D0E1: "LVT",
-    0x0D0E2: "LVT",
-    0x0D0E3: "LVT",
-    0x0D0E4: "LVT",
-    0x0D0E5: "LVT",
-    0x0D0E6: "LVT",
-    0x0D0E7: "LVT",
-    0x0D0E8: "LVT",
-    0x0D0E9: "LVT",
-    0x0D0EA: "LVT",
-    0x0D0EB: "LVT",
-    0x0D0EC: "LVT",
-    0x0D0ED: "LVT",
-    0x0D0EE: "LVT",
-    0x0D0EF: "LVT",
-    0x0D0F0: "LVT",
-    0x0D0F1: "LVT",
-    0x0D0F2: "LVT",
-    0x0D0F3: "LVT",
-    0x0D0F4: "LVT",
-    0x0D0F5: "LVT",
-    0x0D0F6: "LVT",
-    0x0D0F7: "LVT",
-    0x0D0F9: "LVT",
-    0x0D0FA: "LVT",
-    0x0D0FB: "LVT",
-    0x0D0FC: "LVT",
-    0x0D0FD: "LVT",
-    0x0D0FE: "LVT",
-    0x0D0FF: "LVT",
-    0x0D100: "LVT",
-    0x0D101: "LVT",
-    0x0D102: "LVT",
-    0x0D103: "LVT",
-    0x0D104: "LVT",
-    0x0D105: "LVT",
-    0x0D106: "LVT",
-    0x0D107: "LVT",
-    0x0D108: "LVT",
-    0x0D109: "LVT",
-    0x0D10A: "LVT",
-    0x0D10B: "LVT",
-    0x0D10C: "LVT",
-    0x0D10D: "LVT",
-    0x0D10E: "LVT",
-    0x0D10F: "LVT",
-    0x0D110: "LVT",
-    0x0D111: "LVT",
-    0x0D112: "LVT",
-    0x0D113: "LVT",
-    0x0D115: "LVT",
-    0x0D116: "LVT",
-    0x0D117: "LVT",
-    0x0D118: "LVT",
-    0x0D119: "LVT",
-    0x0D11A: "LVT",
-    0x0D11B: "LVT",
-    0x0D11C: "LVT",
-    0x0D11D: "LVT",
-    0x0D11E: "LVT",
-    0x0D11F: "LVT",
-    0x0D120: "LVT",
-    0x0D121: "LVT",
-    0x0D122: "LVT",
-    0x0D123: "LVT",
-    0x0D124: "LVT",
-    0x0D125: "LVT",
-    0x0D126: "LVT",
-    0x0D127: "LVT",
-    0x0D128: "LVT",
-    0x0D129: "LVT",
-    0x0D12A: "LVT",
-    0x0D12B: "LVT",
-    0x0D12C: "LVT",
-    0x0D12D: "LVT",
-    0x0D12E: "LVT",
-    0x0D12F: "LVT",
-    0x0D131: "LVT",
-    0x0D132: "LVT",
-    0x0D133: "LVT",
-    0x0D134: "LVT",
-    0x0D135: "LVT",
-    0x0D136: "LVT",
-    0x0D137: "LVT",
-    0x0D138: "LVT",
-    0x0D139: "LVT",
-    0x0D13A: "LVT",
-    0x0D13B: "LVT",
-    0x0D13C: "LVT",
-    0x0D13D: "LVT",
-    0x0D13E: "LVT",
-    0x0D13F: "LVT",
-    0x0D140: "LVT",
-    0x0D141: "LVT",
-    0x0D142: "LVT",
-    0x0D143: "LVT",
-    0x0D144: "LVT",
-    0x0D145: "LVT",
-    0x0D146: "LVT",
-    0x0D147: "LVT",
-    0x0D148: "LVT",
-    0x0D149: "LVT",
-    0x0D14A: "LVT",
-    0x0D14B: "LVT",
-    0x0D14D: "LVT",
-    0x0D14E: "LVT",
-    0x0D14F: "LVT",
-    0x0D150: "LVT",
-    0x0D151: "LVT",
-    0x0D152: "LVT",
-    0x0D153: "LVT",
-    0x0D154: "LVT",
-    0x0D155: "LVT",
-    0x0D156: "LVT",
-    0x0D157: "LVT",
-    0x0D158: "LVT",
-    0x0D159: "LVT",
-    0x0D15A: "LVT",
-    0x0D15B: "LVT",
-    0x0D15C: "LVT",
-    0x0D15D: "LVT",
-    0x0D15E: "LVT",
-    0x0D15F: "LVT",
-    0x0D160: "LVT",
-    0x0D161: "LVT",
-    0x0D162: "LVT",
-    0x0D163: "LVT",
-    0x0D164: "LVT",
-    0x0D165: "LVT",
-    0x0D166: "LVT",
-    0x0D167: "LVT",
-    0x0D169: "LVT",
-    0x0D16A: "LVT",
-    0x0D16B: "LVT",
-    0x0D16C: "LVT",
-    0x0D16D: "LVT",
-    0x0D16E: "LVT",
-    0x0D16F: "LVT",
-    0x0D170: "LVT",
-    0x0D171: "LVT",
-    0x0D172: "LVT",
-    0x0D173: "LVT",
-    0x0D174: "LVT",
-    0x0D175: "LVT",
-    0x0D176: "LVT",
-    0x0D177: "LVT",
-    0x0D178: "LVT",
-    0x0D179: "LVT",
-    0x0D17A: "LVT",
-    0x0D17B: "LVT",
-    0x0D17C: "LVT",
-    0x0D17D: "LVT",
-    0x0D17E: "LVT",
-    0x0D17F: "LVT",
-    0x0D180: "LVT",
-    0x0D181: "LVT",
-    0x0D182: "LVT",
-    0x0D183: "LVT",
-    0x0D185: "LVT",
-    0x0D186: "LVT",
-    0x0D187: "LVT",
-    0x0D188: "LVT",
-    0x0D189: "LVT",
-    0x0D18A: "LVT",
-    0x0D18B: "LVT",
-    0x0D18C: "LVT",
-    0x0D18D: "LVT",
-    0x0D18E: "LVT",
-    0x0D18F: "LVT",
-    0x0D190: "LVT",
-    0x0D191: "LVT",
-    0x0D192: "LVT",
-    0x0D193: "LVT",
-    0x0D194: "LVT",
-    0x0D195: "LVT",
-    0x0D196: "LVT",
-    0x0D197: "LVT",
-    0x0D198: "LVT",
-    0x0D199: "LVT",
-    0x0D19A: "LVT",
-    0x0D19B: "LVT",
-    0x0D19C: "LVT",
-    0x0D19D: "LVT",
-    0x0D19E: "LVT",
-    0x0D19F: "LVT",
-    0x0D1A1: "LVT",
-    0x0D1A2: "LVT",
-    0x0D1A3: "LVT",
-    0x0D1A4: "LVT",
-    0x0D1A5: "LVT",
-    0x0D1A6: "LVT",
-    0x0D1A7: "LVT",
-    0x0D1A8: "LVT",
-    0x0D1A9: "LVT",
-    0x0D1AA: "LVT",
-    0x0D1AB: "LVT",
-    0x0D1AC: "LVT",
-    0x0D1AD: "LVT",
-    0x0D1AE: "LVT",
-    0x0D1AF: "LVT",
-    0x0D1B0: "LVT",
-    0x0D1B1: "LVT",
-    0x0D1B2: "LVT",
-    0x0D1B3: "LVT",
-    0x0D1B4: "LVT",
-    0x0D1B5: "LVT",
-    0x0D1B6: "LVT",
-    0x0D1B7: "LVT",
-    0x0D1B8: "LVT",
-    0x0D1B9: "LVT",
-    0x0D1BA: "LVT",
-    0x0D1BB: "LVT",
-    0x0D1BD: "LVT",
-    0x0D1BE: "LVT",
-    0x0D1BF: "LVT",
-    0x0D1C0: "LVT",
-    0x0D1C1: "LVT",
-    0x0D1C2: "LVT",
-    0x0D1C3: "LVT",
-    0x0D1C4: "LVT",
-    0x0D1C5: "LVT",
-    0x0D1C6: "LVT",
-    0x0D1C7: "LVT",
-    0x0D1C8: "LVT",
-    0x0D1C9: "LVT",
-    0x0D1CA: "LVT",
-    0x0D1CB: "LVT",
-    0x0D1CC: "LVT",
-    0x0D1CD: "LVT",
-    0x0D1CE: "LVT",
-    0x0D1CF: "LVT",
-    0x0D1D0: "LVT",
-    0x0D1D1: "LVT",
-    0x0D1D2: "LVT",
-    0x0D1D3: "LVT",
-    0x0D1D4: "LVT",
-    0x0D1D5: "LVT",
-    0x0D1D6: "LVT",
-    0x0D1D7: "LVT",
-    0x0D1D9: "LVT",
-    0x0D1DA: "LVT",
-    0x0D1DB: "LVT",
-    0x0D1DC: "LVT",
-    0x0D1DD: "LVT",
-    0x0D1DE: "LVT",
-    0x0D1DF: "LVT",
-    0x0D1E0: "LVT",
-    0x0D1E1: "LVT",
-    0x0D1E2: "LVT",
-    0x0D1E3: "LVT",
-    0x0D1E4: "LVT",
-    0x0D1E5: "LVT",
-    0x0D1E6: "LVT",
-    0x0D1E7: "LVT",
-    0x0D1E8: "LVT",
-    0x0D1E9: "LVT",
-    0x0D1EA: "LVT",
-    0x0D1EB: "LVT",
-    0x0D1EC: "LVT",
-    0x0D1ED: "LVT",
-    0x0D1EE: "LVT",
-    0x0D1EF: "LVT",
-    0x0D1F0: "LVT",
-    0x0D1F1: "LVT",
-    0x0D1F2: "LVT",
-    0x0D1F3: "LVT",
-    0x0D1F5: "LVT",
-    0x0D1F6: "LVT",
-    0x0D1F7: "LVT",
-    0x0D1F8: "LVT",
-    0x0D1F9: "LVT",
-    0x0D1FA: "LVT",
-    0x0D1FB: "LVT",
-    0x0D1FC: "LVT",
-    0x0D1FD: "LVT",
-    0x0D1FE: "LVT",
-    0x0D1FF: "LVT",
-    0x0D200: "LVT",
-    0x0D201: "LVT",
-    0x0D202: "LVT",
-    0x0D203: "LVT",
-    0x0D204: "LVT",
-    0x0D205: "LVT",
-    0x0D206: "LVT",
-    0x0D207: "LVT",
-    0x0D208: "LVT",
-    0x0D209: "LVT",
-    0x0D20A: "LVT",
-    0x0D20B: "LVT",
-    0x0D20C: "LVT",
-    0x0D20D: "LVT",
-    0x0D20E: "LVT",
-    0x0D20F: "LVT",
-    0x0D211: "LVT",
-    0x0D212: "LVT",
-    0x0D213: "LVT",
-    0x0D214: "LVT",
-    0x0D215: "LVT",
-    0x0D216: "LVT",
-    0x0D217: "LVT",
-    0x0D218: "LVT",
-    0x0D219: "LVT",
-    0x0D21A: "LVT",
-    0x0D21B: "LVT",
-    0x0D21C: "LVT",
-    0x0D21D: "LVT",
-    0x0D21E: "LVT",
-    0x0D21F: "LVT",
-    0x0D220: "LVT",
-    0x0D221: "LVT",
-    0x0D222: "LVT",
-    0x0D223: "LVT",
-    0x0D224: "LVT",
-    0x0D225: "LVT",
-    0x0D226: "LVT",
-    0x0D227: "LVT",
-    0x0D228: "LVT",
-    0x0D229: "LVT",
-    0x0D22A: "LVT",
-    0x0D22B: "LVT",
-    0x0D22D: "LVT",
-    0x0D22E: "LVT",
-    0x0D22F: "LVT",
-    0x0D230: "LVT",
-    0x0D231: "LVT",
-    0x0D232: "LVT",
-    0x0D233: "LVT",
-    0x0D234: "LVT",
-    0x0D235: "LVT",
-    0x0D236: "LVT",
-    0x0D237: "LVT",
-    0x0D238: "LVT",
-    0x0D239: "LVT",
-    0x0D23A: "LVT",
-    0x0D23B: "LVT",
-    0x0D23C: "LVT",
-    0x0D23D: "LVT",
-    0x0D23E: "LVT",
-    0x0D23F: "LVT",
-    0x0D240: "LVT",
-    0x0D241: "LVT",
-    0x0D242: "LVT",
-    0x0D243: "LVT",
-    0x0D244: "LVT",
-    0x0D245: "LVT",
-    0x0D246: "LVT",
-    0x0D247: "LVT",
-    0x0D249: "LVT",
-    0x0D24A: "LVT",
-    0x0D24B: "LVT",
-    0x0D24C: "LVT",
-    0x0D24D: "LVT",
-    0x0D24E: "LVT",
-    0x0D24F: "LVT",
-    0x0D250: "LVT",
-    0x0D251: "LVT",
-    0x0D252: "LVT",
-    0x0D253: "LVT",
-    0x0D254: "LVT",
-    0x0D255: "LVT",
-    0x0D256: "LVT",
-    0x0D257: "LVT",
-    0x0D258: "LVT",
-    0x0D259: "LVT",
-    0x0D25A: "LVT",
-    0x0D25B: "LVT",
-    0x0D25C: "LVT",
-    0x0D25D: "LVT",
-    0x0D25E: "LVT",
-    0x0D25F: "LVT",
-    0x0D260: "LVT",
-    0x0D261: "LVT",
-    0x0D262: "LVT",
-    0x0D263: "LVT",
-    0x0D265: "LVT",
-    0x0D266: "LVT",
-    0x0D267: "LVT",
-    0x0D268: "LVT",
-    0x0D269: "LVT",
-    0x0D26A: "LVT",
-    0x0D26B: "LVT",
-    0x0D26C: "LVT",
-    0x0D26D: "LVT",
-    0x0D26E: "LVT",
-    0x0D26F: "LVT",
-    0x0D270: "LVT",
-    0x0D271: "LVT",
-    0x0D272: "LVT",
-    0x0D273: "LVT",
-    0x0D274: "LVT",
-    0x0D275: "LVT",
-    0x0D276: "LVT",
-    0x0D277: "LVT",
-    0x0D278: "LVT",
-    0x0D279: "LVT",
-    0x0D27A: "LVT",
-    0x0D27B: "LVT",
-    0x0D27C: "LVT",
-    0x0D27D: "LVT",
-    0x0D27E: "LVT",
-    0x0D27F: "LVT",
-    0x0D281: "LVT",
-    0x0D282: "LVT",
-    0x0D283: "LVT",
-    0x0D284: "LVT",
-    0x0D285: "LVT",
-    0x0D286: "LVT",
-    0x0D287: "LVT",
-    0x0D288: "LVT",
-    0x0D289: "LVT",
-    0x0D28A: "LVT",
-    0x0D28B: "LVT",
-    0x0D28C: "LVT",
-    0x0D28D: "LVT",
-    0x0D28E: "LVT",
-    0x0D28F: "LVT",
-    0x0D290: "LVT",
-    0x0D291: "LVT",
-    0x0D292: "LVT",
-    0x0D293: "LVT",
-    0x0D294: "LVT",
-    0x0D295: "LVT",
-    0x0D296: "LVT",
-    0x0D297: "LVT",
-    0x0D298: "LVT",
-    0x0D299: "LVT",
-    0x0D29A: "LVT",
-    0x0D29B: "LVT",
-    0x0D29D: "LVT",
-    0x0D29E: "LVT",
-    0x0D29F: "LVT",
-    0x0D2A0: "LVT",
-    0x0D2A1: "LVT",
-    0x0D2A2: "LVT",
-    0x0D2A3: "LVT",
-    0x0D2A4: "LVT",
-    0x0D2A5: "LVT",
-    0x0D2A6: "LVT",
-    0x0D2A7: "LVT",
-    0x0D2A8: "LVT",
-    0x0D2A9: "LVT",
-    0x0D2AA: "LVT",
-    0x0D2AB: "LVT",
-    0x0D2AC: "LVT",
-    0x0D2AD: "LVT",
-    0x0D2AE: "LVT",
-    0x0D2AF: "LVT",
-    0x0D2B0: "LVT",
-    0x0D2B1: "LVT",
-    0x0D2B2: "LVT",
-    0x0D2B3: "LVT",
-    0x0D2B4: "LVT",
-    0x0D2B5: "LVT",
-    0x0D2B6: "LVT",
-    0x0D2B7: "LVT",
-    0x0D2B9: "LVT",
-    0x0D2BA: "LVT",
-    0x0D2BB: "LVT",
-    0x0D2BC: "LVT",
-    0x0D2BD: "LVT",
-    0x0D2BE: "LVT",
-    0x0D2BF: "LVT",
-    0x0D2C0: "LVT",
-    0x0D2C1: "LVT",
-    0x0D2C2: "LVT",
-    0x0D2C3: "LVT",
-    0x0D2C4: "LVT",
-    0x0D2C5: "LVT",
-    0x0D2C6: "LVT",
-    0x0D2C7: "LVT",
-    0x0D2C8: "LVT",
-    0x0D2C9: "LVT",
-    0x0D2CA: "LVT",
-    0x0D2CB: "LVT",
-    0x0D2CC: "LVT",
-    0x0D2CD: "LVT",
-    0x0D2CE: "LVT",
-    0x0D2CF: "LVT",
-    0x0D2D0: "LVT",
-    0x0D2D1: "LVT",
-    0x0D2D2: "LVT",
-    0x0D2D3: "LVT",
-    0x0D2D5: "LVT",
-    0x0D2D6: "LVT",
-    0x0D2D7: "LVT",
-    0x0D2D8: "LVT",
-    0x0D2D9: "LVT",
-    0x0D2DA: "LVT",
-    0x0D2DB: "LVT",
-    0x0D2DC: "LVT",
-    0x0D2DD: "LVT",
-    0x0D2DE: "LVT",
-    0x0D2DF: "LVT",
-    0x0D2E0: "LVT",
-    0x0D2E1: "LVT",
-    0x0D2E2: "LVT",
-    0x0D2E3: "LVT",
-    0x0D2E4: "LVT",
-    0x0D2E5: "LVT",
-    0x0D2E6: "LVT",
-    0x0D2E7: "LVT",
-    0x0D2E8: "LVT",
-    0x0D2E9: "LVT",
-    0x0D2EA: "LVT",
-    0x0D2EB: "LVT",
-    0x0D2EC: "LVT",
-    0x0D2ED: "LVT",
-    0x0D2EE: "LVT",
-    0x0D2EF: "LVT",
-    0x0D2F1: "LVT",
-    0x0D2F2: "LVT",
-    0x0D2F3: "LVT",
-    0x0D2F4: "LVT",
-    0x0D2F5: "LVT",
-    0x0D2F6: "LVT",
-    0x0D2F7: "LVT",
-    0x0D2F8: "LVT",
-    0x0D2F9: "LVT",
-    0x0D2FA: "LVT",
-    0x0D2FB: "LVT",
-    0x0D2FC: "LVT",
-    0x0D2FD: "LVT",
-    0x0D2FE: "LVT",
-    0x0D2FF: "LVT",
-    0x0D300: "LVT",
-    0x0D301: "LVT",
-    0x0D302: "LVT",
-    0x0D303: "LVT",
-    0x0D304: "LVT",
-    0x0D305: "LVT",
-    0x0D306: "LVT",
-    0x0D307: "LVT",
-    0x0D308: "LVT",
-    0x0D309: "LVT",
-    0x0D30A: "LVT",
-    0x0D30B: "LVT",
-    0x0D30D: "LVT",
-    0x0D30E: "LVT",
-    0x0D30F: "LVT",
-    0x0D310: "LVT",
-    0x0D311: "LVT",
-    0x0D312: "LVT",
-    0x0D313: "LVT",
-    0x0D314: "LVT",
-    0x0D315: "LVT",
-    0x0D316: "LVT",
-    0x0D317: "LVT",
-    0x0D318: "LVT",
-    0x0D319: "LVT",
-    0x0D31A: "LVT",
-    0x0D31B: "LVT",
-    0x0D31C: "LVT",
-    0x0D31D: "LVT",
-    0x0D31E: "LVT",
-    0x0D31F: "LVT",
-    0x0D320: "LVT",
-    0x0D321: "LVT",
-    0x0D322: "LVT",
-    0x0D323: "LVT",
-    0x0D324: "LVT",
-    0x0D325: "LVT",
-    0x0D326: "LVT",
-    0x0D327: "LVT",
-    0x0D329: "LVT",
-    0x0D32A: "LVT",
-    0x0D32B: "LVT",
-    0x0D32C: "LVT",
-    0x0D32D: "LVT",
-    0x0D32E: "LVT",
-    0x0D32F: "LVT",
-    0x0D330: "LVT",
-    0x0D331: "LVT",
-    0x0D332: "LVT",
-    0x0D333: "LVT",
-    0x0D334: "LVT",
-    0x0D335: "LVT",
-    0x0D336: "LVT",
-    0x0D337: "LVT",
-    0x0D338: "LVT",
-    0x0D339: "LVT",
-    0x0D33A: "LVT",
-    0x0D33B: "LVT",
-    0x0D33C: "LVT",
-    0x0D33D: "LVT",
-    0x0D33E: "LVT",
-    0x0D33F: "LVT",
-    0x0D340: "LVT",
-    0x0D341: "LVT",
-    0x0D342: "LVT",
-    0x0D343: "LVT",
-    0x0D345: "LVT",
-    0x0D346: "LVT",
-    0x0D347: "LVT",
-    0x0D348: "LVT",
-    0x0D349: "LVT",
-    0x0D34A: "LVT",
-    0x0D34B: "LVT",
-    0x0D34C: "LVT",
-    0x0D34D: "LVT",
-    0x0D34E: "LVT",
-    0x0D34F: "LVT",
-    0x0D350: "LVT",
-    0x0D351: "LVT",
-    0x0D352: "LVT",
-    0x0D353: "LVT",
-    0x0D354: "LVT",
-    0x0D355: "LVT",
-    0x0D356: "LVT",
-    0x0D357: "LVT",
-    0x0D358: "LVT",
-    0x0D359: "LVT",
-    0x0D35A: "LVT",
-    0x0D35B: "LVT",
-    0x0D35C: "LVT",
-    0x0D35D: "LVT",
-    0x0D35E: "LVT",
-    0x0D35F: "LVT",
-    0x0D361: "LVT",
-    0x0D362: "LVT",
-    0x0D363: "LVT",
-    0x0D364: "LVT",
-    0x0D365: "LVT",
-    0x0D366: "LVT",
-    0x0D367: "LVT",
-    0x0D368: "LVT",
-    0x0D369: "LVT",
-    0x0D36A: "LVT",
-    0x0D36B: "LVT",
-    0x0D36C: "LVT",
-    0x0D36D: "LVT",
-    0x0D36E: "LVT",
-    0x0D36F: "LVT",
-    0x0D370: "LVT",
-    0x0D371: "LVT",
-    0x0D372: "LVT",
-    0x0D373: "LVT",
-    0x0D374: "LVT",
-    0x0D375: "LVT",
-    0x0D376: "LVT",
-    0x0D377: "LVT",
-    0x0D378: "LVT",
-    0x0D379: "LVT",
-    0x0D37A: "LVT",
-    0x0D37B: "LVT",
-    0x0D37D: "LVT",
-    0x0D37E: "LVT",
-    0x0D37F: "LVT",
-    0x0D380: "LVT",
-    0x0D381: "LVT",
-    0x0D382: "LVT",
-    0x0D383: "LVT",
-    0x0D384: "LVT",
-    0x0D385: "LVT",
-    0x0D386: "LVT",
-    0x0D387: "LVT",
-    0x0D388: "LVT",
-    0x0D389: "LVT",
-    0x0D38A: "LVT",
-    0x0D38B: "LVT",
-    0x0D38C: "LVT",
-    0x0D38D: "LVT",
-    0x0D38E: "LVT",
-    0x0D38F: "LVT",
-    0x0D390: "LVT",
-    0x0D391: "LVT",
-    0x0D392: "LVT",
-    0x0D393: "LVT",
-    0x0D394: "LVT",
-    0x0D395: "LVT",
-    0x0D396: "LVT",
-    0x0D397: "LVT",
-    0x0D399: "LVT",
-    0x0D39A: "LVT",
-    0x0D39B: "LVT",
-    0x0D39C: "LVT",
-    0x0D39D: "LVT",
-    0x0D39E: "LVT",
-    0x0D39F: "LVT",
-    0x0D3A0: "LVT",
-    0x0D3A1: "LVT",
-    0x0D3A2: "LVT",
-    0x0D3A3: "LVT",
-    0x0D3A4: "LVT",
-    0x0D3A5: "LVT",
-    0x0D3A6: "LVT",
-    0x0D3A7: "LVT",
-    0x0D3A8: "LVT",
-    0x0D3A9: "LVT",
-    0x0D3AA: "LVT",
-    0x0D3AB: "LVT",
-    0x0D3AC: "LVT",
-    0x0D3AD: "LVT",
-    0x0D3AE: "LVT",
-    0x0D3AF: "LVT",
-    0x0D3B0: "LVT",
-    0x0D3B1: "LVT",
-    0x0D3B2: "LVT",
-    0x0D3B3: "LVT",
-    0x0D3B5: "LVT",
-    0x0D3B6: "LVT",
-    0x0D3B7: "LVT",
-    0x0D3B8: "LVT",
-    0x0D3B9: "LVT",
-    0x0D3BA: "LVT",
-    0x0D3BB: "LVT",
-    0x0D3BC: "LVT",
-    0x0D3BD: "LVT",
-    0x0D3BE: "LVT",
-    0x0D3BF: "LVT",
-    0x0D3C0: "LVT",
-    0x0D3C1: "LVT",
-    0x0D3C2: "LVT",
-    0x0D3C3: "LVT",
-    0x0D3C4: "LVT",
-    0x0D3C5: "LVT",
-    0x0D3C6: "LVT",
-    0x0D3C7: "LVT",
-    0x0D3C8: "LVT",
-    0x0D3C9: "LVT",
-    0x0D3CA: "LVT",
-    0x0D3CB: "LVT",
-    0x0D3CC: "LVT",
-    0x0D3CD: "LVT",
-    0x0D3CE: "LVT",
-    0x0D3CF: "LVT",
-    0x0D3D1: "LVT",
-    0x0D3D2: "LVT",
-    0x0D3D3: "LVT",
-    0x0D3D4: "LVT",
-    0x0D3D5: "LVT",
-    0x0D3D6: "LVT",
-    0x0D3D7: "LVT",
-    0x0D3D8: "LVT",
-    0x0D3D9: "LVT",
-    0x0D3DA: "LVT",
-    0x0D3DB: "LVT",
-    0x0D3DC: "LVT",
-    0x0D3DD: "LVT",
-    0x0D3DE: "LVT",
-    0x0D3DF: "LVT",
-    0x0D3E0: "LVT",
-    0x0D3E1: "LVT",
-    0x0D3E2: "LVT",
-    0x0D3E3: "LVT",
-    0x0D3E4: "LVT",
-    0x0D3E5: "LVT",
-    0x0D3E6: "LVT",
-    0x0D3E7: "LVT",
-    0x0D3E8: "LVT",
-    0x0D3E9: "LVT",
-    0x0D3EA: "LVT",
-    0x0D3EB: "LVT",
-    0x0D3ED: "LVT",
-    0x0D3EE: "LVT",
-    0x0D3EF: "LVT",
-    0x0D3F0: "LVT",
-    0x0D3F1: "LVT",
-    0x0D3F2: "LVT",
-    0x0D3F3: "LVT",
-    0x0D3F4: "LVT",
-    0x0D3F5: "LVT",
-    0x0D3F6: "LVT",
-    0x0D3F7: "LVT",
-    0x0D3F8: "LVT",
-    0x0D3F9: "LVT",
-    0x0D3FA: "LVT",
-    0x0D3FB: "LVT",
-    0x0D3FC: "LVT",
-    0x0D3FD: "LVT",
-    0x0D3FE: "LVT",
-    0x0D3FF: "LVT",
-    0x0D400: "LVT",
-    0x0D401: "LVT",
-    0x0D402: "LVT",
-    0x0D403: "LVT",
-    0x0D404: "LVT",
-    0x0D405: "LVT",
-    0x0D406: "LVT",
-    0x0D407: "LVT",
-    0x0D409: "LVT",
-    0x0D40A: "LVT",
-    0x0D40B: "LVT",
-    0x0D40C: "LVT",
-    0x0D40D: "LVT",
-    0x0D40E: "LVT",
-    0x0D40F: "LVT",
-    0x0D410: "LVT",
-    0x0D411: "LVT",
-    0x0D412: "LVT",
-    0x0D413: "LVT",
-    0x0D414: "LVT",
-    0x0D415: "LVT",
-    0x0D416: "LVT",
-    0x0D417: "LVT",
-    0x0D418: "LVT",
-    0x0D419: "LVT",
-    0x0D41A: "LVT",
-    0x0D41B: "LVT",
-    0x0D41C: "LVT",
-    0x0D41D: "LVT",
-    0x0D41E: "LVT",
-    0x0D41F: "LVT",
-    0x0D420: "LVT",
-    0x0D421: "LVT",
-    0x0D422: "LVT",
-    0x0D423: "LVT",
-    0x0D425: "LVT",
-    0x0D426: "LVT",
-    0x0D427: "LVT",
-    0x0D428: "LVT",
-    0x0D429: "LVT",
-    0x0D42A: "LVT",
-    0x0D42B: "LVT",
-    0x0D42C: "LVT",
-    0x0D42D: "LVT",
-    0x0D42E: "LVT",
-    0x0D42F: "LVT",
-    0x0D430: "LVT",
-    0x0D431: "LVT",
-    0x0D432: "LVT",
-    0x0D433: "LVT",
-    0x0D434: "LVT",
-    0x0D435: "LVT",
-    0x0D436: "LVT",
-    0x0D437: "LVT",
-    0x0D438: "LVT",
-    0x0D439: "LVT",
-    0x0D43A: "LVT",
-    0x0D43B: "LVT",
-    0x0D43C: "LVT",
-    0x0D43D: "LVT",
-    0x0D43E: "LVT",
-    0x0D43F: "LVT",
-    0x0D441: "LVT",
-    0x0D442: "LVT",
-    0x0D443: "LVT",
-    0x0D444: "LVT",
-    0x0D445: "LVT",
-    0x0D446: "LVT",
-    0x0D447: "LVT",
-    0x0D448: "LVT",
-    0x0D449: "LVT",
-    0x0D44A: "LVT",
-    0x0D44B: "LVT",
-    0x0D44C: "LVT",
-    0x0D44D: "LVT",
-    0x0D44E: "LVT",
-    0x0D44F: "LVT",
-    0x0D450: "LVT",
-    0x0D451: "LVT",
-    0x0D452: "LVT",
-    0x0D453: "LVT",
-    0x0D454: "LVT",
-    0x0D455: "LVT",
-    0x0D456: "LVT",
-    0x0D457: "LVT",
-    0x0D458: "LVT",
-    0x0D459: "LVT",
-    0x0D45A: "LVT",
-    0x0D45B: "LVT",
-    0x0D45D: "LVT",
-    0x0D45E: "LVT",
-    0x0D45F: "LVT",
-    0x0D460: "LVT",
-    0x0D461: "LVT",
-    0x0D462: "LVT",
-    0x0D463: "LVT",
-    0x0D464: "LVT",
-    0x0D465: "LVT",
-    0x0D466: "LVT",
-    0x0D467: "LVT",
-    0x0D468: "LVT",
-    0x0D469: "LVT",
-    0x0D46A: "LVT",
-    0x0D46B: "LVT",
-    0x0D46C: "LVT",
-    0x0D46D: "LVT",
-    0x0D46E: "LVT",
-    0x0D46F: "LVT",
-    0x0D470: "LVT",
-    0x0D471: "LVT",
-    0x0D472: "LVT",
-    0x0D473: "LVT",
-    0x0D474: "LVT",
-    0x0D475: "LVT",
-    0x0D476: "LVT",
-    0x0D477: "LVT",
-    0x0D479: "LVT",
-    0x0D47A: "LVT",
-    0x0D47B: "LVT",
-    0x0D47C: "LVT",
-    0x0D47D: "LVT",
-    0x0D47E: "LVT",
-    0x0D47F: "LVT",
-    0x0D480: "LVT",
-    0x0D481: "LVT",
-    0x0D482: "LVT",
-    0x0D483: "LVT",
-    0x0D484: "LVT",
-    0x0D485: "LVT",
-    0x0D486: "LVT",
-    0x0D487: "LVT",
-    0x0D488: "LVT",
-    0x0D489: "LVT",
-    0x0D48A: "LVT",
-    0x0D48B: "LVT",
-    0x0D48C: "LVT",
-    0x0D48D: "LVT",
-    0x0D48E: "LVT",
-    0x0D48F: "LVT",
-    0x0D490: "LVT",
-    0x0D491: "LVT",
-    0x0D492: "LVT",
-    0x0D493: "LVT",
-    0x0D495: "LVT",
-    0x0D496: "LVT",
-    0x0D497: "LVT",
-    0x0D498: "LVT",
-    0x0D499: "LVT",
-    0x0D49A: "LVT",
-    0x0D49B: "LVT",
-    0x0D49C: "LVT",
-    0x0D49D: "LVT",
-    0x0D49E: "LVT",
-    0x0D49F: "LVT",
-    0x0D4A0: "LVT",
-    0x0D4A1: "LVT",
-    0x0D4A2: "LVT",
-    0x0D4A3: "LVT",
-    0x0D4A4: "LVT",
-    0x0D4A5: "LVT",
-    0x0D4A6: "LVT",
-    0x0D4A7: "LVT",
-    0x0D4A8: "LVT",
-    0x0D4A9: "LVT",
-    0x0D4AA: "LVT",
-    0x0D4AB: "LVT",
-    0x0D4AC: "LVT",
-    0x0D4AD: "LVT",
-    0x0D4AE: "LVT",
-    0x0D4AF: "LVT",
-    0x0D4B1: "LVT",
-    0x0D4B2: "LVT",
-    0x0D4B3: "LVT",
-    0x0D4B4: "LVT",
-    0x0D4B5: "LVT",
-    0x0D4B6: "LVT",
-    0x0D4B7: "LVT",
-    0x0D4B8: "LVT",
-    0x0D4B9: "LVT",
-    0x0D4BA: "LVT",
-    0x0D4BB: "LVT",
-    0x0D4BC: "LVT",
-    0x0D4BD: "LVT",
-    0x0D4BE: "LVT",
-    0x0D4BF: "LVT",
-    0x0D4C0: "LVT",
-    0x0D4C1: "LVT",
-    0x0D4C2: "LVT",
-    0x0D4C3: "LVT",
-    0x0D4C4: "LVT",
-    0x0D4C5: "LVT",
-    0x0D4C6: "LVT",
-    0x0D4C7: "LVT",
-    0x0D4C8: "LVT",
-    0x0D4C9: "LVT",
-    0x0D4CA: "LVT",
-    0x0D4CB: "LVT",
-    0x0D4CD: "LVT",
-    0x0D4CE: "LVT",
-    0x0D4CF: "LVT",
-    0x0D4D0: "LVT",
-    0x0D4D1: "LVT",
-    0x0D4D2: "LVT",
-    0x0D4D3: "LVT",
-    0x0D4D4: "LVT",
-    0x0D4D5: "LVT",
-    0x0D4D6: "LVT",
-    0x0D4D7: "LVT",
-    0x0D4D8: "LVT",
-    0x0D4D9: "LVT",
-    0x0D4DA: "LVT",
-    0x0D4DB: "LVT",
-    0x0D4DC: "LVT",
-    0x0D4DD: "LVT",
-    0x0D4DE: "LVT",
-    0x0D4DF: "LVT",
-    0x0D4E0: "LVT",
-    0x0D4E1: "LVT",
-    0x0D4E2: "LVT",
-    0x0D4E3: "LVT",
-    0x0D4E4: "LVT",
-    0x0D4E5: "LVT",
-    0x0D4E6: "LVT",
-    0x0D4E7: "LVT",
-    0x0D4E9: "LVT",
-    0x0D4EA: "LVT",
-    0x0D4EB: "LVT",
-    0x0D4EC: "LVT",
-    0x0D4ED: "LVT",
-    0x0D4EE: "LVT",
-    0x0D4EF: "LVT",
-    0x0D4F0: "LVT",
-    0x0D4F1: "LVT",
-    0x0D4F2: "LVT",
-    0x0D4F3: "LVT",
-    0x0D4F4: "LVT",
-    0x0D4F5: "LVT",
-    0x0D4F6: "LVT",
-    0x0D4F7: "LVT",
-    0x0D4F8: "LVT",
-    0x0D4F9: "LVT",
-    0x0D4FA: "LVT",
-    0x0D4FB: "LVT",
-    0x0D4FC: "LVT",
-    0x0D4FD: "LVT",
-    0x0D4FE: "LVT",
-    0x0D4FF: "LVT",
-    0x0D500: "LVT",
-    0x0D501: "LVT",
-    0x0D502: "LVT",
-    0x0D503: "LVT",
-    0x0D505: "LVT",
-    0x0D506: "LVT",
-    0x0D507: "LVT",
-    0x0D508: "LVT",
-    0x0D509: "LVT",
-    0x0D50A: "LVT",
-    0x0D50B: "LVT",
-    0x0D50C: "LVT",
-    0x0D50D: "LVT",
-    0x0D50E: "LVT",
-    0x0D50F: "LVT",
-    0x0D510: "LVT",
-    0x0D511: "LVT",
-    0x0D512: "LVT",
-    0x0D513: "LVT",
-    0x0D514: "LVT",
-    0x0D515: "LVT",
-    0x0D516: "LVT",
-    0x0D517: "LVT",
-    0x0D518: "LVT",
-    0x0D519: "LVT",
-    0x0D51A: "LVT",
-    0x0D51B: "LVT",
-    0x0D51C: "LVT",
-    0x0D51D: "LVT",
-    0x0D51E: "LVT",
-    0x0D51F: "LVT",
-    0x0D521: "LVT",
-    0x0D522: "LVT",
-    0x0D523: "LVT",
-    0x0D524: "LVT",
-    0x0D525: "LVT",
-    0x0D526: "LVT",
-    0x0D527: "LVT",
-    0x0D528: "LVT",
-    0x0D529: "LVT",
-    0x0D52A: "LVT",
-    0x0D52B: "LVT",
-    0x0D52C: "LVT",
-    0x0D52D: "LVT",
-    0x0D52E: "LVT",
-    0x0D52F: "LVT",
-    0x0D530: "LVT",
-    0x0D531: "LVT",
-    0x0D532: "LVT",
-    0x0D533: "LVT",
-    0x0D534: "LVT",
-    0x0D535: "LVT",
-    0x0D536: "LVT",
-    0x0D537: "LVT",
-    0x0D538: "LVT",
-    0x0D539: "LVT",
-    0x0D53A: "LVT",
-    0x0D53B: "LVT",
-    0x0D53D: "LVT",
-    0x0D53E: "LVT",
-    0x0D53F: "LVT",
-    0x0D540: "LVT",
-    0x0D541: "LVT",
-    0x0D542: "LVT",
-    0x0D543: "LVT",
-    0x0D544: "LVT",
-    0x0D545: "LVT",
-    0x0D546: "LVT",
-    0x0D547: "LVT",
-    0x0D548: "LVT",
-    0x0D549: "LVT",
-    0x0D54A: "LVT",
-    0x0D54B: "LVT",
-    0x0D54C: "LVT",
-    0x0D54D: "LVT",
-    0x0D54E: "LVT",
-    0x0D54F: "LVT",
-    0x0D550: "LVT",
-    0x0D551: "LVT",
-    0x0D552: "LVT",
-    0x0D553: "LVT",
-    0x0D554: "LVT",
-    0x0D555: "LVT",
-    0x0D556: "LVT",
-    0x0D557: "LVT",
-    0x0D559: "LVT",
-    0x0D55A: "LVT",
-    0x0D55B: "LVT",
-    0x0D55C: "LVT",
-    0x0D55D: "LVT",
-    0x0D55E: "LVT",
-    0x0D55F: "LVT",
-    0x0D560: "LVT",
-    0x0D561: "LVT",
-    0x0D562: "LVT",
-    0x0D563: "LVT",
-    0x0D564: "LVT",
-    0x0D565: "LVT",
-    0x0D566: "LVT",
-    0x0D567: "LVT",
-    0x0D568: "LVT",
-    0x0D569: "LVT",
-    0x0D56A: "LVT",
-    0x0D56B: "LVT",
-    0x0D56C: "LVT",
-    0x0D56D: "LVT",
-    0x0D56E: "LVT",
-    0x0D56F: "LVT",
-    0x0D570: "LVT",
-    0x0D571: "LVT",
-    0x0D572: "LVT",
-    0x0D573: "LVT",
-    0x0D575: "LVT",
-    0x0D576: "LVT",
-    0x0D577: "LVT",
-    0x0D578: "LVT",
-    0x0D579: "LVT",
-    0x0D57A: "LVT",
-    0x0D57B: "LVT",
-    0x0D57C: "LVT",
-    0x0D57D: "LVT",
-    0x0D57E: "LVT",
-    0x0D57F: "LVT",
-    0x0D580: "LVT",
-    0x0D581: "LVT",
-    0x0D582: "LVT",
-    0x0D583: "LVT",
-    0x0D584: "LVT",
-    0x0D585: "LVT",
-    0x0D586: "LVT",
-    0x0D587: "LVT",
-    0x0D588: "LVT",
-    0x0D589: "LVT",
-    0x0D58A: "LVT",
-    0x0D58B: "LVT",
-    0x0D58C: "LVT",
-    0x0D58D: "LVT",
-    0x0D58E: "LVT",
-    0x0D58F: "LVT",
-    0x0D591: "LVT",
-    0x0D592: "LVT",
-    0x0D593: "LVT",
-    0x0D594: "LVT",
-    0x0D595: "LVT",
-    0x0D596: "LVT",
-    0x0D597: "LVT",
-    0x0D598: "LVT",
-    0x0D599: "LVT",
-    0x0D59A: "LVT",
-    0x0D59B: "LVT",
-    0x0D59C: "LVT",
-    0x0D59D: "LVT",
-    0x0D59E: "LVT",
-    0x0D59F: "LVT",
-    0x0D5A0: "LVT",
-    0x0D5A1: "LVT",
-    0x0D5A2: "LVT",
-    0x0D5A3: "LVT",
-    0x0D5A4: "LVT",
-    0x0D5A5: "LVT",
-    0x0D5A6: "LVT",
-    0x0D5A7: "LVT",
-    0x0D5A8: "LVT",
-    0x0D5A9: "LVT",
-    0x0D5AA: "LVT",
-    0x0D5AB: "LVT",
-    0x0D5AD: "LVT",
-    0x0D5AE: "LVT",
-    0x0D5AF: "LVT",
-    0x0D5B0: "LVT",
-    0x0D5B1: "LVT",
-    0x0D5B2: "LVT",
-    0x0D5B3: "LVT",
-    0x0D5B4: "LVT",
-    0x0D5B5: "LVT",
-    0x0D5B6: "LVT",
-    0x0D5B7: "LVT",
-    0x0D5B8: "LVT",
-    0x0D5B9: "LVT",
-    0x0D5BA: "LVT",
-    0x0D5BB: "LVT",
-    0x0D5BC: "LVT",
-    0x0D5BD: "LVT",
-    0x0D5BE: "LVT",
-    0x0D5BF: "LVT",
-    0x0D5C0: "LVT",
-    0x0D5C1: "LVT",
-    0x0D5C2: "LVT",
-    0x0D5C3: "LVT",
-    0x0D5C4: "LVT",
-    0x0D5C5: "LVT",
-    0x0D5C6: "LVT",
-    0x0D5C7: "LVT",
-    0x0D5C9: "LVT",
-    0x0D5CA: "LVT",
-    0x0D5CB: "LVT",
-    0x0D5CC: "LVT",
-    0x0D5CD: "LVT",
-    0x0D5CE: "LVT",
-    0x0D5CF: "LVT",
-    0x0D5D0: "LVT",
-    0x0D5D1: "LVT",
-    0x0D5D2: "LVT",
-    0x0D5D3: "LVT",
-    0x0D5D4: "LVT",
-    0x0D5D5: "LVT",
-    0x0D5D6: "LVT",
-    0x0D5D7: "LVT",
-    0x0D5D8: "LVT",
-    0x0D5D9: "LVT",
-    0x0D5DA: "LVT",
-    0x0D5DB: "LVT",
-    0x0D5DC: "LVT",
-    0x0D5DD: "LVT",
-    0x0D5DE: "LVT",
-    0x0D5DF: "LVT",
-    0x0D5E0: "LVT",
-    0x0D5E1: "LVT",
-    0x0D5E2: "LVT",
-    0x0D5E3: "LVT",
-    0x0D5E5: "LVT",
-    0x0D5E6: "LVT",
-    0x0D5E7: "LVT",
-    0x0D5E8: "LVT",
-    0x0D5E9: "LVT",
-    0x0D5EA: "LVT",
-    0x0D5EB: "LVT",
-    0x0D5EC: "LVT",
-    0x0D5ED: "LVT",
-    0x0D5EE: "LVT",
-    0x0D5EF: "LVT",
-    0x0D5F0: "LVT",
-    0x0D5F1: "LVT",
-    0x0D5F2: "LVT",
-    0x0D5F3: "LVT",
-    0x0D5F4: "LVT",
-    0x0D5F5: "LVT",
-    0x0D5F6: "LVT",
-    0x0D5F7: "LVT",
-    0x0D5F8: "LVT",
-    0x0D5F9: "LVT",
-    0x0D5FA: "LVT",
-    0x0D5FB: "LVT",
-    0x0D5FC: "LVT",
-    0x0D5FD: "LVT",
-    0x0D5FE: "LVT",
-    0x0D5FF: "LVT",
-    0x0D601: "LVT",
-    0x0D602: "LVT",
-    0x0D603: "LVT",
-    0x0D604: "LVT",
-    0x0D605: "LVT",
-    0x0D606: "LVT",
-    0x0D607: "LVT",
-    0x0D608: "LVT",
-    0x0D609: "LVT",
-    0x0D60A: "LVT",
-    0x0D60B: "LVT",
-    0x0D60C: "LVT",
-    0x0D60D: "LVT",
-    0x0D60E: "LVT",
-    0x0D60F: "LVT",
-    0x0D610: "LVT",
-    0x0D611: "LVT",
-    0x0D612: "LVT",
-    0x0D613: "LVT",
-    0x0D614: "LVT",
-    0x0D615: "LVT",
-    0x0D616: "LVT",
-    0x0D617: "LVT",
-    0x0D618: "LVT",
-    0x0D619: "LVT",
-    0x0D61A: "LVT",
-    0x0D61B: "LVT",
-    0x0D61D: "LVT",
-    0x0D61E: "LVT",
-    0x0D61F: "LVT",
-    0x0D620: "LVT",
-    0x0D621: "LVT",
-    0x0D622: "LVT",
-    0x0D623: "LVT",
-    0x0D624: "LVT",
-    0x0D625: "LVT",
-    0x0D626: "LVT",
-    0x0D627: "LVT",
-    0x0D628: "LVT",
-    0x0D629: "LVT",
-    0x0D62A: "LVT",
-    0x0D62B: "LVT",
-    0x0D62C: "LVT",
-    0x0D62D: "LVT",
-    0x0D62E: "LVT",
-    0x0D62F: "LVT",
-    0x0D630: "LVT",
-    0x0D631: "LVT",
-    0x0D632: "LVT",
-    0x0D633: "LVT",
-    0x0D634: "LVT",
-    0x0D635: "LVT",
-    0x0D636: "LVT",
-    0x0D637: "LVT",
-    0x0D639: "LVT",
-    0x0D63A: "LVT",
-    0x0D63B: "LVT",
-    0x0D63C: "LVT",
-    0x0D63D: "LVT",
-    0x0D63E: "LVT",
-    0x0D63F: "LVT",
-    0x0D640: "LVT",
-    0x0D641: "LVT",
-    0x0D642: "LVT",
-    0x0D643: "LVT",
-    0x0D644: "LVT",
-    0x0D645: "LVT",
-    0x0D646: "LVT",
-    0x0D647: "LVT",
-    0x0D648: "LVT",
-    0x0D649: "LVT",
-    0x0D64A: "LVT",
-    0x0D64B: "LVT",
-    0x0D64C: "LVT",
-    0x0D64D: "LVT",
-    0x0D64E: "LVT",
-    0x0D64F: "LVT",
-    0x0D650: "LVT",
-    0x0D651: "LVT",
-    0x0D652: "LVT",
-    0x0D653: "LVT",
-    0x0D655: "LVT",
-    0x0D656: "LVT",
-    0x0D657: "LVT",
-    0x0D658: "LVT",
-    0x0D659: "LVT",
-    0x0D65A: "LVT",
-    0x0D65B: "LVT",
-    0x0D65C: "LVT",
-    0x0D65D: "LVT",
-    0x0D65E: "LVT",
-    0x0D65F: "LVT",
-    0x0D660: "LVT",
-    0x0D661: "LVT",
-    0x0D662: "LVT",
-    0x0D663: "LVT",
-    0x0D664: "LVT",
-    0x0D665: "LVT",
-    0x0D666: "LVT",
-    0x0D667: "LVT",
-    0x0D668: "LVT",
-    0x0D669: "LVT",
-    0x0D66A: "LVT",
-    0x0D66B: "LVT",
-    0x0D66C: "LVT",
-    0x0D66D: "LVT",
-    0x0D66E: "LVT",
-    0x0D66F: "LVT",
-    0x0D671: "LVT",
-    0x0D672: "LVT",
-    0x0D673: "LVT",
-    0x0D674: "LVT",
-    0x0D675: "LVT",
-    0x0D676: "LVT",
-    0x0D677: "LVT",
-    0x0D678: "LVT",
-    0x0D679: "LVT",
-    0x0D67A: "LVT",
-    0x0D67B: "LVT",
-    0x0D67C: "LVT",
-    0x0D67D: "LVT",
-    0x0D67E: "LVT",
-    0x0D67F: "LVT",
-    0x0D680: "LVT",
-    0x0D681: "LVT",
-    0x0D682: "LVT",
-    0x0D683: "LVT",
-    0x0D684: "LVT",
-    0x0D685: "LVT",
-    0x0D686: "LVT",
-    0x0D687: "LVT",
-    0x0D688: "LVT",
-    0x0D689: "LVT",
-    0x0D68A: "LVT",
-    0x0D68B: "LVT",
-    0x0D68D: "LVT",
-    0x0D68E: "LVT",
-    0x0D68F: "LVT",
-    0x0D690: "LVT",
-    0x0D691: "LVT",
-    0x0D692: "LVT",
-    0x0D693: "LVT",
-    0x0D694: "LVT",
-    0x0D695: "LVT",
-    0x0D696: "LVT",
-    0x0D697: "LVT",
-    0x0D698: "LVT",
-    0x0D699: "LVT",
-    0x0D69A: "LVT",
-    0x0D69B: "LVT",
-    0x0D69C: "LVT",
-    0x0D69D: "LVT",
-    0x0D69E: "LVT",
-    0x0D69F: "LVT",
-    0x0D6A0: "LVT",
-    0x0D6A1: "LVT",
-    0x0D6A2: "LVT",
-    0x0D6A3: "LVT",
-    0x0D6A4: "LVT",
-    0x0D6A5: "LVT",
-    0x0D6A6: "LVT",
-    0x0D6A7: "LVT",
-    0x0D6A9: "LVT",
-    0x0D6AA: "LVT",
-    0x0D6AB: "LVT",
-    0x0D6AC: "LVT",
-    0x0D6AD: "LVT",
-    0x0D6AE: "LVT",
-    0x0D6AF: "LVT",
-    0x0D6B0: "LVT",
-    0x0D6B1: "LVT",
-    0x0D6B2: "LVT",
-    0x0D6B3: "LVT",
-    0x0D6B4: "LVT",
-    0x0D6B5: "LVT",
-    0x0D6B6: "LVT",
-    0x0D6B7: "LVT",
-    0x0D6B8: "LVT",
-    0x0D6B9: "LVT",
-    0x0D6BA: "LVT",
-    0x0D6BB: "LVT",
-    0x0D6BC: "LVT",
-    0x0D6BD: "LVT",
-    0x0D6BE: "LVT",
-    0x0D6BF: "LVT",
-    0x0D6C0: "LVT",
-    0x0D6C1: "LVT",
-    0x0D6C2: "LVT",
-    0x0D6C3: "LVT",
-    0x0D6C5: "LVT",
-    0x0D6C6: "LVT",
-    0x0D6C7: "LVT",
-    0x0D6C8: "LVT",
-    0x0D6C9: "LVT",
-    0x0D6CA: "LVT",
-    0x0D6CB: "LVT",
-    0x0D6CC: "LVT",
-    0x0D6CD: "LVT",
-    0x0D6CE: "LVT",
-    0x0D6CF: "LVT",
-    0x0D6D0: "LVT",
-    0x0D6D1: "LVT",
-    0x0D6D2: "LVT",
-    0x0D6D3: "LVT",
-    0x0D6D4: "LVT",
-    0x0D6D5: "LVT",
-    0x0D6D6: "LVT",
-    0x0D6D7: "LVT",
-    0x0D6D8: "LVT",
-    0x0D6D9: "LVT",
-    0x0D6DA: "LVT",
-    0x0D6DB: "LVT",
-    0x0D6DC: "LVT",
-    0x0D6DD: "LVT",
-    0x0D6DE: "LVT",
-    0x0D6DF: "LVT",
-    0x0D6E1: "LVT",
-    0x0D6E2: "LVT",
-    0x0D6E3: "LVT",
-    0x0D6E4: "LVT",
-    0x0D6E5: "LVT",
-    0x0D6E6: "LVT",
-    0x0D6E7: "LVT",
-    0x0D6E8: "LVT",
-    0x0D6E9: "LVT",
-    0x0D6EA: "LVT",
-    0x0D6EB: "LVT",
-    0x0D6EC: "LVT",
-    0x0D6ED: "LVT",
-    0x0D6EE: "LVT",
-    0x0D6EF: "LVT",
-    0x0D6F0: "LVT",
-    0x0D6F1: "LVT",
-    0x0D6F2: "LVT",
-    0x0D6F3: "LVT",
-    0x0D6F4: "LVT",
-    0x0D6F5: "LVT",
-    0x0D6F6: "LVT",
-    0x0D6F7: "LVT",
-    0x0D6F8: "LVT",
-    0x0D6F9: "LVT",
-    0x0D6FA: "LVT",
-    0x0D6FB: "LVT",
-    0x0D6FD: "LVT",
-    0x0D6FE: "LVT",
-    0x0D6FF: "LVT",
-    0x0D700: "LVT",
-    0x0D701: "LVT",
-    0x0D702: "LVT",
-    0x0D703: "LVT",
-    0x0D704: "LVT",
-    0x0D705: "LVT",
-    0x0D706: "LVT",
-    0x0D707: "LVT",
-    0x0D708: "LVT",
-    0x0D709: "LVT",
-    0x0D70A: "LVT",
-    0x0D70B: "LVT",
-    0x0D70C: "LVT",
-    0x0D70D: "LVT",
-    0x0D70E: "LVT",
-    0x0D70F: "LVT",
-    0x0D710: "LVT",
-    0x0D711: "LVT",
-    0x0D712: "LVT",
-    0x0D713: "LVT",
-    0x0D714: "LVT",
-    0x0D715: "LVT",
-    0x0D716: "LVT",
-    0x0D717: "LVT",
-    0x0D719: "LVT",
-    0x0D71A: "LVT",
-    0x0D71B: "LVT",
-    0x0D71C: "LVT",
-    0x0D71D: "LVT",
-    0x0D71E: "LVT",
-    0x0D71F: "LVT",
-    0x0D720: "LVT",
-    0x0D721: "LVT",
-    0x0D722: "LVT",
-    0x0D723: "LVT",
-    0x0D724: "LVT",
-    0x0D725: "LVT",
-    0x0D726: "LVT",
-    0x0D727: "LVT",
-    0x0D728: "LVT",
-    0x0D729: "LVT",
-    0x0D72A: "LVT",
-    0x0D72B: "LVT",
-    0x0D72C: "LVT",
-    0x0D72D: "LVT",
-    0x0D72E: "LVT",
-    0x0D72F: "LVT",
-    0x0D730: "LVT",
-    0x0D731: "LVT",
-    0x0D732: "LVT",
-    0x0D733: "LVT",
-    0x0D735: "LVT",
-    0x0D736: "LVT",
-    0x0D737: "LVT",
-    0x0D738: "LVT",
-    0x0D739: "LVT",
-    0x0D73A: "LVT",
-    0x0D73B: "LVT",
-    0x0D73C: "LVT",
-    0x0D73D: "LVT",
-    0x0D73E: "LVT",
-    0x0D73F: "LVT",
-    0x0D740: "LVT",
-    0x0D741: "LVT",
-    0x0D742: "LVT",
-    0x0D743: "LVT",
-    0x0D744: "LVT",
-    0x0D745: "LVT",
-    0x0D746: "LVT",
-    0x0D747: "LVT",
-    0x0D748: "LVT",
-    0x0D749: "LVT",
-    0x0D74A: "LVT",
-    0x0D74B: "LVT",
-    0x0D74C: "LVT",
-    0x0D74D: "LVT",
-    0x0D74E: "LVT",
-    0x0D74F: "LVT",
-    0x0D751: "LVT",
-    0x0D752: "LVT",
-    0x0D753: "LVT",
-    0x0D754: "LVT",
-    0x0D755: "LVT",
-    0x0D756: "LVT",
-    0x0D757: "LVT",
-    0x0D758: "LVT",
-    0x0D759: "LVT",
-    0x0D75A: "LVT",
-    0x0D75B: "LVT",
-    0x0D75C: "LVT",
-    0x0D75D: "LVT",
-    0x0D75E: "LVT",
-    0x0D75F: "LVT",
-    0x0D760: "LVT",
-    0x0D761: "LVT",
-    0x0D762: "LVT",
-    0x0D763: "LVT",
-    0x0D764: "LVT",
-    0x0D765: "LVT",
-    0x0D766: "LVT",
-    0x0D767: "LVT",
-    0x0D768: "LVT",
-    0x0D769: "LVT",
-    0x0D76A: "LVT",
-    0x0D76B: "LVT",
-    0x0D76D: "LVT",
-    0x0D76E: "LVT",
-    0x0D76F: "LVT",
-    0x0D770: "LVT",
-    0x0D771: "LVT",
-    0x0D772: "LVT",
-    0x0D773: "LVT",
-    0x0D774: "LVT",
-    0x0D775: "LVT",
-    0x0D776: "LVT",
-    0x0D777: "LVT",
-    0x0D778: "LVT",
-    0x0D779: "LVT",
-    0x0D77A: "LVT",
-    0x0D77B: "LVT",
-    0x0D77C: "LVT",
-    0x0D77D: "LVT",
-    0x0D77E: "LVT",
-    0x0D77F: "LVT",
-    0x0D780: "LVT",
-    0x0D781: "LVT",
-    0x0D782: "LVT",
-    0x0D783: "LVT",
-    0x0D784: "LVT",
-    0x0D785: "LVT",
-    0x0D786: "LVT",
-    0x0D787: "LVT",
-    0x0D789: "LVT",
-    0x0D78A: "LVT",
-    0x0D78B: "LVT",
-    0x0D78C: "LVT",
-    0x0D78D: "LVT",
-    0x0D78E: "LVT",
-    0x0D78F: "LVT",
-    0x0D790: "LVT",
-    0x0D791: "LVT",
-    0x0D792: "LVT",
-    0x0D793: "LVT",
-    0x0D794: "LVT",
-    0x0D795: "LVT",
-    0x0D796: "LVT",
-    0x0D797: "LVT",
-    0x0D798: "LVT",
-    0x0D799: "LVT",
-    0x0D79A: "LVT",
-    0x0D79B: "LVT",
-    0x0D79C: "LVT",
-    0x0D79D: "LVT",
-    0x0D79E: "LVT",
-    0x0D79F: "LVT",
-    0x0D7A0: "LVT",
-    0x0D7A1: "LVT",
-    0x0D7A2: "LVT",
-    0x0D7A3: "LVT",
-    0x0200D: "ZWJ",
-}
+# Classes of code points distinguished by the segmentation algorithm (the
+# grapheme cluster break property values, Extended_Pictographic, and the
+# Indic_Conjunct_Break property values used by rule GB9c); code points are
+# mapped to indices into this tuple
+_CLASSES = (
+    "Other",
+    "CR",
+    "LF",
+    "Control",
+    "Extend",
+    "Regional_Indicator",
+    "Prepend",
+    "SpacingMark",
+    "L",
+    "V",
+    "T",
+    "LV",
+    "LVT",
+    "Extended_Pictographic",
+    "ZWJ",
+    "InCB_Consonant",
+    "InCB_Linker",
+    "InCB_Extend",
+)
 
-# [\p{Extended_Pictographic}]
-# Source: emoji-data.txt
-_EXT_PICTOGR = [
-           0x000A9,
-           0x000AE,
-           0x0203C,
-           0x02049,
-           0x02122,
-           0x02139,
-    *range(0x02194, 0x02199 + 1),
-    *range(0x021A9, 0x021AA + 1),
-    *range(0x0231A, 0x0231B + 1),
-           0x02328,
-           0x02388,
-           0x023CF,
-    *range(0x023E9, 0x023EC + 1),
-    *range(0x023ED, 0x023EE + 1),
-           0x023EF,
-           0x023F0,
-    *range(0x023F1, 0x023F2 + 1),
-           0x023F3,
-    *range(0x023F8, 0x023FA + 1),
-           0x024C2,
-    *range(0x025AA, 0x025AB + 1),
-           0x025B6,
-           0x025C0,
-    *range(0x025FB, 0x025FE + 1),
-    *range(0x02600, 0x02601 + 1),
-    *range(0x02602, 0x02603 + 1),
-           0x02604,
-           0x02605,
-    *range(0x02607, 0x0260D + 1),
-           0x0260E,
-    *range(0x0260F, 0x02610 + 1),
-           0x02611,
-           0x02612,
-    *range(0x02614, 0x02615 + 1),
-    *range(0x02616, 0x02617 + 1),
-           0x02618,
-    *range(0x02619, 0x0261C + 1),
-           0x0261D,
-    *range(0x0261E, 0x0261F + 1),
-           0x02620,
-           0x02621,
-    *range(0x02622, 0x02623 + 1),
-    *range(0x02624, 0x02625 + 1),
-           0x02626,
-    *range(0x02627, 0x02629 + 1),
-           0x0262A,
-    *range(0x0262B, 0x0262D + 1),
-           0x0262E,
-           0x0262F,
-    *range(0x02630, 0x02637 + 1),
-    *range(0x02638, 0x02639 + 1),
-           0x0263A,
-    *range(0x0263B, 0x0263F + 1),
-           0x02640,
-           0x02641,
-           0x02642,
-    *range(0x02643, 0x02647 + 1),
-    *range(0x02648, 0x02653 + 1),
-    *range(0x02654, 0x0265E + 1),
-           0x0265F,
-           0x02660,
-    *range(0x02661, 0x02662 + 1),
-           0x02663,
-           0x02664,
-    *range(0x02665, 0x02666 + 1),
-           0x02667,
-           0x02668,
-    *range(0x02669, 0x0267A + 1),
-           0x0267B,
-    *range(0x0267C, 0x0267D + 1),
-           0x0267E,
-           0x0267F,
-    *range(0x02680, 0x02685 + 1),
-    *range(0x02690, 0x02691 + 1),
-           0x02692,
-           0x02693,
-           0x02694,
-           0x02695,
-    *range(0x02696, 0x02697 + 1),
-           0x02698,
-           0x02699,
-           0x0269A,
-    *range(0x0269B, 0x0269C + 1),
-    *range(0x0269D, 0x0269F + 1),
-    *range(0x026A0, 0x026A1 + 1),
-    *range(0x026A2, 0x026A6 + 1),
-           0x026A7,
-    *range(0x026A8, 0x026A9 + 1),
-    *range(0x026AA, 0x026AB + 1),
-    *range(0x026AC, 0x026AF + 1),
-    *range(0x026B0, 0x026B1 + 1),
-    *range(0x026B2, 0x026BC + 1),
-    *range(0x026BD, 0x026BE + 1),
-    *range(0x026BF, 0x026C3 + 1),
-    *range(0x026C4, 0x026C5 + 1),
-    *range(0x026C6, 0x026C7 + 1),
-           0x026C8,
-    *range(0x026C9, 0x026CD + 1),
-           0x026CE,
-           0x026CF,
-           0x026D0,
-           0x026D1,
-           0x026D2,
-           0x026D3,
-           0x026D4,
-    *range(0x026D5, 0x026E8 + 1),
-           0x026E9,
-           0x026EA,
-    *range(0x026EB, 0x026EF + 1),
-    *range(0x026F0, 0x026F1 + 1),
-    *range(0x026F2, 0x026F3 + 1),
-           0x026F4,
-           0x026F5,
-           0x026F6,
-    *range(0x026F7, 0x026F9 + 1),
-           0x026FA,
-    *range(0x026FB, 0x026FC + 1),
-           0x026FD,
-    *range(0x026FE, 0x02701 + 1),
-           0x02702,
-    *range(0x02703, 0x02704 + 1),
-           0x02705,
-    *range(0x02708, 0x0270C + 1),
-           0x0270D,
-           0x0270E,
-           0x0270F,
-    *range(0x02710, 0x02711 + 1),
-           0x02712,
-           0x02714,
-           0x02716,
-           0x0271D,
-           0x02721,
-           0x02728,
-    *range(0x02733, 0x02734 + 1),
-           0x02744,
-           0x02747,
-           0x0274C,
-           0x0274E,
-    *range(0x02753, 0x02755 + 1),
-           0x02757,
-           0x02763,
-           0x02764,
-    *range(0x02765, 0x02767 + 1),
-    *range(0x02795, 0x02797 + 1),
-           0x027A1,
-           0x027B0,
-           0x027BF,
-    *range(0x02934, 0x02935 + 1),
-    *range(0x02B05, 0x02B07 + 1),
-    *range(0x02B1B, 0x02B1C + 1),
-           0x02B50,
-           0x02B55,
-           0x03030,
-           0x0303D,
-           0x03297,
-           0x03299,
-    *range(0x1F000, 0x1F003 + 1),
-           0x1F004,
-    *range(0x1F005, 0x1F0CE + 1),
-           0x1F0CF,
-    *range(0x1F0D0, 0x1F0FF + 1),
-    *range(0x1F10D, 0x1F10F + 1),
-           0x1F12F,
-    *range(0x1F16C, 0x1F16F + 1),
-    *range(0x1F170, 0x1F171 + 1),
-    *range(0x1F17E, 0x1F17F + 1),
-           0x1F18E,
-    *range(0x1F191, 0x1F19A + 1),
-    *range(0x1F1AD, 0x1F1E5 + 1),
-    *range(0x1F201, 0x1F202 + 1),
-    *range(0x1F203, 0x1F20F + 1),
-           0x1F21A,
-           0x1F22F,
-    *range(0x1F232, 0x1F23A + 1),
-    *range(0x1F23C, 0x1F23F + 1),
-    *range(0x1F249, 0x1F24F + 1),
-    *range(0x1F250, 0x1F251 + 1),
-    *range(0x1F252, 0x1F2FF + 1),
-    *range(0x1F300, 0x1F30C + 1),
-    *range(0x1F30D, 0x1F30E + 1),
-           0x1F30F,
-           0x1F310,
-           0x1F311,
-           0x1F312,
-    *range(0x1F313, 0x1F315 + 1),
-    *range(0x1F316, 0x1F318 + 1),
-           0x1F319,
-           0x1F31A,
-           0x1F31B,
-           0x1F31C,
-    *range(0x1F31D, 0x1F31E + 1),
-    *range(0x1F31F, 0x1F320 + 1),
-           0x1F321,
-    *range(0x1F322, 0x1F323 + 1),
-    *range(0x1F324, 0x1F32C + 1),
-    *range(0x1F32D, 0x1F32F + 1),
-    *range(0x1F330, 0x1F331 + 1),
-    *range(0x1F332, 0x1F333 + 1),
-    *range(0x1F334, 0x1F335 + 1),
-           0x1F336,
-    *range(0x1F337, 0x1F34A + 1),
-           0x1F34B,
-    *range(0x1F34C, 0x1F34F + 1),
-           0x1F350,
-    *range(0x1F351, 0x1F37B + 1),
-           0x1F37C,
-           0x1F37D,
-    *range(0x1F37E, 0x1F37F + 1),
-    *range(0x1F380, 0x1F393 + 1),
-    *range(0x1F394, 0x1F395 + 1),
-    *range(0x1F396, 0x1F397 + 1),
-           0x1F398,
-    *range(0x1F399, 0x1F39B + 1),
-    *range(0x1F39C, 0x1F39D + 1),
-    *range(0x1F39E, 0x1F39F + 1),
-    *range(0x1F3A0, 0x1F3C4 + 1),
-           0x1F3C5,
-           0x1F3C6,
-           0x1F3C7,
-           0x1F3C8,
-           0x1F3C9,
-           0x1F3CA,
-    *range(0x1F3CB, 0x1F3CE + 1),
-    *range(0x1F3CF, 0x1F3D3 + 1),
-    *range(0x1F3D4, 0x1F3DF + 1),
-    *range(0x1F3E0, 0x1F3E3 + 1),
-           0x1F3E4,
-    *range(0x1F3E5, 0x1F3F0 + 1),
-    *range(0x1F3F1, 0x1F3F2 + 1),
-           0x1F3F3,
-           0x1F3F4,
-           0x1F3F5,
-           0x1F3F6,
-           0x1F3F7,
-    *range(0x1F3F8, 0x1F3FA + 1),
-    *range(0x1F400, 0x1F407 + 1),
-           0x1F408,
-    *range(0x1F409, 0x1F40B + 1),
-    *range(0x1F40C, 0x1F40E + 1),
-    *range(0x1F40F, 0x1F410 + 1),
-    *range(0x1F411, 0x1F412 + 1),
-           0x1F413,
-           0x1F414,
-           0x1F415,
-           0x1F416,
-    *range(0x1F417, 0x1F429 + 1),
-           0x1F42A,
-    *range(0x1F42B, 0x1F43E + 1),
-           0x1F43F,
-           0x1F440,
-           0x1F441,
-    *range(0x1F442, 0x1F464 + 1),
-           0x1F465,
-    *range(0x1F466, 0x1F46B + 1),
-    *range(0x1F46C, 0x1F46D + 1),
-    *range(0x1F46E, 0x1F4AC + 1),
-           0x1F4AD,
-    *range(0x1F4AE, 0x1F4B5 + 1),
-    *range(0x1F4B6, 0x1F4B7 + 1),
-    *range(0x1F4B8, 0x1F4EB + 1),
-    *range(0x1F4EC, 0x1F4ED + 1),
-           0x1F4EE,
-           0x1F4EF,
-    *range(0x1F4F0, 0x1F4F4 + 1),
-           0x1F4F5,
-    *range(0x1F4F6, 0x1F4F7 + 1),
-           0x1F4F8,
-    *range(0x1F4F9, 0x1F4FC + 1),
-           0x1F4FD,
-           0x1F4FE,
-    *range(0x1F4FF, 0x1F502 + 1),
-           0x1F503,
-    *range(0x1F504, 0x1F507 + 1),
-           0x1F508,
-           0x1F509,
-    *range(0x1F50A, 0x1F514 + 1),
-           0x1F515,
-    *range(0x1F516, 0x1F52B + 1),
-    *range(0x1F52C, 0x1F52D + 1),
-    *range(0x1F52E, 0x1F53D + 1),
-    *range(0x1F546, 0x1F548 + 1),
-    *range(0x1F549, 0x1F54A + 1),
-    *range(0x1F54B, 0x1F54E + 1),
-           0x1F54F,
-    *range(0x1F550, 0x1F55B + 1),
-    *range(0x1F55C, 0x1F567 + 1),
-    *range(0x1F568, 0x1F56E + 1),
-    *range(0x1F56F, 0x1F570 + 1),
-    *range(0x1F571, 0x1F572 + 1),
-    *range(0x1F573, 0x1F579 + 1),
-           0x1F57A,
-    *range(0x1F57B, 0x1F586 + 1),
-           0x1F587,
-    *range(0x1F588, 0x1F589 + 1),
-    *range(0x1F58A, 0x1F58D + 1),
-    *range(0x1F58E, 0x1F58F + 1),
-           0x1F590,
-    *range(0x1F591, 0x1F594 + 1),
-    *range(0x1F595, 0x1F596 + 1),
-    *range(0x1F597, 0x1F5A3 + 1),
-           0x1F5A4,
-           0x1F5A5,
-    *range(0x1F5A6, 0x1F5A7 + 1),
-           0x1F5A8,
-    *range(0x1F5A9, 0x1F5B0 + 1),
-    *range(0x1F5B1, 0x1F5B2 + 1),
-    *range(0x1F5B3, 0x1F5BB + 1),
-           0x1F5BC,
-    *range(0x1F5BD, 0x1F5C1 + 1),
-    *range(0x1F5C2, 0x1F5C4 + 1),
-    *range(0x1F5C5, 0x1F5D0 + 1),
-    *range(0x1F5D1, 0x1F5D3 + 1),
-    *range(0x1F5D4, 0x1F5DB + 1),
-    *range(0x1F5DC, 0x1F5DE + 1),
-    *range(0x1F5DF, 0x1F5E0 + 1),
-           0x1F5E1,
-           0x1F5E2,
-           0x1F5E3,
-    *range(0x1F5E4, 0x1F5E7 + 1),
-           0x1F5E8,
-    *range(0x1F5E9, 0x1F5EE + 1),
-           0x1F5EF,
-    *range(0x1F5F0, 0x1F5F2 + 1),
-           0x1F5F3,
-    *range(0x1F5F4, 0x1F5F9 + 1),
-           0x1F5FA,
-    *range(0x1F5FB, 0x1F5FF + 1),
-           0x1F600,
-    *range(0x1F601, 0x1F606 + 1),
-    *range(0x1F607, 0x1F608 + 1),
-    *range(0x1F609, 0x1F60D + 1),
-           0x1F60E,
-           0x1F60F,
-           0x1F610,
-           0x1F611,
-    *range(0x1F612, 0x1F614 + 1),
-           0x1F615,
-           0x1F616,
-           0x1F617,
-           0x1F618,
-           0x1F619,
-           0x1F61A,
-           0x1F61B,
-    *range(0x1F61C, 0x1F61E + 1),
-           0x1F61F,
-    *range(0x1F620, 0x1F625 + 1),
-    *range(0x1F626, 0x1F627 + 1),
-    *range(0x1F628, 0x1F62B + 1),
-           0x1F62C,
-           0x1F62D,
-    *range(0x1F62E, 0x1F62F + 1),
-    *range(0x1F630, 0x1F633 + 1),
-           0x1F634,
-           0x1F635,
-           0x1F636,
-    *range(0x1F637, 0x1F640 + 1),
-    *range(0x1F641, 0x1F644 + 1),
-    *range(0x1F645, 0x1F64F + 1),
-           0x1F680,
-    *range(0x1F681, 0x1F682 + 1),
-    *range(0x1F683, 0x1F685 + 1),
-           0x1F686,
-           0x1F687,
-           0x1F688,
-           0x1F689,
-    *range(0x1F68A, 0x1F68B + 1),
-           0x1F68C,
-           0x1F68D,
-           0x1F68E,
-           0x1F68F,
-           0x1F690,
-    *range(0x1F691, 0x1F693 + 1),
-           0x1F694,
-           0x1F695,
-           0x1F696,
-           0x1F697,
-           0x1F698,
-    *range(0x1F699, 0x1F69A + 1),
-    *range(0x1F69B, 0x1F6A1 + 1),
-           0x1F6A2,
-           0x1F6A3,
-    *range(0x1F6A4, 0x1F6A5 + 1),
-           0x1F6A6,
-    *range(0x1F6A7, 0x1F6AD + 1),
-    *range(0x1F6AE, 0x1F6B1 + 1),
-           0x1F6B2,
-    *range(0x1F6B3, 0x1F6B5 + 1),
-           0x1F6B6,
-    *range(0x1F6B7, 0x1F6B8 + 1),
-    *range(0x1F6B9, 0x1F6BE + 1),
-           0x1F6BF,
-           0x1F6C0,
-    *range(0x1F6C1, 0x1F6C5 + 1),
-    *range(0x1F6C6, 0x1F6CA + 1),
-           0x1F6CB,
-           0x1F6CC,
-    *range(0x1F6CD, 0x1F6CF + 1),
-           0x1F6D0,
-    *range(0x1F6D1, 0x1F6D2 + 1),
-    *range(0x1F6D3, 0x1F6D4 + 1),
-           0x1F6D5,
-    *range(0x1F6D6, 0x1F6D7 + 1),
-    *range(0x1F6D8, 0x1F6DB + 1),
-           0x1F6DC,
-    *range(0x1F6DD, 0x1F6DF + 1),
-    *range(0x1F6E0, 0x1F6E5 + 1),
-    *range(0x1F6E6, 0x1F6E8 + 1),
-           0x1F6E9,
-           0x1F6EA,
-    *range(0x1F6EB, 0x1F6EC + 1),
-    *range(0x1F6ED, 0x1F6EF + 1),
-           0x1F6F0,
-    *range(0x1F6F1, 0x1F6F2 + 1),
-           0x1F6F3,
-    *range(0x1F6F4, 0x1F6F6 + 1),
-    *range(0x1F6F7, 0x1F6F8 + 1),
-           0x1F6F9,
-           0x1F6FA,
-    *range(0x1F6FB, 0x1F6FC + 1),
-    *range(0x1F6FD, 0x1F6FF + 1),
-    *range(0x1F774, 0x1F77F + 1),
-    *range(0x1F7D5, 0x1F7DF + 1),
-    *range(0x1F7E0, 0x1F7EB + 1),
-    *range(0x1F7EC, 0x1F7EF + 1),
-           0x1F7F0,
-    *range(0x1F7F1, 0x1F7FF + 1),
-    *range(0x1F80C, 0x1F80F + 1),
-    *range(0x1F848, 0x1F84F + 1),
-    *range(0x1F85A, 0x1F85F + 1),
-    *range(0x1F888, 0x1F88F + 1),
-    *range(0x1F8AE, 0x1F8FF + 1),
-           0x1F90C,
-    *range(0x1F90D, 0x1F90F + 1),
-    *range(0x1F910, 0x1F918 + 1),
-    *range(0x1F919, 0x1F91E + 1),
-           0x1F91F,
-    *range(0x1F920, 0x1F927 + 1),
-    *range(0x1F928, 0x1F92F + 1),
-           0x1F930,
-    *range(0x1F931, 0x1F932 + 1),
-    *range(0x1F933, 0x1F93A + 1),
-    *range(0x1F93C, 0x1F93E + 1),
-           0x1F93F,
-    *range(0x1F940, 0x1F945 + 1),
-    *range(0x1F947, 0x1F94B + 1),
-           0x1F94C,
-    *range(0x1F94D, 0x1F94F + 1),
-    *range(0x1F950, 0x1F95E + 1),
-    *range(0x1F95F, 0x1F96B + 1),
-    *range(0x1F96C, 0x1F970 + 1),
-           0x1F971,
-           0x1F972,
-    *range(0x1F973, 0x1F976 + 1),
-    *range(0x1F977, 0x1F978 + 1),
-           0x1F979,
-           0x1F97A,
-           0x1F97B,
-    *range(0x1F97C, 0x1F97F + 1),
-    *range(0x1F980, 0x1F984 + 1),
-    *range(0x1F985, 0x1F991 + 1),
-    *range(0x1F992, 0x1F997 + 1),
-    *range(0x1F998, 0x1F9A2 + 1),
-    *range(0x1F9A3, 0x1F9A4 + 1),
-    *range(0x1F9A5, 0x1F9AA + 1),
-    *range(0x1F9AB, 0x1F9AD + 1),
-    *range(0x1F9AE, 0x1F9AF + 1),
-    *range(0x1F9B0, 0x1F9B9 + 1),
-    *range(0x1F9BA, 0x1F9BF + 1),
-           0x1F9C0,
-    *range(0x1F9C1, 0x1F9C2 + 1),
-    *range(0x1F9C3, 0x1F9CA + 1),
-           0x1F9CB,
-           0x1F9CC,
-    *range(0x1F9CD, 0x1F9CF + 1),
-    *range(0x1F9D0, 0x1F9E6 + 1),
-    *range(0x1F9E7, 0x1F9FF + 1),
-    *range(0x1FA00, 0x1FA6F + 1),
-    *range(0x1FA70, 0x1FA73 + 1),
-           0x1FA74,
-    *range(0x1FA75, 0x1FA77 + 1),
-    *range(0x1FA78, 0x1FA7A + 1),
-    *range(0x1FA7B, 0x1FA7C + 1),
-    *range(0x1FA7D, 0x1FA7F + 1),
-    *range(0x1FA80, 0x1FA82 + 1),
-    *range(0x1FA83, 0x1FA86 + 1),
-    *range(0x1FA87, 0x1FA88 + 1),
-           0x1FA89,
-    *range(0x1FA8A, 0x1FA8E + 1),
-           0x1FA8F,
-    *range(0x1FA90, 0x1FA95 + 1),
-    *range(0x1FA96, 0x1FAA8 + 1),
-    *range(0x1FAA9, 0x1FAAC + 1),
-    *range(0x1FAAD, 0x1FAAF + 1),
-    *range(0x1FAB0, 0x1FAB6 + 1),
-    *range(0x1FAB7, 0x1FABA + 1),
-    *range(0x1FABB, 0x1FABD + 1),
-           0x1FABE,
-           0x1FABF,
-    *range(0x1FAC0, 0x1FAC2 + 1),
-    *range(0x1FAC3, 0x1FAC5 + 1),
-           0x1FAC6,
-    *range(0x1FAC7, 0x1FACD + 1),
-    *range(0x1FACE, 0x1FACF + 1),
-    *range(0x1FAD0, 0x1FAD6 + 1),
-    *range(0x1FAD7, 0x1FAD9 + 1),
-    *range(0x1FADA, 0x1FADB + 1),
-           0x1FADC,
-    *range(0x1FADD, 0x1FADE + 1),
-           0x1FADF,
-    *range(0x1FAE0, 0x1FAE7 + 1),
-           0x1FAE8,
-           0x1FAE9,
-    *range(0x1FAEA, 0x1FAEF + 1),
-    *range(0x1FAF0, 0x1FAF6 + 1),
-    *range(0x1FAF7, 0x1FAF8 + 1),
-    *range(0x1FAF9, 0x1FAFF + 1),
-    *range(0x1FC00, 0x1FFFD + 1),
-]
+# Two-stage lookup table mapping code points to their classes:
+#   _STAGE2[_STAGE1[cp >> _SHIFT] << _SHIFT | cp & _MASK]
+# Sources: GraphemeBreakProperty.txt, emoji-data.txt, DerivedCoreProperties.txt
+_SHIFT = 7
+_MASK = 127
 
-# [\p{InCB=Consonant}]
-# Source: DerivedCoreProperties.txt
-_INCB_CONSONANT = "".join(map(chr, [
-    *range(0x00915, 0x00939 + 1),
-    *range(0x00958, 0x0095F + 1),
-    *range(0x00978, 0x0097F + 1),
-    *range(0x00995, 0x009A8 + 1),
-    *range(0x009AA, 0x009B0 + 1),
-           0x009B2,
-    *range(0x009B6, 0x009B9 + 1),
-    *range(0x009DC, 0x009DD + 1),
-           0x009DF,
-    *range(0x009F0, 0x009F1 + 1),
-    *range(0x00A95, 0x00AA8 + 1),
-    *range(0x00AAA, 0x00AB0 + 1),
-    *range(0x00AB2, 0x00AB3 + 1),
-    *range(0x00AB5, 0x00AB9 + 1),
-           0x00AF9,
-    *range(0x00B15, 0x00B28 + 1),
-    *range(0x00B2A, 0x00B30 + 1),
-    *range(0x00B32, 0x00B33 + 1),
-    *range(0x00B35, 0x00B39 + 1),
-    *range(0x00B5C, 0x00B5D + 1),
-           0x00B5F,
-           0x00B71,
-    *range(0x00C15, 0x00C28 + 1),
-    *range(0x00C2A, 0x00C39 + 1),
-    *range(0x00C58, 0x00C5A + 1),
-    *range(0x00D15, 0x00D3A + 1),
-]))
+_STAGE1 = bytes.fromhex(
+    "000102020202030202040205060708090a0b0c0d0e0f10111213141516171819"
+    "1a1b1c1d02021e020202020202021f2021222302242526272829022a02020202"
+    "2b2c2d2e02022f300231023233343536020237020202380202393a3b02020202"
+    "3c3d0202023e0202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202023f400202414243444546024748494a4b4c4d4e48"
+    "494a4b4c4d4e48494a4b4c4d4e48494a4b4c4d4e48494a4b4c4d4e48494a4b4c"
+    "4d4e48494a4b4c4d4e48494a4b4c4d4e48494a4b4c4d4e48494a4b4c4d4e4849"
+    "4a4b4c4d4e48494a4b4c4d4e48494a4f02020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020250020202020251520253"
+    "02020254025556020202020202020202020202025758020202025902025a5b5c"
+    "5d5e5f60616263646566026768696a026b026c6d6e6f02027071727302747502"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202760202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "02027702020202020202020202020202020202020278790202027a0202027b7c"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "020202020202020202020202020202020202020202020202027d020202020202"
+    "0202020202020202020202020202020202020202020202020202020202027e02"
+    "02027f8081020202020202020202020202020202828302020202020202020202"
+    "8485790202860202028702880202020202898a02020202020202020202020202"
+    "8b8b8c8d8e8b8b8f8b8b908b918b92939495968b8b8b02028b8b8b8b8b8b8b97"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "98999a9b99999999999999999999999999999999999999999999999999999999"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+    "0202020202020202020202020202020202020202020202020202020202020202"
+)
 
-# [\p{InCB=Linker}]
-# Source: DerivedCoreProperties.txt
-_INCB_LINKER = "".join(map(chr, [
-    0x0094D,
-    0x009CD,
-    0x00ACD,
-    0x00B4D,
-    0x00C4D,
-    0x00D4D,
-]))
+_STAGE2 = bytes.fromhex(
+    "0303030303030303030302030301030303030303030303030303030303030303"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000003"
+    "0303030303030303030303030303030303030303030303030303030303030303"
+    "0000000000000000000d000000030d0000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111100000000000000000000000000000000"
+    "0000001111111111111100000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111110011"
+    "0011110011110011000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0606060606060000000000000000000011111111111111111111110003000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000111111111111111111111111111111111111111111"
+    "0000000000000000000000000000000011000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000011111111111111060011"
+    "1111111111000011110011111111000000000000000000000000000000000000"
+    "0000000000000000000000000000000600110000000000000000000000000000"
+    "0000000000000000000000000000000011111111111111111111111111111111"
+    "1111111111111111111111000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000001111111111111111111111000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000111111111111111111000000000000000000110000"
+    "0000000000000000000000000000000000000000000011111111001111111111"
+    "1111111100111111001111111111000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000011111100000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000006060000000000111111111111111111"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000011111111111111111111111111111111111111111111"
+    "1111061111111111111111111111111111111111111111111111111111111111"
+    "1111110700000000000000000000000000000000000f0f0f0f0f0f0f0f0f0f0f"
+    "0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f110711000707"
+    "0711111111111111110707070710070700111111111111110f0f0f0f0f0f0f0f"
+    "0000111100000000000000000000000000000000000000000f0f0f0f0f0f0f0f"
+    "0011070700000000000000000000000000000000000f0f0f0f0f0f0f0f0f0f0f"
+    "0f0f0f0f0f0f0f0f0f000f0f0f0f0f0f0f000f0000000f0f0f0f000011001107"
+    "071111111100000707000007071000000000000000000011000000000f0f000f"
+    "000011110000000000000000000000000f0f0000000000000000000000001100"
+    "0011110700000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000011000707"
+    "0711110000000011110000111111000000110000000000000000000000000000"
+    "0000000000000000000000000000000011110000001100000000000000000000"
+    "0011110700000000000000000000000000000000000f0f0f0f0f0f0f0f0f0f0f"
+    "0f0f0f0f0f0f0f0f0f000f0f0f0f0f0f0f000f0f000f0f0f0f0f000011000707"
+    "0711111111110011110700070710000000000000000000000000000000000000"
+    "000011110000000000000000000000000000000000000000000f111111111111"
+    "0011070700000000000000000000000000000000000f0f0f0f0f0f0f0f0f0f0f"
+    "0f0f0f0f0f0f0f0f0f000f0f0f0f0f0f0f000f0f000f0f0f0f0f000011001111"
+    "071111111100000707000007071000000000000000111111000000000f0f000f"
+    "00001111000000000000000000000000000f0000000000000000000000000000"
+    "0000110000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000001107"
+    "1107070000000707070007070711000000000000000000110000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1107070711000000000000000000000000000000000f0f0f0f0f0f0f0f0f0f0f"
+    "0f0f0f0f0f0f0f0f0f000f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f000011001111"
+    "1107070707001111110011111110000000000000001111000f0f0f0000000000"
+    "0000111100000000000000000000000000000000000000000000000000000000"
+    "0011070700000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000011000711"
+    "1107110707001111110011111111000000000000001111000000000000000000"
+    "0000111100000000000000000000000000000007000000000000000000000000"
+    "1111070700000000000000000000000000000000000f0f0f0f0f0f0f0f0f0f0f"
+    "0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f0f1111001107"
+    "0711111111000707070007070710060000000000000000110000000000000000"
+    "0000111100000000000000000000000000000000000000000000000000000000"
+    "0011070700000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000011000000001107071111110011000707070707070711"
+    "0000000000000000000000000000000000000707000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000110007111111111111110000000000"
+    "0000000000000011111111111111110000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000110007111111111111111111000000"
+    "0000000000000000111111111111110000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000001111000000000000"
+    "0000000000000000000000000000000000000000001100110011000000000707"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000111111111111111111111111111107"
+    "1111111111001111000000000011111111111111111111110011111111111111"
+    "1111111111111111111111111111111111111111111111111111111111000000"
+    "0000000000001100000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000011111111071111111111110011110707111100"
+    "0000000000000000000000000000000000000000000007071111000000001111"
+    "1100000000000000000000000000000000111111110000000000000000000000"
+    "0000110007111100000000000011000000000000000000000000000000110000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0808080808080808080808080808080808080808080808080808080808080808"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "0909090909090909090909090909090909090909090909090909090909090909"
+    "09090909090909090a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000111111"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000001111111100000000000000000000"
+    "0000000000000000000000000000000000001111110000000000000000000000"
+    "0000000000000000000000000000000000001111000000000000000000000000"
+    "0000000000000000000000000000000000001111000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000111107111111111111110707"
+    "0707070707071107071111111111111111111111000000000000000000110000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000111111031100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000111100000000000000000000000000000000000000000000000000"
+    "0000000000000000001100000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111110707070711110707070000000007071107070707070711111100000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000111107071100000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000711071111111111111100"
+    "1100110000111111111111111107070707070711111111111111111111000011"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011111111111111111111111111111111"
+    "1111111111111111111111111111110000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111107000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000111111111111111111110707"
+    "0707111111000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000111111111111111111000000000000000000000000"
+    "1111070000000000000000000000000000000000000000000000000000000000"
+    "0007111111110707111111111111000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000001107111107070711071111111111000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000007070707070707071111111111111111070711110000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011111100111111111111111111111111"
+    "1107111111111111110000000011000000000000110000071111000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "000000000000000000000003040e030300000000000000000000000000000000"
+    "000000000000000003030303030303000000000000000000000000000d000000"
+    "0000000000000000000d00000000000000000000000000000000000000000000"
+    "0303030303030303030303030303030300000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011111111111111111111111111111111"
+    "1111111111111111111111111111111111000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000d000000000000000000000000000000000000000000000d000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000000d0d0d0d0d0d000000000000"
+    "0000000000000000000d0d000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000000000000000000d0d00000000"
+    "00000000000000000d0000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000d0000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000d00000000000000000000000000000000"
+    "0000000000000000000d0d0d0d0d0d0d0d0d0d0d000000000d0d0d0000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000d0000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000d0d000000000000000000000d000000000000000000"
+    "0d00000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000d0d0d0d00"
+    "0d0d0d0d0d0d000d0d0d0d0d0d0d0d0d0d0d0d000d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d000000000000000000000d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d00000d0d0d0d0d0d0d0d0d0d0d000d000d0000000000000d0000"
+    "000d0000000000000d000000000000000000000d0d0000000000000000000000"
+    "000000000d00000d000000000d000d000000000d0d0d000d0000000000000000"
+    "0000000d0d0d0d0d000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000d0d0d0000000000000000"
+    "000d00000000000000000000000000000d00000000000000000000000000000d"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000000d0d00000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000d0d0d000000000000000000000000000000000000000d0d000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000d000000000d00000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000001111110000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000011"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000001111111111110d0000000000000000000000000d0000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000011110000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000000000000d000d000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000001111111100111111111111111111110000"
+    "0000000000000000000000000000000000000000000000000000000000001111"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011110000000000000000000000000000"
+    "0000110000001100000000110000000000000000000000000000000000000000"
+    "0000000707111107000000001100000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0707000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000070707070707070707070707"
+    "0707070711110000000000000000000000000000000000000000000000000000"
+    "1111111111111111111111111111111111110000000000000000000000000011"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000001111111111111111000000000000000000000000000000000000"
+    "0000000000000011111111111111111111110711000000000000000000000000"
+    "0808080808080808080808080808080808080808080808080808080808000000"
+    "1111110700000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000011070711111111070711110707"
+    "1100000000000000000000000000000000000000000000000000000000000000"
+    "0000000000110000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000001111111111110707111107071111000000000000000000"
+    "0000001100000000000000001107000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000011000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011001111110000111100000000001111"
+    "0011000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000071111070700000000000711000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000707110707110707000711000000000000000000000000000000000000"
+    "0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0b0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c"
+    "0c0c0c0c00000000000000000000000009090909090909090909090909090909"
+    "09090909090909000000000a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a0a00000000"
+    "0000000000000000000000000000000000000000000000000000000000001100"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111111111111111111111111111100000000000000000000000000000000"
+    "1111111111111111111111111111111100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000003"
+    "0000000000000000000000000000000000000000000000000000000000001111"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000003030303030303030303030300000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000110000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1100000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000011111111110000000000"
+    "0011111100111100000000001111111100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000001111110000000011"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000111100000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000011111111000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000001111111111000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000111100000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000011111111"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000001111111111111111111111000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000111111110000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0711070000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000001111111111111111"
+    "1111111111111100000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011000011110000000000000000000011"
+    "1111070000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000007070711111111070711110000060000"
+    "0000110000000000000000000006000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111110000000000000000000000000000000000000000000000000000000000"
+    "0000000000000011111111110711111111111111110000000000000000000000"
+    "0000000000070700000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000011000000000000000000000000"
+    "1111070000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000007070711111111111111111107"
+    "1100060600000000001111111100071100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000707071111110707111111110000000000001100"
+    "0011000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000011"
+    "0707071111111111111111000000000000000000000000000000000000000000"
+    "1111070700000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000001111001107"
+    "1107070707000007070000070711000000000000000000110000000000000000"
+    "0000070700001111111111111100000011111111110000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000001107071111111111"
+    "1100110000110011111107000707111111061100000000000000000000000000"
+    "0011110000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000707071111111111111111"
+    "0707111111071100000000000000000000000000000000000000000000001100"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011070711111111111107110707110711"
+    "1107111100000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000001107071111111100000707070711110711"
+    "1100000000000000000000000000000000000000000000000000000011110000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000007070711111111111111110707110711"
+    "1100000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000110711070711111111111111110000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000110711"
+    "0000111111110711111111110000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000707071111111111111111110711110000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011070707070700070700001111111106"
+    "0706071100000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000070707111111110000111107070707"
+    "1100000007000000000000000000000000000000000000000000000000000000"
+    "0011111111111111111111000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000011111111111107061111111100"
+    "0000000000000011000000000000000000111111111111070711111100000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000006060606060611111111111111111111111111071111000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000711111111111111001111111111110711"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000001111111111111111111111111111"
+    "1111111111111111000711111111111111071111071111000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000111111111111000000110011110011"
+    "1111111111110611000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000007070707070011110007071107110000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000011110707000000000000000000"
+    "1111060700000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000070711111111110000000707"
+    "1111110000000000000000000000000000000000000000000000110000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000003030303030303030303030303030303"
+    "1100000000000011111111111111111111111111111100000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000001111"
+    "1111111111111111111107070711111100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011111111110000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011111111111111000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000900000009090909000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000001100070707070707070707070707070707"
+    "0707070707070707070707070707070707070707070707070707070707070707"
+    "0707070707070707000000000000001111111100000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000011000000000000000000000011110000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000111100"
+    "0303030300000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111000011111111111111111111111111111111"
+    "1111111111111100000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000111111111100000011111111111103030303030303031111111111"
+    "1111110000111111111111110000000000000000000000000000000000000000"
+    "0000000000000000000011111111000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000111111000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111000000001111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111100000000000000001100000000000000000000"
+    "0000000011000000000000000000000000000000000000000000001111111111"
+    "0011111111111111111111111111111100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111111111100111111111111111111111111111111111100001111111111"
+    "1111001111001111111111000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000001100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000110000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000001111111100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000001111111100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000111100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000011111111111111000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000011111111111111000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "000000000000000000000000000d0d0d00000000000000000000000000000000"
+    "0000000000000000000000000000000d00000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000d0d0d0d0d0d0000000000000000000000000d0d"
+    "00000000000000000000000000000d00000d0d0d0d0d0d0d0d0d0d0000000000"
+    "000000000000000000000000000d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0505050505050505050505050505050505050505050505050505"
+    "000d0d0d0d0d0d0d0d0d0d0d0d0d0d0d000000000000000000000d0000000000"
+    "0000000000000000000000000000000d00000d0d0d0d0d0d0d0d0d000d0d0d0d"
+    "0000000000000000000d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d1111111111"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0000"
+    "0000000000000d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d00000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000000d0d0d0d0d0d0d0d0d0d0d0d"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0000000000000000000000000d0d0d0d00000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000d0d0d0d0d0d0d0d000000000000000000000d0d0d0d0d0d"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000d0d0d0d0d0d0d0d00000000000000000000000000000000"
+    "00000000000000000000000000000d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0000000000000000000000000d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d000d0d0d0d"
+    "0d0d0d0d0d0d000d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d"
+    "0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0d0000"
+    "0303030303030303030303030303030303030303030303030303030303030303"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "0303030303030303030303030303030303030303030303030303030303030303"
+    "0303030303030303030303030303030303030303030303030303030303030303"
+    "0303030303030303030303030303030303030303030303030303030303030303"
+    "0303030303030303030303030303030303030303030303030303030303030303"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111103030303030303030303030303030303"
+)
 
-# [\p{InCB=Extend}]
-# Source: DerivedCoreProperties.txt
-_INCB_EXTEND = "".join(map(chr, [
-    *range(0x00300, 0x0036F + 1),
-    *range(0x00483, 0x00487 + 1),
-    *range(0x00488, 0x00489 + 1),
-    *range(0x00591, 0x005BD + 1),
-           0x005BF,
-    *range(0x005C1, 0x005C2 + 1),
-    *range(0x005C4, 0x005C5 + 1),
-           0x005C7,
-    *range(0x00610, 0x0061A + 1),
-    *range(0x0064B, 0x0065F + 1),
-           0x00670,
-    *range(0x006D6, 0x006DC + 1),
-    *range(0x006DF, 0x006E4 + 1),
-    *range(0x006E7, 0x006E8 + 1),
-    *range(0x006EA, 0x006ED + 1),
-           0x00711,
-    *range(0x00730, 0x0074A + 1),
-    *range(0x007A6, 0x007B0 + 1),
-    *range(0x007EB, 0x007F3 + 1),
-           0x007FD,
-    *range(0x00816, 0x00819 + 1),
-    *range(0x0081B, 0x00823 + 1),
-    *range(0x00825, 0x00827 + 1),
-    *range(0x00829, 0x0082D + 1),
-    *range(0x00859, 0x0085B + 1),
-    *range(0x00897, 0x0089F + 1),
-    *range(0x008CA, 0x008E1 + 1),
-    *range(0x008E3, 0x00902 + 1),
-           0x0093A,
-           0x0093C,
-    *range(0x00941, 0x00948 + 1),
-    *range(0x00951, 0x00957 + 1),
-    *range(0x00962, 0x00963 + 1),
-           0x00981,
-           0x009BC,
-           0x009BE,
-    *range(0x009C1, 0x009C4 + 1),
-           0x009D7,
-    *range(0x009E2, 0x009E3 + 1),
-           0x009FE,
-    *range(0x00A01, 0x00A02 + 1),
-           0x00A3C,
-    *range(0x00A41, 0x00A42 + 1),
-    *range(0x00A47, 0x00A48 + 1),
-    *range(0x00A4B, 0x00A4D + 1),
-           0x00A51,
-    *range(0x00A70, 0x00A71 + 1),
-           0x00A75,
-    *range(0x00A81, 0x00A82 + 1),
-           0x00ABC,
-    *range(0x00AC1, 0x00AC5 + 1),
-    *range(0x00AC7, 0x00AC8 + 1),
-    *range(0x00AE2, 0x00AE3 + 1),
-    *range(0x00AFA, 0x00AFF + 1),
-           0x00B01,
-           0x00B3C,
-           0x00B3E,
-           0x00B3F,
-    *range(0x00B41, 0x00B44 + 1),
-    *range(0x00B55, 0x00B56 + 1),
-           0x00B57,
-    *range(0x00B62, 0x00B63 + 1),
-           0x00B82,
-           0x00BBE,
-           0x00BC0,
-           0x00BCD,
-           0x00BD7,
-           0x00C00,
-           0x00C04,
-           0x00C3C,
-    *range(0x00C3E, 0x00C40 + 1),
-    *range(0x00C46, 0x00C48 + 1),
-    *range(0x00C4A, 0x00C4C + 1),
-    *range(0x00C55, 0x00C56 + 1),
-    *range(0x00C62, 0x00C63 + 1),
-           0x00C81,
-           0x00CBC,
-           0x00CBF,
-           0x00CC0,
-           0x00CC2,
-           0x00CC6,
-    *range(0x00CC7, 0x00CC8 + 1),
-    *range(0x00CCA, 0x00CCB + 1),
-    *range(0x00CCC, 0x00CCD + 1),
-    *range(0x00CD5, 0x00CD6 + 1),
-    *range(0x00CE2, 0x00CE3 + 1),
-    *range(0x00D00, 0x00D01 + 1),
-    *range(0x00D3B, 0x00D3C + 1),
-           0x00D3E,
-    *range(0x00D41, 0x00D44 + 1),
-           0x00D57,
-    *range(0x00D62, 0x00D63 + 1),
-           0x00D81,
-           0x00DCA,
-           0x00DCF,
-    *range(0x00DD2, 0x00DD4 + 1),
-           0x00DD6,
-           0x00DDF,
-           0x00E31,
-    *range(0x00E34, 0x00E3A + 1),
-    *range(0x00E47, 0x00E4E + 1),
-           0x00EB1,
-    *range(0x00EB4, 0x00EBC + 1),
-    *range(0x00EC8, 0x00ECE + 1),
-    *range(0x00F18, 0x00F19 + 1),
-           0x00F35,
-           0x00F37,
-           0x00F39,
-    *range(0x00F71, 0x00F7E + 1),
-    *range(0x00F80, 0x00F84 + 1),
-    *range(0x00F86, 0x00F87 + 1),
-    *range(0x00F8D, 0x00F97 + 1),
-    *range(0x00F99, 0x00FBC + 1),
-           0x00FC6,
-    *range(0x0102D, 0x01030 + 1),
-    *range(0x01032, 0x01037 + 1),
-    *range(0x01039, 0x0103A + 1),
-    *range(0x0103D, 0x0103E + 1),
-    *range(0x01058, 0x01059 + 1),
-    *range(0x0105E, 0x01060 + 1),
-    *range(0x01071, 0x01074 + 1),
-           0x01082,
-    *range(0x01085, 0x01086 + 1),
-           0x0108D,
-           0x0109D,
-    *range(0x0135D, 0x0135F + 1),
-    *range(0x01712, 0x01714 + 1),
-           0x01715,
-    *range(0x01732, 0x01733 + 1),
-           0x01734,
-    *range(0x01752, 0x01753 + 1),
-    *range(0x01772, 0x01773 + 1),
-    *range(0x017B4, 0x017B5 + 1),
-    *range(0x017B7, 0x017BD + 1),
-           0x017C6,
-    *range(0x017C9, 0x017D3 + 1),
-           0x017DD,
-    *range(0x0180B, 0x0180D + 1),
-           0x0180F,
-    *range(0x01885, 0x01886 + 1),
-           0x018A9,
-    *range(0x01920, 0x01922 + 1),
-    *range(0x01927, 0x01928 + 1),
-           0x01932,
-    *range(0x01939, 0x0193B + 1),
-    *range(0x01A17, 0x01A18 + 1),
-           0x01A1B,
-           0x01A56,
-    *range(0x01A58, 0x01A5E + 1),
-           0x01A60,
-           0x01A62,
-    *range(0x01A65, 0x01A6C + 1),
-    *range(0x01A73, 0x01A7C + 1),
-           0x01A7F,
-    *range(0x01AB0, 0x01ABD + 1),
-           0x01ABE,
-    *range(0x01ABF, 0x01ACE + 1),
-    *range(0x01B00, 0x01B03 + 1),
-           0x01B34,
-           0x01B35,
-    *range(0x01B36, 0x01B3A + 1),
-           0x01B3B,
-           0x01B3C,
-           0x01B3D,
-           0x01B42,
-    *range(0x01B43, 0x01B44 + 1),
-    *range(0x01B6B, 0x01B73 + 1),
-    *range(0x01B80, 0x01B81 + 1),
-    *range(0x01BA2, 0x01BA5 + 1),
-    *range(0x01BA8, 0x01BA9 + 1),
-           0x01BAA,
-    *range(0x01BAB, 0x01BAD + 1),
-           0x01BE6,
-    *range(0x01BE8, 0x01BE9 + 1),
-           0x01BED,
-    *range(0x01BEF, 0x01BF1 + 1),
-    *range(0x01BF2, 0x01BF3 + 1),
-    *range(0x01C2C, 0x01C33 + 1),
-    *range(0x01C36, 0x01C37 + 1),
-    *range(0x01CD0, 0x01CD2 + 1),
-    *range(0x01CD4, 0x01CE0 + 1),
-    *range(0x01CE2, 0x01CE8 + 1),
-           0x01CED,
-           0x01CF4,
-    *range(0x01CF8, 0x01CF9 + 1),
-    *range(0x01DC0, 0x01DFF + 1),
-           0x0200D,
-    *range(0x020D0, 0x020DC + 1),
-    *range(0x020DD, 0x020E0 + 1),
-           0x020E1,
-    *range(0x020E2, 0x020E4 + 1),
-    *range(0x020E5, 0x020F0 + 1),
-    *range(0x02CEF, 0x02CF1 + 1),
-           0x02D7F,
-    *range(0x02DE0, 0x02DFF + 1),
-    *range(0x0302A, 0x0302D + 1),
-    *range(0x0302E, 0x0302F + 1),
-    *range(0x03099, 0x0309A + 1),
-           0x0A66F,
-    *range(0x0A670, 0x0A672 + 1),
-    *range(0x0A674, 0x0A67D + 1),
-    *range(0x0A69E, 0x0A69F + 1),
-    *range(0x0A6F0, 0x0A6F1 + 1),
-           0x0A802,
-           0x0A806,
-           0x0A80B,
-    *range(0x0A825, 0x0A826 + 1),
-           0x0A82C,
-    *range(0x0A8C4, 0x0A8C5 + 1),
-    *range(0x0A8E0, 0x0A8F1 + 1),
-           0x0A8FF,
-    *range(0x0A926, 0x0A92D + 1),
-    *range(0x0A947, 0x0A951 + 1),
-           0x0A953,
-    *range(0x0A980, 0x0A982 + 1),
-           0x0A9B3,
-    *range(0x0A9B6, 0x0A9B9 + 1),
-    *range(0x0A9BC, 0x0A9BD + 1),
-           0x0A9C0,
-           0x0A9E5,
-    *range(0x0AA29, 0x0AA2E + 1),
-    *range(0x0AA31, 0x0AA32 + 1),
-    *range(0x0AA35, 0x0AA36 + 1),
-           0x0AA43,
-           0x0AA4C,
-           0x0AA7C,
-           0x0AAB0,
-    *range(0x0AAB2, 0x0AAB4 + 1),
-    *range(0x0AAB7, 0x0AAB8 + 1),
-    *range(0x0AABE, 0x0AABF + 1),
-           0x0AAC1,
-    *range(0x0AAEC, 0x0AAED + 1),
-           0x0AAF6,
-           0x0ABE5,
-           0x0ABE8,
-           0x0ABED,
-           0x0FB1E,
-    *range(0x0FE00, 0x0FE0F + 1),
-    *range(0x0FE20, 0x0FE2F + 1),
-    *range(0x0FF9E, 0x0FF9F + 1),
-           0x101FD,
-           0x102E0,
-    *range(0x10376, 0x1037A + 1),
-    *range(0x10A01, 0x10A03 + 1),
-    *range(0x10A05, 0x10A06 + 1),
-    *range(0x10A0C, 0x10A0F + 1),
-    *range(0x10A38, 0x10A3A + 1),
-           0x10A3F,
-    *range(0x10AE5, 0x10AE6 + 1),
-    *range(0x10D24, 0x10D27 + 1),
-    *range(0x10D69, 0x10D6D + 1),
-    *range(0x10EAB, 0x10EAC + 1),
-    *range(0x10EFC, 0x10EFF + 1),
-    *range(0x10F46, 0x10F50 + 1),
-    *range(0x10F82, 0x10F85 + 1),
-           0x11001,
-    *range(0x11038, 0x11046 + 1),
-           0x11070,
-    *range(0x11073, 0x11074 + 1),
-    *range(0x1107F, 0x11081 + 1),
-    *range(0x110B3, 0x110B6 + 1),
-    *range(0x110B9, 0x110BA + 1),
-           0x110C2,
-    *range(0x11100, 0x11102 + 1),
-    *range(0x11127, 0x1112B + 1),
-    *range(0x1112D, 0x11134 + 1),
-           0x11173,
-    *range(0x11180, 0x11181 + 1),
-    *range(0x111B6, 0x111BE + 1),
-           0x111C0,
-    *range(0x111C9, 0x111CC + 1),
-           0x111CF,
-    *range(0x1122F, 0x11231 + 1),
-           0x11234,
-           0x11235,
-    *range(0x11236, 0x11237 + 1),
-           0x1123E,
-           0x11241,
-           0x112DF,
-    *range(0x112E3, 0x112EA + 1),
-    *range(0x11300, 0x11301 + 1),
-    *range(0x1133B, 0x1133C + 1),
-           0x1133E,
-           0x11340,
-           0x1134D,
-           0x11357,
-    *range(0x11366, 0x1136C + 1),
-    *range(0x11370, 0x11374 + 1),
-           0x113B8,
-    *range(0x113BB, 0x113C0 + 1),
-           0x113C2,
-           0x113C5,
-    *range(0x113C7, 0x113C9 + 1),
-           0x113CE,
-           0x113CF,
-           0x113D0,
-           0x113D2,
-    *range(0x113E1, 0x113E2 + 1),
-    *range(0x11438, 0x1143F + 1),
-    *range(0x11442, 0x11444 + 1),
-           0x11446,
-           0x1145E,
-           0x114B0,
-    *range(0x114B3, 0x114B8 + 1),
-           0x114BA,
-           0x114BD,
-    *range(0x114BF, 0x114C0 + 1),
-    *range(0x114C2, 0x114C3 + 1),
-           0x115AF,
-    *range(0x115B2, 0x115B5 + 1),
-    *range(0x115BC, 0x115BD + 1),
-    *range(0x115BF, 0x115C0 + 1),
-    *range(0x115DC, 0x115DD + 1),
-    *range(0x11633, 0x1163A + 1),
-           0x1163D,
-    *range(0x1163F, 0x11640 + 1),
-           0x116AB,
-           0x116AD,
-    *range(0x116B0, 0x116B5 + 1),
-           0x116B6,
-           0x116B7,
-           0x1171D,
-           0x1171F,
-    *range(0x11722, 0x11725 + 1),
-    *range(0x11727, 0x1172B + 1),
-    *range(0x1182F, 0x11837 + 1),
-    *range(0x11839, 0x1183A + 1),
-           0x11930,
-    *range(0x1193B, 0x1193C + 1),
-           0x1193D,
-           0x1193E,
-           0x11943,
-    *range(0x119D4, 0x119D7 + 1),
-    *range(0x119DA, 0x119DB + 1),
-           0x119E0,
-    *range(0x11A01, 0x11A0A + 1),
-    *range(0x11A33, 0x11A38 + 1),
-    *range(0x11A3B, 0x11A3E + 1),
-           0x11A47,
-    *range(0x11A51, 0x11A56 + 1),
-    *range(0x11A59, 0x11A5B + 1),
-    *range(0x11A8A, 0x11A96 + 1),
-    *range(0x11A98, 0x11A99 + 1),
-    *range(0x11C30, 0x11C36 + 1),
-    *range(0x11C38, 0x11C3D + 1),
-           0x11C3F,
-    *range(0x11C92, 0x11CA7 + 1),
-    *range(0x11CAA, 0x11CB0 + 1),
-    *range(0x11CB2, 0x11CB3 + 1),
-    *range(0x11CB5, 0x11CB6 + 1),
-    *range(0x11D31, 0x11D36 + 1),
-           0x11D3A,
-    *range(0x11D3C, 0x11D3D + 1),
-    *range(0x11D3F, 0x11D45 + 1),
-           0x11D47,
-    *range(0x11D90, 0x11D91 + 1),
-           0x11D95,
-           0x11D97,
-    *range(0x11EF3, 0x11EF4 + 1),
-    *range(0x11F00, 0x11F01 + 1),
-    *range(0x11F36, 0x11F3A + 1),
-           0x11F40,
-           0x11F41,
-           0x11F42,
-           0x11F5A,
-           0x13440,
-    *range(0x13447, 0x13455 + 1),
-    *range(0x1611E, 0x16129 + 1),
-    *range(0x1612D, 0x1612F + 1),
-    *range(0x16AF0, 0x16AF4 + 1),
-    *range(0x16B30, 0x16B36 + 1),
-           0x16F4F,
-    *range(0x16F8F, 0x16F92 + 1),
-           0x16FE4,
-    *range(0x16FF0, 0x16FF1 + 1),
-    *range(0x1BC9D, 0x1BC9E + 1),
-    *range(0x1CF00, 0x1CF2D + 1),
-    *range(0x1CF30, 0x1CF46 + 1),
-    *range(0x1D165, 0x1D166 + 1),
-    *range(0x1D167, 0x1D169 + 1),
-    *range(0x1D16D, 0x1D172 + 1),
-    *range(0x1D17B, 0x1D182 + 1),
-    *range(0x1D185, 0x1D18B + 1),
-    *range(0x1D1AA, 0x1D1AD + 1),
-    *range(0x1D242, 0x1D244 + 1),
-    *range(0x1DA00, 0x1DA36 + 1),
-    *range(0x1DA3B, 0x1DA6C + 1),
-           0x1DA75,
-           0x1DA84,
-    *range(0x1DA9B, 0x1DA9F + 1),
-    *range(0x1DAA1, 0x1DAAF + 1),
-    *range(0x1E000, 0x1E006 + 1),
-    *range(0x1E008, 0x1E018 + 1),
-    *range(0x1E01B, 0x1E021 + 1),
-    *range(0x1E023, 0x1E024 + 1),
-    *range(0x1E026, 0x1E02A + 1),
-           0x1E08F,
-    *range(0x1E130, 0x1E136 + 1),
-           0x1E2AE,
-    *range(0x1E2EC, 0x1E2EF + 1),
-    *range(0x1E4EC, 0x1E4EF + 1),
-    *range(0x1E5EE, 0x1E5EF + 1),
-    *range(0x1E8D0, 0x1E8D6 + 1),
-    *range(0x1E944, 0x1E94A + 1),
-    *range(0x1F3FB, 0x1F3FF + 1),
-    *range(0xE0020, 0xE007F + 1),
-    *range(0xE0100, 0xE01EF + 1),
-]))
+# Deterministic finite automaton implementing the grapheme cluster boundary
+# rules of UAX #29: the state reached from state s on reading a code point
+# of class c is _DFA[s * len(_CLASSES) + c]; the start state is 0, and there
+# is a boundary before the code point just read if and only if the state
+# reached is at least _DFA_BREAK_STATE
+_DFA_BREAK_STATE = 13
+
+_DFA = bytes.fromhex(
+    "0102030301040501060708070809010a01010d0e0f0f01101101121314131415"
+    "011601010d0e030f0d10110d1213141314150d160d0d0d0e0f0f0d10110d1213"
+    "141314150d160d0d0d0e0f0f0101110112131413141501160101010e0f0f0104"
+    "0501060708070809010a01010d0e0f0f01101101060714070815011601010d0e"
+    "0f0f01101101120708131415011601010d0e0f0f011011011213081314150116"
+    "01010d0e0f0f091011011213141314150b1609090d0e0f0f0110110112131413"
+    "14150a160c0a0d0e0f0f01101101121314131409011601010d0e0f0f01101101"
+    "1213141314150c0a0c0c0d0e0f0f01101101121314131415011601010d0e030f"
+    "0d10110d1213141314150d160d0d0d0e0f0f0d10110d1213141314150d160d0d"
+    "0d0e0f0f0101110112131413141501160101010e0f0f01040501060708070809"
+    "010a01010d0e0f0f01101101060714070815011601010d0e0f0f011011011207"
+    "08131415011601010d0e0f0f01101101121308131415011601010d0e0f0f0910"
+    "11011213141314150b1609090d0e0f0f011011011213141314150a160c0a"
+)
+
+# Pairs of classes between which there is always a boundary, after which
+# the automaton is in the same state as at the start of the text (so that
+# the text can be segmented from there independently of what precedes):
+# the pair (a, b) is such a pair if _SAFE_BREAKS[a * len(_CLASSES) + b] is 1
+_SAFE_BREAKS = bytes.fromhex(
+    "0101010100010100010101010101000100000101000101010101010101010101"
+    "0101010101010101010101010101010101010101010101010101010101010101"
+    "0101010101010101010101010001010001010101010100010000010101010000"
+    "0100010101010101000100000001010100000000000000000000000000000101"
+    "0101000101000101010101010001000001010101000101000000010000010001"
+    "0000010101010001010001000001010100010000010101010001010001010001"
+    "0101000100000101010100010100010000010101000100000101010100010100"
+    "0101000101010001000001010101000101000101010101010001000001010101"
+    "0001010001010101010000000000010101010001010001010101010100010000"
+    "0101010100010100010101010101000000000101010100010100010101010101"
+    "00000000"
+)
+
+# Rules of UAX #29 deciding whether there is a boundary before a code point
+# (used for instrumentation only); the rule that applies to a code point of
+# class b following one of class a is
+#   _RULES[_PAIR_RULES[(a * len(_CLASSES) + b) * 2 + is_break]]
+# where is_break tells whether there is a boundary between them
+_RULES = (
+    "GB1",
+    "GB3",
+    "GB4",
+    "GB5",
+    "GB6",
+    "GB7",
+    "GB8",
+    "GB9",
+    "GB9a",
+    "GB9b",
+    "GB9c",
+    "GB11",
+    "GB12/GB13",
+    "GB999",
+)
+
+_PAIR_RULES = bytes.fromhex(
+    "000d0003000300030700000d000d0800000d000d000d000d000d000d0700000d"
+    "0700070000020002010000020002000200020002000200020002000200020002"
+    "0002000200020002000200020002000200020002000200020002000200020002"
+    "0002000200020002000200020002000200020002000200020002000200020002"
+    "00020002000200020002000200020002000d0003000300030700000d000d0800"
+    "000d000d000d000d000d000d0700000d07000700000d00030003000307000c0d"
+    "000d0800000d000d000d000d000d000d0700000d070007000900000300030003"
+    "07000900090008000900090009000900090009000700090007000700000d0003"
+    "000300030700000d000d0800000d000d000d000d000d000d0700000d07000700"
+    "000d0003000300030700000d000d080004000400000d04000400000d0700000d"
+    "07000700000d0003000300030700000d000d0800000d05000500000d000d000d"
+    "0700000d07000700000d0003000300030700000d000d0800000d000d0600000d"
+    "000d000d0700000d07000700000d0003000300030700000d000d0800000d0500"
+    "0500000d000d000d0700000d07000700000d0003000300030700000d000d0800"
+    "000d000d0600000d000d000d0700000d07000700000d0003000300030700000d"
+    "000d0800000d000d000d000d000d000d0700000d07000700000d000300030003"
+    "0700000d000d0800000d000d000d000d000d0b0d07000a0d07000700000d0003"
+    "000300030700000d000d0800000d000d000d000d000d000d0700000d07000700"
+    "000d0003000300030700000d000d0800000d000d000d000d000d000d07000a0d"
+    "07000700000d0003000300030700000d000d0800000d000d000d000d000d000d"
+    "07000a0d07000700"
+)
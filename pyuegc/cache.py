@@ -0,0 +1,183 @@
+"""Memoization of the segmentation of repeated strings.
+
+Applications that segment the same strings over and over again, such as
+emoji, user names, stock phrases or labels, can front the segmentation
+functions of pyuegc with a `GraphemeCache`, which keeps the results for the
+strings segmented most recently, within a limit on the number of strings
+and on their total length.
+"""
+
+import threading
+from collections import OrderedDict, namedtuple
+from itertools import accumulate
+
+from pyuegc.egc import EGC, egc_boundaries
+
+CacheInfo = namedtuple(
+    "CacheInfo", "hits misses evictions entries chars max_entries max_chars"
+)
+CacheInfo.__doc__ = """\
+Statistics of a `GraphemeCache`: the numbers of lookups of strings found and
+not found in the cache, and of strings evicted from it; the number and total
+length of the strings in the cache; and the limits on them."""
+
+
+class GraphemeCache:
+    """Least recently used (LRU) cache of the segmentation of strings.
+
+    The `egc`, `boundaries` and `count` methods return the same results as
+    `EGC`, `egc_boundaries` and `egc_count`, except that lists are returned
+    as tuples, so that they can be shared by all callers. The results are
+    cached for the strings looked up most recently: when a limit is
+    exceeded, the least recently used strings are evicted. Strings longer
+    than `max_chars` are segmented but never cached.
+
+    A cache may be used by several threads at once.
+
+    Args:
+        max_entries (int): The maximum number of strings in the cache.
+        max_chars (int): The maximum total length, in code points, of the
+            strings in the cache.
+
+    Raises:
+        ValueError: If a limit is negative.
+
+    Examples:
+        >>> cache = GraphemeCache(max_entries=100)
+        >>> cache.egc("e\u0301le\u0300ve")
+        ('e\u0301', 'l', 'e\u0300', 'v', 'e')
+        >>> cache.count("e\u0301le\u0300ve")
+        5
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=1, evictions=0, entries=1, chars=7, \
+max_entries=100, max_chars=1048576)
+    """
+
+    __slots__ = (
+        "_lock", "_entries", "_chars", "_max_entries", "_max_chars",
+        "_hits", "_misses", "_evictions",
+    )
+
+    def __init__(self, max_entries=4096, max_chars=1 << 20):
+        if max_entries < 0 or max_chars < 0:
+            raise ValueError("cache limits must be nonnegative")
+
+        self._lock = threading.Lock()
+
+        # Cached strings, from the least to the most recently used, mapped to
+        # lists [boundaries, clusters] of tuples, either of which may be None
+        # until requested
+        self._entries = OrderedDict()
+        self._chars = 0
+
+        self._max_entries = max_entries
+        self._max_chars = max_chars
+
+        self._hits = self._misses = self._evictions = 0
+
+    def egc(self, unistr):
+        """Returns the extended grapheme clusters of a string, as a tuple
+        (see `pyuegc.EGC`)."""
+        entry = self._lookup(unistr)
+
+        if entry is None:
+            clusters = tuple(EGC(unistr))
+            self._store(unistr, [None, clusters])
+            return clusters
+
+        if entry[1] is None:
+            boundaries = entry[0]
+            entry[1] = tuple(
+                [unistr[i:j] for i, j in zip(boundaries, boundaries[1:])]
+            )
+
+        return entry[1]
+
+    def boundaries(self, unistr):
+        """Returns the offsets of the extended grapheme cluster boundaries of
+        a string, as a tuple (see `pyuegc.egc_boundaries`)."""
+        entry = self._lookup(unistr)
+
+        if entry is None:
+            return self._segment(unistr)
+
+        if entry[0] is None:
+            entry[0] = tuple(accumulate(map(len, entry[1]), initial=0))
+
+        return entry[0]
+
+    def count(self, unistr):
+        """Returns the number of extended grapheme clusters of a string (see
+        `pyuegc.egc_count`)."""
+        entry = self._lookup(unistr)
+
+        if entry is None:
+            return len(self._segment(unistr)) - 1
+
+        if entry[1] is not None:
+            return len(entry[1])
+
+        return len(entry[0]) - 1
+
+    def cache_info(self):
+        """Returns the statistics of the cache, as a `CacheInfo`."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._evictions,
+                len(self._entries), self._chars,
+                self._max_entries, self._max_chars,
+            )
+
+    def clear(self):
+        """Removes all the strings from the cache, and resets its
+        statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, unistr):
+        # Returns the entry of a string, or None if it is not cached
+        if not isinstance(unistr, str):
+            raise TypeError(
+                f"expected a string, but got {type(unistr).__name__}"
+            )
+
+        with self._lock:
+            entry = self._entries.get(unistr)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(unistr)
+                self._hits += 1
+            return entry
+
+    def _segment(self, unistr):
+        # Caches and returns the boundaries of a string not in the cache
+        boundaries = tuple(egc_boundaries(unistr))
+        self._store(unistr, [boundaries, None])
+        return boundaries
+
+    def _store(self, unistr, entry):
+        size = len(unistr)
+        if size > self._max_chars or not self._max_entries:
+            return
+
+        with self._lock:
+            # Another thread may have cached the same string meanwhile
+            if unistr in self._entries:
+                self._entries.move_to_end(unistr)
+                return
+
+            entries = self._entries
+            entries[unistr] = entry
+            self._chars += size
+
+            while (len(entries) > self._max_entries
+                   or self._chars > self._max_chars):
+                key, _ = entries.popitem(last=False)
+                self._chars -= len(key)
+                self._evictions += 1
@@ -2,99 +2,153 @@
 
 This module provides the `EGC` function, which accurately splits a Unicode
 string into its constituent extended grapheme clusters following the Unicode
-standard version 16.0.
+standard version 16.0, along with variants of it:
+    - `iter_egc` yields the clusters lazily;
+    - `iter_egc_reversed` yields them lazily, from the last one;
+    - `egc_boundaries` returns the offsets of the cluster boundaries;
+    - `egc_count` returns the number of clusters;
+    - `egc_truncate` truncates a string to a number of clusters;
+    - `egc_utf8`, `egc_boundaries_utf8` and `egc_count_utf8` do the same for
+      UTF-8 encoded text, with offsets in bytes;
+    - `segment_file` segments a UTF-8 encoded text file of any size;
+    - `egc_many` segments many strings at once;
+    - `GraphemeSegmenter` segments text supplied in chunks;
+    - `GraphemeString` indexes a string by clusters;
+    - `EditableGraphemeIndex` keeps the clusters of an edited string;
+    - `aiter_egc` segments text read asynchronously from a stream;
+and the `find_safe_boundary` function, which finds a position in a string
+from which the rest of it can be segmented independently, as well as the
+`next_boundary` and `prev_boundary` functions, which find the boundaries
+around a position.
 """
 
-import re
+import codecs
+import mmap
+import os
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, compress, islice, repeat
 
 from pyuegc._unicode import (
-    _PROP_DICT,
-    _EXT_PICTOGR,
-    _INCB_CONSONANT,
-    _INCB_EXTEND,
-    _INCB_LINKER,
+    _CLASSES,
+    _SHIFT,
+    _MASK,
+    _STAGE1,
+    _STAGE2,
+    _DFA,
+    _DFA_BREAK_STATE,
+    _SAFE_BREAKS,
 )
 
-_PROP = {**_PROP_DICT, **dict.fromkeys(_EXT_PICTOGR, "Extended_Pictographic")}
-
-# Regular expression pattern object used to match certain
-# conjunct linker clusters (Indic aksaras)
-# References:
-#   https://www.unicode.org/reports/tr29/tr29-45.html#GB9c
-#   https://www.unicode.org/reports/tr29/tr29-45.html#Regex_Definitions
-_RE_CONJUNCT_LINKER_CLUSTER = re.compile(
-    f"   [{_INCB_CONSONANT}]            "
-    f"   [{_INCB_EXTEND}{_INCB_LINKER}]*"
-    f"   [{_INCB_LINKER}]               "
-    f"   [{_INCB_EXTEND}{_INCB_LINKER}]*"
-    f"(?=[{_INCB_CONSONANT}])           ", re.VERBOSE
-)
+# Maximum number of code points held in the class cache, which is enough
+# for the repertoire of any natural text, even Chinese, and keeps the cache
+# below a few megabytes; once it is full, the classes of the code points not
+# in it are looked up in the two-stage table on every occurrence
+_PROP_CACHE_SIZE = 65536
 
-del _PROP_DICT, _EXT_PICTOGR, _INCB_CONSONANT, _INCB_EXTEND, _INCB_LINKER
-
-# Grapheme cluster break chart
-# https://www.unicode.org/Public/16.0.0/ucd/auxiliary/GraphemeBreakTest.html
-_GCB_CHART = [
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # Other
-    [1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],  # CR
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],  # LF
-    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],  # Control
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # Extend
-    [1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # Regional_Indicator
-    [0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Prepend
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # SpacingMark
-    [1, 1, 1, 1, 0, 1, 1, 0, 0, 0, 1, 0, 0, 1, 0],  # L
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0],  # V
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 1, 0],  # T
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0],  # LV
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 1, 0],  # LVT
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # Extended_Pictographic
-    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # ZWJ
-]
-
-_GCB_VALUES = (
-  # "Other",  # not a GCB property value (used to represent any code point)
-    None,     # used in lieu of "Other"
-    "CR",
-    "LF",
-    "Control",
-    "Extend",
-    "Regional_Indicator",
-    "Prepend",
-    "SpacingMark",
-    "L",
-    "V",
-    "T",
-    "LV",
-    "LVT",
-    "Extended_Pictographic",  # not a GCB property value
-    "ZWJ",
-)
 
-# assert set(_PROP.values()) - set(_GCB_VALUES) == set()
-# assert set(_GCB_VALUES) - set(_PROP.values()) == {None}
+# Mapping of code points to the classes distinguished by the segmentation
+# algorithm (see pyuegc/_unicode.py), filled in on demand from the two-stage
+# lookup table; once a code point has been seen, looking it up with
+# `_PROP.__getitem__` runs entirely in C, which matters because it is done
+# for every character of the input
+class _PropertyCache(dict):
+    __slots__ = ()
 
-_EXTEND = {
-    "Extend",
-    "Extended_Pictographic",
-}
+    def __missing__(self, code):
+        value = _STAGE2[_STAGE1[code >> _SHIFT] << _SHIFT | code & _MASK]
+
+        # The cache is not emptied when full, since text drawn from a larger
+        # repertoire would then keep refilling it, one miss per code point
+        if len(self) < _PROP_CACHE_SIZE:
+            self[code] = value
+        return value
+
+
+_PROP = _PropertyCache()
+
+# Transition table of the automaton implementing the grapheme cluster
+# boundary rules (GB3 to GB999, including GB9c, GB11, GB12 and GB13), with
+# states premultiplied by the number of classes, so that the state reached
+# from state s on reading a code point of class c is _TRANSITIONS[s + c];
+# see pyuegc/tools/generate_unicode.py for how the automaton is built
+_TRANSITIONS = [state * len(_CLASSES) for state in _DFA]
+
+# The states reached on reading a code point that starts a new grapheme
+# cluster (i.e., with a boundary before it) are those from this one onward
+_BREAK_STATE = _DFA_BREAK_STATE * len(_CLASSES)
 
+# Pairs of classes (a, b) between which there is always a boundary, after
+# which segmentation can start afresh, are those for which
+# _SAFE_BREAKS[a * _NUM_CLASSES + b] is 1
+_NUM_CLASSES = len(_CLASSES)
 
-def _build_break_rules_set():
-    break_rules_set = set()
+del _CLASSES, _DFA, _DFA_BREAK_STATE
 
-    for i, sublist in enumerate(_GCB_CHART):
-        for j, val in enumerate(sublist):
-            if val:
-                break_rules_set.add((_GCB_VALUES[i], _GCB_VALUES[j]))
+# Function to which the calls to `EGC`, `egc_boundaries`, `egc_count` and
+# `iter_egc` are redirected while instrumentation is enabled (see
+# pyuegc/instrumentation.py), and None otherwise, so that the only cost of
+# instrumentation when disabled is one test per call
+_instrumentation = None
 
-    return break_rules_set
 
+def _iter_break_positions(elements):
+    """Generates the positions of the grapheme cluster boundaries within a
+    string (excluding its start and end), given an iterable over the classes
+    of its code points. This is a single pass with one table lookup per code
+    point, so `elements` may be lazy.
+    """
+    state = 0
+
+    for i, cls in enumerate(elements):
+        state = _TRANSITIONS[state + cls]
+        if state >= _BREAK_STATE:
+            yield i
+
+
+# In Latin-1 text, the only code points that are not separated by a grapheme
+# cluster boundary are CR followed by LF: there are no Extend, Prepend,
+# SpacingMark or ZWJ characters below U+0100, and the two pictographs (U+00A9
+# and U+00AE) then behave like any other character. Such text can therefore
+# be segmented with string methods alone, without looking up the class of
+# each code point.
+def _is_latin1(unistr):
+    # str.isascii() takes constant time, and encoding is done in C (dropping
+    # the code points above U+00FF, instead of raising an exception, is the
+    # cheapest way of telling whether there are any)
+    return (unistr.isascii()
+            or len(unistr.encode("latin-1", "ignore")) == len(unistr))
+
+
+def _split_latin1(unistr):
+    if "\r\n" not in unistr:
+        return [*unistr]
 
-# Build a set of break rules based on the chart
-_BREAK_RULES = _build_break_rules_set()
+    parts = unistr.split("\r\n")
+    clusters = [*parts[0]]
+    for part in parts[1:]:
+        clusters.append("\r\n")
+        clusters += part
 
-del _GCB_CHART, _GCB_VALUES
+    return clusters
+
+
+def _latin1_boundaries(unistr):
+    if "\r\n" not in unistr:
+        return [*range(len(unistr) + 1)]
+
+    boundaries = []
+    start = 0
+    for part in unistr.split("\r\n"):
+        # Starts of the characters of `part` and of the CR LF following it
+        # (or end of the string)
+        boundaries += range(start, start + len(part) + 1)
+        start += len(part) + 2
+
+    return boundaries
+
+
+def _latin1_count(unistr):
+    return len(unistr) - unistr.count("\r\n")
 
 
 def EGC(unistr):
@@ -129,60 +183,21 @@ def EGC(unistr):
     if not isinstance(unistr, str):
         raise TypeError(f"expected a string, but got {type(unistr).__name__}")
 
+    if _instrumentation is not None:
+        return _instrumentation(EGC, unistr)
+
     if not unistr:
         return []
 
-    elements = [*map(_PROP.get, map(ord, unistr))]
+    if _is_latin1(unistr):
+        return _split_latin1(unistr)
 
-    if elements.count(None) == len(elements):
+    elements = [*map(_PROP.__getitem__, map(ord, unistr))]
+
+    if not any(elements):  # all code points are "Other"
         return [*unistr]
 
-    conjunct_linker_cluster_indices = {
-        match.end() for match in _RE_CONJUNCT_LINKER_CLUSTER.finditer(unistr)
-    }
-
-    break_positions = [0]
-    prev = ext_pictogr_index = ri_count = None
-
-    for i, curr in enumerate(elements):
-        if curr == "Regional_Indicator":
-            ri_count = ri_count + 1 if prev == "Regional_Indicator" else 0
-
-        if i == 0:
-            pass
-
-        elif i in conjunct_linker_cluster_indices:
-            # https://www.unicode.org/reports/tr29/tr29-45.html#GB9c
-            # Do not break within certain combinations
-            # with Indic_Conjunct_Break (InCB)=Linker.
-            pass
-
-        elif curr == "Extended_Pictographic" and prev == "ZWJ":
-            # https://www.unicode.org/reports/tr29/tr29-45.html#GB11
-            # Do not break within emoji modifier sequences
-            # or emoji zwj sequences.
-            if ext_pictogr_index is None or any(
-                elem not in _EXTEND
-                for elem in elements[ext_pictogr_index + 1 : i - 1]
-            ):
-                break_positions.append(i)
-
-        elif (curr == "Regional_Indicator" and prev == "Regional_Indicator"
-            and ri_count % 2 == 0):
-            # https://www.unicode.org/reports/tr29/tr29-45.html#GB12
-            # https://www.unicode.org/reports/tr29/tr29-45.html#GB13
-            # Do not break within emoji flag sequences. That is, do not break
-            # between regional indicator (RI) symbols if there is an odd number
-            # of RI characters before the break point.
-            break_positions.append(i)
-
-        elif (prev, curr) in _BREAK_RULES:
-            break_positions.append(i)
-
-        if curr == "Extended_Pictographic":
-            ext_pictogr_index = i
-
-        prev = curr
+    break_positions = [0, *_iter_break_positions(elements)]
 
     if len(break_positions) == 1:  # break_positions == [0]
         return [unistr]
@@ -192,6 +207,1379 @@ def EGC(unistr):
     return [unistr[i:j] for i, j in zip(break_positions, break_positions[1:])]
 
 
+def egc_boundaries(unistr):
+    """Returns the offsets of the extended grapheme cluster boundaries in
+    the provided Unicode string, without creating the clusters themselves.
+
+    Args:
+        unistr (str): The Unicode string to process.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Returns:
+        list: A list of increasing offsets, starting with 0 and ending with
+            `len(unistr)`, such that the k-th cluster of `unistr` is
+            `unistr[offsets[k]:offsets[k + 1]]`; the list is `[0]` if the
+            input string is empty.
+
+    Examples:
+        >>> egc_boundaries("e\u0301le\u0300ve")
+        [0, 2, 3, 5, 6, 7]
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    if _instrumentation is not None:
+        return _instrumentation(egc_boundaries, unistr)
+
+    if not unistr:
+        return [0]
+
+    if _is_latin1(unistr):
+        return _latin1_boundaries(unistr)
+
+    elements = [*map(_PROP.__getitem__, map(ord, unistr))]
+
+    if not any(elements):  # all code points are "Other"
+        return [*range(len(unistr) + 1)]
+
+    return [0, *_iter_break_positions(elements), len(unistr)]
+
+
+def egc_count(unistr):
+    """Returns the number of extended grapheme clusters in the provided
+    Unicode string, without creating the clusters themselves.
+
+    Args:
+        unistr (str): The Unicode string to process.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Returns:
+        int: The number of clusters, which is equal to `len(EGC(unistr))`.
+
+    Examples:
+        >>> egc_count("e\u0301le\u0300ve")
+        5
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    if _instrumentation is not None:
+        return _instrumentation(egc_count, unistr)
+
+    if not unistr:
+        return 0
+
+    if _is_latin1(unistr):
+        return _latin1_count(unistr)
+
+    elements = [*map(_PROP.__getitem__, map(ord, unistr))]
+
+    if not any(elements):  # all code points are "Other"
+        return len(unistr)
+
+    state = 0
+    count = 1
+
+    for cls in elements:
+        state = _TRANSITIONS[state + cls]
+        if state >= _BREAK_STATE:
+            count += 1
+
+    return count
+
+
+def iter_egc(unistr):
+    """Returns an iterator over the extended grapheme clusters of the
+    provided Unicode string.
+
+    Clusters are produced one at a time, using a constant amount of memory
+    besides the clusters themselves, so that only as much of the string is
+    processed as is consumed.
+
+    Args:
+        unistr (str): The Unicode string to split.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Returns:
+        iterator: An iterator yielding the same strings as `EGC(unistr)`.
+
+    Examples:
+        >>> clusters = iter_egc("e\u0301le\u0300ve")
+        >>> next(clusters)
+        'é'
+        >>> list(clusters)
+        ['l', 'è', 'v', 'e']
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    if _instrumentation is not None:
+        return _instrumentation(iter_egc, unistr)
+
+    return _iter_egc(unistr)
+
+
+def _iter_egc(unistr):
+    if not unistr:
+        return
+
+    if unistr.isascii() and "\r" not in unistr:
+        yield from unistr
+        return
+
+    elements = map(_PROP.__getitem__, map(ord, unistr))
+
+    i = 0
+    for j in _iter_break_positions(elements):
+        yield unistr[i:j]
+        i = j
+
+    yield unistr[i:]
+
+
+def egc_truncate(unistr, max_graphemes, ellipsis=None):
+    """Truncates the provided Unicode string to a maximum number of extended
+    grapheme clusters.
+
+    The string is segmented from its start only until the cluster following
+    the last one kept is found, so that the time taken is proportional to
+    the length of the result, not of the string.
+
+    Args:
+        unistr (str): The Unicode string to truncate.
+        max_graphemes (int): The maximum number of clusters of the result.
+        ellipsis (str): An optional string, such as "\\u2026", appended to
+            the string if it is truncated. Its clusters count toward
+            `max_graphemes`, so that fewer clusters of the string are kept.
+
+    Raises:
+        TypeError: If `unistr` or `ellipsis` is not a string.
+        ValueError: If `max_graphemes` is negative, or lower than the number
+            of clusters of `ellipsis`.
+
+    Returns:
+        str: `unistr` itself if it has at most `max_graphemes` clusters, and
+            otherwise its first clusters, followed by `ellipsis` if any.
+
+    Examples:
+        >>> egc_truncate("e\u0301le\u0300ve", 3)
+        'e\u0301le\u0300'
+        >>> egc_truncate("e\u0301le\u0300ve", 3, ellipsis=".")
+        'e\u0301l.'
+        >>> egc_truncate("e\u0301le\u0300ve", 5, ellipsis=".")
+        'e\u0301le\u0300ve'
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    if ellipsis is None:
+        ellipsis = ""
+    elif not isinstance(ellipsis, str):
+        raise TypeError(
+            f"expected a string, but got {type(ellipsis).__name__}"
+        )
+
+    keep = max_graphemes - egc_count(ellipsis)
+
+    if max_graphemes < 0 or keep < 0:
+        raise ValueError(
+            "max_graphemes must be at least the number of clusters of the "
+            "ellipsis, and nonnegative"
+        )
+
+    # In ASCII text without CR, each code point is a cluster
+    if unistr.isascii() and "\r" not in unistr[:max_graphemes + 1]:
+        if len(unistr) <= max_graphemes:
+            return unistr
+        return unistr[:keep] + ellipsis
+
+    # Boundaries after the first `max_graphemes` clusters; the string is
+    # truncated if there are that many, that is, if the last of them is not
+    # the end of the string
+    positions = [*islice(
+        _iter_break_positions(map(_PROP.__getitem__, map(ord, unistr))),
+        max_graphemes,
+    )]
+
+    if len(positions) < max_graphemes or not unistr:
+        return unistr
+
+    return unistr[:positions[keep - 1] if keep else 0] + ellipsis
+
+
+def _decode_utf8(data):
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise TypeError(
+            f"expected a bytes-like object, but got {type(data).__name__}"
+        )
+
+    # Decoding is done in C, and is much faster than extracting the code
+    # points from the bytes in Python
+    return str(data, "utf-8")
+
+
+def _utf8_boundaries(data):
+    unistr = _decode_utf8(data)
+
+    return _byte_offsets(unistr, egc_boundaries(unistr))
+
+
+# Length of the UTF-8 encoding of a code point, indexed by its first byte
+# (continuation bytes, 10xxxxxx, are deleted by `_byte_offsets` instead)
+_UTF8_WIDTHS = bytes([1] * 0x80 + [0] * 0x40 + [2] * 0x20 + [3] * 0x10
+                     + [4] * 0x10)
+_UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+
+def _byte_offsets(unistr, boundaries):
+    # Converts offsets in code points into offsets in the UTF-8 encoding
+    if unistr.isascii():  # one byte per code point
+        return boundaries
+
+    return [*_iter_byte_offsets(unistr, boundaries)]
+
+
+def _iter_byte_offsets(unistr, boundaries):
+    # Returns an iterator over the offsets in the UTF-8 encoding of `unistr`
+    # of the given offsets in code points, which does not keep `boundaries`
+    # alive
+    #
+    # The UTF-8 width of every code point is obtained in C, by translating
+    # the first byte of its encoding and deleting the others; the offsets in
+    # bytes of all the code points are then summed up in a single pass, and
+    # those at boundaries kept, without creating an object per cluster
+    widths = unistr.encode().translate(_UTF8_WIDTHS, _UTF8_CONTINUATION_BYTES)
+    selected = bytearray(len(unistr) + 1)
+    for boundary in boundaries:
+        selected[boundary] = 1
+
+    return compress(accumulate(widths, initial=0), selected)
+
+
+def egc_utf8(data):
+    """Splits the provided UTF-8 encoded text into its constituent extended
+    grapheme clusters, without copying it.
+
+    Args:
+        data (bytes-like): The UTF-8 encoded text to split, as bytes, a
+            bytearray or a memoryview.
+
+    Raises:
+        TypeError: If `data` is not a bytes-like object.
+        UnicodeDecodeError: If `data` is not valid UTF-8.
+
+    Returns:
+        list: A list of memoryviews on `data`, one for each cluster, or an
+            empty list if `data` is empty (note that a bytearray cannot be
+            resized while memoryviews on it exist).
+
+    Examples:
+        >>> [bytes(cluster) for cluster in egc_utf8(b"e\\xcc\\x81le")]
+        [b'e\\xcc\\x81', b'l', b'e']
+    """
+    boundaries = _utf8_boundaries(data)
+    view = memoryview(data).cast("B")
+
+    return [view[i:j] for i, j in zip(boundaries, boundaries[1:])]
+
+
+def egc_boundaries_utf8(data):
+    """Returns the offsets, in bytes, of the extended grapheme cluster
+    boundaries in the provided UTF-8 encoded text.
+
+    Args:
+        data (bytes-like): The UTF-8 encoded text to process, as bytes, a
+            bytearray or a memoryview.
+
+    Raises:
+        TypeError: If `data` is not a bytes-like object.
+        UnicodeDecodeError: If `data` is not valid UTF-8.
+
+    Returns:
+        list: A list of increasing offsets, starting with 0 and ending with
+            the length of `data` in bytes, such that the k-th cluster of
+            `data` is `data[offsets[k]:offsets[k + 1]]`; the list is `[0]`
+            if `data` is empty.
+
+    Examples:
+        >>> egc_boundaries_utf8(b"e\\xcc\\x81le")
+        [0, 3, 4, 5]
+    """
+    return _utf8_boundaries(data)
+
+
+def egc_count_utf8(data):
+    """Returns the number of extended grapheme clusters in the provided
+    UTF-8 encoded text.
+
+    Args:
+        data (bytes-like): The UTF-8 encoded text to process, as bytes, a
+            bytearray or a memoryview.
+
+    Raises:
+        TypeError: If `data` is not a bytes-like object.
+        UnicodeDecodeError: If `data` is not valid UTF-8.
+
+    Returns:
+        int: The number of clusters, which is equal to `len(egc_utf8(data))`.
+
+    Examples:
+        >>> egc_count_utf8(b"e\\xcc\\x81le")
+        3
+    """
+    return egc_count(_decode_utf8(data))
+
+
+# Approximate number of bytes of a file segmented at once by `segment_file`
+_FILE_CHUNK_SIZE = 1 << 20
+
+
+def segment_file(path, output="boundaries", chunk_size=_FILE_CHUNK_SIZE):
+    """Segments a UTF-8 encoded text file into extended grapheme clusters.
+
+    The file is memory-mapped and processed in chunks of about `chunk_size`
+    bytes, cut at safe boundaries (see `find_safe_boundary`), so that the
+    amount of memory used does not depend on the size of the file (unless
+    it contains a very long sequence of code points with no safe boundary,
+    such as regional indicators, which is then processed as a whole).
+
+    Args:
+        path (str or path-like): The path of the file to process.
+        output (str): What to produce: "boundaries" for the offsets of the
+            cluster boundaries, or "count" for the number of clusters.
+        chunk_size (int): The approximate number of bytes decoded and
+            segmented at once.
+
+    Raises:
+        OSError: If the file cannot be opened or memory-mapped.
+        UnicodeDecodeError: If the file is not valid UTF-8.
+        ValueError: If `output` is not one of the values above.
+
+    Returns:
+        If `output` is "count", the number of clusters in the file;
+            otherwise, an iterator yielding the offsets, in bytes, of the
+            cluster boundaries, from 0 to the size of the file (the same
+            offsets as `egc_boundaries_utf8` on the contents of the file).
+    """
+    if output not in ("boundaries", "count"):
+        raise ValueError(
+            f"output must be 'boundaries' or 'count', but got {output!r}"
+        )
+
+    if output == "count":
+        return sum(
+            egc_count(text) for _, text in _iter_file_chunks(path, chunk_size)
+        )
+
+    return _iter_file_boundaries(path, chunk_size)
+
+
+def _iter_file_boundaries(path, chunk_size):
+    yield 0
+
+    for start, text in _iter_file_chunks(path, chunk_size):
+        # The start of each chunk has already been yielded (as the start of
+        # the file or the end of the previous chunk)
+        if text.isascii():  # one byte per code point
+            boundaries = iter(egc_boundaries(text))
+        else:
+            boundaries = _iter_byte_offsets(text, egc_boundaries(text))
+        yield from map(start.__add__, islice(boundaries, 1, None))
+
+
+def _iter_file_chunks(path, chunk_size):
+    # Generates pairs (start, text), where text is the decoded contents of
+    # the file from offset start, up to a safe boundary or the end of file
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:  # empty files cannot be memory-mapped
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < size:
+                text, length = _read_chunk(data, start, size, chunk_size)
+                yield start, text
+                start += length
+
+
+def _read_chunk(data, start, size, chunk_size):
+    # Returns the longest prefix of the contents of `data` from offset
+    # `start` that is at most `chunk_size` bytes long and ends with a safe
+    # boundary, decoded, along with its length in bytes; the chunk is made
+    # longer until there is a safe boundary in it
+    while True:
+        end = start + max(chunk_size, 1)
+        if end >= size:
+            return str(data[start:size], "utf-8"), size - start
+
+        # Do not cut a UTF-8 sequence (continuation bytes are 10xxxxxx)
+        while end > start and data[end] & 0xC0 == 0x80:
+            end -= 1
+
+        text = str(data[start:end], "utf-8")
+
+        # The end of the text is not the end of the file, so the boundary
+        # searched for must come before its last code point; it is the last
+        # safe boundary, found by looking back from there
+        cut = _safe_start(text, len(text) - 1) if text else 0
+        if cut:
+            tail = text[cut:]
+            return text[:cut], end - start - len(tail.encode())
+
+        chunk_size *= 2
+
+
+class GraphemeSegmenter:
+    """Incremental segmenter of text supplied in chunks of any size.
+
+    Chunks are passed to `feed`, which returns the extended grapheme
+    clusters completed so far; the last cluster of the text is returned by
+    `flush` once all the chunks have been fed. The clusters returned are the
+    same as those of `EGC` applied to the concatenation of the chunks, while
+    only the last (not yet completed) cluster is held in memory.
+
+    Examples:
+        >>> segmenter = GraphemeSegmenter()
+        >>> segmenter.feed("e\u0301l")
+        ['e\u0301']
+        >>> segmenter.feed("e")
+        ['l']
+        >>> segmenter.feed("\u0300ve")
+        ['e\u0300', 'v']
+        >>> segmenter.flush()
+        ['e']
+    """
+
+    __slots__ = ("_state", "_pending")
+
+    def __init__(self):
+        # State of the automaton after the code points fed so far, and the
+        # code points of the last cluster, which may still be continued
+        self._state = 0
+        self._pending = []
+
+    def feed(self, chunk):
+        """Segments the next chunk of text.
+
+        Args:
+            chunk (str): The Unicode string following the text fed so far.
+
+        Raises:
+            TypeError: If `chunk` is not a string.
+
+        Returns:
+            list: The clusters completed by `chunk`, that is, all the clusters
+                of the text fed so far, not yet returned, except the last one.
+        """
+        if not isinstance(chunk, str):
+            raise TypeError(
+                f"expected a string, but got {type(chunk).__name__}"
+            )
+
+        positions = []
+        append = positions.append
+        state = self._state
+
+        for i, cls in enumerate(map(_PROP.__getitem__, map(ord, chunk))):
+            state = _TRANSITIONS[state + cls]
+            if state >= _BREAK_STATE:
+                append(i)
+
+        self._state = state
+
+        if not positions:  # the last cluster goes on
+            if chunk:
+                self._pending.append(chunk)
+            return []
+
+        # The first boundary completes the cluster started before it, which
+        # may have started in earlier chunks
+        self._pending.append(chunk[:positions[0]])
+        clusters = ["".join(self._pending)]
+        clusters += [chunk[i:j] for i, j in zip(positions, positions[1:])]
+        self._pending = [chunk[positions[-1]:]]
+
+        return clusters
+
+    def flush(self):
+        """Ends the text, and resets the segmenter so that it can be used for
+        a new text.
+
+        Returns:
+            list: The last cluster of the text, if not yet returned, in a
+                list (which is empty if no text was fed since the segmenter
+                was created or last flushed).
+        """
+        clusters = ["".join(self._pending)] if self._pending else []
+        self._state = 0
+        self._pending = []
+
+        return clusters
+
+
+class GraphemeString:
+    """Unicode string indexed by extended grapheme clusters.
+
+    The string is segmented once, when the object is created, and the
+    offsets of its cluster boundaries are stored in an array of integers
+    (4 bytes per cluster for strings shorter than 2**32 code points). The
+    length, indices and slices of the object are then in clusters, so that
+    accessing a cluster or a range of clusters takes constant time, and
+    finding the cluster containing a given code point takes logarithmic time,
+    without segmenting the string again.
+
+    Args:
+        unistr (str): The Unicode string to index.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Examples:
+        >>> s = GraphemeString("e\\u0301le\\u0300ve")
+        >>> len(s), len(str(s))
+        (5, 7)
+        >>> s[0], s[-1]
+        ('e\\u0301', 'e')
+        >>> s[1:3]
+        GraphemeString('le\\u0300')
+        >>> [*reversed(s)]
+        ['e', 'v', 'e\\u0300', 'l', 'e\\u0301']
+        >>> s.cluster_index(4)
+        2
+    """
+
+    __slots__ = ("_string", "_boundaries")
+
+    def __init__(self, unistr):
+        if not isinstance(unistr, str):
+            raise TypeError(
+                f"expected a string, but got {type(unistr).__name__}"
+            )
+
+        self._string = str(unistr)
+        self._boundaries = _boundary_array(len(unistr), egc_boundaries(unistr))
+
+    @classmethod
+    def _from_boundaries(cls, unistr, boundaries):
+        # Creates an object from a string and its boundary array, without
+        # segmenting the string
+        self = cls.__new__(cls)
+        self._string = unistr
+        self._boundaries = boundaries
+        return self
+
+    @property
+    def boundaries(self):
+        """memoryview: A read-only view of the offsets of the cluster
+        boundaries, as returned by `egc_boundaries`."""
+        return memoryview(self._boundaries).toreadonly()
+
+    def offset(self, index):
+        """Returns the offset, in code points, of the start of a cluster.
+
+        Args:
+            index (int): The index of the cluster, which may be negative, or
+                equal to the number of clusters (for the end of the string).
+
+        Raises:
+            IndexError: If `index` is out of range.
+        """
+        if index < 0:
+            index += len(self._boundaries) - 1
+            if index < 0:
+                raise IndexError("cluster index out of range")
+        return self._boundaries[index]
+
+    def cluster_index(self, offset):
+        """Returns the index of the cluster containing a code point.
+
+        Args:
+            offset (int): The offset of the code point in the string.
+
+        Raises:
+            IndexError: If `offset` is out of range.
+        """
+        if not 0 <= offset < len(self._string):
+            raise IndexError("string index out of range")
+        return bisect_right(self._boundaries, offset) - 1
+
+    def __len__(self):
+        return len(self._boundaries) - 1
+
+    def __getitem__(self, index):
+        boundaries = self._boundaries
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(boundaries) - 1)
+
+            if step != 1:
+                # The selected clusters are kept as they are, even where
+                # they would be segmented differently once joined
+                clusters = [self[i] for i in range(start, stop, step)]
+                lengths = accumulate(map(len, clusters), initial=0)
+                unistr = "".join(clusters)
+                return GraphemeString._from_boundaries(
+                    unistr, _boundary_array(len(unistr), lengths)
+                )
+
+            stop = max(start, stop)
+            first = boundaries[start]
+            unistr = self._string[first:boundaries[stop]]
+            return GraphemeString._from_boundaries(
+                unistr,
+                _boundary_array(
+                    len(unistr),
+                    [offset - first for offset in boundaries[start:stop + 1]],
+                ),
+            )
+
+        if index < 0:
+            index += len(boundaries) - 1
+            if index < 0:
+                raise IndexError("cluster index out of range")
+        elif index >= len(boundaries) - 1:
+            raise IndexError("cluster index out of range")
+
+        return self._string[boundaries[index]:boundaries[index + 1]]
+
+    def __iter__(self):
+        unistr = self._string
+        boundaries = self._boundaries
+        for i, j in zip(boundaries, islice(boundaries, 1, None)):
+            yield unistr[i:j]
+
+    def __reversed__(self):
+        unistr = self._string
+        boundaries = self._boundaries
+        for k in range(len(boundaries) - 1, 0, -1):
+            yield unistr[boundaries[k - 1]:boundaries[k]]
+
+    def __str__(self):
+        return self._string
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._string!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, GraphemeString):
+            return (self._string == other._string
+                    and self._boundaries == other._boundaries)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._string)
+
+
+class EditableGraphemeIndex:
+    """Index of the extended grapheme clusters of a string that is edited.
+
+    After the string is segmented once, each call to `replace` segments
+    again only the part of the string around the edit, from the closest
+    safe boundary (see `find_safe_boundary`) before the edit to the first
+    safe boundary after it, and updates the offsets of the cluster
+    boundaries accordingly. The cost of an edit is thus proportional to the
+    size of the edit in the common case, besides copying the string itself.
+
+    The offsets are kept in two arrays, as in the gap buffers of text
+    editors: those of the boundaries before the last edit, from the start of
+    the string, and those of the boundaries after it, from the end of the
+    string, so that an edit does not change any of them but those of the
+    boundaries around it. Edits far from the previous one move the
+    boundaries between them from one array to the other.
+
+    Args:
+        unistr (str): The initial Unicode string.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Examples:
+        >>> index = EditableGraphemeIndex("ele\\u0300ve")
+        >>> index.replace(1, 1, "\\u0301")
+        >>> str(index)
+        'e\\u0301le\\u0300ve'
+        >>> index.boundaries
+        [0, 2, 3, 5, 6, 7]
+        >>> len(index), index[2]
+        (5, 'e\\u0300')
+    """
+
+    __slots__ = ("_string", "_head", "_tail")
+
+    def __init__(self, unistr=""):
+        if not isinstance(unistr, str):
+            raise TypeError(
+                f"expected a string, but got {type(unistr).__name__}"
+            )
+
+        self._string = str(unistr)
+
+        # Offsets of the boundaries before the gap, from the start of the
+        # string, in increasing order, and of the boundaries after it, from
+        # the end of the string, in increasing order too (from the end of the
+        # string to the gap); the end of the string is always the first item
+        # of `_tail`, as 0
+        boundaries = egc_boundaries(unistr)
+        self._head = _boundary_array(len(unistr), boundaries[:-1])
+        self._tail = _boundary_array(len(unistr), [0])
+
+    def replace(self, start, end, text):
+        """Replaces part of the string, and updates the index.
+
+        Args:
+            start (int): The offset of the first code point replaced.
+            end (int): The offset following the last code point replaced
+                (equal to `start` to insert `text`).
+            text (str): The replacement text (empty to delete code points).
+
+        Raises:
+            TypeError: If `text` is not a string.
+            IndexError: If `start` and `end` do not satisfy
+                `0 <= start <= end <= len(str(self))`.
+        """
+        if not isinstance(text, str):
+            raise TypeError(
+                f"expected a string, but got {type(text).__name__}"
+            )
+
+        old_length = len(self._string)
+        if not 0 <= start <= end <= old_length:
+            raise IndexError("string range out of range")
+
+        unistr = self._string = (
+            self._string[:start] + text + self._string[end:]
+        )
+        length = len(unistr)
+
+        head = self._head
+        tail = self._tail
+
+        if length >> 32 and head.typecode == "I":
+            from array import array
+
+            head = self._head = array("Q", head)
+            tail = self._tail = array("Q", tail)
+
+        if not length:
+            del head[:]
+            del tail[1:]
+            return
+
+        # Segment from the closest safe boundary at or before the edit, up
+        # to the first safe boundary after the text inserted, beyond which
+        # the boundaries are unchanged (the two code points around it are
+        # not part of the edit)
+        first = _safe_start(unistr, min(start, length - 1))
+        stop = start + len(text)
+
+        positions = [first]
+        append = positions.append
+        prev = _PROP[ord(unistr[first])]
+        state = _TRANSITIONS[prev]
+        last = length
+
+        for i in range(first + 1, length):
+            cls = _PROP[ord(unistr[i])]
+            if i > stop and _SAFE_BREAKS[prev * _NUM_CLASSES + cls]:
+                last = i
+                break
+            state = _TRANSITIONS[state + cls]
+            if state >= _BREAK_STATE:
+                append(i)
+            prev = cls
+
+        # Move the gap to `first`, then replace the boundaries of `_tail`
+        # before `last` with those found; the offsets of the others, from the
+        # end of the string, are not changed by the edit
+        cut = bisect_left(head, first)
+        tail.extend([old_length - offset for offset in reversed(head[cut:])])
+        del head[cut:]
+
+        cut = bisect_right(tail, old_length - first)
+        head.extend([old_length - offset for offset in reversed(tail[cut:])])
+        del tail[cut:]
+
+        del tail[bisect_right(tail, length - last):]
+        head.extend(positions)
+
+    @property
+    def boundaries(self):
+        """list: The offsets of the cluster boundaries, as returned by
+        `egc_boundaries`."""
+        length = len(self._string)
+        return [
+            *self._head, *[length - offset for offset in reversed(self._tail)]
+        ]
+
+    def __len__(self):
+        return len(self._head) + len(self._tail) - 1
+
+    def __getitem__(self, index):
+        count = len(self)
+
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("cluster index out of range")
+
+        return self._string[self._offset(index):self._offset(index + 1)]
+
+    def _offset(self, index):
+        # Offset of the boundary of the given index, on either side of the gap
+        head = self._head
+        if index < len(head):
+            return head[index]
+        return len(self._string) - self._tail[len(self) - index]
+
+    def __str__(self):
+        return self._string
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._string!r})"
+
+
+def _boundary_array(length, boundaries):
+    # Boundary offsets are stored as 4-byte integers, unless the string is
+    # too long for them (the array module is imported on first use, since
+    # importing it imports collections.abc, which doubles the import time of
+    # pyuegc)
+    from array import array
+
+    return array("I" if length < 1 << 32 else "Q", boundaries)
+
+
+# Number of bytes requested at a time by `aiter_egc` from a stream with a
+# `read` method, and maximum number of code points it segments between two
+# suspensions (giving the event loop the opportunity to run other tasks)
+_STREAM_READ_SIZE = 65536
+_STREAM_SLICE_SIZE = 8192
+
+
+def aiter_egc(stream, encoding="utf-8", errors="strict"):
+    """Returns an asynchronous iterator over the extended grapheme clusters
+    of the text read from the provided stream.
+
+    The text is segmented as it is read, with a `GraphemeSegmenter`, and the
+    iterator suspends itself regularly, so that segmenting large amounts of
+    text does not block the event loop. Byte chunks are decoded
+    incrementally, so that a character may be split across chunks.
+
+    Args:
+        stream: An asynchronous stream with a `read` coroutine method, such
+            as an `asyncio.StreamReader`, or an asynchronous iterable, whose
+            chunks are either all Unicode strings or all bytes-like objects.
+        encoding (str): The encoding used to decode byte chunks.
+        errors (str): The error handling scheme used to decode byte chunks.
+
+    Raises:
+        TypeError: If `stream` is neither a stream nor an asynchronous
+            iterable, or (when iterating) if a chunk is neither a string nor
+            a bytes-like object.
+        UnicodeDecodeError: If a byte chunk cannot be decoded, and `errors`
+            is "strict" (when iterating).
+
+    Returns:
+        async iterator: An asynchronous iterator yielding the same strings
+            as `EGC` applied to the whole text.
+
+    Examples:
+        >>> import asyncio
+        >>> async def main():
+        ...     reader = asyncio.StreamReader()
+        ...     reader.feed_data("e\u0301le\u0300ve".encode())
+        ...     reader.feed_eof()
+        ...     return [cluster async for cluster in aiter_egc(reader)]
+        ...
+        >>> asyncio.run(main())
+        ['e\u0301', 'l', 'e\u0300', 'v', 'e']
+    """
+    if not (hasattr(stream, "read") or hasattr(stream, "__aiter__")):
+        raise TypeError(
+            f"expected an asynchronous stream or iterable, "
+            f"but got {type(stream).__name__}"
+        )
+
+    return _aiter_egc(stream, encoding, errors)
+
+
+async def _aiter_egc(stream, encoding, errors):
+    # Imported here, since importing asyncio takes longer than importing
+    # pyuegc itself
+    from asyncio import sleep
+
+    segmenter = GraphemeSegmenter()
+    decoder = None
+
+    async for chunk in _aiter_chunks(stream):
+        if not isinstance(chunk, str):
+            if not isinstance(chunk, (bytes, bytearray, memoryview)):
+                raise TypeError(
+                    f"expected a string or a bytes-like object, "
+                    f"but got {type(chunk).__name__}"
+                )
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)(errors)
+            chunk = decoder.decode(chunk)
+
+        for i in range(0, len(chunk), _STREAM_SLICE_SIZE):
+            for cluster in segmenter.feed(chunk[i:i + _STREAM_SLICE_SIZE]):
+                yield cluster
+            await sleep(0)
+
+    if decoder is not None:
+        for cluster in segmenter.feed(decoder.decode(b"", final=True)):
+            yield cluster
+
+    for cluster in segmenter.flush():
+        yield cluster
+
+
+async def _aiter_chunks(stream):
+    if not hasattr(stream, "read"):
+        async for chunk in stream:
+            yield chunk
+        return
+
+    while True:
+        chunk = await stream.read(_STREAM_READ_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+# Default maximum distance from the given index at which `find_safe_boundary`
+# looks for a boundary
+_MAX_SAFE_DISTANCE = 1024
+
+
+def find_safe_boundary(unistr, index, max_distance=_MAX_SAFE_DISTANCE):
+    """Finds a grapheme cluster boundary near the given offset that can be
+    identified without segmenting the provided Unicode string from its
+    start.
+
+    Such a "safe" boundary is one that lies between two code points that
+    are always separated by a boundary, whatever precedes them (as opposed
+    to, say, two regional indicators, which may or may not form a flag
+    depending on how many regional indicators precede them). Segmenting
+    the string after a safe boundary therefore yields the same clusters as
+    segmenting the whole string, so that it can be split at safe boundaries
+    into chunks that are segmented independently. Only the code points at
+    most `max_distance` away from `index` are examined; the start and the
+    end of the string are always safe boundaries.
+
+    Args:
+        unistr (str): The Unicode string to process.
+        index (int): The offset near which to look for a boundary.
+        max_distance (int): The maximum distance between `index` and the
+            boundary.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Returns:
+        int: The offset of the safe boundary closest to `index` (the one
+            before it in case of a tie), or None if there is no safe
+            boundary within `max_distance` of `index`.
+
+    Examples:
+        >>> find_safe_boundary("e\u0301le\u0300ve", 4)
+        3
+
+        >>> find_safe_boundary("\U0001F1EB\U0001F1F7" * 5000, 5000) is None
+        True
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    length = len(unistr)
+    index = min(max(index, 0), length)
+    lo = max(index - max_distance, 0)
+    hi = min(index + max_distance, length)
+
+    # The classes of the code points from unistr[lo - 1] to unistr[hi]; the
+    # start and the end of the string are treated as NULs, so that they are
+    # always safe boundaries (there is always one before and after a NUL)
+    window = unistr[max(lo - 1, 0):hi + 1]
+    if lo == 0:
+        window = "\0" + window
+    if hi == length:
+        window += "\0"
+    elements = [*map(_PROP.__getitem__, map(ord, window))]
+
+    for distance in range(max_distance + 1):
+        for position in (index - distance, index + distance):
+            if lo <= position <= hi:
+                k = position - lo
+                if _SAFE_BREAKS[elements[k] * _NUM_CLASSES + elements[k + 1]]:
+                    return position
+
+    return None
+
+
+def next_boundary(unistr, index):
+    """Returns the offset of the first grapheme cluster boundary after the
+    given offset in the provided Unicode string, such as for moving a cursor
+    forward by one cluster.
+
+    Only the code points around `index` are examined: the string is
+    segmented from the closest safe boundary (see `find_safe_boundary`) at
+    or before `index`, up to the boundary sought. The rules that depend on
+    an unbounded number of preceding code points (regional indicator pairs,
+    emoji ZWJ sequences and conjunct linker clusters) are thus applied as by
+    `EGC`, looking back only as far as they require.
+
+    Args:
+        unistr (str): The Unicode string to process.
+        index (int): An offset in the string, clamped to the range from 0 to
+            `len(unistr)`.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Returns:
+        int: The offset of the first boundary greater than `index`, or
+            `len(unistr)` if `index` is the end of the string.
+
+    Examples:
+        >>> next_boundary("élève", 0)
+        2
+        >>> next_boundary("élève", 3)
+        5
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    length = len(unistr)
+    index = max(index, 0)
+
+    if index >= length - 1:
+        return length
+
+    for position in _iter_boundaries_from(unistr, _safe_start(unistr, index)):
+        if position > index:
+            return position
+
+
+def prev_boundary(unistr, index):
+    """Returns the offset of the last grapheme cluster boundary before the
+    given offset in the provided Unicode string, such as for moving a cursor
+    backward by one cluster, or deleting the cluster before it.
+
+    As with `next_boundary`, only the code points around `index` are
+    examined.
+
+    Args:
+        unistr (str): The Unicode string to process.
+        index (int): An offset in the string, clamped to the range from 0 to
+            `len(unistr)`.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Returns:
+        int: The offset of the last boundary less than `index`, or 0 if
+            `index` is the start of the string.
+
+    Examples:
+        >>> prev_boundary("élève", 7)
+        6
+        >>> prev_boundary("élève", 5)
+        3
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    index = min(index, len(unistr))
+
+    if index <= 1:
+        return 0
+
+    # The boundary sought is at or after the safe boundary found before the
+    # code point preceding `index`
+    start = _safe_start(unistr, index - 1)
+    boundary = start
+
+    for position in _iter_boundaries_from(unistr, start):
+        if position >= index:
+            break
+        boundary = position
+
+    return boundary
+
+
+def _safe_start(unistr, index):
+    # Returns the greatest offset, not greater than `index` (which must be a
+    # valid index), that is either 0 or a safe boundary, looking back one
+    # code point at a time
+    cls = _PROP[ord(unistr[index])]
+
+    while index:
+        prev = _PROP[ord(unistr[index - 1])]
+        if _SAFE_BREAKS[prev * _NUM_CLASSES + cls]:
+            break
+        index -= 1
+        cls = prev
+
+    return index
+
+
+def _iter_boundaries_from(unistr, start):
+    # Generates the boundaries after `start`, which must be 0 or a safe
+    # boundary, up to the end of the string; as the state of the automaton
+    # after a safe boundary does not depend on the code points preceding it,
+    # the string is segmented from `start` as if it started there
+    state = 0
+
+    for i in range(start, len(unistr)):
+        state = _TRANSITIONS[state + _PROP[ord(unistr[i])]]
+        if state >= _BREAK_STATE:
+            yield i
+
+    yield len(unistr)
+
+
+def iter_egc_reversed(unistr):
+    """Returns an iterator over the extended grapheme clusters of the
+    provided Unicode string, from the last one to the first one.
+
+    The string is segmented backward, one piece at a time: each piece starts
+    at a safe boundary (see `find_safe_boundary`) and ends where the
+    previous piece started, so that it is segmented independently, with the
+    same result as segmenting the whole string, and only as much of the
+    string is processed as is consumed.
+
+    Args:
+        unistr (str): The Unicode string to split.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+
+    Returns:
+        iterator: An iterator yielding the same strings as
+            `reversed(EGC(unistr))`.
+
+    Examples:
+        >>> clusters = iter_egc_reversed("e\\u0301le\\u0300ve")
+        >>> next(clusters)
+        'e'
+        >>> list(clusters)
+        ['v', 'e\\u0300', 'l', 'e\\u0301']
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    return _iter_egc_reversed(unistr)
+
+
+# Minimum number of code points segmented at once by `iter_egc_reversed`
+# (less at the start of the string)
+_REVERSED_PIECE_SIZE = 256
+
+
+def _iter_egc_reversed(unistr):
+    end = len(unistr)
+
+    while end:
+        start = _safe_start(unistr, max(end - _REVERSED_PIECE_SIZE, 0))
+        piece = unistr[start:end]
+
+        positions = [
+            0,
+            *_iter_break_positions(map(_PROP.__getitem__, map(ord, piece))),
+        ]
+
+        j = len(piece)
+        for i in reversed(positions):
+            yield piece[i:j]
+            j = i
+
+        end = start
+
+
+# Number of strings segmented at once by `egc_many`
+_BATCH_SIZE = 1024
+
+_OUTPUTS = ("clusters", "boundaries", "count")
+
+
+def egc_many(strings, output="clusters"):
+    """Segments each string of an iterable into extended grapheme clusters.
+
+    This is equivalent to `map(EGC, strings)` (or `map(egc_boundaries, ...)`
+    or `map(egc_count, ...)`, depending on `output`), except that the strings
+    are segmented in batches, the classes of the code points of a whole
+    batch being looked up at once, so that the overhead of a call is shared
+    by a whole batch instead of being paid for every string.
+
+    Args:
+        strings (iterable): The Unicode strings to split.
+        output (str): What to produce for each string: "clusters" for its
+            list of clusters, "boundaries" for the list of offsets of its
+            cluster boundaries, or "count" for its number of clusters.
+
+    Raises:
+        TypeError: If an item of `strings` is not a string.
+        ValueError: If `output` is not one of the values above.
+
+    Returns:
+        iterator: An iterator yielding the results for the strings, in
+            order; strings are consumed lazily, one batch at a time.
+
+    Examples:
+        >>> list(egc_many(["e\u0301le\u0300ve", "", "ok"]))
+        [['é', 'l', 'è', 'v', 'e'], [], ['o', 'k']]
+
+        >>> list(egc_many(["e\u0301le\u0300ve", "", "ok"], output="count"))
+        [5, 0, 2]
+    """
+    _check_output(output)
+
+    return _iter_many(strings, output)
+
+
+def _check_output(output):
+    if output not in _OUTPUTS:
+        raise ValueError(
+            f"output must be one of {', '.join(map(repr, _OUTPUTS))}, "
+            f"but got {output!r}"
+        )
+
+
+def _iter_many(strings, output):
+    segment = _BATCH_FUNCTIONS[output]
+    strings = iter(strings)
+
+    while True:
+        batch = [*islice(strings, _BATCH_SIZE)]
+        if not batch:
+            return
+
+        if not all(map(isinstance, batch, repeat(str))):
+            for unistr in batch:
+                if not isinstance(unistr, str):
+                    raise TypeError(
+                        f"expected a string, but got {type(unistr).__name__}"
+                    )
+
+        yield from segment(batch)
+
+
+# The functions below segment each string of a batch as `egc_count`,
+# `egc_boundaries` and `EGC` do, with per-batch rather than per-string
+# overhead. Latin-1 strings are segmented with string methods alone, as
+# they are by these functions (all at once when the whole batch is Latin-1);
+# the classes of the code points of all the other strings are looked up at
+# once by `_batch_classes`, and the automaton loop is inlined, restarting at
+# the start of each string. Counting has a loop of its own, because it is
+# about a third faster than building the lists of boundaries.
+
+
+def _batch_classes(batch, latin1):
+    # Returns the classes of the code points of the strings of the batch
+    # that are not Latin-1, joined together, as bytes: the strings are
+    # translated with `_PROP`, which maps code points to their classes, that
+    # is, to characters U+0000 to U+0011, so that the lookups are done in C
+    text = "".join(
+        [unistr for unistr, is_latin1 in zip(batch, latin1) if not is_latin1]
+    )
+    return text.translate(_PROP).encode("latin-1")
+
+
+def _count_batch(batch):
+    if _is_latin1("".join(batch)):
+        return [*map(_latin1_count, batch)]
+
+    latin1 = [*map(_is_latin1, batch)]
+    classes = _batch_classes(batch, latin1)
+    counts = []
+    append = counts.append
+    start = 0
+
+    for unistr, is_latin1 in zip(batch, latin1):
+        if is_latin1:
+            append(_latin1_count(unistr))
+            continue
+
+        end = start + len(unistr)
+        elements = classes[start:end]
+        start = end
+
+        if elements.count(0) == len(elements):  # all "Other"
+            append(len(unistr))
+            continue
+
+        state = 0
+        count = 1
+        for cls in elements:
+            state = _TRANSITIONS[state + cls]
+            if state >= _BREAK_STATE:
+                count += 1
+        append(count)
+
+    return counts
+
+
+def _boundaries_batch(batch):
+    if _is_latin1("".join(batch)):
+        return [*map(_latin1_boundaries, batch)]
+
+    latin1 = [*map(_is_latin1, batch)]
+    classes = _batch_classes(batch, latin1)
+    results = []
+    append = results.append
+    start = 0
+
+    for unistr, is_latin1 in zip(batch, latin1):
+        if is_latin1:
+            append(_latin1_boundaries(unistr))
+            continue
+
+        end = start + len(unistr)
+        elements = classes[start:end]
+        start = end
+
+        if elements.count(0) == len(elements):  # all "Other"
+            append([*range(len(unistr) + 1)])
+            continue
+
+        boundaries = [0]
+        add = boundaries.append
+        state = 0
+        for i, cls in enumerate(elements):
+            state = _TRANSITIONS[state + cls]
+            if state >= _BREAK_STATE:
+                add(i)
+        add(len(unistr))
+        append(boundaries)
+
+    return results
+
+
+def _clusters_batch(batch):
+    if _is_latin1("".join(batch)):
+        return [*map(_split_latin1, batch)]
+
+    return [
+        [*unistr] if len(boundaries) > len(unistr)  # one code point each
+        else [unistr[i:j] for i, j in zip(boundaries, boundaries[1:])]
+        for unistr, boundaries in zip(batch, _boundaries_batch(batch))
+    ]
+
+
+_BATCH_FUNCTIONS = {
+    "clusters": _clusters_batch,
+    "boundaries": _boundaries_batch,
+    "count": _count_batch,
+}
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
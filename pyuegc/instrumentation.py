@@ -0,0 +1,214 @@
+"""Opt-in instrumentation of the segmentation functions of pyuegc.
+
+While instrumentation is enabled, the calls to `EGC`, `egc_boundaries`,
+`egc_count` and `iter_egc` (and to the functions built on them, such as
+`egc_utf8` or `segment_file`) are counted, along with:
+    - the number of code points and of clusters processed;
+    - the number of calls handled by each fast path ("empty" for the empty
+      string, "latin1" for Latin-1 text and "all_other" for text made of
+      code points with no special segmentation property only);
+    - the number of times each rule of UAX #29 decided whether there is a
+      boundary before a code point, in the calls not handled by a fast path
+      (e.g., "GB9c" for conjunct linker clusters, "GB11" for emoji ZWJ
+      sequences, and "GB999" for the default rule, breaking everywhere
+      else);
+    - the time spent in the instrumented calls.
+
+Instrumentation is enabled within the `instrument` context manager, between
+calls to `enable` and `disable`, or for the whole life of the process if the
+PYUEGC_INSTRUMENT environment variable is set to a nonempty value when
+pyuegc is imported, in which case the counters are available as
+`environment_counters`. Instrumented calls are much slower than regular
+ones, and `iter_egc` then returns an iterator over a precomputed list; when
+instrumentation is disabled, which is the default, the only cost is one test
+per call of the functions above.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from pyuegc import egc
+from pyuegc._unicode import _RULES, _PAIR_RULES
+
+_lock = threading.Lock()
+
+# Pairs (counters, callback) of the enabled instrumentations
+_enabled = []
+
+
+def new_counters():
+    """Returns a new dictionary of counters, all set to zero."""
+    return {
+        "calls": {},
+        "code_points": 0,
+        "clusters": 0,
+        "fast_paths": {"empty": 0, "latin1": 0, "all_other": 0},
+        "rules": dict.fromkeys(_RULES, 0),
+        "seconds": 0.0,
+    }
+
+
+def enable(callback=None):
+    """Enables instrumentation.
+
+    Args:
+        callback (callable): An optional function called after each
+            instrumented call with a dictionary describing it, with keys
+            "function" (the name of the function called), "code_points",
+            "clusters", "fast_path" (the name of the fast path used, or
+            None), "rules" (a dictionary mapping the names of the rules that
+            applied to the number of times they did) and "seconds".
+
+    Returns:
+        dict: The counters (see `new_counters`) that are updated after each
+            instrumented call, until `disable` is called with them.
+    """
+    counters = new_counters()
+
+    with _lock:
+        _enabled.append((counters, callback))
+        egc._instrumentation = _instrumented_call
+
+    return counters
+
+
+def disable(counters):
+    """Disables the instrumentation that was enabled by the call to `enable`
+    that returned `counters`, which are no longer updated afterward.
+
+    Raises:
+        ValueError: If `counters` are not those of an enabled
+            instrumentation.
+    """
+    with _lock:
+        for i, (enabled_counters, _) in enumerate(_enabled):
+            if enabled_counters is counters:
+                del _enabled[i]
+                break
+        else:
+            raise ValueError("instrumentation is not enabled")
+
+        if not _enabled:
+            egc._instrumentation = None
+
+
+@contextmanager
+def instrument(callback=None):
+    """Returns a context manager that enables instrumentation within its
+    context, and provides the counters (see `enable`).
+
+    Examples:
+        >>> from pyuegc import EGC
+        >>> with instrument() as counters:
+        ...     clusters = EGC("\\u0915\\u094D\\u0937\\u093F")
+        ...
+        >>> counters["code_points"], counters["clusters"]
+        (4, 1)
+        >>> counters["rules"]["GB9c"]
+        1
+    """
+    counters = enable(callback)
+    try:
+        yield counters
+    finally:
+        disable(counters)
+
+
+def _instrumented_call(func, unistr):
+    start = time.perf_counter()
+
+    fast_path = None
+    rules = {}
+
+    if not unistr:
+        fast_path = "empty"
+        boundaries = [0]
+    elif egc._is_latin1(unistr):
+        fast_path = "latin1"
+        boundaries = egc._latin1_boundaries(unistr)
+    else:
+        elements = [*map(egc._PROP.__getitem__, map(ord, unistr))]
+        if not any(elements):
+            fast_path = "all_other"
+            boundaries = [*range(len(unistr) + 1)]
+        else:
+            boundaries, rules = _segment(elements)
+
+    if func is egc.egc_count:
+        result = len(boundaries) - 1
+    elif func is egc.egc_boundaries:
+        result = boundaries
+    else:
+        result = [unistr[i:j] for i, j in zip(boundaries, boundaries[1:])]
+        if func is egc.iter_egc:
+            result = iter(result)
+
+    record = {
+        "function": func.__name__,
+        "code_points": len(unistr),
+        "clusters": len(boundaries) - 1,
+        "fast_path": fast_path,
+        "rules": rules,
+        "seconds": time.perf_counter() - start,
+    }
+
+    with _lock:
+        enabled = _enabled[:]
+        for counters, _ in enabled:
+            _update(counters, record)
+
+    for _, callback in enabled:
+        if callback is not None:
+            callback(record)
+
+    return result
+
+
+def _segment(elements):
+    # Same as the loop of `egc._iter_break_positions`, also recording which
+    # rule applies to each code point, given the classes of the code point
+    # and of the previous one and whether there is a boundary between them
+    transitions = egc._TRANSITIONS
+    break_state = egc._BREAK_STATE
+    num_classes = egc._NUM_CLASSES
+
+    counts = [0] * len(_RULES)
+    counts[0] = 1  # GB1, for the first code point
+    boundaries = [0]
+
+    prev = elements[0]
+    state = transitions[prev]
+
+    for i in range(1, len(elements)):
+        cls = elements[i]
+        state = transitions[state + cls]
+        is_break = state >= break_state
+        counts[_PAIR_RULES[(prev * num_classes + cls) * 2 + is_break]] += 1
+        if is_break:
+            boundaries.append(i)
+        prev = cls
+
+    boundaries.append(len(elements))
+
+    return boundaries, {
+        rule: count for rule, count in zip(_RULES, counts) if count
+    }
+
+
+def _update(counters, record):
+    calls = counters["calls"]
+    calls[record["function"]] = calls.get(record["function"], 0) + 1
+    counters["code_points"] += record["code_points"]
+    counters["clusters"] += record["clusters"]
+    if record["fast_path"] is not None:
+        counters["fast_paths"][record["fast_path"]] += 1
+    for rule, count in record["rules"].items():
+        counters["rules"][rule] += count
+    counters["seconds"] += record["seconds"]
+
+
+# Counters of the instrumentation enabled for the whole life of the process
+# by the PYUEGC_INSTRUMENT environment variable, or None
+environment_counters = enable() if os.environ.get("PYUEGC_INSTRUMENT") else None
@@ -0,0 +1,244 @@
+"""Segment large amounts of text into extended grapheme clusters using
+several processes.
+
+The segmentation functions of pyuegc are pure Python and CPU-bound, so a
+single process uses a single core. This module spreads the work over a pool
+of worker processes:
+    - `egc_many_parallel` segments the strings of an iterable, such as a list
+      of documents, which are sent to the workers in batches;
+    - `egc_parallel` segments a single large string, which is cut into chunks
+      at positions that are always grapheme cluster boundaries.
+
+Workers only send back the offsets of the cluster boundaries, packed into
+arrays, and the clusters themselves (if requested) are sliced from the input
+in the calling process. Results are always produced in the order of the
+input, whatever the order in which the workers complete.
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+
+from pyuegc.egc import (
+    egc_boundaries,
+    egc_many,
+    find_safe_boundary,
+    _check_output,
+    _MAX_SAFE_DISTANCE,
+)
+
+# Approximate number of code points in a batch of strings or in a chunk of a
+# large string processed by a worker
+_CHUNK_SIZE = 1 << 20
+
+
+def egc_many_parallel(strings, output="clusters", max_workers=None,
+                      chunk_size=_CHUNK_SIZE):
+    """Segments each string of an iterable into extended grapheme clusters,
+    using several processes.
+
+    This is equivalent to `pyuegc.egc_many(strings, output)`, except that
+    batches of strings are segmented concurrently by a pool of worker
+    processes.
+
+    Args:
+        strings (iterable): The Unicode strings to split.
+        output (str): What to produce for each string: "clusters" for its
+            list of clusters, "boundaries" for the list of offsets of its
+            cluster boundaries, or "count" for its number of clusters.
+        max_workers (int): The number of worker processes, which defaults to
+            the number of processors on the machine.
+        chunk_size (int): The approximate number of code points in a batch
+            of strings sent to a worker.
+
+    Raises:
+        TypeError: If an item of `strings` is not a string.
+        ValueError: If `output` is not one of the values above.
+
+    Returns:
+        iterator: An iterator yielding the results for the strings, in
+            order; strings are consumed lazily, as the workers become
+            available.
+    """
+    _check_output(output)
+
+    return _iter_many_parallel(strings, output, max_workers, chunk_size)
+
+
+def _iter_many_parallel(strings, output, max_workers, chunk_size):
+    max_workers = max_workers or os.cpu_count() or 1
+
+    # Number of batches submitted ahead of the one whose results are being
+    # yielded, so that the workers do not run out of work while the input is
+    # consumed no faster than needed
+    max_pending = 2 * max_workers
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        pending = deque()
+
+        for batch in _iter_batches(strings, chunk_size):
+            pending.append(
+                (batch, executor.submit(_segment_batch, batch, output))
+            )
+            if len(pending) > max_pending:
+                yield from _unpack_batch(*pending.popleft(), output)
+
+        while pending:
+            yield from _unpack_batch(*pending.popleft(), output)
+
+
+def _iter_batches(strings, chunk_size):
+    batch = []
+    size = 0
+
+    for unistr in strings:
+        if not isinstance(unistr, str):
+            raise TypeError(
+                f"expected a string, but got {type(unistr).__name__}"
+            )
+
+        batch.append(unistr)
+        size += len(unistr) + 1
+
+        if size >= chunk_size:
+            yield batch
+            batch = []
+            size = 0
+
+    if batch:
+        yield batch
+
+
+def _segment_batch(batch, output):
+    """Runs in a worker process. Returns the number of clusters of each
+    string of the batch and, unless only the numbers of clusters are wanted,
+    the offsets of the boundaries strictly inside the strings.
+    """
+    if output == "count":
+        return _pack(egc_many(batch, output="count")), None
+
+    counts = []
+    offsets = []
+
+    for boundaries in egc_many(batch, output="boundaries"):
+        counts.append(len(boundaries) - 1)
+        offsets += boundaries[1:-1]
+
+    return _pack(counts), _pack(offsets)
+
+
+def _unpack_batch(batch, future, output):
+    counts, offsets = future.result()
+
+    if output == "count":
+        yield from counts
+        return
+
+    k = 0
+
+    for unistr, count in zip(batch, counts):
+        if not count:  # empty string
+            yield [] if output == "clusters" else [0]
+            continue
+
+        boundaries = [0, *offsets[k:k + count - 1], len(unistr)]
+        k += count - 1
+
+        if output == "boundaries":
+            yield boundaries
+        else:
+            yield [unistr[i:j] for i, j in zip(boundaries, boundaries[1:])]
+
+
+def egc_parallel(unistr, output="clusters", max_workers=None,
+                 chunk_size=_CHUNK_SIZE):
+    """Splits a large Unicode string into extended grapheme clusters, using
+    several processes.
+
+    The string is cut into chunks of about `chunk_size` code points at safe
+    boundaries (see `pyuegc.find_safe_boundary`), which are then segmented
+    concurrently by a pool of worker processes. Where there is no safe
+    boundary near the end of a chunk (which only happens in contrived text,
+    such as a long run of regional indicators), the chunk is extended.
+
+    Args:
+        unistr (str): The Unicode string to split.
+        output (str): What to produce: "clusters" for the list of clusters
+            of the string, "boundaries" for the list of offsets of its
+            cluster boundaries, or "count" for its number of clusters.
+        max_workers (int): The number of worker processes, which defaults to
+            the number of processors on the machine.
+        chunk_size (int): The approximate number of code points in a chunk
+            of the string sent to a worker.
+
+    Raises:
+        TypeError: If `unistr` is not a string.
+        ValueError: If `output` is not one of the values above.
+
+    Returns:
+        The same result as `EGC(unistr)`, `egc_boundaries(unistr)` or
+            `egc_count(unistr)`, depending on `output`.
+    """
+    if not isinstance(unistr, str):
+        raise TypeError(f"expected a string, but got {type(unistr).__name__}")
+
+    _check_output(output)
+
+    cuts = _cut_points(unistr, chunk_size)
+
+    if len(cuts) <= 2:  # a single chunk
+        boundaries = egc_boundaries(unistr)
+    else:
+        chunks = [unistr[i:j] for i, j in zip(cuts, cuts[1:])]
+        with ProcessPoolExecutor(max_workers) as executor:
+            results = executor.map(_chunk_boundaries, chunks)
+            boundaries = [*chain.from_iterable(
+                map(start.__add__, offsets)
+                for start, offsets in zip(cuts, results)
+            ), len(unistr)]
+
+    if output == "count":
+        return len(boundaries) - 1
+    if output == "boundaries":
+        return boundaries
+
+    return [unistr[i:j] for i, j in zip(boundaries, boundaries[1:])]
+
+
+def _cut_points(unistr, chunk_size):
+    # Offsets of the start of each chunk, followed by len(unistr); looking
+    # for a cut point less than half a chunk away from each multiple of
+    # `chunk_size` keeps the cut points in increasing order
+    max_distance = min(_MAX_SAFE_DISTANCE, (chunk_size - 1) // 2)
+    cuts = [0]
+
+    for target in range(chunk_size, len(unistr), chunk_size):
+        cut = find_safe_boundary(unistr, target, max_distance)
+        if cut is not None and 0 < cut < len(unistr):
+            cuts.append(cut)
+
+    cuts.append(len(unistr))
+
+    return cuts
+
+
+def _chunk_boundaries(chunk):
+    """Runs in a worker process. Returns the offsets of the boundaries of
+    the chunk, except the one at its end, which starts the next chunk.
+    """
+    return _pack(egc_boundaries(chunk)[:-1])
+
+
+def _pack(values):
+    # Offsets and counts are sent back from the workers as arrays of
+    # integers, which are pickled as raw bytes, instead of as lists of
+    # Python integers
+    values = array("Q", values)
+
+    if not values or max(values) < 1 << 32:
+        return array("I", values)
+
+    return values
+
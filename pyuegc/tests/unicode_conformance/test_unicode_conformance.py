@@ -9,7 +9,14 @@ Information about conformance testing for Unicode extended grapheme clusters:
 import os
 import unittest
 
-from pyuegc import EGC, UNICODE_VERSION
+from pyuegc import (
+    EGC,
+    UNICODE_VERSION,
+    GraphemeSegmenter,
+    egc_boundaries,
+    egc_count,
+    iter_egc,
+)
 
 # Unicode conformance test file
 UNICODE_FILE = "GraphemeBreakTest.txt"
@@ -55,7 +62,7 @@ def parse_file():
                     for i, j in zip(positions, positions[1:])
                 ]
 
-            records.append((num, string, egc))
+            records.append((num, string, egc, positions))
 
     return records
 
@@ -71,12 +78,37 @@ class TestExtendedGraphemeClusters(unittest.TestCase):
 
 
 def generator():
-    for num, string, expected in parse_file():
+    for num, string, expected, positions in parse_file():
         testname = f"test_line_{num:04d}"
         observed = EGC(string)
         testfunc = make_function(observed, expected)
         setattr(TestExtendedGraphemeClusters, testname, testfunc)
 
+        testname = f"test_iter_egc_line_{num:04d}"
+        observed = [*iter_egc(string)]
+        testfunc = make_function(observed, expected)
+        setattr(TestExtendedGraphemeClusters, testname, testfunc)
+
+        testname = f"test_egc_boundaries_line_{num:04d}"
+        observed = egc_boundaries(string)
+        testfunc = make_function(observed, positions)
+        setattr(TestExtendedGraphemeClusters, testname, testfunc)
+
+        testname = f"test_egc_count_line_{num:04d}"
+        observed = egc_count(string)
+        testfunc = make_function(observed, len(expected))
+        setattr(TestExtendedGraphemeClusters, testname, testfunc)
+
+        # Feed the code points one at a time
+        testname = f"test_segmenter_line_{num:04d}"
+        segmenter = GraphemeSegmenter()
+        observed = [
+            cluster for char in string for cluster in segmenter.feed(char)
+        ]
+        observed += segmenter.flush()
+        testfunc = make_function(observed, expected)
+        setattr(TestExtendedGraphemeClusters, testname, testfunc)
+
 
 generator()
 
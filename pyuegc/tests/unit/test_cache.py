@@ -0,0 +1,120 @@
+"""Unit tests for the memoization of the segmentation (pyuegc.cache)."""
+
+import threading
+import unittest
+
+from pyuegc import EGC, egc_boundaries, egc_count
+from pyuegc.cache import GraphemeCache
+
+STRINGS = (
+    "",
+    "abc",
+    "e\u0301le\u0300ve",
+    "\u0915\u094D\u0937\u093F",
+    "\U0001F468\u200D\U0001F469\u200D\U0001F467 \U0001F1EB\U0001F1F7",
+)
+
+
+class TestGraphemeCache(unittest.TestCase):
+
+    def test_results(self):
+        cache = GraphemeCache()
+        for _ in range(2):
+            for s in STRINGS:
+                self.assertEqual(cache.egc(s), tuple(EGC(s)))
+                self.assertEqual(cache.boundaries(s), tuple(egc_boundaries(s)))
+                self.assertEqual(cache.count(s), egc_count(s))
+
+    def test_results_from_clusters(self):
+        # Boundaries and count of strings first cached by `egc`
+        cache = GraphemeCache()
+        for s in STRINGS:
+            cache.egc(s)
+        for s in STRINGS:
+            self.assertEqual(cache.boundaries(s), tuple(egc_boundaries(s)))
+            self.assertEqual(cache.count(s), egc_count(s))
+
+    def test_shared_results(self):
+        cache = GraphemeCache()
+        s = "e\u0301le\u0300ve"
+        self.assertIs(cache.egc(s), cache.egc(s))
+        self.assertIs(cache.boundaries(s), cache.boundaries(s))
+
+    def test_statistics(self):
+        cache = GraphemeCache()
+        cache.egc("e\u0301le\u0300ve")
+        cache.count("e\u0301le\u0300ve")
+        cache.boundaries("abc")
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 2))
+        self.assertEqual((info.entries, info.chars), (2, 10))
+        self.assertEqual(len(cache), 2)
+
+        cache.clear()
+        self.assertEqual(
+            cache.cache_info()[:5], (0, 0, 0, 0, 0)
+        )
+
+    def test_max_entries(self):
+        cache = GraphemeCache(max_entries=2)
+        cache.count("a")
+        cache.count("b")
+        cache.count("a")  # "b" is now the least recently used
+        cache.count("c")
+        info = cache.cache_info()
+        self.assertEqual((info.entries, info.evictions), (2, 1))
+        cache.count("a")
+        self.assertEqual(cache.cache_info().hits, 2)
+        cache.count("b")
+        self.assertEqual(cache.cache_info().misses, 4)
+
+    def test_max_chars(self):
+        cache = GraphemeCache(max_chars=5)
+        cache.count("abc")
+        cache.count("de")
+        self.assertEqual(cache.cache_info().chars, 5)
+        cache.count("f")
+        info = cache.cache_info()
+        self.assertEqual((info.entries, info.chars, info.evictions),
+                         (2, 3, 1))
+
+        # Longer strings are not cached
+        self.assertEqual(cache.egc("abcdef"), tuple("abcdef"))
+        self.assertEqual(cache.cache_info().entries, 2)
+
+    def test_disabled(self):
+        cache = GraphemeCache(max_entries=0)
+        self.assertEqual(cache.count("abc"), 3)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.cache_info().evictions, 0)
+
+    def test_threads(self):
+        cache = GraphemeCache(max_entries=3)
+        errors = []
+
+        def work():
+            for _ in range(200):
+                for s in STRINGS:
+                    if cache.egc(s) != tuple(EGC(s)):
+                        errors.append(s)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 4 * 200 * len(STRINGS))
+        self.assertLessEqual(info.entries, 3)
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            GraphemeCache().egc(b"abc")
+        with self.assertRaises(ValueError):
+            GraphemeCache(max_entries=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,696 @@
+"""Unit tests for the pyuegc.egc module."""
+
+import asyncio
+import contextlib
+import itertools
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pyuegc import (
+    EGC,
+    EditableGraphemeIndex,
+    GraphemeSegmenter,
+    GraphemeString,
+    aiter_egc,
+    egc_boundaries,
+    egc_boundaries_utf8,
+    egc_count,
+    egc_count_utf8,
+    egc_many,
+    egc_truncate,
+    egc_utf8,
+    find_safe_boundary,
+    iter_egc,
+    iter_egc_reversed,
+    next_boundary,
+    prev_boundary,
+    segment_file,
+)
+from pyuegc import egc
+
+
+@contextlib.contextmanager
+def count_lookups():
+    """Records the code points whose class is looked up within the context,
+    in the list it yields."""
+    lookups = []
+    properties = egc._PROP
+
+    class Properties:
+        def __getitem__(self, code_point):
+            lookups.append(code_point)
+            return properties[code_point]
+
+    with mock.patch.object(egc, "_PROP", Properties()):
+        yield lookups
+
+
+class TestRules(unittest.TestCase):
+
+    def check(self, string, expected):
+        self.assertEqual(EGC(string), expected)
+        self.assertEqual([*iter_egc(string)], expected)
+        self.assertEqual(egc_count(string), len(expected))
+
+        boundaries = egc_boundaries(string)
+        self.assertEqual(
+            [string[i:j] for i, j in zip(boundaries, boundaries[1:])],
+            expected,
+        )
+
+    def test_emoji_zwj_sequence_after_extend(self):
+        # GB11: \p{ExtPict} Extend* ZWJ \u00D7 \p{ExtPict}
+        string = "\U0001F468" + "\u0301" * 1000 + "\u200D\U0001F469"
+        self.check(string, [string])
+
+    def test_emoji_zwj_sequence_interrupted(self):
+        # A regional indicator is not Extend, so GB11 does not apply
+        self.check(
+            "\U0001F3A9\U0001F1FA\u200D\U0001F3A9",
+            ["\U0001F3A9", "\U0001F1FA\u200D", "\U0001F3A9"],
+        )
+
+    def test_regional_indicator_pairs(self):
+        self.check(
+            "\U0001F1EB\U0001F1F7\U0001F1E9\U0001F1EA\U0001F1FA",
+            ["\U0001F1EB\U0001F1F7", "\U0001F1E9\U0001F1EA", "\U0001F1FA"],
+        )
+
+    def test_conjunct_linker_cluster(self):
+        # GB9c, with InCB=Extend code points (including ZWJ) around the linker
+        self.check("\u0915\u094D\u0937", ["\u0915\u094D\u0937"])
+        string = "\u0915\u0951\u094D\u200D\u0937"
+        self.check(string, [string])
+        self.check("\u0915\u0951\u0937", ["\u0915\u0951", "\u0937"])
+
+    def test_all_other(self):
+        self.check("Python", ["P", "y", "t", "h", "o", "n"])
+
+    def test_empty_string(self):
+        self.check("", [])
+        self.assertEqual(egc_boundaries(""), [0])
+
+
+class TestPropertyCache(unittest.TestCase):
+
+    def test_full(self):
+        # Once the cache is full, it is neither emptied nor extended, and the
+        # classes of the other code points are still returned
+        cache = egc._PropertyCache()
+        unistr = "e\u0301\u0915\u094D\u0937\u093F\U0001F1EB\u200D"
+        with mock.patch.object(egc, "_PROP_CACHE_SIZE", 3):
+            classes = [*map(cache.__getitem__, map(ord, unistr))]
+        self.assertEqual(
+            classes, [*map(egc._PROP.__getitem__, map(ord, unistr))]
+        )
+        self.assertEqual([*cache], [*map(ord, unistr[:3])])
+
+
+class TestLatin1(unittest.TestCase):
+
+    STRINGS = (
+        "Python",
+        "a\r\nb",
+        "\r\n",
+        "\r\r\n\n\r",
+        "\r\n\r\n",
+        "\x00\x7F\x85\xAD\xA0",
+        "\xA9\xAE caf\xE9\r\n",
+    )
+
+    def test_same_as_general_case(self):
+        # U+0100 is not in Latin-1, and there is always a boundary before it
+        # in these strings, so the general algorithm is applied to them
+        for string in self.STRINGS:
+            with self.subTest(string=string):
+                expected = EGC(string + "\u0100")[:-1]
+                self.assertEqual(EGC(string), expected)
+                self.assertEqual([*iter_egc(string)], expected)
+                self.assertEqual(egc_count(string), len(expected))
+                self.assertEqual(
+                    egc_boundaries(string),
+                    egc_boundaries(string + "\u0100")[:-1],
+                )
+
+
+class TestEgcMany(unittest.TestCase):
+
+    STRINGS = (
+        "",
+        "Python",
+        "a\r",  # not joined with the LF starting the next string
+        "\nb",
+        "e\u0301le\u0300ve",
+        "\u0915\u094D\u0937\u093F",
+        "\U0001F1EB\U0001F1F7\U0001F1E9",
+        "\U0001F468\u200D\U0001F469\u200D\U0001F467",
+        "\u0301\u0301",
+        "\u0600",  # Prepend
+    )
+
+    def check(self, strings):
+        strings = list(strings)
+        self.assertEqual(list(egc_many(strings)), [*map(EGC, strings)])
+        self.assertEqual(
+            list(egc_many(strings, output="boundaries")),
+            [*map(egc_boundaries, strings)],
+        )
+        self.assertEqual(
+            list(egc_many(strings, output="count")),
+            [*map(egc_count, strings)],
+        )
+
+    def test_strings(self):
+        self.check(self.STRINGS)
+
+    def test_latin1_strings(self):
+        self.check(TestLatin1.STRINGS)
+
+    def test_latin1_fast_path(self):
+        # The classes of the code points of Latin-1 strings are not looked
+        # up, whether or not there are other strings in the batch
+        for strings, expected in (
+            (TestLatin1.STRINGS, set()),
+            (TestLatin1.STRINGS + ("e\u0301",), {0x65, 0x301}),
+        ):
+            for output in ("clusters", "boundaries", "count"):
+                with self.subTest(strings=strings, output=output):
+                    with count_lookups() as lookups:
+                        list(egc_many(strings, output=output))
+                    self.assertEqual(set(lookups), expected)
+
+    def test_several_batches(self):
+        self.check(self.STRINGS * 3000)
+
+    def test_lazy(self):
+        results = egc_many(itertools.repeat("e\u0301"))
+        self.assertEqual(next(results), ["e\u0301"])
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            next(egc_many(["ab", 42]))
+
+    def test_invalid_output(self):
+        with self.assertRaises(ValueError):
+            egc_many([], output="clusters_list")
+
+
+class TestUtf8(unittest.TestCase):
+
+    def check(self, data):
+        expected = [cluster.encode() for cluster in EGC(bytes(data).decode())]
+        self.assertEqual([*map(bytes, egc_utf8(data))], expected)
+        self.assertEqual(egc_count_utf8(data), len(expected))
+
+        boundaries = egc_boundaries_utf8(data)
+        self.assertEqual(
+            [bytes(data[i:j]) for i, j in zip(boundaries, boundaries[1:])],
+            expected,
+        )
+
+    def test_strings(self):
+        for string in TestEgcMany.STRINGS + TestLatin1.STRINGS:
+            with self.subTest(string=string):
+                self.check(string.encode())
+
+    def test_bytes_like(self):
+        data = "e\u0301le\u0300ve \U0001F1EB\U0001F1F7".encode()
+        self.check(bytearray(data))
+        self.check(memoryview(data))
+
+    def test_no_copy(self):
+        data = bytearray("e\u0301l".encode())
+        clusters = egc_utf8(data)
+        data[0:1] = b"a"
+        self.assertEqual(bytes(clusters[0]), b"a\xcc\x81")
+
+    def test_invalid_utf8(self):
+        for func in (egc_utf8, egc_boundaries_utf8, egc_count_utf8):
+            with self.subTest(func=func.__name__):
+                with self.assertRaises(UnicodeDecodeError):
+                    func(b"e\xcc")
+
+    def test_type_error(self):
+        for func in (egc_utf8, egc_boundaries_utf8, egc_count_utf8):
+            with self.subTest(func=func.__name__):
+                with self.assertRaises(TypeError):
+                    func("abc")
+
+
+class TestSegmentFile(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def check(self, data, chunk_sizes=(1, 2, 3, 7, 50, 1 << 20)):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+        expected = egc_boundaries_utf8(data)
+        for chunk_size in chunk_sizes:
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    list(segment_file(self.path, chunk_size=chunk_size)),
+                    expected,
+                )
+                self.assertEqual(
+                    segment_file(self.path, "count", chunk_size),
+                    len(expected) - 1,
+                )
+
+    def test_text(self):
+        self.check(TestGraphemeSegmenter.STRING.encode() * 3)
+
+    def test_no_safe_boundary(self):
+        self.check("\U0001F1EB".encode() * 25 + b"a")
+
+    def test_chunks_cut_at_last_safe_boundary(self):
+        # The boundary before the last code point read is not known to be
+        # safe, so the chunk ends at the one before it
+        data = ("e\u0301" * 1000).encode()
+        self.assertEqual(
+            egc._read_chunk(data, 0, len(data), 2000), ("e\u0301" * 666, 1998)
+        )
+
+    def test_empty_file(self):
+        self.check(b"")
+
+    def test_invalid_utf8(self):
+        with open(self.path, "wb") as f:
+            f.write(b"abc\xff")
+        with self.assertRaises(UnicodeDecodeError):
+            segment_file(self.path, "count")
+
+    def test_invalid_output(self):
+        with self.assertRaises(ValueError):
+            segment_file(self.path, "clusters")
+
+
+class TestGraphemeSegmenter(unittest.TestCase):
+
+    STRING = "".join(TestEgcMany.STRINGS) + "a\r\n\u0915\u094D"
+
+    def segment(self, chunks):
+        segmenter = GraphemeSegmenter()
+        clusters = [
+            cluster for chunk in chunks for cluster in segmenter.feed(chunk)
+        ]
+        return clusters + segmenter.flush()
+
+    def test_any_split(self):
+        expected = EGC(self.STRING)
+        for i in range(len(self.STRING) + 1):
+            for j in range(i, len(self.STRING) + 1):
+                chunks = [self.STRING[:i], self.STRING[i:j], self.STRING[j:]]
+                with self.subTest(i=i, j=j):
+                    self.assertEqual(self.segment(chunks), expected)
+
+    def test_long_cluster(self):
+        # A cluster spanning many chunks
+        chunks = ["a", *["\u0301"] * 1000, "b"]
+        self.assertEqual(self.segment(chunks), ["a" + "\u0301" * 1000, "b"])
+
+    def test_flush_resets(self):
+        segmenter = GraphemeSegmenter()
+        self.assertEqual(segmenter.flush(), [])
+        self.assertEqual(segmenter.feed("\U0001F1EB"), [])
+        self.assertEqual(segmenter.flush(), ["\U0001F1EB"])
+        # Flushing starts a new text, so the first regional indicator is not
+        # paired with the one fed before
+        self.assertEqual(segmenter.feed("\U0001F1F7\U0001F1EB"), [])
+        self.assertEqual(segmenter.flush(), ["\U0001F1F7\U0001F1EB"])
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            GraphemeSegmenter().feed(b"abc")
+
+
+class TestEgcTruncate(unittest.TestCase):
+
+    STRINGS = TestEgcMany.STRINGS + ("a\r\nb", "ab\r", "\r\n" * 3)
+
+    def test_truncate(self):
+        for unistr in self.STRINGS:
+            clusters = EGC(unistr)
+            for n in range(len(clusters) + 2):
+                with self.subTest(unistr=unistr, n=n):
+                    self.assertEqual(
+                        egc_truncate(unistr, n), "".join(clusters[:n])
+                    )
+
+    def test_ellipsis(self):
+        for unistr in self.STRINGS:
+            clusters = EGC(unistr)
+            for n in range(1, len(clusters) + 2):
+                with self.subTest(unistr=unistr, n=n):
+                    expected = (
+                        unistr if len(clusters) <= n
+                        else "".join(clusters[:n - 1]) + "\u2026"
+                    )
+                    self.assertEqual(
+                        egc_truncate(unistr, n, ellipsis="\u2026"), expected
+                    )
+
+    def test_long_string(self):
+        # Only the start of the string is segmented
+        unistr = "e\u0301" * 10 + "\U0001F1EB" * 10**6
+        with count_lookups() as lookups:
+            self.assertEqual(egc_truncate(unistr, 3), "e\u0301" * 3)
+        self.assertEqual(len(lookups), 7)
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            egc_truncate(b"abc", 1)
+        with self.assertRaises(TypeError):
+            egc_truncate("abc", 1, ellipsis=b"...")
+        with self.assertRaises(ValueError):
+            egc_truncate("abc", -1)
+        with self.assertRaises(ValueError):
+            egc_truncate("abc", 1, ellipsis="\u2026\u2026")
+
+
+class TestGraphemeString(unittest.TestCase):
+
+    STRING = TestGraphemeSegmenter.STRING
+
+    def setUp(self):
+        self.string = GraphemeString(self.STRING)
+        self.clusters = EGC(self.STRING)
+
+    def test_len_str(self):
+        self.assertEqual(len(self.string), len(self.clusters))
+        self.assertEqual(str(self.string), self.STRING)
+        self.assertEqual(
+            list(self.string.boundaries), egc_boundaries(self.STRING)
+        )
+
+    def test_indexing(self):
+        n = len(self.clusters)
+        for i in range(-n, n):
+            self.assertEqual(self.string[i], self.clusters[i])
+        for i in (n, -n - 1):
+            with self.assertRaises(IndexError):
+                self.string[i]
+
+    def test_slicing(self):
+        n = len(self.clusters)
+        for start, stop, step in itertools.product(
+            (None, 0, 1, -2, n, n + 1), (None, 0, 2, -1, n), (None, 1, 2, -1)
+        ):
+            with self.subTest(start=start, stop=stop, step=step):
+                s = self.string[start:stop:step]
+                self.assertIsInstance(s, GraphemeString)
+                self.assertEqual(list(s), self.clusters[start:stop:step])
+                self.assertEqual(
+                    str(s), "".join(self.clusters[start:stop:step])
+                )
+
+    def test_iteration(self):
+        self.assertEqual(list(self.string), self.clusters)
+        self.assertEqual(list(reversed(self.string)), self.clusters[::-1])
+
+    def test_offsets(self):
+        boundaries = egc_boundaries(self.STRING)
+        for index, offset in enumerate(boundaries):
+            self.assertEqual(self.string.offset(index), offset)
+        self.assertEqual(self.string.offset(-1), boundaries[-2])
+        for offset in range(len(self.STRING)):
+            index = self.string.cluster_index(offset)
+            self.assertLessEqual(boundaries[index], offset)
+            self.assertLess(offset, boundaries[index + 1])
+        with self.assertRaises(IndexError):
+            self.string.cluster_index(len(self.STRING))
+
+    def test_empty(self):
+        s = GraphemeString("")
+        self.assertEqual((len(s), list(s), list(reversed(s))), (0, [], []))
+        self.assertEqual(self.string[3:3], s)
+
+    def test_equality(self):
+        self.assertEqual(GraphemeString("e\u0301"), GraphemeString("e\u0301"))
+        self.assertEqual(len({GraphemeString("a"), GraphemeString("a")}), 1)
+        # Clusters selected by an extended slice are kept as they are
+        s = GraphemeString("\rx\n")[::2]
+        self.assertEqual(list(s), ["\r", "\n"])
+        self.assertNotEqual(s, GraphemeString("\r\n"))
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            GraphemeString(b"abc")
+
+
+class TestEditableGraphemeIndex(unittest.TestCase):
+
+    STRING = TestGraphemeSegmenter.STRING
+
+    def check(self, index, unistr):
+        self.assertEqual(str(index), unistr)
+        self.assertEqual(index.boundaries, egc_boundaries(unistr))
+        clusters = EGC(unistr)
+        self.assertEqual(len(index), len(clusters))
+        self.assertEqual([*map(index.__getitem__, range(len(index)))],
+                         clusters)
+
+    def test_any_edit(self):
+        # Insertions, deletions and replacements at every position, with
+        # texts continuing or completing the clusters around them
+        unistr = self.STRING
+        for text in ("", "a", "\u0301", "\U0001F1EB", "\u200D\U0001F469",
+                     "\u094D", "\r"):
+            for start in range(len(unistr) + 1):
+                for end in (start, start + 1, start + 3):
+                    if end > len(unistr):
+                        continue
+                    with self.subTest(text=text, start=start, end=end):
+                        index = EditableGraphemeIndex(unistr)
+                        index.replace(start, end, text)
+                        self.check(
+                            index, unistr[:start] + text + unistr[end:]
+                        )
+
+    def test_edit_sequence(self):
+        # Successive edits, moving back and forth in the string
+        unistr = self.STRING * 3
+        index = EditableGraphemeIndex(unistr)
+        edits = [(5, 5, "\u0301"), (60, 62, ""), (0, 1, "\r"),
+                 (30, 30, "\U0001F1F7"), (len(unistr) - 1, len(unistr) - 1,
+                                           "\n\u0915\u094D"), (10, 40, "")]
+        for start, end, text in edits:
+            index.replace(start, end, text)
+            unistr = unistr[:start] + text + unistr[end:]
+            self.check(index, unistr)
+
+        index.replace(0, len(unistr), "")
+        self.check(index, "")
+        index.replace(0, 0, "e\u0301")
+        self.check(index, "e\u0301")
+
+    def test_local_segmentation(self):
+        # Only the code points around the edit are segmented again
+        unistr = "e\u0301" * 10**5
+        index = EditableGraphemeIndex(unistr)
+        with count_lookups() as lookups:
+            index.replace(50002, 50002, "\u0300")
+        self.assertLess(len(lookups), 20)
+        self.assertEqual(index[25000], "e\u0301\u0300")
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            EditableGraphemeIndex(b"abc")
+        index = EditableGraphemeIndex("abc")
+        with self.assertRaises(TypeError):
+            index.replace(0, 1, b"x")
+        for start, end in ((-1, 1), (2, 1), (1, 4)):
+            with self.assertRaises(IndexError):
+                index.replace(start, end, "x")
+        with self.assertRaises(IndexError):
+            index[3]
+
+
+class TestAiterEgc(unittest.TestCase):
+
+    STRING = TestGraphemeSegmenter.STRING * 1000
+
+    @staticmethod
+    def collect(stream, **kwargs):
+        async def main():
+            return [cluster async for cluster in aiter_egc(stream, **kwargs)]
+        return asyncio.run(main())
+
+    @staticmethod
+    async def iterate(chunks):
+        for chunk in chunks:
+            yield chunk
+
+    def test_stream_reader(self):
+        async def main():
+            reader = asyncio.StreamReader()
+            reader.feed_data(self.STRING.encode())
+            reader.feed_eof()
+            return [cluster async for cluster in aiter_egc(reader)]
+
+        self.assertEqual(asyncio.run(main()), EGC(self.STRING))
+
+    def test_string_chunks(self):
+        chunks = [self.STRING[i:i + 7] for i in range(0, len(self.STRING), 7)]
+        self.assertEqual(
+            self.collect(self.iterate(chunks)), EGC(self.STRING)
+        )
+
+    def test_byte_chunks(self):
+        # Chunks of 5 bytes split most UTF-8 sequences
+        data = self.STRING.encode("utf-8")
+        chunks = [data[i:i + 5] for i in range(0, len(data), 5)]
+        self.assertEqual(
+            self.collect(self.iterate(chunks)), EGC(self.STRING)
+        )
+
+    def test_decoding(self):
+        chunks = [b"caf\xc3", b"\xa9 \xff"]
+        self.assertEqual(
+            self.collect(self.iterate(chunks), errors="replace"),
+            [*"caf\xe9 \ufffd"],
+        )
+        with self.assertRaises(UnicodeDecodeError):
+            self.collect(self.iterate(chunks))
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            aiter_egc(["abc"])
+        with self.assertRaises(TypeError):
+            self.collect(self.iterate(["abc", 42]))
+
+
+class TestFindSafeBoundary(unittest.TestCase):
+
+    def check(self, string, index, expected, max_distance=1024):
+        position = find_safe_boundary(string, index, max_distance)
+        self.assertEqual(position, expected)
+        if position is not None:
+            self.assertEqual(
+                EGC(string[:position]) + EGC(string[position:]),
+                EGC(string),
+            )
+
+    def test_nearest(self):
+        self.check("e\u0301le\u0300ve", 4, 3)
+        self.check("e\u0301le\u0300ve", 5, 5)
+        # Tie between 1 and 5, the earlier one wins
+        self.check("ab\u0301\u0301\u0301c", 3, 1)
+
+    def test_ends_of_string(self):
+        self.check("", 0, 0)
+        self.check("a\u0301\u0301", 1, 0)
+        self.check("a\u0301\u0301", 2, 3)
+        self.check("abc", -5, 0)
+        self.check("abc", 10, 3)
+
+    def test_context_dependent_boundaries(self):
+        # The boundaries between regional indicators, before an emoji after
+        # ZWJ and before a consonant after a linker depend on what precedes
+        string = "a" + "\U0001F1EB" * 20
+        self.check(string, 11, None, max_distance=9)
+        self.check(string, 11, 1, max_distance=10)
+
+        string = "\U0001F3A9" + "\u200D\U0001F3A9" * 5
+        self.check(string, 5, None, max_distance=4)
+
+        string = "\u0915" + "\u094D\u0937" * 5
+        self.check(string, 5, None, max_distance=4)
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            find_safe_boundary(b"abc", 1)
+
+
+class TestNextPrevBoundary(unittest.TestCase):
+
+    STRINGS = TestEgcMany.STRINGS + (
+        TestGraphemeSegmenter.STRING,
+        "\U0001F1EB" * 7 + "a",
+        "\u0915\u094D\u200D\u0937\u094D" * 3,
+        "\U0001F468\u200D\U0001F469\u200D\U0001F467\u0301" * 3,
+    )
+
+    def test_same_as_egc_boundaries(self):
+        for unistr in self.STRINGS:
+            boundaries = egc_boundaries(unistr)
+            for index in range(-1, len(unistr) + 2):
+                clamped = min(max(index, 0), len(unistr))
+                with self.subTest(unistr=unistr, index=index):
+                    self.assertEqual(
+                        next_boundary(unistr, index),
+                        min([b for b in boundaries if b > clamped],
+                            default=len(unistr)),
+                    )
+                    self.assertEqual(
+                        prev_boundary(unistr, index),
+                        max([b for b in boundaries if b < clamped],
+                            default=0),
+                    )
+
+    def test_local_context(self):
+        # Only the code points around the index are examined
+        unistr = "e\u0301" * 10**5
+        with count_lookups() as lookups:
+            self.assertEqual(next_boundary(unistr, 50001), 50002)
+            self.assertEqual(prev_boundary(unistr, 50001), 50000)
+        self.assertLess(len(lookups), 20)
+
+    def test_type_error(self):
+        for func in (next_boundary, prev_boundary):
+            with self.assertRaises(TypeError):
+                func(b"abc", 1)
+
+
+class TestIterEgcReversed(unittest.TestCase):
+
+    def test_same_as_egc(self):
+        for unistr in TestNextPrevBoundary.STRINGS:
+            with self.subTest(unistr=unistr):
+                self.assertEqual(
+                    list(iter_egc_reversed(unistr)), EGC(unistr)[::-1]
+                )
+
+    def test_pieces(self):
+        # Strings segmented in several pieces, with clusters and runs of
+        # regional indicators spanning them
+        for unistr in (
+            TestGraphemeSegmenter.STRING * 50,
+            "a" + "\U0001F1EB" * 1001,
+            "\u0301" * 1000 + "a",
+        ):
+            with self.subTest(unistr=unistr[:10]):
+                self.assertEqual(
+                    list(iter_egc_reversed(unistr)), EGC(unistr)[::-1]
+                )
+
+    def test_lazy(self):
+        # Only the end of the string is segmented
+        unistr = "e\u0301" * 10**5 + "ab"
+        with count_lookups() as lookups:
+            clusters = iter_egc_reversed(unistr)
+            self.assertEqual(
+                [*itertools.islice(clusters, 3)], ["b", "a", "e\u0301"]
+            )
+        self.assertLess(len(lookups), 1000)
+
+
+class TestErrors(unittest.TestCase):
+
+    def test_type_error(self):
+        for func in (EGC, egc_boundaries, egc_count, iter_egc,
+                     iter_egc_reversed):
+            with self.subTest(func=func.__name__):
+                with self.assertRaises(TypeError):
+                    func(b"abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
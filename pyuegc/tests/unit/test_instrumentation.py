@@ -0,0 +1,129 @@
+"""Unit tests for the instrumentation of pyuegc (pyuegc.instrumentation)."""
+
+import os
+import subprocess
+import sys
+import unittest
+
+from pyuegc import EGC, egc, egc_boundaries, egc_count, iter_egc
+from pyuegc.instrumentation import disable, enable, instrument
+
+STRINGS = (
+    "",
+    "\u00E9l\u00E8ve",
+    "\u4E2D\u6587",
+    "e\u0301le\u0300ve",
+    "\u0915\u094D\u0937\u093F",
+    "\U0001F468\u200D\U0001F469\u200D\U0001F467 "
+    "\U0001F1EB\U0001F1F7\U0001F1E9",
+    "\r\n\u1100\u1161\u11A8\u0600a\u0903",
+)
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_same_results(self):
+        expected = [
+            (EGC(s), egc_boundaries(s), egc_count(s), [*iter_egc(s)])
+            for s in STRINGS
+        ]
+        with instrument():
+            self.assertEqual(
+                [
+                    (EGC(s), egc_boundaries(s), egc_count(s), [*iter_egc(s)])
+                    for s in STRINGS
+                ],
+                expected,
+            )
+
+    def test_counters(self):
+        with instrument() as counters:
+            for s in STRINGS:
+                EGC(s)
+            egc_count("abc")
+
+        self.assertEqual(counters["calls"], {"EGC": 7, "egc_count": 1})
+        self.assertEqual(
+            counters["code_points"], sum(map(len, STRINGS)) + 3
+        )
+        self.assertEqual(
+            counters["clusters"], sum(len(EGC(s)) for s in STRINGS) + 3
+        )
+        self.assertEqual(
+            counters["fast_paths"], {"empty": 1, "latin1": 2, "all_other": 1}
+        )
+        self.assertGreater(counters["seconds"], 0)
+
+    def test_rules(self):
+        with instrument() as counters:
+            EGC("\r\n\u1100\u1161\u11A8\u0600a\u0903")
+
+        rules = {rule: n for rule, n in counters["rules"].items() if n}
+        self.assertEqual(
+            rules,
+            {"GB1": 1, "GB3": 1, "GB4": 1, "GB6": 1, "GB7": 1,
+             "GB9a": 1, "GB9b": 1, "GB999": 1},
+        )
+
+    def test_rules_sum(self):
+        # One rule applies at each position but the end of text (GB2)
+        with instrument() as counters:
+            for s in STRINGS[3:]:
+                EGC(s)
+        self.assertEqual(
+            sum(counters["rules"].values()),
+            sum(map(len, STRINGS[3:])),
+        )
+        self.assertEqual(counters["rules"]["GB9c"], 1)
+        self.assertEqual(counters["rules"]["GB11"], 2)
+        self.assertEqual(counters["rules"]["GB12/GB13"], 1)
+
+    def test_callback(self):
+        records = []
+        with instrument(records.append):
+            egc_boundaries("e\u0301")
+            egc_count("")
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["function"], "egc_boundaries")
+        self.assertEqual(records[0]["code_points"], 2)
+        self.assertEqual(records[0]["clusters"], 1)
+        self.assertIsNone(records[0]["fast_path"])
+        self.assertEqual(records[0]["rules"], {"GB1": 1, "GB9": 1})
+        self.assertEqual(records[1]["fast_path"], "empty")
+
+    def test_nested(self):
+        with instrument() as outer:
+            EGC("a")
+            with instrument() as inner:
+                EGC("b")
+            EGC("c")
+        self.assertEqual(outer["calls"], {"EGC": 3})
+        self.assertEqual(inner["calls"], {"EGC": 1})
+
+    def test_disabled(self):
+        counters = enable()
+        disable(counters)
+        EGC("a")
+        self.assertEqual(counters["calls"], {})
+        self.assertIsNone(egc._instrumentation)
+        with self.assertRaises(ValueError):
+            disable(counters)
+
+    def test_environment_variable(self):
+        code = (
+            "import pyuegc, pyuegc.instrumentation as i; "
+            "pyuegc.EGC('abc'); "
+            "print(i.environment_counters['calls']); "
+            "print(hasattr(pyuegc, 'pyuegc'))"
+        )
+        env = dict(os.environ, PYUEGC_INSTRUMENT="1")
+        output = subprocess.run(
+            [sys.executable, "-c", code], env=env, check=True,
+            stdout=subprocess.PIPE, universal_newlines=True,
+        ).stdout
+        self.assertEqual(output.splitlines(), ["{'EGC': 1}", "False"])
+
+
+if __name__ == "__main__":
+    unittest.main()
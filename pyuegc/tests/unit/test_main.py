@@ -0,0 +1,81 @@
+"""Unit tests for the command-line interface (pyuegc.__main__)."""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from pyuegc.__main__ import main
+
+TEXT = "e\u0301le\u0300ve\r\n\U0001F1EB\U0001F1F7\U0001F1E9\n\nabc"
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(TEXT)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def run_main(self, *args, stdin=None):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(stdout), \
+                contextlib.redirect_stderr(stderr):
+            if stdin is None:
+                status = main([*args, self.path])
+            else:
+                stdin = io.TextIOWrapper(io.BytesIO(stdin.encode()))
+                with mock.patch.object(sys, "stdin", stdin):
+                    status = main(list(args))
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_count(self):
+        self.assertEqual(self.run_main(), (0, "5\n2\n0\n3\n", ""))
+
+    def test_boundaries(self):
+        status, stdout, _ = self.run_main("-o", "boundaries")
+        self.assertEqual(stdout, "0 2 3 5 6 7\n0 2 3\n0\n0 1 2 3\n")
+
+    def test_clusters(self):
+        status, stdout, _ = self.run_main("-o", "clusters", "-d", "/")
+        self.assertEqual(
+            stdout.splitlines()[:2],
+            ["e\u0301/l/e\u0300/v/e", "\U0001F1EB\U0001F1F7/\U0001F1E9"],
+        )
+
+    def test_json(self):
+        status, stdout, _ = self.run_main("-o", "clusters", "--json")
+        records = [*map(json.loads, stdout.splitlines())]
+        self.assertEqual(records[0]["line"], 1)
+        self.assertEqual(
+            records[0]["clusters"], ["e\u0301", "l", "e\u0300", "v", "e"]
+        )
+        self.assertEqual(records[2], {"line": 3, "clusters": []})
+
+    def test_stdin(self):
+        self.assertEqual(self.run_main(stdin=TEXT), self.run_main())
+
+    def test_jobs(self):
+        self.assertEqual(self.run_main("-j", "2"), self.run_main())
+
+    def test_stats(self):
+        status, _, stderr = self.run_main("--stats")
+        self.assertIn("4 lines, 13 code points, 10 clusters", stderr)
+
+    def test_missing_file(self):
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            status = main([self.path + ".missing"])
+        self.assertEqual(status, 1)
+        self.assertIn("error", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Unit tests for the pyuegc.parallel module."""
+
+import unittest
+
+from pyuegc import EGC, egc_boundaries, egc_count
+from pyuegc.parallel import egc_many_parallel, egc_parallel
+
+STRINGS = (
+    "",
+    "Python",
+    "a\r\nb",
+    "e\u0301le\u0300ve",
+    "\u0915\u094D\u0937\u093F",
+    "\U0001F1EB\U0001F1F7\U0001F1E9",
+    "\U0001F468\u200D\U0001F469\u200D\U0001F467",
+    "\u0301\u0301",
+)
+
+
+class TestEgcManyParallel(unittest.TestCase):
+
+    def test_same_as_sequential(self):
+        # Small batches, so that several of them are pending at once
+        strings = STRINGS * 50
+        for output, func in (
+            ("clusters", EGC),
+            ("boundaries", egc_boundaries),
+            ("count", egc_count),
+        ):
+            with self.subTest(output=output):
+                self.assertEqual(
+                    list(egc_many_parallel(
+                        strings, output, max_workers=2, chunk_size=20
+                    )),
+                    [*map(func, strings)],
+                )
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            list(egc_many_parallel(["ab", 42], max_workers=1))
+
+    def test_invalid_output(self):
+        with self.assertRaises(ValueError):
+            egc_many_parallel([], output="clusters_list")
+
+
+class TestEgcParallel(unittest.TestCase):
+
+    def test_same_as_sequential(self):
+        string = "\n".join(STRINGS) * 20 + "\r\n\r\n"
+        for output, func in (
+            ("clusters", EGC),
+            ("boundaries", egc_boundaries),
+            ("count", egc_count),
+        ):
+            with self.subTest(output=output):
+                self.assertEqual(
+                    egc_parallel(string, output, max_workers=2, chunk_size=15),
+                    func(string),
+                )
+
+    def test_without_line_feeds(self):
+        string = "".join(STRINGS) * 20
+        self.assertEqual(
+            egc_parallel(string, max_workers=2, chunk_size=15), EGC(string)
+        )
+
+    def test_single_chunk(self):
+        # No safe boundary to cut at
+        string = "\U0001F1EB" * 101
+        self.assertEqual(egc_parallel(string, chunk_size=5), EGC(string))
+        self.assertEqual(egc_parallel(""), [])
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            egc_parallel(b"abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,11 @@
 #     https://www.unicode.org/Public/16.0.0/ucd/emoji/emoji-data.txt
 #     https://www.unicode.org/Public/16.0.0/ucd/DerivedCoreProperties.txt
 #
+# The generated module holds a lookup table of the classes of code points
+# used by the segmentation algorithm, and the automaton implementing its
+# rules, compiled from the grapheme cluster break chart and the other rules
+# of UAX #29 (see the `step` function below).
+#
 # Output file:
 #     tools/_unicode.py
 #
@@ -22,6 +27,96 @@ DERIVED_CORE_PROPERTIES = "DerivedCoreProperties.txt"
 EMOJI_DATA = "emoji-data.txt"
 GRAPHEME_BREAK_PROPRETY = "GraphemeBreakProperty.txt"
 
+# Classes of code points distinguished by the segmentation algorithm: the
+# grapheme cluster break property values, with the Indic_Conjunct_Break
+# (InCB) property values needed by rule GB9c split out of Other and Extend
+# (ZWJ always has InCB=Extend); each code point is mapped to the index of
+# its class in this tuple
+CLASSES = (
+    "Other",
+    "CR",
+    "LF",
+    "Control",
+    "Extend",
+    "Regional_Indicator",
+    "Prepend",
+    "SpacingMark",
+    "L",
+    "V",
+    "T",
+    "LV",
+    "LVT",
+    "Extended_Pictographic",  # not a GCB property value
+    "ZWJ",
+    "InCB_Consonant",  # Other with InCB=Consonant
+    "InCB_Linker",     # Extend with InCB=Linker
+    "InCB_Extend",     # Extend with InCB=Extend
+)
+
+(
+    OTHER,
+    CR,
+    LF,
+    CONTROL,
+    EXTEND,
+    REGIONAL_INDICATOR,
+    PREPEND,
+    SPACINGMARK,
+    L,
+    V,
+    T,
+    LV,
+    LVT,
+    EXTENDED_PICTOGRAPHIC,
+    ZWJ,
+    INCB_CONSONANT,
+    INCB_LINKER,
+    INCB_EXTEND,
+) = range(len(CLASSES))
+
+# Grapheme cluster break chart (rows and columns are indexed by the first
+# fifteen classes above)
+# https://www.unicode.org/Public/16.0.0/ucd/auxiliary/GraphemeBreakTest.html
+GCB_CHART = [
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # Other
+    [1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],  # CR
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],  # LF
+    [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],  # Control
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # Extend
+    [1, 1, 1, 1, 0, 0, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # Regional_Indicator
+    [0, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],  # Prepend
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # SpacingMark
+    [1, 1, 1, 1, 0, 1, 1, 0, 0, 0, 1, 0, 0, 1, 0],  # L
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0],  # V
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 1, 0],  # T
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 1, 1, 1, 0],  # LV
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 1, 0],  # LVT
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # Extended_Pictographic
+    [1, 1, 1, 1, 0, 1, 1, 0, 1, 1, 1, 1, 1, 1, 0],  # ZWJ
+]
+
+# Names of the rules of UAX #29 that decide whether there is a boundary
+# before a code point (GB1 being used for the first code point of the text,
+# and GB2, the end of text, never applying to a code point)
+RULES = (
+    "GB1",
+    "GB3",
+    "GB4",
+    "GB5",
+    "GB6",
+    "GB7",
+    "GB8",
+    "GB9",
+    "GB9a",
+    "GB9b",
+    "GB9c",
+    "GB11",
+    "GB12/GB13",
+    "GB999",
+)
+
+MAX_CODE_POINT = 0x10FFFF
+
 
 def read_remote(filename):
     base_url = f"https://www.unicode.org/Public/{UNICODE_VERSION}/ucd/"
@@ -46,6 +141,7 @@ def parse_lines(lines, target_property=None):
     results = []
     property_data = {}
 
+    curr_prop = None
     code_points = set()
     total_points_expected = None
 
@@ -80,25 +176,11 @@ def parse_lines(lines, target_property=None):
 
             if ".." in data:
                 start, end = [int(cp, 16) for cp in data.split("..")]
-                code_points.update([*range(start, end + 1)])
-
-                if target_property is None:
-                    for code in range(start, end + 1):
-                        results.append(f'    0x{code:05X}: "{curr_prop}",')
-                else:
-                    results.append(
-                        f"    *range(0x{start:05X}, 0x{end:05X} + 1),"
-                    )
-
             else:
-                code_points.add(data)
+                start = end = int(data, 16)
 
-                if target_property is None:
-                    results.append(f'    0x{data:0>5}: "{curr_prop}",')
-                else:
-                    indent = \
-                        " " * (4 if target_property == "InCB; Linker" else 11)
-                    results.append(f"{indent}0x{data:0>5},")
+            code_points.update(range(start, end + 1))
+            results.append((start, end, curr_prop))
 
     for prop, data in property_data.items():
         if target_property and prop != target_property:
@@ -112,6 +194,35 @@ def parse_lines(lines, target_property=None):
     return results
 
 
+def build_two_stage_table(values, block_shift):
+    """Splits `values` (a bytes object with one entry per code point) into
+    blocks of 2**block_shift entries and returns the block index (stage 1)
+    and the deduplicated blocks (stage 2) as a pair of bytes objects, or None
+    if there are too many distinct blocks to index them with bytes."""
+    block_size = 1 << block_shift
+    blocks = {}
+    stage1 = []
+
+    for start in range(0, len(values), block_size):
+        block = values[start : start + block_size]
+        stage1.append(blocks.setdefault(block, len(blocks)))
+
+    if len(blocks) > 256:
+        return None
+
+    return bytes(stage1), b"".join(blocks)
+
+
+def format_bytes(data, width=32):
+    # Hexadecimal string literals compile several times faster than bytes
+    # literals made of escape sequences, which matters when no cached
+    # bytecode is available for the generated module
+    return "\n".join(
+        f'    "{data[start : start + width].hex()}"'
+        for start in range(0, len(data), width)
+    )
+
+
 def main():
     # Current working directory
     cwd = pathlib.Path.cwd()
@@ -189,13 +300,319 @@ def main():
     InCBExtend = parse_lines(lines, target_property="InCB; Extend")
 
 
-    PROP_DICT = "\n".join(gcb_prop_values)
-    EXT_PICTOGR = "\n".join(ExtendedPictographic)
-    INCB_CONSONANT = "\n".join(InCBConsonant)
-    INCB_LINKER = "\n".join(InCBLinker)
-    INCB_EXTEND = "\n".join(InCBExtend)
-
-    with open(cwd / "_unicode.py", "w", encoding="utf-8", newline="\n") as f:
+    write_module(
+        cwd / "_unicode.py",
+        gcb_prop_values,
+        ExtendedPictographic,
+        InCBConsonant,
+        InCBLinker,
+        InCBExtend,
+    )
+
+
+def gcb(cls):
+    """Returns the class in the grapheme cluster break chart of `cls`."""
+    if cls == INCB_CONSONANT:
+        return OTHER
+    if cls in (INCB_LINKER, INCB_EXTEND):
+        return EXTEND
+    return cls
+
+
+def chart_rule(prev, cls):
+    """Returns the name of the rule that decides whether there is a boundary
+    between code points of classes `prev` and `cls` in the grapheme cluster
+    break chart (which does not cover rules GB9c, GB11, GB12 and GB13)."""
+    prev, cls = gcb(prev), gcb(cls)
+
+    if prev == CR and cls == LF:
+        rule = "GB3"
+    elif prev in (CONTROL, CR, LF):
+        rule = "GB4"
+    elif cls in (CONTROL, CR, LF):
+        rule = "GB5"
+    elif prev == L and cls in (L, V, LV, LVT):
+        rule = "GB6"
+    elif prev in (LV, V) and cls in (V, T):
+        rule = "GB7"
+    elif prev in (LVT, T) and cls == T:
+        rule = "GB8"
+    elif cls in (EXTEND, ZWJ):
+        rule = "GB9"
+    elif cls == SPACINGMARK:
+        rule = "GB9a"
+    elif prev == PREPEND:
+        rule = "GB9b"
+    else:
+        rule = "GB999"
+
+    # Only rules GB4, GB5 and GB999 break
+    assert GCB_CHART[prev][cls] == (rule in ("GB4", "GB5", "GB999")) or (
+        prev == cls == REGIONAL_INDICATOR
+    )
+
+    return rule
+
+
+def apply_rules(state, cls):
+    """Applies the grapheme cluster boundary rules to a code point of class
+    `cls`, given the `state` reached after the code points preceding it (see
+    `step`). Returns a pair (rule, is_break), where rule is the name of the
+    rule that applies, and is_break tells whether there is a boundary before
+    the code point.
+    """
+    prev, ri_odd, emoji, conjunct = state
+
+    if prev is None:
+        # https://www.unicode.org/reports/tr29/tr29-45.html#GB1
+        # Break at the start of text (which is not reported).
+        return "GB1", False
+    if conjunct == 2 and cls == INCB_CONSONANT:
+        # https://www.unicode.org/reports/tr29/tr29-45.html#GB9c
+        # Do not break within certain combinations
+        # with Indic_Conjunct_Break (InCB)=Linker.
+        return "GB9c", False
+    if emoji == 2 and cls == EXTENDED_PICTOGRAPHIC:
+        # https://www.unicode.org/reports/tr29/tr29-45.html#GB11
+        # Do not break within emoji modifier sequences
+        # or emoji zwj sequences.
+        return "GB11", False
+    if prev == REGIONAL_INDICATOR and cls == REGIONAL_INDICATOR:
+        # https://www.unicode.org/reports/tr29/tr29-45.html#GB12
+        # https://www.unicode.org/reports/tr29/tr29-45.html#GB13
+        # Do not break within emoji flag sequences. That is, do not break
+        # between regional indicator (RI) symbols if there is an odd number
+        # of RI characters before the break point.
+        return ("GB12/GB13", False) if ri_odd else ("GB999", True)
+
+    return chart_rule(prev, cls), bool(GCB_CHART[gcb(prev)][gcb(cls)])
+
+
+def step(state, cls):
+    """Applies the grapheme cluster boundary rules to a code point of class
+    `cls`, given the `state` reached after the code points preceding it.
+
+    A state is a tuple (prev, ri_odd, emoji, conjunct), where
+        prev is the class of the previous code point (None at the start
+            of the text);
+        ri_odd tells whether the text ends with an odd number of regional
+            indicator (RI) symbols;
+        emoji is 1 if the text ends with \\p{ExtPict} Extend*, 2 if it
+            ends with \\p{ExtPict} Extend* ZWJ, and 0 otherwise;
+        conjunct is 1 if the text ends with \\p{InCB=Consonant}
+            [\\p{InCB=Extend}\\p{InCB=Linker}]*, 2 if in addition these
+            trailing code points include an InCB=Linker, and 0 otherwise.
+
+    Returns a pair (is_break, next_state), where is_break tells whether
+    there is a boundary before the code point.
+    """
+    _, is_break = apply_rules(state, cls)
+    prev, ri_odd, emoji, conjunct = state
+
+    if cls == REGIONAL_INDICATOR:
+        ri_odd = not (prev == REGIONAL_INDICATOR and ri_odd)
+    else:
+        ri_odd = False
+
+    if cls == EXTENDED_PICTOGRAPHIC:
+        emoji = 1
+    elif gcb(cls) == EXTEND:
+        emoji = 1 if emoji == 1 else 0
+    elif cls == ZWJ:
+        emoji = 2 if emoji == 1 else 0
+    else:
+        emoji = 0
+
+    if cls == INCB_CONSONANT:
+        conjunct = 1
+    elif cls == INCB_LINKER:
+        conjunct = 2 if conjunct else 0
+    elif cls not in (INCB_EXTEND, ZWJ):
+        conjunct = 0
+
+    return is_break, (cls, ri_odd, emoji, conjunct)
+
+
+# State before the first code point of the text
+START_STATE = (None, False, 0, 0)
+
+
+def enumerate_states():
+    """Enumerates the states reachable from the start of the text, each
+    paired with whether there is a boundary before the last code point
+    read. Returns a pair (states, transitions), where states[0] is the start
+    state and transitions[i][c] is the index of the state reached from
+    states[i] on reading a code point of class c.
+    """
+    start = (False, START_STATE)
+    states = [start]
+    index = {start: 0}
+    transitions = []
+
+    while len(transitions) < len(states):
+        _, state = states[len(transitions)]
+        row = []
+        for cls in range(len(CLASSES)):
+            target = step(state, cls)
+            if target not in index:
+                index[target] = len(states)
+                states.append(target)
+            row.append(index[target])
+        transitions.append(row)
+
+    return states, transitions
+
+
+def build_safe_breaks():
+    """Finds the pairs of classes between which there is a boundary that
+    does not depend on what precedes them.
+
+    Such a boundary is "safe": whatever the state before the first code
+    point of the pair, there is a boundary before the second one, and the
+    state then reached is the same as at the start of the text, so the text
+    can be segmented from there without looking back. Returns a list of
+    bytes, where safe[a][b] is 1 if the pair (a, b) is safe, and 0
+    otherwise.
+    """
+    states, _ = enumerate_states()
+    safe = [bytearray([1]) * len(CLASSES) for _ in CLASSES]
+
+    for cls in range(len(CLASSES)):
+        _, restart = step(START_STATE, cls)
+        for _, state in states[1:]:
+            if step(state, cls) != (True, restart):
+                safe[state[0]][cls] = 0
+
+    return [bytes(row) for row in safe]
+
+
+def build_pair_rules():
+    """Tabulates the rule that applies to a code point, given its class, the
+    class of the previous code point, and whether there is a boundary between
+    them (these determine the rule, whatever precedes the pair). Returns a
+    list of bytes, where rules[a][2 * b + is_break] is the index in RULES of
+    the rule that applies to a code point of class b following one of class
+    a (0 if there is no such case).
+    """
+    states, _ = enumerate_states()
+    rules = [bytearray(2 * len(CLASSES)) for _ in CLASSES]
+    seen = {}
+
+    for _, state in states[1:]:
+        for cls in range(len(CLASSES)):
+            rule, is_break = apply_rules(state, cls)
+            key = (state[0], cls, is_break)
+            assert seen.setdefault(key, rule) == rule, key
+            rules[state[0]][2 * cls + is_break] = RULES.index(rule)
+
+    return [bytes(row) for row in rules]
+
+
+def build_dfa():
+    """Compiles the grapheme cluster boundary rules into a minimal
+    deterministic finite automaton.
+
+    The states of the automaton also record whether there is a boundary
+    before the last code point read; they are numbered so that the start
+    state is 0 and the states recording a boundary come last. Returns a
+    pair (transitions, num_break_states), where transitions[s][c] is the
+    state reached from state s on reading a code point of class c.
+    """
+    states, transitions = enumerate_states()
+
+    # Minimize the automaton by partition refinement (Moore's algorithm),
+    # starting from the partition {start}, {non-break}, {break}
+    blocks = [
+        0 if i == 0 else 1 + is_break for i, (is_break, _) in enumerate(states)
+    ]
+    while True:
+        signatures = [
+            (blocks[i], *(blocks[j] for j in row))
+            for i, row in enumerate(transitions)
+        ]
+        numbering = {}
+        refined = [
+            numbering.setdefault(signature, len(numbering))
+            for signature in signatures
+        ]
+        if len(numbering) == len(set(blocks)):
+            break
+        blocks = refined
+
+    # Renumber the minimized states: start state first, break states last
+    representatives = {}
+    for i, block in enumerate(blocks):
+        representatives.setdefault(block, i)
+    order = sorted(
+        representatives.values(), key=lambda i: (i != 0, states[i][0], i)
+    )
+    number = {blocks[i]: n for n, i in enumerate(order)}
+
+    dfa = [[number[blocks[j]] for j in transitions[i]] for i in order]
+    num_break_states = sum(states[i][0] for i in order)
+
+    return dfa, num_break_states
+
+
+def write_module(path, gcb_prop_values, ext_pictogr,
+                 incb_consonant, incb_linker, incb_extend):
+    values = bytearray(MAX_CODE_POINT + 1)
+
+    for start, end, prop in gcb_prop_values:
+        values[start : end + 1] = [CLASSES.index(prop)] * (end - start + 1)
+
+    # Extended_Pictographic is not a GCB property value, but it is handled
+    # as one by the segmentation algorithm (the two sets are disjoint)
+    for start, end, _ in ext_pictogr:
+        assert not any(values[start : end + 1])
+        values[start : end + 1] = [EXTENDED_PICTOGRAPHIC] * (end - start + 1)
+
+    for ranges, cls in (
+        (incb_consonant, INCB_CONSONANT),
+        (incb_linker, INCB_LINKER),
+        (incb_extend, INCB_EXTEND),
+    ):
+        for start, end, _ in ranges:
+            for code in range(start, end + 1):
+                if values[code] == ZWJ:
+                    continue
+                assert gcb(cls) == values[code], f"{code:04X}"
+                values[code] = cls
+
+    # Pick the block size that yields the smallest table
+    tables = {
+        shift: build_two_stage_table(bytes(values), shift)
+        for shift in range(4, 10)
+    }
+    block_shift = min(
+        (shift for shift, table in tables.items() if table is not None),
+        key=lambda shift: sum(map(len, tables[shift])),
+    )
+    stage1, stage2 = tables[block_shift]
+
+    print()
+    print(f"Two-stage table: block size {1 << block_shift}, "
+          f"{len(stage1):,} + {len(stage2):,} bytes")
+
+    dfa, num_break_states = build_dfa()
+
+    print(f"Automaton: {len(dfa)} states ({num_break_states} break states)")
+
+    safe_breaks = build_safe_breaks()
+
+    print(f"Safe boundaries: {sum(map(sum, safe_breaks))} pairs of classes")
+
+    pair_rules = build_pair_rules()
+
+    CLASSES_ = "\n".join(f'    "{cls}",' for cls in CLASSES)
+    STAGE1 = format_bytes(stage1)
+    STAGE2 = format_bytes(stage2)
+    DFA = format_bytes(bytes(state for row in dfa for state in row))
+    SAFE_BREAKS = format_bytes(b"".join(safe_breaks))
+    RULES_ = "\n".join(f'    "{rule}",' for rule in RULES)
+    PAIR_RULES = format_bytes(b"".join(pair_rules))
+
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
         f.write(f'''\
 """Data derived from the Unicode character database (UCD).
 
@@ -204,36 +621,59 @@ This file was generated from {SCRIPT_PATH}
 
 _UNICODE_VERSION = "{UNICODE_VERSION}"
 
-# Mapping of Unicode code points to their corresponding grapheme cluster
-# break property values (any code point not listed here defaults to "Other")
-# Source: GraphemeBreakProperty.txt
-_PROP_DICT = {{
-{PROP_DICT}
-}}
-
-# [\\p{{Extended_Pictographic}}]
-# Source: emoji-data.txt
-_EXT_PICTOGR = [
-{EXT_PICTOGR}
-]
-
-# [\\p{{InCB=Consonant}}]
-# Source: DerivedCoreProperties.txt
-_INCB_CONSONANT = "".join(map(chr, [
-{INCB_CONSONANT}
-]))
-
-# [\\p{{InCB=Linker}}]
-# Source: DerivedCoreProperties.txt
-_INCB_LINKER = "".join(map(chr, [
-{INCB_LINKER}
-]))
-
-# [\\p{{InCB=Extend}}]
-# Source: DerivedCoreProperties.txt
-_INCB_EXTEND = "".join(map(chr, [
-{INCB_EXTEND}
-]))
+# Classes of code points distinguished by the segmentation algorithm (the
+# grapheme cluster break property values, Extended_Pictographic, and the
+# Indic_Conjunct_Break property values used by rule GB9c); code points are
+# mapped to indices into this tuple
+_CLASSES = (
+{CLASSES_}
+)
+
+# Two-stage lookup table mapping code points to their classes:
+#   _STAGE2[_STAGE1[cp >> _SHIFT] << _SHIFT | cp & _MASK]
+# Sources: GraphemeBreakProperty.txt, emoji-data.txt, DerivedCoreProperties.txt
+_SHIFT = {block_shift}
+_MASK = {(1 << block_shift) - 1}
+
+_STAGE1 = bytes.fromhex(
+{STAGE1}
+)
+
+_STAGE2 = bytes.fromhex(
+{STAGE2}
+)
+
+# Deterministic finite automaton implementing the grapheme cluster boundary
+# rules of UAX #29: the state reached from state s on reading a code point
+# of class c is _DFA[s * len(_CLASSES) + c]; the start state is 0, and there
+# is a boundary before the code point just read if and only if the state
+# reached is at least _DFA_BREAK_STATE
+_DFA_BREAK_STATE = {len(dfa) - num_break_states}
+
+_DFA = bytes.fromhex(
+{DFA}
+)
+
+# Pairs of classes between which there is always a boundary, after which
+# the automaton is in the same state as at the start of the text (so that
+# the text can be segmented from there independently of what precedes):
+# the pair (a, b) is such a pair if _SAFE_BREAKS[a * len(_CLASSES) + b] is 1
+_SAFE_BREAKS = bytes.fromhex(
+{SAFE_BREAKS}
+)
+
+# Rules of UAX #29 deciding whether there is a boundary before a code point
+# (used for instrumentation only); the rule that applies to a code point of
+# class b following one of class a is
+#   _RULES[_PAIR_RULES[(a * len(_CLASSES) + b) * 2 + is_break]]
+# where is_break tells whether there is a boundary between them
+_RULES = (
+{RULES_}
+)
+
+_PAIR_RULES = bytes.fromhex(
+{PAIR_RULES}
+)
 ''')
 
 